@@ -2,12 +2,45 @@
 Database connection management
 """
 
+import time
+
 from databases import Database
 from funding_rate_service.config import settings
+from helpers.metrics import REGISTRY
+
+DB_QUERY_SECONDS = REGISTRY.histogram(
+    "db_query_seconds", "Database call time including connection acquisition", ("operation",)
+)
+
+
+class TimedDatabase(Database):
+    """Database whose query methods record their latency in ``db_query_seconds``."""
+
+    async def _timed(self, operation: str, call, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await call(*args, **kwargs)
+        finally:
+            DB_QUERY_SECONDS.labels(operation=operation).observe(time.perf_counter() - start)
+
+    async def fetch_all(self, *args, **kwargs):
+        return await self._timed("fetch_all", super().fetch_all, *args, **kwargs)
+
+    async def fetch_one(self, *args, **kwargs):
+        return await self._timed("fetch_one", super().fetch_one, *args, **kwargs)
+
+    async def fetch_val(self, *args, **kwargs):
+        return await self._timed("fetch_val", super().fetch_val, *args, **kwargs)
+
+    async def execute(self, *args, **kwargs):
+        return await self._timed("execute", super().execute, *args, **kwargs)
+
+    async def execute_many(self, *args, **kwargs):
+        return await self._timed("execute_many", super().execute_many, *args, **kwargs)
 
 
 # Create database instance
-database = Database(
+database = TimedDatabase(
     settings.database_url,
     min_size=settings.database_pool_min_size,
     max_size=settings.database_pool_max_size,
@@ -0,0 +1,37 @@
+-- ============================================================================
+-- Migration 019: Push Strategy Notifications via LISTEN/NOTIFY
+-- ============================================================================
+-- Publishes the id of every new strategy_notifications row on the
+-- 'strategy_notifications' channel so the Telegram bot can deliver it
+-- immediately instead of waiting for its next poll.
+--
+-- The payload is only the notification id (UUID); listeners read the row
+-- themselves, so the 8000-byte NOTIFY payload limit never applies.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION notify_strategy_notification() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('strategy_notifications', NEW.id::text);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS strategy_notifications_notify ON strategy_notifications;
+
+CREATE TRIGGER strategy_notifications_notify
+    AFTER INSERT ON strategy_notifications
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_strategy_notification();
+
+-- The bot's safety-net poll only ever looks at unsent rows
+CREATE INDEX IF NOT EXISTS idx_strategy_notifications_unsent
+    ON strategy_notifications(created_at)
+    WHERE sent = FALSE;
+
+COMMENT ON FUNCTION notify_strategy_notification() IS 'Publishes new strategy_notifications ids on the strategy_notifications channel';
+
+-- Success message
+DO $$
+BEGIN
+    RAISE NOTICE 'Migration 019 completed successfully!';
+END $$;
@@ -0,0 +1,43 @@
+-- ============================================================================
+-- Migration 020: Opportunity Generations Feed
+-- ============================================================================
+-- The funding rate service stores every opportunity analysis run as one
+-- compact, versioned row and publishes its id on the
+-- 'opportunity_generations' channel. Strategy processes LISTEN and read the
+-- latest generation instead of each re-running the latest-rates query and
+-- pairwise scoring themselves.
+--
+-- As with migration 019 the payload is only the generation id, so the
+-- 8000-byte NOTIFY payload limit never applies.
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS opportunity_generations (
+    id BIGSERIAL PRIMARY KEY,
+    format_version INTEGER NOT NULL,
+    opportunity_count INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+CREATE OR REPLACE FUNCTION notify_opportunity_generation() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('opportunity_generations', NEW.id::text);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS opportunity_generations_notify ON opportunity_generations;
+
+CREATE TRIGGER opportunity_generations_notify
+    AFTER INSERT ON opportunity_generations
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_opportunity_generation();
+
+COMMENT ON TABLE opportunity_generations IS 'Published opportunity analysis runs (compact encoded payload), newest id wins';
+COMMENT ON FUNCTION notify_opportunity_generation() IS 'Publishes new opportunity_generations ids on the opportunity_generations channel';
+
+-- Success message
+DO $$
+BEGIN
+    RAISE NOTICE 'Migration 020 completed successfully!';
+END $$;
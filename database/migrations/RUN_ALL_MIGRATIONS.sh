@@ -25,6 +25,8 @@ python database/scripts/migrations/run_migration.py database/migrations/015_add_
 python database/scripts/migrations/run_migration.py database/migrations/016_add_trade_fills_table.sql
 python database/scripts/migrations/run_migration.py database/migrations/017_add_insufficient_margin_notification_type.sql
 python database/scripts/migrations/run_migration.py database/migrations/018_add_liquidation_risk_notification_type.sql
+python database/scripts/migrations/run_migration.py database/migrations/019_add_strategy_notifications_notify_trigger.sql
+python database/scripts/migrations/run_migration.py database/migrations/020_add_opportunity_generations.sql
 
 echo ""
 echo "=================================="
@@ -221,6 +221,62 @@ class FundingRateRepository:
             }
         )
     
+    async def get_bucketed_history(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        bucket_seconds: int = 3600,
+        dex_names: Optional[List[str]] = None,
+        symbols: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get funding rate history averaged into fixed time buckets (all DEXs/symbols)
+
+        Used by the backtester to load a whole symbol universe in one query
+        instead of one get_history() call per DEX/symbol pair.
+
+        Args:
+            start_time: Start of time range (inclusive)
+            end_time: End of time range (exclusive)
+            bucket_seconds: Bucket width in seconds (default: 1 hour)
+            dex_names: Optional DEX filter
+            symbols: Optional symbol filter
+
+        Returns:
+            Rows with bucket (epoch seconds), dex_name, symbol, funding_rate,
+            open_interest_usd and volume_24h, ordered by bucket
+        """
+        filters = ""
+        values: Dict[str, Any] = {
+            "start_time": start_time,
+            "end_time": end_time,
+            "bucket_seconds": bucket_seconds,
+        }
+        if dex_names:
+            filters += " AND d.name = ANY(:dex_names)"
+            values["dex_names"] = [name.lower() for name in dex_names]
+        if symbols:
+            filters += " AND s.symbol = ANY(:symbols)"
+            values["symbols"] = [symbol.upper() for symbol in symbols]
+
+        query = f"""
+            SELECT
+                (FLOOR(EXTRACT(EPOCH FROM fr.time) / :bucket_seconds) * :bucket_seconds)::bigint AS bucket,
+                d.name AS dex_name,
+                s.symbol,
+                AVG(fr.funding_rate) AS funding_rate,
+                AVG(fr.open_interest_usd) AS open_interest_usd,
+                AVG(fr.volume_24h) AS volume_24h
+            FROM funding_rates fr
+            JOIN dexes d ON fr.dex_id = d.id
+            JOIN symbols s ON fr.symbol_id = s.id
+            WHERE fr.time >= :start_time
+              AND fr.time < :end_time{filters}
+            GROUP BY bucket, d.name, s.symbol
+            ORDER BY bucket
+        """
+        return await self.db.fetch_all(query, values)
+
     async def get_stats(
         self,
         dex_name: str,
@@ -112,6 +112,71 @@ class TradeFillRepository:
             logger.error(f"Failed to insert trade fill: {e}")
             return None
     
+    async def insert_trade_fills(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Bulk insert aggregated trade fills in a single round trip.
+        
+        Each row carries the same keys as ``insert_trade_fill`` arguments
+        (optional keys default like the single-row insert). Rows that already
+        exist for (position_id, order_id) are skipped by the ON CONFLICT clause,
+        so callers don't need a per-order existence check.
+        
+        Args:
+            rows: Trade fill rows to insert
+            
+        Returns:
+            Number of rows submitted (0 on error)
+        """
+        if not rows:
+            return 0
+        
+        query = """
+            INSERT INTO trade_fills (
+                position_id, account_id, trade_type,
+                dex_id, symbol_id, order_id, trade_id,
+                timestamp, side, total_quantity, weighted_avg_price,
+                total_fee, fee_currency, realized_pnl, realized_funding,
+                fill_count
+            )
+            VALUES (
+                :position_id, :account_id, :trade_type,
+                :dex_id, :symbol_id, :order_id, :trade_id,
+                :timestamp, :side, :total_quantity, :weighted_avg_price,
+                :total_fee, :fee_currency, :realized_pnl, :realized_funding,
+                :fill_count
+            )
+            ON CONFLICT (position_id, order_id) DO NOTHING
+        """
+        
+        values = [
+            {
+                "position_id": row["position_id"],
+                "account_id": row["account_id"],
+                "trade_type": row["trade_type"],
+                "dex_id": row["dex_id"],
+                "symbol_id": row["symbol_id"],
+                "order_id": row["order_id"],
+                "trade_id": row.get("trade_id"),
+                "timestamp": self._to_naive_utc(row["timestamp"]),
+                "side": row["side"],
+                "total_quantity": row["total_quantity"],
+                "weighted_avg_price": row["weighted_avg_price"],
+                "total_fee": row["total_fee"],
+                "fee_currency": row["fee_currency"],
+                "realized_pnl": row.get("realized_pnl"),
+                "realized_funding": row.get("realized_funding"),
+                "fill_count": row.get("fill_count", 1),
+            }
+            for row in rows
+        ]
+        
+        try:
+            await self.db.execute_many(query, values)
+            return len(values)
+        except Exception as e:
+            logger.error(f"Failed to bulk insert {len(values)} trade fills: {e}")
+            return 0
+    
     @staticmethod
     def _to_naive_utc(dt: datetime) -> datetime:
         """
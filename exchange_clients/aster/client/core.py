@@ -10,7 +10,6 @@ import hashlib
 from decimal import Decimal, ROUND_DOWN
 from typing import Dict, Any, List, Optional, Tuple, Callable, Awaitable
 from urllib.parse import urlencode
-import aiohttp
 
 from exchange_clients.base_client import BaseExchangeClient, OrderFillCallback, OrderStatusCallback
 from exchange_clients.base_models import (
@@ -20,6 +19,7 @@ from exchange_clients.base_models import (
     TradeData,
     validate_credentials,
 )
+from exchange_clients.order_state_cache import OrderStateCache
 from exchange_clients.aster.common import get_aster_symbol_format, get_quantity_multiplier
 from exchange_clients.aster.websocket import AsterWebSocketManager
 from helpers.unified_logger import get_exchange_logger
@@ -36,6 +36,9 @@ from .managers.websocket_handlers import AsterWebSocketHandlers
 class AsterClient(BaseExchangeClient):
     """Aster exchange client implementation."""
 
+    SHARED_METADATA_ATTRS = ("_contract_id_cache", "_tick_size_cache", "_min_order_notional")
+    SUPPORTS_CLIENT_PROXY = True
+
     def __init__(
         self, 
         config: Dict[str, Any],
@@ -68,7 +71,7 @@ class AsterClient(BaseExchangeClient):
         # Initialize logger early
         self.logger = get_exchange_logger("aster", self.config.ticker)
         self._order_update_handler = None
-        self._latest_orders: Dict[str, OrderInfo] = {}
+        self._latest_orders: Dict[str, OrderInfo] = OrderStateCache(stream_live=self._order_stream_live)
         self._min_order_notional: Dict[str, Decimal] = {}
         
         # Caches (single source of truth)
@@ -123,47 +126,47 @@ class AsterClient(BaseExchangeClient):
             'Content-Type': 'application/x-www-form-urlencoded'
         }
 
-        async with aiohttp.ClientSession() as session:
-            if method.upper() == 'GET':
-                # For GET requests, signature is based on query parameters only
-                signature = self._generate_signature(params)
-                params['signature'] = signature
-
-                async with session.get(url, params=params, headers=headers) as response:
-                    result = await response.json()
-                    if response.status != 200:
-                        raise Exception(f"API request failed: {result}")
-                    return result
-            elif method.upper() == 'POST':
-                # For POST requests, signature must include both query string and request body
-                # According to Aster API docs: totalParams = queryString + requestBody
-                all_params = {**params, **data}
-                
+        # Pooled keep-alive connections, through this client's proxy when it has one
+        if method.upper() == 'GET':
+            # For GET requests, signature is based on query parameters only
+            signature = self._generate_signature(params)
+            params['signature'] = signature
+
+            async with self.transport.request('GET', url, params=params, headers=headers) as response:
+                result = await response.json()
+                if response.status != 200:
+                    raise Exception(f"API request failed: {result}")
+                return result
+        elif method.upper() == 'POST':
+            # For POST requests, signature must include both query string and request body
+            # According to Aster API docs: totalParams = queryString + requestBody
+            all_params = {**params, **data}
+            
+            self.logger.debug(
+                f"POST {endpoint} - Params: {params}, Data: {data}"
+            )
+            
+            signature = self._generate_signature(all_params)
+            all_params['signature'] = signature
+
+            async with self.transport.request('POST', url, data=all_params, headers=headers) as response:
+                result = await response.json()
                 self.logger.debug(
-                    f"POST {endpoint} - Params: {params}, Data: {data}"
+                    f"Response {response.status}: {result.get('orderId', result.get('status', 'N/A'))}"
                 )
-                
-                signature = self._generate_signature(all_params)
-                all_params['signature'] = signature
-
-                async with session.post(url, data=all_params, headers=headers) as response:
-                    result = await response.json()
-                    self.logger.debug(
-                        f"Response {response.status}: {result.get('orderId', result.get('status', 'N/A'))}"
-                    )
-                    if response.status != 200:
-                        raise Exception(f"API request failed: {result}")
-                    return result
-            elif method.upper() == 'DELETE':
-                # For DELETE requests, signature is based on query parameters only
-                signature = self._generate_signature(params)
-                params['signature'] = signature
-
-                async with session.delete(url, params=params, headers=headers) as response:
-                    result = await response.json()
-                    if response.status != 200:
-                        raise Exception(f"API request failed: {result}")
-                    return result
+                if response.status != 200:
+                    raise Exception(f"API request failed: {result}")
+                return result
+        elif method.upper() == 'DELETE':
+            # For DELETE requests, signature is based on query parameters only
+            signature = self._generate_signature(params)
+            params['signature'] = signature
+
+            async with self.transport.request('DELETE', url, params=params, headers=headers) as response:
+                result = await response.json()
+                if response.status != 200:
+                    raise Exception(f"API request failed: {result}")
+                return result
 
     async def connect(self) -> None:
         """Connect to Aster and initialize managers."""
@@ -234,10 +237,12 @@ class AsterClient(BaseExchangeClient):
                 order_update_callback=self.ws_handlers.handle_websocket_order_update,
                 liquidation_callback=self.ws_handlers.handle_liquidation_notification,
                 symbol_formatter=self.normalize_symbol,
+                transport=self.transport,
             )
 
             # Set logger for WebSocket manager
             self.ws_manager.set_logger(self.logger)
+            self._watch_order_stream(self.ws_manager)
             
             # Update market_data with ws_manager reference
             self.market_data.ws_manager = self.ws_manager
@@ -254,8 +259,10 @@ class AsterClient(BaseExchangeClient):
     async def disconnect(self) -> None:
         """Disconnect from Aster."""
         try:
+            await self.close_shared_book()
             if hasattr(self, 'ws_manager') and self.ws_manager:
                 await self.ws_manager.disconnect()
+            await self.close_transport()
         except Exception as e:
             self.logger.error(f"Error during Aster disconnect: {e}")
 
@@ -326,6 +333,9 @@ class AsterClient(BaseExchangeClient):
     # Market data delegates
     async def fetch_bbo_prices(self, contract_id: str) -> Tuple[Decimal, Decimal]:
         """Get best bid/offer prices, preferring WebSocket data when available."""
+        shared = self.shared_bbo()
+        if shared is not None:
+            return shared
         return await self.market_data.fetch_bbo_prices(contract_id)
 
     async def get_order_book_depth(
@@ -334,6 +344,9 @@ class AsterClient(BaseExchangeClient):
         levels: int = 10
     ) -> Dict[str, List[Dict[str, Decimal]]]:
         """Get order book depth for a symbol."""
+        shared = self.shared_order_book(levels)
+        if shared is not None:
+            return shared
         return await self.market_data.get_order_book_depth(contract_id, levels)
 
     async def get_order_price(self, direction: str) -> Decimal:
@@ -441,6 +454,10 @@ class AsterClient(BaseExchangeClient):
         """Get leverage and position limit information for a symbol."""
         return await self.account_manager.get_leverage_info(symbol)
 
+    async def get_all_leverage_info(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Get leverage and position limit information for all Aster markets."""
+        return await self.account_manager.get_all_leverage_info()
+
     def get_min_order_notional(self, symbol: Optional[str]) -> Optional[Decimal]:
         """Return the minimum notional requirement for the given symbol if known."""
         return self.account_manager.get_min_order_notional(symbol)
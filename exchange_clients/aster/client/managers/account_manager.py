@@ -4,8 +4,9 @@ Account manager module for Aster client.
 Handles account queries, balance, leverage management, and min order notional.
 """
 
+import asyncio
 from decimal import Decimal
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from exchange_clients.aster.client.utils.helpers import to_decimal
 from exchange_clients.aster.common import get_aster_symbol_format
@@ -295,30 +296,11 @@ class AsterAccountManager:
                     leverage_info['brackets'] = brackets
                     
                     if brackets and len(brackets) > 0:
-                        # 🔍 CRITICAL: Find the MAXIMUM leverage across all brackets
-                        # Bracket 1 typically has highest leverage (for smaller positions)
-                        # But let's find the actual maximum to be safe
-                        max_leverage_value = 0
-                        max_notional_value = None
-                        
-                        for bracket in brackets:
-                            initial_leverage = bracket.get('initialLeverage', 0)
-                            if initial_leverage > max_leverage_value:
-                                max_leverage_value = initial_leverage
-                            
-                            # Get the highest notional cap (from the last bracket)
-                            notional_cap = bracket.get('notionalCap')
-                            if notional_cap:
-                                max_notional_value = max(
-                                    max_notional_value or 0, 
-                                    notional_cap
-                                )
-                        
-                        if max_leverage_value > 0:
-                            leverage_info['max_leverage'] = Decimal(str(max_leverage_value))
-                        
-                        if max_notional_value:
-                            leverage_info['max_notional'] = Decimal(str(max_notional_value))
+                        max_leverage, max_notional = self._summarize_brackets(brackets)
+                        if max_leverage is not None:
+                            leverage_info['max_leverage'] = max_leverage
+                        if max_notional is not None:
+                            leverage_info['max_notional'] = max_notional
                     else:
                         self.logger.warning(
                             f"[ASTER] Symbol {symbol} has empty brackets array"
@@ -420,6 +402,85 @@ class AsterAccountManager:
                 'brackets': None
             }
 
+    @staticmethod
+    def _summarize_brackets(brackets: List[Dict[str, Any]]) -> Tuple[Optional[Decimal], Optional[Decimal]]:
+        """Return (max leverage, max notional cap) across a symbol's leverage brackets."""
+        # 🔍 CRITICAL: Find the MAXIMUM leverage across all brackets
+        # Bracket 1 typically has highest leverage (for smaller positions)
+        # But let's find the actual maximum to be safe
+        max_leverage_value = 0
+        max_notional_value = None
+        
+        for bracket in brackets:
+            initial_leverage = bracket.get('initialLeverage', 0)
+            if initial_leverage > max_leverage_value:
+                max_leverage_value = initial_leverage
+            
+            # Get the highest notional cap (from the last bracket)
+            notional_cap = bracket.get('notionalCap')
+            if notional_cap:
+                max_notional_value = max(max_notional_value or 0, notional_cap)
+        
+        return (
+            Decimal(str(max_leverage_value)) if max_leverage_value > 0 else None,
+            Decimal(str(max_notional_value)) if max_notional_value else None,
+        )
+    
+    async def get_all_leverage_info(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Leverage info for every Aster market in two requests.
+        
+        GET /fapi/v1/leverageBracket and GET /fapi/v2/positionRisk without a
+        symbol return all markets. Same dict shape as get_leverage_info(),
+        keyed by base symbol (e.g. "BTC").
+        
+        Returns:
+            Mapping of symbol -> leverage info, or None if the bulk query failed
+        """
+        try:
+            brackets_result, position_risk = await asyncio.gather(
+                self._make_request('GET', '/fapi/v1/leverageBracket', {}),
+                self._make_request('GET', '/fapi/v2/positionRisk', {}),
+                return_exceptions=True,
+            )
+            if isinstance(brackets_result, BaseException) or not isinstance(brackets_result, list):
+                self.logger.warning(f"[ASTER] Bulk leverage bracket query failed: {brackets_result}")
+                return None
+            
+            account_leverage: Dict[str, int] = {}
+            if isinstance(position_risk, list):
+                for entry in position_risk:
+                    leverage = int(entry.get('leverage', 0) or 0)
+                    if leverage > 0:
+                        account_leverage[str(entry.get('symbol', '')).upper()] = leverage
+            
+            results: Dict[str, Dict[str, Any]] = {}
+            for symbol_data in brackets_result:
+                exchange_symbol = str(symbol_data.get('symbol', '')).upper()
+                if not exchange_symbol.endswith('USDT'):
+                    continue
+                max_leverage, max_notional = self._summarize_brackets(symbol_data.get('brackets') or [])
+                if max_leverage is None:
+                    continue
+                
+                leverage = account_leverage.get(exchange_symbol)
+                results[exchange_symbol[: -len('USDT')]] = {
+                    'max_leverage': max_leverage,
+                    'max_notional': max_notional,
+                    'account_leverage': leverage,
+                    # Account leverage determines actual margin usage (see get_leverage_info)
+                    'margin_requirement': Decimal('1') / Decimal(str(leverage or max_leverage)),
+                    'brackets': symbol_data.get('brackets'),
+                    'error': None,
+                }
+            
+            self.logger.debug(f"[ASTER] Loaded leverage info for {len(results)} markets")
+            return results
+        
+        except Exception as e:
+            self.logger.warning(f"[ASTER] Bulk leverage query failed: {e}")
+            return None
+
     def get_min_order_notional(self, symbol: Optional[str]) -> Optional[Decimal]:
         """
         Return the minimum notional requirement for the given symbol if known.
@@ -10,6 +10,7 @@ from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP
 from typing import Any, Callable, Dict, List, Optional
 
 from exchange_clients.base_models import OrderInfo, OrderResult, query_retry
+from exchange_clients.order_state_cache import fresh_order_state
 from exchange_clients.aster.client.utils.helpers import to_decimal
 from exchange_clients.aster.client.utils.converters import build_order_info_from_raw
 from exchange_clients.aster.client.utils.caching import TickSizeCache
@@ -481,10 +482,11 @@ class AsterOrderManager:
         """Get order information from Aster."""
         order_id_str = str(order_id)
         cached = self.latest_orders.get(order_id_str)
-        if not force_refresh and cached is not None:
-            status_upper = (cached.status or "").upper()
-            if status_upper in {"FILLED", "CANCELED", "REJECTED", "EXPIRED"}:
-                return cached
+        if not force_refresh:
+            # Websocket state is served unless stale (stream down / too old while open)
+            fresh = fresh_order_state(self.latest_orders, order_id_str)
+            if fresh is not None:
+                return fresh
 
         result = await self._make_request('GET', '/fapi/v1/order', {
             'symbol': contract_id,
@@ -11,6 +11,7 @@ from typing import Any, Callable, Dict, Optional
 
 from exchange_clients.base_models import CancelReason, OrderInfo
 from exchange_clients.events import LiquidationEvent
+from exchange_clients.order_state_cache import store_order_update
 from exchange_clients.aster.client.utils.helpers import to_decimal
 
 
@@ -128,7 +129,9 @@ class AsterWebSocketHandlers:
                 remaining_size=remaining or Decimal("0"),
                 cancel_reason=cancel_reason,
             )
-            self.latest_orders[order_id] = info
+            # Transaction time orders updates for the same order; stale ones are dropped
+            if not store_order_update(self.latest_orders, order_id, info, sequence=order_data.get("update_time")):
+                return
             
             # Notify order manager that update was received (for await_order_update())
             if self.order_manager:
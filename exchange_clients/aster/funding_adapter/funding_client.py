@@ -32,9 +32,9 @@ class AsterFundingClient:
         
         self.api_base_url = api_base_url
         self.timeout = timeout
-        self.aster_client: Optional[AsterClient] = None
+        self.aster_client: Optional["AsterClient"] = None
 
-    def ensure_client(self) -> AsterClient:
+    def ensure_client(self) -> "AsterClient":
         """
         Ensure API client is initialized.
         
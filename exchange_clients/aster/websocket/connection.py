@@ -8,6 +8,7 @@ import asyncio
 import hmac
 import hashlib
 import time
+from contextlib import asynccontextmanager
 from typing import Dict, Any, Optional, Callable, Awaitable
 from urllib.parse import urlencode
 
@@ -32,6 +33,7 @@ class AsterWebSocketConnection:
         ws_url: str,
         base_url: str,
         logger: Optional[Any] = None,
+        transport: Optional[Any] = None,
     ):
         """
         Initialize connection manager.
@@ -43,6 +45,8 @@ class AsterWebSocketConnection:
             ws_url: WebSocket base URL
             base_url: REST API base URL
             logger: Logger instance
+            transport: The client's ProxyTransport (listen key calls and the
+                       user stream go through its pool and proxy)
         """
         self.config = config
         self.api_key = api_key
@@ -50,6 +54,7 @@ class AsterWebSocketConnection:
         self.ws_url = ws_url
         self.base_url = base_url
         self.logger = logger
+        self.transport = transport
         
         # Connection state
         self.websocket: Optional[websockets.WebSocketClientProtocol] = None
@@ -76,6 +81,23 @@ class AsterWebSocketConnection:
             elif hasattr(self.logger, 'info'):
                 self.logger.info(message)
 
+    @asynccontextmanager
+    async def _request(self, method: str, url: str, **kwargs: Any):
+        """REST call through the client's transport (or a one-off session without one)."""
+        if self.transport is not None:
+            async with self.transport.request(method, url, **kwargs) as response:
+                yield response
+            return
+        async with aiohttp.ClientSession() as session:
+            async with session.request(method, url, **kwargs) as response:
+                yield response
+
+    async def connect_websocket(self, url: str):
+        """Open a websocket through the client's transport (direct without one)."""
+        if self.transport is not None:
+            return await self.transport.connect_websocket(url)
+        return await websockets.connect(url)
+
     def _generate_signature(self, params: Dict[str, Any]) -> str:
         """Generate HMAC SHA256 signature for Aster API authentication."""
         # Use urlencode to properly format the query string
@@ -103,20 +125,20 @@ class AsterWebSocketConnection:
             'Content-Type': 'application/x-www-form-urlencoded'
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f'{self.base_url}/fapi/v1/listenKey',
-                headers=headers,
-                data=params
-            ) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    listen_key = result.get('listenKey')
-                    if not listen_key:
-                        raise Exception("Listen key not found in response")
-                    return listen_key
-                else:
-                    raise Exception(f"Failed to get listen key: {response.status}")
+        async with self._request(
+            'POST',
+            f'{self.base_url}/fapi/v1/listenKey',
+            headers=headers,
+            data=params
+        ) as response:
+            if response.status == 200:
+                result = await response.json()
+                listen_key = result.get('listenKey')
+                if not listen_key:
+                    raise Exception("Listen key not found in response")
+                return listen_key
+            else:
+                raise Exception(f"Failed to get listen key: {response.status}")
 
     async def keepalive_listen_key(self) -> bool:
         """Keep alive the listen key to prevent timeout."""
@@ -135,18 +157,18 @@ class AsterWebSocketConnection:
                 'Content-Type': 'application/x-www-form-urlencoded'
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.put(
-                    f"{self.base_url}/fapi/v1/listenKey",
-                    headers=headers,
-                    data=params
-                ) as response:
-                    if response.status == 200:
-                        self._log("Listen key keepalive successful", "DEBUG")
-                        return True
-                    else:
-                        self._log(f"Failed to keepalive listen key: {response.status}", "WARNING")
-                        return False
+            async with self._request(
+                'PUT',
+                f"{self.base_url}/fapi/v1/listenKey",
+                headers=headers,
+                data=params
+            ) as response:
+                if response.status == 200:
+                    self._log("Listen key keepalive successful", "DEBUG")
+                    return True
+                else:
+                    self._log(f"Failed to keepalive listen key: {response.status}", "WARNING")
+                    return False
         except Exception as e:
             self._log(f"Error keeping alive listen key: {e}", "ERROR")
             return False
@@ -184,7 +206,7 @@ class AsterWebSocketConnection:
             WebSocket connection
         """
         ws_url = f"{self.ws_url}/ws/{listen_key}"
-        self.websocket = await websockets.connect(ws_url)
+        self.websocket = await self.connect_websocket(ws_url)
         self.listen_key = listen_key
         self.running = True
         return self.websocket
@@ -10,7 +10,7 @@ from typing import Dict, Any, Optional, Callable, Awaitable, List
 
 import websockets
 
-from exchange_clients.base_websocket import BaseWebSocketManager, BBOData
+from exchange_clients.base_websocket import BaseWebSocketManager, BBOData, socket_is_open
 
 from .connection import AsterWebSocketConnection
 from .order_book import AsterOrderBook
@@ -29,6 +29,7 @@ class AsterWebSocketManager(BaseWebSocketManager):
         order_update_callback: Callable,
         liquidation_callback: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
         symbol_formatter: Optional[Callable[[str], str]] = None,
+        transport: Optional[Any] = None,
     ):
         """
         Initialize WebSocket manager.
@@ -40,6 +41,7 @@ class AsterWebSocketManager(BaseWebSocketManager):
             order_update_callback: Callback for order updates
             liquidation_callback: Callback for liquidations
             symbol_formatter: Function to format symbols
+            transport: The client's ProxyTransport (pool and proxy for REST and streams)
         """
         super().__init__()
         self.config = config
@@ -60,6 +62,7 @@ class AsterWebSocketManager(BaseWebSocketManager):
             secret_key=secret_key,
             ws_url=self.ws_url,
             base_url=self.base_url,
+            transport=transport,
         )
         self.order_book = AsterOrderBook()
         self.market_switcher = AsterMarketSwitcher(
@@ -69,6 +72,7 @@ class AsterWebSocketManager(BaseWebSocketManager):
             order_book_manager=self.order_book,
             notify_bbo_update_fn=self._notify_bbo_update,
             running=False,
+            connect_fn=self.connection.connect_websocket,
         )
         self.message_handler = AsterMessageHandler(
             config=config,
@@ -91,6 +95,19 @@ class AsterWebSocketManager(BaseWebSocketManager):
         self.market_switcher.set_logger(logger)
         self.message_handler.set_logger(logger)
 
+    def set_recorder(self, recorder):
+        """Attach a feed recorder to the user stream and market data streams."""
+        super().set_recorder(recorder)
+        self.market_switcher.recorder = recorder
+
+    def get_replay_handlers(self) -> Dict[str, Callable[[Any], Awaitable[None]]]:
+        """Recorded streams: ``user`` (user data), ``book_ticker`` and ``depth``."""
+        return {
+            "user": self.message_handler.process_message,
+            "book_ticker": self.market_switcher.process_book_ticker_message,
+            "depth": self.market_switcher.process_depth_message,
+        }
+
     def _log(self, message: str, level: str = "INFO"):
         """Log message using the logger if available."""
         if self.logger:
@@ -141,6 +158,17 @@ class AsterWebSocketManager(BaseWebSocketManager):
 
         # Format symbol for Aster (e.g., "TOSHI" -> "TOSHIUSDT")
         stream_symbol = self.market_switcher.format_symbol(symbol)
+
+        if not self.public_book_feed:
+            # Public book is served by the shared market-data daemon; only keep config in sync
+            await self.market_switcher.cancel_all_streams()
+            self.market_switcher._current_book_ticker_symbol = None
+            self.market_switcher._current_depth_symbol = None
+            self.order_book.reset_order_book()
+            self.order_book.best_bid = None
+            self.order_book.best_ask = None
+            self.market_switcher._update_market_config(stream_symbol)
+            return
         
         # Start book ticker for BBO (handles its own switching logic)
         await self.market_switcher.start_book_ticker(stream_symbol)
@@ -171,6 +199,7 @@ class AsterWebSocketManager(BaseWebSocketManager):
             self.running = True
             self.connection.running = True
             self.market_switcher.set_running(True)
+            self.start_recording_from_env("aster")
             
             # Update message handler with WebSocket reference
             self.message_handler.set_ws(ws)
@@ -179,7 +208,7 @@ class AsterWebSocketManager(BaseWebSocketManager):
 
             # Start keepalive task
             self.connection._keepalive_task = asyncio.create_task(
-                self.connection.start_keepalive_task(reconnect_fn=self.connect)
+                self.connection.start_keepalive_task(reconnect_fn=self.reconnect)
             )
             
             # Start market data streams for the already-configured symbol
@@ -211,6 +240,40 @@ class AsterWebSocketManager(BaseWebSocketManager):
             self._log(f"WebSocket connection error: {e}", "ERROR")
             raise
 
+    def private_stream_open(self) -> bool:
+        """User data socket is open and its listener is still consuming it."""
+        task = self._listener_task
+        return socket_is_open(self.connection.websocket) and task is not None and not task.done()
+
+    def public_stream_open(self) -> bool:
+        """Book ticker socket is open and its listener is still consuming it."""
+        task = self.market_switcher._book_ticker_task
+        return socket_is_open(self.market_switcher._book_ticker_ws) and task is not None and not task.done()
+
+    async def reconnect(self):
+        """Re-open the user data stream with a fresh listen key (keepalive health-check path)."""
+        if not self.running:
+            return await self.connect()
+
+        self._notify_private_stream_drop()
+        if self._listener_task and not self._listener_task.done():
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+        if self.connection.websocket:
+            try:
+                await self.connection.websocket.close()
+            except Exception:
+                pass
+
+        listen_key = await self.connection.get_listen_key()
+        ws = await self.connection.open_connection(listen_key)
+        self.message_handler.set_ws(ws)
+        self._listener_task = asyncio.create_task(self._listen_loop())
+        self._log("[ASTER] 🔗 Reconnected user data stream", "INFO")
+
     async def _listen_loop(self):
         """Listen for WebSocket messages on user data stream."""
         try:
@@ -220,6 +283,10 @@ class AsterWebSocketManager(BaseWebSocketManager):
                         if not self.running:
                             break
                         
+                        self.note_private_message()
+                        if self.recorder is not None:
+                            self.recorder.record("user", message)
+
                         # Process message through handler
                         await self.message_handler.process_message(message)
                 
@@ -234,6 +301,9 @@ class AsterWebSocketManager(BaseWebSocketManager):
         except Exception as e:
             if self.running:
                 self._log(f"WebSocket listen error: {e}", "ERROR")
+        finally:
+            # Order updates may be missed until the stream is re-opened
+            self._notify_private_stream_drop()
 
     async def disconnect(self):
         """Disconnect from WebSocket."""
@@ -262,6 +332,8 @@ class AsterWebSocketManager(BaseWebSocketManager):
 
         # Close main connection
         await self.connection.close_connection()
+        self._notify_private_stream_drop()
+        self.stop_recording()
         
         self._log("WebSocket disconnected", "INFO")
 
@@ -5,13 +5,14 @@ Handles market subscription switching, book ticker, and depth stream management.
 """
 
 import asyncio
-import json
 import time
-from typing import Dict, Any, Optional, Callable
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 import websockets
 
 from exchange_clients.base_websocket import BBOData
+from exchange_clients.market_data.decoding import BookMessage, JSONDecodeError, TickerMessage
+from helpers.unified_logger import log_throttled
 
 
 class AsterMarketSwitcher:
@@ -26,6 +27,7 @@ class AsterMarketSwitcher:
         notify_bbo_update_fn: Optional[Callable] = None,
         running: bool = False,
         logger: Optional[Any] = None,
+        connect_fn: Optional[Callable[[str], Awaitable[Any]]] = None,
     ):
         """
         Initialize market switcher.
@@ -38,6 +40,7 @@ class AsterMarketSwitcher:
             notify_bbo_update_fn: Function to notify BBO updates
             running: Whether the manager is running
             logger: Logger instance
+            connect_fn: Opens a websocket for a URL (defaults to websockets.connect)
         """
         self.config = config
         self.ws_url = ws_url
@@ -46,6 +49,8 @@ class AsterMarketSwitcher:
         self.notify_bbo_update = notify_bbo_update_fn
         self.running = running
         self.logger = logger
+        self._connect = connect_fn or websockets.connect
+        self.recorder: Optional[Any] = None
         
         # Stream state
         self._current_book_ticker_symbol: Optional[str] = None
@@ -132,18 +137,18 @@ class AsterMarketSwitcher:
         
         try:
             # Connect to WebSocket
-            self._book_ticker_ws = await websockets.connect(book_ticker_url)
+            self._book_ticker_ws = await self._connect(book_ticker_url)
             
             self._log(f"✅ Connected to Aster book ticker for {symbol}", "INFO")
             
             # Wait for first BBO message (up to 5 seconds)
             try:
                 message = await asyncio.wait_for(self._book_ticker_ws.recv(), timeout=5.0)
-                data = json.loads(message)
+                if self.recorder is not None:
+                    self.recorder.record("book_ticker", message)
                 
                 # Process first message through order book manager
-                if self.order_book:
-                    await self.order_book.handle_book_ticker(data, self.notify_bbo_update)
+                await self.process_book_ticker_message(message)
                 
                 if self.order_book:
                     self._log(
@@ -160,6 +165,20 @@ class AsterMarketSwitcher:
             self._log(f"Failed to connect to book ticker: {e}", "ERROR")
             raise
     
+    async def process_book_ticker_message(self, message: Any) -> None:
+        """Decode a raw book ticker frame and apply it to the order book."""
+        if self.order_book:
+            decoded = self.order_book.decoder.decode(message)
+            if decoded.__class__ is TickerMessage:
+                await self.order_book.apply_ticker_message(decoded, self.notify_bbo_update)
+
+    async def process_depth_message(self, message: Any) -> None:
+        """Decode a raw depth frame and apply it to the order book."""
+        if self.order_book:
+            decoded = self.order_book.decoder.decode(message)
+            if decoded.__class__ is BookMessage:
+                await self.order_book.apply_depth_message(decoded, self.notify_bbo_update)
+
     async def _listen_book_ticker(self):
         """
         Continuously listen for book ticker messages.
@@ -178,14 +197,14 @@ class AsterMarketSwitcher:
                         if not self.running:
                             break
                         
+                        if self.recorder is not None:
+                            self.recorder.record("book_ticker", message)
                         try:
-                            data = json.loads(message)
-                            if self.order_book:
-                                await self.order_book.handle_book_ticker(data, self.notify_bbo_update)
-                        except json.JSONDecodeError as e:
-                            self._log(f"Failed to parse book ticker message: {e}", "ERROR")
+                            await self.process_book_ticker_message(message)
+                        except JSONDecodeError as e:
+                            log_throttled(self.logger, f"Failed to parse book ticker message: {e}", "ERROR")
                         except Exception as e:
-                            self._log(f"Error handling book ticker: {e}", "ERROR")
+                            log_throttled(self.logger, f"Error handling book ticker: {e}", "ERROR")
                 
                 except websockets.exceptions.ConnectionClosed:
                     if self.running:
@@ -196,7 +215,7 @@ class AsterMarketSwitcher:
                         try:
                             stream_name = f"{self._current_book_ticker_symbol.lower()}@bookTicker"
                             book_ticker_url = f"{self.ws_url}/ws/{stream_name}"
-                            self._book_ticker_ws = await websockets.connect(book_ticker_url)
+                            self._book_ticker_ws = await self._connect(book_ticker_url)
                             reconnect_delay = 1  # Reset on successful reconnect
                             self._log("✅ Reconnected to book ticker", "INFO")
                         except Exception as e:
@@ -285,7 +304,8 @@ class AsterMarketSwitcher:
             
             while self.running:
                 try:
-                    async with websockets.connect(depth_url) as ws:
+                    ws = await self._connect(depth_url)
+                    try:
                         self._depth_ws = ws
                         
                         self._log(f"📚 [ASTER] Connected to depth stream for {symbol}", "INFO")
@@ -298,14 +318,16 @@ class AsterMarketSwitcher:
                             if not self.running:
                                 break
                             
+                            if self.recorder is not None:
+                                self.recorder.record("depth", message)
                             try:
-                                data = json.loads(message)
-                                if self.order_book:
-                                    await self.order_book.handle_depth_update(data, self.notify_bbo_update)
-                            except json.JSONDecodeError as e:
-                                self._log(f"Failed to parse depth message: {e}", "ERROR")
+                                await self.process_depth_message(message)
+                            except JSONDecodeError as e:
+                                log_throttled(self.logger, f"Failed to parse depth message: {e}", "ERROR")
                             except Exception as e:
-                                self._log(f"Error handling depth update: {e}", "ERROR")
+                                log_throttled(self.logger, f"Error handling depth update: {e}", "ERROR")
+                    finally:
+                        await ws.close()
                 
                 except websockets.exceptions.ConnectionClosed:
                     if self.running:
@@ -11,6 +11,7 @@ from typing import Dict, Any, Optional, Callable, Awaitable
 import websockets
 
 from exchange_clients.base_websocket import BBOData
+from helpers.unified_logger import UnifiedLogger, log_throttled
 
 
 class AsterMessageHandler:
@@ -91,9 +92,9 @@ class AsterMessageHandler:
             
             await self._handle_message(data)
         except json.JSONDecodeError as e:
-            self._log(f"Failed to parse WebSocket message: {e}", "ERROR")
+            log_throttled(self.logger, f"Failed to parse WebSocket message: {e}", "ERROR")
         except Exception as e:
-            self._log(f"Error handling WebSocket message: {e}", "ERROR")
+            log_throttled(self.logger, f"Error handling WebSocket message: {e}", "ERROR")
 
     async def _handle_message(self, data: Dict[str, Any]):
         """Handle incoming WebSocket messages and route by event type."""
@@ -108,7 +109,7 @@ class AsterMessageHandler:
             elif event_type == 'listenKeyExpired':
                 self._log("Listen key expired, reconnecting...", "WARNING")
                 # Note: Reconnection should be handled by connection manager
-            else:
+            elif UnifiedLogger.is_enabled("DEBUG"):
                 self._log(f"Unknown WebSocket message: {data}", "DEBUG")
 
         except Exception as e:
@@ -151,7 +152,8 @@ class AsterMessageHandler:
                     'size': quantity,
                     'price': price,
                     'contract_id': symbol,
-                    'filled_size': executed_qty
+                    'filled_size': executed_qty,
+                    'update_time': order_info.get('T'),
                 })
 
         except Exception as e:
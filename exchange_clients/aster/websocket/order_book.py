@@ -1,7 +1,9 @@
 """
 Order book state management for Aster WebSocket.
 
-Handles order book updates, BBO extraction, and state management.
+Handles order book updates, BBO extraction, and state management. Depth
+levels are held as integer (price, size) units from the typed decoder and only
+become Decimals when a caller reads the book.
 """
 
 import time
@@ -9,6 +11,15 @@ from decimal import Decimal
 from typing import Dict, Any, List, Optional, Callable
 
 from exchange_clients.base_websocket import BBOData
+from exchange_clients.market_data.decoding import (
+    AsterDecoder,
+    BookMessage,
+    TickerMessage,
+    to_units,
+    units_to_decimal,
+    units_to_float,
+)
+from helpers.unified_logger import log_throttled
 
 
 class AsterOrderBook:
@@ -24,19 +35,24 @@ class AsterOrderBook:
         self.logger = logger
         
         # Order book state (from depth stream)
-        self.order_book = {"bids": [], "asks": []}  # Snapshot format: [{'price': Decimal, 'size': Decimal}, ...]
+        self.order_book = {"bids": [], "asks": []}  # Snapshot format: [(price_units, size_units), ...], best first
         self.order_book_ready = False
         
         # BBO state (from book ticker stream)
         self.best_bid: Optional[float] = None
         self.best_ask: Optional[float] = None
 
+        self.decoder = AsterDecoder()
+
     def set_logger(self, logger):
         """Set the logger instance."""
         self.logger = logger
 
     def _log(self, message: str, level: str = "INFO"):
-        """Log message using the logger if available."""
+        """Log message using the logger if available (warnings/errors throttled per call site)."""
+        if level in ("WARNING", "ERROR"):
+            log_throttled(self.logger, message, level, depth=1)
+            return
         if self.logger:
             if hasattr(self.logger, 'log'):
                 self.logger.log(message, level)
@@ -62,6 +78,13 @@ class AsterOrderBook:
             bids: List of bid levels [{'price': Decimal, 'size': Decimal}, ...]
             asks: List of ask levels [{'price': Decimal, 'size': Decimal}, ...]
         """
+        self.apply_depth_levels(
+            [(to_units(str(level['price'])), to_units(str(level['size']))) for level in bids],
+            [(to_units(str(level['price'])), to_units(str(level['size']))) for level in asks],
+        )
+
+    def apply_depth_levels(self, bids: List[Any], asks: List[Any]):
+        """Replace the book with decoded (price_units, size_units) levels, best first."""
         self.order_book = {
             'bids': bids,
             'asks': asks
@@ -70,9 +93,9 @@ class AsterOrderBook:
         
         # Extract BBO from depth stream (ensures freshness even if book ticker hasn't updated)
         if bids:
-            self.best_bid = float(bids[0]['price'])  # Already sorted, first is best
+            self.best_bid = units_to_float(bids[0][0])  # Already sorted, first is best
         if asks:
-            self.best_ask = float(asks[0]['price'])  # Already sorted, first is best
+            self.best_ask = units_to_float(asks[0][0])  # Already sorted, first is best
 
     def update_bbo_from_book_ticker(self, best_bid: float, best_ask: float):
         """
@@ -99,7 +122,6 @@ class AsterOrderBook:
             return None
         
         try:
-            # Order book is already in standard format from depth stream
             bids = self.order_book.get('bids', [])
             asks = self.order_book.get('asks', [])
             
@@ -112,7 +134,10 @@ class AsterOrderBook:
                 bids = bids[:levels]
                 asks = asks[:levels]
             
-            return {'bids': bids, 'asks': asks}
+            return {
+                'bids': [{'price': units_to_decimal(price), 'size': units_to_decimal(size)} for price, size in bids],
+                'asks': [{'price': units_to_decimal(price), 'size': units_to_decimal(size)} for price, size in asks],
+            }
             
         except Exception as e:
             self._log(f"Error formatting order book: {e}", "ERROR")
@@ -135,37 +160,27 @@ class AsterOrderBook:
             data: Raw depth update message
             notify_bbo_fn: Optional function to notify BBO updates
         """
+        message = self.decoder.decode_data(data)
+        if message.__class__ is BookMessage:
+            await self.apply_depth_message(message, notify_bbo_fn)
+        elif message.type == 'depthUpdate':
+            self._log(f"Error processing depth update: malformed payload {data}", "ERROR")
+
+    async def apply_depth_message(self, message: BookMessage, notify_bbo_fn: Optional[Callable] = None):
+        """Apply a decoded partial-depth snapshot and notify the new BBO."""
         try:
-            if data.get('e') != 'depthUpdate':
-                return
-            
-            # Extract bids and asks
-            bids_raw = data.get('b', [])
-            asks_raw = data.get('a', [])
-            
-            # Convert to standard format
-            bids = [
-                {'price': Decimal(price), 'size': Decimal(qty)}
-                for price, qty in bids_raw
-            ]
-            asks = [
-                {'price': Decimal(price), 'size': Decimal(qty)}
-                for price, qty in asks_raw
-            ]
-            
             # Update order book state (snapshot, not incremental)
-            self.update_order_book_from_depth(bids, asks)
+            self.apply_depth_levels(message.bids, message.asks)
             
             # Notify BBO update if callback provided
             if notify_bbo_fn and self.best_bid and self.best_ask:
-                symbol = data.get('s', '')
                 await notify_bbo_fn(
                     BBOData(
-                        symbol=symbol,
+                        symbol=message.symbol or '',
                         bid=self.best_bid,
                         ask=self.best_ask,
                         timestamp=time.time(),
-                        sequence=data.get('u'),
+                        sequence=message.sequence,
                     )
                 )
             
@@ -191,18 +206,16 @@ class AsterOrderBook:
             data: Raw book ticker message
             notify_bbo_fn: Optional function to notify BBO updates
         """
+        message = self.decoder.decode_data(data)
+        if message.__class__ is TickerMessage:
+            await self.apply_ticker_message(message, notify_bbo_fn)
+
+    async def apply_ticker_message(self, message: TickerMessage, notify_bbo_fn: Optional[Callable] = None):
+        """Apply a decoded book ticker and notify the new BBO."""
         try:
-            if data.get('e') != 'bookTicker':
-                return
-            
-            # Extract symbol, best bid and ask
-            symbol = data.get('s', '')
-            best_bid_str = data.get('b')
-            best_ask_str = data.get('a')
-            
-            if best_bid_str and best_ask_str:
-                best_bid = float(best_bid_str)
-                best_ask = float(best_ask_str)
+            if message.bid and message.ask:
+                best_bid = units_to_float(message.bid)
+                best_ask = units_to_float(message.ask)
                 
                 self.update_bbo_from_book_ticker(best_bid, best_ask)
                 
@@ -210,14 +223,13 @@ class AsterOrderBook:
                 if notify_bbo_fn:
                     await notify_bbo_fn(
                         BBOData(
-                            symbol=symbol,
+                            symbol=message.symbol or '',
                             bid=best_bid,
                             ask=best_ask,
                             timestamp=time.time(),
-                            sequence=data.get('u'),
+                            sequence=message.sequence,
                         )
                     )
         
         except Exception as e:
             self._log(f"Error processing book ticker: {e}", "ERROR")
-
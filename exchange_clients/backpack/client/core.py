@@ -18,6 +18,7 @@ from exchange_clients.base_models import (
     TradeData,
     validate_credentials,
 )
+from exchange_clients.order_state_cache import OrderStateCache
 from exchange_clients.backpack.common import (
     get_backpack_symbol_format,
     normalize_symbol as normalize_backpack_symbol,
@@ -43,6 +44,8 @@ from .managers.websocket_handlers import BackpackWebSocketHandlers
 class BackpackClient(BaseExchangeClient):
     """Backpack exchange client implementation."""
 
+    SHARED_METADATA_ATTRS = ("_contract_id_cache", "_precision_cache", "_market_symbol_map")
+
     # Default maximum decimal places (fallback if we can't infer from market data)
     MAX_PRICE_DECIMALS = 3
 
@@ -82,7 +85,7 @@ class BackpackClient(BaseExchangeClient):
         # Caches
         self._precision_cache = SymbolPrecisionCache(max_price_decimals=self.MAX_PRICE_DECIMALS)
         self._market_symbol_map = MarketSymbolMapCache()
-        self._latest_orders: Dict[str, OrderInfo] = {}
+        self._latest_orders: Dict[str, OrderInfo] = OrderStateCache(stream_live=self._order_stream_live)
 
         # Initialize Backpack SDK clients
         try:
@@ -182,6 +185,7 @@ class BackpackClient(BaseExchangeClient):
                 symbol_formatter=self._ensure_exchange_symbol,
             )
             self.ws_manager.set_logger(self.logger)
+            self._watch_order_stream(self.ws_manager)
         else:
             self.ws_manager.update_symbol(ws_symbol)
 
@@ -202,6 +206,7 @@ class BackpackClient(BaseExchangeClient):
 
     async def disconnect(self) -> None:
         """Disconnect from Backpack WebSocket and cleanup."""
+        await self.close_shared_book()
         if self.ws_manager:
             await self.ws_manager.disconnect()
 
@@ -251,6 +256,9 @@ class BackpackClient(BaseExchangeClient):
 
     async def fetch_bbo_prices(self, contract_id: str):
         """Fetch best bid/offer, preferring WebSocket data when available."""
+        shared = self.shared_bbo()
+        if shared is not None:
+            return shared
         return await self.market_data.fetch_bbo_prices(contract_id)
 
     async def get_order_book_depth(
@@ -259,6 +267,9 @@ class BackpackClient(BaseExchangeClient):
         levels: int = 10,
     ):
         """Fetch order book depth, preferring WebSocket data when available."""
+        shared = self.shared_order_book(levels)
+        if shared is not None:
+            return shared
         return await self.market_data.get_order_book_depth(contract_id, levels)
 
     async def get_order_price(self, direction: str) -> Decimal:
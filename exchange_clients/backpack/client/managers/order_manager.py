@@ -20,6 +20,7 @@ from typing import Any, Callable, Dict, List, Optional
 from bpx.constants.enums import OrderTypeEnum, TimeInForceEnum
 
 from exchange_clients.base_models import OrderInfo, OrderResult, query_retry
+from exchange_clients.order_state_cache import fresh_order_state
 from exchange_clients.backpack.client.utils.converters import build_order_info_from_raw
 from exchange_clients.backpack.client.utils.caching import SymbolPrecisionCache
 
@@ -503,10 +504,11 @@ class BackpackOrderManager:
         """Fetch detailed order information."""
         order_id_str = str(order_id)
         cached = self.latest_orders.get(order_id_str)
-        if cached and not force_refresh:
-            status_upper = (cached.status or "").upper()
-            if status_upper in {"FILLED", "CANCELED"}:
-                return cached
+        if not force_refresh:
+            # Websocket state is served unless stale (stream down / too old while open)
+            fresh = fresh_order_state(self.latest_orders, order_id_str)
+            if fresh is not None:
+                return fresh
         try:
             order = self.account_client.get_open_order(symbol=self.config.contract_id, order_id=order_id)
         except Exception as exc:
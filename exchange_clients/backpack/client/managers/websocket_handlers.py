@@ -10,6 +10,7 @@ from decimal import Decimal
 from typing import Any, Callable, Dict, Optional
 
 from exchange_clients.base_models import CancelReason, OrderInfo
+from exchange_clients.order_state_cache import store_order_update
 from exchange_clients.events import LiquidationEvent
 from exchange_clients.backpack.client.utils.helpers import to_decimal, to_internal_symbol
 
@@ -146,7 +147,9 @@ class BackpackWebSocketHandlers:
                 remaining_size=remaining or Decimal("0"),
                 cancel_reason=cancel_reason,
             )
-            self.latest_orders[order_id] = info
+            # Engine timestamp orders updates for the same order; stale ones are dropped
+            if not store_order_update(self.latest_orders, order_id, info, sequence=order_data.get("T")):
+                return
             
             # Notify order manager that update was received (for await_order_update())
             if self.order_manager:
@@ -5,13 +5,14 @@ Orchestrates connection, order book, message handling, and market switching.
 """
 
 import asyncio
+import json
 import time
 from decimal import Decimal
 from typing import Any, Callable, Dict, List, Optional, Awaitable
 
 import websockets
 
-from exchange_clients.base_websocket import BaseWebSocketManager, BBOData
+from exchange_clients.base_websocket import BaseWebSocketManager, BBOData, socket_is_open
 
 from .connection import BackpackWebSocketConnection
 from .order_book import BackpackOrderBook
@@ -215,6 +216,7 @@ class BackpackWebSocketManager(BaseWebSocketManager):
         self._ready_event.clear()
         self._account_ready_event.clear()
         self._depth_ready_event.clear()
+        self.start_recording_from_env("backpack")
 
         # Start account stream task
         self._account_task = asyncio.create_task(
@@ -258,6 +260,7 @@ class BackpackWebSocketManager(BaseWebSocketManager):
 
         await self.connection.close_account_ws(self.connection._account_ws)
         await self.connection.close_depth_ws(self.connection._depth_ws)
+        self._notify_private_stream_drop()
 
         self._account_task = None
         self._depth_task = None
@@ -266,6 +269,7 @@ class BackpackWebSocketManager(BaseWebSocketManager):
         self._account_ready_event.clear()
         self._depth_ready_event.clear()
         self.order_book.reset()
+        self.stop_recording()
 
     def update_symbol(self, symbol: Optional[str]) -> None:
         """
@@ -299,9 +303,21 @@ class BackpackWebSocketManager(BaseWebSocketManager):
             finally:
                 await self.connection.close_account_ws(self.connection._account_ws)
                 self.connection._account_ws = None
+                # Order updates may be missed until the account stream is re-opened
+                self._notify_private_stream_drop()
 
         self._account_ready_event.clear()
 
+    def private_stream_open(self) -> bool:
+        """Account socket is open and its stream task is still running."""
+        task = self._account_task
+        return socket_is_open(self.connection._account_ws) and task is not None and not task.done()
+
+    def public_stream_open(self) -> bool:
+        """Depth socket is open and its stream task is still running."""
+        task = self._depth_task
+        return socket_is_open(self.connection._depth_ws) and task is not None and not task.done()
+
     async def _listen_account_ws(self) -> None:
         """Listen for account stream messages."""
         assert self.connection._account_ws is not None
@@ -309,6 +325,9 @@ class BackpackWebSocketManager(BaseWebSocketManager):
             async for message in self.connection._account_ws:
                 if not self.running:
                     break
+                self.note_private_message()
+                if self.recorder is not None:
+                    self.recorder.record("account", message)
                 await self.message_handler.process_account_message(message)
         except websockets.exceptions.ConnectionClosed:
             if self.logger:
@@ -360,6 +379,8 @@ class BackpackWebSocketManager(BaseWebSocketManager):
                 self.logger.error(f"[BACKPACK] Failed to fetch depth snapshot: {exc}")
             return False
 
+        if self.recorder is not None:
+            self.recorder.record("depth_snapshot", snapshot)
         self.order_book.load_snapshot(snapshot)
         self._depth_ready_event.set()
         return True
@@ -377,35 +398,67 @@ class BackpackWebSocketManager(BaseWebSocketManager):
             async for message in self.connection._depth_ws:
                 if not self.running:
                     break
-                result = self.message_handler.process_depth_message(message)
-                
-                if result["type"] == "depth":
-                    applied = self.order_book.apply_depth_update(result["payload"], self.symbol)
-                    if not applied:
-                        # Gap detected - reload snapshot
-                        asyncio.create_task(self._reload_depth_snapshot())
-                    else:
-                        bbo_data = self.order_book._rebuild_order_book()
-                        if bbo_data:
-                            bbo_data.symbol = self.symbol or ""
-                            asyncio.create_task(self._notify_bbo_update(bbo_data))
-                        self._depth_ready_event.set()
-                elif result["type"] == "book_ticker":
-                    self.order_book.apply_book_ticker(result["payload"])
-                    # Notify BBO update
-                    if self.order_book.best_bid and self.order_book.best_ask:
-                        asyncio.create_task(
-                            self._notify_bbo_update(
-                                BBOData(
-                                    symbol=self.symbol or "",
-                                    bid=float(self.order_book.best_bid),
-                                    ask=float(self.order_book.best_ask),
-                                    timestamp=time.time(),
-                                    sequence=self.order_book._last_update_id,
-                                )
-                            )
-                        )
+                if self.recorder is not None:
+                    self.recorder.record("depth", message)
+                self._process_depth_message(message)
         except websockets.exceptions.ConnectionClosed:
             if self.logger:
                 self.logger.warning("[BACKPACK] Depth stream closed")
 
+    def _process_depth_message(self, message: str, reload_on_gap: bool = True) -> None:
+        """Apply one depth/book ticker frame to the order book and fan out BBO updates."""
+        result = self.message_handler.process_depth_message(message)
+
+        if result["type"] == "depth":
+            previous_bbo = (self.order_book.best_bid, self.order_book.best_ask)
+            applied = self.order_book.apply_depth_message(result["payload"], self.symbol)
+            if not applied:
+                # Gap detected - reload snapshot
+                if reload_on_gap:
+                    asyncio.create_task(self._reload_depth_snapshot())
+            else:
+                best_bid, best_ask = self.order_book.best_bid, self.order_book.best_ask
+                if best_bid is not None and best_ask is not None and (best_bid, best_ask) != previous_bbo:
+                    asyncio.create_task(
+                        self._notify_bbo_update(
+                            BBOData(
+                                symbol=self.symbol or "",
+                                bid=float(best_bid),
+                                ask=float(best_ask),
+                                timestamp=time.time(),
+                                sequence=self.order_book._last_update_id,
+                            )
+                        )
+                    )
+                self._depth_ready_event.set()
+        elif result["type"] == "book_ticker":
+            self.order_book.apply_ticker_message(result["payload"])
+            # Notify BBO update
+            if self.order_book.best_bid and self.order_book.best_ask:
+                asyncio.create_task(
+                    self._notify_bbo_update(
+                        BBOData(
+                            symbol=self.symbol or "",
+                            bid=float(self.order_book.best_bid),
+                            ask=float(self.order_book.best_ask),
+                            timestamp=time.time(),
+                            sequence=self.order_book._last_update_id,
+                        )
+                    )
+                )
+
+    def _replay_depth_snapshot(self, payload: str) -> None:
+        self.order_book.load_snapshot(json.loads(payload))
+        self._depth_ready_event.set()
+
+    def get_replay_handlers(self) -> Dict[str, Callable[[Any], Any]]:
+        """
+        Recorded streams: ``account``, ``depth`` and ``depth_snapshot`` (REST
+        snapshots taken on connect and after sequence gaps, so replay never
+        needs to reload them itself).
+        """
+        return {
+            "account": self.message_handler.process_account_message,
+            "depth": lambda message: self._process_depth_message(message, reload_on_gap=False),
+            "depth_snapshot": self._replay_depth_snapshot,
+        }
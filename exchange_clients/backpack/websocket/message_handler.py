@@ -8,6 +8,9 @@ import json
 from decimal import Decimal, InvalidOperation
 from typing import Any, Callable, Dict, Optional, Awaitable
 
+from exchange_clients.market_data.decoding import BackpackDecoder, BookMessage, JSONDecodeError, TickerMessage
+from helpers.unified_logger import UnifiedLogger, log_throttled
+
 
 class BackpackMessageHandler:
     """Handles WebSocket message parsing and routing."""
@@ -29,6 +32,7 @@ class BackpackMessageHandler:
         self.order_update_callback = order_update_callback
         self.liquidation_callback = liquidation_callback
         self.logger = logger
+        self.decoder = BackpackDecoder()
 
     def set_logger(self, logger):
         """Set the logger instance."""
@@ -58,7 +62,7 @@ class BackpackMessageHandler:
         try:
             data = json.loads(message)
         except json.JSONDecodeError as exc:
-            self._log(f"[BACKPACK] Failed to decode account message: {exc}", "ERROR")
+            log_throttled(self.logger, f"[BACKPACK] Failed to decode account message: {exc}", "ERROR")
             return
 
         stream = data.get("stream", "")
@@ -66,7 +70,7 @@ class BackpackMessageHandler:
 
         if "orderUpdate" in stream:
             await self._handle_order_update(payload)
-        else:
+        elif UnifiedLogger.is_enabled("DEBUG"):
             self._log(f"[BACKPACK] Ignoring account stream message: {data}", "DEBUG")
 
     async def _handle_order_update(self, payload: Dict[str, Any]) -> None:
@@ -127,28 +131,26 @@ class BackpackMessageHandler:
 
     def process_depth_message(self, message: str) -> Dict[str, Any]:
         """
-        Process depth stream message.
+        Decode a depth stream message.
         
         Args:
             message: Raw message string
             
         Returns:
-            Dictionary with message type and payload
+            Dictionary with message type and decoded payload (BookMessage for
+            depth, TickerMessage for book ticker)
         """
         try:
-            data = json.loads(message)
-        except json.JSONDecodeError as exc:
-            self._log(f"[BACKPACK] Failed to decode depth message: {exc}", "ERROR")
+            decoded = self.decoder.decode(message)
+        except JSONDecodeError as exc:
+            log_throttled(self.logger, f"[BACKPACK] Failed to decode depth message: {exc}", "ERROR")
             return {"type": None, "payload": None}
 
-        stream = data.get("stream", "")
-        payload = data.get("data", {})
-
-        if stream.startswith("depth"):
-            return {"type": "depth", "payload": payload}
-        elif stream.startswith("bookTicker"):
-            return {"type": "book_ticker", "payload": payload}
+        if decoded.__class__ is BookMessage:
+            return {"type": "depth", "payload": decoded}
+        elif decoded.__class__ is TickerMessage:
+            return {"type": "book_ticker", "payload": decoded}
         else:
-            self._log(f"[BACKPACK] Ignoring depth stream message: {data}", "DEBUG")
+            if UnifiedLogger.is_enabled("DEBUG"):
+                self._log(f"[BACKPACK] Ignoring depth stream message: {decoded.data}", "DEBUG")
             return {"type": None, "payload": None}
-
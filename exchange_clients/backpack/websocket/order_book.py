@@ -2,6 +2,8 @@
 Order book state management for Backpack WebSocket.
 
 Handles order book updates, validation, BBO extraction, and state management.
+Levels are keyed by integer price units from the typed decoder; the sorted
+Decimal view is only built when a caller reads the book.
 """
 
 import asyncio
@@ -10,6 +12,14 @@ from decimal import Decimal, InvalidOperation
 from typing import Any, Dict, List, Optional
 
 from exchange_clients.base_websocket import BBOData
+from exchange_clients.market_data.decoding import (
+    BackpackDecoder,
+    BookMessage,
+    TickerMessage,
+    to_units,
+    units_to_decimal,
+)
+from helpers.unified_logger import log_throttled
 
 
 class BackpackOrderBook:
@@ -25,18 +35,20 @@ class BackpackOrderBook:
         self.logger = logger
         
         # Order book state
-        self.order_book: Dict[str, List[Dict[str, Decimal]]] = {"bids": [], "asks": []}
         self.best_bid: Optional[Decimal] = None
         self.best_ask: Optional[Decimal] = None
         self.order_book_ready: bool = False
         
-        # Internal order book representation keyed by price
-        self._order_levels: Dict[str, Dict[Decimal, Decimal]] = {
+        # Internal order book representation: price units -> size units
+        self._order_levels: Dict[str, Dict[int, int]] = {
             "bids": {},
             "asks": {},
         }
+        self._best_bid_units: Optional[int] = None
+        self._best_ask_units: Optional[int] = None
         self._last_update_id: Optional[int] = None
         self._depth_reload_lock = asyncio.Lock()
+        self.decoder = BackpackDecoder()
 
     def set_logger(self, logger):
         """Set the logger instance."""
@@ -44,6 +56,10 @@ class BackpackOrderBook:
 
     def _log(self, message: str, level: str = "INFO"):
         """Log message using the logger if available."""
+        # Malformed depth repeats on every frame; keep one line per call site per interval
+        if level in ("WARNING", "ERROR"):
+            log_throttled(self.logger, message, level, depth=1)
+            return
         if self.logger:
             if hasattr(self.logger, 'log'):
                 self.logger.log(message, level)
@@ -61,10 +77,19 @@ class BackpackOrderBook:
         self.order_book_ready = False
         self.best_bid = None
         self.best_ask = None
-        self.order_book = {"bids": [], "asks": []}
         self._order_levels = {"bids": {}, "asks": {}}
+        self._best_bid_units = None
+        self._best_ask_units = None
         self._last_update_id = None
 
+    @property
+    def order_book(self) -> Dict[str, List[Dict[str, Decimal]]]:
+        """Full sorted book as ``{'bids': [{'price', 'size'}], 'asks': [...]}``."""
+        return {
+            "bids": self._format_side("bids", None),
+            "asks": self._format_side("asks", None),
+        }
+
     def apply_book_ticker(self, payload: Dict[str, Any]) -> None:
         """
         Apply book ticker update (BBO snapshot).
@@ -80,6 +105,11 @@ class BackpackOrderBook:
         except (InvalidOperation, TypeError):
             return
 
+    def apply_ticker_message(self, message: TickerMessage) -> None:
+        """Apply a decoded book ticker (BBO snapshot)."""
+        self.best_bid = units_to_decimal(message.bid)
+        self.best_ask = units_to_decimal(message.ask)
+
     def apply_depth_update(self, payload: Dict[str, Any], symbol: Optional[str] = None) -> bool:
         """
         Apply depth update to order book.
@@ -91,13 +121,30 @@ class BackpackOrderBook:
         Returns:
             True if update was applied, False if rejected
         """
-        if not payload or payload.get("e") != "depth":
+        if not payload:
+            return False
+        try:
+            message = self.decoder.depth_from_payload(payload)
+        except (KeyError, TypeError, ValueError, ArithmeticError):
             return False
-        if symbol and payload.get("s") and payload["s"] != symbol:
+        return self.apply_depth_message(message, symbol)
+
+    def apply_depth_message(self, message: BookMessage, symbol: Optional[str] = None) -> bool:
+        """
+        Apply a decoded depth delta.
+        
+        Args:
+            message: Decoded depth update
+            symbol: Optional symbol to validate against
+            
+        Returns:
+            True if update was applied, False if rejected
+        """
+        if symbol and message.symbol and message.symbol != symbol:
             return False
 
-        first_update = self._to_int(payload.get("U"))
-        final_update = self._to_int(payload.get("u"))
+        first_update = message.first_sequence
+        final_update = message.sequence
 
         if self._last_update_id is not None and first_update is not None:
             if final_update is not None and final_update <= self._last_update_id:
@@ -106,8 +153,8 @@ class BackpackOrderBook:
                 # Gap detected - need to reload snapshot
                 return False
 
-        self._apply_depth_side("bids", payload.get("b", []))
-        self._apply_depth_side("asks", payload.get("a", []))
+        self._apply_depth_side("bids", message.bids)
+        self._apply_depth_side("asks", message.asks)
 
         if final_update is not None:
             self._last_update_id = final_update
@@ -116,24 +163,16 @@ class BackpackOrderBook:
         self.order_book_ready = True
         return True
 
-    def _apply_depth_side(self, side: str, updates: List[List[str]]) -> None:
+    def _apply_depth_side(self, side: str, updates: List[Any]) -> None:
         """
         Apply depth updates for one side (bids or asks).
         
         Args:
             side: "bids" or "asks"
-            updates: List of [price, size] pairs
+            updates: List of (price_units, size_units) pairs
         """
-        if side not in self._order_levels:
-            return
         levels = self._order_levels[side]
-        for price_str, size_str in updates:
-            try:
-                price = Decimal(str(price_str))
-                size = Decimal(str(size_str))
-            except (InvalidOperation, TypeError):
-                continue
-
+        for price, size in updates:
             if size <= 0:
                 levels.pop(price, None)
             else:
@@ -149,26 +188,17 @@ class BackpackOrderBook:
         bids = snapshot.get("bids") or []
         asks = snapshot.get("asks") or []
 
-        self._order_levels["bids"].clear()
-        self._order_levels["asks"].clear()
-
-        for price_str, size_str in bids:
-            try:
-                price = Decimal(str(price_str))
-                size = Decimal(str(size_str))
-            except (InvalidOperation, TypeError):
-                continue
-            if size > 0:
-                self._order_levels["bids"][price] = size
-
-        for price_str, size_str in asks:
-            try:
-                price = Decimal(str(price_str))
-                size = Decimal(str(size_str))
-            except (InvalidOperation, TypeError):
-                continue
-            if size > 0:
-                self._order_levels["asks"][price] = size
+        for side, entries in (("bids", bids), ("asks", asks)):
+            levels = self._order_levels[side]
+            levels.clear()
+            for price_str, size_str in entries:
+                try:
+                    price = to_units(price_str)
+                    size = to_units(size_str)
+                except (ValueError, TypeError, InvalidOperation):
+                    continue
+                if size > 0:
+                    levels[price] = size
 
         last_update_raw = snapshot.get("lastUpdateId") or snapshot.get("u")
         self._last_update_id = self._to_int(last_update_raw)
@@ -182,22 +212,22 @@ class BackpackOrderBook:
         Returns:
             BBOData if BBO changed, None otherwise
         """
-        bids_sorted = sorted(self._order_levels["bids"].items(), key=lambda kv: kv[0], reverse=True)
-        asks_sorted = sorted(self._order_levels["asks"].items(), key=lambda kv: kv[0])
-
-        self.order_book["bids"] = [{"price": price, "size": size} for price, size in bids_sorted]
-        self.order_book["asks"] = [{"price": price, "size": size} for price, size in asks_sorted]
-
-        previous_bid = self.best_bid
-        previous_ask = self.best_ask
-        self.best_bid = bids_sorted[0][0] if bids_sorted else None
-        self.best_ask = asks_sorted[0][0] if asks_sorted else None
+        bids = self._order_levels["bids"]
+        asks = self._order_levels["asks"]
+        previous_bid = self._best_bid_units
+        previous_ask = self._best_ask_units
+        self._best_bid_units = max(bids) if bids else None
+        self._best_ask_units = min(asks) if asks else None
+        if self._best_bid_units != previous_bid:
+            self.best_bid = units_to_decimal(self._best_bid_units) if self._best_bid_units is not None else None
+        if self._best_ask_units != previous_ask:
+            self.best_ask = units_to_decimal(self._best_ask_units) if self._best_ask_units is not None else None
 
         # Return BBO data if changed (for notification)
         if (
-            self.best_bid is not None
-            and self.best_ask is not None
-            and (self.best_bid != previous_bid or self.best_ask != previous_ask)
+            self._best_bid_units is not None
+            and self._best_ask_units is not None
+            and (self._best_bid_units != previous_bid or self._best_ask_units != previous_ask)
         ):
             return BBOData(
                 symbol="",  # Will be set by caller
@@ -208,6 +238,12 @@ class BackpackOrderBook:
             )
         return None
 
+    def _format_side(self, side: str, levels: Optional[int]) -> List[Dict[str, Decimal]]:
+        items = sorted(self._order_levels[side].items(), reverse=(side == "bids"))
+        if levels is not None:
+            items = items[:levels]
+        return [{"price": units_to_decimal(price), "size": units_to_decimal(size)} for price, size in items]
+
     def get_order_book(self, levels: Optional[int] = None) -> Optional[Dict[str, List[Dict[str, Decimal]]]]:
         """
         Retrieve a snapshot of the maintained order book.
@@ -221,15 +257,9 @@ class BackpackOrderBook:
         if not self.order_book_ready:
             return None
 
-        bids = self.order_book["bids"]
-        asks = self.order_book["asks"]
-        if levels is not None:
-            bids = bids[:levels]
-            asks = asks[:levels]
-
         return {
-            "bids": [{"price": level["price"], "size": level["size"]} for level in bids],
-            "asks": [{"price": level["price"], "size": level["size"]} for level in asks],
+            "bids": self._format_side("bids", levels),
+            "asks": self._format_side("asks", levels),
         }
 
     @staticmethod
@@ -6,7 +6,7 @@ from abc import ABC, abstractmethod
 import asyncio
 import inspect
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Any, Dict, List, Optional, Set, Tuple, TYPE_CHECKING, Callable, Awaitable
+from typing import Any, Awaitable, Callable, ClassVar, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 
 from exchange_clients.events import LiquidationEvent, LiquidationEventDispatcher
 
@@ -19,9 +19,13 @@ OrderStatusCallback = Optional[Callable[[str, str, Decimal, Optional[Decimal]],
 # Args: (order_id, status, filled_size, price)
 
 if TYPE_CHECKING:
+    from networking import ProxySelector, ProxyTransport
+
     from .base_websocket import BaseWebSocketManager
+    from .market_data.shared_book import SharedBookWebSocketManager
 
 from .base_models import ExchangePositionSnapshot, OrderInfo, OrderResult, TradeData
+from .order_state_cache import OrderStateCache
 
 
 class BaseExchangeClient(ABC):
@@ -53,6 +57,15 @@ class BaseExchangeClient(ABC):
         ```
     """
 
+    # Public per-symbol metadata caches (no account state). Clients of the same
+    # venue in one process may share them; see adopt_shared_metadata().
+    SHARED_METADATA_ATTRS: ClassVar[Tuple[str, ...]] = ("_contract_id_cache",)
+
+    # True when every REST and websocket call of the client goes through
+    # self.transport, so it can be given its own proxy (see use_client_proxy()).
+    # SDK-managed HTTP stacks that cannot be pointed at a proxy stay False.
+    SUPPORTS_CLIENT_PROXY: ClassVar[bool] = False
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the exchange client with configuration.
@@ -64,6 +77,11 @@ class BaseExchangeClient(ABC):
         self._validate_config()
         self._liquidation_dispatcher = LiquidationEventDispatcher()
         self.ws_manager: Optional["BaseWebSocketManager"] = None
+        # Public books from the host's market-data daemon (None = follow $SHARED_MARKET_DATA)
+        self.use_shared_market_data: Optional[bool] = None
+        self.shared_book: Optional["SharedBookWebSocketManager"] = None
+        self._public_feed_resume: Optional[asyncio.Task] = None
+        self._transport: Optional["ProxyTransport"] = None
         
         # Per-symbol contract ID cache (fixes multi-symbol trading bug)
         # Maps normalized symbol -> exchange-specific contract_id
@@ -92,6 +110,56 @@ class BaseExchangeClient(ABC):
         """
         pass
 
+    def adopt_shared_metadata(self, donor: "BaseExchangeClient") -> None:
+        """
+        Use ``donor``'s market metadata caches instead of this client's own.
+
+        Lets several accounts on one venue resolve contract ids, tick sizes and
+        minimum notionals once per process. Call before ``connect()``, which
+        hands the caches to the client's managers.
+        """
+        if type(donor) is not type(self):
+            raise TypeError(
+                f"Cannot share metadata between {type(self).__name__} and {type(donor).__name__}"
+            )
+        for attr in self.SHARED_METADATA_ATTRS:
+            setattr(self, attr, getattr(donor, attr))
+
+    @property
+    def transport(self) -> "ProxyTransport":
+        """Keep-alive pool and websocket factory for this client (direct unless a proxy is set)."""
+        if self._transport is None:
+            from networking import ProxyTransport
+
+            self._transport = ProxyTransport(name=self.get_exchange_name(), logger=getattr(self, "logger", None))
+        return self._transport
+
+    def use_client_proxy(self, selector: "ProxySelector", *, name: Optional[str] = None) -> "ProxyTransport":
+        """
+        Route this client through its own proxy transport.
+
+        The transport rotates on its own health score, independently of the
+        other clients sharing ``selector``. Call before ``connect()``.
+
+        Raises:
+            ValueError: If the client does not support per-client proxies
+        """
+        if not self.SUPPORTS_CLIENT_PROXY:
+            raise ValueError(f"{self.get_exchange_name()} does not support per-client proxies")
+        from networking import ProxyTransport
+
+        self._transport = ProxyTransport(
+            selector,
+            name=name or self.get_exchange_name(),
+            logger=getattr(self, "logger", None),
+        )
+        return self._transport
+
+    async def close_transport(self) -> None:
+        """Close the transport's connection pools (called from disconnect()); its route is kept."""
+        if self._transport is not None:
+            await self._transport.close()
+
     # ========================================================================
     # EVENT STREAMS (OPTIONAL)
     # ========================================================================
@@ -174,6 +242,18 @@ class BaseExchangeClient(ABC):
         Default implementation delegates to the attached websocket manager.
         """
         manager = self.ws_manager
+        shared = self._get_shared_book()
+        if shared is not None:
+            await shared.prepare_market_feed(symbol)
+            if manager is not None:
+                shared.forward_to(manager)
+                if shared.is_live():
+                    # Leave public book channels to the daemon while its ring is live
+                    manager.public_book_feed = False
+                elif not manager.public_book_feed:
+                    # The ring went stale after the manager dropped its own book channels
+                    await self._resume_public_book_feed(symbol)
+
         if manager is None:
             return
 
@@ -190,6 +270,98 @@ class BaseExchangeClient(ABC):
                     "DEBUG",
                 )
 
+    def _get_shared_book(self) -> Optional["SharedBookWebSocketManager"]:
+        """Shared-book adapter for this venue, created on first use when enabled."""
+        if self.shared_book is not None:
+            return self.shared_book
+        from exchange_clients.market_data.shared_book import (
+            SharedBookWebSocketManager,
+            shared_market_data_enabled,
+        )
+
+        enabled = self.use_shared_market_data
+        if enabled is None:
+            enabled = shared_market_data_enabled()
+        if not enabled:
+            return None
+        self.shared_book = SharedBookWebSocketManager(self.get_exchange_name())
+        self.shared_book.set_logger(getattr(self, "logger", None))
+        return self.shared_book
+
+    def shared_bbo(self) -> Optional[Tuple[Decimal, Decimal]]:
+        """
+        Best bid/ask from the market-data daemon's ring, or None when unavailable.
+
+        Reads the symbol last passed to ensure_market_feed(), mirroring how the
+        venue websocket managers serve the market they are switched to.
+        """
+        shared = self.shared_book
+        if shared is None:
+            return None
+        frame = shared.snapshot()
+        if frame is None:
+            # Stale ring: take the public feed back so later reads skip REST
+            self._schedule_public_feed_resume()
+            return None
+        if frame.best_bid is None or frame.best_ask is None:
+            return None
+        if not 0 < frame.best_bid < frame.best_ask:
+            return None
+        return Decimal(str(frame.best_bid)), Decimal(str(frame.best_ask))
+
+    def shared_order_book(self, levels: int) -> Optional[Dict[str, List[Dict[str, Decimal]]]]:
+        """Top ``levels`` of the daemon's book, or None when unavailable or too shallow."""
+        shared = self.shared_book
+        if shared is None:
+            return None
+        frame = shared.snapshot()
+        # The ring only holds the daemon's configured depth; deeper requests go to the venue
+        if frame is None or not frame.bids or not frame.asks or levels > shared.levels_available():
+            return None
+        return frame.to_order_book(levels)
+
+    async def _resume_public_book_feed(self, symbol: Optional[str]) -> None:
+        """Have the venue manager subscribe its own public book channels again."""
+        manager = self.ws_manager
+        if manager is None or manager.public_book_feed:
+            return
+        try:
+            await manager.resume_public_book_feed(symbol)
+        except Exception as exc:
+            logger = getattr(self, "logger", None)
+            if logger and hasattr(logger, "log"):
+                logger.log(
+                    f"⚠️ [{self.get_exchange_name().upper()}] "
+                    f"Resuming public book feed failed: {exc}",
+                    "DEBUG",
+                )
+
+    def _schedule_public_feed_resume(self) -> None:
+        """Start _resume_public_book_feed() in the background, at most once at a time."""
+        manager = self.ws_manager
+        shared = self.shared_book
+        if manager is None or shared is None or manager.public_book_feed:
+            return
+        task = self._public_feed_resume
+        if task is not None and not task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._public_feed_resume = loop.create_task(self._resume_public_book_feed(shared.symbol))
+
+    async def close_shared_book(self) -> None:
+        """Stop the shared-book adapter's poll task (called from disconnect())."""
+        task = self._public_feed_resume
+        if task is not None:
+            self._public_feed_resume = None
+            task.cancel()
+        shared = self.shared_book
+        if shared is not None:
+            self.shared_book = None
+            await shared.disconnect()
+
     @abstractmethod
     def get_exchange_name(self) -> str:
         """
@@ -517,6 +689,38 @@ class BaseExchangeClient(ABC):
         """
         return 1  # Default: no multiplier (1 unit = 1 token)
 
+    def _order_stream_live(self) -> bool:
+        """
+        True while the private order stream is connected and recently active.
+        
+        Managers built on BaseWebSocketManager check their socket state and the
+        time of the last private message; other managers fall back to ``running``.
+        """
+        ws_manager = getattr(self, "ws_manager", None)
+        if ws_manager is None:
+            return False
+        check = getattr(ws_manager, "private_stream_live", None)
+        if callable(check):
+            return bool(check())
+        return bool(getattr(ws_manager, "running", False))
+
+    def _watch_order_stream(self, ws_manager: Any) -> None:
+        """Mark every live cached order stale whenever ``ws_manager``'s private stream drops or reconnects."""
+        cache = self.get_order_state_cache()
+        register = getattr(ws_manager, "register_private_stream_drop_listener", None)
+        if cache is not None and callable(register):
+            register(cache.mark_stale)
+
+    def get_order_state_cache(self) -> Optional[OrderStateCache]:
+        """
+        Websocket-fed order state cache, if this client keeps one.
+        
+        Reconcilers use it to read order state locally and wait for updates
+        instead of polling get_order_info().
+        """
+        cache = getattr(self, "_latest_orders", None)
+        return cache if isinstance(cache, OrderStateCache) else None
+
     @abstractmethod
     async def get_order_info(self, order_id: str, *, force_refresh: bool = False) -> Optional[OrderInfo]:
         """
@@ -800,6 +1004,23 @@ class BaseExchangeClient(ABC):
         """
         pass
 
+    async def get_all_leverage_info(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Get leverage information for every market on the exchange at once.
+        
+        Lets callers (e.g. LeverageValidator) preload limits for all symbols in
+        one request instead of one get_leverage_info() call per symbol.
+        
+        Returns:
+            Mapping of normalized symbol (e.g. "BTC") to the same dict returned by
+            get_leverage_info(), or None if bulk queries are not supported.
+            
+        Note:
+            Override this method if the exchange exposes a bulk endpoint.
+            Default implementation returns None.
+        """
+        return None
+
     # ========================================================================
     # CONFIGURATION & UTILITIES
     # ========================================================================
@@ -10,7 +10,16 @@ from typing import Dict, Optional, Tuple
 import aiohttp
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
-from .base_models import FundingRateSample
+from helpers.metrics import REGISTRY
+
+from .base_models import REST_REQUESTS, FundingRateSample
+
+COLLECTION_SECONDS = REGISTRY.histogram(
+    "funding_collection_seconds", "Funding rate fetch latency per DEX", ("dex",)
+)
+COLLECTION_ERRORS = REGISTRY.counter(
+    "funding_collection_errors_total", "Failed funding rate fetches per DEX", ("dex",)
+)
 
 
 class BaseFundingAdapter(ABC):
@@ -179,10 +188,22 @@ class BaseFundingAdapter(ABC):
         """
         if self._session is None or self._session.closed:
             self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.timeout)
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                trace_configs=[self._request_counter()],
             )
         return self._session
     
+    def _request_counter(self) -> aiohttp.TraceConfig:
+        """Trace config counting this adapter's requests in ``rest_requests_total``."""
+        requests = REST_REQUESTS.labels(venue=self.dex_name, operation="funding_adapter")
+
+        async def on_request_start(session, context, params) -> None:
+            requests.inc()
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        return trace_config
+    
     async def close(self) -> None:
         """
         Close the HTTP session and cleanup resources.
@@ -265,11 +286,12 @@ class BaseFundingAdapter(ABC):
         
         try:
             rates = await self.fetch_funding_rates()
-            latency_ms = int((asyncio.get_event_loop().time() - start_time) * 1000)
-            return rates, latency_ms
+            elapsed = asyncio.get_event_loop().time() - start_time
+            COLLECTION_SECONDS.labels(dex=self.dex_name).observe(elapsed)
+            return rates, int(elapsed * 1000)
         
-        except Exception as e:
-            latency_ms = int((asyncio.get_event_loop().time() - start_time) * 1000)
+        except Exception:
+            COLLECTION_ERRORS.labels(dex=self.dex_name).inc()
             raise
     
     def __repr__(self) -> str:
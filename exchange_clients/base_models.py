@@ -17,6 +17,12 @@ from tenacity import (
     wait_exponential,
 )
 
+from helpers.metrics import REGISTRY
+
+REST_REQUESTS = REGISTRY.counter(
+    "rest_requests_total", "REST requests issued per venue", ("venue", "operation")
+)
+
 
 class MissingCredentialsError(Exception):
     """Raised when exchange credentials are missing or invalid (placeholders)."""
@@ -60,6 +66,20 @@ def validate_credentials(
         raise MissingCredentialsError(f"{credential_name} is not configured (placeholder or empty)")
 
 
+def _venue_of(owner: Any) -> str:
+    """Venue of an exchange client or one of its managers (``exchange_clients.<venue>...``)."""
+    get_name = getattr(owner, "get_exchange_name", None)
+    if callable(get_name):
+        try:
+            return str(get_name())
+        except Exception:
+            pass
+    parts = type(owner).__module__.split(".")
+    if len(parts) > 1 and parts[0] == "exchange_clients":
+        return parts[1]
+    return "unknown"
+
+
 def query_retry(
     default_return: Any = None,
     exception_type: Union[Type[Exception], Tuple[Type[Exception], ...]] = (Exception,),
@@ -80,6 +100,10 @@ def query_retry(
         reraise: Whether to reraise the exception after retries
     """
 
+    def count_attempt(retry_state: RetryCallState):
+        owner = retry_state.args[0] if retry_state.args else None
+        REST_REQUESTS.labels(venue=_venue_of(owner), operation=retry_state.fn.__name__).inc()
+
     def retry_error_callback(retry_state: RetryCallState):
         print(
             f"Operation: [{retry_state.fn.__name__}] failed after {retry_state.attempt_number} retries, "
@@ -92,6 +116,7 @@ def query_retry(
         wait=wait_exponential(multiplier=1, min=min_wait, max=max_wait),
         retry=retry_if_exception_type(exception_type),
         retry_error_callback=retry_error_callback,
+        before=count_attempt,
         reraise=reraise,
     )
 
@@ -7,8 +7,29 @@ implement so higher-level strategy code can interact with them uniformly.
 
 from __future__ import annotations
 
+import inspect
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Awaitable, Callable, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional
+
+if TYPE_CHECKING:
+    from exchange_clients.market_data.recorder import FeedRecorder
+
+# A private stream that has been silent this long is no longer trusted as live
+PRIVATE_STREAM_MAX_SILENCE_SECONDS = 30.0
+
+
+def socket_is_open(ws: Any) -> bool:
+    """True if a websockets or aiohttp connection object is still open."""
+    if ws is None:
+        return False
+    closed = getattr(ws, "closed", None)
+    if isinstance(closed, bool):
+        return not closed
+    state = getattr(ws, "state", None)
+    if state is not None:
+        return str(getattr(state, "name", state)).upper() == "OPEN"
+    return True
 
 
 class BaseWebSocketManager(ABC):
@@ -18,18 +39,71 @@ class BaseWebSocketManager(ABC):
     Implementations are responsible for maintaining their own connection state
     but must expose a consistent surface so strategies can request market data
     streams for specific symbols before placing orders.
+
+    ``public_book_feed`` is cleared by the client when the host's market-data
+    daemon serves this venue's books; managers that support it then skip
+    their public book channels and keep only private order/account streams.
     """
 
+    public_book_feed: bool = True
+    private_stream_max_silence: float = PRIVATE_STREAM_MAX_SILENCE_SECONDS
+
     def __init__(self) -> None:
         self.logger: Any = None
         self.running: bool = False
         self._bbo_listeners: list[Callable[["BBOData"], Optional[Awaitable[None]]]] = []
         self._latest_bbo: Optional["BBOData"] = None
+        self.recorder: Optional["FeedRecorder"] = None
+        self.private_message_at: Optional[float] = None
+        self._private_stream_drop_listeners: list[Callable[[], Any]] = []
 
     def set_logger(self, logger: Any) -> None:
         """Attach a logger instance (expects unified_logger-style interface)."""
         self.logger = logger
 
+    # ------------------------------------------------------------------
+    # Raw feed recording / replay
+    # ------------------------------------------------------------------
+
+    def set_recorder(self, recorder: Optional["FeedRecorder"]) -> None:
+        """
+        Attach a FeedRecorder that receives every raw frame before it is parsed.
+
+        Managers whose frames arrive in sub-components (market switchers,
+        message handlers) override this to propagate the recorder.
+        """
+        self.recorder = recorder
+
+    def start_recording_from_env(self, venue: str) -> None:
+        """Start recording raw frames if ``WS_RECORD_DIR`` is set (no-op otherwise)."""
+        if self.recorder is not None:
+            return
+        from exchange_clients.market_data.recorder import FeedRecorder
+
+        recorder = FeedRecorder.from_env(venue)
+        if recorder is not None:
+            self.set_recorder(recorder)
+            if self.logger and hasattr(self.logger, "log"):
+                self.logger.log(f"[{venue.upper()}] Recording websocket frames to {recorder.path}", "INFO")
+
+    def stop_recording(self) -> None:
+        """Flush and detach the active recorder, if any."""
+        recorder = self.recorder
+        if recorder is None:
+            return
+        self.set_recorder(None)
+        recorder.close()
+
+    def get_replay_handlers(self) -> Dict[str, Callable[[Any], Optional[Awaitable[Any]]]]:
+        """
+        Map recorded stream names to the callables that process their raw frames.
+
+        Used by FeedReplayer to push a recording through the same parsing and
+        order book paths as the live feed. Managers without recording support
+        return an empty mapping.
+        """
+        return {}
+
     @abstractmethod
     async def connect(self) -> None:
         """Establish websocket connections and start background processing."""
@@ -91,6 +165,73 @@ class BaseWebSocketManager(ABC):
         """
         ...
 
+    # ------------------------------------------------------------------
+    # Public book stream
+    # ------------------------------------------------------------------
+
+    def public_stream_open(self) -> bool:
+        """
+        True while the socket carrying public book updates is open.
+
+        The market-data daemon uses this to tell a quiet market from a dead
+        feed. Managers override it with a check of their actual socket.
+        """
+        return self.running
+
+    async def resume_public_book_feed(self, symbol: Optional[str]) -> None:
+        """
+        Take the public book channels back after the shared daemon's ring went stale.
+
+        The default re-runs ``prepare_market_feed`` with ``public_book_feed``
+        set; managers that return early when already on the market subscribe
+        the book channels directly instead.
+        """
+        if self.public_book_feed:
+            return
+        self.public_book_feed = True
+        result = self.prepare_market_feed(symbol)
+        if inspect.isawaitable(result):
+            await result
+
+    # ------------------------------------------------------------------
+    # Private (order) stream health
+    # ------------------------------------------------------------------
+
+    def private_stream_open(self) -> bool:
+        """
+        True while the socket carrying order updates is open.
+
+        Managers override this with a check of their actual socket (and
+        listener task); ``running`` alone stays set after a listener dies.
+        """
+        return self.running
+
+    def note_private_message(self) -> None:
+        """Record that a private (order/account) message just arrived."""
+        self.private_message_at = time.monotonic()
+
+    def private_stream_live(self) -> bool:
+        """True if the private socket is open and has delivered a message within ``private_stream_max_silence``."""
+        if not self.running or not self.private_stream_open():
+            return False
+        last = self.private_message_at
+        return last is not None and time.monotonic() - last <= self.private_stream_max_silence
+
+    def register_private_stream_drop_listener(self, listener: Callable[[], Any]) -> None:
+        """Register a callable invoked whenever the private stream drops, reconnects or is torn down."""
+        if listener not in self._private_stream_drop_listeners:
+            self._private_stream_drop_listeners.append(listener)
+
+    def _notify_private_stream_drop(self) -> None:
+        """Forget the last private message and tell listeners that updates may have been missed."""
+        self.private_message_at = None
+        for listener in list(self._private_stream_drop_listeners):
+            try:
+                listener()
+            except Exception as exc:  # pragma: no cover - defensive logging
+                if self.logger and hasattr(self.logger, "log"):
+                    self.logger.log(f"Private stream drop listener error: {exc}", "ERROR")
+
     # ------------------------------------------------------------------
     # Best bid/ask streaming helpers
     # ------------------------------------------------------------------
@@ -17,6 +17,7 @@ class ExchangeFactory:
         'aster': 'exchange_clients.aster.AsterClient',
         'lighter': 'exchange_clients.lighter.LighterClient',
         'grvt': 'exchange_clients.grvt.GrvtClient',
+        'sim': 'exchange_clients.sim.SimClient',
     }
     
     # Mapping of standardized credential keys to exchange-specific parameter names
@@ -52,6 +53,9 @@ class ExchangeFactory:
             'base_url': 'base_url',
             'ws_url': 'ws_url',
         },
+        'sim': {
+            'account_id': 'account_id',
+        },
     }
 
     @classmethod
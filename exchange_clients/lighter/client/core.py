@@ -19,6 +19,7 @@ from exchange_clients.base_models import (
     MissingCredentialsError,
     validate_credentials,
 )
+from exchange_clients.order_state_cache import OrderStateCache
 from exchange_clients.events import LiquidationEvent
 from helpers.unified_logger import get_exchange_logger
 
@@ -40,6 +41,9 @@ from networking import SessionProxyManager
 class LighterClient(BaseExchangeClient):
     """Lighter exchange client implementation."""
 
+    SHARED_METADATA_ATTRS = ("_contract_id_cache", "_market_id_cache", "_market_metadata", "_min_order_notional")
+    SUPPORTS_CLIENT_PROXY = True
+
     def __init__(
         self, 
         config: Dict[str, Any],
@@ -99,7 +103,7 @@ class LighterClient(BaseExchangeClient):
         self.current_order_client_id = None
         self.current_order = None
         self._min_order_notional: Dict[str, Decimal] = {}
-        self._latest_orders: Dict[str, OrderInfo] = {}
+        self._latest_orders: Dict[str, OrderInfo] = OrderStateCache(stream_live=self._order_stream_live)
         self._order_update_events: Dict[str, asyncio.Event] = {}
         self.order_fill_callback = order_fill_callback
         self.order_status_callback = order_status_callback
@@ -182,12 +186,20 @@ class LighterClient(BaseExchangeClient):
                 proxy_info = SessionProxyManager.describe(mask_password=True)
                 if proxy_info:
                     self.logger.info(f"[LIGHTER] Session proxy configured: {proxy_info}")
+            elif self.transport.owns_proxy:
+                self.logger.info(f"[LIGHTER] Client proxy configured: {self.transport.describe()}")
 
             # Initialize shared API client
             self.api_client = ApiClient(configuration=Configuration(host=self.base_url))
 
             # Initialize Lighter client
             await self._initialize_lighter_client()
+
+            # The SDK clients keep their own aiohttp pools; point them at this client's proxy
+            self.transport.bind_openapi_client(self.api_client)
+            signer_api_client = getattr(self.lighter_client, "api_client", None)
+            if signer_api_client is not None:
+                self.transport.bind_openapi_client(signer_api_client)
             
             # Initialize API instances for order management
             self.account_api = lighter.AccountApi(self.api_client)
@@ -254,6 +266,7 @@ class LighterClient(BaseExchangeClient):
                 ws_manager=None,  # Will be set after ws_manager is created
                 normalize_symbol_fn=self.normalize_symbol,
                 market_data=self.market_data,  # For REST fallback when websocket unavailable
+                shared_bbo_fn=self.shared_bbo,
             )
             
             # Initialize account manager
@@ -297,10 +310,12 @@ class LighterClient(BaseExchangeClient):
                 liquidation_callback=self.ws_handlers.handle_liquidation_notification,
                 positions_callback=self.ws_handlers.handle_positions_stream_update,
                 user_stats_callback=self._handle_user_stats_update,
+                transport=self.transport,
             )
 
             # Set logger for WebSocket manager
             self.ws_manager.set_logger(self.logger)
+            self._watch_order_stream(self.ws_manager)
             
             # Update managers with ws_manager reference
             if self.market_data:
@@ -334,6 +349,7 @@ class LighterClient(BaseExchangeClient):
     async def disconnect(self) -> None:
         """Disconnect from Lighter."""
         try:
+            await self.close_shared_book()
             if hasattr(self, 'ws_manager') and self.ws_manager:
                 await self.ws_manager.disconnect()
 
@@ -341,6 +357,7 @@ class LighterClient(BaseExchangeClient):
             if self.api_client:
                 await self.api_client.close()
                 self.api_client = None
+            await self.close_transport()
         except Exception as e:
             self.logger.error(f"Error during Lighter disconnect: {e}")
 
@@ -402,6 +419,9 @@ class LighterClient(BaseExchangeClient):
     @query_retry(default_return=(Decimal("0"), Decimal("0")))
     async def fetch_bbo_prices(self, contract_id: str) -> Tuple[Decimal, Decimal]:
         """Get best bid/offer prices, preferring WebSocket data when available."""
+        shared = self.shared_bbo()
+        if shared is not None:
+            return shared
         return await self.market_data.fetch_bbo_prices(contract_id)
 
     async def get_order_book_depth(
@@ -410,6 +430,9 @@ class LighterClient(BaseExchangeClient):
         levels: int = 10
     ) -> Dict[str, List[Dict[str, Decimal]]]:
         """Get order book depth for a symbol."""
+        shared = self.shared_order_book(levels)
+        if shared is not None:
+            return shared
         return await self.market_data.get_order_book_depth(contract_id, levels)
 
     async def place_limit_order(
@@ -595,6 +618,10 @@ class LighterClient(BaseExchangeClient):
         """Get leverage information for Lighter by querying market configuration."""
         return await self.account_manager.get_leverage_info(symbol)
 
+    async def get_all_leverage_info(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Get leverage information for all Lighter markets in one request."""
+        return await self.account_manager.get_all_leverage_info()
+
     async def get_total_asset_value(self) -> Optional[Decimal]:
         """Get total account asset value using Lighter SDK."""
         return await self.account_manager.get_total_asset_value()
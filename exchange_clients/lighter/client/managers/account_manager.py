@@ -286,6 +286,46 @@ class LighterAccountManager:
                 'error': f"Failed to query leverage info: {str(e)}"
             }
     
+    async def get_all_leverage_info(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Leverage info for every Lighter market from one order_book_details() call.
+        
+        Same dict shape as get_leverage_info(), keyed by symbol. Position-level
+        leverage (account_leverage) is not included.
+        
+        Returns:
+            Mapping of symbol -> leverage info, or None if the query failed
+        """
+        try:
+            if not self.order_api:
+                self.order_api = lighter.OrderApi(self.api_client)
+            
+            # No market_id returns details for all markets
+            response = await self.order_api.order_book_details(_request_timeout=10)
+            if not response or not response.order_book_details:
+                return None
+            
+            # Lighter margin fractions are in basis points (10,000 = 100%)
+            basis_points_divisor = Decimal('10000')
+            results: Dict[str, Dict[str, Any]] = {}
+            for market_detail in response.order_book_details:
+                min_margin_fraction = Decimal(str(market_detail.min_initial_margin_fraction)) / basis_points_divisor
+                results[str(market_detail.symbol).upper()] = {
+                    'max_leverage': Decimal('1') / min_margin_fraction if min_margin_fraction > 0 else Decimal('20'),
+                    'max_notional': None,
+                    'account_leverage': None,
+                    'margin_requirement': min_margin_fraction,
+                    'brackets': None,
+                    'error': None,
+                }
+            
+            self.logger.debug(f"[LIGHTER] Loaded leverage info for {len(results)} markets")
+            return results
+        
+        except Exception as e:
+            self.logger.warning(f"[LIGHTER] Bulk leverage query failed: {e}")
+            return None
+    
     async def get_total_asset_value(self) -> Optional[Decimal]:
         """Get total account asset value using Lighter SDK."""
         try:
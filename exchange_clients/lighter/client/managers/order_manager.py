@@ -13,6 +13,7 @@ import lighter
 
 from exchange_clients.base_models import OrderInfo, OrderResult, query_retry
 from exchange_clients.lighter.client.utils.converters import build_order_info_from_payload
+from exchange_clients.order_state_cache import fresh_order_state
 
 
 class LighterOrderManager:
@@ -725,12 +726,14 @@ class LighterOrderManager:
             cached_fallback = cached_primary or cached_server
 
             if not force_refresh:
-                if cached_primary is not None:
-                    return cached_primary
-
-                if cached_server is not None:
-                    return cached_server
-
+                # Websocket state is authoritative unless stale (stream down / too old while open)
+                fresh = fresh_order_state(self.latest_orders, order_id_str)
+                if fresh is None and server_order_id:
+                    fresh = fresh_order_state(self.latest_orders, str(server_order_id))
+                if fresh is not None:
+                    return fresh
+
+            if not force_refresh and cached_fallback is None:
                 # Wait briefly for websocket state before hitting REST endpoints
                 websocket_snapshot = await self.await_order_update(order_id_str)
                 if websocket_snapshot is not None:
@@ -7,7 +7,7 @@ Handles position tracking, snapshots, funding calculations, and enrichment.
 import asyncio
 import time
 from decimal import Decimal, InvalidOperation
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from exchange_clients.base_models import ExchangePositionSnapshot
 from exchange_clients.lighter.client.utils.converters import build_snapshot_from_raw
@@ -39,6 +39,7 @@ class LighterPositionManager:
         ws_manager: Optional[Any] = None,
         normalize_symbol_fn: Optional[Any] = None,
         market_data: Optional[Any] = None,
+        shared_bbo_fn: Optional[Callable[[], Optional[Tuple[Decimal, Decimal]]]] = None,
     ):
         """
         Initialize position manager.
@@ -56,6 +57,7 @@ class LighterPositionManager:
             ws_manager: Optional WebSocket manager (for live mark prices)
             normalize_symbol_fn: Function to normalize symbols
             market_data: Optional MarketData manager (for REST fallback when websocket unavailable)
+            shared_bbo_fn: Optional reader of the market-data daemon's BBO (client.shared_bbo)
         """
         self.account_api = account_api
         self.order_api = order_api
@@ -68,6 +70,7 @@ class LighterPositionManager:
         self.positions_ready = positions_ready
         self.ws_manager = ws_manager
         self.market_data = market_data
+        self.shared_bbo = shared_bbo_fn
         self.normalize_symbol = normalize_symbol_fn or (lambda s: s.upper())
     
     def _trigger_async_reconnect(self, coro) -> None:
@@ -96,6 +99,14 @@ class LighterPositionManager:
             if normalized_symbol != active_symbol:
                 return None
 
+        # The market-data daemon serves the book when SHARED_MARKET_DATA is on
+        shared = self.shared_bbo() if self.shared_bbo is not None else None
+        if shared is not None:
+            best_bid, best_ask = shared
+            return (best_bid + best_ask) / Decimal("2")
+        if not getattr(self.ws_manager, "public_book_feed", True):
+            return None  # Own book is not subscribed; don't reconnect over it, use REST
+
         # Check staleness and trigger reconnect if needed
         if self.ws_manager.order_book.is_stale():
             staleness_seconds = self.ws_manager.order_book.get_staleness_seconds()
@@ -15,6 +15,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from exchange_clients.base_models import CancelReason, OrderInfo
 from exchange_clients.events import LiquidationEvent
+from exchange_clients.order_state_cache import store_order_update
 
 
 class LighterWebSocketHandlers:
@@ -202,14 +203,15 @@ class LighterWebSocketHandlers:
                 )
                 if self.current_order_ref is not None:
                     setattr(self.current_order_ref, 'current_order', current_order)
-                self.latest_orders[order_id] = current_order
-                if self.order_manager:
-                    self.order_manager.notify_order_update(order_id)
-                if server_order_index is not None:
-                    server_key = str(server_order_index)
-                    self.latest_orders[server_key] = current_order
+                # Lighter has no per-order sequence; a late OPEN after a terminal update is dropped
+                if store_order_update(self.latest_orders, order_id, current_order):
                     if self.order_manager:
-                        self.order_manager.notify_order_update(server_key)
+                        self.order_manager.notify_order_update(order_id)
+                    if server_order_index is not None:
+                        server_key = str(server_order_index)
+                        store_order_update(self.latest_orders, server_key, current_order)
+                        if self.order_manager:
+                            self.order_manager.notify_order_update(server_key)
 
             if status in ['FILLED', 'CANCELED']:
                 self.logger.log_transaction(order_id, side, filled_size, price, status)
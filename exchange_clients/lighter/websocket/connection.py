@@ -12,6 +12,7 @@ from urllib.parse import urlparse
 import aiohttp
 
 from exchange_clients.base_websocket import BaseWebSocketManager
+from networking import ProxyTransport
 
 
 class LighterWebSocketConnection:
@@ -21,16 +22,24 @@ class LighterWebSocketConnection:
     RECONNECT_BACKOFF_MAX = 30.0
     RECEIVE_TIMEOUT = 45.0  # seconds - timeout for receiving messages (detects dead connections)
 
-    def __init__(self, config: Dict[str, Any], logger: Optional[Any] = None):
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        logger: Optional[Any] = None,
+        transport: Optional[ProxyTransport] = None,
+    ):
         """
         Initialize connection manager.
         
         Args:
             config: Configuration object
             logger: Logger instance
+            transport: The client's transport; when set, the websocket uses its
+                       pool and proxy instead of a private session
         """
         self.config = config
         self.logger = logger
+        self.transport = transport
         self.ws: Optional[aiohttp.ClientWebSocketResponse] = None
         self._session: Optional[aiohttp.ClientSession] = None
         self._listener_task: Optional[asyncio.Task] = None
@@ -61,7 +70,7 @@ class LighterWebSocketConnection:
         return self._session
 
     async def _close_session(self) -> None:
-        """Close the websocket session if it exists."""
+        """Close the websocket session if it exists (a transport's pool is closed by its client)."""
         if self._session and not self._session.closed:
             await self._session.close()
         self._session = None
@@ -106,6 +115,10 @@ class LighterWebSocketConnection:
 
     async def open_connection(self) -> None:
         """Establish the websocket connection."""
+        if self.transport is not None:
+            await self._open_transport_connection()
+            return
+
         session = await self._get_session()
         proxy_kwargs = self._proxy_kwargs()
         if proxy_kwargs.get("proxy"):
@@ -127,6 +140,16 @@ class LighterWebSocketConnection:
             self._log(f"Failed to connect to Lighter websocket: {exc}", "ERROR")
             raise
 
+    async def _open_transport_connection(self) -> None:
+        if self.transport.proxy is not None:
+            self._log(f"[LIGHTER] Websocket via proxy {self.transport.describe()}", "INFO")
+        try:
+            self.ws = await self.transport.ws_connect(self.ws_url, receive_timeout=self.RECEIVE_TIMEOUT)
+            self._log("[LIGHTER] 🔗 Connected to websocket", "INFO")
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as exc:
+            self._log(f"Failed to connect to Lighter websocket: {exc}", "ERROR")
+            raise
+
     async def cleanup_current_ws(self) -> None:
         """Close the active websocket connection if it exists."""
         if self.ws and not self.ws.closed:
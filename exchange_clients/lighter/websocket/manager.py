@@ -8,7 +8,9 @@ import asyncio
 import json
 from typing import Dict, Any, List, Optional, Callable, Awaitable
 
-from exchange_clients.base_websocket import BaseWebSocketManager, BBOData
+import aiohttp
+
+from exchange_clients.base_websocket import BaseWebSocketManager, BBOData, socket_is_open
 
 from .connection import LighterWebSocketConnection
 from .order_book import LighterOrderBook
@@ -26,6 +28,7 @@ class LighterWebSocketManager(BaseWebSocketManager):
         liquidation_callback: Optional[Callable[[List[Dict[str, Any]]], Awaitable[None]]] = None,
         positions_callback: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
         user_stats_callback: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
+        transport: Optional[Any] = None,
     ):
         """
         Initialize WebSocket manager.
@@ -36,12 +39,13 @@ class LighterWebSocketManager(BaseWebSocketManager):
             liquidation_callback: Callback for liquidations
             positions_callback: Callback for positions
             user_stats_callback: Callback for user stats
+            transport: The client's ProxyTransport (pool and proxy for the websocket)
         """
         super().__init__()
         self.config = config
         
         # Initialize components
-        self.connection = LighterWebSocketConnection(config)
+        self.connection = LighterWebSocketConnection(config, transport=transport)
         self.order_book = LighterOrderBook()
         self.market_switcher = LighterMarketSwitcher(
             config=config,
@@ -64,6 +68,7 @@ class LighterWebSocketManager(BaseWebSocketManager):
         self.running = False
         self._listener_task: Optional[asyncio.Task] = None
         self._staleness_monitor_task: Optional[asyncio.Task] = None
+        self._cleanup_counter = 0
 
     def set_logger(self, logger):
         """Set the logger instance for all components."""
@@ -132,8 +137,8 @@ class LighterWebSocketManager(BaseWebSocketManager):
             old_market_id = self.market_switcher.market_index
             await self._perform_market_switch(old_market_id, target_market)
             
-            # Step 4: Wait for new data to arrive
-            success = await self._wait_for_market_ready(timeout=5.0)
+            # Step 4: Wait for new data to arrive (the shared daemon serves the book otherwise)
+            success = await self._wait_for_market_ready(timeout=5.0) if self.public_book_feed else True
             
             # Step 5: Log result
             order_book_size = {
@@ -166,7 +171,7 @@ class LighterWebSocketManager(BaseWebSocketManager):
         self.market_switcher.update_market_config(new_market_id)
         
         # Subscribe to new market
-        await self.market_switcher.subscribe_market(new_market_id)
+        await self.market_switcher.subscribe_market(new_market_id, include_order_book=self.public_book_feed)
 
     async def _wait_for_market_ready(self, timeout: float = 5.0) -> bool:
         """
@@ -239,11 +244,12 @@ class LighterWebSocketManager(BaseWebSocketManager):
             subscribe_positions=bool(self.message_handler.positions_callback),
             subscribe_liquidations=bool(self.message_handler.liquidation_callback),
             subscribe_user_stats=bool(self.message_handler.user_stats_callback),
+            subscribe_order_book=self.public_book_feed,
         )
 
     async def _consume_messages(self) -> None:
         """Listen for messages on the WebSocket connection."""
-        cleanup_counter = 0
+        self._cleanup_counter = 0
         while self.running and self.connection.ws:
             try:
                 msg = await self.connection.ws.receive()
@@ -252,39 +258,81 @@ class LighterWebSocketManager(BaseWebSocketManager):
             except Exception as exc:
                 break
 
-            # Process message
-            result = await self.message_handler.process_message(msg)
-            
-            if result is None:
-                continue
-            
-            if result.get("close") or result.get("error"):
+            if self.recorder is not None and msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                self.recorder.record("ws", msg.data)
+
+            if not await self._handle_ws_message(msg):
                 break
 
-            # Handle cleanup periodically
-            cleanup_counter += 1
-            if cleanup_counter >= 1000:
-                self.order_book.cleanup_old_order_book_levels()
-                cleanup_counter = 0
+    async def _handle_ws_message(self, msg: aiohttp.WSMessage) -> bool:
+        """Process one websocket frame. Returns False when the connection should be dropped."""
+        result = await self.message_handler.process_message(msg)
 
-            # Handle snapshot request
-            if result.get("request_snapshot"):
-                try:
-                    await self.request_fresh_snapshot()
-                    self.order_book.order_book_sequence_gap = False
-                except Exception as exc:
-                    self._log(f"Failed to request fresh snapshot: {exc}", "ERROR")
-                    break
+        if result is None:
+            return True
+
+        if result.get("close") or result.get("error"):
+            return False
+
+        if result.get("private"):
+            self.note_private_message()
 
-            # Dispatch callbacks
-            if result.get("notifications"):
-                await self.message_handler.dispatch_liquidations(result["notifications"])
+        # Handle cleanup periodically
+        self._cleanup_counter += 1
+        if self._cleanup_counter >= 1000:
+            self.order_book.cleanup_old_order_book_levels()
+            self._cleanup_counter = 0
 
-            if result.get("positions"):
-                await self.message_handler.dispatch_positions(result["positions"])
+        # Handle snapshot request
+        if result.get("request_snapshot"):
+            try:
+                await self.request_fresh_snapshot()
+                self.order_book.order_book_sequence_gap = False
+            except Exception as exc:
+                self._log(f"Failed to request fresh snapshot: {exc}", "ERROR")
+                return False
 
-            if result.get("user_stats"):
-                await self.message_handler.dispatch_user_stats(result["user_stats"])
+        # Dispatch callbacks
+        if result.get("notifications"):
+            await self.message_handler.dispatch_liquidations(result["notifications"])
+
+        if result.get("positions"):
+            await self.message_handler.dispatch_positions(result["positions"])
+
+        if result.get("user_stats"):
+            await self.message_handler.dispatch_user_stats(result["user_stats"])
+
+        return True
+
+    async def _replay_ws_message(self, payload: Any) -> None:
+        """Feed a recorded frame through the live processing path."""
+        msg_type = aiohttp.WSMsgType.BINARY if isinstance(payload, bytes) else aiohttp.WSMsgType.TEXT
+        await self._handle_ws_message(aiohttp.WSMessage(msg_type, payload, None))
+
+    def get_replay_handlers(self) -> Dict[str, Callable[[Any], Awaitable[None]]]:
+        """Recorded streams: ``ws`` (the single Lighter connection)."""
+        return {"ws": self._replay_ws_message}
+
+    def private_stream_open(self) -> bool:
+        """Socket is open and the listener task is still consuming it."""
+        task = self._listener_task
+        return socket_is_open(self.connection.ws) and task is not None and not task.done()
+
+    def public_stream_open(self) -> bool:
+        """The order book shares the single Lighter connection."""
+        return self.private_stream_open()
+
+    async def resume_public_book_feed(self, symbol: Optional[str]) -> None:
+        """Re-subscribe the order book channel for the current market (prepare_market_feed skips it)."""
+        if self.public_book_feed:
+            return
+        self.public_book_feed = True
+        market_id = self.market_switcher.market_index
+        if market_id is None or not self.running:
+            await self.prepare_market_feed(symbol)
+            return
+        self._log(f"[LIGHTER] Shared book stale, subscribing order_book/{market_id} directly", "INFO")
+        await self.market_switcher.subscribe_order_book(market_id)
 
     async def _listen_loop(self) -> None:
         """Keep the websocket stream alive and reconnect on failures."""
@@ -300,6 +348,8 @@ class LighterWebSocketManager(BaseWebSocketManager):
                     await self.connection.cleanup_current_ws()
                     self.order_book.order_book_ready = False
                     self.order_book.snapshot_loaded = False
+                    # Account updates may be missed until the reconnect completes
+                    self._notify_private_stream_drop()
 
                 if not self.running:
                     break
@@ -319,6 +369,7 @@ class LighterWebSocketManager(BaseWebSocketManager):
             await self.connection.cleanup_current_ws()
             await self.connection._close_session()
             self.running = False
+            self._notify_private_stream_drop()
             self._log("WebSocket listener stopped", "INFO")
 
     def _update_component_references(self):
@@ -346,6 +397,7 @@ class LighterWebSocketManager(BaseWebSocketManager):
 
         self.running = True
         self.market_switcher.set_running(True)
+        self.start_recording_from_env("lighter")
 
         self._listener_task = asyncio.create_task(self._listen_loop(), name="lighter-ws-listener")
         self._staleness_monitor_task = asyncio.create_task(
@@ -429,6 +481,8 @@ class LighterWebSocketManager(BaseWebSocketManager):
 
         await self.connection.cleanup_current_ws()
         await self.connection._close_session()
+        self._notify_private_stream_drop()
+        self.stop_recording()
 
         self._log("WebSocket disconnected", "INFO")
 
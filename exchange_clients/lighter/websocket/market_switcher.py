@@ -145,17 +145,32 @@ class LighterMarketSwitcher:
         })
         await self.ws.send_str(account_unsub_msg)
     
-    async def subscribe_market(self, market_id: int) -> None:
-        """Subscribe to order book and account orders for a market."""
+    async def subscribe_order_book(self, market_id: int) -> None:
+        """Subscribe only the public order book channel for a market."""
         if not self.ws:
             return
-            
-        # Subscribe to order book
-        subscribe_msg = json.dumps({
+        await self.ws.send_str(json.dumps({
             "type": "subscribe",
             "channel": f"order_book/{market_id}"
-        })
-        await self.ws.send_str(subscribe_msg)
+        }))
+
+    async def subscribe_market(self, market_id: int, include_order_book: bool = True) -> None:
+        """
+        Subscribe to order book and account orders for a market.
+
+        ``include_order_book=False`` leaves the public book to the shared
+        market-data daemon and only subscribes the private account orders.
+        """
+        if not self.ws:
+            return
+            
+        # Subscribe to order book
+        if include_order_book:
+            subscribe_msg = json.dumps({
+                "type": "subscribe",
+                "channel": f"order_book/{market_id}"
+            })
+            await self.ws.send_str(subscribe_msg)
 
         # Subscribe to account orders (with auth)
         auth_token = None
@@ -181,6 +196,7 @@ class LighterMarketSwitcher:
         subscribe_positions: bool = False,
         subscribe_liquidations: bool = False,
         subscribe_user_stats: bool = False,
+        subscribe_order_book: bool = True,
     ) -> None:
         """
         Subscribe to the required Lighter channels.
@@ -189,14 +205,16 @@ class LighterMarketSwitcher:
             subscribe_positions: Whether to subscribe to positions channel
             subscribe_liquidations: Whether to subscribe to liquidations channel
             subscribe_user_stats: Whether to subscribe to user stats channel
+            subscribe_order_book: Whether to subscribe to the public order book channel
         """
         if not self.ws:
             raise RuntimeError("WebSocket connection not available")
 
-        await self.ws.send_str(json.dumps({
-            "type": "subscribe",
-            "channel": f"order_book/{self.market_index}"
-        }))
+        if subscribe_order_book:
+            await self.ws.send_str(json.dumps({
+                "type": "subscribe",
+                "channel": f"order_book/{self.market_index}"
+            }))
 
         auth_token = None
         if self.lighter_client:
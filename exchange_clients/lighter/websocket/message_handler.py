@@ -11,6 +11,18 @@ from typing import Dict, Any, List, Optional, Callable, Awaitable
 import aiohttp
 
 from exchange_clients.base_websocket import BBOData
+from exchange_clients.market_data.decoding import BookMessage, JSONDecodeError, LighterDecoder
+from helpers.unified_logger import log_throttled
+
+# Account channels: frames on these prove the private side of the connection is alive
+PRIVATE_MESSAGE_TYPES = frozenset(
+    {
+        "update/account_orders",
+        "update/account_all_positions",
+        "update/notification",
+        "update/user_stats",
+    }
+)
 
 
 class LighterMessageHandler:
@@ -54,6 +66,7 @@ class LighterMessageHandler:
         self.user_stats_callback = user_stats_callback
         self.notify_bbo_update = notify_bbo_update_fn
         self.logger = logger
+        self.decoder = LighterDecoder()
 
     def set_logger(self, logger):
         """Set the logger instance."""
@@ -77,7 +90,7 @@ class LighterMessageHandler:
         Process a WebSocket message and return extracted payloads.
         
         Returns:
-            Dict with keys: 'notifications', 'positions', 'user_stats', 'request_snapshot'
+            Dict with keys: 'notifications', 'positions', 'user_stats', 'request_snapshot', 'private'
         """
         # Handle different message types
         if msg.type == aiohttp.WSMsgType.TEXT:
@@ -120,9 +133,9 @@ class LighterMessageHandler:
             return None
 
         try:
-            data = json.loads(raw_message)
-        except json.JSONDecodeError as exc:
-            self._log(f"JSON parsing error in Lighter websocket: {exc}", "ERROR")
+            message = self.decoder.decode(raw_message)
+        except JSONDecodeError as exc:
+            log_throttled(self.logger, f"JSON parsing error in Lighter websocket: {exc}", "ERROR")
             return None
 
         result = {
@@ -130,45 +143,52 @@ class LighterMessageHandler:
             "positions": None,
             "user_stats": None,
             "request_snapshot": False,
+            "private": False,
         }
 
-        # Process order book messages
-        if data.get("type") == "subscribed/order_book":
-            await self._handle_order_book_snapshot(data)
-        elif data.get("type") == "update/order_book" and self.order_book_manager.snapshot_loaded:
-            request_snapshot = await self._handle_order_book_update(data)
-            result["request_snapshot"] = request_snapshot
-        elif data.get("type") == "ping":
+        # Order book frames arrive decoded; everything else is routed on its type tag
+        if message.__class__ is BookMessage:
+            if message.snapshot:
+                await self._handle_order_book_snapshot(message)
+            elif self.order_book_manager.snapshot_loaded:
+                result["request_snapshot"] = await self._handle_order_book_update(message)
+            return result
+
+        msg_type = message.type
+        data = message.data
+        result["private"] = msg_type in PRIVATE_MESSAGE_TYPES
+        if msg_type == "update/order_book":
+            if self.order_book_manager.snapshot_loaded:
+                log_throttled(self.logger, "Skipping incomplete order book update", "WARNING")
+        elif msg_type == "subscribed/order_book":
+            log_throttled(self.logger, "Skipping malformed order book snapshot", "WARNING")
+        elif msg_type == "ping":
             if self.ws:
                 await self.ws.send_str(json.dumps({"type": "pong"}))
-        elif data.get("type") == "update/account_orders":
+        elif msg_type == "update/account_orders":
             orders = data.get("orders", {}).get(str(self.market_index), [])
             self._handle_order_update(orders)
-        elif data.get("type") == "update/account_all_positions":
+        elif msg_type == "update/account_all_positions":
             result["positions"] = data
-        elif data.get("type") == "update/notification":
+        elif msg_type == "update/notification":
             result["notifications"] = data.get("notifs", [])
-        elif data.get("type") == "update/user_stats":
+        elif msg_type == "update/user_stats":
             result["user_stats"] = data
-        elif data.get("type") == "subscribed/notification":
+        elif msg_type == "subscribed/notification":
             self._log("Subscribed to notification channel", "DEBUG")
-        elif data.get("type") == "subscribed/account_all_positions":
+        elif msg_type == "subscribed/account_all_positions":
             self._log("Subscribed to account positions channel", "DEBUG")
-        elif data.get("type") == "subscribed/user_stats":
+        elif msg_type == "subscribed/user_stats":
             self._log("Subscribed to user stats channel (real-time balance updates)", "DEBUG")
 
         return result
 
-    async def _handle_order_book_snapshot(self, data: Dict[str, Any]):
+    async def _handle_order_book_snapshot(self, message: BookMessage):
         """Handle order book snapshot message."""
         async with self.order_book_manager.order_book_lock:
-            self.order_book_manager.order_book["bids"].clear()
-            self.order_book_manager.order_book["asks"].clear()
-            order_book = data.get("order_book", {})
-            if order_book and "offset" in order_book:
-                self.order_book_manager.order_book_offset = order_book["offset"]
-            self.order_book_manager.update_order_book("bids", order_book.get("bids", []))
-            self.order_book_manager.update_order_book("asks", order_book.get("asks", []))
+            if message.sequence is not None:
+                self.order_book_manager.order_book_offset = message.sequence
+            self.order_book_manager.apply_message(message)
             self.order_book_manager.snapshot_loaded = True
             self.order_book_manager.order_book_ready = True
             # Mark snapshot as fresh update (ensure timestamp is set even if order book was empty)
@@ -198,25 +218,19 @@ class LighterMessageHandler:
                 "INFO",
             )
 
-    async def _handle_order_book_update(self, data: Dict[str, Any]) -> bool:
-        """Handle order book update message. Returns True if snapshot should be requested."""
-        if not self.order_book_manager.handle_order_book_cutoff(data):
-            self._log("Skipping incomplete order book update", "WARNING")
-            return False
-
-        order_book = data.get("order_book", {})
-        offset = order_book.get("offset")
-        if offset is None:
-            self._log("Order book update missing offset, skipping", "WARNING")
-            return False
+    async def _handle_order_book_update(self, message: BookMessage) -> bool:
+        """
+        Handle a decoded order book delta. Returns True if snapshot should be requested.
 
+        Cut-off/incomplete updates never decode to a BookMessage (see LighterDecoder).
+        """
+        offset = message.sequence
         if not self.order_book_manager.validate_order_book_offset(offset):
             if self.order_book_manager.order_book_sequence_gap:
                 return True
             return False
 
-        self.order_book_manager.update_order_book("bids", order_book.get("bids", []))
-        self.order_book_manager.update_order_book("asks", order_book.get("asks", []))
+        self.order_book_manager.apply_message(message)
 
         if not self.order_book_manager.validate_order_book_integrity():
             return True
@@ -2,12 +2,41 @@
 Order book state management for Lighter WebSocket.
 
 Handles order book updates, validation, BBO extraction, and state management.
+Levels are keyed by integer price units (see ``market_data.decoding``) so
+decoded websocket deltas apply without float or Decimal conversion.
 """
 
 import asyncio
 import time
+import weakref
 from typing import Dict, Any, List, Optional, Tuple
-from decimal import Decimal
+
+from exchange_clients.market_data.decoding import (
+    BookMessage,
+    UNIT_SCALE,
+    to_units,
+    units_to_decimal,
+    units_to_float,
+)
+from helpers.metrics import REGISTRY
+from helpers.unified_logger import log_throttled
+
+BOOK_STALENESS = REGISTRY.gauge(
+    "ws_book_staleness_seconds", "Seconds since the last order book update", ("venue",)
+)
+
+# Every live book in the process (several per process under MultiAccountRuntime)
+_LIVE_BOOKS: "weakref.WeakSet[LighterOrderBook]" = weakref.WeakSet()
+
+
+def _max_book_staleness() -> Optional[float]:
+    """Staleness of the stalest live book, or None when no book has received data."""
+    values = [book.get_staleness_seconds() for book in list(_LIVE_BOOKS)]
+    values = [value for value in values if value is not None]
+    return max(values) if values else None
+
+
+BOOK_STALENESS.labels(venue="lighter").set_function(_max_book_staleness)
 
 
 class LighterOrderBook:
@@ -27,8 +56,8 @@ class LighterOrderBook:
         """
         self.logger = logger
         
-        # Order book state
-        self.order_book = {"bids": {}, "asks": {}}
+        # Order book state: price units -> size units
+        self.order_book: Dict[str, Dict[int, int]] = {"bids": {}, "asks": {}}
         self.best_bid: Optional[float] = None
         self.best_ask: Optional[float] = None
         self.snapshot_loaded = False
@@ -39,13 +68,22 @@ class LighterOrderBook:
         
         # Track last update time to detect staleness
         self.last_update_timestamp: Optional[float] = None
+        _LIVE_BOOKS.add(self)
 
     def set_logger(self, logger):
         """Set the logger instance."""
         self.logger = logger
 
     def _log(self, message: str, level: str = "INFO"):
-        """Log message using the logger if available."""
+        """
+        Log message using the logger if available.
+
+        Warnings/errors are rate limited per call site, since a bad feed
+        repeats them on every delta.
+        """
+        if level in ("WARNING", "ERROR"):
+            log_throttled(self.logger, message, level, depth=1)
+            return
         if self.logger:
             self.logger.log(message, level)
 
@@ -74,8 +112,8 @@ class LighterOrderBook:
                     self._log(f"Missing required fields in update: {update}", "ERROR")
                     continue
 
-                price = float(update["price"])
-                size = float(update["size"])
+                price = to_units(update["price"])
+                size = to_units(update["size"])
 
                 # Validate price and size are reasonable
                 if price <= 0:
@@ -100,6 +138,25 @@ class LighterOrderBook:
         if has_valid_updates:
             self.last_update_timestamp = time.time()
 
+    def apply_message(self, message: BookMessage) -> None:
+        """Apply a decoded snapshot/delta; snapshots replace both sides."""
+        bids = self.order_book["bids"]
+        asks = self.order_book["asks"]
+        if message.snapshot:
+            bids.clear()
+            asks.clear()
+        for ob, levels in ((bids, message.bids), (asks, message.asks)):
+            for price, size in levels:
+                if price <= 0 or size < 0:
+                    self._log(f"Invalid level in update: price={price}, size={size}", "ERROR")
+                    continue
+                if size == 0:
+                    ob.pop(price, None)
+                else:
+                    ob[price] = size
+        if message.bids or message.asks:
+            self.last_update_timestamp = time.time()
+
     def validate_order_book_offset(self, new_offset: int) -> bool:
         """Validate that the new offset is sequential and handle gaps."""
         if self.order_book_offset is None:
@@ -165,7 +222,8 @@ class LighterOrderBook:
             # Check if best bid is higher than best ask (inconsistent)
             if best_bid >= best_ask:
                 self._log(
-                    f"Order book inconsistency detected! Best bid: {best_bid}, Best ask: {best_ask}",
+                    f"Order book inconsistency detected! Best bid: {units_to_float(best_bid)}, "
+                    f"Best ask: {units_to_float(best_ask)}",
                     "WARNING"
                 )
                 return False
@@ -188,23 +246,26 @@ class LighterOrderBook:
             ((best_bid_price, best_bid_size), (best_ask_price, best_ask_size))
         """
         try:
-            # Get all bid levels with sufficient size
-            bid_levels = [
-                (price, size)
-                for price, size in self.order_book["bids"].items()
-                if size * price >= min_size_usd
-            ]
-
-            # Get all ask levels with sufficient size
-            ask_levels = [
-                (price, size)
-                for price, size in self.order_book["asks"].items()
-                if size * price >= min_size_usd
-            ]
+            bids = self.order_book["bids"]
+            asks = self.order_book["asks"]
+            if min_size_usd > 0:
+                # Notional in units**2; compare against the threshold scaled to match
+                threshold = min_size_usd * UNIT_SCALE * UNIT_SCALE
+                bid_prices = [price for price, size in bids.items() if size * price >= threshold]
+                ask_prices = [price for price, size in asks.items() if size * price >= threshold]
+            else:
+                bid_prices = bids
+                ask_prices = asks
 
             # Get best bid (highest price) and best ask (lowest price)
-            best_bid = max(bid_levels) if bid_levels else (None, None)
-            best_ask = min(ask_levels) if ask_levels else (None, None)
+            best_bid: Tuple[Optional[float], Optional[float]] = (None, None)
+            best_ask: Tuple[Optional[float], Optional[float]] = (None, None)
+            if bid_prices:
+                price = max(bid_prices)
+                best_bid = (units_to_float(price), units_to_float(bids[price]))
+            if ask_prices:
+                price = min(ask_prices)
+                best_ask = (units_to_float(price), units_to_float(asks[price]))
 
             return best_bid, best_ask
         except (ValueError, KeyError) as e:
@@ -225,21 +286,21 @@ class LighterOrderBook:
             return None
         
         try:
-            # Convert to standard format and sort
+            # Sort and limit before converting, so only returned levels become Decimals
+            bid_items = sorted(self.order_book["bids"].items(), reverse=True)
+            ask_items = sorted(self.order_book["asks"].items())
+            if levels is not None:
+                bid_items = bid_items[:levels]
+                ask_items = ask_items[:levels]
+
             bids = [
-                {'price': Decimal(str(price)), 'size': Decimal(str(size))}
-                for price, size in sorted(self.order_book["bids"].items(), reverse=True)
+                {'price': units_to_decimal(price), 'size': units_to_decimal(size)}
+                for price, size in bid_items
             ]
             asks = [
-                {'price': Decimal(str(price)), 'size': Decimal(str(size))}
-                for price, size in sorted(self.order_book["asks"].items())
+                {'price': units_to_decimal(price), 'size': units_to_decimal(size)}
+                for price, size in ask_items
             ]
-            
-            # Apply level limiting if requested
-            if levels is not None:
-                bids = bids[:levels]
-                asks = asks[:levels]
-            
             return {'bids': bids, 'asks': asks}
             
         except Exception as e:
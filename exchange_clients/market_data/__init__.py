@@ -1,5 +1,36 @@
 """Market data helpers for exchange clients."""
 
+from .daemon import MarketDataDaemon
 from .price_stream import PriceStream, PriceStreamError
+from .recorder import (
+    FeedReader,
+    FeedRecorder,
+    FeedRecordingError,
+    FeedReplayer,
+    RecordedFrame,
+    ReplayStats,
+)
+from .shared_book import (
+    BookFrame,
+    SharedBookError,
+    SharedBookReader,
+    SharedBookWebSocketManager,
+    SharedBookWriter,
+)
 
-__all__ = ["PriceStream", "PriceStreamError"]
+__all__ = [
+    "PriceStream",
+    "PriceStreamError",
+    "FeedReader",
+    "FeedRecorder",
+    "FeedRecordingError",
+    "FeedReplayer",
+    "RecordedFrame",
+    "ReplayStats",
+    "BookFrame",
+    "MarketDataDaemon",
+    "SharedBookError",
+    "SharedBookReader",
+    "SharedBookWebSocketManager",
+    "SharedBookWriter",
+]
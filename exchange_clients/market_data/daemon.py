@@ -0,0 +1,214 @@
+"""
+Host-wide market-data daemon.
+
+Owns the public websocket feeds for a set of (venue, symbol) pairs and
+publishes each venue manager's book into a shared ring (see ``shared_book``)
+on every BBO update, plus a heartbeat that carries depth changes which did not
+move the BBO. Frames are stamped with the venue book's own last-update time.
+Liveness is stamped separately: the heartbeat confirms each ring alive while
+the venue's public socket is connected, so a quiet market stays live and a
+dropped feed goes stale in readers. Strategy processes started with
+``SHARED_MARKET_DATA=1`` read those rings instead of subscribing to public
+channels themselves.
+
+Venue websocket managers follow one market at a time, so the daemon runs one
+client per (venue, symbol).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from exchange_clients.base_websocket import BBOData
+from exchange_clients.market_data.shared_book import (
+    DEFAULT_LEVELS,
+    DEFAULT_MAX_AGE_SECONDS,
+    DEFAULT_SLOTS,
+    SharedBookWriter,
+)
+
+ClientFactory = Callable[[str, str], Any]
+
+logger = logging.getLogger(__name__)
+
+
+def default_client_factory(venue: str, symbol: str) -> Any:
+    """Build a venue client from environment credentials, configured for ``symbol``."""
+    from exchange_clients.factory import ExchangeFactory
+
+    config = SimpleNamespace(
+        ticker=symbol,
+        exchange=venue,
+        contract_id=symbol,
+        market_index=None,
+        account_index=None,
+        lighter_client=None,
+        api_client=None,
+    )
+    client = ExchangeFactory.create_exchange(exchange_name=venue, config=config)
+    # The daemon is the publisher; it must never read its own rings
+    client.use_shared_market_data = False
+    return client
+
+
+class _Feed:
+    """One venue client publishing one symbol's book into its ring."""
+
+    def __init__(self, venue: str, symbol: str, client: Any, writer: SharedBookWriter) -> None:
+        self.venue = venue
+        self.symbol = symbol
+        self.client = client
+        self.writer = writer
+        self.listener: Optional[Callable[[BBOData], Any]] = None
+        self.publishes = 0
+        self.bbo_at: Optional[float] = None  # Wall-clock receipt of the last BBO update
+        self.published_at: Optional[float] = None  # Timestamp of the last published frame
+
+
+class MarketDataDaemon:
+    """Publishes public books for the configured feeds into shared memory."""
+
+    def __init__(
+        self,
+        feeds: Dict[str, List[str]],
+        *,
+        levels: int = DEFAULT_LEVELS,
+        slots: int = DEFAULT_SLOTS,
+        heartbeat_interval: float = 1.0,
+        client_factory: Optional[ClientFactory] = None,
+    ) -> None:
+        self.feeds = {venue.lower(): [symbol.upper() for symbol in symbols] for venue, symbols in feeds.items()}
+        self.levels = levels
+        self.slots = slots
+        self.heartbeat_interval = heartbeat_interval
+        self._client_factory = client_factory or default_client_factory
+        self._feeds: Dict[Tuple[str, str], _Feed] = {}
+        self._heartbeat_task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Connect every feed and begin publishing; failed feeds are logged and skipped."""
+        for venue, symbols in self.feeds.items():
+            for symbol in symbols:
+                try:
+                    await self._start_feed(venue, symbol)
+                except Exception as exc:
+                    logger.error("Failed to start %s:%s feed: %s", venue, symbol, exc)
+        self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+
+    async def _start_feed(self, venue: str, symbol: str) -> None:
+        client = self._client_factory(venue, symbol)
+        await client.connect()
+        await client.ensure_market_feed(symbol)
+        manager = client.ws_manager
+        if manager is None:
+            await client.disconnect()
+            raise RuntimeError(f"{venue} client has no websocket manager")
+
+        feed = _Feed(venue, symbol, client, SharedBookWriter.create(venue, symbol, levels=self.levels, slots=self.slots))
+
+        async def on_bbo(bbo: BBOData) -> None:
+            feed.bbo_at = time.time()
+            if bbo.symbol:
+                feed.writer.set_feed_symbol(str(bbo.symbol))
+            self.publish(feed, sequence=bbo.sequence)
+
+        feed.listener = on_bbo
+        manager.register_bbo_listener(on_bbo)
+        self._feeds[(venue, symbol)] = feed
+        self.publish(feed)
+        logger.info("Publishing %s:%s to shared segment %s", venue, symbol, feed.writer.name)
+
+    @staticmethod
+    def book_updated_at(feed: _Feed) -> Optional[float]:
+        """
+        Wall-clock time of the venue book's last update.
+
+        Uses the order book's ``last_update_timestamp`` where the venue keeps
+        one, and the last BBO update seen otherwise (whichever is newer).
+        """
+        manager = feed.client.ws_manager
+        stamp = getattr(getattr(manager, "order_book", None), "last_update_timestamp", None)
+        candidates = [t for t in (stamp, feed.bbo_at) if isinstance(t, (int, float))]
+        return float(max(candidates)) if candidates else None
+
+    def publish(self, feed: _Feed, sequence: Optional[int] = None) -> bool:
+        """Copy the venue manager's current book into the ring; False if it has no book yet."""
+        manager = feed.client.ws_manager
+        book = manager.get_order_book(self.levels) if manager is not None else None
+        if not book or not book.get("bids") or not book.get("asks"):
+            return False
+        updated_at = self.book_updated_at(feed)
+        timestamp = updated_at if updated_at is not None else time.time()
+        feed.writer.publish(
+            [(level["price"], level["size"]) for level in book["bids"]],
+            [(level["price"], level["size"]) for level in book["asks"]],
+            sequence=sequence,
+            timestamp=timestamp,
+        )
+        feed.publishes += 1
+        feed.published_at = timestamp
+        return True
+
+    @staticmethod
+    def feed_connected(feed: _Feed) -> bool:
+        """True while the venue manager's public book socket is connected."""
+        manager = feed.client.ws_manager
+        if manager is None or not getattr(manager, "running", False):
+            return False
+        check = getattr(manager, "public_stream_open", None)
+        return bool(check()) if callable(check) else True
+
+    def _heartbeat(self, feed: _Feed) -> bool:
+        """
+        Republish a book that changed since the last frame, then confirm the ring
+        alive if the feed is connected. Returns True if a frame was published.
+        """
+        published = False
+        updated_at = self.book_updated_at(feed)
+        if (
+            updated_at is not None
+            and time.time() - updated_at <= DEFAULT_MAX_AGE_SECONDS
+            and (feed.published_at is None or updated_at > feed.published_at)
+        ):
+            published = self.publish(feed)
+        # An unchanged book on a connected socket is a quiet market, not a dead feed
+        if feed.published_at is not None and self.feed_connected(feed):
+            feed.writer.mark_alive()
+        return published
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            for feed in list(self._feeds.values()):
+                try:
+                    self._heartbeat(feed)
+                except Exception as exc:
+                    logger.warning("Heartbeat publish failed for %s:%s: %s", feed.venue, feed.symbol, exc)
+
+    def stats(self) -> Dict[str, int]:
+        return {f"{venue}:{symbol}": feed.publishes for (venue, symbol), feed in self._feeds.items()}
+
+    async def stop(self) -> None:
+        """Stop publishing, disconnect clients and unlink every segment."""
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+
+        for feed in list(self._feeds.values()):
+            manager = feed.client.ws_manager
+            if manager is not None and feed.listener is not None:
+                manager.unregister_bbo_listener(feed.listener)
+            try:
+                await feed.client.disconnect()
+            except Exception as exc:
+                logger.warning("Disconnect failed for %s:%s: %s", feed.venue, feed.symbol, exc)
+            feed.writer.close(unlink=True)
+        self._feeds.clear()
@@ -0,0 +1,61 @@
+"""
+Typed websocket decoding per venue.
+
+Each venue decoder parses a raw frame once, dispatches on its type tag
+through a table and returns compact ``__slots__`` messages whose prices and
+sizes are already integer units (see ``base``). Order books apply these
+directly; message types without a schema come back as RawMessage.
+"""
+
+from .aster import AsterDecoder
+from .backpack import BackpackDecoder
+from .base import (
+    JSON_BACKEND,
+    UNIT_DECIMALS,
+    UNIT_SCALE,
+    BookMessage,
+    JSONDecodeError,
+    MessageDecoder,
+    RawMessage,
+    TickerMessage,
+    loads,
+    to_units,
+    units_to_decimal,
+    units_to_float,
+)
+from .lighter import LighterDecoder
+from .paradex import ParadexDecoder
+
+DECODERS = {
+    "aster": AsterDecoder,
+    "backpack": BackpackDecoder,
+    "lighter": LighterDecoder,
+    "paradex": ParadexDecoder,
+}
+
+
+def get_decoder(venue: str) -> MessageDecoder:
+    """New decoder instance for ``venue``; raises KeyError for unknown venues."""
+    return DECODERS[venue.lower()]()
+
+
+__all__ = [
+    "DECODERS",
+    "get_decoder",
+    "AsterDecoder",
+    "BackpackDecoder",
+    "LighterDecoder",
+    "ParadexDecoder",
+    "JSON_BACKEND",
+    "UNIT_DECIMALS",
+    "UNIT_SCALE",
+    "BookMessage",
+    "JSONDecodeError",
+    "MessageDecoder",
+    "RawMessage",
+    "TickerMessage",
+    "loads",
+    "to_units",
+    "units_to_decimal",
+    "units_to_float",
+]
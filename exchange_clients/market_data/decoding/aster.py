@@ -0,0 +1,49 @@
+"""
+Aster websocket schemas (Binance-compatible market streams).
+
+Frames are tagged by the ``e`` event field. ``depthUpdate`` on the partial
+depth stream carries the full top-N book, so it decodes as a snapshot::
+
+    {"e": "bookTicker", "u": 400900217, "s": "BNBUSDT",
+     "b": "25.3519", "B": "31.21", "a": "25.3652", "A": "40.66"}
+    {"e": "depthUpdate", "E": 1571889248277, "s": "BTCUSDT", "u": 7,
+     "b": [["7403.89", "0.002"], ...], "a": [["7405.96", "3.340"], ...]}
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from .base import BookMessage, MessageDecoder, TickerMessage, levels_from_pairs, to_units
+
+
+class AsterDecoder(MessageDecoder):
+    VENUE = "aster"
+    TYPE_FIELD = "e"
+    SCHEMAS = {
+        "bookTicker": "decode_book_ticker",
+        "depthUpdate": "decode_depth",
+    }
+
+    def decode_book_ticker(self, data: Dict[str, Any]) -> TickerMessage:
+        bid_size = data.get("B")
+        ask_size = data.get("A")
+        return TickerMessage(
+            symbol=data.get("s"),
+            bid=to_units(data["b"]),
+            ask=to_units(data["a"]),
+            bid_size=to_units(bid_size) if bid_size is not None else None,
+            ask_size=to_units(ask_size) if ask_size is not None else None,
+            sequence=data.get("u"),
+            event_time=data.get("E"),
+        )
+
+    def decode_depth(self, data: Dict[str, Any]) -> BookMessage:
+        return BookMessage(
+            symbol=data.get("s"),
+            bids=levels_from_pairs(data.get("b") or []),
+            asks=levels_from_pairs(data.get("a") or []),
+            snapshot=True,
+            sequence=data.get("u"),
+            event_time=data.get("E"),
+        )
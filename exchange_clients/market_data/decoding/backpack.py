@@ -0,0 +1,73 @@
+"""
+Backpack websocket schemas.
+
+Market frames arrive wrapped as ``{"stream": "<kind>.<symbol>", "data": {...}}``
+and are tagged by the stream kind. Depth frames are deltas bounded by the
+``U``/``u`` update ids::
+
+    {"stream": "depth.SOL_USDC_PERP",
+     "data": {"e": "depth", "s": "SOL_USDC_PERP", "U": 101, "u": 103,
+              "b": [["150.10", "2.5"]], "a": [["150.20", "0"]]}}
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from .base import BookMessage, MessageDecoder, TickerMessage, levels_from_pairs, to_units
+
+
+def _int_or_none(value: Any) -> Optional[int]:
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class BackpackDecoder(MessageDecoder):
+    VENUE = "backpack"
+    SCHEMAS = {
+        "depth": "decode_depth",
+        "bookTicker": "decode_book_ticker",
+    }
+
+    def message_type(self, data: Any) -> Optional[str]:
+        if data.__class__ is not dict:
+            return None
+        stream = data.get("stream")
+        if not stream:
+            return None
+        return stream.partition(".")[0]
+
+    def decode_depth(self, data: Dict[str, Any]) -> BookMessage:
+        return self.depth_from_payload(data["data"])
+
+    def depth_from_payload(self, payload: Dict[str, Any]) -> BookMessage:
+        """Decode an unwrapped depth event (the frame's ``data``)."""
+        if payload.get("e") != "depth":
+            raise ValueError("not a depth event")
+        return BookMessage(
+            symbol=payload.get("s"),
+            bids=levels_from_pairs(payload.get("b") or []),
+            asks=levels_from_pairs(payload.get("a") or []),
+            snapshot=False,
+            sequence=_int_or_none(payload.get("u")),
+            first_sequence=_int_or_none(payload.get("U")),
+            event_time=payload.get("E"),
+        )
+
+    def decode_book_ticker(self, data: Dict[str, Any]) -> TickerMessage:
+        payload = data["data"]
+        bid_size = payload.get("B")
+        ask_size = payload.get("A")
+        return TickerMessage(
+            symbol=payload.get("s"),
+            bid=to_units(payload["b"]),
+            ask=to_units(payload["a"]),
+            bid_size=to_units(bid_size) if bid_size is not None else None,
+            ask_size=to_units(ask_size) if ask_size is not None else None,
+            sequence=_int_or_none(payload.get("u")),
+            event_time=payload.get("E"),
+        )
@@ -0,0 +1,192 @@
+"""
+Shared primitives for typed websocket decoding.
+
+Prices and sizes are parsed from their wire strings straight into integers in
+units of ``10**-UNIT_DECIMALS`` (no intermediate float or Decimal), so order
+books can key levels by exact integers and only materialize Decimals for the
+levels a caller asks for.
+"""
+
+from __future__ import annotations
+
+import json
+from decimal import Decimal
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple
+
+from helpers.metrics import REGISTRY
+
+try:  # Optional accelerated JSON parser
+    import orjson
+
+    def loads(raw: Any) -> Any:
+        """Parse a JSON frame (str or bytes)."""
+        return orjson.loads(raw)
+
+    JSON_BACKEND = "orjson"
+except ImportError:  # pragma: no cover - depends on environment
+    def loads(raw: Any) -> Any:
+        """Parse a JSON frame (str or bytes)."""
+        return json.loads(raw)
+
+    JSON_BACKEND = "json"
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch one type
+JSONDecodeError = json.JSONDecodeError
+
+UNIT_DECIMALS = 10
+UNIT_SCALE = 10 ** UNIT_DECIMALS
+_PAD = "0" * UNIT_DECIMALS
+
+# (price_units, size_units)
+Level = Tuple[int, int]
+
+WS_MESSAGES = REGISTRY.counter("ws_messages_total", "Websocket frames decoded per venue", ("venue",))
+WS_MALFORMED = REGISTRY.counter(
+    "ws_malformed_messages_total", "Frames whose payload did not fit the venue schema", ("venue",)
+)
+
+
+def to_units(value: Any) -> int:
+    """
+    Parse a decimal string (or number) into integer units of ``10**-UNIT_DECIMALS``.
+
+    Digits beyond ``UNIT_DECIMALS`` are truncated; exponent notation and
+    non-string inputs go through Decimal.
+    """
+    if value.__class__ is not str:
+        if isinstance(value, int):
+            return value * UNIT_SCALE
+        value = str(value)
+    if "e" in value or "E" in value:
+        return int(Decimal(value).scaleb(UNIT_DECIMALS))
+    whole, _, frac = value.partition(".")
+    if len(frac) >= UNIT_DECIMALS:
+        return int(whole + frac[:UNIT_DECIMALS])
+    return int(whole + frac + _PAD[len(frac):])
+
+
+def units_to_decimal(units: int) -> Decimal:
+    """Exact Decimal for a unit count, without trailing zeros (e.g. ``Decimal("100.5")``)."""
+    whole, frac = divmod(abs(units), UNIT_SCALE)
+    sign = "-" if units < 0 else ""
+    if not frac:
+        return Decimal(f"{sign}{whole}")
+    return Decimal(f"{sign}{whole}.{str(frac).rjust(UNIT_DECIMALS, '0').rstrip('0')}")
+
+
+def units_to_float(units: int) -> float:
+    return units / UNIT_SCALE
+
+
+def levels_from_pairs(pairs: List[Any]) -> List[Level]:
+    """``[[price, size], ...]`` wire levels to unit tuples."""
+    return [(to_units(price), to_units(size)) for price, size, *_ in pairs]
+
+
+def levels_from_dicts(entries: List[Dict[str, Any]]) -> List[Level]:
+    """``[{"price": ..., "size": ...}, ...]`` wire levels to unit tuples."""
+    return [(to_units(entry["price"]), to_units(entry["size"])) for entry in entries]
+
+
+class BookMessage:
+    """Order book snapshot or delta; a size of 0 removes the level."""
+
+    __slots__ = ("symbol", "bids", "asks", "snapshot", "sequence", "first_sequence", "event_time")
+
+    def __init__(
+        self,
+        *,
+        symbol: Optional[str],
+        bids: List[Level],
+        asks: List[Level],
+        snapshot: bool,
+        sequence: Optional[int] = None,
+        first_sequence: Optional[int] = None,
+        event_time: Optional[int] = None,
+    ) -> None:
+        self.symbol = symbol
+        self.bids = bids
+        self.asks = asks
+        self.snapshot = snapshot
+        self.sequence = sequence
+        self.first_sequence = first_sequence
+        self.event_time = event_time
+
+
+class TickerMessage:
+    """Best bid/ask update in units (sizes are None when the venue omits them)."""
+
+    __slots__ = ("symbol", "bid", "bid_size", "ask", "ask_size", "sequence", "event_time")
+
+    def __init__(
+        self,
+        *,
+        symbol: Optional[str],
+        bid: int,
+        ask: int,
+        bid_size: Optional[int] = None,
+        ask_size: Optional[int] = None,
+        sequence: Optional[int] = None,
+        event_time: Optional[int] = None,
+    ) -> None:
+        self.symbol = symbol
+        self.bid = bid
+        self.ask = ask
+        self.bid_size = bid_size
+        self.ask_size = ask_size
+        self.sequence = sequence
+        self.event_time = event_time
+
+
+class RawMessage:
+    """Any other message: its type tag and the parsed payload, left untyped."""
+
+    __slots__ = ("type", "data")
+
+    def __init__(self, type: Optional[str], data: Any) -> None:
+        self.type = type
+        self.data = data
+
+
+class MessageDecoder:
+    """
+    Decodes one venue's frames into typed messages.
+
+    Subclasses set ``VENUE`` (the ``venue`` label of ``ws_messages_total``),
+    ``TYPE_FIELD`` (or override ``message_type``) and map type
+    tags to decode methods in ``SCHEMAS``; unmapped types, and mapped ones
+    whose payload does not fit the schema, come back as RawMessage.
+    """
+
+    VENUE: ClassVar[str] = "unknown"
+    TYPE_FIELD: ClassVar[str] = "type"
+    SCHEMAS: ClassVar[Dict[str, str]] = {}
+
+    def __init__(self) -> None:
+        self._table: Dict[str, Callable[[Any], Any]] = {
+            tag: getattr(self, method) for tag, method in self.SCHEMAS.items()
+        }
+        self.malformed = 0
+        self._frames = WS_MESSAGES.labels(venue=self.VENUE)
+        self._malformed_frames = WS_MALFORMED.labels(venue=self.VENUE)
+
+    def message_type(self, data: Any) -> Optional[str]:
+        return data.get(self.TYPE_FIELD) if data.__class__ is dict else None
+
+    def decode(self, raw: Any) -> Any:
+        """Parse and decode one raw frame; raises JSONDecodeError on invalid JSON."""
+        return self.decode_data(loads(raw))
+
+    def decode_data(self, data: Any) -> Any:
+        """Decode an already-parsed frame (e.g. delivered by a venue SDK)."""
+        self._frames.inc()
+        tag = self.message_type(data)
+        handler = self._table.get(tag)
+        if handler is None:
+            return RawMessage(tag, data)
+        try:
+            return handler(data)
+        except (KeyError, TypeError, ValueError, AttributeError, ArithmeticError):
+            self.malformed += 1
+            self._malformed_frames.inc()
+            return RawMessage(tag, data)
@@ -0,0 +1,51 @@
+"""
+Lighter websocket schemas.
+
+Frames are JSON objects tagged by ``type``; order book snapshots arrive on
+``subscribed/order_book`` and deltas on ``update/order_book``::
+
+    {"type": "update/order_book", "channel": "order_book:1",
+     "order_book": {"code": 0, "offset": 41,
+                    "bids": [{"price": "100.10", "size": "1.5"}], "asks": [...]}}
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from .base import BookMessage, MessageDecoder, levels_from_dicts
+
+
+class LighterDecoder(MessageDecoder):
+    VENUE = "lighter"
+    TYPE_FIELD = "type"
+    SCHEMAS = {
+        "subscribed/order_book": "decode_snapshot",
+        "update/order_book": "decode_update",
+    }
+
+    def decode_snapshot(self, data: Dict[str, Any]) -> BookMessage:
+        order_book = data.get("order_book") or {}
+        return BookMessage(
+            symbol=None,
+            bids=levels_from_dicts(order_book.get("bids") or []),
+            asks=levels_from_dicts(order_book.get("asks") or []),
+            snapshot=True,
+            sequence=order_book.get("offset"),
+        )
+
+    def decode_update(self, data: Dict[str, Any]) -> BookMessage:
+        order_book = data["order_book"]
+        # Incomplete/cut-off updates stay raw so the handler can skip them
+        if "code" not in order_book or order_book.get("offset") is None:
+            raise KeyError("offset")
+        bids, asks = order_book["bids"], order_book["asks"]
+        if bids.__class__ is not list or asks.__class__ is not list:
+            raise TypeError("bids/asks must be lists")
+        return BookMessage(
+            symbol=None,
+            bids=levels_from_dicts(bids),
+            asks=levels_from_dicts(asks),
+            snapshot=False,
+            sequence=order_book["offset"],
+        )
@@ -0,0 +1,110 @@
+"""
+Paradex websocket schemas.
+
+The Paradex SDK delivers JSON-RPC frames already parsed, so these schemas
+decode dicts (``decode_data``) and are tagged by the channel prefix::
+
+    {"jsonrpc": "2.0", "method": "subscription",
+     "params": {"channel": "order_book.BTC-USD-PERP.snapshot@15@100ms",
+                "data": {"market": "BTC-USD-PERP", "update_type": "d", "seq_no": 9,
+                         "inserts": [{"side": "BUY", "price": "100.1", "size": "2"}],
+                         "updates": [], "deletes": []}}}
+
+Order book deltas flatten into per-side level lists in the order the legacy
+handler applied them (direct bids/asks, deletes, inserts, updates), with
+deletes as size 0.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from .base import BookMessage, Level, MessageDecoder, TickerMessage, to_units
+
+_BUY_SIDES = {"BUY", "1", 1}
+_SELL_SIDES = {"SELL", "2", 2}
+
+
+def _side(value: Any) -> Optional[str]:
+    if value.__class__ is str:
+        value = value.upper()
+    if value in _BUY_SIDES:
+        return "bids"
+    if value in _SELL_SIDES:
+        return "asks"
+    return None
+
+
+def _direct_levels(entries: List[Any], out: List[Level]) -> None:
+    for entry in entries:
+        if entry.__class__ is dict:
+            price, size = entry.get("price"), entry.get("size")
+        else:
+            price, size = entry[0], entry[1]
+        if price is None or size is None:
+            continue
+        out.append((to_units(price), to_units(size)))
+
+
+class ParadexDecoder(MessageDecoder):
+    VENUE = "paradex"
+    SCHEMAS = {
+        "order_book": "decode_order_book",
+        "bbo": "decode_bbo",
+    }
+
+    def message_type(self, data: Any) -> Optional[str]:
+        if data.__class__ is not dict:
+            return None
+        channel = (data.get("params") or {}).get("channel")
+        if not channel:
+            return None
+        return channel.partition(".")[0]
+
+    def decode_order_book(self, message: Dict[str, Any]) -> BookMessage:
+        return self.book_from_data(message["params"]["data"])
+
+    def book_from_data(self, data: Dict[str, Any]) -> BookMessage:
+        """Decode an order book channel's ``data`` payload."""
+        sides: Dict[str, List[Level]] = {"bids": [], "asks": []}
+        _direct_levels(data.get("bids") or [], sides["bids"])
+        _direct_levels(data.get("asks") or [], sides["asks"])
+
+        for entry in data.get("deletes") or []:
+            side = _side(entry.get("side"))
+            price = entry.get("price")
+            if side and price is not None:
+                sides[side].append((to_units(price), 0))
+        for key in ("inserts", "updates"):
+            for entry in data.get(key) or []:
+                side = _side(entry.get("side"))
+                price, size = entry.get("price"), entry.get("size")
+                if side and price is not None and size is not None:
+                    sides[side].append((to_units(price), to_units(size)))
+
+        return BookMessage(
+            symbol=data.get("market"),
+            bids=sides["bids"],
+            asks=sides["asks"],
+            snapshot=data.get("update_type") == "s",
+            sequence=data.get("seq_no"),
+            event_time=data.get("last_updated_at"),
+        )
+
+    def decode_bbo(self, message: Dict[str, Any]) -> TickerMessage:
+        data = message["params"]["data"]
+        bid = data.get("bid") or data.get("best_bid")
+        ask = data.get("ask") or data.get("best_ask")
+        if not bid or not ask:
+            raise ValueError("incomplete BBO")
+        bid_size = data.get("bid_size")
+        ask_size = data.get("ask_size")
+        return TickerMessage(
+            symbol=data.get("market"),
+            bid=to_units(bid),
+            ask=to_units(ask),
+            bid_size=to_units(bid_size) if bid_size is not None else None,
+            ask_size=to_units(ask_size) if ask_size is not None else None,
+            sequence=data.get("seq_no"),
+            event_time=data.get("last_updated_at"),
+        )
@@ -0,0 +1,531 @@
+"""
+Binary recorder and replayer for raw websocket feeds.
+
+Frames are captured with their receive timestamp at the point where each venue
+hands them to its message handler, buffered in memory and written out as
+self-contained compressed chunks. A fixed-width side index (``<file>.idx``) is
+memory-mapped by the reader so a time range can be located without scanning
+the data file.
+
+File layout::
+
+    FILE_MAGIC
+    chunk*   := CHUNK_HEADER + payload (zlib-compressed when codec == 1)
+    payload  := stream_table frame*
+    stream_table := (STREAM_ENTRY + utf-8 name)*   # streams used in the chunk
+    frame    := FRAME_HEADER + data
+
+    <file>.idx := INDEX_MAGIC + INDEX_ENTRY*        # one entry per chunk
+
+Every length is explicit, so a truncated tail (e.g. after a crash) is detected
+and ignored, and the index can be rebuilt from the data file alone.
+
+Usage:
+    >>> recorder = FeedRecorder("logs/feeds/lighter.mdrec")
+    >>> recorder.record("ws", raw_text)
+    >>> recorder.close()
+    >>>
+    >>> with FeedReader("logs/feeds/lighter.mdrec") as reader:
+    ...     stats = await FeedReplayer(reader, manager.get_replay_handlers(), speed=10).run()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import inspect
+import json
+import mmap
+import os
+import struct
+import time
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+FILE_MAGIC = b"MDREC\x00\x01\n"
+INDEX_MAGIC = b"MDIDX\x00\x01\n"
+CHUNK_MAGIC = b"CHNK"
+
+CODEC_NONE = 0
+CODEC_ZLIB = 1
+
+KIND_TEXT = 0
+KIND_BINARY = 1
+
+# magic, codec, stream_count, frame_count, raw_len, stored_len, first_ts_ns, last_ts_ns
+CHUNK_HEADER = struct.Struct("<4sBxHIIIqq")
+# stream_id, name_len
+STREAM_ENTRY = struct.Struct("<HH")
+# recv_ts_ns, stream_id, kind, data_len
+FRAME_HEADER = struct.Struct("<qHBxI")
+# chunk offset, stored_len, frame_count, first_ts_ns, last_ts_ns
+INDEX_ENTRY = struct.Struct("<QIIqq")
+
+RECORD_DIR_ENV = "WS_RECORD_DIR"
+RECORD_FILE_SUFFIX = ".mdrec"
+
+Payload = Union[str, bytes, bytearray, memoryview, Dict[str, Any], List[Any]]
+
+
+class FeedRecordingError(RuntimeError):
+    """Raised when a recording file is malformed."""
+
+
+@dataclass(frozen=True)
+class ChunkIndexEntry:
+    offset: int
+    stored_len: int
+    frame_count: int
+    first_ts_ns: int
+    last_ts_ns: int
+
+
+class RecordedFrame:
+    """One websocket frame as received."""
+
+    __slots__ = ("timestamp_ns", "stream", "payload")
+
+    def __init__(self, timestamp_ns: int, stream: str, payload: Union[str, bytes]) -> None:
+        self.timestamp_ns = timestamp_ns
+        self.stream = stream
+        self.payload = payload
+
+    @property
+    def timestamp(self) -> float:
+        return self.timestamp_ns / 1e9
+
+    def __repr__(self) -> str:  # pragma: no cover - debugging helper
+        return f"RecordedFrame(ts={self.timestamp_ns}, stream={self.stream!r}, len={len(self.payload)})"
+
+
+class FeedRecorder:
+    """
+    Append-only writer for raw websocket frames.
+
+    ``record()`` only appends to an in-memory buffer; compression and disk I/O
+    happen on a single background thread when a chunk fills up (or is older
+    than ``flush_interval``), so the event loop never blocks on the file.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        chunk_bytes: int = 1 << 20,
+        flush_interval: float = 5.0,
+        compression_level: int = 1,
+    ) -> None:
+        """
+        Args:
+            path: Output file (created, or appended to if it exists)
+            chunk_bytes: Uncompressed chunk size that triggers a flush
+            flush_interval: Maximum age in seconds of buffered frames
+            compression_level: zlib level (0 stores chunks uncompressed)
+        """
+        self.path = Path(path)
+        self.index_path = index_path_for(self.path)
+        self.chunk_bytes = chunk_bytes
+        self.flush_interval = flush_interval
+        self.compression_level = compression_level
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        existing = list(_scan_chunks(self.path)) if self.path.exists() else []
+        if self.path.exists() and self.path.stat().st_size >= len(FILE_MAGIC):
+            # Appending: drop any partially written chunk and rebuild the index
+            last = existing[-1] if existing else None
+            valid_end = last.offset + CHUNK_HEADER.size + last.stored_len if last else len(FILE_MAGIC)
+            self._file = open(self.path, "r+b")
+            if self._file.read(len(FILE_MAGIC)) != FILE_MAGIC:
+                self._file.close()
+                raise FeedRecordingError(f"{self.path} exists and is not a feed recording")
+            self._file.truncate(valid_end)
+            self._file.seek(valid_end)
+        else:
+            self._file = open(self.path, "wb")
+            self._file.write(FILE_MAGIC)
+            self._file.flush()
+        with open(self.index_path, "wb") as index_file:
+            index_file.write(INDEX_MAGIC)
+            for entry in existing:
+                index_file.write(INDEX_ENTRY.pack(
+                    entry.offset, entry.stored_len, entry.frame_count,
+                    entry.first_ts_ns, entry.last_ts_ns,
+                ))
+        self._index_file = open(self.index_path, "ab")
+
+        self._stream_ids: Dict[str, int] = {}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="feed-recorder")
+        self._pending: Optional[Future] = None
+        self._closed = False
+
+        self.frames_recorded = 0
+        self.bytes_recorded = 0
+        self._reset_chunk()
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def record(self, stream: str, payload: Payload, timestamp_ns: Optional[int] = None) -> None:
+        """Buffer one frame. Dicts/lists are stored as compact JSON text."""
+        if self._closed:
+            return
+        if timestamp_ns is None:
+            timestamp_ns = time.time_ns()
+
+        if isinstance(payload, str):
+            kind, data = KIND_TEXT, payload.encode("utf-8")
+        elif isinstance(payload, (bytes, bytearray, memoryview)):
+            kind, data = KIND_BINARY, bytes(payload)
+        else:
+            kind, data = KIND_TEXT, json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+
+        stream_id = self._stream_ids.get(stream)
+        if stream_id is None:
+            stream_id = len(self._stream_ids)
+            self._stream_ids[stream] = stream_id
+        self._chunk_streams.add(stream_id)
+
+        buffer = self._buffer
+        buffer += FRAME_HEADER.pack(timestamp_ns, stream_id, kind, len(data))
+        buffer += data
+        if self._frame_count == 0:
+            self._first_ts = timestamp_ns
+            self._chunk_started = time.monotonic()
+        self._last_ts = timestamp_ns
+        self._frame_count += 1
+        self.frames_recorded += 1
+        self.bytes_recorded += len(data)
+
+        if len(buffer) >= self.chunk_bytes or time.monotonic() - self._chunk_started >= self.flush_interval:
+            self.flush()
+
+    def flush(self, wait: bool = False) -> None:
+        """Hand the current chunk to the writer thread."""
+        if self._frame_count:
+            names = {stream_id: name for name, stream_id in self._stream_ids.items()}
+            table = bytearray()
+            for stream_id in sorted(self._chunk_streams):
+                encoded = names[stream_id].encode("utf-8")
+                table += STREAM_ENTRY.pack(stream_id, len(encoded))
+                table += encoded
+            job = (
+                bytes(table), bytes(self._buffer), len(self._chunk_streams),
+                self._frame_count, self._first_ts, self._last_ts,
+            )
+            self._reset_chunk()
+            self._pending = self._executor.submit(self._write_chunk, *job)
+        if wait and self._pending is not None:
+            self._pending.result()
+
+    def close(self) -> None:
+        """Flush buffered frames and close the files."""
+        if self._closed:
+            return
+        self.flush(wait=True)
+        self._closed = True
+        self._executor.shutdown(wait=True)
+        self._file.close()
+        self._index_file.close()
+
+    def __enter__(self) -> "FeedRecorder":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _reset_chunk(self) -> None:
+        self._buffer = bytearray()
+        self._chunk_streams: set = set()
+        self._frame_count = 0
+        self._first_ts = 0
+        self._last_ts = 0
+        self._chunk_started = time.monotonic()
+
+    def _write_chunk(
+        self,
+        table: bytes,
+        frames: bytes,
+        stream_count: int,
+        frame_count: int,
+        first_ts: int,
+        last_ts: int,
+    ) -> None:
+        raw = table + frames
+        if self.compression_level > 0:
+            codec, stored = CODEC_ZLIB, zlib.compress(raw, self.compression_level)
+        else:
+            codec, stored = CODEC_NONE, raw
+
+        offset = self._file.tell()
+        self._file.write(CHUNK_HEADER.pack(
+            CHUNK_MAGIC, codec, stream_count, frame_count, len(raw), len(stored), first_ts, last_ts,
+        ))
+        self._file.write(stored)
+        self._file.flush()
+        # Index entry only after the chunk is on disk
+        self._index_file.write(INDEX_ENTRY.pack(offset, len(stored), frame_count, first_ts, last_ts))
+        self._index_file.flush()
+
+    # ------------------------------------------------------------------
+    # Construction helpers
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_env(cls, venue: str, **kwargs: Any) -> Optional["FeedRecorder"]:
+        """
+        Create a recorder under ``$WS_RECORD_DIR`` when recording is enabled.
+
+        Files are named ``<venue>_<YYYYmmdd_HHMMSS>_<pid>.mdrec``.
+        """
+        directory = os.getenv(RECORD_DIR_ENV)
+        if not directory:
+            return None
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return cls(Path(directory) / f"{venue.lower()}_{stamp}_{os.getpid()}{RECORD_FILE_SUFFIX}", **kwargs)
+
+
+class FeedReader:
+    """Random-access reader for recordings written by FeedRecorder."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        if size < len(FILE_MAGIC):
+            raise FeedRecordingError(f"{self.path} is not a feed recording")
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._data[:len(FILE_MAGIC)] != FILE_MAGIC:
+            self.close()
+            raise FeedRecordingError(f"{self.path} is not a feed recording")
+
+        self._index_map: Optional[mmap.mmap] = None
+        self._index_file = None
+        self.chunks: List[ChunkIndexEntry] = self._load_index()
+        self._first_ts = [entry.first_ts_ns for entry in self.chunks]
+
+    def _load_index(self) -> List[ChunkIndexEntry]:
+        index_path = index_path_for(self.path)
+        if index_path.exists() and index_path.stat().st_size > len(INDEX_MAGIC):
+            self._index_file = open(index_path, "rb")
+            self._index_map = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+            if self._index_map[:len(INDEX_MAGIC)] == INDEX_MAGIC:
+                count = (len(self._index_map) - len(INDEX_MAGIC)) // INDEX_ENTRY.size
+                entries = [
+                    ChunkIndexEntry(*INDEX_ENTRY.unpack_from(self._index_map, len(INDEX_MAGIC) + i * INDEX_ENTRY.size))
+                    for i in range(count)
+                ]
+                # Drop entries pointing past the data actually on disk
+                return [e for e in entries if e.offset + CHUNK_HEADER.size + e.stored_len <= len(self._data)]
+        return list(_scan_chunks(self.path, self._data))
+
+    @property
+    def frame_count(self) -> int:
+        return sum(entry.frame_count for entry in self.chunks)
+
+    @property
+    def start_ns(self) -> Optional[int]:
+        return self.chunks[0].first_ts_ns if self.chunks else None
+
+    @property
+    def end_ns(self) -> Optional[int]:
+        return max((entry.last_ts_ns for entry in self.chunks), default=None)
+
+    def streams(self) -> List[str]:
+        """Names of all streams present in the recording."""
+        names = set()
+        for entry in self.chunks:
+            names.update(self._decode_chunk(entry)[2].values())
+        return sorted(names)
+
+    def iter_frames(
+        self,
+        start_ns: Optional[int] = None,
+        end_ns: Optional[int] = None,
+        streams: Optional[Iterable[str]] = None,
+    ) -> Iterator[RecordedFrame]:
+        """Yield frames in recording order, optionally limited to a time range / streams."""
+        wanted = set(streams) if streams else None
+        first_chunk = 0
+        if start_ns is not None and self.chunks:
+            first_chunk = max(0, bisect.bisect_right(self._first_ts, start_ns) - 1)
+
+        for entry in self.chunks[first_chunk:]:
+            if end_ns is not None and entry.first_ts_ns > end_ns:
+                break
+            if start_ns is not None and entry.last_ts_ns < start_ns:
+                continue
+            raw, position, names = self._decode_chunk(entry)
+            end = len(raw)
+            while position < end:
+                ts, stream_id, kind, length = FRAME_HEADER.unpack_from(raw, position)
+                position += FRAME_HEADER.size
+                if (start_ns is not None and ts < start_ns) or (end_ns is not None and ts > end_ns):
+                    position += length
+                    continue
+                stream = names[stream_id]
+                if wanted is not None and stream not in wanted:
+                    position += length
+                    continue
+                data = raw[position:position + length]
+                position += length
+                yield RecordedFrame(ts, stream, data.decode("utf-8") if kind == KIND_TEXT else bytes(data))
+
+    def __iter__(self) -> Iterator[RecordedFrame]:
+        return self.iter_frames()
+
+    def close(self) -> None:
+        for handle in (self._index_map, self._index_file, getattr(self, "_data", None), self._file):
+            if handle is not None:
+                try:
+                    handle.close()
+                except Exception:
+                    pass
+
+    def __enter__(self) -> "FeedReader":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _decode_chunk(self, entry: ChunkIndexEntry) -> Tuple[bytes, int, Dict[int, str]]:
+        """Return (raw payload, offset of the first frame, stream id -> name)."""
+        magic, codec, stream_count, _, raw_len, stored_len, _, _ = CHUNK_HEADER.unpack_from(self._data, entry.offset)
+        if magic != CHUNK_MAGIC:
+            raise FeedRecordingError(f"Corrupt chunk at offset {entry.offset} in {self.path}")
+        start = entry.offset + CHUNK_HEADER.size
+        stored = self._data[start:start + stored_len]
+        raw = zlib.decompress(stored) if codec == CODEC_ZLIB else stored
+        if len(raw) != raw_len:
+            raise FeedRecordingError(f"Chunk at offset {entry.offset} has unexpected length")
+
+        names: Dict[int, str] = {}
+        position = 0
+        for _ in range(stream_count):
+            stream_id, name_len = STREAM_ENTRY.unpack_from(raw, position)
+            position += STREAM_ENTRY.size
+            names[stream_id] = bytes(raw[position:position + name_len]).decode("utf-8")
+            position += name_len
+        return raw, position, names
+
+
+@dataclass
+class ReplayStats:
+    frames: int = 0
+    dispatched: int = 0
+    skipped: int = 0
+    errors: int = 0
+    elapsed_seconds: float = 0.0
+    recorded_seconds: float = 0.0
+    per_stream: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def frames_per_second(self) -> float:
+        return self.frames / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+ReplayHandler = Callable[[Union[str, bytes]], Optional[Awaitable[Any]]]
+
+
+class FeedReplayer:
+    """
+    Feed recorded frames back into websocket message handlers.
+
+    ``handlers`` maps stream name to the callable that processes that stream's
+    raw frames (see ``BaseWebSocketManager.get_replay_handlers()``). Frames for
+    streams without a handler are skipped.
+    """
+
+    def __init__(
+        self,
+        reader: FeedReader,
+        handlers: Dict[str, ReplayHandler],
+        speed: Optional[float] = 1.0,
+        logger: Any = None,
+    ) -> None:
+        """
+        Args:
+            reader: Open recording
+            handlers: Stream name -> frame handler (sync or async)
+            speed: Playback speed multiplier (1.0 = recorded pace, None/0 = as fast as possible)
+            logger: Optional unified_logger-style logger for handler errors
+        """
+        self.reader = reader
+        self.handlers = handlers
+        self.speed = speed if speed and speed > 0 else None
+        self.logger = logger
+
+    async def run(
+        self,
+        start_ns: Optional[int] = None,
+        end_ns: Optional[int] = None,
+    ) -> ReplayStats:
+        stats = ReplayStats()
+        handlers = self.handlers
+        first_ts: Optional[int] = None
+        last_ts = 0
+        started = time.perf_counter()
+
+        for frame in self.reader.iter_frames(start_ns=start_ns, end_ns=end_ns):
+            stats.frames += 1
+            if first_ts is None:
+                first_ts = frame.timestamp_ns
+            last_ts = frame.timestamp_ns
+
+            if self.speed is not None:
+                delay = (frame.timestamp_ns - first_ts) / 1e9 / self.speed - (time.perf_counter() - started)
+                if delay > 0.001:
+                    await asyncio.sleep(delay)
+
+            handler = handlers.get(frame.stream)
+            if handler is None:
+                stats.skipped += 1
+                continue
+            try:
+                result = handler(frame.payload)
+                if inspect.isawaitable(result):
+                    await result
+                stats.dispatched += 1
+                stats.per_stream[frame.stream] = stats.per_stream.get(frame.stream, 0) + 1
+            except Exception as exc:
+                stats.errors += 1
+                if self.logger and hasattr(self.logger, "log"):
+                    self.logger.log(f"Replay handler error on stream '{frame.stream}': {exc}", "ERROR")
+
+        stats.elapsed_seconds = time.perf_counter() - started
+        if first_ts is not None:
+            stats.recorded_seconds = (last_ts - first_ts) / 1e9
+        return stats
+
+
+def index_path_for(path: Union[str, Path]) -> Path:
+    path = Path(path)
+    return path.with_name(path.name + ".idx")
+
+
+def _scan_chunks(path: Path, data: Optional[mmap.mmap] = None) -> Iterator[ChunkIndexEntry]:
+    """Rebuild the chunk index by walking chunk headers; stops at a truncated tail."""
+    owned = data is None
+    handle = None
+    if owned:
+        handle = open(path, "rb")
+        if os.fstat(handle.fileno()).st_size <= len(FILE_MAGIC):
+            handle.close()
+            return
+        data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        offset = len(FILE_MAGIC)
+        size = len(data)
+        while offset + CHUNK_HEADER.size <= size:
+            magic, _, _, frame_count, _, stored_len, first_ts, last_ts = CHUNK_HEADER.unpack_from(data, offset)
+            if magic != CHUNK_MAGIC or offset + CHUNK_HEADER.size + stored_len > size:
+                break
+            yield ChunkIndexEntry(offset, stored_len, frame_count, first_ts, last_ts)
+            offset += CHUNK_HEADER.size + stored_len
+    finally:
+        if owned:
+            data.close()
+            handle.close()
@@ -0,0 +1,469 @@
+"""
+Shared-memory order book rings for host-wide public market data.
+
+One process (``MarketDataDaemon``) owns the public websocket feeds and writes
+BBO plus top-N depth for each (venue, symbol) into a named shared-memory
+segment. Strategy processes attach read-only and read the latest book straight
+out of the mapping, so N account processes share one set of public
+subscriptions instead of each keeping its own.
+
+Segment layout::
+
+    HEADER                       # magic, version, levels, slots, head, feed symbol, alive_at
+    slot[slots]
+    slot := SLOT_HEADER + (price, size)[levels] bids + (price, size)[levels] asks
+
+Each publish goes to the slot after ``head`` and is guarded seqlock-style: the
+slot's ``seq`` is made odd before the payload is written and even afterwards,
+then ``head`` is advanced. Readers copy a slot and retry if ``seq`` was odd or
+changed while copying, which only happens when the writer laps the whole ring
+during a read.
+
+Each frame keeps the venue book's own update time. Liveness is tracked
+separately in the header's ``alive_at``, which the daemon stamps while the
+venue's public socket is connected, so a quiet but healthy market is not
+mistaken for a dead feed.
+
+Usage:
+    >>> writer = SharedBookWriter.create("lighter", "BTC", levels=10)
+    >>> writer.publish([(100.0, 1.5)], [(100.5, 2.0)], sequence=42)
+    >>>
+    >>> reader = SharedBookReader.attach("lighter", "BTC")
+    >>> frame = reader.read()
+    >>> frame.best_bid, frame.best_ask
+    (100.0, 100.5)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import re
+import struct
+import time
+from decimal import Decimal
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from exchange_clients.base_websocket import BaseWebSocketManager, BBOData
+
+SHARED_MARKET_DATA_ENV = "SHARED_MARKET_DATA"
+
+SEGMENT_MAGIC = b"MDBOOK\x00\x01"
+SEGMENT_VERSION = 2
+SEGMENT_PREFIX = "mdbook"
+
+DEFAULT_LEVELS = 10
+DEFAULT_SLOTS = 8
+# A ring not confirmed alive for this long is treated as unavailable (the daemon heartbeats every second)
+DEFAULT_MAX_AGE_SECONDS = 3.0
+
+# magic, version, levels, slots, head, venue feed symbol (as emitted in the venue's BBOData), alive_at
+HEADER = struct.Struct("<8sIII4xQ32sd")
+HEAD_OFFSET = 24
+FEED_SYMBOL = struct.Struct("<32s")
+FEED_SYMBOL_OFFSET = 32
+ALIVE_AT = struct.Struct("<d")
+ALIVE_AT_OFFSET = 64
+# seq, wall-clock timestamp, exchange sequence (-1 when unknown), bid count, ask count
+SLOT_HEADER = struct.Struct("<QdqII")
+
+MAX_READ_ATTEMPTS = 64
+
+
+class SharedBookError(RuntimeError):
+    """Raised when a shared book segment is missing or malformed."""
+
+
+def segment_name(venue: str, symbol: str) -> str:
+    """Shared-memory segment name for a venue/symbol pair (e.g. ``mdbook_lighter_BTC``)."""
+    safe_symbol = re.sub(r"[^A-Za-z0-9]", "", symbol.upper())
+    return f"{SEGMENT_PREFIX}_{venue.lower()}_{safe_symbol}"
+
+
+def shared_market_data_enabled() -> bool:
+    """True when ``$SHARED_MARKET_DATA`` asks strategy processes to read books from the daemon."""
+    return os.getenv(SHARED_MARKET_DATA_ENV, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _slot_size(levels: int) -> int:
+    return SLOT_HEADER.size + levels * 4 * 8
+
+
+class BookFrame:
+    """One book snapshot copied out of a shared ring slot."""
+
+    __slots__ = ("timestamp", "sequence", "bids", "asks", "version")
+
+    def __init__(
+        self,
+        timestamp: float,
+        sequence: Optional[int],
+        bids: List[Tuple[float, float]],
+        asks: List[Tuple[float, float]],
+        version: int,
+    ) -> None:
+        self.timestamp = timestamp
+        self.sequence = sequence
+        self.bids = bids
+        self.asks = asks
+        self.version = version
+
+    @property
+    def best_bid(self) -> Optional[float]:
+        return self.bids[0][0] if self.bids else None
+
+    @property
+    def best_ask(self) -> Optional[float]:
+        return self.asks[0][0] if self.asks else None
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.timestamp
+
+    def to_order_book(self, levels: Optional[int] = None) -> Dict[str, List[Dict[str, Decimal]]]:
+        """Book in the ``get_order_book`` format shared by all websocket managers."""
+        bids = self.bids[:levels] if levels else self.bids
+        asks = self.asks[:levels] if levels else self.asks
+        return {
+            "bids": [{"price": Decimal(str(price)), "size": Decimal(str(size))} for price, size in bids],
+            "asks": [{"price": Decimal(str(price)), "size": Decimal(str(size))} for price, size in asks],
+        }
+
+
+class SharedBookWriter:
+    """Single writer for one venue/symbol ring. Only the daemon creates these."""
+
+    def __init__(self, segment: shared_memory.SharedMemory, levels: int, slots: int) -> None:
+        self._shm = segment
+        self._buf = segment.buf
+        self.levels = levels
+        self.slots = slots
+        self._slot_size = _slot_size(levels)
+        self._levels_format = struct.Struct(f"<{levels * 4}d")
+        self._head = 0
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @classmethod
+    def create(
+        cls,
+        venue: str,
+        symbol: str,
+        *,
+        levels: int = DEFAULT_LEVELS,
+        slots: int = DEFAULT_SLOTS,
+    ) -> "SharedBookWriter":
+        """Create (or take over a stale) segment for ``venue``/``symbol``."""
+        name = segment_name(venue, symbol)
+        size = HEADER.size + slots * _slot_size(levels)
+        try:
+            segment = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # Left behind by a daemon that did not shut down cleanly
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            segment = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+        segment.buf[:size] = bytes(size)
+        HEADER.pack_into(segment.buf, 0, SEGMENT_MAGIC, SEGMENT_VERSION, levels, slots, 0, b"", 0.0)
+        return cls(segment, levels, slots)
+
+    def set_feed_symbol(self, symbol: str) -> None:
+        """Record the symbol the venue uses in its BBO updates so readers can re-emit it."""
+        FEED_SYMBOL.pack_into(self._buf, FEED_SYMBOL_OFFSET, symbol.encode()[:FEED_SYMBOL.size])
+
+    def mark_alive(self, timestamp: Optional[float] = None) -> None:
+        """Confirm the feed is connected as of ``timestamp`` (now by default)."""
+        ALIVE_AT.pack_into(self._buf, ALIVE_AT_OFFSET, time.time() if timestamp is None else timestamp)
+
+    def publish(
+        self,
+        bids: Sequence[Tuple[float, float]],
+        asks: Sequence[Tuple[float, float]],
+        *,
+        timestamp: Optional[float] = None,
+        sequence: Optional[int] = None,
+    ) -> int:
+        """
+        Write one book snapshot and return its head counter.
+
+        Also stamps ``alive_at`` with the frame's timestamp: a book update is
+        itself proof the feed was alive at that time.
+        """
+        levels = self.levels
+        nbids = min(len(bids), levels)
+        nasks = min(len(asks), levels)
+        values = [0.0] * (levels * 4)
+        for i in range(nbids):
+            values[2 * i] = float(bids[i][0])
+            values[2 * i + 1] = float(bids[i][1])
+        ask_base = levels * 2
+        for i in range(nasks):
+            values[ask_base + 2 * i] = float(asks[i][0])
+            values[ask_base + 2 * i + 1] = float(asks[i][1])
+
+        stamp = time.time() if timestamp is None else timestamp
+        head = self._head + 1
+        offset = HEADER.size + (head % self.slots) * self._slot_size
+        buf = self._buf
+        seq = struct.unpack_from("<Q", buf, offset)[0] + 1
+        # Odd seq marks the slot as being written
+        struct.pack_into("<Q", buf, offset, seq)
+        SLOT_HEADER.pack_into(
+            buf,
+            offset,
+            seq,
+            stamp,
+            -1 if sequence is None else int(sequence),
+            nbids,
+            nasks,
+        )
+        self._levels_format.pack_into(buf, offset + SLOT_HEADER.size, *values)
+        struct.pack_into("<Q", buf, offset, seq + 1)
+        struct.pack_into("<Q", buf, HEAD_OFFSET, head)
+        ALIVE_AT.pack_into(buf, ALIVE_AT_OFFSET, stamp)
+        self._head = head
+        return head
+
+    def close(self, unlink: bool = True) -> None:
+        """Release the mapping; ``unlink`` removes the segment for all readers."""
+        self._buf = None
+        self._shm.close()
+        if unlink:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class SharedBookReader:
+    """Read-only view of a ring written by SharedBookWriter."""
+
+    def __init__(self, segment: shared_memory.SharedMemory) -> None:
+        self._shm = segment
+        self._buf = segment.buf
+        magic, version, levels, slots, _, _, _ = HEADER.unpack_from(self._buf, 0)
+        if magic != SEGMENT_MAGIC or version != SEGMENT_VERSION:
+            self.close()
+            raise SharedBookError(f"{segment.name} is not a shared book segment")
+        self.levels = levels
+        self.slots = slots
+        self._slot_size = _slot_size(levels)
+        self._levels_format = struct.Struct(f"<{levels * 4}d")
+        self.torn_reads = 0
+
+    @classmethod
+    def attach(cls, venue: str, symbol: str) -> "SharedBookReader":
+        """Attach to the daemon's segment; raises SharedBookError when it is not published."""
+        name = segment_name(venue, symbol)
+        try:
+            segment = shared_memory.SharedMemory(name=name)
+        except FileNotFoundError as exc:
+            raise SharedBookError(f"No shared book published for {venue}:{symbol}") from exc
+        try:
+            # Readers must not unlink the daemon's segment when they exit
+            resource_tracker.unregister(segment._name, "shared_memory")  # type: ignore[attr-defined]
+        except Exception:
+            pass
+        return cls(segment)
+
+    @property
+    def head(self) -> int:
+        """Publish counter; changes whenever the writer publishes a new frame."""
+        return struct.unpack_from("<Q", self._buf, HEAD_OFFSET)[0]
+
+    @property
+    def feed_symbol(self) -> Optional[str]:
+        raw = FEED_SYMBOL.unpack_from(self._buf, FEED_SYMBOL_OFFSET)[0].rstrip(b"\x00")
+        return raw.decode() if raw else None
+
+    @property
+    def alive_at(self) -> float:
+        """Wall-clock time the daemon last confirmed the feed alive (0.0 before the first stamp)."""
+        return ALIVE_AT.unpack_from(self._buf, ALIVE_AT_OFFSET)[0]
+
+    def read(self) -> Optional[BookFrame]:
+        """Copy the latest frame out of the ring, or None if nothing was published yet."""
+        buf = self._buf
+        for _ in range(MAX_READ_ATTEMPTS):
+            head = struct.unpack_from("<Q", buf, HEAD_OFFSET)[0]
+            if head == 0:
+                return None
+            offset = HEADER.size + (head % self.slots) * self._slot_size
+            seq, timestamp, sequence, nbids, nasks = SLOT_HEADER.unpack_from(buf, offset)
+            if seq & 1:
+                self.torn_reads += 1
+                continue
+            values = self._levels_format.unpack_from(buf, offset + SLOT_HEADER.size)
+            if struct.unpack_from("<Q", buf, offset)[0] != seq:
+                self.torn_reads += 1
+                continue
+            ask_base = self.levels * 2
+            return BookFrame(
+                timestamp=timestamp,
+                sequence=None if sequence < 0 else sequence,
+                bids=[(values[2 * i], values[2 * i + 1]) for i in range(nbids)],
+                asks=[(values[ask_base + 2 * i], values[ask_base + 2 * i + 1]) for i in range(nasks)],
+                version=head,
+            )
+        return None
+
+    def close(self) -> None:
+        self._buf = None
+        self._shm.close()
+
+
+class SharedBookWebSocketManager(BaseWebSocketManager):
+    """
+    BaseWebSocketManager backed by the market-data daemon's shared rings.
+
+    Exposes the same public-book surface as the venue managers (``best_bid``,
+    ``best_ask``, ``get_order_book``, BBO listeners) without opening any
+    websocket. A poll task watches the ring head and fans new frames out to
+    listeners and to the ``forward_to`` managers, so code registered on the
+    venue manager (e.g. PriceStream) keeps receiving BBO updates. Private
+    order/account streams stay on the venue manager.
+    """
+
+    def __init__(
+        self,
+        venue: str,
+        *,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+        poll_interval: float = 0.005,
+    ) -> None:
+        super().__init__()
+        self.venue = venue.lower()
+        self.symbol: Optional[str] = None
+        self.max_age_seconds = max_age_seconds
+        self.poll_interval = poll_interval
+        self._reader: Optional[SharedBookReader] = None
+        self._frame: Optional[BookFrame] = None
+        self._forward: List[BaseWebSocketManager] = []
+        self._poll_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_env(cls, venue: str, **kwargs: Any) -> Optional["SharedBookWebSocketManager"]:
+        """Create an adapter when ``$SHARED_MARKET_DATA`` is enabled (None otherwise)."""
+        if not shared_market_data_enabled():
+            return None
+        return cls(venue, **kwargs)
+
+    def _log(self, message: str, level: str = "INFO") -> None:
+        if self.logger and hasattr(self.logger, "log"):
+            self.logger.log(message, level)
+
+    def forward_to(self, manager: Optional[BaseWebSocketManager]) -> None:
+        """Also deliver BBO updates to ``manager``'s listeners."""
+        if manager is not None and manager is not self and manager not in self._forward:
+            self._forward.append(manager)
+
+    async def connect(self) -> None:
+        self.running = True
+        if self._poll_task is None or self._poll_task.done():
+            self._poll_task = asyncio.create_task(self._poll_loop())
+
+    async def disconnect(self) -> None:
+        self.running = False
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            try:
+                await self._poll_task
+            except asyncio.CancelledError:
+                pass
+            self._poll_task = None
+        self._detach()
+
+    def _detach(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+        self._reader = None
+        self._frame = None
+        self._latest_bbo = None
+
+    async def prepare_market_feed(self, symbol: Optional[str], timeout: float = 2.0) -> None:
+        """Attach to ``symbol``'s ring and wait briefly for a live frame."""
+        if not symbol:
+            return
+        if self.symbol != symbol.upper() or self._reader is None:
+            self._detach()
+            self.symbol = symbol.upper()
+            try:
+                self._reader = SharedBookReader.attach(self.venue, self.symbol)
+            except SharedBookError as exc:
+                self._log(f"[{self.venue.upper()}] Shared book unavailable: {exc}", "DEBUG")
+                return
+
+        if not self.running:
+            await self.connect()
+
+        deadline = time.monotonic() + timeout
+        while not self.is_live() and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+
+    def snapshot(self) -> Optional[BookFrame]:
+        """
+        Latest frame while the ring is live.
+
+        The ring is live when the daemon confirmed the feed within
+        ``max_age_seconds``; the frame itself may be older when the market is
+        quiet.
+        """
+        reader = self._reader
+        if reader is None:
+            return None
+        frame = self._frame
+        if frame is None or frame.version != reader.head:
+            frame = reader.read()
+            self._frame = frame
+        if frame is None or time.time() - reader.alive_at > self.max_age_seconds:
+            return None
+        return frame
+
+    def levels_available(self) -> int:
+        """Depth per side held in the attached ring (0 when detached)."""
+        return self._reader.levels if self._reader is not None else 0
+
+    def is_live(self) -> bool:
+        frame = self.snapshot()
+        return frame is not None and frame.best_bid is not None and frame.best_ask is not None
+
+    @property
+    def best_bid(self) -> Optional[float]:
+        frame = self.snapshot()
+        return frame.best_bid if frame else None
+
+    @property
+    def best_ask(self) -> Optional[float]:
+        frame = self.snapshot()
+        return frame.best_ask if frame else None
+
+    def get_order_book(self, levels: Optional[int] = None) -> Optional[Dict[str, List[Dict[str, Decimal]]]]:
+        frame = self.snapshot()
+        if frame is None:
+            return None
+        return frame.to_order_book(levels)
+
+    async def _poll_loop(self) -> None:
+        last_version = 0
+        while self.running:
+            reader = self._reader
+            if reader is not None and reader.head != last_version:
+                frame = self.snapshot()
+                if frame is not None and frame.best_bid is not None and frame.best_ask is not None:
+                    last_version = frame.version
+                    bbo = BBOData(
+                        symbol=reader.feed_symbol or self.symbol or "",
+                        bid=Decimal(str(frame.best_bid)),
+                        ask=Decimal(str(frame.best_ask)),
+                        timestamp=frame.timestamp,
+                        sequence=frame.sequence,
+                    )
+                    await self._notify_bbo_update(bbo)
+                    for manager in list(self._forward):
+                        await manager._notify_bbo_update(bbo)
+            await asyncio.sleep(self.poll_interval)
@@ -0,0 +1,215 @@
+"""
+Order state cache fed by private websocket streams.
+
+Every exchange client keeps its latest ``OrderInfo`` per order id in
+``client._latest_orders``. ``OrderStateCache`` is a drop-in ``dict`` for that
+store which also tracks when each order last changed, the last sequence number
+seen per order, and whether the private stream is live. Order managers use
+``fresh()`` to decide whether the cached state can be trusted or a REST
+``get_order_info`` call is needed: only for unknown orders, orders whose
+state is older than ``max_open_age`` while still open, or after a sequence gap
+or stream drop marked them stale.
+
+Reconciliation loops ``await wait_for_update()`` instead of sleeping between
+REST polls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+TERMINAL_STATUSES = frozenset({"FILLED", "CANCELED", "CANCELLED", "CLOSED", "REJECTED", "EXPIRED"})
+
+DEFAULT_MAX_OPEN_AGE_SECONDS = 30.0
+
+
+def is_terminal(info: Any) -> bool:
+    return str(getattr(info, "status", "") or "").upper() in TERMINAL_STATUSES
+
+
+class OrderStateCache(dict):
+    """``Dict[str, OrderInfo]`` with freshness, sequencing and update notification."""
+
+    def __init__(
+        self,
+        max_open_age: float = DEFAULT_MAX_OPEN_AGE_SECONDS,
+        stream_live: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        super().__init__()
+        self.max_open_age = max_open_age
+        self._stream_live = stream_live
+        self._updated_at: Dict[str, float] = {}
+        self._sequences: Dict[str, Any] = {}
+        self._stale: Set[str] = set()
+        self._waiters: Dict[str, List[asyncio.Future]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.dropped_updates = 0
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def __setitem__(self, key: Any, info: Any) -> None:
+        key = str(key)
+        super().__setitem__(key, info)
+        self._updated_at[key] = time.monotonic()
+        self._stale.discard(key)
+        self._wake(key)
+
+    def __delitem__(self, key: Any) -> None:
+        key = str(key)
+        super().__delitem__(key)
+        self._forget(key)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        key = str(key)
+        self._forget(key)
+        return super().pop(key, *default)
+
+    def clear(self) -> None:
+        super().clear()
+        self._updated_at.clear()
+        self._sequences.clear()
+        self._stale.clear()
+
+    def _forget(self, key: str) -> None:
+        self._updated_at.pop(key, None)
+        self._sequences.pop(key, None)
+        self._stale.discard(key)
+
+    def apply(self, order_id: Any, info: Any, sequence: Any = None, aliases: Iterable[Any] = ()) -> bool:
+        """
+        Store a websocket update unless it is older than what is cached.
+
+        Updates carrying a lower ``sequence`` than the last one seen for the
+        order, or moving a terminal order back to a live state, arrived out of
+        order and are dropped.
+
+        Returns:
+            True if the update was stored.
+        """
+        key = str(order_id)
+        existing = self.get(key)
+        last_sequence = self._sequences.get(key)
+        if sequence is not None and last_sequence is not None:
+            try:
+                if sequence < last_sequence:
+                    self.dropped_updates += 1
+                    return False
+            except TypeError:
+                pass
+        if existing is not None and is_terminal(existing) and not is_terminal(info) and sequence is None:
+            self.dropped_updates += 1
+            return False
+
+        for alias in (key, *(str(a) for a in aliases if a is not None)):
+            self[alias] = info
+            if sequence is not None:
+                self._sequences[alias] = sequence
+        return True
+
+    # ------------------------------------------------------------------
+    # Staleness
+    # ------------------------------------------------------------------
+
+    def set_stream_live_check(self, check: Optional[Callable[[], bool]]) -> None:
+        self._stream_live = check
+
+    @property
+    def stream_live(self) -> bool:
+        if self._stream_live is None:
+            return False
+        try:
+            return bool(self._stream_live())
+        except Exception:
+            return False
+
+    def mark_stale(self, order_id: Any = None) -> None:
+        """Force the next read of one (or every live) order to go to REST, e.g. after a sequence gap or reconnect."""
+        if order_id is not None:
+            self._stale.add(str(order_id))
+            return
+        self._stale.update(key for key, info in self.items() if not is_terminal(info))
+
+    def age(self, order_id: Any) -> Optional[float]:
+        updated = self._updated_at.get(str(order_id))
+        return time.monotonic() - updated if updated is not None else None
+
+    def fresh(self, order_id: Any) -> Optional[Any]:
+        """
+        Cached state if it can be trusted without asking the exchange.
+
+        Terminal orders are always served. Live orders are served while the
+        private stream is connected, the entry isn't marked stale and it
+        changed within ``max_open_age``. Returns None when REST is required.
+        """
+        key = str(order_id)
+        info = self.get(key)
+        if info is None:
+            self.misses += 1
+            return None
+        if is_terminal(info):
+            self.hits += 1
+            return info
+        if not self.stream_live:
+            # Updates may be missed while the stream is down: re-verify everything live
+            self.mark_stale()
+            self.misses += 1
+            return None
+        age = self.age(key)
+        if key in self._stale or age is None or age > self.max_open_age:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return info
+
+    # ------------------------------------------------------------------
+    # Notification
+    # ------------------------------------------------------------------
+
+    def _wake(self, key: str) -> None:
+        waiters = self._waiters.pop(key, None)
+        if not waiters:
+            return
+        for future in waiters:
+            if not future.done():
+                future.set_result(None)
+
+    async def wait_for_update(self, order_id: Any, timeout: float) -> Optional[Any]:
+        """Wait up to ``timeout`` for the order's next update; returns the cached state either way."""
+        key = str(order_id)
+        info = self.get(key)
+        if info is not None and is_terminal(info):
+            return info
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(key, []).append(future)
+        try:
+            await asyncio.wait_for(future, timeout=max(timeout, 0.0))
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            waiters = self._waiters.get(key)
+            if waiters and future in waiters:
+                waiters.remove(future)
+                if not waiters:
+                    self._waiters.pop(key, None)
+        return self.get(key)
+
+
+def store_order_update(latest_orders: Dict[str, Any], order_id: Any, info: Any, sequence: Any = None) -> bool:
+    """Record a websocket order update into a client's order store (plain dicts just assign)."""
+    if isinstance(latest_orders, OrderStateCache):
+        return latest_orders.apply(order_id, info, sequence=sequence)
+    latest_orders[str(order_id)] = info
+    return True
+
+
+def fresh_order_state(latest_orders: Dict[str, Any], order_id: Any) -> Optional[Any]:
+    """Cached order state that needs no REST refresh (plain dicts: terminal states only)."""
+    if isinstance(latest_orders, OrderStateCache):
+        return latest_orders.fresh(order_id)
+    info = latest_orders.get(str(order_id))
+    return info if info is not None and is_terminal(info) else None
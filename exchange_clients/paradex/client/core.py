@@ -17,6 +17,7 @@ from exchange_clients.base_models import (
     TradeData,
     validate_credentials,
 )
+from exchange_clients.order_state_cache import OrderStateCache
 from exchange_clients.paradex.common import normalize_symbol, get_paradex_symbol_format
 from helpers.unified_logger import get_exchange_logger
 
@@ -96,6 +97,8 @@ def patch_paradex_http_client():
 class ParadexClient(BaseExchangeClient):
     """Paradex exchange client implementation."""
 
+    SHARED_METADATA_ATTRS = ("_contract_id_cache", "_min_order_notional")
+
     def __init__(
         self,
         config: Dict[str, Any],
@@ -152,7 +155,7 @@ class ParadexClient(BaseExchangeClient):
         self.ws_manager: Optional[ParadexWebSocketManager] = None
         
         # Order tracking
-        self._latest_orders: Dict[str, OrderInfo] = {}
+        self._latest_orders: Dict[str, OrderInfo] = OrderStateCache(stream_live=self._order_stream_live)
         self._min_order_notional: Dict[str, Decimal] = {}
         
         # Contract ID cache (for multi-symbol trading)
@@ -276,6 +279,7 @@ class ParadexClient(BaseExchangeClient):
             
             # Set logger for WebSocket manager
             self.ws_manager.set_logger(self.logger)
+            self._watch_order_stream(self.ws_manager)
             
             # Update market_data to use ws_manager
             self.market_data.set_ws_manager(self.ws_manager)
@@ -290,6 +294,7 @@ class ParadexClient(BaseExchangeClient):
     async def disconnect(self) -> None:
         """Disconnect from Paradex."""
         try:
+            await self.close_shared_book()
             if self.ws_manager:
                 await self.ws_manager.disconnect()
         except Exception as e:
@@ -308,6 +313,9 @@ class ParadexClient(BaseExchangeClient):
         """Fetch best bid and offer prices."""
         if not self.market_data:
             raise RuntimeError("Market data manager not initialized. Call connect() first.")
+        shared = self.shared_bbo()
+        if shared is not None:
+            return shared
         return await self.market_data.fetch_bbo_prices(contract_id)
 
     async def get_order_book_depth(
@@ -318,6 +326,9 @@ class ParadexClient(BaseExchangeClient):
         """Get order book depth for liquidity analysis."""
         if not self.market_data:
             raise RuntimeError("Market data manager not initialized. Call connect() first.")
+        shared = self.shared_order_book(levels)
+        if shared is not None:
+            return shared
         return await self.market_data.get_order_book_depth(contract_id, levels)
     
     async def get_contract_attributes(self) -> Tuple[str, Decimal]:
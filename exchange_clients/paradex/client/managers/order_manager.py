@@ -12,6 +12,7 @@ from typing import Any, Dict, List, Optional
 from tenacity import retry, stop_after_attempt, wait_fixed, retry_if_exception_type
 
 from exchange_clients.base_models import OrderInfo, OrderResult, query_retry
+from exchange_clients.order_state_cache import fresh_order_state
 from exchange_clients.paradex.client.utils.converters import build_order_info_from_paradex
 from exchange_clients.paradex.client.utils.helpers import to_decimal, normalize_order_side
 from exchange_clients.paradex.common import normalize_symbol
@@ -407,9 +408,11 @@ class ParadexOrderManager:
         Returns:
             OrderInfo with order details, or None if order not found
         """
-        # Check cache first (unless force_refresh)
-        if not force_refresh and order_id in self.latest_orders:
-            return self.latest_orders[order_id]
+        # Serve websocket state unless stale (stream down / too old while open)
+        if not force_refresh:
+            fresh = fresh_order_state(self.latest_orders, order_id)
+            if fresh is not None:
+                return fresh
         
         try:
             # Fetch order from API (synchronous SDK call in executor)
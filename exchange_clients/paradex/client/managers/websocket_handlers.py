@@ -10,6 +10,7 @@ from decimal import Decimal
 from typing import Any, Dict, Optional
 
 from exchange_clients.base_models import CancelReason, OrderInfo
+from exchange_clients.order_state_cache import store_order_update
 from exchange_clients.paradex.client.utils.converters import build_order_info_from_paradex
 from exchange_clients.paradex.client.utils.helpers import to_decimal, normalize_order_side
 
@@ -99,8 +100,11 @@ class ParadexWebSocketHandlers:
             previous_order = self.latest_orders.get(order_id)
             prev_filled = previous_order.filled_size if previous_order else Decimal("0")
             
-            # Update cache
-            self.latest_orders[order_id] = order_info
+            # Update cache (last_updated_at orders updates; stale ones are dropped)
+            if not store_order_update(
+                self.latest_orders, order_id, order_info, sequence=order_data.get('last_updated_at')
+            ):
+                return
             
             # Notify order manager that update was received (for await_order_update())
             if self.order_manager:
@@ -5,9 +5,10 @@ Orchestrates connection, order book, message handling, and market switching.
 """
 
 import asyncio
+import json
 from typing import Dict, Any, List, Optional, Callable, Awaitable
 
-from exchange_clients.base_websocket import BaseWebSocketManager, BBOData
+from exchange_clients.base_websocket import BaseWebSocketManager, BBOData, socket_is_open
 
 from .connection import ParadexWebSocketConnection
 from .order_book import ParadexOrderBook
@@ -117,6 +118,7 @@ class ParadexWebSocketManager(BaseWebSocketManager):
         
         self.running = True
         self.market_switcher.set_running(True)
+        self.start_recording_from_env("paradex")
         
         # Subscribe to initial market
         contract_id = getattr(self.config, 'contract_id', None)
@@ -126,6 +128,34 @@ class ParadexWebSocketManager(BaseWebSocketManager):
         if self.logger:
             self.logger.info("[PARADEX] 🔗 WebSocket connected and subscribed")
 
+    def private_stream_open(self) -> bool:
+        """SDK connection is up and, when the SDK exposes it, its socket is still open."""
+        if not self.connection.is_connected():
+            return False
+        ws = getattr(self.paradex_ws_client, "ws", None)
+        return ws is None or socket_is_open(ws)
+
+    def public_stream_open(self) -> bool:
+        """Book and BBO channels share the SDK connection with the private ones."""
+        return self.private_stream_open()
+
+    async def resume_public_book_feed(self, symbol: Optional[str]) -> None:
+        """Subscribe the book and BBO channels for the current market (prepare_market_feed skips it)."""
+        if self.public_book_feed:
+            return
+        self.public_book_feed = True
+        contract_id = self.market_switcher.current_contract_id
+        if not contract_id or not self.running:
+            await self.prepare_market_feed(symbol)
+            return
+        if self.logger:
+            self.logger.info(f"[PARADEX] Shared book stale, subscribing book channels for {contract_id} directly")
+        await self.market_switcher.subscribe_market(
+            contract_id=contract_id,
+            order_book_callback=self._handle_order_book_update,
+            bbo_callback=self._handle_bbo_update,
+        )
+
     async def disconnect(self) -> None:
         """Tear down websocket connections and cancel background tasks."""
         if not self.running:
@@ -141,6 +171,9 @@ class ParadexWebSocketManager(BaseWebSocketManager):
             if self.logger:
                 self.logger.error(f"Error closing WebSocket connection: {e}")
         
+        self._notify_private_stream_drop()
+        self.stop_recording()
+
         if self.logger:
             self.logger.info("[PARADEX] WebSocket disconnected")
 
@@ -174,8 +207,8 @@ class ParadexWebSocketManager(BaseWebSocketManager):
             old_contract_id = self.market_switcher.current_contract_id
             await self._perform_market_switch(old_contract_id, target_contract_id)
             
-            # Step 4: Wait for new data to arrive
-            success = await self._wait_for_market_ready(timeout=5.0)
+            # Step 4: Wait for new data to arrive (the shared daemon serves the book otherwise)
+            success = await self._wait_for_market_ready(timeout=5.0) if self.public_book_feed else True
             
             # Step 5: Log result
             order_book_size = {
@@ -211,12 +244,13 @@ class ParadexWebSocketManager(BaseWebSocketManager):
         self.market_switcher.update_market_config(new_contract_id)
 
     async def _subscribe_to_market(self, contract_id: str) -> None:
-        """Subscribe to all channels for a market."""
+        """Subscribe to all channels for a market (private ones only when the shared daemon serves books)."""
+        public = self.public_book_feed
         await self.market_switcher.subscribe_channels(
             contract_id=contract_id,
             order_callback=self._handle_order_update,
-            order_book_callback=self._handle_order_book_update,
-            bbo_callback=self._handle_bbo_update,
+            order_book_callback=self._handle_order_book_update if public else None,
+            bbo_callback=self._handle_bbo_update if public else None,
             fills_callback=self._handle_fill_update,
         )
 
@@ -237,10 +271,31 @@ class ParadexWebSocketManager(BaseWebSocketManager):
             await asyncio.sleep(0.1)
         return True
 
+    def get_replay_handlers(self) -> Dict[str, Callable[[Any], Awaitable[None]]]:
+        """
+        Recorded streams: ``orders``, ``order_book``, ``bbo`` and ``fills``.
+
+        The SDK delivers parsed dicts, so frames are recorded as JSON and
+        decoded again before being handed to the channel callbacks.
+        """
+        handlers = {
+            "orders": self._handle_order_update,
+            "order_book": self._handle_order_book_update,
+            "bbo": self._handle_bbo_update,
+            "fills": self._handle_fill_update,
+        }
+        return {
+            stream: (lambda payload, handler=handler: handler(None, json.loads(payload)))
+            for stream, handler in handlers.items()
+        }
+
     # WebSocket message handlers (delegated from SDK callbacks)
     
     async def _handle_order_update(self, ws_channel: Any, message: Dict[str, Any]) -> None:
         """Handle order update from WebSocket."""
+        self.note_private_message()
+        if self.recorder is not None:
+            self.recorder.record("orders", message)
         if self.order_update_callback:
             try:
                 # Extract order data from message
@@ -259,19 +314,22 @@ class ParadexWebSocketManager(BaseWebSocketManager):
 
     async def _handle_order_book_update(self, ws_channel: Any, message: Dict[str, Any]) -> None:
         """Handle order book update from WebSocket."""
+        if self.recorder is not None:
+            self.recorder.record("order_book", message)
         try:
             params = message.get('params', {})
             data = params.get('data', {})
-            market = data.get('market')
             
-            if market:
-                self.order_book.update_order_book(market, data)
+            if data.get('market'):
+                self.order_book.apply_message(self.order_book.decoder.book_from_data(data))
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Error handling order book update: {e}")
 
     async def _handle_bbo_update(self, ws_channel: Any, message: Dict[str, Any]) -> None:
         """Handle BBO (Best Bid/Offer) update from WebSocket."""
+        if self.recorder is not None:
+            self.recorder.record("bbo", message)
         try:
             import time
             
@@ -302,6 +360,9 @@ class ParadexWebSocketManager(BaseWebSocketManager):
 
     async def _handle_fill_update(self, ws_channel: Any, message: Dict[str, Any]) -> None:
         """Handle fill update from WebSocket (includes liquidations)."""
+        self.note_private_message()
+        if self.recorder is not None:
+            self.recorder.record("fills", message)
         try:
             params = message.get('params', {})
             data = params.get('data', {})
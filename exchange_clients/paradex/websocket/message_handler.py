@@ -12,6 +12,7 @@ import time
 from typing import Dict, Any, List, Optional, Callable, Awaitable
 
 from exchange_clients.base_websocket import BBOData
+from helpers.unified_logger import UnifiedLogger
 
 
 class ParadexMessageHandler:
@@ -160,7 +161,7 @@ class ParadexMessageHandler:
                 )
                 # Note: notify_bbo_update is async, but we can't await here
                 # The actual callback invocation happens in manager
-                if self.logger:
+                if self.logger and UnifiedLogger.is_enabled("DEBUG"):
                     self.logger.debug(
                         f"[PARADEX] BBO update for {market}: bid={bid}, ask={ask}"
                     )
@@ -2,6 +2,7 @@
 Order book state management for Paradex WebSocket.
 
 Handles order book updates, validation, BBO extraction, and state management.
+Levels are keyed by integer price units (see ``market_data.decoding``).
 """
 
 import asyncio
@@ -9,7 +10,8 @@ import time
 from typing import Dict, Any, List, Optional, Tuple
 from decimal import Decimal
 
-from exchange_clients.paradex.client.utils.helpers import to_decimal
+from exchange_clients.market_data.decoding import BookMessage, ParadexDecoder, units_to_decimal
+from helpers.unified_logger import log_throttled
 
 
 class ParadexOrderBook:
@@ -29,8 +31,8 @@ class ParadexOrderBook:
         """
         self.logger = logger
         
-        # Order book state
-        self.order_book = {"bids": {}, "asks": {}}
+        # Order book state: price units -> size units
+        self.order_book: Dict[str, Dict[int, int]] = {"bids": {}, "asks": {}}
         self.best_bid: Optional[Decimal] = None
         self.best_ask: Optional[Decimal] = None
         self.snapshot_loaded = False
@@ -40,6 +42,10 @@ class ParadexOrderBook:
         # Track last update time to detect staleness
         self.last_update_timestamp: Optional[float] = None
 
+        self.decoder = ParadexDecoder()
+        self._best_bid_units: Optional[int] = None
+        self._best_ask_units: Optional[int] = None
+
     def set_logger(self, logger):
         """Set the logger instance."""
         self.logger = logger
@@ -60,154 +66,59 @@ class ParadexOrderBook:
             data: Order book update data from WebSocket
         """
         try:
-            update_type = data.get('update_type')
-            deletes = data.get('deletes', [])
-            inserts = data.get('inserts', [])
-            updates = data.get('updates', [])
-            
-            # Check if Paradex sends bids/asks directly (alternative format)
-            bids_raw = data.get('bids', [])
-            asks_raw = data.get('asks', [])
-            
-            # If snapshot (update_type == 's'), clear existing state first
-            if update_type == 's':
-                self.order_book['bids'].clear()
-                self.order_book['asks'].clear()
-            
-            # Handle direct bids/asks format (if present)
-            if bids_raw or asks_raw:
-                # Process bids
-                for bid_item in bids_raw:
-                    if isinstance(bid_item, (list, tuple)) and len(bid_item) >= 2:
-                        # Format: [price, size]
-                        price = to_decimal(bid_item[0])
-                        size = to_decimal(bid_item[1])
-                        if price and size and size > 0:
-                            self.order_book['bids'][float(price)] = float(size)
-                    elif isinstance(bid_item, dict):
-                        # Format: {'price': ..., 'size': ...}
-                        price = to_decimal(bid_item.get('price'))
-                        size = to_decimal(bid_item.get('size'))
-                        if price and size and size > 0:
-                            self.order_book['bids'][float(price)] = float(size)
-                
-                # Process asks
-                for ask_item in asks_raw:
-                    if isinstance(ask_item, (list, tuple)) and len(ask_item) >= 2:
-                        # Format: [price, size]
-                        price = to_decimal(ask_item[0])
-                        size = to_decimal(ask_item[1])
-                        if price and size and size > 0:
-                            self.order_book['asks'][float(price)] = float(size)
-                    elif isinstance(ask_item, dict):
-                        # Format: {'price': ..., 'size': ...}
-                        price = to_decimal(ask_item.get('price'))
-                        size = to_decimal(ask_item.get('size'))
-                        if price and size and size > 0:
-                            self.order_book['asks'][float(price)] = float(size)
-            
-            # Process deletes
-            for delete_item in deletes:
-                side = delete_item.get('side', '')
-                if isinstance(side, str):
-                    side = side.upper()
-                elif side == 1 or side == '1':
-                    side = 'BUY'
-                elif side == 2 or side == '2':
-                    side = 'SELL'
-                else:
-                    side = str(side).upper()
-                
-                price = to_decimal(delete_item.get('price'))
-                if side == 'BUY' and price:
-                    self.order_book['bids'].pop(float(price), None)
-                elif side == 'SELL' and price:
-                    self.order_book['asks'].pop(float(price), None)
-            
-            # Process inserts
-            inserts_processed = 0
-            for insert_item in inserts:
-                side = insert_item.get('side', '')
-                if isinstance(side, str):
-                    side = side.upper()
-                elif side == 1 or side == '1':
-                    side = 'BUY'
-                elif side == 2 or side == '2':
-                    side = 'SELL'
-                else:
-                    side = str(side).upper()
-                
-                price = to_decimal(insert_item.get('price'))
-                size = to_decimal(insert_item.get('size'))
-                
-                if side == 'BUY' and price and size and size > 0:
-                    self.order_book['bids'][float(price)] = float(size)
-                    inserts_processed += 1
-                elif side == 'SELL' and price and size and size > 0:
-                    self.order_book['asks'][float(price)] = float(size)
-                    inserts_processed += 1
-            
-            if inserts_processed > 0 and self.logger:
-                # Log sample prices to validate
-                sample_bids = list(self.order_book['bids'].keys())[:3] if self.order_book['bids'] else []
-                sample_asks = list(self.order_book['asks'].keys())[:3] if self.order_book['asks'] else []
-            
-            # Process updates
-            for update_item in updates:
-                side = update_item.get('side', '')
-                if isinstance(side, str):
-                    side = side.upper()
-                elif side == 1 or side == '1':
-                    side = 'BUY'
-                elif side == 2 or side == '2':
-                    side = 'SELL'
-                else:
-                    side = str(side).upper()
-                
-                price = to_decimal(update_item.get('price'))
-                size = to_decimal(update_item.get('size'))
-                if side == 'BUY' and price and size:
-                    if size > 0:
-                        self.order_book['bids'][float(price)] = float(size)
-                    else:
-                        # Size 0 means remove this level
-                        self.order_book['bids'].pop(float(price), None)
-                elif side == 'SELL' and price and size:
-                    if size > 0:
-                        self.order_book['asks'][float(price)] = float(size)
-                    else:
-                        # Size 0 means remove this level
-                        self.order_book['asks'].pop(float(price), None)
-            
-            # Update best bid/ask
-            if self.order_book['bids']:
-                self.best_bid = Decimal(str(max(self.order_book['bids'].keys())))
-            if self.order_book['asks']:
-                self.best_ask = Decimal(str(min(self.order_book['asks'].keys())))
-            
-            # Log best prices for validation
-            if self.best_bid and self.best_ask and self.logger:
-                spread_bps = ((self.best_ask - self.best_bid) / self.best_bid * 10000) if self.best_bid > 0 else 0
-            
-            # Mark as ready after first snapshot or when we have data
-            if update_type == 's' or (not self.snapshot_loaded and (self.order_book['bids'] or self.order_book['asks'])):
-                self.snapshot_loaded = True
-                self.order_book_ready = True
-                best_bid_str = str(self.best_bid) if self.best_bid else "N/A"
-                best_ask_str = str(self.best_ask) if self.best_ask else "N/A"
-            
-            # Update timestamp
-            self.last_update_timestamp = time.time()
-            
+            self.apply_message(self.decoder.book_from_data(data))
         except Exception as e:
-            if self.logger:
-                self.logger.error(f"Error updating order book: {e}")
+            log_throttled(self.logger, f"Error updating order book: {e}", "ERROR")
+
+    def apply_message(self, message: BookMessage) -> None:
+        """
+        Apply a decoded snapshot or delta (levels with size 0 are removed).
+
+        Snapshots clear existing state first. The book is marked ready after
+        the first snapshot, or the first update that leaves levels behind.
+        """
+        bids = self.order_book['bids']
+        asks = self.order_book['asks']
+        if message.snapshot:
+            bids.clear()
+            asks.clear()
+
+        for levels, updates in ((bids, message.bids), (asks, message.asks)):
+            for price, size in updates:
+                if price <= 0:
+                    continue
+                if size > 0:
+                    levels[price] = size
+                else:
+                    levels.pop(price, None)
+
+        # Update best bid/ask (kept from the last non-empty side, as before)
+        if bids:
+            best_bid = max(bids)
+            if best_bid != self._best_bid_units:
+                self._best_bid_units = best_bid
+                self.best_bid = units_to_decimal(best_bid)
+        if asks:
+            best_ask = min(asks)
+            if best_ask != self._best_ask_units:
+                self._best_ask_units = best_ask
+                self.best_ask = units_to_decimal(best_ask)
+
+        # Mark as ready after first snapshot or when we have data
+        if message.snapshot or (not self.snapshot_loaded and (bids or asks)):
+            self.snapshot_loaded = True
+            self.order_book_ready = True
+
+        # Update timestamp
+        self.last_update_timestamp = time.time()
 
     def reset_order_book(self) -> None:
         """Reset order book state (called when switching markets or reconnecting)."""
         self.order_book = {"bids": {}, "asks": {}}
         self.best_bid = None
         self.best_ask = None
+        self._best_bid_units = None
+        self._best_ask_units = None
         self.snapshot_loaded = False
         self.order_book_ready = False
         self.last_update_timestamp = None
@@ -237,7 +148,7 @@ class ParadexOrderBook:
                 sorted_bids = sorted_bids[:levels]
             
             for price, size in sorted_bids:
-                bids.append({'price': Decimal(str(price)), 'size': Decimal(str(size))})
+                bids.append({'price': units_to_decimal(price), 'size': units_to_decimal(size)})
             
             # Sort asks ascending (lowest first)
             sorted_asks = sorted(self.order_book['asks'].items(), key=lambda x: x[0])
@@ -245,13 +156,12 @@ class ParadexOrderBook:
                 sorted_asks = sorted_asks[:levels]
             
             for price, size in sorted_asks:
-                asks.append({'price': Decimal(str(price)), 'size': Decimal(str(size))})
+                asks.append({'price': units_to_decimal(price), 'size': units_to_decimal(size)})
             
             return {'bids': bids, 'asks': asks}
             
         except Exception as e:
-            if self.logger:
-                self.logger.error(f"Error getting order book: {e}")
+            log_throttled(self.logger, f"Error getting order book: {e}", "ERROR")
             return None
 
     def get_best_levels(
@@ -276,9 +186,9 @@ class ParadexOrderBook:
         best_ask_size = None
         
         if best_bid_price:
-            best_bid_size = Decimal(str(self.order_book['bids'].get(float(best_bid_price), 0)))
+            best_bid_size = units_to_decimal(self.order_book['bids'].get(self._best_bid_units, 0))
         if best_ask_price:
-            best_ask_size = Decimal(str(self.order_book['asks'].get(float(best_ask_price), 0)))
+            best_ask_size = units_to_decimal(self.order_book['asks'].get(self._best_ask_units, 0))
         
         return ((best_bid_price, best_bid_size), (best_ask_price, best_ask_size))
 
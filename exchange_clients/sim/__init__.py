@@ -0,0 +1,24 @@
+"""
+Simulated Exchange Module
+
+Provides an in-process venue (matching engine, trading client and websocket
+manager) for benchmarking and testing executors without network access.
+"""
+
+from .client import SimClient
+from .common import (
+    SimVenueConfig,
+    normalize_symbol,
+    get_sim_symbol_format,
+)
+from .engine import SimMatchingEngine
+from .websocket import SimWebSocketManager
+
+__all__ = [
+    'SimClient',
+    'SimMatchingEngine',
+    'SimVenueConfig',
+    'SimWebSocketManager',
+    'normalize_symbol',
+    'get_sim_symbol_format',
+]
@@ -0,0 +1,468 @@
+"""
+Simulated exchange client.
+
+Implements BaseExchangeClient on top of the in-process SimMatchingEngine so
+executors and strategies can be exercised end to end (order placement, fills,
+cancels, websocket callbacks) without network access or credentials. Latency,
+jitter, nonce errors and rejections are configurable via SimVenueConfig.
+"""
+
+import asyncio
+import random
+from datetime import datetime, timezone
+from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP
+from typing import Any, Dict, List, Optional, Tuple
+
+from exchange_clients.base_client import BaseExchangeClient
+from exchange_clients.base_models import (
+    CancelReason,
+    ExchangePositionSnapshot,
+    OrderInfo,
+    OrderResult,
+    TradeData,
+)
+from helpers.unified_logger import get_exchange_logger
+
+from .common import (
+    SimVenueConfig,
+    from_lots,
+    from_ticks,
+    get_sim_symbol_format,
+    normalize_symbol,
+    to_lots,
+    to_ticks,
+)
+from .engine import SimMatchingEngine, SimOrder, SimOrderUpdate
+from .websocket import SimWebSocketManager
+
+NONCE_ERROR_MESSAGE = "invalid nonce (code=21104)"
+FINAL_STATUSES = {"FILLED", "CANCELED", "CANCELLED", "REJECTED", "EXPIRED"}
+
+
+class SimOrderManager:
+    """Tracks websocket order state and wakes up await_order_update() waiters."""
+
+    def __init__(self, latest_orders: Dict[str, OrderInfo]) -> None:
+        self.latest_orders = latest_orders
+        self.order_update_events: Dict[str, asyncio.Event] = {}
+
+    def notify_order_update(self, order_id: str) -> None:
+        if not order_id:
+            return
+        event = self.order_update_events.get(str(order_id))
+        if event is not None and not event.is_set():
+            event.set()
+
+    async def await_order_update(self, order_id: str, timeout: float = 10.0) -> Optional[OrderInfo]:
+        if not order_id:
+            return None
+        order_id_str = str(order_id)
+        cached = self.latest_orders.get(order_id_str)
+        if cached is not None and cached.status in FINAL_STATUSES:
+            return cached
+
+        event = self.order_update_events.setdefault(order_id_str, asyncio.Event())
+        if not event.is_set():
+            try:
+                await asyncio.wait_for(event.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+        self.order_update_events.pop(order_id_str, None)
+        return self.latest_orders.get(order_id_str)
+
+
+class SimClient(BaseExchangeClient):
+    """Exchange client backed by the in-process simulated venue."""
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        account_id: Optional[str] = None,
+        engine: Optional[SimMatchingEngine] = None,
+    ):
+        """
+        Initialize the simulated client.
+
+        Args:
+            config: Trading configuration object (``sim_*`` attributes tune the venue)
+            account_id: Optional account name; clients with different accounts trade
+                against each other on the same shared book
+            engine: Optional engine instance (defaults to the shared engine for the venue)
+        """
+        super().__init__(config)
+        self.venue_config = SimVenueConfig.from_config(config)
+        self.engine = engine or SimMatchingEngine.shared(self.venue_config)
+        self.account_id = account_id or "default"
+        self.logger = get_exchange_logger("sim", getattr(self.config, "ticker", None))
+
+        self._rng = random.Random(self.venue_config.seed)
+        self.latest_orders: Dict[str, OrderInfo] = {}
+        self._fill_notional: Dict[str, int] = {}
+        self.order_manager = SimOrderManager(self.latest_orders)
+        self.ws_manager = SimWebSocketManager(
+            engine=self.engine,
+            owner=self.account_id,
+            venue_config=self.venue_config,
+            config=self.config,
+            order_update_callback=self._handle_order_update,
+        )
+        self.ws_manager.set_logger(self.logger)
+
+    def _validate_config(self) -> None:
+        """No credentials are required for the simulated venue."""
+        return None
+
+    # ------------------------------------------------------------------ #
+    # Connection
+    # ------------------------------------------------------------------ #
+
+    async def connect(self) -> None:
+        await self.ws_manager.connect()
+        ticker = getattr(self.config, "ticker", None)
+        if ticker:
+            await self.ws_manager.prepare_market_feed(ticker)
+
+    async def disconnect(self) -> None:
+        await self.ws_manager.disconnect()
+
+    def get_exchange_name(self) -> str:
+        return self.venue_config.venue_name
+
+    async def _simulate_latency(self) -> None:
+        """Sleep for one simulated REST round trip (no-op when latency is zero)."""
+        delay_ms = self.venue_config.latency_ms
+        if self.venue_config.jitter_ms > 0:
+            delay_ms += self._rng.uniform(0.0, self.venue_config.jitter_ms)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000.0)
+
+    # ------------------------------------------------------------------ #
+    # Market data
+    # ------------------------------------------------------------------ #
+
+    def normalize_symbol(self, symbol: str) -> str:
+        return get_sim_symbol_format(symbol)
+
+    def resolve_contract_id(self, symbol: str) -> str:
+        return get_sim_symbol_format(symbol)
+
+    async def fetch_bbo_prices(self, contract_id: str) -> Tuple[Decimal, Decimal]:
+        best_bid, best_ask = self.engine.get_bbo(contract_id)
+        tick = self.venue_config.tick_size
+        bid = from_ticks(best_bid, tick) if best_bid is not None else Decimal("0")
+        ask = from_ticks(best_ask, tick) if best_ask is not None else Decimal("0")
+        return bid, ask
+
+    async def get_order_book_depth(
+        self,
+        contract_id: str,
+        levels: int = 10,
+    ) -> Dict[str, List[Dict[str, Decimal]]]:
+        return self.ws_manager.format_order_book(normalize_symbol(contract_id), levels)
+
+    async def get_contract_attributes(self) -> Tuple[str, Decimal]:
+        ticker = getattr(self.config, "ticker", None)
+        if not ticker:
+            raise ValueError("Ticker is empty")
+        symbol = normalize_symbol(ticker)
+        self.engine.ensure_symbol(symbol)
+        contract_id = get_sim_symbol_format(symbol)
+        self.config.contract_id = contract_id
+        self.config.tick_size = self.venue_config.tick_size
+        self._contract_id_cache[symbol] = contract_id
+        return contract_id, self.venue_config.tick_size
+
+    def round_to_step(self, quantity: Decimal) -> Decimal:
+        step = self.venue_config.step_size
+        return Decimal(str(quantity)).quantize(step, rounding=ROUND_DOWN)
+
+    def round_to_tick(self, price) -> Decimal:
+        tick = self.venue_config.tick_size
+        return Decimal(str(price)).quantize(tick, rounding=ROUND_HALF_UP)
+
+    # ------------------------------------------------------------------ #
+    # Orders
+    # ------------------------------------------------------------------ #
+
+    def _pre_trade_error(self) -> Optional[str]:
+        """Roll for injected submission failures."""
+        if self.venue_config.nonce_error_rate > 0 and self._rng.random() < self.venue_config.nonce_error_rate:
+            return NONCE_ERROR_MESSAGE
+        if self.venue_config.reject_rate > 0 and self._rng.random() < self.venue_config.reject_rate:
+            return "Order rejected by simulated venue"
+        return None
+
+    def _order_result(self, order: SimOrder, quantity: Decimal) -> OrderResult:
+        tick = self.venue_config.tick_size
+        step = self.venue_config.step_size
+        if order.status == "REJECTED":
+            if order.cancel_reason == CancelReason.POST_ONLY_VIOLATION:
+                message = f"Post-only order would cross the book ({CancelReason.POST_ONLY_VIOLATION})"
+            else:
+                message = "Reduce-only order would increase position"
+            return OrderResult(
+                success=False,
+                order_id=order.order_id,
+                side=order.side,
+                size=quantity,
+                status="REJECTED",
+                error_message=message,
+            )
+
+        status = order.status
+        if status == "CANCELED" and order.cancel_reason == CancelReason.POST_ONLY_VIOLATION:
+            # Venue accepted the order; the cancellation arrives via websocket
+            status = "OPEN"
+        price = order.price
+        if order.filled_lots:
+            price = order.fill_notional / order.filled_lots
+        return OrderResult(
+            success=True,
+            order_id=order.order_id,
+            side=order.side,
+            size=quantity,
+            price=(tick * Decimal(str(price))).quantize(tick) if price is not None else None,
+            status=status,
+            filled_size=from_lots(order.filled_lots, step),
+        )
+
+    async def place_limit_order(
+        self,
+        contract_id: str,
+        quantity: Decimal,
+        price: Decimal,
+        side: str,
+        reduce_only: bool = False,
+    ) -> OrderResult:
+        await self._simulate_latency()
+        side = side.lower()
+        error = self._pre_trade_error()
+        if error:
+            return OrderResult(success=False, side=side, size=quantity, price=price, error_message=error)
+
+        lots = to_lots(quantity, self.venue_config.step_size)
+        if lots <= 0:
+            return OrderResult(success=False, side=side, size=quantity, price=price,
+                               error_message="Order size below minimum step size")
+
+        order = self.engine.submit_limit(
+            self.account_id,
+            normalize_symbol(contract_id),
+            side,
+            to_ticks(price, self.venue_config.tick_size),
+            lots,
+            post_only=True,
+            reduce_only=reduce_only,
+        )
+        return self._order_result(order, quantity)
+
+    async def place_market_order(
+        self,
+        contract_id: str,
+        quantity: Decimal,
+        side: str,
+        reduce_only: bool = False,
+    ) -> OrderResult:
+        await self._simulate_latency()
+        side = side.lower()
+        error = self._pre_trade_error()
+        if error:
+            return OrderResult(success=False, side=side, size=quantity, error_message=error)
+
+        lots = to_lots(quantity, self.venue_config.step_size)
+        if lots <= 0:
+            return OrderResult(success=False, side=side, size=quantity,
+                               error_message="Order size below minimum step size")
+
+        order = self.engine.submit_market(
+            self.account_id,
+            normalize_symbol(contract_id),
+            side,
+            lots,
+            reduce_only=reduce_only,
+        )
+        result = self._order_result(order, quantity)
+        if result.success and order.filled_lots == 0:
+            result.success = False
+            result.error_message = "Market order found no liquidity"
+        return result
+
+    async def cancel_order(self, order_id: str) -> OrderResult:
+        await self._simulate_latency()
+        order = self.engine.cancel(order_id)
+        if order is None:
+            return OrderResult(success=False, order_id=str(order_id), error_message="Order not found")
+        return OrderResult(
+            success=order.status == "CANCELED",
+            order_id=order.order_id,
+            side=order.side,
+            status=order.status,
+            filled_size=from_lots(order.filled_lots, self.venue_config.step_size),
+            error_message=None if order.status == "CANCELED" else f"Order already {order.status}",
+        )
+
+    def _order_info(self, order: Any) -> OrderInfo:
+        tick = self.venue_config.tick_size
+        step = self.venue_config.step_size
+        if order.filled_lots:
+            price = (tick * Decimal(order.fill_notional) / Decimal(order.filled_lots)).quantize(tick)
+        elif order.price is not None:
+            price = from_ticks(order.price, tick)
+        else:
+            price = Decimal("0")
+        return OrderInfo(
+            order_id=order.order_id,
+            side=order.side,
+            size=from_lots(order.lots, step),
+            price=price,
+            status=order.status,
+            filled_size=from_lots(order.filled_lots, step),
+            remaining_size=from_lots(order.lots - order.filled_lots, step),
+            cancel_reason=order.cancel_reason,
+        )
+
+    async def get_order_info(self, order_id: str, *, force_refresh: bool = False) -> Optional[OrderInfo]:
+        if not force_refresh:
+            cached = self.latest_orders.get(str(order_id))
+            if cached is not None and cached.status in FINAL_STATUSES:
+                return cached
+        await self._simulate_latency()
+        order = self.engine.get_order(order_id)
+        if order is None or order.owner != self.account_id:
+            return None
+        return self._order_info(order)
+
+    async def get_active_orders(self, contract_id: str) -> List[OrderInfo]:
+        await self._simulate_latency()
+        return [self._order_info(order) for order in self.engine.open_orders(self.account_id, contract_id)]
+
+    async def await_order_update(self, order_id: str, timeout: float = 10.0) -> Optional[OrderInfo]:
+        return await self.order_manager.await_order_update(order_id, timeout)
+
+    async def _handle_order_update(self, update: SimOrderUpdate) -> None:
+        """Apply a websocket order update and fan out fill/status callbacks."""
+        try:
+            previous = self.latest_orders.get(update.order_id)
+            prev_filled = previous.filled_size if previous else Decimal("0")
+            info = self._order_info(update)
+            self.latest_orders[update.order_id] = info
+            self.order_manager.notify_order_update(update.order_id)
+
+            prev_notional = self._fill_notional.get(update.order_id, 0)
+            self._fill_notional[update.order_id] = update.fill_notional
+
+            fill_increment = info.filled_size - prev_filled
+            if self.order_fill_callback and fill_increment > 0:
+                # VWAP of the fills covered by this update (one submit may sweep several levels)
+                increment_lots = update.filled_lots - to_lots(prev_filled, self.venue_config.step_size)
+                fill_price = (
+                    self.venue_config.tick_size
+                    * Decimal(update.fill_notional - prev_notional)
+                    / Decimal(increment_lots)
+                ).quantize(self.venue_config.tick_size)
+                await self.order_fill_callback(update.order_id, fill_price, fill_increment, update.sequence)
+
+            if self.order_status_callback and update.status in {"FILLED", "CANCELED"}:
+                await self.order_status_callback(update.order_id, update.status, info.filled_size, info.price)
+        except Exception as exc:
+            self.logger.error(f"Error handling simulated order update: {exc}")
+
+    # ------------------------------------------------------------------ #
+    # Account
+    # ------------------------------------------------------------------ #
+
+    def _position_values(self, symbol: str) -> Tuple[Decimal, Optional[Decimal], Decimal]:
+        """Return (signed quantity, average entry price, realized pnl) for ``symbol``."""
+        lots, cost, realized = self.engine.get_position(self.account_id, symbol)
+        tick = self.venue_config.tick_size
+        step = self.venue_config.step_size
+        quantity = from_lots(lots, step)
+        entry = (tick * Decimal(cost) / Decimal(lots)).quantize(tick) if lots else None
+        return quantity, entry, tick * step * realized
+
+    async def get_account_positions(self) -> Decimal:
+        ticker = getattr(self.config, "ticker", None)
+        if not ticker:
+            return Decimal("0")
+        quantity, _, _ = self._position_values(ticker)
+        return abs(quantity)
+
+    async def get_account_balance(self) -> Optional[Decimal]:
+        equity = self.venue_config.starting_balance - self.engine.get_fees(self.account_id)
+        used_margin = Decimal("0")
+        for symbol in self.engine.positions(self.account_id):
+            quantity, _, realized = self._position_values(symbol)
+            equity += realized
+            if quantity:
+                mid = from_ticks(self.engine.get_mid(symbol), self.venue_config.tick_size)
+                used_margin += abs(quantity) * mid / self.venue_config.max_leverage
+        return equity - used_margin
+
+    async def get_position_snapshot(
+        self,
+        symbol: str,
+        position_opened_at: Optional[float] = None,
+    ) -> Optional[ExchangePositionSnapshot]:
+        quantity, entry, realized = self._position_values(symbol)
+        if quantity == 0:
+            return None
+        mid = from_ticks(self.engine.get_mid(symbol), self.venue_config.tick_size)
+        unrealized = (mid - entry) * quantity if entry is not None else None
+        return ExchangePositionSnapshot(
+            symbol=normalize_symbol(symbol),
+            quantity=quantity,
+            side="long" if quantity > 0 else "short",
+            entry_price=entry,
+            mark_price=mid,
+            exposure_usd=abs(quantity) * mid,
+            unrealized_pnl=unrealized,
+            realized_pnl=realized,
+            funding_accrued=Decimal("0"),
+            margin_reserved=abs(quantity) * mid / self.venue_config.max_leverage,
+            leverage=self.venue_config.max_leverage,
+            timestamp=datetime.now(timezone.utc),
+        )
+
+    async def get_user_trade_history(
+        self,
+        symbol: str,
+        start_time: float,
+        end_time: float,
+        order_id: Optional[str] = None,
+    ) -> List[TradeData]:
+        target = normalize_symbol(symbol)
+        tick = self.venue_config.tick_size
+        step = self.venue_config.step_size
+        trades: List[TradeData] = []
+        for fill in self.engine.get_fills(self.account_id):
+            if fill.symbol != target or not (start_time <= fill.timestamp <= end_time):
+                continue
+            if order_id and fill.order_id != str(order_id):
+                continue
+            price = from_ticks(fill.price, tick)
+            quantity = from_lots(fill.lots, step)
+            fee_rate = self.venue_config.maker_fee if fill.is_maker else self.venue_config.taker_fee
+            trades.append(
+                TradeData(
+                    trade_id=fill.trade_id,
+                    timestamp=fill.timestamp,
+                    symbol=target,
+                    side=fill.side,
+                    quantity=quantity,
+                    price=price,
+                    fee=price * quantity * fee_rate,
+                    fee_currency="USD",
+                    order_id=fill.order_id,
+                )
+            )
+        return trades
+
+    async def get_leverage_info(self, symbol: str) -> Dict[str, Any]:
+        max_leverage = self.venue_config.max_leverage
+        return {
+            "max_leverage": max_leverage,
+            "max_notional": None,
+            "margin_requirement": Decimal("1") / max_leverage,
+            "brackets": None,
+            "error": None,
+        }
@@ -0,0 +1,178 @@
+"""
+Common utilities for the simulated exchange.
+
+Holds the venue configuration and the tick/lot conversion helpers shared by
+the matching engine, the trading client and the websocket manager.
+"""
+
+import os
+from dataclasses import dataclass, field
+from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP
+from typing import Any, Dict, Optional
+
+
+def _config_value(config: Any, name: str, default: Any = None) -> Any:
+    """Read a setting from a dict-style or attribute-style trading config."""
+    if config is None:
+        return default
+    if isinstance(config, dict):
+        value = config.get(name)
+    else:
+        value = getattr(config, name, None)
+    if value is None:
+        strategy_params = (
+            config.get("strategy_params") if isinstance(config, dict)
+            else getattr(config, "strategy_params", None)
+        )
+        if isinstance(strategy_params, dict):
+            value = strategy_params.get(name)
+    return default if value is None else value
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None or raw == "":
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
+@dataclass
+class SimVenueConfig:
+    """
+    Behaviour knobs for the simulated venue.
+
+    Every field can be set on the trading config as ``sim_<field>`` (or inside
+    ``strategy_params``) and most fall back to ``SIM_<FIELD>`` env vars, so a
+    CI job can dial in latency or rejection rates without code changes.
+    """
+
+    venue_name: str = "sim"
+    # Request/response latency for REST-style calls (milliseconds, one way)
+    latency_ms: float = 0.0
+    # Uniform jitter added on top of latency_ms (milliseconds)
+    jitter_ms: float = 0.0
+    # Delay between an engine event and its websocket callback (milliseconds)
+    ws_latency_ms: float = 0.0
+    # Probability that an order submission fails with a nonce error
+    nonce_error_rate: float = 0.0
+    # Probability that an order submission is rejected outright
+    reject_rate: float = 0.0
+    # "reject" -> crossing post-only orders fail at submission
+    # "cancel" -> they are accepted, then cancelled with POST_ONLY_VIOLATION
+    post_only_mode: str = "reject"
+    tick_size: Decimal = Decimal("0.01")
+    step_size: Decimal = Decimal("0.001")
+    default_mid_price: Decimal = Decimal("100")
+    initial_prices: Dict[str, Decimal] = field(default_factory=dict)
+    # Synthetic maker ladder seeded around the mid on each side
+    book_levels: int = 20
+    level_size: Decimal = Decimal("5")
+    # Half-spread of the synthetic ladder, in ticks
+    spread_ticks: int = 1
+    # Random walk applied by advance_market(), in ticks per step (std dev)
+    volatility_ticks: float = 2.0
+    # Synthetic taker flow per advance_market() step, in base units
+    taker_size: Decimal = Decimal("1")
+    # Background market driver interval (seconds); 0 disables the driver
+    market_step_interval: float = 0.0
+    starting_balance: Decimal = Decimal("100000")
+    max_leverage: Decimal = Decimal("20")
+    maker_fee: Decimal = Decimal("0.0002")
+    taker_fee: Decimal = Decimal("0.0005")
+    seed: Optional[int] = None
+
+    @classmethod
+    def from_config(cls, config: Any) -> "SimVenueConfig":
+        """Build a venue config from a trading config plus SIM_* env vars."""
+        defaults = cls()
+
+        def pick(name: str, env_name: Optional[str] = None) -> Any:
+            value = _config_value(config, f"sim_{name}")
+            if value is not None:
+                return value
+            if env_name:
+                default = getattr(defaults, name)
+                if isinstance(default, (int, float)) and not isinstance(default, bool):
+                    return type(default)(_env_float(env_name, float(default)))
+                env_value = os.getenv(env_name)
+                if env_value:
+                    return env_value
+            return getattr(defaults, name)
+
+        seed_value = pick("seed")
+        if seed_value is None and os.getenv("SIM_SEED"):
+            seed_value = int(os.getenv("SIM_SEED"))
+
+        initial_prices = {
+            str(symbol).upper(): Decimal(str(price))
+            for symbol, price in (pick("initial_prices") or {}).items()
+        }
+
+        return cls(
+            venue_name=str(pick("venue_name", "SIM_VENUE_NAME")).lower(),
+            latency_ms=float(pick("latency_ms", "SIM_LATENCY_MS")),
+            jitter_ms=float(pick("jitter_ms", "SIM_JITTER_MS")),
+            ws_latency_ms=float(pick("ws_latency_ms", "SIM_WS_LATENCY_MS")),
+            nonce_error_rate=float(pick("nonce_error_rate", "SIM_NONCE_ERROR_RATE")),
+            reject_rate=float(pick("reject_rate", "SIM_REJECT_RATE")),
+            post_only_mode=str(pick("post_only_mode", "SIM_POST_ONLY_MODE")).lower(),
+            tick_size=Decimal(str(pick("tick_size"))),
+            step_size=Decimal(str(pick("step_size"))),
+            default_mid_price=Decimal(str(pick("default_mid_price"))),
+            initial_prices=initial_prices,
+            book_levels=int(pick("book_levels")),
+            level_size=Decimal(str(pick("level_size"))),
+            spread_ticks=max(1, int(pick("spread_ticks"))),
+            volatility_ticks=float(pick("volatility_ticks")),
+            taker_size=Decimal(str(pick("taker_size"))),
+            market_step_interval=float(pick("market_step_interval", "SIM_MARKET_STEP_INTERVAL")),
+            starting_balance=Decimal(str(pick("starting_balance"))),
+            max_leverage=Decimal(str(pick("max_leverage"))),
+            maker_fee=Decimal(str(pick("maker_fee"))),
+            taker_fee=Decimal(str(pick("taker_fee"))),
+            seed=int(seed_value) if seed_value is not None else None,
+        )
+
+
+def normalize_symbol(symbol: str) -> str:
+    """
+    Normalize a simulated contract id to the standard base-asset format.
+
+    Args:
+        symbol: Contract id (e.g., "BTC-SIM") or base asset (e.g., "btc")
+
+    Returns:
+        Normalized symbol (e.g., "BTC")
+    """
+    normalized = (symbol or "").upper()
+    if normalized.endswith("-SIM"):
+        normalized = normalized[: -len("-SIM")]
+    return normalized
+
+
+def get_sim_symbol_format(symbol: str) -> str:
+    """Convert a normalized symbol to the simulated venue's contract id."""
+    return f"{normalize_symbol(symbol)}-SIM"
+
+
+def to_ticks(price: Any, tick_size: Decimal, rounding=ROUND_HALF_UP) -> int:
+    """Convert a price to an integer number of ticks."""
+    return int((Decimal(str(price)) / tick_size).to_integral_value(rounding=rounding))
+
+
+def to_lots(quantity: Any, step_size: Decimal) -> int:
+    """Convert a quantity to an integer number of lots (always rounds down)."""
+    return int((Decimal(str(quantity)) / step_size).to_integral_value(rounding=ROUND_DOWN))
+
+
+def from_ticks(ticks: int, tick_size: Decimal) -> Decimal:
+    """Convert integer ticks back to a Decimal price."""
+    return tick_size * ticks
+
+
+def from_lots(lots: int, step_size: Decimal) -> Decimal:
+    """Convert integer lots back to a Decimal quantity."""
+    return step_size * lots
@@ -0,0 +1,577 @@
+"""
+In-process matching engine for the simulated exchange.
+
+Implements a price-time-priority limit order book per symbol with integer
+tick/lot arithmetic so thousands of orders per second can be matched inside
+the test process. A synthetic maker ladder and taker flow (driven by
+``advance_market``) give resting orders something to trade against.
+
+Engine events are delivered synchronously to subscribers as ``(kind, payload)``
+tuples:
+    - ("order", SimOrderUpdate): order accepted / filled / cancelled / rejected
+    - ("book", symbol): top of book or depth changed for ``symbol``
+"""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+import random
+import time
+from collections import deque
+from decimal import Decimal
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from exchange_clients.base_models import CancelReason
+
+from .common import SimVenueConfig, from_lots, from_ticks, normalize_symbol, to_ticks
+
+SIM_MAKER = "__sim_maker__"
+SIM_TAKER = "__sim_taker__"
+
+EngineListener = Callable[[str, object], None]
+
+
+class SimOrder:
+    """Mutable order state tracked by the engine (prices in ticks, sizes in lots)."""
+
+    __slots__ = (
+        "order_id", "owner", "symbol", "side", "price", "lots", "filled_lots",
+        "fill_notional", "status", "post_only", "reduce_only", "cancel_reason",
+        "client_order_id", "created_at", "updated_at", "last_fill_price", "last_fill_lots",
+    )
+
+    def __init__(
+        self,
+        order_id: str,
+        owner: str,
+        symbol: str,
+        side: str,
+        price: Optional[int],
+        lots: int,
+        post_only: bool,
+        reduce_only: bool,
+        client_order_id: Optional[int],
+    ) -> None:
+        self.order_id = order_id
+        self.owner = owner
+        self.symbol = symbol
+        self.side = side
+        self.price = price
+        self.lots = lots
+        self.filled_lots = 0
+        self.fill_notional = 0  # sum(price_ticks * lots) over fills
+        self.status = "NEW"
+        self.post_only = post_only
+        self.reduce_only = reduce_only
+        self.cancel_reason = ""
+        self.client_order_id = client_order_id
+        self.created_at = time.time()
+        self.updated_at = self.created_at
+        self.last_fill_price: Optional[int] = None
+        self.last_fill_lots = 0
+
+    @property
+    def remaining_lots(self) -> int:
+        return self.lots - self.filled_lots
+
+    def snapshot(self, sequence: int) -> "SimOrderUpdate":
+        return SimOrderUpdate(
+            sequence=sequence,
+            order_id=self.order_id,
+            owner=self.owner,
+            symbol=self.symbol,
+            side=self.side,
+            price=self.price,
+            lots=self.lots,
+            filled_lots=self.filled_lots,
+            fill_notional=self.fill_notional,
+            status=self.status,
+            cancel_reason=self.cancel_reason,
+            last_fill_price=self.last_fill_price,
+            last_fill_lots=self.last_fill_lots,
+            timestamp=self.updated_at,
+        )
+
+
+class SimOrderUpdate:
+    """Immutable point-in-time copy of an order, delivered to subscribers."""
+
+    __slots__ = (
+        "sequence", "order_id", "owner", "symbol", "side", "price", "lots",
+        "filled_lots", "fill_notional", "status", "cancel_reason",
+        "last_fill_price", "last_fill_lots", "timestamp",
+    )
+
+    def __init__(self, **fields) -> None:
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+    @property
+    def avg_fill_price(self) -> Optional[float]:
+        if self.filled_lots <= 0:
+            return None
+        return self.fill_notional / self.filled_lots
+
+
+class SimFill:
+    """A single execution between a maker and a taker order."""
+
+    __slots__ = ("trade_id", "order_id", "owner", "symbol", "side", "price", "lots", "is_maker", "timestamp")
+
+    def __init__(
+        self,
+        trade_id: str,
+        order_id: str,
+        owner: str,
+        symbol: str,
+        side: str,
+        price: int,
+        lots: int,
+        is_maker: bool,
+        timestamp: float,
+    ) -> None:
+        self.trade_id = trade_id
+        self.order_id = order_id
+        self.owner = owner
+        self.symbol = symbol
+        self.side = side
+        self.price = price
+        self.lots = lots
+        self.is_maker = is_maker
+        self.timestamp = timestamp
+
+
+class SimOrderBook:
+    """Price-time-priority book for one symbol."""
+
+    def __init__(self, symbol: str) -> None:
+        self.symbol = symbol
+        self.levels: Dict[str, Dict[int, Deque[SimOrder]]] = {"buy": {}, "sell": {}}
+        # Ascending price lists per side; best bid is the last bid, best ask the first ask
+        self.prices: Dict[str, List[int]] = {"buy": [], "sell": []}
+
+    def best_bid(self) -> Optional[int]:
+        bids = self.prices["buy"]
+        return bids[-1] if bids else None
+
+    def best_ask(self) -> Optional[int]:
+        asks = self.prices["sell"]
+        return asks[0] if asks else None
+
+    def best(self, side: str) -> Optional[int]:
+        return self.best_bid() if side == "buy" else self.best_ask()
+
+    def add(self, order: SimOrder) -> None:
+        side_levels = self.levels[order.side]
+        queue = side_levels.get(order.price)
+        if queue is None:
+            queue = deque()
+            side_levels[order.price] = queue
+            bisect.insort(self.prices[order.side], order.price)
+        queue.append(order)
+
+    def remove(self, order: SimOrder) -> bool:
+        queue = self.levels[order.side].get(order.price)
+        if not queue:
+            return False
+        try:
+            queue.remove(order)
+        except ValueError:
+            return False
+        if not queue:
+            self._drop_level(order.side, order.price)
+        return True
+
+    def _drop_level(self, side: str, price: int) -> None:
+        self.levels[side].pop(price, None)
+        prices = self.prices[side]
+        index = bisect.bisect_left(prices, price)
+        if index < len(prices) and prices[index] == price:
+            prices.pop(index)
+
+    def depth(self, levels: Optional[int] = None) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+        """Aggregate resting size per price level (bids descending, asks ascending)."""
+        bid_prices = self.prices["buy"][::-1]
+        ask_prices = self.prices["sell"]
+        if levels is not None:
+            bid_prices = bid_prices[:levels]
+            ask_prices = ask_prices[:levels]
+        bids = [(price, sum(o.remaining_lots for o in self.levels["buy"][price])) for price in bid_prices]
+        asks = [(price, sum(o.remaining_lots for o in self.levels["sell"][price])) for price in ask_prices]
+        return bids, asks
+
+
+class SimMatchingEngine:
+    """
+    Matching engine shared by every simulated client of the same venue.
+
+    Use ``SimMatchingEngine.shared(config)`` so that several clients (e.g. two
+    accounts, or a client plus a benchmark driver) trade against the same book.
+    """
+
+    _shared: Dict[str, "SimMatchingEngine"] = {}
+
+    def __init__(self, config: Optional[SimVenueConfig] = None) -> None:
+        self.config = config or SimVenueConfig()
+        self.tick_size = self.config.tick_size
+        self.step_size = self.config.step_size
+        self._rng = random.Random(self.config.seed)
+        self._books: Dict[str, SimOrderBook] = {}
+        self._mid: Dict[str, int] = {}
+        self._orders: Dict[str, SimOrder] = {}
+        self._fills: Dict[str, List[SimFill]] = {}
+        # (owner, symbol) -> [signed_lots, signed_cost (ticks*lots), realized (ticks*lots)]
+        self._positions: Dict[Tuple[str, str], List[int]] = {}
+        self._fees: Dict[str, Decimal] = {}
+        self._listeners: List[EngineListener] = []
+        self._order_ids = itertools.count(1)
+        self._trade_ids = itertools.count(1)
+        self._sequence = 0
+
+    # ------------------------------------------------------------------ #
+    # Registry
+    # ------------------------------------------------------------------ #
+
+    @classmethod
+    def shared(cls, config: SimVenueConfig) -> "SimMatchingEngine":
+        """Return the process-wide engine for ``config.venue_name`` (creating it if needed)."""
+        engine = cls._shared.get(config.venue_name)
+        if engine is None:
+            engine = cls(config)
+            cls._shared[config.venue_name] = engine
+        return engine
+
+    @classmethod
+    def reset_shared(cls, venue_name: Optional[str] = None) -> None:
+        """Drop shared engines (used by tests and benchmarks between runs)."""
+        if venue_name is None:
+            cls._shared.clear()
+        else:
+            cls._shared.pop(venue_name, None)
+
+    # ------------------------------------------------------------------ #
+    # Subscriptions
+    # ------------------------------------------------------------------ #
+
+    def subscribe(self, listener: EngineListener) -> None:
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: EngineListener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _emit(self, kind: str, payload: object) -> None:
+        for listener in list(self._listeners):
+            listener(kind, payload)
+
+    def _emit_order(self, order: SimOrder) -> None:
+        if order.owner in (SIM_MAKER, SIM_TAKER) or not self._listeners:
+            return
+        self._sequence += 1
+        self._emit("order", order.snapshot(self._sequence))
+
+    # ------------------------------------------------------------------ #
+    # Market setup
+    # ------------------------------------------------------------------ #
+
+    def ensure_symbol(self, symbol: str) -> SimOrderBook:
+        """Create the book for ``symbol`` and seed the synthetic maker ladder."""
+        symbol = normalize_symbol(symbol)
+        book = self._books.get(symbol)
+        if book is not None:
+            return book
+        book = SimOrderBook(symbol)
+        self._books[symbol] = book
+        mid_price = self.config.initial_prices.get(symbol, self.config.default_mid_price)
+        self._mid[symbol] = to_ticks(mid_price, self.tick_size)
+        self._seed_ladder(symbol)
+        return book
+
+    def has_symbol(self, symbol: str) -> bool:
+        return normalize_symbol(symbol) in self._books
+
+    def _seed_ladder(self, symbol: str) -> None:
+        mid = self._mid[symbol]
+        level_lots = max(1, int(self.config.level_size / self.step_size))
+        spread = self.config.spread_ticks
+        for offset in range(self.config.book_levels):
+            bid_price = mid - spread - offset
+            ask_price = mid + spread + offset
+            if bid_price > 0:
+                self._submit(SIM_MAKER, symbol, "buy", bid_price, level_lots, False, False, None)
+            self._submit(SIM_MAKER, symbol, "sell", ask_price, level_lots, False, False, None)
+
+    def advance_market(self, symbol: str, steps: int = 1) -> None:
+        """
+        Move the simulated market for ``symbol``.
+
+        Each step random-walks the mid, lets synthetic taker flow trade through
+        any resting orders priced through the new touch, and re-seeds the maker
+        ladder. Resting client orders that end up marketable are filled as makers,
+        which is how limit orders get (partially) filled in the simulation.
+        """
+        symbol = normalize_symbol(symbol)
+        book = self.ensure_symbol(symbol)
+        taker_lots = max(1, int(self.config.taker_size / self.step_size))
+        for _ in range(steps):
+            for side in ("buy", "sell"):
+                for price in list(book.prices[side]):
+                    for order in [o for o in book.levels[side][price] if o.owner == SIM_MAKER]:
+                        book.remove(order)
+                        order.status = "CANCELED"
+                        self._orders.pop(order.order_id, None)
+
+            move = int(round(self._rng.gauss(0.0, self.config.volatility_ticks)))
+            self._mid[symbol] = max(self.config.spread_ticks + 1, self._mid[symbol] + move)
+            mid = self._mid[symbol]
+
+            # Takers sweep client orders resting through the new touch first
+            spread = self.config.spread_ticks
+            for side, limit in (("buy", mid + spread), ("sell", mid - spread)):
+                size = self._rng.randint(1, taker_lots)
+                self._submit(SIM_TAKER, symbol, side, limit, size, False, False, None, ioc=True)
+
+            self._seed_ladder(symbol)
+        self._emit("book", symbol)
+
+    # ------------------------------------------------------------------ #
+    # Order entry
+    # ------------------------------------------------------------------ #
+
+    def submit_limit(
+        self,
+        owner: str,
+        symbol: str,
+        side: str,
+        price: int,
+        lots: int,
+        post_only: bool = True,
+        reduce_only: bool = False,
+        client_order_id: Optional[int] = None,
+    ) -> SimOrder:
+        """Submit a limit order (prices in ticks, size in lots)."""
+        symbol = normalize_symbol(symbol)
+        self.ensure_symbol(symbol)
+        order = self._submit(owner, symbol, side, price, lots, post_only, reduce_only, client_order_id)
+        self._emit("book", symbol)
+        return order
+
+    def submit_market(
+        self,
+        owner: str,
+        symbol: str,
+        side: str,
+        lots: int,
+        reduce_only: bool = False,
+        client_order_id: Optional[int] = None,
+    ) -> SimOrder:
+        """Submit an immediate-or-cancel market order."""
+        symbol = normalize_symbol(symbol)
+        self.ensure_symbol(symbol)
+        order = self._submit(owner, symbol, side, None, lots, False, reduce_only, client_order_id, ioc=True)
+        self._emit("book", symbol)
+        return order
+
+    def reject(
+        self,
+        owner: str,
+        symbol: str,
+        side: str,
+        price: Optional[int],
+        lots: int,
+        reason: str,
+    ) -> SimOrder:
+        """Record an order that was rejected before reaching the book."""
+        order = SimOrder(
+            str(next(self._order_ids)), owner, normalize_symbol(symbol), side, price, lots, False, False, None
+        )
+        order.status = "REJECTED"
+        order.cancel_reason = reason
+        self._orders[order.order_id] = order
+        self._emit_order(order)
+        return order
+
+    def cancel(self, order_id: str) -> Optional[SimOrder]:
+        """Cancel a resting order. Returns the order (in its final state) or None if unknown."""
+        order = self._orders.get(str(order_id))
+        if order is None:
+            return None
+        if order.status in ("NEW", "OPEN", "PARTIALLY_FILLED"):
+            self._books[order.symbol].remove(order)
+            order.status = "CANCELED"
+            order.cancel_reason = CancelReason.USER_CANCELED
+            order.updated_at = time.time()
+            self._emit_order(order)
+            self._emit("book", order.symbol)
+        return order
+
+    def get_order(self, order_id: str) -> Optional[SimOrder]:
+        return self._orders.get(str(order_id))
+
+    def open_orders(self, owner: str, symbol: Optional[str] = None) -> List[SimOrder]:
+        target = normalize_symbol(symbol) if symbol else None
+        return [
+            order for order in self._orders.values()
+            if order.owner == owner
+            and order.status in ("OPEN", "PARTIALLY_FILLED")
+            and (target is None or order.symbol == target)
+        ]
+
+    def _submit(
+        self,
+        owner: str,
+        symbol: str,
+        side: str,
+        price: Optional[int],
+        lots: int,
+        post_only: bool,
+        reduce_only: bool,
+        client_order_id: Optional[int],
+        ioc: bool = False,
+    ) -> SimOrder:
+        book = self._books[symbol]
+        order = SimOrder(
+            str(next(self._order_ids)), owner, symbol, side, price, lots, post_only, reduce_only, client_order_id
+        )
+        if owner not in (SIM_MAKER, SIM_TAKER):
+            self._orders[order.order_id] = order
+
+        if reduce_only:
+            position_lots = self._positions.get((owner, symbol), [0, 0, 0])[0]
+            closable = -position_lots if side == "buy" else position_lots
+            if closable <= 0:
+                order.status = "REJECTED"
+                order.cancel_reason = CancelReason.REJECTED
+                self._emit_order(order)
+                return order
+            order.lots = min(order.lots, closable)
+
+        opposite = "sell" if side == "buy" else "buy"
+        best_opposite = book.best(opposite)
+        crosses = best_opposite is not None and (
+            price is None
+            or (side == "buy" and price >= best_opposite)
+            or (side == "sell" and price <= best_opposite)
+        )
+
+        if post_only and crosses:
+            order.cancel_reason = CancelReason.POST_ONLY_VIOLATION
+            order.status = "REJECTED" if self.config.post_only_mode == "reject" else "CANCELED"
+            self._emit_order(order)
+            return order
+
+        if crosses:
+            self._match(order, book, opposite)
+
+        if order.remaining_lots > 0:
+            if ioc:
+                order.status = "CANCELED"
+                if not order.cancel_reason:
+                    order.cancel_reason = CancelReason.EXPIRED
+            else:
+                order.status = "PARTIALLY_FILLED" if order.filled_lots else "OPEN"
+                book.add(order)
+        else:
+            order.status = "FILLED"
+        order.updated_at = time.time()
+        self._emit_order(order)
+        return order
+
+    def _match(self, taker: SimOrder, book: SimOrderBook, opposite: str) -> None:
+        side_levels = book.levels[opposite]
+        prices = book.prices[opposite]
+        now = time.time()
+        while taker.remaining_lots > 0 and prices:
+            level_price = prices[0] if opposite == "sell" else prices[-1]
+            if taker.price is not None:
+                if taker.side == "buy" and level_price > taker.price:
+                    break
+                if taker.side == "sell" and level_price < taker.price:
+                    break
+            queue = side_levels[level_price]
+            while taker.remaining_lots > 0 and queue:
+                maker = queue[0]
+                trade_lots = min(taker.remaining_lots, maker.remaining_lots)
+                self._apply_fill(maker, level_price, trade_lots, True, now)
+                self._apply_fill(taker, level_price, trade_lots, False, now)
+                if maker.remaining_lots <= 0:
+                    queue.popleft()
+                    maker.status = "FILLED"
+                else:
+                    maker.status = "PARTIALLY_FILLED"
+                maker.updated_at = now
+                self._emit_order(maker)
+            if not queue:
+                book._drop_level(opposite, level_price)
+
+    def _apply_fill(self, order: SimOrder, price: int, lots: int, is_maker: bool, now: float) -> None:
+        order.filled_lots += lots
+        order.fill_notional += price * lots
+        order.last_fill_price = price
+        order.last_fill_lots = lots
+        if order.owner in (SIM_MAKER, SIM_TAKER):
+            return
+
+        self._fills.setdefault(order.owner, []).append(
+            SimFill(str(next(self._trade_ids)), order.order_id, order.owner, order.symbol,
+                    order.side, price, lots, is_maker, now)
+        )
+        fee_rate = self.config.maker_fee if is_maker else self.config.taker_fee
+        notional = from_ticks(price, self.tick_size) * from_lots(lots, self.step_size)
+        self._fees[order.owner] = self._fees.get(order.owner, Decimal("0")) + notional * fee_rate
+
+        position = self._positions.setdefault((order.owner, order.symbol), [0, 0, 0])
+        signed = lots if order.side == "buy" else -lots
+        size, cost, _ = position
+        if size == 0 or (size > 0) == (signed > 0):
+            position[0] = size + signed
+            position[1] = cost + price * signed
+            return
+        # Reducing (and possibly flipping) the position
+        closing = min(abs(size), lots)
+        avg_entry = cost / size
+        direction = 1 if size > 0 else -1
+        position[2] += int(round((price - avg_entry) * closing * direction))
+        remaining = size + signed
+        if remaining == 0:
+            position[0], position[1] = 0, 0
+        elif (remaining > 0) == (size > 0):
+            position[0] = remaining
+            position[1] = int(round(avg_entry * remaining))
+        else:
+            position[0] = remaining
+            position[1] = price * remaining
+
+    # ------------------------------------------------------------------ #
+    # Queries
+    # ------------------------------------------------------------------ #
+
+    def get_book(self, symbol: str) -> SimOrderBook:
+        return self.ensure_symbol(symbol)
+
+    def get_bbo(self, symbol: str) -> Tuple[Optional[int], Optional[int]]:
+        book = self.ensure_symbol(symbol)
+        return book.best_bid(), book.best_ask()
+
+    def get_mid(self, symbol: str) -> int:
+        self.ensure_symbol(symbol)
+        return self._mid[normalize_symbol(symbol)]
+
+    def get_position(self, owner: str, symbol: str) -> Tuple[int, int, int]:
+        """Return (signed_lots, signed_cost_ticks_lots, realized_ticks_lots)."""
+        return tuple(self._positions.get((owner, normalize_symbol(symbol)), (0, 0, 0)))
+
+    def positions(self, owner: str) -> Dict[str, Tuple[int, int, int]]:
+        return {
+            symbol: tuple(values)
+            for (position_owner, symbol), values in self._positions.items()
+            if position_owner == owner
+        }
+
+    def get_fills(self, owner: str) -> List[SimFill]:
+        return list(self._fills.get(owner, []))
+
+    def get_fees(self, owner: str) -> Decimal:
+        return self._fees.get(owner, Decimal("0"))
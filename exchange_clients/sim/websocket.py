@@ -0,0 +1,152 @@
+"""
+WebSocket manager for the simulated exchange.
+
+Bridges synchronous matching-engine events to the async callbacks the real
+venue managers expose: BBO listeners, order updates and order book snapshots.
+An optional ``ws_latency_ms`` delays delivery while preserving event order.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from exchange_clients.base_websocket import BaseWebSocketManager, BBOData
+
+from .common import SimVenueConfig, from_lots, from_ticks, get_sim_symbol_format, normalize_symbol
+from .engine import SimMatchingEngine, SimOrderUpdate
+
+
+class SimWebSocketManager(BaseWebSocketManager):
+    """Event stream for one simulated account."""
+
+    def __init__(
+        self,
+        engine: SimMatchingEngine,
+        owner: str,
+        venue_config: SimVenueConfig,
+        config: Any = None,
+        order_update_callback: Optional[Callable[[SimOrderUpdate], Awaitable[None]]] = None,
+    ) -> None:
+        super().__init__()
+        self.engine = engine
+        self.owner = owner
+        self.venue_config = venue_config
+        self.config = config
+        self.order_update_callback = order_update_callback
+        self.symbol: Optional[str] = None
+        self._delay = max(0.0, venue_config.ws_latency_ms) / 1000.0
+        self._last_delivery_at = 0.0
+        self._last_bbo: Optional[tuple] = None
+        self._bbo_sequence = 0
+        self._market_task: Optional[asyncio.Task] = None
+
+    # ------------------------------------------------------------------ #
+    # Connection lifecycle
+    # ------------------------------------------------------------------ #
+
+    async def connect(self) -> None:
+        self.engine.subscribe(self._on_engine_event)
+        self.running = True
+        interval = self.venue_config.market_step_interval
+        if interval > 0 and self._market_task is None:
+            self._market_task = asyncio.create_task(self._drive_market(interval))
+
+    async def disconnect(self) -> None:
+        self.running = False
+        self.engine.unsubscribe(self._on_engine_event)
+        if self._market_task is not None:
+            self._market_task.cancel()
+            try:
+                await self._market_task
+            except asyncio.CancelledError:
+                pass
+            self._market_task = None
+
+    async def prepare_market_feed(self, symbol: Optional[str]) -> None:
+        if not symbol:
+            return
+        target = normalize_symbol(symbol)
+        if target == self.symbol:
+            return
+        self.engine.ensure_symbol(target)
+        self.symbol = target
+        self._last_bbo = None
+        self._update_market_config(get_sim_symbol_format(target))
+        await self._publish_bbo(target)
+
+    async def _drive_market(self, interval: float) -> None:
+        """Background market driver used for long-running simulations."""
+        try:
+            while self.running:
+                await asyncio.sleep(interval)
+                if self.symbol:
+                    self.engine.advance_market(self.symbol)
+        except asyncio.CancelledError:
+            pass
+
+    # ------------------------------------------------------------------ #
+    # Market data
+    # ------------------------------------------------------------------ #
+
+    def get_order_book(self, levels: Optional[int] = None) -> Optional[Any]:
+        if not self.symbol:
+            return None
+        return self.format_order_book(self.symbol, levels)
+
+    def format_order_book(self, symbol: str, levels: Optional[int] = None) -> dict:
+        book = self.engine.get_book(symbol)
+        bids, asks = book.depth(levels)
+        tick = self.venue_config.tick_size
+        step = self.venue_config.step_size
+        return {
+            "bids": [{"price": from_ticks(p, tick), "size": from_lots(s, step)} for p, s in bids],
+            "asks": [{"price": from_ticks(p, tick), "size": from_lots(s, step)} for p, s in asks],
+        }
+
+    # ------------------------------------------------------------------ #
+    # Engine event fan-out
+    # ------------------------------------------------------------------ #
+
+    def _on_engine_event(self, kind: str, payload: Any) -> None:
+        if not self.running:
+            return
+        if kind == "order":
+            if payload.owner == self.owner and self.order_update_callback is not None:
+                self._deliver(self.order_update_callback(payload))
+        elif kind == "book":
+            if payload == self.symbol and self._bbo_listeners:
+                self._deliver(self._publish_bbo(payload))
+
+    def _deliver(self, coro: Awaitable[None]) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop (engine driven from sync code) - drop the coroutine cleanly
+            coro.close()
+            return
+        if self._delay <= 0:
+            loop.create_task(coro)
+            return
+        # Keep delivery monotonic so later events never overtake earlier ones
+        deliver_at = max(loop.time() + self._delay, self._last_delivery_at)
+        self._last_delivery_at = deliver_at
+        loop.call_at(deliver_at, lambda: loop.create_task(coro))
+
+    async def _publish_bbo(self, symbol: str) -> None:
+        best_bid, best_ask = self.engine.get_bbo(symbol)
+        if best_bid is None or best_ask is None:
+            return
+        if self._last_bbo == (best_bid, best_ask):
+            return
+        self._last_bbo = (best_bid, best_ask)
+        self._bbo_sequence += 1
+        tick = self.venue_config.tick_size
+        await self._notify_bbo_update(
+            BBOData(
+                symbol=symbol,
+                bid=from_ticks(best_bid, tick),
+                ask=from_ticks(best_ask, tick),
+                timestamp=time.time(),
+                sequence=self._bbo_sequence,
+            )
+        )
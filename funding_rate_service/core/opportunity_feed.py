@@ -0,0 +1,458 @@
+"""
+Opportunity Feed
+
+Publishes each opportunity analysis run ("generation") from the funding rate
+service to strategy processes, so N account processes don't each rerun the
+latest-rates query and pairwise scoring every cycle.
+
+Flow:
+1. OpportunityTask computes every profitable opportunity once (no per-account
+   filters) and OpportunityFeedPublisher stores it as one compact, versioned
+   row in opportunity_generations.
+2. An insert trigger publishes the row id via Postgres NOTIFY (migration 020).
+3. OpportunityFeedSubscriber in each strategy process LISTENs, loads the new
+   row once, and answers find_opportunities-style queries locally with the
+   same filter semantics as OpportunityFinder.
+
+Strategy CPU and DB load per cycle become a local filter plus, per
+generation, one primary-key read, regardless of how many accounts run.
+"""
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from funding_rate_service.core.opportunity_finder import OpportunityFinder
+from funding_rate_service.models.filters import OpportunityFilter
+from funding_rate_service.models.opportunity import ArbitrageOpportunity
+from funding_rate_service.utils.logger import logger
+
+
+# Channel published by the opportunity_generations insert trigger
+FEED_CHANNEL = "opportunity_generations"
+
+# Bump when the encoded row layout changes; subscribers ignore unknown versions
+FEED_FORMAT_VERSION = 1
+
+# Opportunities per generation (all profitable pairs in practice)
+FEED_MAX_OPPORTUNITIES = 2000
+
+# Generations kept in the table (older rows are pruned on publish)
+FEED_RETAINED_GENERATIONS = 10
+
+# Generations older than this are not served (publisher runs every 60s)
+FEED_MAX_AGE_SECONDS = 180.0
+
+# Poll interval for new generations when LISTEN is unavailable, and the
+# safety-net interval while it is connected
+FALLBACK_POLL_INTERVAL_SECONDS = 15.0
+SAFETY_POLL_INTERVAL_SECONDS = 60.0
+
+# Delay before re-establishing a dropped listener connection
+LISTEN_RECONNECT_SECONDS = 5.0
+
+# Encoded column order (row = list of values in this order)
+FEED_FIELDS = (
+    "symbol",
+    "long_dex",
+    "short_dex",
+    "long_rate",
+    "short_rate",
+    "divergence",
+    "estimated_fees",
+    "net_profit_percent",
+    "annualized_apy",
+    "long_dex_volume_24h",
+    "short_dex_volume_24h",
+    "min_volume_24h",
+    "long_dex_oi_usd",
+    "short_dex_oi_usd",
+    "min_oi_usd",
+    "max_oi_usd",
+    "oi_ratio",
+    "oi_imbalance",
+    "long_dex_spread_bps",
+    "short_dex_spread_bps",
+    "avg_spread_bps",
+)
+
+_DECIMAL_FIELDS = frozenset({
+    "long_rate", "short_rate", "divergence", "estimated_fees", "net_profit_percent", "annualized_apy",
+    "long_dex_volume_24h", "short_dex_volume_24h", "min_volume_24h",
+    "long_dex_oi_usd", "short_dex_oi_usd", "min_oi_usd", "max_oi_usd", "oi_ratio",
+})
+
+_SELECT_GENERATION = """
+    SELECT id, format_version, payload
+    FROM opportunity_generations
+"""
+
+
+@dataclass
+class OpportunityGeneration:
+    """One published opportunity analysis run."""
+
+    generation_id: int
+    published_at: float  # Epoch seconds
+    opportunities: List[ArbitrageOpportunity]
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.published_at
+
+
+# ------------------------------------------------------------------------
+# Encoding
+# ------------------------------------------------------------------------
+
+
+def publish_filter() -> OpportunityFilter:
+    """Broadest filter: every profitable opportunity, ranked by net profit."""
+    filters = OpportunityFilter(
+        min_profit_percent=Decimal("0"),
+        min_divergence=Decimal("0"),
+        sort_by="net_profit_percent",
+        sort_desc=True,
+    )
+    # The API caps limit at 100; the feed must carry every candidate so local filtering is exact
+    return filters.model_copy(update={"limit": FEED_MAX_OPPORTUNITIES})
+
+
+def encode_generation(opportunities: List[ArbitrageOpportunity], published_at: Optional[float] = None) -> str:
+    """Compact JSON: field names once, then one value list per opportunity."""
+    rows = []
+    for opportunity in opportunities:
+        row = []
+        for field in FEED_FIELDS:
+            value = getattr(opportunity, field, None)
+            row.append(str(value) if isinstance(value, Decimal) else value)
+        rows.append(row)
+    return json.dumps(
+        {
+            "v": FEED_FORMAT_VERSION,
+            "ts": time.time() if published_at is None else published_at,
+            "fields": list(FEED_FIELDS),
+            "rows": rows,
+        },
+        separators=(",", ":"),
+    )
+
+
+def decode_generation(generation_id: int, payload: str) -> Optional[OpportunityGeneration]:
+    """Decode a stored generation; None for unknown format versions."""
+    data = json.loads(payload)
+    if data.get("v") != FEED_FORMAT_VERSION:
+        return None
+
+    published_at = float(data["ts"])
+    discovered_at = datetime.fromtimestamp(published_at, tz=timezone.utc).replace(tzinfo=None)
+    fields = data["fields"]
+    opportunities = []
+    for row in data["rows"]:
+        values: Dict[str, Any] = {}
+        for field, value in zip(fields, row):
+            if value is not None and field in _DECIMAL_FIELDS:
+                value = Decimal(value)
+            values[field] = value
+        values["discovered_at"] = discovered_at
+        opportunities.append(ArbitrageOpportunity(**values))
+    return OpportunityGeneration(generation_id=int(generation_id), published_at=published_at, opportunities=opportunities)
+
+
+# ------------------------------------------------------------------------
+# Local filtering (mirrors OpportunityFinder._create_opportunity)
+# ------------------------------------------------------------------------
+
+
+def _lower_all(values: Optional[List[str]]) -> Optional[List[str]]:
+    return [value.lower() for value in values] if values else None
+
+
+def matches_filters(opportunity: ArbitrageOpportunity, filters: OpportunityFilter) -> bool:
+    """Whether OpportunityFinder would have returned this opportunity for ``filters``."""
+    symbol = opportunity.symbol
+    long_dex = opportunity.long_dex.lower()
+    short_dex = opportunity.short_dex.lower()
+
+    # Untradeable marks are process-local, so they are applied by each subscriber
+    if not OpportunityFinder.is_symbol_tradeable(long_dex, symbol):
+        return False
+    if not OpportunityFinder.is_symbol_tradeable(short_dex, symbol):
+        return False
+
+    if filters.symbol and symbol != filters.symbol:
+        return False
+    if filters.min_divergence is not None and opportunity.divergence < filters.min_divergence:
+        return False
+    if filters.min_profit_percent is not None and opportunity.net_profit_percent < filters.min_profit_percent:
+        return False
+
+    if filters.dex and filters.dex.lower() not in (long_dex, short_dex):
+        return False
+    dex_pair = _lower_all(filters.dex_pair)
+    if dex_pair and not (long_dex in dex_pair and short_dex in dex_pair and long_dex != short_dex):
+        return False
+    dexes = _lower_all(filters.dexes)
+    if dexes and not (long_dex in dexes or short_dex in dexes):
+        return False
+    whitelist = _lower_all(filters.whitelist_dexes)
+    if whitelist and not (long_dex in whitelist and short_dex in whitelist):
+        return False
+    exclude = _lower_all(filters.exclude_dexes)
+    if exclude and (long_dex in exclude or short_dex in exclude):
+        return False
+    required_dex = filters.required_dex.lower() if filters.required_dex else None
+    if required_dex and required_dex not in (long_dex, short_dex):
+        return False
+
+    min_volume = opportunity.min_volume_24h
+    if filters.min_volume_24h and min_volume and min_volume < filters.min_volume_24h:
+        return False
+    if filters.max_volume_24h and min_volume and min_volume > filters.max_volume_24h:
+        return False
+
+    min_oi = opportunity.min_oi_usd
+    if filters.min_oi_usd and min_oi and min_oi < filters.min_oi_usd:
+        return False
+    if filters.max_oi_usd:
+        if required_dex:
+            target_oi = opportunity.long_dex_oi_usd if long_dex == required_dex else opportunity.short_dex_oi_usd
+            if target_oi is None or target_oi > filters.max_oi_usd:
+                return False
+        elif min_oi and min_oi > filters.max_oi_usd:
+            return False
+
+    oi_ratio = opportunity.oi_ratio
+    if filters.oi_ratio_min and oi_ratio and oi_ratio < filters.oi_ratio_min:
+        return False
+    if filters.oi_ratio_max and oi_ratio and oi_ratio > filters.oi_ratio_max:
+        return False
+
+    avg_spread = opportunity.avg_spread_bps
+    if filters.max_spread_bps and avg_spread and avg_spread > filters.max_spread_bps:
+        return False
+    return True
+
+
+def select_opportunities(
+    opportunities: List[ArbitrageOpportunity],
+    filters: OpportunityFilter,
+) -> List[ArbitrageOpportunity]:
+    """Filter, sort and limit a generation like OpportunityFinder.find_opportunities."""
+    selected = [opportunity for opportunity in opportunities if matches_filters(opportunity, filters)]
+    reverse = filters.sort_desc
+
+    def sort_key(opportunity: ArbitrageOpportunity):
+        value = getattr(opportunity, filters.sort_by, None)
+        if value is None:
+            return Decimal("-inf") if reverse else Decimal("inf")
+        return value
+
+    try:
+        selected.sort(key=sort_key, reverse=reverse)
+    except Exception:
+        selected.sort(key=lambda opportunity: opportunity.net_profit_percent, reverse=True)
+    return selected[:filters.limit]
+
+
+# ------------------------------------------------------------------------
+# Publisher (funding rate service)
+# ------------------------------------------------------------------------
+
+
+class OpportunityFeedPublisher:
+    """Stores opportunity generations; the insert trigger NOTIFYs subscribers."""
+
+    def __init__(self, database):
+        self.database = database
+
+    async def publish(self, opportunities: List[ArbitrageOpportunity]) -> int:
+        """
+        Publish one generation.
+
+        Returns:
+            The new generation id
+        """
+        payload = encode_generation(opportunities)
+        row = await self.database.fetch_one(
+            """
+            INSERT INTO opportunity_generations (format_version, opportunity_count, payload)
+            VALUES (:format_version, :opportunity_count, :payload)
+            RETURNING id
+            """,
+            {
+                "format_version": FEED_FORMAT_VERSION,
+                "opportunity_count": len(opportunities),
+                "payload": payload,
+            },
+        )
+        generation_id = int(row["id"])
+        await self.database.execute(
+            "DELETE FROM opportunity_generations WHERE id <= :cutoff",
+            {"cutoff": generation_id - FEED_RETAINED_GENERATIONS},
+        )
+        logger.debug(
+            f"Published opportunity generation {generation_id} "
+            f"({len(opportunities)} opportunities, {len(payload)} bytes)"
+        )
+        return generation_id
+
+
+# ------------------------------------------------------------------------
+# Subscriber (strategy processes)
+# ------------------------------------------------------------------------
+
+
+class OpportunityFeedSubscriber:
+    """
+    Keeps the latest published generation in memory.
+
+    A LISTEN connection loads each new generation as soon as it is published;
+    a slow poll of the newest row is the safety net (and the only source when
+    the backend has no LISTEN support). ``select`` returns None while no fresh
+    generation is available so callers can fall back to OpportunityFinder.
+
+    One subscriber can serve every strategy in a process: ``start``/``stop``
+    are reference counted, so the listener stops with its last user.
+    """
+
+    def __init__(self, database, max_age_seconds: float = FEED_MAX_AGE_SECONDS):
+        self.database = database
+        self.max_age_seconds = max_age_seconds
+        self.latest: Optional[OpportunityGeneration] = None
+        self._pending_ids: "asyncio.Queue[int]" = asyncio.Queue()
+        self._listen_task: Optional[asyncio.Task] = None
+        self._poll_task: Optional[asyncio.Task] = None
+        self._running = False
+        self._listening = False
+        self._users = 0
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def is_fresh(self) -> bool:
+        return self.latest is not None and self.latest.age <= self.max_age_seconds
+
+    def select(self, filters: OpportunityFilter) -> Optional[List[ArbitrageOpportunity]]:
+        """Opportunities matching ``filters`` from the latest fresh generation, else None."""
+        if not self.is_fresh():
+            return None
+        return select_opportunities(self.latest.opportunities, filters)
+
+    async def start(self) -> None:
+        self._users += 1
+        if self._running:
+            return
+        self._running = True
+        self._listen_task = asyncio.create_task(self._listen_loop(), name="opportunity-feed-listen")
+        self._poll_task = asyncio.create_task(self._poll_loop(), name="opportunity-feed-poll")
+
+    async def stop(self) -> None:
+        self._users = max(0, self._users - 1)
+        if self._users:
+            return
+        self._running = False
+        for task in (self._listen_task, self._poll_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        self._listen_task = None
+        self._poll_task = None
+
+    def _on_notify(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        """asyncpg listener callback: queue the generation id for loading."""
+        try:
+            self._pending_ids.put_nowait(int(payload))
+        except (TypeError, ValueError):
+            pass
+
+    async def _listen_loop(self) -> None:
+        while self._running:
+            try:
+                async with self.database.connection() as conn:
+                    raw_conn = conn.raw_connection
+                    if not hasattr(raw_conn, "add_listener"):
+                        logger.info("Database backend has no LISTEN support; polling the opportunity feed")
+                        return
+
+                    await raw_conn.add_listener(FEED_CHANNEL, self._on_notify)
+                    self._listening = True
+                    logger.info(f"Listening for opportunity generations on channel '{FEED_CHANNEL}'")
+                    # Catch up on whatever was published before LISTEN took effect
+                    await self.load_latest()
+                    try:
+                        while self._running and not raw_conn.is_closed():
+                            try:
+                                generation_id = await asyncio.wait_for(self._pending_ids.get(), timeout=5)
+                            except asyncio.TimeoutError:
+                                continue
+                            await self.load_generation(generation_id)
+                    finally:
+                        self._listening = False
+                        if not raw_conn.is_closed():
+                            await raw_conn.remove_listener(FEED_CHANNEL, self._on_notify)
+            except asyncio.CancelledError:
+                break
+            except Exception as exc:
+                self._listening = False
+                logger.error(f"Opportunity feed listener error: {exc}")
+
+            if self._running:
+                await asyncio.sleep(LISTEN_RECONNECT_SECONDS)
+
+    async def _poll_loop(self) -> None:
+        while self._running:
+            try:
+                if not self._listening:
+                    await self.load_latest()
+                interval = SAFETY_POLL_INTERVAL_SECONDS if self._listening else FALLBACK_POLL_INTERVAL_SECONDS
+                await asyncio.sleep(interval)
+                if self._listening:
+                    await self.load_latest()
+            except asyncio.CancelledError:
+                break
+            except Exception as exc:
+                logger.error(f"Opportunity feed poll error: {exc}")
+                await asyncio.sleep(FALLBACK_POLL_INTERVAL_SECONDS)
+
+    async def load_latest(self) -> Optional[OpportunityGeneration]:
+        """Load the newest published generation (if newer than the one held)."""
+        row = await self.database.fetch_one(_SELECT_GENERATION + " ORDER BY id DESC LIMIT 1")
+        return self._accept(row)
+
+    async def load_generation(self, generation_id: int) -> Optional[OpportunityGeneration]:
+        """Load a specific generation announced via NOTIFY."""
+        if self.latest is not None and generation_id <= self.latest.generation_id:
+            return self.latest
+        row = await self.database.fetch_one(
+            _SELECT_GENERATION + " WHERE id = :generation_id",
+            {"generation_id": generation_id},
+        )
+        return self._accept(row)
+
+    def _accept(self, row: Any) -> Optional[OpportunityGeneration]:
+        if row is None:
+            return self.latest
+        generation_id = int(row["id"])
+        if self.latest is not None and generation_id <= self.latest.generation_id:
+            return self.latest
+        if row["format_version"] != FEED_FORMAT_VERSION:
+            logger.warning(
+                f"Ignoring opportunity generation {generation_id} with format version {row['format_version']}"
+            )
+            return self.latest
+        generation = decode_generation(generation_id, row["payload"])
+        if generation is not None:
+            self.latest = generation
+            logger.debug(
+                f"Loaded opportunity generation {generation_id} ({len(generation.opportunities)} opportunities)"
+            )
+        return self.latest
@@ -5,6 +5,7 @@ Analyzes funding rates across multiple DEXs to find profitable arbitrage opportu
 Filters by volume, OI, spread, and other criteria.
 """
 
+import time
 from decimal import Decimal
 from typing import List, Optional, Dict
 from datetime import datetime
@@ -14,6 +15,15 @@ from funding_rate_service.models.filters import OpportunityFilter
 from database.connection import Database
 from funding_rate_service.core.mappers import DEXMapper, SymbolMapper
 from funding_rate_service.utils.logger import logger
+from helpers.metrics import REGISTRY
+
+OPPORTUNITY_SECONDS = REGISTRY.histogram(
+    "opportunity_computation_seconds",
+    "find_opportunities time, split into the rates fetch and the pairing/filtering",
+    ("phase",),
+)
+_FETCH_SECONDS = OPPORTUNITY_SECONDS.labels(phase="fetch")
+_COMPUTE_SECONDS = OPPORTUNITY_SECONDS.labels(phase="compute")
 
 
 class OpportunityFinder:
@@ -119,7 +129,10 @@ class OpportunityFinder:
         logger.debug(f"Finding opportunities with filters: {filters}")
         
         # Fetch latest funding rates with market data
+        started = time.perf_counter()
         rates_data = await self._fetch_latest_rates_with_market_data(filters)
+        fetched = time.perf_counter()
+        _FETCH_SECONDS.observe(fetched - started)
         
         if not rates_data:
             logger.warning("No funding rates available")
@@ -167,6 +180,7 @@ class OpportunityFinder:
         
         # Apply limit
         limited_opportunities = sorted_opportunities[:filters.limit]
+        _COMPUTE_SECONDS.observe(time.perf_counter() - fetched)
         
         logger.info(
             f"Found {len(opportunities)} raw opportunities, "
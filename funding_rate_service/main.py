@@ -8,7 +8,7 @@ Provides REST API endpoints for accessing funding rates, opportunities, and anal
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from database.connection import database
 from database.migration_manager import run_startup_migrations
@@ -19,6 +19,7 @@ from funding_rate_service.core.historical_analyzer import HistoricalAnalyzer
 from funding_rate_service.core.dependencies import services
 from funding_rate_service.api.routes import funding_rates, opportunities, dexes, health, tasks
 from funding_rate_service.utils.logger import logger
+from helpers.metrics import CONTENT_TYPE, REGISTRY
 
 
 # API version
@@ -186,6 +187,13 @@ async def ping():
     return {"status": "ok"}
 
 
+# Prometheus scrape target (collection latency, opportunity timing, DB queries, tasks)
+@app.get("/metrics")
+async def metrics():
+    """Process metrics in Prometheus text format"""
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
 if __name__ == "__main__":
     import uvicorn
     
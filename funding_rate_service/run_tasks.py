@@ -13,6 +13,7 @@ Usage:
 """
 
 import asyncio
+import os
 import signal
 import sys
 import argparse
@@ -29,6 +30,7 @@ from database.connection import database
 from database.migration_manager import run_startup_migrations
 from funding_rate_service.core.mappers import dex_mapper, symbol_mapper
 from funding_rate_service.utils.logger import logger
+from helpers.metrics import serve_metrics
 
 
 class TaskRunner:
@@ -49,6 +51,7 @@ class TaskRunner:
         self.args = args
         self.scheduler = None
         self.running = False
+        self.metrics_runner = None
         
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -104,6 +107,12 @@ class TaskRunner:
             await self.scheduler.start()
             logger.info("✅ Task scheduler started")
             
+            # Expose collection/task metrics (this process has no API server)
+            metrics_port = self.args.metrics_port or int(os.getenv("METRICS_PORT", "0"))
+            if metrics_port:
+                self.metrics_runner = await serve_metrics("0.0.0.0", metrics_port)
+                logger.info(f"✅ Metrics served on :{metrics_port}/metrics")
+            
             # Print schedule information
             self._print_schedule_info()
             
@@ -181,6 +190,10 @@ class TaskRunner:
                 await self.scheduler.shutdown()
                 logger.info("✅ Task scheduler stopped")
             
+            if self.metrics_runner:
+                await self.metrics_runner.cleanup()
+                self.metrics_runner = None
+            
             await database.disconnect()
             logger.info("✅ Database disconnected")
             
@@ -272,6 +285,13 @@ For VPS deployment:
         help='Run all tasks once and exit (useful for testing)'
     )
     
+    parser.add_argument(
+        '--metrics-port',
+        type=int,
+        default=None,
+        help='Serve Prometheus metrics on this port (default: $METRICS_PORT, off if unset)'
+    )
+    
     parser.add_argument(
         '--log-level',
         choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
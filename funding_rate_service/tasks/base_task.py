@@ -12,6 +12,14 @@ from typing import Dict, Any, Optional
 from dataclasses import dataclass
 
 from funding_rate_service.utils.logger import logger
+from helpers.metrics import REGISTRY
+
+TASK_DURATION = REGISTRY.histogram(
+    "background_task_duration_seconds",
+    "Background task run time by outcome",
+    ("task", "status"),
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+)
 
 
 @dataclass
@@ -199,6 +207,7 @@ class BaseTask(ABC):
         self.metrics.successful_runs += 1
         self.metrics.last_run_time = datetime.utcnow()
         self.metrics.last_success_time = datetime.utcnow()
+        TASK_DURATION.labels(task=self.task_name, status="success").observe(duration_ms / 1000)
         
         # Update average duration
         self.metrics.total_duration_ms += duration_ms
@@ -211,6 +220,7 @@ class BaseTask(ABC):
         self.metrics.last_run_time = datetime.utcnow()
         self.metrics.last_error_time = datetime.utcnow()
         self.metrics.last_error_message = error_message
+        TASK_DURATION.labels(task=self.task_name, status="failed").observe(duration_ms / 1000)
         
         # Update average duration (include failed runs)
         self.metrics.total_duration_ms += duration_ms
@@ -11,6 +11,7 @@ from decimal import Decimal
 
 from funding_rate_service.tasks.base_task import BaseTask
 from funding_rate_service.core.opportunity_finder import OpportunityFinder
+from funding_rate_service.core.opportunity_feed import OpportunityFeedPublisher, publish_filter
 from funding_rate_service.core.fee_calculator import fee_calculator
 from funding_rate_service.core.mappers import dex_mapper, symbol_mapper
 from database.connection import database
@@ -25,8 +26,9 @@ class OpportunityTask(BaseTask):
     This task:
     1. Analyzes latest funding rates to find arbitrage opportunities
     2. Calculates profitability after fees
-    3. Caches top opportunities for fast API responses
-    4. Tracks opportunity metrics and trends
+    3. Publishes every profitable opportunity to the strategy feed
+    4. Caches top opportunities for fast API responses
+    5. Tracks opportunity metrics and trends
     
     Designed for VPS 24/7 operation with intelligent caching.
     """
@@ -41,6 +43,7 @@ class OpportunityTask(BaseTask):
         super().__init__("opportunity_analysis", max_retries)
         self.opportunity_finder = None
         self._finder_initialized = False
+        self.feed_publisher = OpportunityFeedPublisher(database)
         
         # Cache for frequently requested opportunity types
         self._opportunity_cache = {
@@ -102,6 +105,14 @@ class OpportunityTask(BaseTask):
             'analysis_timestamp': datetime.utcnow().isoformat()
         }
         
+        # 0. Publish the full generation for strategy processes (filtered locally per account)
+        try:
+            feed_opportunities = await finder.find_opportunities(filters=publish_filter())
+            analysis_results['generation_id'] = await self.feed_publisher.publish(feed_opportunities)
+            analysis_results['generation_size'] = len(feed_opportunities)
+        except Exception as e:
+            logger.warning(f"Failed to publish opportunity generation: {e}")
+        
         # 1. Find best overall opportunities
         logger.debug("Finding best overall opportunities...")
         best_opportunities = await finder.find_opportunities(
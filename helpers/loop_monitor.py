@@ -0,0 +1,416 @@
+"""
+Event loop health monitoring for strategy processes.
+
+EventLoopMonitor measures scheduling lag continuously and, while a stall is in
+progress, samples the loop thread's stack from a watchdog thread, so the
+blocking call itself (a synchronous REST request, ``subprocess.run`` inside a
+coroutine, ...) shows up rather than whatever runs after it. It also installs
+a task factory that accounts CPU time per task name (monitor loop, websocket
+listeners, liquidation consumers, ...).
+
+Snapshots are served by the control API (``/api/v1/diagnostics/loop``), lag
+samples feed the ``event_loop_lag_seconds`` histogram on ``/metrics``, and a
+summary is logged periodically.
+
+Environment:
+    LOOP_MONITOR_ENABLED          Enable the monitor (default: true)
+    LOOP_LAG_THRESHOLD_MS         Lag that counts as a stall (default: 250)
+    LOOP_MONITOR_SUMMARY_SECONDS  Summary log interval, 0 disables (default: 300)
+    LOOP_MONITOR_TASK_CPU         Per-task CPU accounting (default: true)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections.abc
+import os
+import re
+import sys
+import threading
+import time
+import traceback
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+
+from helpers.metrics import REGISTRY
+from helpers.unified_logger import log_throttled
+
+_UNNAMED_TASK = re.compile(r"^Task-\d+$")
+UNNAMED_TASKS = "<unnamed>"
+
+LOOP_LAG_SECONDS = REGISTRY.histogram(
+    "event_loop_lag_seconds",
+    "Event loop scheduling lag per monitor sample",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+
+@dataclass(slots=True)
+class StallSample:
+    """One event loop stall: when it started, how long it lasted and what was running."""
+
+    started_at: float
+    lag_seconds: float
+    task: Optional[str] = None
+    stack: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class TaskCpuStats:
+    """CPU time consumed by all tasks sharing a name."""
+
+    name: str
+    cpu_seconds: float = 0.0
+    steps: int = 0
+    live: int = 0
+    finished: int = 0
+
+
+class _TimedCoroutine(collections.abc.Coroutine):
+    """Coroutine proxy that accounts thread CPU time spent in each step."""
+
+    __slots__ = ("_coro", "cpu_time", "steps")
+
+    def __init__(self, coro) -> None:
+        self._coro = coro
+        self.cpu_time = 0.0
+        self.steps = 0
+
+    def send(self, value):
+        start = time.thread_time()
+        try:
+            return self._coro.send(value)
+        finally:
+            self.cpu_time += time.thread_time() - start
+            self.steps += 1
+
+    def throw(self, typ, val=None, tb=None):
+        start = time.thread_time()
+        try:
+            if val is None and tb is None:
+                return self._coro.throw(typ)
+            return self._coro.throw(typ, val, tb)
+        finally:
+            self.cpu_time += time.thread_time() - start
+            self.steps += 1
+
+    def close(self):
+        return self._coro.close()
+
+    def __await__(self):
+        return self._coro.__await__()
+
+    # Introspection used by Task.get_stack()/repr()
+    @property
+    def cr_frame(self):
+        return getattr(self._coro, "cr_frame", None)
+
+    @property
+    def cr_await(self):
+        return getattr(self._coro, "cr_await", None)
+
+    @property
+    def cr_running(self):
+        return getattr(self._coro, "cr_running", False)
+
+    @property
+    def cr_code(self):
+        return getattr(self._coro, "cr_code", None)
+
+
+def _task_group(task: asyncio.Task) -> str:
+    name = task.get_name()
+    return UNNAMED_TASKS if _UNNAMED_TASK.match(name) else name
+
+
+def _format_stack(frame, limit: int) -> List[str]:
+    """Innermost-last ``file:line in func: code`` lines for a frame."""
+    summary = traceback.extract_stack(frame, limit=None)[-limit:]
+    return [
+        f"{entry.filename}:{entry.lineno} in {entry.name}: {entry.line or ''}".rstrip(": ")
+        for entry in summary
+    ]
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class EventLoopMonitor:
+    """
+    Measures event loop lag, captures stacks of stalls and accounts per-task CPU.
+
+    Start it from inside the loop it should watch; stop it before the loop closes.
+    """
+
+    def __init__(
+        self,
+        *,
+        logger=None,
+        interval: float = 0.1,
+        lag_threshold: float = 0.25,
+        summary_interval: float = 300.0,
+        track_task_cpu: bool = True,
+        window: int = 3000,
+        max_stalls: int = 50,
+        stack_limit: int = 25,
+    ) -> None:
+        self._logger = logger
+        self.interval = interval
+        self.lag_threshold = lag_threshold
+        self.summary_interval = summary_interval
+        self.track_task_cpu = track_task_cpu
+        self._stack_limit = stack_limit
+
+        self._lags: Deque[float] = deque(maxlen=window)
+        self._samples = 0
+        self._max_lag = 0.0
+        self._stall_count = 0
+        self._stalls: Deque[StallSample] = deque(maxlen=max_stalls)
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._heartbeat = time.monotonic()
+        # Stall captured by the watchdog, completed by the sampler once the loop resumes
+        self._pending_stall: Optional[StallSample] = None
+        self._pending_beat: Optional[float] = None
+
+        self._previous_factory = None
+        self._finished_cpu: Dict[str, TaskCpuStats] = {}
+
+    @classmethod
+    def from_env(cls, logger=None) -> Optional["EventLoopMonitor"]:
+        """Monitor configured from LOOP_* environment variables, or None if disabled."""
+        if os.getenv("LOOP_MONITOR_ENABLED", "true").lower() not in ("true", "1", "yes"):
+            return None
+        return cls(
+            logger=logger,
+            lag_threshold=float(os.getenv("LOOP_LAG_THRESHOLD_MS", "250")) / 1000.0,
+            summary_interval=float(os.getenv("LOOP_MONITOR_SUMMARY_SECONDS", "300")),
+            track_task_cpu=os.getenv("LOOP_MONITOR_TASK_CPU", "true").lower() in ("true", "1", "yes"),
+        )
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Begin monitoring the running loop in the background."""
+        if self.running:
+            return
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop.clear()
+
+        if self.track_task_cpu:
+            self._previous_factory = loop.get_task_factory()
+            loop.set_task_factory(self._task_factory)
+
+        self._task = loop.create_task(self._run(), name="loop-monitor")
+        self._watchdog = threading.Thread(target=self._watch, name="loop-monitor-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        """Stop monitoring and restore the loop's previous task factory."""
+        self._stop.set()
+        if self._loop is not None and self._loop.get_task_factory() == self._task_factory:
+            self._loop.set_task_factory(self._previous_factory)
+        self._previous_factory = None
+
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:  # pragma: no cover - expected on shutdown
+                pass
+            finally:
+                self._task = None
+        if self._watchdog:
+            await asyncio.to_thread(self._watchdog.join, 1.0)
+            self._watchdog = None
+
+    # ------------------------------------------------------------------
+    # Lag sampling (loop side) and stall capture (watchdog thread)
+    # ------------------------------------------------------------------
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_summary = loop.time() + self.summary_interval if self.summary_interval > 0 else None
+        while True:
+            expected = loop.time() + self.interval
+            self._heartbeat = time.monotonic()
+            await asyncio.sleep(self.interval)
+            now = loop.time()
+            self._record_lag(max(0.0, now - expected))
+
+            if next_summary is not None and now >= next_summary:
+                next_summary = now + self.summary_interval
+                if self._logger:
+                    self._logger.info(self.format_summary())
+
+    def _record_lag(self, lag: float) -> None:
+        LOOP_LAG_SECONDS.observe(lag)
+        self._lags.append(lag)
+        self._samples += 1
+        if lag > self._max_lag:
+            self._max_lag = lag
+        if lag < self.lag_threshold:
+            return
+
+        stall = self._pending_stall
+        if stall is None or self._pending_beat is None:
+            # Watchdog missed it (e.g. a stall just over the threshold)
+            stall = StallSample(started_at=time.time() - lag, lag_seconds=lag)
+        stall.lag_seconds = lag
+        self._pending_stall = None
+        self._pending_beat = None
+        self._stall_count += 1
+        self._stalls.append(stall)
+
+        location = stall.stack[-1] if stall.stack else "stack not captured"
+        log_throttled(
+            self._logger,
+            lambda: (
+                f"⏱️ Event loop stalled {lag * 1000:.0f}ms "
+                f"(task: {stall.task or 'n/a'}) at {location}"
+            ),
+            "WARNING",
+            interval=10.0,
+        )
+
+    def _watch(self) -> None:
+        check_every = max(0.01, self.lag_threshold / 4)
+        while not self._stop.wait(check_every):
+            beat = self._heartbeat
+            stalled_for = time.monotonic() - beat - self.interval
+            if stalled_for < self.lag_threshold or self._pending_beat == beat:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            task = asyncio.current_task(self._loop) if self._loop is not None else None
+            self._pending_stall = StallSample(
+                started_at=time.time() - stalled_for,
+                lag_seconds=stalled_for,
+                task=task.get_name() if task is not None else None,
+                stack=_format_stack(frame, self._stack_limit),
+            )
+            self._pending_beat = beat
+            del frame
+
+    # ------------------------------------------------------------------
+    # Per-task CPU accounting
+    # ------------------------------------------------------------------
+
+    def _task_factory(self, loop, coro, context=None):
+        timed = _TimedCoroutine(coro)
+        if self._previous_factory is not None:
+            if context is None:
+                task = self._previous_factory(loop, timed)
+            else:
+                task = self._previous_factory(loop, timed, context=context)
+        else:
+            task = asyncio.Task(timed, loop=loop, context=context)
+        task.add_done_callback(self._on_task_done)
+        return task
+
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        coro = task.get_coro()
+        if not isinstance(coro, _TimedCoroutine):
+            return
+        name = _task_group(task)
+        stats = self._finished_cpu.get(name)
+        if stats is None:
+            stats = self._finished_cpu[name] = TaskCpuStats(name=name)
+        stats.cpu_seconds += coro.cpu_time
+        stats.steps += coro.steps
+        stats.finished += 1
+
+    def task_stats(self, limit: Optional[int] = 20) -> List[TaskCpuStats]:
+        """CPU per task name (finished + live tasks), highest first."""
+        totals: Dict[str, TaskCpuStats] = defaultdict(lambda: TaskCpuStats(name=""))
+        for name, stats in self._finished_cpu.items():
+            totals[name] = TaskCpuStats(name, stats.cpu_seconds, stats.steps, 0, stats.finished)
+        if self._loop is not None:
+            for task in asyncio.all_tasks(self._loop):
+                coro = task.get_coro()
+                if not isinstance(coro, _TimedCoroutine):
+                    continue
+                name = _task_group(task)
+                stats = totals[name]
+                stats.name = name
+                stats.cpu_seconds += coro.cpu_time
+                stats.steps += coro.steps
+                stats.live += 1
+        ranked = sorted(totals.values(), key=lambda s: s.cpu_seconds, reverse=True)
+        return ranked[:limit] if limit else ranked
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-ready view of lag, recent stalls and task CPU."""
+        lags = sorted(self._lags)
+        return {
+            "running": self.running,
+            "lag": {
+                "interval_ms": self.interval * 1000,
+                "threshold_ms": self.lag_threshold * 1000,
+                "samples": self._samples,
+                "current_ms": round(self._lags[-1] * 1000, 3) if self._lags else 0.0,
+                "p50_ms": round(_percentile(lags, 50) * 1000, 3),
+                "p99_ms": round(_percentile(lags, 99) * 1000, 3),
+                "max_ms": round(self._max_lag * 1000, 3),
+            },
+            "stalls": {
+                "count": self._stall_count,
+                "recent": [asdict(stall) for stall in reversed(self._stalls)],
+            },
+            "tasks": [
+                {
+                    "name": stats.name,
+                    "cpu_seconds": round(stats.cpu_seconds, 6),
+                    "steps": stats.steps,
+                    "live": stats.live,
+                    "finished": stats.finished,
+                }
+                for stats in self.task_stats()
+            ] if self.track_task_cpu else [],
+        }
+
+    def format_summary(self, top: int = 5) -> str:
+        lags = sorted(self._lags)
+        parts = [
+            f"📈 Event loop: lag p50={_percentile(lags, 50) * 1000:.1f}ms "
+            f"p99={_percentile(lags, 99) * 1000:.1f}ms max={self._max_lag * 1000:.1f}ms, "
+            f"stalls={self._stall_count}"
+        ]
+        if self.track_task_cpu:
+            busiest = ", ".join(
+                f"{stats.name}={stats.cpu_seconds:.2f}s" for stats in self.task_stats(limit=top)
+            )
+            if busiest:
+                parts.append(f"task CPU: {busiest}")
+        return " | ".join(parts)
+
+
+__all__ = [
+    "EventLoopMonitor",
+    "StallSample",
+    "TaskCpuStats",
+    "UNNAMED_TASKS",
+]
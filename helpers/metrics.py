@@ -0,0 +1,354 @@
+"""
+Process-wide metrics registry with Prometheus text exposition.
+
+Counters, gauges and fixed-bucket histograms are registered once (get-or-create
+by name) on the shared ``REGISTRY`` and rendered by the ``/metrics`` endpoints
+of the control server and the funding rate service.
+
+Updates take no lock: a labelled child is a plain object whose fields are
+bumped in place, which is safe on the event loop thread (and close enough for
+the rare update from a worker thread). Only creating a new label combination
+takes the registry lock, so hot paths should resolve ``labels(...)`` once and
+keep the child.
+
+Example:
+    >>> ORDERS = REGISTRY.counter("orders_total", "Orders placed", ("venue",))
+    >>> lighter_orders = ORDERS.labels(venue="lighter")
+    >>> lighter_orders.inc()
+    >>> with REGISTRY.histogram("db_query_seconds", "DB query time").time():
+    ...     ...
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; spans sub-millisecond book handling up to slow REST collections
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_text(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    """Shared label handling; subclasses define the child type and rendering."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames: Tuple[str, ...] = tuple(labelnames)
+        self._children: Dict[LabelValues, object] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._children[()] = self._new_child()
+
+    def _new_child(self):  # pragma: no cover - abstract
+        raise NotImplementedError
+
+    def labels(self, *values: str, **kwargs: str):
+        """Child for one label combination (created on first use)."""
+        if kwargs:
+            values = tuple(str(kwargs[name]) for name in self.labelnames)
+        else:
+            values = tuple(str(value) for value in values)
+        child = self._children.get(values)
+        if child is not None:
+            return child
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+        with self._lock:
+            return self._children.setdefault(values, self._new_child())
+
+    def _unlabelled(self):
+        if self.labelnames:
+            raise ValueError(f"{self.name} has labels {self.labelnames}; use labels(...)")
+        return self._children[()]
+
+    def samples(self) -> Iterable[Tuple[str, str, float]]:  # pragma: no cover - abstract
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        lines.extend(f"{name}{labels} {_format_value(value)}" for name, labels, value in self.samples())
+        return lines
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    def inc(self, amount: float = 1) -> None:
+        self.value += amount
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1) -> None:
+        self._unlabelled().value += amount
+
+    def samples(self):
+        for values, child in list(self._children.items()):
+            yield self.name, _label_text(self.labelnames, values), child.value
+
+
+class _GaugeChild:
+    __slots__ = ("value", "_function")
+
+    def __init__(self) -> None:
+        self.value = 0.0
+        self._function: Optional[Callable[[], Optional[float]]] = None
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self.value -= amount
+
+    def set_function(self, function: Callable[[], Optional[float]]) -> None:
+        """
+        Read the value from ``function`` at scrape time.
+
+        Bound methods are held weakly, so registering an object's accessor does
+        not keep the object alive; the gauge reads as absent once it is gone.
+        """
+        if hasattr(function, "__self__") and hasattr(function, "__func__"):
+            ref = weakref.WeakMethod(function)
+
+            def read() -> Optional[float]:
+                method = ref()
+                return method() if method is not None else None
+
+            self._function = read
+        else:
+            self._function = function
+
+    def read(self) -> Optional[float]:
+        if self._function is None:
+            return self.value
+        try:
+            return self._function()
+        except Exception:
+            return None
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, or be computed at scrape time."""
+
+    kind = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self._unlabelled().set(value)
+
+    def inc(self, amount: float = 1) -> None:
+        self._unlabelled().inc(amount)
+
+    def dec(self, amount: float = 1) -> None:
+        self._unlabelled().dec(amount)
+
+    def set_function(self, function: Callable[[], Optional[float]]) -> None:
+        self._unlabelled().set_function(function)
+
+    def samples(self):
+        for values, child in list(self._children.items()):
+            value = child.read()
+            if value is not None:
+                yield self.name, _label_text(self.labelnames, values), float(value)
+
+
+class _Timer:
+    __slots__ = ("_child", "_start")
+
+    def __init__(self, child: "_HistogramChild") -> None:
+        self._child = child
+
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._child.observe(time.perf_counter() - self._start)
+
+
+class _HistogramChild:
+    __slots__ = ("_bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self._bounds = bounds
+        # One slot per bound plus the +Inf overflow; cumulated when rendered
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self._bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def time(self) -> _Timer:
+        """Context manager observing the elapsed wall time of its block."""
+        return _Timer(self)
+
+
+class Histogram(_Metric):
+    """Observations counted into fixed buckets (upper bounds, inclusive)."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        bounds = tuple(sorted(float(bound) for bound in buckets if bound != math.inf))
+        if not bounds:
+            raise ValueError(f"{name} needs at least one finite bucket")
+        self.buckets = bounds
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._unlabelled().observe(value)
+
+    def time(self) -> _Timer:
+        return self._unlabelled().time()
+
+    def samples(self):
+        for values, child in list(self._children.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), list(child.counts)):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket", _label_text(self.labelnames, values, le), cumulative
+            labels = _label_text(self.labelnames, values)
+            yield f"{self.name}_sum", labels, child.sum
+            yield f"{self.name}_count", labels, child.count
+
+
+class MetricsRegistry:
+    """Named metrics of one process; registration is get-or-create."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs):
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if type(existing) is not cls or existing.labelnames != tuple(labelnames):
+                    raise ValueError(f"Metric {name} already registered as {existing.kind} {existing.labelnames}")
+                return existing
+            metric = cls(name, documentation, labelnames, **kwargs)
+            self._metrics[name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format (0.0.4)."""
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+async def serve_metrics(host: str, port: int, registry: MetricsRegistry = REGISTRY):
+    """
+    Serve ``GET /metrics`` on its own port, for processes without a FastAPI app
+    (e.g. the funding rate task runner). Returns the aiohttp AppRunner; call
+    ``await runner.cleanup()`` to stop it.
+    """
+    from aiohttp import web
+
+    async def handle(_request):
+        return web.Response(body=registry.render().encode(), headers={"Content-Type": CONTENT_TYPE})
+
+    app = web.Application()
+    app.router.add_get("/metrics", handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    return runner
+
+
+__all__ = [
+    "CONTENT_TYPE",
+    "Counter",
+    "DEFAULT_LATENCY_BUCKETS",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "REGISTRY",
+    "serve_metrics",
+]
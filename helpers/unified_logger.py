@@ -8,15 +8,97 @@ Provides consistent, colored, and informative logging across all components:
 - Core utilities
 
 Based on loguru with enhanced formatting and component-specific context.
+
+Hot paths (per-tick / per-message code) should avoid paying for records nobody
+keeps:
+- Pass a callable instead of an f-string to build the message only when the
+  level is enabled: ``logger.debug(lambda: f"BBO {bid}/{ask}")``
+- ``logger.is_enabled("DEBUG")`` is a cheap check before expensive work
+- ``logger.throttled(...)`` logs a call site at most once per interval and
+  reports how many records it suppressed; ``logger.sampled(...)`` keeps 1 in N
+- ``log_throttled(obj, ...)`` does the same for duck-typed component loggers
+
+File sinks log at DEBUG unless LOG_FILE_LEVEL is set (e.g. LOG_FILE_LEVEL=INFO
+makes disabled debug calls nearly free).
 """
 
 import os
 import sys
+import time
 from datetime import datetime
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
 from loguru import logger as _logger
 from pathlib import Path
 
+# A message, or a zero-argument callable that builds it only when needed
+Message = Union[str, Callable[[], str]]
+
+_LEVEL_NO = {"TRACE": 5, "DEBUG": 10, "INFO": 20, "SUCCESS": 25, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+DEFAULT_THROTTLE_INTERVAL = 5.0
+
+
+def _file_log_level() -> str:
+    return os.getenv("LOG_FILE_LEVEL", "DEBUG").upper()
+
+
+def _call_site(depth: int) -> Tuple[str, int]:
+    """(filename, line) of the frame ``depth`` levels above the caller."""
+    frame = sys._getframe(depth + 1)
+    return frame.f_code.co_filename, frame.f_lineno
+
+
+class LogThrottle:
+    """
+    Per-key gates for rate-limited and sampled log records.
+
+    ``admit`` lets one record per key through each ``interval`` seconds and
+    returns how many were suppressed since the last one (None = suppress).
+    ``sample`` lets the first and then every ``every``-th record through and
+    returns how many were seen since the last one.
+    """
+
+    def __init__(self) -> None:
+        self._windows: Dict[Hashable, List[float]] = {}
+        self._samples: Dict[Hashable, int] = {}
+
+    def admit(self, key: Hashable, interval: float, now: Optional[float] = None) -> Optional[int]:
+        if now is None:
+            now = time.monotonic()
+        window = self._windows.get(key)
+        if window is None:
+            self._windows[key] = [now + interval, 0]
+            return 0
+        if now < window[0]:
+            window[1] += 1
+            return None
+        suppressed = int(window[1])
+        window[0] = now + interval
+        window[1] = 0
+        return suppressed
+
+    def sample(self, key: Hashable, every: int) -> Optional[int]:
+        seen = self._samples.get(key, 0)
+        self._samples[key] = seen + 1
+        if seen % every:
+            return None
+        return every if seen else 1
+
+    def reset(self) -> None:
+        self._windows.clear()
+        self._samples.clear()
+
+
+# Shared by every logger so instances of the same component share call-site budgets
+log_throttle = LogThrottle()
+
+
+def _with_suppressed(message: str, suppressed: int) -> str:
+    if not suppressed:
+        return message
+    return f"{message} (+{suppressed} similar suppressed)"
+
 
 class UnifiedLogger:
     """
@@ -204,19 +286,16 @@ class UnifiedLogger:
                     
                     return result
 
-                def format_record(record):
+                @lru_cache(maxsize=4096)
+                def _source_location(module_name: str, function_name: str, line_number: int) -> str:
                     """
-                    Format log record with fixed-width origin column.
+                    Fixed-width origin column for one call site.
                     
                     Ensures all log messages align at the same column by:
                     1. Ellipsizing module path (preserving root and final module)
                     2. Always showing function:line
                     3. Left-aligning to fixed width
                     """
-                    module_name = record.get("module") or record.get("name", "")
-                    function_name = record.get("function", "")
-                    line_number = record.get("line", 0)
-                    
                     # Fixed width for entire origin column
                     max_width = 40
                     
@@ -244,7 +323,15 @@ class UnifiedLogger:
                     
                     # Left-align to EXACTLY max_width characters
                     # This ensures ALL log messages start at the same column
-                    record["extra"]["short_name"] = f"{source_location:<{max_width}}"
+                    return f"{source_location:<{max_width}}"
+
+                def format_record(record):
+                    """Attach the (cached) origin column for the record's call site."""
+                    record["extra"]["short_name"] = _source_location(
+                        record.get("module") or record.get("name", ""),
+                        record.get("function", ""),
+                        record.get("line", 0),
+                    )
                     return True
                 
                 console_format = (
@@ -317,7 +404,7 @@ class UnifiedLogger:
             handler_id = _logger.add(
                 str(history_file),
                 format=history_format,
-                level="DEBUG",
+                level=_file_log_level(),
                 filter=ensure_component,
                 backtrace=False,
                 diagnose=False,
@@ -364,7 +451,7 @@ class UnifiedLogger:
             handler_id = _logger.add(
                 str(session_file),
                 format=session_format,
-                level="DEBUG",
+                level=_file_log_level(),
                 filter=ensure_component_session,
                 backtrace=False,
                 diagnose=False,
@@ -376,22 +463,49 @@ class UnifiedLogger:
         
         # Bind component context to all log records
         self._logger = _logger.bind(component_id=self.component_id)
+        # depth=1 skips these wrapper methods and shows the real caller
+        self._caller = self._logger.opt(depth=1)
     
-    def debug(self, message: str, **kwargs):
-        """Log debug message."""
-        self._logger.opt(depth=1).debug(message, **kwargs)
+    # ------------------------------------------------------------------
+    # Level checks and lazy messages
+    # ------------------------------------------------------------------
     
-    def info(self, message: str, **kwargs):
+    @staticmethod
+    def is_enabled(level: str) -> bool:
+        """
+        True if any sink would keep a record at ``level``.
+        
+        Cheap enough to guard expensive message construction on hot paths.
+        """
+        return _LEVEL_NO.get(level.upper(), 20) >= _logger._core.min_level
+    
+    def debug(self, message: Message, **kwargs):
+        """Log debug message (callables are only evaluated when DEBUG is enabled)."""
+        if callable(message):
+            if _LEVEL_NO["DEBUG"] < _logger._core.min_level:
+                return
+            message = message()
+        self._caller.debug(message, **kwargs)
+    
+    def info(self, message: Message, **kwargs):
         """Log info message."""
-        self._logger.opt(depth=1).info(message, **kwargs)
+        if callable(message):
+            if _LEVEL_NO["INFO"] < _logger._core.min_level:
+                return
+            message = message()
+        self._caller.info(message, **kwargs)
     
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: Message, **kwargs):
         """Log warning message."""
-        self._logger.opt(depth=1).warning(message, **kwargs)
+        if callable(message):
+            message = message()
+        self._caller.warning(message, **kwargs)
     
-    def error(self, message: str, **kwargs):
+    def error(self, message: Message, **kwargs):
         """Log error message."""
-        self._logger.opt(depth=1).error(message, **kwargs)
+        if callable(message):
+            message = message()
+        self._caller.error(message, **kwargs)
     
     def exception(self, message: str, **kwargs):
         """
@@ -402,33 +516,84 @@ class UnifiedLogger:
         """
         self._logger.opt(depth=1).error(message, exc_info=True, **kwargs)
     
-    def critical(self, message: str, **kwargs):
+    def critical(self, message: Message, **kwargs):
         """Log critical message."""
-        self._logger.opt(depth=1).critical(message, **kwargs)
+        if callable(message):
+            message = message()
+        self._caller.critical(message, **kwargs)
     
-    def log(self, message: str, level: str = "INFO", **kwargs):
+    def log(self, message: Message, level: str = "INFO", **kwargs):
         """
         Backward compatibility method for existing .log() calls.
         
         Args:
-            message: Log message
+            message: Log message (or a callable building it)
             level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
             **kwargs: Additional context
         """
         level = level.upper()
-        # Use depth=1 to skip this wrapper method and show the real caller
-        if level == "DEBUG":
-            self._logger.opt(depth=1).debug(message, **kwargs)
-        elif level == "INFO":
-            self._logger.opt(depth=1).info(message, **kwargs)
-        elif level == "WARNING":
-            self._logger.opt(depth=1).warning(message, **kwargs)
-        elif level == "ERROR":
-            self._logger.opt(depth=1).error(message, **kwargs)
-        elif level == "CRITICAL":
-            self._logger.opt(depth=1).critical(message, **kwargs)
-        else:
-            self._logger.opt(depth=1).info(message, **kwargs)
+        if level not in _LEVEL_NO:
+            level = "INFO"
+        if callable(message):
+            if _LEVEL_NO[level] < _logger._core.min_level:
+                return
+            message = message()
+        self._caller.log(level, message, **kwargs)
+    
+    # ------------------------------------------------------------------
+    # Rate-limited / sampled records
+    # ------------------------------------------------------------------
+    
+    def throttled(
+        self,
+        message: Message,
+        level: str = "WARNING",
+        *,
+        interval: float = DEFAULT_THROTTLE_INTERVAL,
+        key: Optional[Hashable] = None,
+        **kwargs,
+    ):
+        """
+        Log at most once per ``interval`` seconds per call site (or ``key``).
+        
+        The next record that gets through notes how many were suppressed.
+        
+        Example:
+            logger.throttled(lambda: f"Stale book for {symbol}", "WARNING", interval=10)
+        """
+        level = level.upper()
+        if _LEVEL_NO.get(level, 20) < _logger._core.min_level:
+            return
+        site = (self.component_id, key if key is not None else _call_site(1))
+        suppressed = log_throttle.admit(site, interval)
+        if suppressed is None:
+            return
+        if callable(message):
+            message = message()
+        self._caller.log(level, _with_suppressed(message, suppressed), **kwargs)
+    
+    def sampled(
+        self,
+        message: Message,
+        level: str = "DEBUG",
+        *,
+        every: int = 100,
+        key: Optional[Hashable] = None,
+        **kwargs,
+    ):
+        """Log the first and then every ``every``-th record per call site (or ``key``)."""
+        level = level.upper()
+        if _LEVEL_NO.get(level, 20) < _logger._core.min_level:
+            return
+        site = (self.component_id, key if key is not None else _call_site(1))
+        seen = log_throttle.sample(site, every)
+        if seen is None:
+            return
+        if callable(message):
+            message = message()
+        if seen > 1:
+            message = f"{message} (1 of {seen} sampled)"
+        self._caller.log(level, message, **kwargs)
     
     def log_transaction(self, order_id: str, side: str, quantity: Any, price: Any, status: str):
         """
@@ -638,3 +803,38 @@ def log_stage(
     _emit(border_line)
     _emit(label)
     _emit(border_line)
+
+
+def log_throttled(
+    logger_obj: Any,
+    message: Message,
+    level: str = "WARNING",
+    *,
+    interval: float = DEFAULT_THROTTLE_INTERVAL,
+    key: Optional[Hashable] = None,
+    depth: int = 0,
+) -> None:
+    """
+    Rate-limited log for any logger object (UnifiedLogger, loguru, stdlib-style).
+    
+    Used by components that receive an arbitrary logger (order books, websocket
+    helpers). Without ``key`` the budget is per call site; ``depth`` moves that
+    call site up the stack for ``_log``-style wrappers.
+    """
+    if logger_obj is None:
+        return
+    level = level.upper()
+    site = (id(logger_obj), key if key is not None else _call_site(depth + 1))
+    suppressed = log_throttle.admit(site, interval)
+    if suppressed is None:
+        return
+    if callable(message):
+        message = message()
+    message = _with_suppressed(message, suppressed)
+    
+    if isinstance(logger_obj, UnifiedLogger):
+        logger_obj.log(message, level)
+    elif hasattr(logger_obj, level.lower()):
+        getattr(logger_obj, level.lower())(message)
+    elif hasattr(logger_obj, "log"):
+        logger_obj.log(message, level)
@@ -0,0 +1,264 @@
+"""
+Multi-Account Runtime - several funding arbitrage accounts in one process.
+
+Each account keeps its own TradingBot: credentials, exchange clients, order and
+account streams, position manager and notifications. What is not account
+specific is shared by the process:
+
+- the event loop and its EventLoopMonitor
+- the database pool and dex/symbol mappers (module globals already)
+- one OpportunityFeedSubscriber (one LISTEN connection, one decoded generation)
+- venue metadata caches (contract ids, market ids, tick sizes, min notionals)
+- public books, when the host's market-data daemon is enabled (SHARED_MARKET_DATA=1)
+- one control API server, which routes position and reload requests by account
+
+With --proxy-mode session, SessionProxyManager routes the whole process
+through one proxy, so hosted accounts must share it (or use none). With
+--proxy-mode client every exchange client has its own ProxyTransport over its
+account's proxies, so accounts with different proxies can share the process.
+
+Usage:
+    python runbot.py --config configs/funding.yml --accounts acc1,acc2,acc3
+    python runbot.py --config configs/funding.yml --accounts acc1,acc2 --enable-proxy --proxy-mode client
+"""
+
+import asyncio
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from exchange_clients.market_data.shared_book import shared_market_data_enabled
+from helpers.loop_monitor import EventLoopMonitor
+from helpers.networking import ProxyHealthMonitor
+from helpers.unified_logger import get_logger
+from networking import ProxySelector, SessionProxyManager
+from networking.models import ProxyEndpoint
+from trading_bot import TradingBot, TradingConfig
+
+
+@dataclass
+class HostedAccount:
+    """One account of the runtime: its strategy config, credentials and proxies."""
+
+    name: str
+    config: TradingConfig
+    credentials: Optional[Dict[str, Dict[str, Any]]] = None
+    proxy_selector: Optional[ProxySelector] = None
+
+
+def shared_proxy(selectors: Dict[str, Optional[ProxySelector]]) -> Optional[ProxyEndpoint]:
+    """
+    The session proxy every account resolves to.
+
+    Args:
+        selectors: Each account's proxy selector (None when it has no proxies)
+
+    Returns:
+        The common proxy, or None when no account has one
+
+    Raises:
+        ValueError: If the accounts resolve to different proxies (or only some have one)
+    """
+    proxies = {
+        name: selector.current_proxy() if selector else None
+        for name, selector in selectors.items()
+    }
+    if len({proxy.id if proxy else None for proxy in proxies.values()}) > 1:
+        detail = ", ".join(f"{name}={proxy.label if proxy else 'none'}" for name, proxy in proxies.items())
+        raise ValueError(
+            f"Accounts in one process must share a session proxy ({detail}); "
+            "use --proxy-mode client or run them in separate processes"
+        )
+    return next(iter(proxies.values()), None)
+
+
+class MultiAccountRuntime:
+    """Runs one hosted TradingBot per account on a shared event loop."""
+
+    def __init__(self, accounts: List[HostedAccount], *, logger=None):
+        """
+        Build every account's bot and wire up the shared state.
+
+        Args:
+            accounts: Accounts to host (funding_arbitrage configs, unique names)
+            logger: Optional logger (defaults to a "bot" logger for the runtime)
+
+        Raises:
+            ValueError: If no accounts are given, names repeat, or a config is
+                        not a funding_arbitrage strategy
+        """
+        if not accounts:
+            raise ValueError("Multi-account runtime needs at least one account")
+        names = [account.name for account in accounts]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Accounts listed more than once: {', '.join(duplicates)}")
+        unsupported = [account.name for account in accounts if account.config.strategy != "funding_arbitrage"]
+        if unsupported:
+            raise ValueError(f"Only funding_arbitrage accounts can share a process (not: {', '.join(unsupported)})")
+
+        self.logger = logger or get_logger(
+            "bot", "multi_account", context={"accounts": len(accounts)}, log_to_console=True
+        )
+        self.bots: Dict[str, TradingBot] = {
+            account.name: TradingBot(
+                account.config,
+                account_credentials=account.credentials,
+                proxy_selector=account.proxy_selector,
+                hosted=True,
+            )
+            for account in accounts
+        }
+        self.opportunity_feed = self._share_opportunity_feed()
+        self._share_metadata()
+
+        self._loop_monitor: Optional[EventLoopMonitor] = EventLoopMonitor.from_env(logger=self.logger)
+        self._proxy_health_monitor: Optional[ProxyHealthMonitor] = None
+        self._control_server: Optional[Any] = None  # uvicorn.Server
+        self._control_server_task: Optional[asyncio.Task] = None
+        self._control_server_enabled = os.getenv("CONTROL_API_ENABLED", "false").lower() in ("true", "1", "yes")
+        self._shutdown_requested = False
+        self._force_shutdown_requested = False
+
+    # Signal handlers (runbot) flip these on the runtime as they would on a bot
+
+    @property
+    def shutdown_requested(self) -> bool:
+        return self._shutdown_requested
+
+    @shutdown_requested.setter
+    def shutdown_requested(self, value: bool) -> None:
+        self._shutdown_requested = value
+        for bot in self.bots.values():
+            bot.shutdown_requested = value
+
+    @property
+    def _force_shutdown(self) -> bool:
+        return self._force_shutdown_requested
+
+    @_force_shutdown.setter
+    def _force_shutdown(self, value: bool) -> None:
+        self._force_shutdown_requested = value
+        for bot in self.bots.values():
+            bot._force_shutdown = value
+
+    @property
+    def strategies(self) -> Dict[str, Any]:
+        """Hosted strategies keyed by account name."""
+        return {name: bot.strategy for name, bot in self.bots.items()}
+
+    def _share_opportunity_feed(self):
+        """Point every strategy using the opportunity feed at the first one's subscriber."""
+        feed = None
+        for bot in self.bots.values():
+            if getattr(bot.strategy, "opportunity_feed", None) is None:
+                continue
+            if feed is None:
+                feed = bot.strategy.opportunity_feed
+            else:
+                bot.strategy.opportunity_feed = feed
+        return feed
+
+    def _share_metadata(self) -> None:
+        """Let same-venue clients share the first client's metadata caches (before connect)."""
+        donors: Dict[type, Any] = {}
+        for bot in self.bots.values():
+            for client in (bot.exchange_clients or {}).values():
+                donor = donors.setdefault(type(client), client)
+                if donor is not client:
+                    client.adopt_shared_metadata(donor)
+
+    async def run(self) -> None:
+        """Run every account until shutdown; one account failing does not stop the others."""
+        if self._loop_monitor:
+            self._loop_monitor.start()
+
+        if SessionProxyManager.is_active():
+            # Report only: rotating would move every account off its assigned proxy
+            self._proxy_health_monitor = ProxyHealthMonitor(
+                logger=self.logger,
+                interval_seconds=1800.0,
+                timeout=10.0,
+            )
+            self._proxy_health_monitor.start()
+
+        if self._control_server_enabled:
+            await self._start_control_server()
+
+        if not shared_market_data_enabled():
+            self.logger.info(
+                "Each account subscribes to its own public books; start the market-data daemon "
+                "and set SHARED_MARKET_DATA=1 to share them"
+            )
+
+        self.logger.info(f"Hosting accounts: {', '.join(self.bots)}")
+        try:
+            await asyncio.gather(*(self._run_account(name, bot) for name, bot in self.bots.items()))
+        finally:
+            await self._stop_shared_services()
+
+    async def _run_account(self, name: str, bot: TradingBot) -> None:
+        try:
+            await bot.run()
+        except Exception as exc:
+            # TradingBot.run has already shut this account down
+            self.logger.error(f"Account {name} stopped after a critical error: {exc}")
+
+    async def graceful_shutdown(self, reason: str = "Unknown") -> None:
+        """Shut every account down, then the services they share."""
+        self.logger.info(f"🛑 Graceful shutdown initiated: {reason}")
+        self.shutdown_requested = True
+        await asyncio.gather(
+            *(bot.graceful_shutdown(reason) for bot in self.bots.values()),
+            return_exceptions=True,
+        )
+        await self._stop_shared_services()
+
+    async def _start_control_server(self) -> None:
+        """Serve the control API for every hosted account on one port."""
+        try:
+            import uvicorn
+            from strategies.control.funding_arb_controller import FundingArbStrategyController
+            from strategies.control.server import app, set_loop_monitor, set_strategy_controller
+
+            set_strategy_controller(FundingArbStrategyController(strategies=self.strategies))
+            set_loop_monitor(self._loop_monitor)
+
+            host = os.getenv("CONTROL_API_HOST", "127.0.0.1")
+            port = int(os.getenv("CONTROL_API_PORT", "8766"))
+            server = uvicorn.Server(
+                uvicorn.Config(app=app, host=host, port=port, log_level="warning", access_log=False, loop="asyncio")
+            )
+            # Shutdown signals stay with runbot's handlers, which stop every account
+            server.install_signal_handlers = lambda: None
+            self._control_server = server
+            self._control_server_task = asyncio.create_task(server.serve(), name="control-api-server")
+            self.logger.info(f"✅ Control API for {len(self.bots)} accounts on http://{host}:{port}")
+        except Exception as exc:
+            # Trading continues without the API
+            self.logger.error(f"Failed to start control API server: {exc}")
+
+    async def _stop_shared_services(self) -> None:
+        if self._control_server_task:
+            if self._control_server:
+                self._control_server.should_exit = True
+            try:
+                await asyncio.wait_for(self._control_server_task, timeout=5.0)
+            except (asyncio.TimeoutError, asyncio.CancelledError, Exception):
+                self._control_server_task.cancel()
+            self._control_server_task = None
+            self._control_server = None
+
+        if self._proxy_health_monitor:
+            try:
+                await asyncio.wait_for(self._proxy_health_monitor.stop(), timeout=5.0)
+            except (asyncio.TimeoutError, Exception):
+                pass
+            self._proxy_health_monitor = None
+
+        if self._loop_monitor and self._loop_monitor.running:
+            self.logger.info(self._loop_monitor.format_summary())
+            try:
+                await asyncio.wait_for(self._loop_monitor.stop(), timeout=5.0)
+            except (asyncio.TimeoutError, Exception):
+                pass
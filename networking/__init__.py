@@ -1,18 +1,21 @@
 """
-Networking helpers for process-wide proxy management.
+Networking helpers for process-wide and per-client proxy management.
 
 This package centralises proxy modelling, database retrieval, selection,
-and session-level enablement so trading processes can transparently route
-traffic through per-account proxies.
+session-level enablement and per-client transports so trading processes can
+transparently route traffic through per-account proxies.
 """
 
 from .models import ProxyEndpoint, ProxyAssignment
 from .selector import ProxySelector
 from .session_proxy import SessionProxyManager
+from .transport import ProxyHealth, ProxyTransport
 
 __all__ = [
     "ProxyAssignment",
     "ProxyEndpoint",
+    "ProxyHealth",
     "ProxySelector",
+    "ProxyTransport",
     "SessionProxyManager",
 ]
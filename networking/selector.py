@@ -82,6 +82,12 @@ class ProxySelector:
         """Reset cursor to the first entry."""
         self._cursor = 0
 
+    def fork(self) -> "ProxySelector":
+        """Return an independent selector over the same assignments, at the same cursor."""
+        forked = ProxySelector(self._assignments)
+        forked._cursor = self._cursor
+        return forked
+
     def has_active_proxy(self) -> bool:
         return bool(self._active_pool())
 
@@ -61,6 +61,11 @@ class SessionProxyManager:
     def is_active(cls) -> bool:
         return cls._active_proxy is not None
 
+    @classmethod
+    def current(cls) -> Optional[ProxyEndpoint]:
+        """Return the enabled proxy, if any."""
+        return cls._active_proxy
+
     @classmethod
     def describe(cls, *, mask_password: bool = True) -> Optional[str]:
         proxy = cls._active_proxy
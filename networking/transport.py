@@ -0,0 +1,475 @@
+"""
+Per-client proxy transport.
+
+SessionProxyManager routes the whole process through one proxy by patching
+``socket.socket`` and the proxy environment variables. A ProxyTransport is
+owned by a single exchange client instead: it holds that client's keep-alive
+aiohttp pool, opens its websockets through the client's current proxy and
+scores the proxy from the client's own traffic. When the score drops, only
+this transport moves on to the next proxy, so the other clients of the
+account - and other accounts in the process, with their own proxies - keep
+their connections.
+
+Usage:
+    transport = ProxyTransport(selector, name="acc1/aster", logger=logger)
+    async with transport.request("GET", url, params=params) as response:
+        ...
+    ws = await transport.connect_websocket("wss://fstream.asterdex.com/ws/...")
+    await transport.close()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+from urllib.parse import urlparse
+
+import aiohttp
+import socks
+import websockets
+
+from helpers.metrics import REGISTRY
+
+from .models import ProxyEndpoint
+from .selector import ProxySelector
+from .session_proxy import SessionProxyManager
+
+DEFAULT_POOL_LIMIT = 32
+DEFAULT_KEEPALIVE_TIMEOUT = 30.0
+DEFAULT_CONNECT_TIMEOUT = 15.0
+DEFAULT_REQUEST_TIMEOUT = 30.0
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_MIN_SCORE = 0.5
+DEFAULT_ROTATE_COOLDOWN = 60.0
+DEFAULT_RETIRE_GRACE = 30.0
+
+# EWMA weight of the latest outcome; 0.2 lets four straight failures sink a perfect score below 0.5
+HEALTH_ALPHA = 0.2
+# The score alone only condemns a proxy once it has seen this many requests
+MIN_SCORED_SAMPLES = 10
+
+HTTP_PROXY_PROTOCOLS = frozenset({"http", "https"})
+
+# Tunnel types for websockets; HTTP proxies are used through CONNECT over plain TCP
+_TUNNEL_TYPES = {
+    "http": socks.HTTP,
+    "https": socks.HTTP,
+    "socks4": socks.SOCKS4,
+    "socks4a": socks.SOCKS4,
+    "socks5": socks.SOCKS5,
+    "socks5h": socks.SOCKS5,
+}
+
+# Failures that say something about the route to the venue rather than the request
+TRANSPORT_ERRORS = (
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientHttpProxyError,
+    asyncio.TimeoutError,
+    OSError,
+)
+
+# Responses that fault the route: the proxy refusing us (407) or a failing upstream (5xx)
+PROXY_AUTH_REQUIRED = 407
+
+
+def _is_route_failure(status: int) -> bool:
+    return status == PROXY_AUTH_REQUIRED or status >= 500
+
+
+PROXY_HEALTH = REGISTRY.gauge(
+    "proxy_health_score", "Health score of each client's proxy (1 = recent traffic all succeeded)", ("client",)
+)
+PROXY_ROTATIONS = REGISTRY.counter("proxy_rotations_total", "Proxy rotations per client", ("client",))
+
+
+@dataclass(slots=True)
+class ProxyHealth:
+    """Outcome statistics for the proxy a transport is currently using."""
+
+    score: float = 1.0
+    latency: Optional[float] = None  # EWMA seconds to response headers / handshake
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    last_error: Optional[str] = None
+
+    @property
+    def samples(self) -> int:
+        return self.successes + self.failures
+
+    def record_success(self, latency: Optional[float] = None) -> None:
+        self.score += HEALTH_ALPHA * (1.0 - self.score)
+        self.successes += 1
+        self.consecutive_failures = 0
+        if latency is not None:
+            self.latency = latency if self.latency is None else self.latency + HEALTH_ALPHA * (latency - self.latency)
+
+    def record_failure(self, error: BaseException) -> None:
+        self.score -= HEALTH_ALPHA * self.score
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.last_error = f"{type(error).__name__}: {error}"
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "score": round(self.score, 3),
+            "latency_ms": round(self.latency * 1000, 1) if self.latency is not None else None,
+            "successes": self.successes,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "last_error": self.last_error,
+        }
+
+
+class ProxyTransport:
+    """
+    Connection pool, websocket factory and proxy health for one exchange client.
+
+    Without a selector the transport connects directly and is only a
+    keep-alive pool. While SessionProxyManager routes the process, the session
+    proxy takes precedence and this transport never rotates.
+    """
+
+    def __init__(
+        self,
+        selector: Optional[ProxySelector] = None,
+        *,
+        name: str = "client",
+        logger: Optional[Any] = None,
+        pool_limit: int = DEFAULT_POOL_LIMIT,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        min_score: float = DEFAULT_MIN_SCORE,
+        rotate_cooldown: float = DEFAULT_ROTATE_COOLDOWN,
+        retire_grace: float = DEFAULT_RETIRE_GRACE,
+    ):
+        """
+        Args:
+            selector: The account's proxies (None = direct). The transport works
+                      on a fork, so its rotations do not move other clients.
+            name: Label for logs and metrics (e.g. "acc1/lighter")
+            logger: Optional logger with ``log(message, level)``
+            pool_limit: Maximum simultaneous connections in the pool
+            keepalive_timeout: Seconds an idle pooled connection is kept
+            connect_timeout: Seconds to establish a connection or tunnel
+            request_timeout: Default total seconds for ``request()`` calls
+            failure_threshold: Consecutive failures that make the proxy unhealthy
+            min_score: Health score below which the proxy is unhealthy
+            rotate_cooldown: Minimum seconds between two rotations
+            retire_grace: Seconds the previous pool stays open after a rotation
+        """
+        self._selector = selector.fork() if selector else None
+        self.name = name
+        self.logger = logger
+        self.pool_limit = pool_limit
+        self.keepalive_timeout = keepalive_timeout
+        self.connect_timeout = connect_timeout
+        self.request_timeout = request_timeout
+        self.failure_threshold = failure_threshold
+        self.min_score = min_score
+        self.rotate_cooldown = rotate_cooldown
+        self.retire_grace = retire_grace
+
+        self.health = ProxyHealth()
+        self.rotations = 0
+        self._last_rotation = float("-inf")
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._retired: List[aiohttp.ClientSession] = []
+        self._retire_tasks: Set[asyncio.Task] = set()
+        self._openapi_clients: List[Any] = []
+        self._rotations_total = PROXY_ROTATIONS.labels(client=name)
+        if self._selector is not None:
+            PROXY_HEALTH.labels(client=name).set_function(self._health_score)
+
+    def _log(self, message: str, level: str = "INFO") -> None:
+        if self.logger and hasattr(self.logger, "log"):
+            self.logger.log(message, level)
+
+    # ------------------------------------------------------------------
+    # Route
+    # ------------------------------------------------------------------
+
+    @property
+    def owns_proxy(self) -> bool:
+        """True when the route comes from this transport's selector (and may rotate)."""
+        return self._selector is not None and not SessionProxyManager.is_active()
+
+    @property
+    def proxy(self) -> Optional[ProxyEndpoint]:
+        """Proxy that new connections go through (None = direct)."""
+        session_proxy = SessionProxyManager.current()
+        if session_proxy is not None:
+            # SOCKS session proxies already apply through the patched socket module
+            return session_proxy if session_proxy.protocol in HTTP_PROXY_PROTOCOLS else None
+        return self._selector.current_proxy() if self._selector else None
+
+    def describe(self) -> str:
+        proxy = self.proxy
+        return proxy.masked_label() if proxy else "direct"
+
+    def _health_score(self) -> Optional[float]:
+        return self.health.score if self.owns_proxy else None
+
+    def request_kwargs(self) -> Dict[str, Any]:
+        """``proxy``/``proxy_auth`` arguments for aiohttp calls (empty when direct or SOCKS)."""
+        proxy = self.proxy
+        if proxy is None or proxy.protocol not in HTTP_PROXY_PROTOCOLS:
+            return {}
+        kwargs: Dict[str, Any] = {"proxy": proxy.endpoint}
+        if proxy.username:
+            kwargs["proxy_auth"] = aiohttp.BasicAuth(proxy.username, proxy.password or "")
+        return kwargs
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+
+    async def session(self) -> aiohttp.ClientSession:
+        """The keep-alive pool for the current proxy (created on first use)."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=self._connector(),
+                # No total timeout: websockets live on this session too
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=self.connect_timeout),
+                # The route is decided here, never by *_PROXY variables
+                trust_env=False,
+            )
+        return self._session
+
+    def _connector(self) -> aiohttp.BaseConnector:
+        proxy = self.proxy
+        options = {"limit": self.pool_limit, "keepalive_timeout": self.keepalive_timeout}
+        if proxy is None or proxy.protocol in HTTP_PROXY_PROTOCOLS:
+            return aiohttp.TCPConnector(**options)
+        try:
+            from aiohttp_socks import ProxyConnector
+        except ImportError as exc:
+            raise RuntimeError(
+                f"aiohttp-socks is required for SOCKS proxies on per-client connections ({self.name}). "
+                "Install with 'pip install aiohttp-socks' or use an HTTP proxy."
+            ) from exc
+        return ProxyConnector.from_url(proxy.url_with_auth(), **options)
+
+    @asynccontextmanager
+    async def request(self, method: str, url: str, **kwargs: Any) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        ``session.request(...)`` on the pool, through the proxy.
+
+        Only the connect and header phase feeds the health score: errors raised
+        while the caller handles the response are not the route's fault.
+        """
+        session = await self.session()
+        kwargs.setdefault("timeout", aiohttp.ClientTimeout(total=self.request_timeout))
+        started = time.perf_counter()
+        try:
+            response = await session.request(method, url, **self.request_kwargs(), **kwargs)
+        except TRANSPORT_ERRORS as exc:
+            self.record_failure(exc)
+            raise
+        async with response:
+            if _is_route_failure(response.status):
+                self.record_failure(
+                    aiohttp.ClientResponseError(
+                        response.request_info, response.history, status=response.status, message=response.reason or ""
+                    )
+                )
+            else:
+                self.record_success(time.perf_counter() - started)
+            yield response
+
+    async def ws_connect(self, url: str, **kwargs: Any) -> aiohttp.ClientWebSocketResponse:
+        """aiohttp websocket on the pool, through the proxy."""
+        session = await self.session()
+        started = time.perf_counter()
+        try:
+            ws = await session.ws_connect(url, **self.request_kwargs(), **kwargs)
+        except TRANSPORT_ERRORS as exc:
+            self.record_failure(exc)
+            raise
+        self.record_success(time.perf_counter() - started)
+        return ws
+
+    async def connect_websocket(self, url: str, **kwargs: Any):
+        """
+        ``websockets.connect(url, **kwargs)`` through the proxy.
+
+        The tunnel is opened with PySocks (HTTP CONNECT or SOCKS) and handed to
+        websockets as a connected socket. Such a connection keeps its tunnel
+        after a rotation until it is reconnected.
+        """
+        proxy = self.proxy
+        started = time.perf_counter()
+        try:
+            if proxy is not None:
+                parsed = urlparse(url)
+                secure = parsed.scheme == "wss"
+                kwargs["sock"] = await asyncio.to_thread(
+                    self._open_tunnel, proxy, parsed.hostname, parsed.port or (443 if secure else 80)
+                )
+                if secure:
+                    kwargs.setdefault("server_hostname", parsed.hostname)
+            ws = await websockets.connect(url, **kwargs)
+        except TRANSPORT_ERRORS as exc:
+            self.record_failure(exc)
+            raise
+        self.record_success(time.perf_counter() - started)
+        return ws
+
+    def _open_tunnel(self, proxy: ProxyEndpoint, host: str, port: int) -> socket.socket:
+        proxy_type = _TUNNEL_TYPES.get(proxy.protocol)
+        if proxy_type is None:
+            raise ValueError(f"Unsupported proxy protocol for websockets: {proxy.protocol}")
+        tunnel = socks.create_connection(
+            (host, port),
+            timeout=self.connect_timeout,
+            proxy_type=proxy_type,
+            proxy_addr=proxy.host,
+            proxy_port=proxy.port,
+            proxy_rdns=True,
+            proxy_username=proxy.username,
+            proxy_password=proxy.password,
+        )
+        # Hand asyncio a plain socket; the tunnel is already established
+        return socket.socket(fileno=tunnel.detach())
+
+    def bind_openapi_client(self, api_client: Any) -> None:
+        """
+        Route an OpenAPI-generated SDK client (e.g. lighter's ApiClient) through the proxy.
+
+        The SDK keeps its own aiohttp pool; only its proxy settings are managed
+        here, and re-applied after a rotation.
+
+        Raises:
+            ValueError: If the proxy is SOCKS (the generated clients only speak HTTP proxies)
+        """
+        proxy = self.proxy
+        if proxy is not None and proxy.protocol not in HTTP_PROXY_PROTOCOLS:
+            raise ValueError(f"{self.name}: SDK REST calls need an HTTP proxy, not {proxy.protocol}")
+        if api_client not in self._openapi_clients:
+            self._openapi_clients.append(api_client)
+        self._apply_openapi_proxy(api_client)
+
+    def _apply_openapi_proxy(self, api_client: Any) -> None:
+        kwargs = self.request_kwargs()
+        proxy_url = kwargs.get("proxy")
+        proxy_headers = None
+        if "proxy_auth" in kwargs:
+            proxy_headers = {"Proxy-Authorization": kwargs["proxy_auth"].encode()}
+        for target in (getattr(api_client, "configuration", None), getattr(api_client, "rest_client", None)):
+            if target is not None:
+                target.proxy = proxy_url
+                target.proxy_headers = proxy_headers
+
+    # ------------------------------------------------------------------
+    # Health and rotation
+    # ------------------------------------------------------------------
+
+    def record_success(self, latency: Optional[float] = None) -> None:
+        self.health.record_success(latency)
+
+    def record_failure(self, error: BaseException) -> None:
+        """Count a failed connection or request; rotates when the proxy turns unhealthy."""
+        self.health.record_failure(error)
+        if self.owns_proxy and self.is_unhealthy():
+            self.rotate(
+                f"{self.health.consecutive_failures} consecutive failures, "
+                f"score {self.health.score:.2f}, last error {self.health.last_error}"
+            )
+
+    def is_unhealthy(self) -> bool:
+        health = self.health
+        if health.consecutive_failures >= self.failure_threshold:
+            return True
+        return health.samples >= MIN_SCORED_SAMPLES and health.score < self.min_score
+
+    def rotate(self, reason: str = "requested") -> Optional[ProxyEndpoint]:
+        """
+        Move this transport to its next proxy.
+
+        New requests and websockets use the new proxy immediately. The previous
+        pool is closed after ``retire_grace`` seconds so in-flight requests can
+        finish; aiohttp websockets on it drop then and reconnect through the
+        new proxy.
+
+        Returns:
+            The new proxy, or None when rotation is not possible (no own
+            selector, cooldown not over, or no other proxy to move to)
+        """
+        if not self.owns_proxy:
+            return None
+        now = time.monotonic()
+        if now - self._last_rotation < self.rotate_cooldown:
+            return None
+        # Also throttles the warning below when there is nothing to rotate to
+        self._last_rotation = now
+
+        previous = self._selector.current_proxy()
+        proxy = self._selector.rotate()
+        if proxy is None or previous is None or proxy.id == previous.id:
+            self._log(f"⚠️ [{self.name}] Proxy unhealthy ({reason}) and no other proxy to rotate to", "WARNING")
+            return None
+
+        self.rotations += 1
+        self._rotations_total.inc()
+        self.health = ProxyHealth()
+        self._retire_session()
+        for api_client in self._openapi_clients:
+            self._apply_openapi_proxy(api_client)
+        self._log(
+            f"🔁 [{self.name}] Proxy {previous.label} unhealthy ({reason}); now using {proxy.masked_label()}",
+            "WARNING",
+        )
+        return proxy
+
+    def _retire_session(self) -> None:
+        session, self._session = self._session, None
+        if session is None or session.closed:
+            return
+        self._retired.append(session)
+        try:
+            task = asyncio.get_running_loop().create_task(self._close_retired(session))
+        except RuntimeError:
+            return  # No loop: close() will take care of it
+        self._retire_tasks.add(task)
+        task.add_done_callback(self._retire_tasks.discard)
+
+    async def _close_retired(self, session: aiohttp.ClientSession) -> None:
+        await asyncio.sleep(self.retire_grace)
+        if session in self._retired:
+            self._retired.remove(session)
+        await session.close()
+
+    def status(self) -> Dict[str, Any]:
+        """Route and health summary for logs and status endpoints."""
+        return {
+            "client": self.name,
+            "proxy": self.describe(),
+            "rotations": self.rotations,
+            **self.health.as_dict(),
+        }
+
+    async def close(self) -> None:
+        """Close the pool and any retired pools."""
+        for task in list(self._retire_tasks):
+            task.cancel()
+        sessions = [session for session in (self._session, *self._retired) if session is not None]
+        self._session = None
+        self._retired.clear()
+        self._openapi_clients.clear()
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+
+
+__all__ = [
+    "HTTP_PROXY_PROTOCOLS",
+    "ProxyHealth",
+    "ProxyTransport",
+    "TRANSPORT_ERRORS",
+]
@@ -4,6 +4,7 @@ Modular Trading Bot - Config-driven launcher.
 
 Usage:
     python runbot.py --config configs/my_strategy.yml [--env-file .env]
+    python runbot.py --config configs/funding.yml --accounts acc1,acc2   # one process, several accounts
 
 Generate configs via:
     python -m trading_config.config_builder
@@ -11,19 +12,23 @@ Generate configs via:
 
 import argparse
 import asyncio
+import copy
 import logging
 import signal
 from pathlib import Path
 import sys
 import dotenv
 from decimal import Decimal
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple, Union
 from trading_bot import TradingBot, TradingConfig
 import os
 
 from networking import ProxySelector, SessionProxyManager
 from helpers.networking import detect_egress_ip
 
+if TYPE_CHECKING:
+    from multi_account_runtime import MultiAccountRuntime
+
 
 def parse_arguments():
     """Parse command line arguments (config-only workflow)."""
@@ -54,6 +59,14 @@ def parse_arguments():
         help="Account name to load credentials from database (e.g., 'acc1'). "
              "If provided, credentials will be loaded from the database instead of env vars.",
     )
+
+    parser.add_argument(
+        "--accounts",
+        type=str,
+        default=None,
+        help="Comma-separated account names to run in this one process (funding_arbitrage only), "
+             "sharing market data, metadata caches and the control API. Replaces --account.",
+    )
     
     parser.add_argument(
         "--log-level",
@@ -69,6 +82,17 @@ def parse_arguments():
         action="store_true",
         help="Enable the account's configured proxy assignments for this session (disabled by default).",
     )
+
+    parser.add_argument(
+        "--proxy-mode",
+        choices=["session", "client"],
+        default="session",
+        help=(
+            "How --enable-proxy routes traffic: 'session' patches the whole process onto one proxy; "
+            "'client' gives each exchange client its own proxied connection pool that rotates on its "
+            "own health (Lighter and Aster only). Default: session."
+        ),
+    )
     
     parser.add_argument(
         "--enable-control-api",
@@ -205,14 +229,45 @@ async def load_account_context(account_name: str) -> Tuple[dict, Optional[ProxyS
         await db.disconnect()
 
 
+async def enable_session_proxy(proxy) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Route the process through ``proxy`` and confirm its egress IP.
+
+    Returns:
+        Tuple of (masked proxy url, egress ip, ip source); all None if enabling failed.
+    """
+    try:
+        SessionProxyManager.enable(proxy)
+    except Exception as exc:
+        print(f"⚠️ Failed to enable session proxy ({exc})\n")
+        return None, None, None
+
+    active_proxy_display = proxy.url_with_auth(mask_password=True)
+    print(f"✓ Session proxy enabled: {proxy.label} -> {active_proxy_display}\n")
+    ip_result = await detect_egress_ip()
+    if ip_result.address:
+        print(
+            f"✓ Proxy egress IP confirmed: {ip_result.address} "
+            f"(via {ip_result.source})\n"
+        )
+        return active_proxy_display, ip_result.address, ip_result.source
+
+    failure_reason = ip_result.error or "no response"
+    print(
+        "⚠️ Unable to confirm proxy egress IP "
+        f"(reason: {failure_reason})\n"
+    )
+    return active_proxy_display, None, None
+
+
 async def load_account_credentials(account_name: str) -> dict:
     """Backward-compatible helper returning only credentials."""
     credentials, _ = await load_account_context(account_name)
     return credentials
 
 
-# Global bot instance for signal handling
-_bot_instance: Optional[TradingBot] = None
+# Global bot instance for signal handling (a MultiAccountRuntime behaves like a bot here)
+_bot_instance: Optional[Union[TradingBot, "MultiAccountRuntime"]] = None
 _shutdown_event: Optional[asyncio.Event] = None
 _signal_count = 0
 _last_signal_time = 0.0
@@ -321,6 +376,13 @@ async def main():
         sys.exit(1)
     dotenv.load_dotenv(args.env_file)
 
+    if args.accounts:
+        if args.account:
+            print("Error: use either --account or --accounts, not both")
+            sys.exit(1)
+        await run_multi_account(args, strategy_name, strategy_config)
+        return
+
     # Load account credentials and proxy assignments when --account is provided
     account_credentials = None
     account_name = None
@@ -336,29 +398,13 @@ async def main():
         if proxy_selector:
             if args.enable_proxy:
                 proxy = proxy_selector.current_proxy()
-                if proxy:
-                    try:
-                        SessionProxyManager.enable(proxy)
-                        active_proxy_display = proxy.url_with_auth(mask_password=True)
-                        print(f"✓ Session proxy enabled: {proxy.label} -> {active_proxy_display}\n")
-                        ip_result = await detect_egress_ip()
-                        if ip_result.address:
-                            detected_proxy_ip = ip_result.address
-                            detected_proxy_source = ip_result.source
-                            print(
-                                f"✓ Proxy egress IP confirmed: {ip_result.address} "
-                                f"(via {ip_result.source})\n"
-                            )
-                        else:
-                            failure_reason = ip_result.error or "no response"
-                            print(
-                                "⚠️ Unable to confirm proxy egress IP "
-                                f"(reason: {failure_reason})\n"
-                            )
-                    except Exception as exc:
-                        print(f"⚠️ Failed to enable session proxy ({exc})\n")
-                else:
+                if not proxy:
                     print("⚠️ No active proxies available for this account\n")
+                elif args.proxy_mode == "client":
+                    active_proxy_display = f"{proxy.url_with_auth(mask_password=True)} (per client)"
+                    print(f"✓ Per-client proxies enabled, starting at {proxy.label}\n")
+                else:
+                    active_proxy_display, detected_proxy_ip, detected_proxy_source = await enable_session_proxy(proxy)
             else:
                 print("ℹ️ Proxy enablement skipped (use --enable-proxy to enable)\n")
         # load_account_context already prints summary lines (including trailing newline)
@@ -367,17 +413,11 @@ async def main():
     strategy_config["_account_name"] = account_name
     strategy_config["_account_credentials"] = account_credentials
     strategy_config["_proxy_enabled"] = bool(active_proxy_display)
+    strategy_config["_client_proxies"] = bool(active_proxy_display) and args.proxy_mode == "client"
     strategy_config["_proxy_egress_ip"] = detected_proxy_ip
     strategy_config["_proxy_egress_source"] = detected_proxy_source
     
-    # Set control API environment variables if enabled
-    if args.enable_control_api:
-        os.environ["CONTROL_API_ENABLED"] = "true"
-        os.environ["CONTROL_API_PORT"] = str(args.control_api_port)
-        os.environ["CONTROL_API_HOST"] = args.control_api_host
-        print(f"✓ Control API enabled: http://{args.control_api_host}:{args.control_api_port}")
-        print(f"✓ CONTROL_API_PORT environment variable set to: {os.environ.get('CONTROL_API_PORT')}")
-        print("")
+    configure_control_api(args)
 
     # Convert to TradingConfig
     config = _config_dict_to_trading_config(strategy_name, strategy_config)
@@ -420,6 +460,98 @@ async def main():
         _bot_instance = None
 
 
+def configure_control_api(args) -> None:
+    """Set the control API environment variables when --enable-control-api is given."""
+    if args.enable_control_api:
+        os.environ["CONTROL_API_ENABLED"] = "true"
+        os.environ["CONTROL_API_PORT"] = str(args.control_api_port)
+        os.environ["CONTROL_API_HOST"] = args.control_api_host
+        print(f"✓ Control API enabled: http://{args.control_api_host}:{args.control_api_port}")
+        print(f"✓ CONTROL_API_PORT environment variable set to: {os.environ.get('CONTROL_API_PORT')}")
+        print("")
+
+
+async def run_multi_account(args, strategy_name: str, strategy_config: dict) -> None:
+    """Run several accounts' funding arbitrage strategies in this process."""
+    global _bot_instance
+    from multi_account_runtime import HostedAccount, MultiAccountRuntime, shared_proxy
+
+    if strategy_name != "funding_arbitrage":
+        print(f"Error: --accounts only supports funding_arbitrage (config strategy: {strategy_name})")
+        sys.exit(1)
+
+    account_names = [name.strip() for name in args.accounts.split(",") if name.strip()]
+    contexts = []
+    for account_name in account_names:
+        print(f"Loading credentials for account: {account_name}")
+        credentials, proxy_selector = await load_account_context(account_name)
+        contexts.append((account_name, credentials, proxy_selector))
+
+    active_proxy_display = detected_proxy_ip = detected_proxy_source = None
+    client_proxies = args.enable_proxy and args.proxy_mode == "client"
+    if client_proxies:
+        # Every account's clients route through that account's own proxies
+        active_proxy_display = "per client"
+        print("✓ Per-client proxies enabled\n")
+    elif args.enable_proxy:
+        try:
+            proxy = shared_proxy({name: selector for name, _, selector in contexts})
+        except ValueError as exc:
+            print(f"Error: {exc}")
+            sys.exit(1)
+        if proxy:
+            active_proxy_display, detected_proxy_ip, detected_proxy_source = await enable_session_proxy(proxy)
+        else:
+            print("⚠️ No active proxies available for these accounts\n")
+
+    accounts = []
+    for account_name, credentials, proxy_selector in contexts:
+        account_config = copy.deepcopy(strategy_config)
+        account_config["_account_name"] = account_name
+        account_config["_account_credentials"] = credentials
+        if client_proxies:
+            has_proxy = bool(proxy_selector and proxy_selector.current_proxy())
+            if not has_proxy:
+                print(f"⚠️ No active proxies for {account_name}; its clients connect directly\n")
+            account_config["_proxy_enabled"] = has_proxy
+        else:
+            account_config["_proxy_enabled"] = bool(active_proxy_display)
+        account_config["_client_proxies"] = client_proxies
+        account_config["_proxy_egress_ip"] = detected_proxy_ip
+        account_config["_proxy_egress_source"] = detected_proxy_source
+        accounts.append(HostedAccount(
+            name=account_name,
+            config=_config_dict_to_trading_config(strategy_name, account_config),
+            credentials=credentials,
+            proxy_selector=proxy_selector,
+        ))
+
+    configure_control_api(args)
+
+    print("\n" + "="*70)
+    print("  Starting Multi-Account Runtime")
+    print("="*70)
+    print(f"  Strategy: {strategy_name}")
+    print(f"  Accounts: {', '.join(account_names)}")
+    if active_proxy_display:
+        print(f"  Proxy:    {active_proxy_display}")
+    print("="*70 + "\n")
+
+    runtime = MultiAccountRuntime(accounts)
+    _bot_instance = runtime
+    try:
+        await runtime.run()
+    except KeyboardInterrupt:
+        print("\n📡 KeyboardInterrupt received, shutting down...")
+        await runtime.graceful_shutdown("User interruption (Ctrl+C)")
+    except Exception as e:
+        print(f"Runtime execution failed: {e}")
+        await runtime.graceful_shutdown(f"Error: {e}")
+        raise
+    finally:
+        _bot_instance = None
+
+
 def _config_dict_to_trading_config(strategy_name: str, config_dict: dict) -> TradingConfig:
     """
     Convert a strategy config dict (from YAML or interactive) to TradingConfig.
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Backtest the funding arbitrage strategy over stored funding_rates history.
+
+Loads the history into a dense (time, dex, symbol) cube once, then replays the
+strategy's entry/exit rules for every parameter set in the grid across a
+process pool.
+
+Usage:
+    # 90 days of hourly data, parameters from a strategy config
+    python scripts/backtest_funding_arb.py --config configs/config.yml
+
+    # Sweep entry/exit thresholds
+    python scripts/backtest_funding_arb.py --days 30 \\
+        --grid min_profit=0.0001,0.0002,0.0005 \\
+        --grid min_erosion_ratio=0.3,0.5,0.7 \\
+        --grid max_position_age_hours=24,72,168
+
+    # Restrict the universe
+    python scripts/backtest_funding_arb.py --dexes lighter,aster,paradex --symbols BTC,ETH,SOL
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+from dotenv import load_dotenv
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from rich.console import Console
+
+console = Console()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Backtest funding arbitrage parameters over funding rate history"
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=90,
+        help="Length of the backtest window in days (default: 90)",
+    )
+    parser.add_argument(
+        "--bucket-minutes",
+        type=int,
+        default=60,
+        help="Resampling interval in minutes (default: 60)",
+    )
+    parser.add_argument(
+        "--dexes",
+        type=str,
+        default=None,
+        help="Comma-separated DEX universe (default: all)",
+    )
+    parser.add_argument(
+        "--symbols",
+        type=str,
+        default=None,
+        help="Comma-separated symbol universe (default: all)",
+    )
+    parser.add_argument(
+        "--config",
+        type=str,
+        default=None,
+        help="funding_arbitrage YAML config to take base parameters from",
+    )
+    parser.add_argument(
+        "--grid",
+        action="append",
+        default=[],
+        metavar="NAME=V1,V2,...",
+        help="Parameter values to sweep (repeatable)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="Number of parameter sets to show (default: 20)",
+    )
+    parser.add_argument(
+        "--sort-by",
+        type=str,
+        default="net_pnl_usd",
+        help="Summary metric to rank by (default: net_pnl_usd)",
+    )
+    parser.add_argument(
+        "--env-file",
+        type=str,
+        default=".env",
+        help="Env file with DATABASE_URL (default: .env)",
+    )
+    return parser.parse_args()
+
+
+def _parse_csv(value: str | None) -> List[str] | None:
+    if not value:
+        return None
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _parse_value(raw: str) -> Any:
+    lowered = raw.lower()
+    if lowered in ("none", "null"):
+        return None
+    if lowered in ("true", "false"):
+        return lowered == "true"
+    for cast in (int, float):
+        try:
+            return cast(raw)
+        except ValueError:
+            continue
+    return raw
+
+
+def _parse_grid(entries: List[str]) -> Dict[str, List[Any]]:
+    grid: Dict[str, List[Any]] = {}
+    for entry in entries:
+        if "=" not in entry:
+            raise ValueError(f"Invalid --grid entry '{entry}' (expected NAME=V1,V2,...)")
+        name, raw_values = entry.split("=", 1)
+        grid[name.strip()] = [_parse_value(v) for v in _parse_csv(raw_values) or []]
+    return grid
+
+
+async def main() -> None:
+    args = parse_args()
+    load_dotenv(args.env_file)
+
+    try:
+        from databases import Database
+    except ImportError:
+        console.print("[red]Error: 'databases' package is required. Install with: pip install databases[/red]")
+        sys.exit(1)
+
+    try:
+        from strategies.implementations.funding_arbitrage.backtest import (
+            BacktestParams,
+            expand_grid,
+            format_sweep_report,
+            load_funding_rate_cube,
+            run_sweep,
+        )
+    except ImportError as exc:
+        console.print(f"[red]Error: {exc}. Install numpy with: pip install numpy[/red]")
+        sys.exit(1)
+
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        console.print("[red]Error: DATABASE_URL environment variable not set[/red]")
+        sys.exit(1)
+
+    if args.config:
+        from trading_config.config_yaml import load_config_from_yaml
+
+        loaded = load_config_from_yaml(Path(args.config))
+        if loaded["strategy"] != "funding_arbitrage":
+            console.print(f"[red]Error: {args.config} is not a funding_arbitrage config[/red]")
+            sys.exit(1)
+        base = BacktestParams.from_strategy_params(loaded["config"])
+    else:
+        base = BacktestParams()
+
+    try:
+        grid = _parse_grid(args.grid)
+        param_sets = expand_grid(base, grid)
+    except ValueError as exc:
+        console.print(f"[red]Error: {exc}[/red]")
+        sys.exit(1)
+
+    end_time = datetime.now(timezone.utc)
+    start_time = end_time - timedelta(days=args.days)
+
+    db = Database(database_url)
+    await db.connect()
+    try:
+        started = time.perf_counter()
+        cube = await load_funding_rate_cube(
+            db,
+            start_time=start_time,
+            end_time=end_time,
+            bucket_seconds=args.bucket_minutes * 60,
+            dex_names=_parse_csv(args.dexes),
+            symbols=_parse_csv(args.symbols),
+        )
+    except ValueError as exc:
+        console.print(f"[yellow]{exc}[/yellow]")
+        return
+    finally:
+        await db.disconnect()
+
+    steps, n_dexes, n_symbols = cube.shape
+    console.print(
+        f"[cyan]Loaded {steps} steps × {n_dexes} DEXs × {n_symbols} symbols "
+        f"in {time.perf_counter() - started:.1f}s[/cyan]"
+    )
+    console.print(f"[cyan]Running {len(param_sets)} parameter set(s)...[/cyan]")
+
+    started = time.perf_counter()
+    results = run_sweep(cube, param_sets, max_workers=args.workers)
+    console.print(f"[cyan]Sweep finished in {time.perf_counter() - started:.1f}s[/cyan]\n")
+
+    console.print(format_sweep_report(results, varied=list(grid.keys()), top=args.top, sort_by=args.sort_by))
+
+    best = max(results, key=lambda r: r.summary.get(args.sort_by, 0.0))
+    console.print("\n[bold]Best parameter set:[/bold]")
+    for key, value in best.summary.items():
+        if key == "params":
+            continue
+        console.print(f"  {key}: {value}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Replay grid strategy presets against a recorded or synthetic BBO stream.
+
+Every preset runs the real GridStrategy on a virtual clock against an
+in-memory venue with a queue-position fill model; presets are spread across a
+process pool and summarized in an EV / drawdown table.
+
+Usage:
+    # All presets in configs/grid over a synthetic 24h BTC series
+    python scripts/backtest_grid.py --synthetic-hours 24 --seed 7
+
+    # Quotes from CSV (timestamp,bid,ask[,bid_size,ask_size])
+    python scripts/backtest_grid.py --csv data/btc_bbo.csv --exchange lighter --tick-size 0.1
+
+    # Quotes extracted from a feed recording
+    python scripts/backtest_grid.py --recording logs/recordings/paradex.mdrec \\
+        --recording-venue paradex --market BTC-USD-PERP
+
+    # Specific presets, tighter queue assumptions
+    python scripts/backtest_grid.py --configs configs/grid/grid_hft.yml configs/grid/grid_original.yml \\
+        --default-queue-usd 50000 --touch-volume-usd 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+
+from dotenv import load_dotenv
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from rich.console import Console
+
+console = Console()
+
+RECORDING_VENUES = ("paradex",)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Replay grid strategy presets against BBO streams"
+    )
+    parser.add_argument(
+        "--configs",
+        nargs="+",
+        default=None,
+        help="Grid YAML configs to replay (default: configs/grid/*.yml)",
+    )
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--csv", type=str, default=None, help="CSV of quotes (timestamp,bid,ask[,bid_size,ask_size])")
+    source.add_argument("--recording", type=str, default=None, help="Feed recording (.mdrec) to extract quotes from")
+    parser.add_argument(
+        "--recording-venue",
+        type=str,
+        default="paradex",
+        choices=RECORDING_VENUES,
+        help="Venue whose websocket manager decodes the recording (default: paradex)",
+    )
+    parser.add_argument(
+        "--market",
+        type=str,
+        default="BTC-USD-PERP",
+        help="Venue market id for --recording (default: BTC-USD-PERP)",
+    )
+    parser.add_argument(
+        "--synthetic-hours",
+        type=float,
+        default=24.0,
+        help="Length of the synthetic series when no --csv/--recording is given (default: 24)",
+    )
+    parser.add_argument("--volatility", type=float, default=0.5, help="Synthetic annualized volatility (default: 0.5)")
+    parser.add_argument("--start-price", type=float, default=100_000.0, help="Synthetic start price (default: 100000)")
+    parser.add_argument("--seed", type=int, default=None, help="Synthetic series RNG seed")
+    parser.add_argument(
+        "--exchange",
+        type=str,
+        default="lighter",
+        help="Exchange whose fee schedule the venue uses (default: lighter)",
+    )
+    parser.add_argument("--ticker", type=str, default="BTC", help="Ticker (default: BTC)")
+    parser.add_argument("--tick-size", type=str, default="0.1", help="Price tick (default: 0.1)")
+    parser.add_argument("--step-size", type=str, default="0.00001", help="Quantity step (default: 0.00001)")
+    parser.add_argument("--max-leverage", type=str, default="20", help="Venue max leverage (default: 20)")
+    parser.add_argument(
+        "--touch-volume-usd",
+        type=float,
+        default=2_000.0,
+        help="Traded notional per second at the touch, for series without sizes (default: 2000)",
+    )
+    parser.add_argument(
+        "--default-queue-usd",
+        type=float,
+        default=20_000.0,
+        help="Queue ahead of an order joining a level with unknown size (default: 20000)",
+    )
+    parser.add_argument(
+        "--trade-share",
+        type=float,
+        default=0.5,
+        help="Share of displayed-size decreases treated as trades (default: 0.5)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--sort-by",
+        type=str,
+        default="net_pnl_usd",
+        help="Summary metric to rank by (default: net_pnl_usd)",
+    )
+    parser.add_argument(
+        "--env-file",
+        type=str,
+        default=".env",
+        help="Env file to load (default: .env)",
+    )
+    return parser.parse_args()
+
+
+async def _load_series(args: argparse.Namespace):
+    from strategies.implementations.grid.backtest import bbo_from_recording, load_bbo_csv, synthetic_bbo
+
+    if args.csv:
+        return load_bbo_csv(args.csv, symbol=args.ticker)
+    if args.recording:
+        from exchange_clients.paradex.websocket.manager import ParadexWebSocketManager
+
+        manager = ParadexWebSocketManager(config=SimpleNamespace(contract_id=args.market), paradex_ws_client=None)
+        return await bbo_from_recording(args.recording, manager, symbol=args.ticker)
+    return synthetic_bbo(
+        duration_seconds=args.synthetic_hours * 3600.0,
+        start_price=args.start_price,
+        tick_size=float(args.tick_size),
+        volatility=args.volatility,
+        start_time=time.time() - args.synthetic_hours * 3600.0,
+        seed=args.seed,
+        symbol=args.ticker,
+    )
+
+
+async def main() -> None:
+    args = parse_args()
+    load_dotenv(args.env_file)
+
+    try:
+        from strategies.implementations.grid.backtest import (
+            FillModel,
+            GridReplayParams,
+            format_preset_report,
+            load_grid_presets,
+            run_preset_sweep,
+        )
+    except ImportError as exc:
+        console.print(f"[red]Error: {exc}. Install numpy with: pip install numpy[/red]")
+        sys.exit(1)
+
+    config_paths = [Path(p) for p in args.configs] if args.configs else sorted((PROJECT_ROOT / "configs" / "grid").glob("*.yml"))
+    if not config_paths:
+        console.print("[red]Error: no grid configs found[/red]")
+        sys.exit(1)
+
+    try:
+        presets = load_grid_presets(config_paths)
+        series = await _load_series(args)
+    except (OSError, ValueError) as exc:
+        console.print(f"[red]Error: {exc}[/red]")
+        sys.exit(1)
+
+    console.print(
+        f"[cyan]Loaded {len(series)} quotes covering {series.duration_seconds / 3600:.1f}h; "
+        f"replaying {len(presets)} preset(s)...[/cyan]"
+    )
+
+    params = GridReplayParams(
+        exchange=args.exchange,
+        ticker=args.ticker,
+        tick_size=Decimal(args.tick_size),
+        step_size=Decimal(args.step_size),
+        max_leverage=Decimal(args.max_leverage),
+        fill_model=FillModel(
+            touch_volume_usd_per_second=args.touch_volume_usd,
+            default_queue_usd=args.default_queue_usd,
+            trade_share=args.trade_share,
+        ),
+    )
+
+    started = time.perf_counter()
+    results = run_preset_sweep(series, presets, params, max_workers=args.workers)
+    console.print(f"[cyan]Replay finished in {time.perf_counter() - started:.1f}s[/cyan]\n")
+    console.print(format_preset_report(results, sort_by=args.sort_by), soft_wrap=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Report per-venue execution latency and slippage percentiles.
+
+Reads the execution telemetry written by OrderExecutor
+(logs/execution_telemetry/executions_YYYYMMDD.jsonl) and shows, per group:
+- Orders, fill rate and average retries
+- Time-to-first-fill and time-to-full-fill percentiles (ms)
+- Slippage vs intended price and vs mid at send percentiles (bps, positive = worse)
+
+Usage:
+    # Per-venue report over everything recorded
+    python scripts/execution_quality_report.py
+
+    # Last 24 hours, split by venue and execution mode
+    python scripts/execution_quality_report.py --hours 24 --group-by venue,mode
+
+    # Only one venue/symbol, as JSON
+    python scripts/execution_quality_report.py --venue lighter --symbol BTC --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+from strategies.execution.core.execution_telemetry import ExecutionRecord, load_records, summarize
+
+console = Console()
+
+GROUP_FIELDS = ("venue", "symbol", "side", "mode", "mode_used", "source")
+METRIC_COLUMNS = (
+    ("time_to_first_fill_ms", "1st fill ms"),
+    ("time_to_full_fill_ms", "Full fill ms"),
+    ("slippage_bps", "Slip bps"),
+    ("arrival_slippage_bps", "Arrival bps"),
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Report per-venue execution latency and slippage percentiles"
+    )
+    parser.add_argument(
+        "--dir",
+        type=Path,
+        default=None,
+        help="Telemetry directory (default: EXECUTION_TELEMETRY_DIR or logs/execution_telemetry)",
+    )
+    parser.add_argument(
+        "--hours",
+        type=float,
+        default=None,
+        help="Only include orders sent in the last N hours",
+    )
+    parser.add_argument(
+        "--group-by",
+        default="venue",
+        help=f"Comma-separated grouping fields from: {', '.join(GROUP_FIELDS)} (default: venue)",
+    )
+    parser.add_argument("--venue", help="Only include this venue")
+    parser.add_argument("--symbol", help="Only include this symbol")
+    parser.add_argument(
+        "--include-failed",
+        action="store_true",
+        help="Include orders that did not succeed",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the summary as JSON instead of a table",
+    )
+    return parser.parse_args()
+
+
+def _matches(record: ExecutionRecord, args: argparse.Namespace) -> bool:
+    if args.venue and record.venue != args.venue.lower():
+        return False
+    if args.symbol and record.symbol != args.symbol.upper():
+        return False
+    if not args.include_failed and not record.success:
+        return False
+    return True
+
+
+def _fmt(value: Optional[float], decimals: int = 0) -> str:
+    if value is None:
+        return "-"
+    return f"{value:.{decimals}f}"
+
+
+def render_table(summary: List[Dict[str, Any]], group_by: List[str]) -> None:
+    table = Table(title="Execution Quality", box=box.SIMPLE_HEAVY)
+    for name in group_by:
+        table.add_column(name.replace("_", " ").title(), style="cyan")
+    table.add_column("Orders", justify="right")
+    table.add_column("Fill %", justify="right")
+    table.add_column("Retries", justify="right")
+    for _, label in METRIC_COLUMNS:
+        table.add_column(f"{label}\np50/p90/p99", justify="right")
+
+    for row in summary:
+        cells = [str(row[name]) for name in group_by]
+        cells += [
+            str(row["orders"]),
+            f"{row['fill_rate'] * 100:.1f}",
+            f"{row['avg_retries']:.2f}",
+        ]
+        for metric, _ in METRIC_COLUMNS:
+            stats = row[metric]
+            decimals = 2 if metric.endswith("_bps") else 0
+            cells.append(" / ".join(_fmt(stats[p], decimals) for p in ("p50", "p90", "p99")))
+        table.add_row(*cells)
+
+    console.print(table)
+
+
+def main() -> None:
+    args = parse_args()
+    group_by = [name.strip() for name in args.group_by.split(",") if name.strip()]
+    unknown = [name for name in group_by if name not in GROUP_FIELDS]
+    if unknown:
+        console.print(f"[red]Unknown group-by field(s): {', '.join(unknown)}[/red]")
+        sys.exit(1)
+
+    since = time.time() - args.hours * 3600 if args.hours is not None else None
+    records = [record for record in load_records(args.dir, since=since) if _matches(record, args)]
+    if not records:
+        console.print("[yellow]No execution telemetry records found.[/yellow]")
+        return
+
+    summary = summarize(records, group_by=group_by)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        render_table(summary, group_by)
+
+
+if __name__ == "__main__":
+    main()
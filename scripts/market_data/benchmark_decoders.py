@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark Decoders
+
+Measure websocket decoding throughput (messages/second) on a raw feed
+recording written when WS_RECORD_DIR is set. For each stream, compares plain
+JSON parsing with the venue's typed decoder (parse + dispatch + unit
+conversion), so regressions in the hot decode path show up on real traffic.
+
+The venue is taken from the recording's file name (``<venue>_<ts>.mdrec``)
+unless --venue is given.
+
+Usage:
+    python benchmark_decoders.py logs/feeds/lighter_20251021_200021_1234.mdrec
+    python benchmark_decoders.py <file> --venue aster --stream depth --repeat 5
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# Add project root to path
+# Script is at scripts/market_data/, so go up 3 levels to project root
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from rich.console import Console
+from rich.table import Table
+from rich import box
+
+from exchange_clients.market_data.decoding import DECODERS, JSON_BACKEND, RawMessage, get_decoder
+from exchange_clients.market_data.recorder import FeedReader, FeedRecordingError
+
+console = Console()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark typed websocket decoders on a feed recording")
+    parser.add_argument("path", type=str, help="Recording file (.mdrec)")
+    parser.add_argument("--venue", type=str, default=None, choices=sorted(DECODERS), help="Venue (default: from file name)")
+    parser.add_argument("--stream", type=str, default=None, help="Only benchmark this stream")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes per stream (best is reported)")
+    return parser.parse_args()
+
+
+def _best_rate(fn: Callable[[List], object], payloads: List, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        fn(payloads)
+        best = min(best, time.perf_counter() - start)
+    return len(payloads) / best if best > 0 else float("inf")
+
+
+def main() -> None:
+    args = parse_args()
+    venue = (args.venue or Path(args.path).name.split("_", 1)[0]).lower()
+    if venue not in DECODERS:
+        console.print(f"[red]Error: unknown venue '{venue}' (use --venue)[/red]")
+        sys.exit(1)
+
+    try:
+        reader = FeedReader(args.path)
+    except (FileNotFoundError, FeedRecordingError) as exc:
+        console.print(f"[red]Error: {exc}[/red]")
+        sys.exit(1)
+
+    streams: Dict[str, List] = defaultdict(list)
+    with reader:
+        for frame in reader.iter_frames(streams=[args.stream] if args.stream else None):
+            streams[frame.stream].append(frame.payload)
+
+    if not streams:
+        console.print("[yellow]No frames to decode[/yellow]")
+        return
+
+    table = Table(box=box.SIMPLE_HEAVY, title=f"{venue} decoding ({JSON_BACKEND})")
+    table.add_column("Stream", style="cyan")
+    table.add_column("Frames", justify="right")
+    table.add_column("Typed", justify="right")
+    table.add_column("json.loads msg/s", justify="right")
+    table.add_column("Decoder msg/s", justify="right")
+
+    for stream, payloads in sorted(streams.items()):
+        decoder = get_decoder(venue)
+        typed = sum(1 for message in map(decoder.decode, payloads) if not isinstance(message, RawMessage))
+        json_rate = _best_rate(lambda items: [json.loads(item) for item in items], payloads, args.repeat)
+        decode = decoder.decode
+        typed_rate = _best_rate(lambda items: [decode(item) for item in items], payloads, args.repeat)
+        table.add_row(
+            stream,
+            f"{len(payloads):,}",
+            f"{typed / len(payloads):.0%}",
+            f"{json_rate:,.0f}",
+            f"{typed_rate:,.0f}",
+        )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Inspect Feed Recording
+
+Summarize a raw websocket recording written when WS_RECORD_DIR is set
+(streams, frame counts, time range, compression) and optionally dump frames.
+
+Usage:
+    python inspect_feed_recording.py logs/feeds/paradex_20251021_200021_1234.mdrec
+    python inspect_feed_recording.py <file> --dump 20                 # Print first 20 frames
+    python inspect_feed_recording.py <file> --dump 20 --stream depth  # Only the depth stream
+"""
+
+import argparse
+import sys
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path
+# Script is at scripts/market_data/, so go up 3 levels to project root
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from rich.console import Console
+from rich.table import Table
+from rich import box
+
+from exchange_clients.market_data.recorder import CHUNK_HEADER, FeedReader, FeedRecordingError
+
+console = Console()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Inspect a websocket feed recording")
+    parser.add_argument("path", type=str, help="Recording file (.mdrec)")
+    parser.add_argument("--dump", type=int, default=0, help="Print the first N frames")
+    parser.add_argument("--stream", type=str, default=None, help="Only dump frames from this stream")
+    parser.add_argument("--width", type=int, default=160, help="Truncate dumped payloads to this width")
+    return parser.parse_args()
+
+
+def _fmt_ts(timestamp_ns: int) -> str:
+    return datetime.fromtimestamp(timestamp_ns / 1e9).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+
+
+def main() -> None:
+    args = parse_args()
+
+    try:
+        reader = FeedReader(args.path)
+    except (FileNotFoundError, FeedRecordingError) as exc:
+        console.print(f"[red]Error: {exc}[/red]")
+        sys.exit(1)
+
+    with reader:
+        if not reader.chunks:
+            console.print("[yellow]Recording contains no complete chunks[/yellow]")
+            return
+
+        counts: Counter = Counter()
+        sizes: Counter = Counter()
+        for frame in reader:
+            counts[frame.stream] += 1
+            sizes[frame.stream] += len(frame.payload)
+
+        stored = sum(CHUNK_HEADER.size + entry.stored_len for entry in reader.chunks)
+        raw = sum(sizes.values())
+        duration = (reader.end_ns - reader.start_ns) / 1e9
+
+        console.print(f"\n[bold]{args.path}[/bold]")
+        console.print(f"  Range:    {_fmt_ts(reader.start_ns)} → {_fmt_ts(reader.end_ns)} ({duration:.1f}s)")
+        console.print(f"  Chunks:   {len(reader.chunks)}")
+        console.print(f"  Frames:   {reader.frame_count:,}")
+        console.print(f"  Payload:  {raw:,} bytes ({stored:,} on disk, {raw / max(stored, 1):.1f}x)\n")
+
+        table = Table(box=box.SIMPLE_HEAVY)
+        table.add_column("Stream", style="cyan")
+        table.add_column("Frames", justify="right")
+        table.add_column("Frames/s", justify="right")
+        table.add_column("Avg bytes", justify="right")
+        for stream, count in counts.most_common():
+            table.add_row(
+                stream,
+                f"{count:,}",
+                f"{count / duration:,.1f}" if duration > 0 else "-",
+                f"{sizes[stream] / count:,.0f}",
+            )
+        console.print(table)
+
+        if args.dump:
+            streams = [args.stream] if args.stream else None
+            for index, frame in enumerate(reader.iter_frames(streams=streams)):
+                if index >= args.dump:
+                    break
+                payload = frame.payload if isinstance(frame.payload, str) else frame.payload.hex()
+                if len(payload) > args.width:
+                    payload = payload[:args.width] + "…"
+                console.print(f"{_fmt_ts(frame.timestamp_ns)} {frame.stream:<12} {payload}", markup=False, highlight=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Run Market Data Daemon
+
+Owns the public websocket feeds for the given venues/symbols and publishes
+BBO + top-N depth into shared memory. Strategy processes on the same host
+started with SHARED_MARKET_DATA=1 read books from it and skip their own public
+book subscriptions (private order/account streams stay per process).
+
+Venue credentials are read from the environment, as for any other client.
+
+Usage:
+    python run_market_data_daemon.py --feed lighter:BTC,ETH --feed aster:BTC
+    python run_market_data_daemon.py --feed paradex:SOL --levels 20
+    screen -S market_data python scripts/market_data/run_market_data_daemon.py --feed lighter:BTC
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+# Add project root to path
+# Script is at scripts/market_data/, so go up 3 levels to project root
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from exchange_clients.market_data.daemon import MarketDataDaemon
+from exchange_clients.market_data.shared_book import DEFAULT_LEVELS, DEFAULT_SLOTS
+
+logging.basicConfig(
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    level=logging.INFO
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_feeds(values: List[str]) -> Dict[str, List[str]]:
+    """Parse ``venue:SYM1,SYM2`` arguments into a venue -> symbols mapping."""
+    feeds: Dict[str, List[str]] = {}
+    for value in values:
+        venue, _, symbols = value.partition(":")
+        if not venue or not symbols:
+            raise argparse.ArgumentTypeError(f"Invalid feed '{value}' (expected venue:SYM1,SYM2)")
+        targets = feeds.setdefault(venue.strip().lower(), [])
+        for symbol in symbols.split(","):
+            symbol = symbol.strip().upper()
+            if symbol and symbol not in targets:
+                targets.append(symbol)
+    return feeds
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Publish public order books to shared memory")
+    parser.add_argument("--feed", action="append", required=True, help="venue:SYM1,SYM2 (repeatable)")
+    parser.add_argument("--levels", type=int, default=DEFAULT_LEVELS, help="Depth levels per side")
+    parser.add_argument("--slots", type=int, default=DEFAULT_SLOTS, help="Ring slots per symbol")
+    parser.add_argument("--heartbeat", type=float, default=1.0, help="Republish interval for quiet books (s)")
+    parser.add_argument("--stats-interval", type=float, default=60.0, help="Publish count log interval (s)")
+    return parser.parse_args()
+
+
+async def run(args: argparse.Namespace) -> None:
+    daemon = MarketDataDaemon(
+        parse_feeds(args.feed),
+        levels=args.levels,
+        slots=args.slots,
+        heartbeat_interval=args.heartbeat,
+    )
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    await daemon.start()
+    try:
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=args.stats_interval)
+            except asyncio.TimeoutError:
+                logger.info("Publishes: %s", daemon.stats())
+    finally:
+        await daemon.stop()
+
+
+def main() -> None:
+    args = parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
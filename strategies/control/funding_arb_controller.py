@@ -4,7 +4,10 @@ Funding Arbitrage Strategy Controller
 Implements control operations for funding arbitrage strategy.
 """
 
-from typing import List, Dict, Any, Optional
+import asyncio
+import os
+import time
+from typing import Awaitable, Callable, List, Dict, Any, Hashable, Optional, Tuple
 from uuid import UUID
 from decimal import Decimal
 from datetime import datetime
@@ -12,11 +15,69 @@ from datetime import datetime
 from strategies.control.strategy_controller import BaseStrategyController
 from strategies.implementations.funding_arbitrage.strategy import FundingArbitrageStrategy
 
+# How stale live data served by the control API may be (seconds)
+DEFAULT_SNAPSHOT_TTL_SECONDS = float(os.getenv("CONTROL_API_SNAPSHOT_TTL", "3"))
+DEFAULT_BALANCE_TTL_SECONDS = float(os.getenv("CONTROL_API_BALANCE_TTL", "10"))
+# Leverage limits change rarely
+LEVERAGE_INFO_TTL_SECONDS = 300.0
+
+
+class _TTLCache:
+    """
+    Small async cache: values expire after ``ttl`` seconds and concurrent
+    loads of the same key share one in-flight call. The load runs in its own
+    task, so a cancelled caller never cancels it for the others. Failed loads
+    (exceptions or None results) are not cached.
+    """
+    
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._values: Dict[Hashable, Tuple[float, Any]] = {}
+        self._inflight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+    
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        cached = self._values.get(key)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, loader))
+            # Retrieve the exception even if every waiter was cancelled
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[key] = task
+        return await asyncio.shield(task)
+    
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Run one load and cache its result; shared by every caller waiting on ``key``."""
+        try:
+            value = await loader()
+        finally:
+            self._inflight.pop(key, None)
+        if value is not None and self.ttl > 0:
+            self._values[key] = (time.monotonic() + self.ttl, value)
+        return value
+    
+    def clear(self) -> None:
+        self._values.clear()
+
+
+def _strategy_account(strategy: Any) -> Optional[str]:
+    """Account a strategy trades (None when it runs on env credentials)."""
+    config = getattr(strategy, "config", None)
+    return getattr(config, "account_name", None) or getattr(config, "_account_name", None)
+
 
 class FundingArbStrategyController(BaseStrategyController):
     """Controller for funding arbitrage strategy"""
     
-    def __init__(self, strategy: Optional[FundingArbitrageStrategy] = None):
+    def __init__(
+        self,
+        strategy: Optional[FundingArbitrageStrategy] = None,
+        snapshot_ttl: float = DEFAULT_SNAPSHOT_TTL_SECONDS,
+        balance_ttl: float = DEFAULT_BALANCE_TTL_SECONDS,
+        strategies: Optional[Dict[str, FundingArbitrageStrategy]] = None,
+    ):
         """
         Initialize funding arbitrage controller.
         
@@ -24,13 +85,41 @@ class FundingArbStrategyController(BaseStrategyController):
             strategy: Optional FundingArbitrageStrategy instance. If None, controller works
                      in read-only mode (can query balances/positions but cannot perform actions
                      that require strategy state like closing positions or reloading config).
+            snapshot_ttl: Max age (seconds) of position snapshots served to API callers
+                          (env CONTROL_API_SNAPSHOT_TTL)
+            balance_ttl: Max age (seconds) of balances served to API callers
+                         (env CONTROL_API_BALANCE_TTL)
+            strategies: Strategies hosted by a multi-account process, keyed by account
+                        name. Actions on a position are routed to its account's strategy.
         """
+        self.strategies: Dict[Optional[str], FundingArbitrageStrategy] = dict(strategies or {})
+        if strategy is not None and not self.strategies:
+            self.strategies[_strategy_account(strategy)] = strategy
+        if strategy is None:
+            strategy = next(iter(self.strategies.values()), None)
         self.strategy = strategy
+        self._snapshot_cache = _TTLCache(snapshot_ttl)
+        self._balance_cache = _TTLCache(balance_ttl)
+        self._leverage_info_cache = _TTLCache(LEVERAGE_INFO_TTL_SECONDS)
     
     def get_strategy_name(self) -> str:
         """Get the strategy name."""
         return "funding_arbitrage"
     
+    def hosts(self, account_name: Optional[str]) -> bool:
+        """Whether a strategy in this process trades ``account_name``."""
+        return account_name in self.strategies
+    
+    def _strategy_for(self, account_name: Optional[str]) -> Optional[FundingArbitrageStrategy]:
+        """
+        Strategy trading ``account_name``. A strategy started without an account
+        (env credentials) serves every account, as before multi-account hosting.
+        """
+        strategy = self.strategies.get(account_name)
+        if strategy is None:
+            strategy = self.strategies.get(None)
+        return strategy
+    
     async def get_positions(
         self,
         account_ids: List[str],
@@ -140,6 +229,7 @@ class FundingArbStrategyController(BaseStrategyController):
         } for row in account_rows}
         
         # Convert position rows to position objects and group by account
+        positions_by_account: List[Tuple[str, "FundingArbPosition"]] = []
         for row in position_rows:
             long_dex_name = dex_mapper.get_name(row['long_dex_id'])
             short_dex_name = dex_mapper.get_name(row['short_dex_id'])
@@ -179,13 +269,20 @@ class FundingArbStrategyController(BaseStrategyController):
                 except Exception:
                     position.metadata = {}
             
-            # Enrich position with live exchange data (similar to position_monitor)
-            await self._enrich_position_with_live_data(position)
-            
-            account_name_val = row['account_name']
+            positions_by_account.append((row['account_name'], position))
+        
+        # Enrich positions with live exchange data (similar to position_monitor), concurrently
+        await asyncio.gather(
+            *(
+                self._enrich_position_with_live_data(position, account_name_val)
+                for account_name_val, position in positions_by_account
+            )
+        )
+        
+        for account_name_val, position in positions_by_account:
             if account_name_val in accounts_dict:
                 accounts_dict[account_name_val]["positions"].append(
-                    self._format_position_for_api(position)
+                    self._format_position_for_api(position, account_name_val)
                 )
         
         # Convert to list (include all accounts, even if they have no positions)
@@ -206,31 +303,60 @@ class FundingArbStrategyController(BaseStrategyController):
             "accounts": accounts_data
         }
     
-    async def _enrich_position_with_live_data(self, position: "FundingArbPosition"):
+    async def _enrich_position_with_live_data(
+        self,
+        position: "FundingArbPosition",
+        account_name: Optional[str] = None,
+    ):
         """Enrich position with live exchange data (similar to position_monitor)."""
-        # Skip enrichment if no strategy instance (read-only mode)
-        if not self.strategy:
+        # Skip enrichment if no strategy trades this account (read-only mode)
+        strategy = self._strategy_for(account_name)
+        if not strategy:
             return
         
         try:
             # Fetch exchange snapshots
-            exchange_clients = self.strategy.exchange_clients
+            exchange_clients = strategy.exchange_clients
             clients_lower = {name.lower(): client for name, client in exchange_clients.items()}
             
             legs_metadata = {}
             total_unrealized = Decimal("0")
             total_funding = Decimal("0")
             
-            # Fetch funding rates
-            funding_rate_repo = self.strategy.funding_rate_repo
-            rate1_data = rate2_data = None
-            if funding_rate_repo:
-                rate1_data = await funding_rate_repo.get_latest_specific(
-                    position.long_dex, position.symbol
-                )
-                rate2_data = await funding_rate_repo.get_latest_specific(
-                    position.short_dex, position.symbol
-                )
+            position_opened_at_ts = None
+            if position.opened_at:
+                position_opened_at_ts = position.opened_at.timestamp()
+            
+            # Fetch funding rates and both legs' snapshots concurrently
+            legs = [
+                (dex, clients_lower.get(dex.lower()))
+                for dex in [position.long_dex, position.short_dex]
+                if dex
+            ]
+            legs = [(dex, client) for dex, client in legs if client]
+            
+            funding_rate_repo = strategy.funding_rate_repo
+            
+            async def _latest_rate(dex: str):
+                if not funding_rate_repo:
+                    return None
+                return await funding_rate_repo.get_latest_specific(dex, position.symbol)
+            
+            results = await asyncio.gather(
+                _latest_rate(position.long_dex),
+                _latest_rate(position.short_dex),
+                *(
+                    self._get_position_snapshot(
+                        client, dex.lower(), position.symbol, position_opened_at_ts, account_name
+                    )
+                    for dex, client in legs
+                ),
+                return_exceptions=True,
+            )
+            rate1_data, rate2_data = (
+                None if isinstance(result, BaseException) else result for result in results[:2]
+            )
+            snapshots = results[2:]
             
             if rate1_data and rate2_data:
                 rate1 = Decimal(str(rate1_data["funding_rate"]))
@@ -238,59 +364,46 @@ class FundingArbStrategyController(BaseStrategyController):
                 position.current_divergence = rate2 - rate1
                 position.last_check = datetime.now()
             
-            # Fetch exchange snapshots for each leg
-            for dex in [position.long_dex, position.short_dex]:
-                if not dex:
+            # Build leg metadata from each snapshot
+            for (dex, client), snapshot in zip(legs, snapshots):
+                # Missing exchange data shouldn't break the API
+                if isinstance(snapshot, BaseException) or not snapshot:
                     continue
                 
                 dex_key = dex.lower()
-                client = clients_lower.get(dex_key)
-                if not client:
-                    continue
-                
                 try:
-                    position_opened_at_ts = None
-                    if position.opened_at:
-                        position_opened_at_ts = position.opened_at.timestamp()
+                    leg_meta = {
+                        "side": snapshot.side or ("long" if dex == position.long_dex else "short"),
+                        "quantity": float(snapshot.quantity.copy_abs()) if snapshot.quantity else 0.0,
+                        "entry_price": float(snapshot.entry_price) if snapshot.entry_price else None,
+                        "mark_price": float(snapshot.mark_price) if snapshot.mark_price else None,
+                        "unrealized_pnl": float(snapshot.unrealized_pnl) if snapshot.unrealized_pnl else None,
+                        "funding_accrued": float(snapshot.funding_accrued) if snapshot.funding_accrued else None,
+                        "exposure_usd": float(snapshot.exposure_usd) if snapshot.exposure_usd else None,
+                        "leverage": float(snapshot.leverage) if snapshot.leverage else None,
+                        "liquidation_price": float(snapshot.liquidation_price) if snapshot.liquidation_price else None,
+                    }
                     
-                    snapshot = await client.get_position_snapshot(
-                        position.symbol,
-                        position_opened_at=position_opened_at_ts,
-                    )
+                    # Calculate leverage if not available in snapshot (for Lighter, Paradex, etc.)
+                    if leg_meta["leverage"] is None:
+                        leg_meta["leverage"] = await self._calculate_leverage(
+                            client, position.symbol, snapshot, dex_key, account_name
+                        )
+                    
+                    if snapshot.unrealized_pnl:
+                        total_unrealized += snapshot.unrealized_pnl
+                    if snapshot.funding_accrued:
+                        total_funding += snapshot.funding_accrued
                     
-                    if snapshot:
-                        leg_meta = {
-                            "side": snapshot.side or ("long" if dex == position.long_dex else "short"),
-                            "quantity": float(snapshot.quantity.copy_abs()) if snapshot.quantity else 0.0,
-                            "entry_price": float(snapshot.entry_price) if snapshot.entry_price else None,
-                            "mark_price": float(snapshot.mark_price) if snapshot.mark_price else None,
-                            "unrealized_pnl": float(snapshot.unrealized_pnl) if snapshot.unrealized_pnl else None,
-                            "funding_accrued": float(snapshot.funding_accrued) if snapshot.funding_accrued else None,
-                            "exposure_usd": float(snapshot.exposure_usd) if snapshot.exposure_usd else None,
-                            "leverage": float(snapshot.leverage) if snapshot.leverage else None,
-                            "liquidation_price": float(snapshot.liquidation_price) if snapshot.liquidation_price else None,
-                        }
-                        
-                        # Calculate leverage if not available in snapshot (for Lighter, Paradex, etc.)
-                        if leg_meta["leverage"] is None:
-                            leg_meta["leverage"] = await self._calculate_leverage(
-                                client, position.symbol, snapshot, dex_key
-                            )
-                        
-                        if snapshot.unrealized_pnl:
-                            total_unrealized += snapshot.unrealized_pnl
-                        if snapshot.funding_accrued:
-                            total_funding += snapshot.funding_accrued
-                        
-                        # Calculate funding APY
-                        if rate1_data and dex_key == position.long_dex.lower():
-                            leg_meta["funding_rate"] = float(rate1)
-                            leg_meta["funding_apy"] = float(rate1 * Decimal("3") * Decimal("365") * Decimal("100"))
-                        elif rate2_data and dex_key == position.short_dex.lower():
-                            leg_meta["funding_rate"] = float(rate2)
-                            leg_meta["funding_apy"] = float(rate2 * Decimal("3") * Decimal("365") * Decimal("100"))
-                        
-                        legs_metadata[dex] = leg_meta
+                    # Calculate funding APY
+                    if rate1_data and dex_key == position.long_dex.lower():
+                        leg_meta["funding_rate"] = float(rate1)
+                        leg_meta["funding_apy"] = float(rate1 * Decimal("3") * Decimal("365") * Decimal("100"))
+                    elif rate2_data and dex_key == position.short_dex.lower():
+                        leg_meta["funding_rate"] = float(rate2)
+                        leg_meta["funding_apy"] = float(rate2 * Decimal("3") * Decimal("365") * Decimal("100"))
+                    
+                    legs_metadata[dex] = leg_meta
                 except Exception as e:
                     # Log but don't fail - missing exchange data shouldn't break the API
                     pass
@@ -312,12 +425,32 @@ class FundingArbStrategyController(BaseStrategyController):
             # Don't fail API call if enrichment fails
             pass
     
+    async def _get_position_snapshot(
+        self,
+        client: Any,
+        dex_key: str,
+        symbol: str,
+        position_opened_at: Optional[float],
+        account_name: Optional[str] = None,
+    ) -> Any:
+        """
+        Position snapshot from the strategy's live client, reused for snapshot_ttl seconds.
+        
+        Live clients serve snapshots from their websocket account streams where the
+        venue supports it, so this rarely hits REST.
+        """
+        return await self._snapshot_cache.get_or_load(
+            (account_name, dex_key, symbol),
+            lambda: client.get_position_snapshot(symbol, position_opened_at=position_opened_at),
+        )
+    
     async def _calculate_leverage(
         self,
         client: Any,
         symbol: str,
         snapshot: Any,
-        dex_name: str
+        dex_name: str,
+        account_name: Optional[str] = None,
     ) -> Optional[float]:
         """
         Calculate leverage for exchanges that don't provide it directly (Lighter, Paradex).
@@ -330,6 +463,7 @@ class FundingArbStrategyController(BaseStrategyController):
             symbol: Trading symbol
             snapshot: ExchangePositionSnapshot
             dex_name: Exchange name (lowercase) to determine which leverage field to use
+            account_name: Account the client trades (Lighter leverage is per position)
             
         Returns:
             Leverage as float, or None if cannot be calculated
@@ -343,7 +477,10 @@ class FundingArbStrategyController(BaseStrategyController):
             
             # Method 2: Use exchange client's get_leverage_info method (same as leverage_validator)
             if hasattr(client, 'get_leverage_info'):
-                leverage_info = await client.get_leverage_info(symbol)
+                leverage_info = await self._leverage_info_cache.get_or_load(
+                    (account_name, dex_name, symbol),
+                    lambda: client.get_leverage_info(symbol),
+                )
                 if leverage_info:
                     # For Lighter: leverage is per-position, not account-level. Prioritize position leverage
                     # (from initial_margin_fraction) over max_leverage (symbol-level maximum).
@@ -381,7 +518,11 @@ class FundingArbStrategyController(BaseStrategyController):
             # Don't fail if leverage calculation fails
             return None
     
-    def _format_position_for_api(self, position: "FundingArbPosition") -> Dict[str, Any]:
+    def _format_position_for_api(
+        self,
+        position: "FundingArbPosition",
+        account_name: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """Format position data for API response with comprehensive metrics."""
         from decimal import Decimal
         
@@ -440,8 +581,9 @@ class FundingArbStrategyController(BaseStrategyController):
         min_hold_hours = None
         max_position_age_hours = None
         min_erosion_threshold = None
-        if self.strategy and hasattr(self.strategy, 'config') and hasattr(self.strategy.config, 'risk_config'):
-            risk_cfg = self.strategy.config.risk_config
+        strategy = self._strategy_for(account_name)
+        if strategy and hasattr(strategy, 'config') and hasattr(strategy.config, 'risk_config'):
+            risk_cfg = strategy.config.risk_config
             min_hold_hours = float(risk_cfg.min_hold_hours) if hasattr(risk_cfg, 'min_hold_hours') else None
             max_position_age_hours = float(risk_cfg.max_position_age_hours) if hasattr(risk_cfg, 'max_position_age_hours') else None
             min_erosion_threshold = float(risk_cfg.min_erosion_threshold) if hasattr(risk_cfg, 'min_erosion_threshold') else None
@@ -518,9 +660,10 @@ class FundingArbStrategyController(BaseStrategyController):
             Dict with close operation result
             
         Raises:
-            ValueError: If strategy not available (read-only mode)
+            ValueError: If strategy not available (read-only mode) or the position's
+                        account is not traded by this process
         """
-        if not self.strategy:
+        if not self.strategies:
             raise ValueError("Cannot close positions: strategy controller is in read-only mode. Start a strategy to enable position closing.")
         
         from database.connection import database
@@ -540,8 +683,14 @@ class FundingArbStrategyController(BaseStrategyController):
         if position_row['account_id'] not in account_ids:
             raise ValueError(f"Position {position_id} does not belong to accessible accounts")
         
-        # Get position from strategy's position manager
-        position = await self.strategy.position_manager.get(UUID(position_id))
+        strategy = self._strategy_for(position_row['account_name'])
+        if strategy is None:
+            raise ValueError(
+                f"Account {position_row['account_name']} is not traded by this strategy process"
+            )
+        
+        # Get position from the account's position manager
+        position = await strategy.position_manager.get(UUID(position_id))
         if not position:
             raise ValueError(f"Position {position_id} not found in strategy")
         
@@ -549,7 +698,7 @@ class FundingArbStrategyController(BaseStrategyController):
         if (
             order_type == "market" 
             and not confirm_wide_spread
-            and getattr(self.strategy.config, "enable_wide_spread_protection", True)
+            and getattr(strategy.config, "enable_wide_spread_protection", True)
         ):
             from strategies.implementations.funding_arbitrage.operations.core.price_utils import (
                 calculate_spread_pct,
@@ -564,12 +713,12 @@ class FundingArbStrategyController(BaseStrategyController):
             max_dex = None
             
             for dex in filter(None, [position.long_dex, position.short_dex]):
-                client = self.strategy.exchange_clients.get(dex)
+                client = strategy.exchange_clients.get(dex)
                 if not client:
                     continue
                 
                 try:
-                    price_provider = self.strategy.price_provider
+                    price_provider = strategy.price_provider
                     bid, ask = await price_provider.get_bbo_prices(client, position.symbol)
                     spread_pct = calculate_spread_pct(bid, ask)
                     
@@ -582,7 +731,7 @@ class FundingArbStrategyController(BaseStrategyController):
                             max_dex = dex
                 except Exception as exc:
                     # If spread check fails, log but don't block closing
-                    self.strategy.logger.warning(
+                    strategy.logger.warning(
                         f"Failed to check spread for {position.symbol} on {dex}: {exc}"
                     )
             
@@ -602,12 +751,15 @@ class FundingArbStrategyController(BaseStrategyController):
         # Close position using strategy's position closer
         try:
             # Use the position closer's close method with explicit order_type
-            await self.strategy.position_closer.close(
+            await strategy.position_closer.close(
                 position=position,
                 reason=reason,
                 live_snapshots=None,
                 order_type=order_type
             )
+            # Closed legs and freed margin must show up on the next read
+            self._snapshot_cache.clear()
+            self._balance_cache.clear()
             
             return {
                 "success": True,
@@ -641,7 +793,6 @@ class FundingArbStrategyController(BaseStrategyController):
         """
         from database.connection import database
         from database.credential_loader import DatabaseCredentialLoader
-        from exchange_clients.factory import ExchangeFactory
         
         # Ensure database is connected
         if not database.is_connected:
@@ -674,157 +825,171 @@ class FundingArbStrategyController(BaseStrategyController):
                 "accounts": []
             }
         
-        # Load credentials for each account and fetch balances
+        # Load credentials and fetch balances for every account concurrently
         credential_loader = DatabaseCredentialLoader(database)
-        accounts_data = []
+        accounts_data = await asyncio.gather(
+            *(self._get_account_balances(credential_loader, account_row) for account_row in account_rows)
+        )
         
-        for account_row in account_rows:
-            account_name_val = account_row['account_name']
-            account_id_val = account_row['account_id']
-            
-            try:
-                # Load credentials for this account
-                credentials = await credential_loader.load_account_credentials(account_name_val)
-                
-                # Get list of exchanges configured for this account
-                exchange_names = list(credentials.keys())
-                
-                if not exchange_names:
-                    # Account has no exchange credentials configured
-                    accounts_data.append({
-                        "account_name": account_name_val,
-                        "account_id": account_id_val,
-                        "balances": []
-                    })
-                    continue
-                
-                # Try to reuse strategy's exchange clients if available (avoids duplicate WebSocket connections)
-                # Otherwise create temporary clients
-                from types import SimpleNamespace
-                
-                # Fetch balances from each exchange
-                balances = []
-                
-                # Create and query each exchange client
-                for exchange_name in exchange_names:
-                    balance_result = {
-                        "exchange": exchange_name,
-                        "balance": None,
-                        "error": None
-                    }
-                    
-                    try:
-                        # Try to reuse strategy's exchange client if available (same account/exchange)
-                        client = None
-                        should_disconnect = False
-                        
-                        if self.strategy and hasattr(self.strategy, 'exchange_clients'):
-                            strategy_clients = self.strategy.exchange_clients
-                            if strategy_clients and exchange_name.lower() in strategy_clients:
-                                # Check if strategy is using the same account
-                                strategy_account = getattr(self.strategy.config, '_account_name', None)
-                                if strategy_account == account_name_val:
-                                    # Reuse existing client (already connected, no need to disconnect)
-                                    client = strategy_clients[exchange_name.lower()]
-                        
-                        # If no reusable client, create a new temporary one
-                        if client is None:
-                            # Get credentials for this exchange
-                            exchange_creds = credentials.get(exchange_name)
-                            if not exchange_creds:
-                                balance_result["error"] = "No credentials found"
-                                balances.append(balance_result)
-                                continue
-                            
-                            # Create config object with attributes (exchange clients access config.ticker, config.contract_id, etc.)
-                            exchange_config = SimpleNamespace(
-                                ticker="BTC",  # Dummy ticker - not used for balance queries
-                                exchange=exchange_name,
-                                contract_id="BTC",  # Dummy contract_id - required by some exchanges during connect()
-                                market_index=None,  # Will be set by connect() if needed
-                                account_index=None,  # Will be set by connect() if needed
-                                lighter_client=None,  # Will be set by connect() if needed
-                                api_client=None,  # Will be set by connect() if needed
-                            )
-                            
-                            client = ExchangeFactory.create_exchange(
-                                exchange_name=exchange_name,
-                                config=exchange_config,
-                                credentials=exchange_creds
-                            )
-                            
-                            # Connect to exchange (only for new clients)
-                            await client.connect()
-                            should_disconnect = True
-                        
-                        try:
-                            # Query balance
-                            balance = await client.get_account_balance()
-                            
-                            if balance is not None:
-                                balance_result["balance"] = str(balance)
-                            else:
-                                balance_result["error"] = "Balance not available"
-                        finally:
-                            # Only disconnect if we created a new client
-                            if should_disconnect:
-                                try:
-                                    await client.disconnect()
-                                except Exception:
-                                    pass  # Ignore disconnect errors
-                        
-                    except Exception as e:
-                        # Handle errors gracefully - continue with other exchanges
-                        balance_result["error"] = str(e)[:200]  # Truncate long error messages
-                    
-                    balances.append(balance_result)
-                
-                accounts_data.append({
-                    "account_name": account_name_val,
-                    "account_id": account_id_val,
-                    "balances": balances
-                })
-                
-            except Exception as e:
-                # If account credential loading fails, still include account with error
-                accounts_data.append({
-                    "account_name": account_name_val,
-                    "account_id": account_id_val,
-                    "balances": [{
-                        "exchange": "all",
-                        "balance": None,
-                        "error": f"Failed to load credentials: {str(e)[:200]}"
-                    }]
-                })
+        return {
+            "accounts": list(accounts_data)
+        }
+    
+    async def _get_account_balances(self, credential_loader: Any, account_row: Any) -> Dict[str, Any]:
+        """Balances for one account, querying all of its exchanges concurrently."""
+        account_name_val = account_row['account_name']
+        account_id_val = account_row['account_id']
+        
+        try:
+            # Load credentials for this account
+            credentials = await credential_loader.load_account_credentials(account_name_val)
+        except Exception as e:
+            # If account credential loading fails, still include account with error
+            return {
+                "account_name": account_name_val,
+                "account_id": account_id_val,
+                "balances": [{
+                    "exchange": "all",
+                    "balance": None,
+                    "error": f"Failed to load credentials: {str(e)[:200]}"
+                }]
+            }
+        
+        # Account may have no exchange credentials configured (empty list then)
+        balances = await asyncio.gather(
+            *(
+                self._get_exchange_balance(account_name_val, exchange_name, credentials.get(exchange_name))
+                for exchange_name in credentials.keys()
+            )
+        )
         
         return {
-            "accounts": accounts_data
+            "account_name": account_name_val,
+            "account_id": account_id_val,
+            "balances": list(balances)
         }
     
-    async def reload_config(self) -> Dict[str, Any]:
+    async def _get_exchange_balance(
+        self,
+        account_name: str,
+        exchange_name: str,
+        exchange_creds: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Balance for one account/exchange, served from cache when fresh."""
+        balance_result = {
+            "exchange": exchange_name,
+            "balance": None,
+            "error": None
+        }
+        
+        try:
+            balance = await self._balance_cache.get_or_load(
+                (account_name, exchange_name.lower()),
+                lambda: self._fetch_exchange_balance(account_name, exchange_name, exchange_creds),
+            )
+            
+            if balance is not None:
+                balance_result["balance"] = str(balance)
+            else:
+                balance_result["error"] = "Balance not available"
+        except Exception as e:
+            # Handle errors gracefully - other exchanges are still reported
+            balance_result["error"] = str(e)[:200]  # Truncate long error messages
+        
+        return balance_result
+    
+    async def _fetch_exchange_balance(
+        self,
+        account_name: str,
+        exchange_name: str,
+        exchange_creds: Optional[Dict[str, Any]],
+    ) -> Optional[Decimal]:
+        """
+        Query an account balance, reusing the strategy's live client when possible.
+        
+        Falls back to a temporary client (connect, query, disconnect) for accounts
+        the running strategy isn't trading.
+        """
+        from types import SimpleNamespace
+        from exchange_clients.factory import ExchangeFactory
+        
+        # Reuse the live client of the strategy trading this account (avoids duplicate WebSocket connections)
+        strategy = self.strategies.get(account_name)
+        strategy_clients = getattr(strategy, 'exchange_clients', None)
+        if strategy_clients and exchange_name.lower() in strategy_clients:
+            # Already connected, no need to disconnect
+            return await strategy_clients[exchange_name.lower()].get_account_balance()
+        
+        if not exchange_creds:
+            raise ValueError("No credentials found")
+        
+        # Create config object with attributes (exchange clients access config.ticker, config.contract_id, etc.)
+        exchange_config = SimpleNamespace(
+            ticker="BTC",  # Dummy ticker - not used for balance queries
+            exchange=exchange_name,
+            contract_id="BTC",  # Dummy contract_id - required by some exchanges during connect()
+            market_index=None,  # Will be set by connect() if needed
+            account_index=None,  # Will be set by connect() if needed
+            lighter_client=None,  # Will be set by connect() if needed
+            api_client=None,  # Will be set by connect() if needed
+        )
+        
+        client = ExchangeFactory.create_exchange(
+            exchange_name=exchange_name,
+            config=exchange_config,
+            credentials=exchange_creds
+        )
+        
+        # Connect to exchange (only for new clients)
+        await client.connect()
+        try:
+            return await client.get_account_balance()
+        finally:
+            try:
+                await client.disconnect()
+            except Exception:
+                pass  # Ignore disconnect errors
+    
+    async def reload_config(self, account_name: Optional[str] = None) -> Dict[str, Any]:
         """
         Reload strategy configuration from the config file.
         
+        Args:
+            account_name: Reload only this account's strategy (default: every
+                          strategy in the process)
+        
         Returns:
             Dict with reload operation result
             
         Raises:
-            ValueError: If strategy not available (read-only mode)
+            ValueError: If strategy not available (read-only mode) or the account
+                        is not traded by this process
         """
-        if not self.strategy:
+        if not self.strategies:
             raise ValueError("Cannot reload config: strategy controller is in read-only mode. Start a strategy to enable config reloading.")
         
+        if account_name is None:
+            targets = list(self.strategies.items())
+        else:
+            strategy = self._strategy_for(account_name)
+            if strategy is None:
+                raise ValueError(f"Account {account_name} is not traded by this strategy process")
+            targets = [(account_name, strategy)]
+        
         try:
-            success = await self.strategy.reload_config()
+            results = await asyncio.gather(*(strategy.reload_config() for _, strategy in targets))
+            success = all(results)
             if success:
                 return {
                     "success": True,
+                    "accounts": [name for name, _ in targets if name is not None],
                     "message": "Config reloaded successfully. Changes will take effect on the next cycle."
                 }
             else:
+                failed = [name for (name, _), ok in zip(targets, results) if not ok and name is not None]
                 return {
                     "success": False,
-                    "error": "Failed to reload config",
+                    "error": "Failed to reload config" + (f" for {', '.join(failed)}" if failed else ""),
                     "message": "Config reload failed. Check logs for details."
                 }
         except Exception as e:
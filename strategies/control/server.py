@@ -6,13 +6,15 @@ FastAPI server for controlling running strategies via REST API.
 
 from typing import Optional, Dict, Any
 from fastapi import FastAPI, Request, HTTPException, status, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel, Field
 from databases import Database
 import os
 
 from strategies.control.auth import APIKeyAuth
 from strategies.control.funding_arb_controller import FundingArbStrategyController
+from helpers.loop_monitor import EventLoopMonitor
+from helpers.metrics import CONTENT_TYPE, REGISTRY
 
 # Import database - will be initialized when bot starts
 try:
@@ -44,6 +46,10 @@ _auth: Optional[APIKeyAuth] = None
 
 # Strategy controller registry (will be populated when bot starts)
 _strategy_controller: Optional[FundingArbStrategyController] = None
+_read_only_controller: Optional[FundingArbStrategyController] = None
+
+# Event loop monitor of the hosting process (set by TradingBot when enabled)
+_loop_monitor: Optional[EventLoopMonitor] = None
 
 
 def set_strategy_controller(controller: FundingArbStrategyController):
@@ -57,6 +63,19 @@ def get_strategy_controller() -> Optional[FundingArbStrategyController]:
     return _strategy_controller
 
 
+def get_read_controller() -> FundingArbStrategyController:
+    """
+    Controller for read endpoints: the strategy's controller, or a shared
+    read-only one so its balance/snapshot caches survive across requests.
+    """
+    global _read_only_controller
+    if _strategy_controller is not None:
+        return _strategy_controller
+    if _read_only_controller is None:
+        _read_only_controller = FundingArbStrategyController(strategy=None)
+    return _read_only_controller
+
+
 def require_strategy_controller() -> FundingArbStrategyController:
     """Get the strategy controller, raising error if not available."""
     if _strategy_controller is None:
@@ -67,6 +86,12 @@ def require_strategy_controller() -> FundingArbStrategyController:
     return _strategy_controller
 
 
+def set_loop_monitor(monitor: Optional[EventLoopMonitor]):
+    """Set the event loop monitor exposed under /api/v1/diagnostics (called by TradingBot)."""
+    global _loop_monitor
+    _loop_monitor = monitor
+
+
 def get_auth() -> APIKeyAuth:
     """Get auth instance (initialized when database is available)."""
     global _auth
@@ -94,11 +119,8 @@ async def get_status(user_info: Dict[str, Any] = Depends(get_user_info)):
     Returns:
         Strategy status, user info, and accessible accounts
     """
-    # Create controller if not available (read-only mode)
-    controller = get_strategy_controller()
-    if controller is None:
-        from strategies.control.funding_arb_controller import FundingArbStrategyController
-        controller = FundingArbStrategyController(strategy=None)
+    # Fall back to the shared read-only controller when no strategy is running
+    controller = get_read_controller()
     
     auth = get_auth()
     
@@ -125,7 +147,8 @@ async def get_status(user_info: Dict[str, Any] = Depends(get_user_info)):
                 "account_name": acc["account_name"],
                 "account_id": acc["id"],
                 "is_active": acc["is_active"],
-                "created_at": acc["created_at"].isoformat() if acc["created_at"] else None
+                "created_at": acc["created_at"].isoformat() if acc["created_at"] else None,
+                "hosted": controller.hosts(acc["account_name"]),
             }
             for acc in accounts
         ]
@@ -183,11 +206,8 @@ async def get_positions(
     Returns:
         Positions grouped by account
     """
-    # Create controller if not available (read-only mode)
-    controller = get_strategy_controller()
-    if controller is None:
-        from strategies.control.funding_arb_controller import FundingArbStrategyController
-        controller = FundingArbStrategyController(strategy=None)
+    # Fall back to the shared read-only controller when no strategy is running
+    controller = get_read_controller()
     
     auth = get_auth()
     
@@ -231,11 +251,8 @@ async def get_balances(
     Returns:
         Balances grouped by account and exchange
     """
-    # Create controller if not available (read-only mode)
-    controller = get_strategy_controller()
-    if controller is None:
-        from strategies.control.funding_arb_controller import FundingArbStrategyController
-        controller = FundingArbStrategyController(strategy=None)
+    # Fall back to the shared read-only controller when no strategy is running
+    controller = get_read_controller()
     
     auth = get_auth()
     
@@ -330,19 +347,38 @@ async def close_position(
 
 
 @app.post("/api/v1/config/reload", response_model=Dict[str, Any])
-async def reload_config(user_info: Dict[str, Any] = Depends(get_user_info)):
+async def reload_config(
+    account_name: Optional[str] = Query(None, description="Reload only this account's strategy"),
+    user_info: Dict[str, Any] = Depends(get_user_info)
+):
     """
     Reload strategy configuration from the config file without restarting.
     
     Changes will take effect on the next execution cycle.
     
+    Args:
+        account_name: Optional account whose strategy to reload (default: all
+                      strategies hosted by this process)
+    
     Returns:
         Reload operation result
     """
     controller = require_strategy_controller()  # Requires running strategy
     
+    if account_name:
+        await get_auth().validate_account_access(
+            user_info["user_id"],
+            user_info["is_admin"],
+            account_name
+        )
+        if not controller.hosts(account_name) and not controller.hosts(None):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Account {account_name} is not traded by this strategy process"
+            )
+    
     try:
-        result = await controller.reload_config()
+        result = await controller.reload_config(account_name=account_name)
         
         if not result.get("success"):
             raise HTTPException(
@@ -359,12 +395,37 @@ async def reload_config(user_info: Dict[str, Any] = Depends(get_user_info)):
         )
 
 
+@app.get("/api/v1/diagnostics/loop", response_model=Dict[str, Any])
+async def get_loop_diagnostics(
+    user_info: Dict[str, Any] = Depends(get_user_info)
+):
+    """
+    Event loop lag, recent stalls (with stack samples) and per-task CPU time.
+
+    Admin only, since stall samples expose source paths of the running process.
+    """
+    if not user_info["is_admin"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Loop diagnostics require an admin API key"
+        )
+    if _loop_monitor is None:
+        return {"enabled": False}
+    return {"enabled": True, **_loop_monitor.snapshot()}
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
     return {"status": "ok"}
 
 
+@app.get("/metrics")
+async def metrics():
+    """Process metrics in Prometheus text format (unauthenticated, like /health)."""
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler."""
@@ -6,6 +6,9 @@ Fundamental components for order execution:
 - LiquidityAnalyzer: Pre-flight depth checks
 - PositionSizer: USD↔Quantity conversion
 - SlippageCalculator: Slippage tracking
+- FillLedger: Per-process record of websocket fills (fill_ledger)
+- ExecutionTelemetry: Append-only per-order execution quality records (execution_telemetry)
+- MarketScale: Integer tick/lot grid for one market (fixed_point)
 - Spread utilities: calculate_spread_pct, is_spread_acceptable, MAX_*_SPREAD_PCT constants
 """
 
@@ -14,6 +17,13 @@ from strategies.execution.core.execution_types import ExecutionMode, ExecutionRe
 from strategies.execution.core.liquidity_analyzer import LiquidityAnalyzer, LiquidityReport
 from strategies.execution.core.position_sizer import PositionSizer
 from strategies.execution.core.slippage_calculator import SlippageCalculator
+from strategies.execution.core.fixed_point import MarketScale
+from strategies.execution.core.fill_ledger import FillLedger, OrderFills, fill_ledger
+from strategies.execution.core.execution_telemetry import (
+    ExecutionRecord,
+    ExecutionTelemetry,
+    execution_telemetry,
+)
 from strategies.execution.core.execution_strategies import (
     ExecutionStrategy,
     SimpleLimitExecutionStrategy,
@@ -36,6 +46,13 @@ __all__ = [
     "LiquidityReport",
     "PositionSizer",
     "SlippageCalculator",
+    "MarketScale",
+    "FillLedger",
+    "OrderFills",
+    "fill_ledger",
+    "ExecutionRecord",
+    "ExecutionTelemetry",
+    "execution_telemetry",
     "ExecutionStrategy",
     "SimpleLimitExecutionStrategy",
     "AggressiveLimitExecutionStrategy",
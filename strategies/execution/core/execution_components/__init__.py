@@ -4,6 +4,7 @@ from .pricer import AggressiveLimitPricer, PriceResult
 from .reconciler import OrderReconciler, ReconciliationResult
 from .event_reconciler import EventBasedReconciler
 from .order_tracker import OrderTracker
+from .fill_model import AttemptPlan, FillLatencyModel, fill_latency_model
 
 __all__ = [
     "AggressiveLimitPricer",
@@ -12,5 +13,8 @@ __all__ = [
     "ReconciliationResult",
     "EventBasedReconciler",
     "OrderTracker",
+    "AttemptPlan",
+    "FillLatencyModel",
+    "fill_latency_model",
 ]
 
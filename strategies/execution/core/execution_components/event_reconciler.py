@@ -10,8 +10,9 @@ from __future__ import annotations
 import asyncio
 import time
 from decimal import Decimal
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
+from strategies.execution.core.fill_ledger import fill_ledger
 from strategies.execution.core.utils import coerce_decimal
 
 from .order_tracker import OrderTracker
@@ -24,6 +25,7 @@ class EventBasedReconciler:
     def __init__(self, logger):
         self.logger = logger
         self._order_registry: Dict[str, OrderTracker] = {}
+        self._order_venues: Dict[str, Tuple[str, str]] = {}  # order_id -> (exchange, symbol)
         self._pending_callbacks: Dict[str, list] = {}
         self._callback_router = None
         self._status_callback_router = None
@@ -35,6 +37,18 @@ class EventBasedReconciler:
         self._original_fill_callback = fill_callback
         self._original_status_callback = status_callback
     
+    def _record_fill(self, order_id: str, price: Decimal, quantity: Decimal, sequence: Optional[int] = None) -> None:
+        """Mirror a fill into the process-wide fill ledger."""
+        venue = self._order_venues.get(order_id)
+        if venue is not None:
+            fill_ledger.record_fill(venue[0], order_id, price, quantity, sequence=sequence, symbol=venue[1])
+
+    def _record_status(self, order_id: str, status: str, filled_size: Decimal, price: Optional[Decimal]) -> None:
+        """Mirror a cumulative status update into the process-wide fill ledger."""
+        venue = self._order_venues.get(order_id)
+        if venue is not None:
+            fill_ledger.record_status(venue[0], order_id, status, filled_size, price)
+
     def get_callback_router(self):
         """Get the websocket callback router function."""
         if self._callback_router is None:
@@ -59,16 +73,20 @@ class EventBasedReconciler:
                         "sequence": sequence,
                     })
                     self.logger.debug(
-                        f"Queued websocket fill callback for {order_id} (tracker not registered yet)"
+                        lambda: f"Queued websocket fill callback for {order_id} (tracker not registered yet)"
                     )
                     return
                 
                 # Tracker registered - route fill directly
                 self.logger.info(
-                    f"🔔 Routing websocket fill to tracker {order_id}: "
+                    lambda: f"🔔 Routing websocket fill to tracker {order_id}: "
                     f"filled_size={filled_size}, price={price}"
                 )
                 tracker.on_fill(filled_size, price)
+                # Record each fill in one layer only: a chained router that writes
+                # to the ledger itself (the atomic WebsocketManager) records it
+                if not getattr(self._original_fill_callback, "records_fills", False):
+                    self._record_fill(order_id, price, filled_size, sequence)
                 
                 # Also call original callback if it exists (for strategy notifications)
                 if self._original_fill_callback:
@@ -114,15 +132,16 @@ class EventBasedReconciler:
                         "price": price,
                     })
                     self.logger.debug(
-                        f"Queued websocket status callback for {order_id} (tracker not registered yet)"
+                        lambda: f"Queued websocket status callback for {order_id} (tracker not registered yet)"
                     )
                     return
                 
                 # Tracker registered - route status directly
                 status_upper = status.upper()
+                self._record_status(order_id, status_upper, filled_size, price)
                 if status_upper == "FILLED":
                     self.logger.info(
-                        f"🔔 Routing websocket FILLED status to tracker {order_id}: "
+                        lambda: f"🔔 Routing websocket FILLED status to tracker {order_id}: "
                         f"filled_size={filled_size}, price={price}"
                     )
                     # Update tracker with final fill
@@ -138,7 +157,7 @@ class EventBasedReconciler:
                     tracker.fill_event.set()
                 elif status_upper in {"CANCELED", "CANCELLED"}:
                     self.logger.info(
-                        f"🔔 Routing websocket CANCELED status to tracker {order_id}: "
+                        lambda: f"🔔 Routing websocket CANCELED status to tracker {order_id}: "
                         f"filled_size={filled_size}"
                     )
                     tracker.on_cancel(filled_size)
@@ -271,6 +290,8 @@ class EventBasedReconciler:
             limit_price=limit_price,
         )
         
+        self._order_venues[order_id] = (exchange_name, symbol)
+        
         # Process any pending callbacks that arrived before registration
         pending = self._pending_callbacks.pop(order_id, [])
         for callback_data in pending:
@@ -280,10 +301,17 @@ class EventBasedReconciler:
                         callback_data["quantity"],
                         callback_data["price"]
                     )
+                    self._record_fill(
+                        order_id,
+                        callback_data["price"],
+                        callback_data["quantity"],
+                        callback_data.get("sequence"),
+                    )
                 elif callback_data.get("type") == "status":
                     status = callback_data.get("status", "").upper()
                     filled_size = callback_data.get("filled_size", Decimal("0"))
                     price = callback_data.get("price")
+                    self._record_status(order_id, status, filled_size, price)
                     if status == "FILLED":
                         if filled_size > tracker.filled_quantity:
                             tracker.on_fill(filled_size - tracker.filled_quantity, price or tracker.limit_price)
@@ -583,9 +611,11 @@ class EventBasedReconciler:
         finally:
             # Cleanup - remove tracker from registry
             self._order_registry.pop(order_id, None)
+            self._order_venues.pop(order_id, None)
     
     def cleanup(self) -> None:
         """Cleanup all registries (for testing/debugging)."""
         self._order_registry.clear()
+        self._order_venues.clear()
         self._pending_callbacks.clear()
 
@@ -0,0 +1,180 @@
+"""Online fill-latency model for adaptive aggressive limit pricing."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Dict, Optional, Sequence, Tuple
+
+# Price levels in ticks relative to the opposite touch (buy: ask + level*tick,
+# sell: bid - level*tick). -1 is the static "inside_spread" step, 0 "touch",
+# +1 "cross_spread".
+DEFAULT_LEVELS: Tuple[int, ...] = (-2, -1, 0, 1)
+
+# Prior fill rates (fills per second of resting time) before any observations
+DEFAULT_PRIOR_RATES: Dict[int, float] = {-2: 0.1, -1: 0.3, 0: 1.0, 1: 3.0}
+
+
+@dataclass
+class LevelStats:
+    """Decayed fill counts, resting time and rejections for one price level."""
+
+    fills: float
+    exposure_seconds: float
+    rejects: float = 0.0
+    attempts: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        # Censored-exponential MLE: fills per second the order was resting
+        return self.fills / self.exposure_seconds if self.exposure_seconds > 0 else 0.0
+
+    @property
+    def reject_rate(self) -> float:
+        total = self.attempts + self.rejects
+        return self.rejects / total if total else 0.0
+
+    def decay(self, factor: float) -> None:
+        self.fills *= factor
+        self.exposure_seconds *= factor
+        self.rejects *= factor
+        self.attempts *= factor
+
+
+@dataclass
+class AttemptPlan:
+    """Price level and wait chosen for one aggressive limit attempt."""
+
+    level: int
+    wait_seconds: float
+    fill_probability: float  # Estimated P(fill within wait_seconds)
+
+
+class FillLatencyModel:
+    """
+    Per-(venue, symbol) estimates of fill rate vs. distance from touch.
+
+    Each attempt is an observation: an order resting at ``level`` for ``t``
+    seconds that either filled (one arrival after ``t``) or did not (censored
+    at ``t``). Fill arrivals are modeled as exponential, so the rate estimate
+    is decayed fills / decayed resting time and P(fill within w) is
+    ``1 - exp(-rate * w)``. Priors act as one pseudo-fill per level so new
+    markets start from sensible defaults and adapt within a few orders.
+
+    ``plan`` picks the most passive level that reaches the target fill
+    probability within the remaining latency budget, and the wait needed to
+    get there; levels a venue keeps rejecting (e.g. post-only crosses) are
+    skipped.
+    """
+
+    def __init__(
+        self,
+        levels: Sequence[int] = DEFAULT_LEVELS,
+        prior_rates: Optional[Dict[int, float]] = None,
+        decay: float = 0.95,
+        target_fill_probability: float = 0.8,
+        min_wait_seconds: float = 0.25,
+        max_wait_seconds: float = 5.0,
+        max_reject_rate: float = 0.5,
+    ) -> None:
+        self.levels = tuple(sorted(levels))
+        self.prior_rates = dict(DEFAULT_PRIOR_RATES if prior_rates is None else prior_rates)
+        self.decay = decay
+        self.target_fill_probability = target_fill_probability
+        self.min_wait_seconds = min_wait_seconds
+        self.max_wait_seconds = max_wait_seconds
+        self.max_reject_rate = max_reject_rate
+        self._stats: Dict[Tuple[str, str, int], LevelStats] = {}
+
+    @staticmethod
+    def level_for_price(side: str, limit_price: Decimal, best_bid: Decimal, best_ask: Decimal, tick_size: Decimal) -> int:
+        """Ticks of aggression relative to the opposite touch for an already-priced order."""
+        if tick_size <= 0:
+            return 0
+        if side == "buy":
+            distance = (limit_price - best_ask) / tick_size
+        else:
+            distance = (best_bid - limit_price) / tick_size
+        return int(distance.to_integral_value())
+
+    def _key(self, venue: str, symbol: str, level: int) -> Tuple[str, str, int]:
+        return (str(venue).lower(), str(symbol).upper(), level)
+
+    def stats(self, venue: str, symbol: str, level: int) -> LevelStats:
+        key = self._key(venue, symbol, level)
+        entry = self._stats.get(key)
+        if entry is None:
+            prior = self.prior_rates.get(level)
+            if prior is None:
+                nearest = min(self.prior_rates, key=lambda known: abs(known - level))
+                prior = self.prior_rates[nearest]
+            entry = LevelStats(fills=1.0, exposure_seconds=1.0 / prior)
+            self._stats[key] = entry
+        return entry
+
+    def fill_probability(self, venue: str, symbol: str, level: int, wait_seconds: float) -> float:
+        rate = self.stats(venue, symbol, level).rate
+        return 1.0 - math.exp(-rate * max(wait_seconds, 0.0))
+
+    def observe(self, venue: str, symbol: str, level: int, waited_seconds: float, filled: bool) -> None:
+        """Record an attempt that rested ``waited_seconds`` and did or did not (censored) fill."""
+        entry = self.stats(venue, symbol, level)
+        entry.decay(self.decay)
+        entry.exposure_seconds += max(waited_seconds, 0.001)
+        entry.attempts += 1
+        if filled:
+            entry.fills += 1
+
+    def observe_rejection(self, venue: str, symbol: str, level: int) -> None:
+        """Record a venue rejection (e.g. post-only violation) at ``level``."""
+        entry = self.stats(venue, symbol, level)
+        entry.decay(self.decay)
+        entry.rejects += 1
+
+    def plan(
+        self,
+        venue: str,
+        symbol: str,
+        remaining_budget_seconds: float,
+        min_level: Optional[int] = None,
+    ) -> AttemptPlan:
+        """
+        Choose the level and wait for the next attempt.
+
+        Args:
+            remaining_budget_seconds: Time left until the target completion latency
+            min_level: Don't go more passive than this (escalation after a miss)
+        """
+        required = -math.log(1.0 - self.target_fill_probability)
+        budget = max(remaining_budget_seconds, self.min_wait_seconds)
+        candidates = [level for level in self.levels if min_level is None or level >= min_level]
+        if not candidates:
+            candidates = [self.levels[-1]]
+        usable = [
+            level for level in candidates
+            if self.stats(venue, symbol, level).reject_rate <= self.max_reject_rate
+        ] or candidates
+
+        chosen = usable[-1]
+        for level in usable:
+            rate = self.stats(venue, symbol, level).rate
+            if rate > 0 and required / rate <= budget:
+                chosen = level
+                break
+
+        rate = self.stats(venue, symbol, chosen).rate
+        needed = required / rate if rate > 0 else self.max_wait_seconds
+        wait = min(max(needed, self.min_wait_seconds), self.max_wait_seconds, budget)
+        return AttemptPlan(
+            level=chosen,
+            wait_seconds=wait,
+            fill_probability=self.fill_probability(venue, symbol, chosen, wait),
+        )
+
+    def clear(self) -> None:
+        self._stats.clear()
+
+
+# Process-wide model shared by every aggressive limit execution
+fill_latency_model = FillLatencyModel()
@@ -1,4 +1,9 @@
-"""Price calculation utilities for aggressive limit order execution."""
+"""
+Price calculation utilities for aggressive limit order execution.
+
+Limit levels are computed in integer ticks of the market's tick size; the BBO
+is converted to ticks once and the chosen level back to a Decimal once.
+"""
 
 from __future__ import annotations
 
@@ -7,6 +12,7 @@ from typing import Optional
 
 from exchange_clients import BaseExchangeClient
 
+from ..fixed_point import MarketScale
 from ..price_alignment import BreakEvenPriceAligner
 from ..price_provider import PriceProvider
 
@@ -20,13 +26,15 @@ class PriceResult:
         best_ask: Decimal,
         limit_price: Decimal,
         pricing_strategy: str,
-        break_even_strategy: Optional[str] = None
+        break_even_strategy: Optional[str] = None,
+        tick_size: Optional[Decimal] = None,
     ):
         self.best_bid = best_bid
         self.best_ask = best_ask
         self.limit_price = limit_price
         self.pricing_strategy = pricing_strategy
         self.break_even_strategy = break_even_strategy
+        self.tick_size = tick_size
 
 
 class AggressiveLimitPricer:
@@ -52,6 +60,7 @@ class AggressiveLimitPricer:
         trigger_fill_price: Optional[Decimal] = None,
         trigger_side: Optional[str] = None,
         logger=None,
+        offset_ticks: Optional[int] = None,
     ) -> PriceResult:
         """
         Calculate aggressive limit price using break-even or adaptive pricing strategy.
@@ -74,6 +83,9 @@ class AggressiveLimitPricer:
             trigger_fill_price: Optional fill price from trigger order (for break-even pricing)
             trigger_side: Optional side of trigger order ("buy" or "sell")
             logger: Optional logger instance for logging
+            offset_ticks: Explicit level in ticks relative to the opposite touch
+                (buy: ask + n*tick, sell: bid - n*tick) chosen by the fill-latency
+                model; replaces the retry_count progression when set
             
         Returns:
             PriceResult with pricing details
@@ -88,16 +100,18 @@ class AggressiveLimitPricer:
         if best_bid <= Decimal("0") or best_ask <= Decimal("0"):
             raise ValueError(f"Invalid BBO for {exchange_name} {symbol}: bid={best_bid}, ask={best_ask}")
         
-        # Get tick_size with fallback
-        tick_size = getattr(exchange_client.config, 'tick_size', None)
-        if tick_size is None:
-            # Fallback: use 0.01% of price (1 basis point)
-            tick_size = best_ask * Decimal('0.0001')
-        else:
-            tick_size = Decimal(str(tick_size))
+        # Get tick grid from contract attributes, with fallback
+        scale = MarketScale.for_client(exchange_client)
+        on_venue_grid = scale is not None
+        if scale is None:
+            # Fallback: use 0.01% of price (1 basis point); price-derived, so kept out of the shared cache
+            scale = MarketScale(best_ask * Decimal('0.0001'))
+        tick_size = scale.tick_size
+        bid_ticks = scale.to_ticks(best_bid)
+        ask_ticks = scale.to_ticks(best_ask)
         
         # Attempt break-even pricing relative to trigger fill price
-        limit_price = None
+        limit_ticks = None
         pricing_strategy = None
         break_even_strategy = None
         
@@ -108,13 +122,13 @@ class AggressiveLimitPricer:
             if max_deviation_pct is None:
                 max_deviation_pct = BreakEvenPriceAligner.DEFAULT_MAX_DEVIATION_PCT
             
-            break_even_price, break_even_strategy = BreakEvenPriceAligner.calculate_break_even_hedge_price(
+            break_even_ticks, break_even_strategy = BreakEvenPriceAligner.break_even_hedge_ticks(
+                scale=scale,
                 trigger_fill_price=trigger_fill_price,
                 trigger_side=trigger_side,
-                hedge_bid=best_bid,
-                hedge_ask=best_ask,
+                bid_ticks=bid_ticks,
+                ask_ticks=ask_ticks,
                 hedge_side=side,
-                tick_size=tick_size,
                 max_deviation_pct=max_deviation_pct,
             )
             
@@ -124,23 +138,17 @@ class AggressiveLimitPricer:
                 # Buy orders: should be close to ask (at ask or ask - small offset) to fill as maker
                 # Sell orders: should be close to bid (at bid or bid + small offset) to fill as maker
                 # If break-even is too far from market, it won't fill and will timeout
-                is_fillable = False
                 if side == "buy":
-                    # Buy order: For maker fill, price should be close to ask
-                    # Check if break-even is within reasonable distance of ask (e.g., within 2 ticks)
-                    distance_from_ask = best_ask - break_even_price
-                    max_distance = tick_size * 2  # Allow up to 2 ticks away from ask
-                    is_fillable = distance_from_ask >= 0 and distance_from_ask <= max_distance
+                    # Buy order: within 2 ticks below the ask
+                    distance_ticks = ask_ticks - break_even_ticks
                 else:  # sell
-                    # Sell order: For maker fill, price should be close to bid
-                    # Check if break-even is within reasonable distance of bid (e.g., within 2 ticks)
-                    distance_from_bid = break_even_price - best_bid
-                    max_distance = tick_size * 2  # Allow up to 2 ticks away from bid
-                    is_fillable = distance_from_bid >= 0 and distance_from_bid <= max_distance
+                    # Sell order: within 2 ticks above the bid
+                    distance_ticks = break_even_ticks - bid_ticks
+                is_fillable = 0 <= distance_ticks <= 2
                 
                 if is_fillable:
                     # Use break-even price
-                    limit_price = break_even_price
+                    limit_ticks = break_even_ticks
                     pricing_strategy = "break_even"
                     # Determine comparison operator based on sides
                     if trigger_side == "buy" and side == "sell":
@@ -152,7 +160,7 @@ class AggressiveLimitPricer:
                     
                     if logger:
                         logger.info(
-                            f"✅ [{exchange_name}] Using break-even price: {limit_price:.6f} "
+                            f"✅ [{exchange_name}] Using break-even price: {scale.to_price(limit_ticks):.6f} "
                             f"{comparison} trigger {trigger_fill_price:.6f} for {symbol} "
                             f"(fillable: bid={best_bid:.6f}, ask={best_ask:.6f})"
                         )
@@ -160,7 +168,7 @@ class AggressiveLimitPricer:
                     # Break-even price is not fillable - skip it and use adaptive pricing
                     if logger:
                         logger.warning(
-                            f"⚠️ [{exchange_name}] Break-even price {break_even_price:.6f} is not fillable "
+                            f"⚠️ [{exchange_name}] Break-even price {scale.to_price(break_even_ticks):.6f} is not fillable "
                             f"for {symbol} (side={side}, bid={best_bid:.6f}, ask={best_ask:.6f}). "
                             f"Skipping break-even and using adaptive pricing to prioritize fill probability."
                         )
@@ -176,7 +184,20 @@ class AggressiveLimitPricer:
         
         # If break-even not attempted or not feasible, use adaptive pricing strategy
         # For aggressive limit orders, prioritize fill probability over price optimization
-        if limit_price is None:
+        if limit_ticks is None and offset_ticks is not None:
+            if offset_ticks < 0:
+                pricing_strategy = "inside_spread"
+            elif offset_ticks == 0:
+                pricing_strategy = "touch"
+            else:
+                pricing_strategy = "cross_spread"
+            # Passive levels never rest behind our own side of the book
+            if side == "buy":
+                limit_ticks = max(ask_ticks + offset_ticks, bid_ticks)
+            else:
+                limit_ticks = min(bid_ticks - offset_ticks, ask_ticks)
+
+        if limit_ticks is None:
             # Strategy progression to maximize fill probability:
             # 1. First attempt: Touch best bid/ask (most aggressive, highest fill probability)
             # 2. Next attempts: Inside spread (1 tick away, still fillable, avoids post-only)
@@ -185,37 +206,30 @@ class AggressiveLimitPricer:
             if retry_count == 0:
                 # First attempt: Touch best bid/ask for maximum fill probability
                 pricing_strategy = "touch"
-                if side == "buy":
-                    limit_price = best_ask  # At ask, will fill as maker if market moves up
-                else:
-                    limit_price = best_bid  # At bid, will fill as maker if market moves down
+                # Buy at ask (fills as maker if market moves up), sell at bid
+                limit_ticks = ask_ticks if side == "buy" else bid_ticks
             elif retry_count < inside_tick_retries:
                 # Next attempts: Inside spread (1 tick away from touch)
                 # Still fillable but safer from post-only violations
                 pricing_strategy = "inside_spread"
-                if side == "buy":
-                    limit_price = best_ask - tick_size
-                else:
-                    limit_price = best_bid + tick_size
+                limit_ticks = ask_ticks - 1 if side == "buy" else bid_ticks + 1
             else:
                 # Final attempts: Cross spread slightly to guarantee fill
                 # This ensures fill but we pay a small spread
                 pricing_strategy = "cross_spread"
-                if side == "buy":
-                    # Cross ask slightly to guarantee fill
-                    limit_price = best_ask + tick_size
-                else:
-                    # Cross bid slightly to guarantee fill
-                    limit_price = best_bid - tick_size
+                limit_ticks = ask_ticks + 1 if side == "buy" else bid_ticks - 1
         
-        # Round price to tick size
-        limit_price = exchange_client.round_to_tick(limit_price)
+        # Back to a price at the venue boundary (already on the tick grid)
+        limit_price = scale.to_price(limit_ticks)
+        if not on_venue_grid:
+            limit_price = exchange_client.round_to_tick(limit_price)
         
         return PriceResult(
             best_bid=best_bid,
             best_ask=best_ask,
             limit_price=limit_price,
             pricing_strategy=pricing_strategy,
-            break_even_strategy=break_even_strategy
+            break_even_strategy=break_even_strategy,
+            tick_size=tick_size,
         )
 
@@ -7,6 +7,11 @@ import time
 from decimal import Decimal
 from typing import Optional, Tuple
 
+from exchange_clients.order_state_cache import OrderStateCache
+
+# Upper bound on one wait for a websocket order update before re-reading state
+ORDER_UPDATE_WAIT_SECONDS = 1.0
+
 
 class ReconciliationResult:
     """Result of order reconciliation."""
@@ -33,6 +38,23 @@ class ReconciliationResult:
 class OrderReconciler:
     """Handles order polling and reconciliation for order execution."""
     
+    @staticmethod
+    async def _wait_for_order_change(exchange_client, order_id: str, remaining: float) -> None:
+        """
+        Wait until the order's state may have changed.
+        
+        With a live websocket-fed order cache this blocks on the next update for
+        the order, so get_order_info() is answered from the cache and REST is only
+        hit when the cache reports the state as stale. Otherwise falls back to
+        polling every 50ms.
+        """
+        get_cache = getattr(exchange_client, "get_order_state_cache", None)
+        cache = get_cache() if callable(get_cache) else None
+        if isinstance(cache, OrderStateCache) and cache.stream_live and str(order_id) in cache:
+            await cache.wait_for_update(order_id, timeout=max(0.0, min(remaining, ORDER_UPDATE_WAIT_SECONDS)))
+            return
+        await asyncio.sleep(0.05)  # Poll every 50ms for faster response
+
     async def poll_order_until_filled(
         self,
         exchange_client,
@@ -185,7 +207,9 @@ class OrderReconciler:
             except Exception as exc:
                 logger.debug(f"Error checking order status: {exc}")
             
-            await asyncio.sleep(0.05)  # Poll every 50ms for faster response
+            await self._wait_for_order_change(
+                exchange_client, order_id, attempt_timeout - (time.time() - fill_start_time)
+            )
         
         return ReconciliationResult(
             filled=filled,
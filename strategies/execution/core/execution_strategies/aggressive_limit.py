@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import os
 import time
 from decimal import Decimal
 from typing import Optional, Tuple
@@ -10,9 +11,11 @@ from dataclasses import dataclass
 
 from exchange_clients import BaseExchangeClient
 
+from ..execution_telemetry import timed_placement
 from ..execution_types import ExecutionResult
 from ..price_provider import PriceProvider
 from .base import ExecutionStrategy
+from ..execution_components.fill_model import FillLatencyModel, fill_latency_model
 from ..execution_components.pricer import AggressiveLimitPricer
 from ..execution_components.reconciler import OrderReconciler
 from helpers.unified_logger import get_core_logger
@@ -38,6 +41,16 @@ class ExecutionState:
     last_pricing_strategy: str
     execution_success: bool
     execution_error: Optional[str]
+    min_level: Optional[int] = None  # Adaptive mode: most passive level still allowed
+    send_bbo: Optional[Tuple[Decimal, Decimal]] = None  # BBO the first attempt was priced from
+
+
+def _env_target_latency() -> Optional[float]:
+    value = os.getenv("AGGRESSIVE_LIMIT_TARGET_LATENCY_SECONDS")
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
 
 
 class AggressiveLimitExecutionStrategy(ExecutionStrategy):
@@ -50,6 +63,8 @@ class AggressiveLimitExecutionStrategy(ExecutionStrategy):
         reconciler: Optional[OrderReconciler] = None,
         market_fallback: Optional[ExecutionStrategy] = None,
         use_websocket_events: bool = True,
+        fill_model: Optional[FillLatencyModel] = None,
+        target_fill_latency_seconds: Optional[float] = None,
     ):
         """
         Initialize aggressive limit execution strategy.
@@ -60,12 +75,19 @@ class AggressiveLimitExecutionStrategy(ExecutionStrategy):
             reconciler: Optional OrderReconciler instance (fallback if websockets not available)
             market_fallback: Optional MarketExecutionStrategy for fallback
             use_websocket_events: If True, use event-based reconciler (faster). Falls back to polling if not supported.
+            fill_model: Optional FillLatencyModel (defaults to the process-wide model)
+            target_fill_latency_seconds: Default target completion latency; enables adaptive
+                pricing when set (env AGGRESSIVE_LIMIT_TARGET_LATENCY_SECONDS if None)
         """
         super().__init__(use_websocket_events=use_websocket_events)
         
         self._price_provider = price_provider or PriceProvider()
         self._pricer = pricer or AggressiveLimitPricer(price_provider=self._price_provider)
         self._reconciler = reconciler or OrderReconciler()
+        self._fill_model = fill_model or fill_latency_model
+        self.target_fill_latency_seconds = (
+            target_fill_latency_seconds if target_fill_latency_seconds is not None else _env_target_latency()
+        )
         self.logger = get_core_logger("aggressive_limit_execution_strategy")
         
         # Lazy import to avoid circular dependency
@@ -235,12 +257,16 @@ class AggressiveLimitExecutionStrategy(ExecutionStrategy):
             OrderResult from exchange
         """
         contract_id = exchange_client.resolve_contract_id(symbol)
-        return await exchange_client.place_limit_order(
-            contract_id=contract_id,
-            quantity=float(order_quantity),
-            price=float(limit_price),
-            side=side,
-            reduce_only=reduce_only,
+        return await timed_placement(
+            exchange_name.lower(),
+            "aggressive_limit",
+            exchange_client.place_limit_order(
+                contract_id=contract_id,
+                quantity=float(order_quantity),
+                price=float(limit_price),
+                side=side,
+                reduce_only=reduce_only,
+            ),
         )
     
     def _is_retryable_error(self, error_msg: str) -> bool:
@@ -601,6 +627,7 @@ class AggressiveLimitExecutionStrategy(ExecutionStrategy):
         trigger_fill_price: Optional[Decimal] = None,
         trigger_side: Optional[str] = None,
         logger=None,
+        target_fill_latency_seconds: Optional[float] = None,
         **kwargs
     ) -> ExecutionResult:
         """
@@ -612,6 +639,12 @@ class AggressiveLimitExecutionStrategy(ExecutionStrategy):
         - Retry on post-only violations with fresh BBO
         - Fallback to market orders if timeout or retries exhausted
         
+        Adaptive mode (target_fill_latency_seconds set): each attempt's price level
+        and wait come from the fill-latency model's per-(venue, symbol) estimates,
+        choosing the most passive level expected to fill within the remaining
+        latency budget and escalating after a miss. Every attempt (static or
+        adaptive) updates the model.
+        
         For closing operations (reduce_only=True), uses more aggressive settings:
         - Shorter timeout (8s vs 13s) for faster exit
         - Fewer retries (8 vs 15) to avoid delay
@@ -632,6 +665,8 @@ class AggressiveLimitExecutionStrategy(ExecutionStrategy):
             trigger_fill_price: Optional fill price from trigger order (for break-even pricing)
             trigger_side: Optional side of trigger order ("buy" or "sell")
             logger: Optional logger instance
+            target_fill_latency_seconds: Target completion latency for adaptive pricing
+                (None = instance default; static retry progression if both unset)
             **kwargs: Additional strategy-specific parameters
             
         Returns:
@@ -646,6 +681,12 @@ class AggressiveLimitExecutionStrategy(ExecutionStrategy):
         )
         
         exchange_name = exchange_client.get_exchange_name().upper()
+        target_latency = (
+            target_fill_latency_seconds
+            if target_fill_latency_seconds is not None
+            else self.target_fill_latency_seconds
+        )
+        adaptive = target_latency is not None and target_latency > 0
         
         # Calculate quantity if not provided
         if quantity is None:
@@ -725,6 +766,18 @@ class AggressiveLimitExecutionStrategy(ExecutionStrategy):
                     # Calculate remaining quantity
                     remaining_qty = target_quantity - state.accumulated_filled_qty
                     
+                    plan = None
+                    if adaptive:
+                        plan = self._fill_model.plan(
+                            exchange_name, symbol,
+                            remaining_budget_seconds=target_latency - (time.time() - start_time),
+                            min_level=state.min_level,
+                        )
+                        logger.debug(
+                            f"🎯 [{exchange_name}] Adaptive plan for {symbol}: level={plan.level} "
+                            f"wait={plan.wait_seconds:.2f}s p_fill={plan.fill_probability:.2f}"
+                        )
+                    
                     # Calculate price using pricer
                     price_result = await self._pricer.calculate_aggressive_limit_price(
                         exchange_client=exchange_client,
@@ -736,8 +789,15 @@ class AggressiveLimitExecutionStrategy(ExecutionStrategy):
                         trigger_fill_price=trigger_fill_price,
                         trigger_side=trigger_side,
                         logger=logger,
+                        offset_ticks=plan.level if plan else None,
                     )
                     state.last_pricing_strategy = price_result.pricing_strategy
+                    if state.send_bbo is None:
+                        state.send_bbo = (price_result.best_bid, price_result.best_ask)
+                    level = self._fill_model.level_for_price(
+                        side, price_result.limit_price, price_result.best_bid,
+                        price_result.best_ask, price_result.tick_size or Decimal("0"),
+                    )
                     
                     # Round quantity to step size
                     order_quantity = exchange_client.round_to_step(remaining_qty)
@@ -779,6 +839,7 @@ class AggressiveLimitExecutionStrategy(ExecutionStrategy):
                         if is_fatal:
                             state.execution_error = error_msg
                             break
+                        self._fill_model.observe_rejection(exchange_name, symbol, level)
                         if should_continue:
                             state.retries_used += 1
                             continue
@@ -805,10 +866,11 @@ class AggressiveLimitExecutionStrategy(ExecutionStrategy):
                             pass
                         break
                     
-                    # Wait for fill (max 5 seconds per attempt)
-                    attempt_timeout = min(5, remaining_timeout)
+                    # Wait for fill (max 5 seconds per attempt, model-chosen in adaptive mode)
+                    attempt_timeout = min(plan.wait_seconds if plan else 5, remaining_timeout)
                     
                     # Wait for order fill
+                    wait_started = time.time()
                     recon_result = await self._wait_for_order_fill(
                         exchange_client, use_event_based, order_id, order_quantity,
                         price_result.limit_price, target_quantity, state.accumulated_filled_qty,
@@ -816,6 +878,16 @@ class AggressiveLimitExecutionStrategy(ExecutionStrategy):
                         retry_count, config.retry_backoff_ms, exchange_name, symbol, logger
                     )
                     
+                    got_fill = recon_result.filled or recon_result.partial_fill_detected
+                    self._fill_model.observe(
+                        exchange_name, symbol, level,
+                        waited_seconds=min(time.time() - wait_started, attempt_timeout),
+                        filled=got_fill,
+                    )
+                    if plan and not got_fill:
+                        # Never go back to a level that just missed
+                        state.min_level = level + 1
+                    
                     # Update state with reconciliation results
                     state.last_order_filled_qty = recon_result.current_order_filled_qty
                     state.accumulated_filled_qty = recon_result.accumulated_filled_qty
@@ -929,11 +1001,14 @@ class AggressiveLimitExecutionStrategy(ExecutionStrategy):
             
             # Fallback to market if limit execution failed
             if not state.execution_success:
-                return await self._execute_market_fallback(
+                fallback_result = await self._execute_market_fallback(
                     exchange_client, symbol, side, quantity, target_quantity,
                     state.accumulated_filled_qty, state.accumulated_fill_price,
                     reduce_only, exchange_name, state.execution_error, logger
                 )
+                fallback_result.retries = state.retries_used
+                fallback_result.send_bbo = state.send_bbo or fallback_result.send_bbo
+                return fallback_result
             
             # Success case
             return ExecutionResult(
@@ -943,6 +1018,8 @@ class AggressiveLimitExecutionStrategy(ExecutionStrategy):
                 fill_price=state.accumulated_fill_price,
                 execution_mode_used=f"aggressive_limit_{state.last_pricing_strategy}",
                 order_id=state.last_order_id,
+                retries=state.retries_used,
+                send_bbo=state.send_bbo,
             )
         
         finally:
@@ -0,0 +1,411 @@
+"""
+Execution Telemetry - append-only store of per-order execution quality.
+
+Every order placed through OrderExecutor (and therefore every leg placed by
+AtomicMultiOrderExecutor) produces one compact ``ExecutionRecord``: venue,
+symbol, mode, intended price, BBO at send, fill VWAP, time-to-first-fill,
+time-to-full-fill and retries. Records are buffered in memory and appended in
+batches to daily JSONL files, so the order path never waits on disk I/O.
+
+``summarize`` aggregates stored records into per-venue latency and slippage
+percentiles (see scripts/execution_quality_report.py). ``timed_placement``
+feeds the live ``order_placement_seconds`` histogram served on ``/metrics``.
+
+Environment:
+    EXECUTION_TELEMETRY_ENABLED: "0"/"false" disables recording (default on)
+    EXECUTION_TELEMETRY_DIR: output directory (default <project>/logs/execution_telemetry)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Awaitable, Coroutine, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, TypeVar
+
+from helpers.metrics import REGISTRY
+from helpers.unified_logger import get_core_logger
+
+logger = get_core_logger("execution_telemetry")
+
+DEFAULT_DIRECTORY = Path(__file__).resolve().parents[3] / "logs" / "execution_telemetry"
+FILE_PREFIX = "executions_"
+
+ORDER_PLACEMENT_SECONDS = REGISTRY.histogram(
+    "order_placement_seconds",
+    "Round trip of place_*_order calls until the venue accepts or rejects",
+    ("venue", "order_type"),
+)
+ORDERS_PLACED = REGISTRY.counter(
+    "orders_placed_total", "Order placement attempts by outcome", ("venue", "order_type", "outcome")
+)
+
+T = TypeVar("T")
+
+
+def _float(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def signed_slippage_bps(side: str, reference: Optional[float], fill_price: Optional[float]) -> Optional[float]:
+    """Slippage of ``fill_price`` against ``reference`` in bps; positive means worse for ``side``."""
+    if not reference or not fill_price:
+        return None
+    direction = 1 if str(side).lower() == "buy" else -1
+    return round(direction * (fill_price - reference) / reference * 10_000, 3)
+
+
+@dataclass(slots=True)
+class ExecutionRecord:
+    """One order's execution quality."""
+
+    ts: float  # Send time (unix seconds)
+    venue: str
+    symbol: str
+    side: str
+    mode: str  # Requested ExecutionMode value
+    mode_used: str  # ExecutionResult.execution_mode_used
+    source: str  # Caller (order_executor, atomic_multi_order, ...)
+    success: bool
+    filled: bool
+    reduce_only: bool = False
+    order_id: Optional[str] = None
+    intended_price: Optional[float] = None
+    bid: Optional[float] = None  # BBO at send
+    ask: Optional[float] = None
+    fill_price: Optional[float] = None  # Fill VWAP
+    quantity: Optional[float] = None
+    filled_quantity: Optional[float] = None
+    time_to_first_fill_ms: Optional[int] = None
+    time_to_full_fill_ms: Optional[int] = None
+    execution_time_ms: int = 0
+    retries: int = 0
+    slippage_bps: Optional[float] = None  # Fill VWAP vs intended price
+    arrival_slippage_bps: Optional[float] = None  # Fill VWAP vs mid at send
+    error: Optional[str] = None
+
+    @property
+    def mid(self) -> Optional[float]:
+        if self.bid and self.ask:
+            return (self.bid + self.ask) / 2
+        return None
+
+    def to_row(self) -> Dict[str, Any]:
+        return {key: value for key, value in asdict(self).items() if value is not None}
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "ExecutionRecord":
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in row.items() if key in known})
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        sent_at: float,
+        venue: str,
+        symbol: str,
+        side: str,
+        mode: str,
+        source: str,
+        result: Any,
+        reduce_only: bool = False,
+        quantity: Optional[Decimal] = None,
+        bbo: Optional[Tuple[Decimal, Decimal]] = None,
+        order_fills: Any = None,
+    ) -> "ExecutionRecord":
+        """
+        Build a record from an ExecutionResult.
+
+        ``order_fills`` is the fill ledger entry for the result's order; its
+        websocket fill timestamps give time-to-first/full-fill. Without it a
+        completed fill falls back to the total execution time.
+        """
+        bid, ask = (_float(bbo[0]), _float(bbo[1])) if bbo else (None, None)
+        fill_price = _float(result.fill_price)
+        filled_quantity = _float(result.filled_quantity)
+
+        intended = _float(result.expected_price)
+        if intended is None:
+            intended = ask if str(side).lower() == "buy" else bid
+
+        first_fill_ms = full_fill_ms = None
+        if order_fills is not None and order_fills.fills:
+            first_fill_ms = max(int((order_fills.first_timestamp - sent_at) * 1000), 0)
+            if order_fills.is_complete(result.filled_quantity):
+                last = max(fill.timestamp for fill in order_fills.fills)
+                full_fill_ms = max(int((last - sent_at) * 1000), 0)
+        if full_fill_ms is None and result.success and result.filled:
+            full_fill_ms = int(result.execution_time_ms)
+
+        record = cls(
+            ts=round(sent_at, 3),
+            venue=str(venue).lower(),
+            symbol=str(symbol).upper(),
+            side=str(side).lower(),
+            mode=mode,
+            mode_used=result.execution_mode_used or mode,
+            source=source,
+            success=bool(result.success),
+            filled=bool(result.filled),
+            reduce_only=reduce_only,
+            order_id=str(result.order_id) if result.order_id else None,
+            intended_price=intended,
+            bid=bid,
+            ask=ask,
+            fill_price=fill_price,
+            quantity=_float(quantity),
+            filled_quantity=filled_quantity,
+            time_to_first_fill_ms=first_fill_ms,
+            time_to_full_fill_ms=full_fill_ms,
+            execution_time_ms=int(result.execution_time_ms or 0),
+            retries=int(getattr(result, "retries", 0) or 0),
+            error=result.error_message,
+        )
+        record.slippage_bps = signed_slippage_bps(record.side, intended, fill_price)
+        record.arrival_slippage_bps = signed_slippage_bps(record.side, record.mid, fill_price)
+        return record
+
+
+async def timed_placement(venue: str, order_type: str, placement: Awaitable[T]) -> T:
+    """
+    Await an exchange ``place_*_order`` call, recording its latency and outcome.
+
+    Outcome is ``accepted``/``rejected`` from the OrderResult, or ``error`` if it raised.
+    """
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        result = await placement
+        outcome = "accepted" if getattr(result, "success", False) else "rejected"
+        return result
+    finally:
+        ORDER_PLACEMENT_SECONDS.labels(venue=venue, order_type=order_type).observe(time.perf_counter() - start)
+        ORDERS_PLACED.labels(venue=venue, order_type=order_type, outcome=outcome).inc()
+
+
+class ExecutionTelemetry:
+    """Buffers execution records and appends them to daily JSONL files in batches."""
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        enabled: Optional[bool] = None,
+        batch_size: int = 50,
+        flush_interval_seconds: float = 5.0,
+        max_buffer: int = 10_000,
+    ) -> None:
+        if enabled is None:
+            enabled = os.getenv("EXECUTION_TELEMETRY_ENABLED", "1").lower() not in ("0", "false", "no")
+        if directory is None:
+            directory = Path(os.getenv("EXECUTION_TELEMETRY_DIR") or DEFAULT_DIRECTORY)
+        self.enabled = enabled
+        self.directory = Path(directory)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_seconds
+        self.max_buffer = max_buffer
+        self._buffer: List[Dict[str, Any]] = []
+        self._write_lock = threading.Lock()
+        self._flush_task: Optional["asyncio.Task[None]"] = None
+        self._flush_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._pending: Set["asyncio.Task[Any]"] = set()
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def record(self, record: ExecutionRecord) -> None:
+        """Queue a record; never blocks on disk."""
+        if not self.enabled:
+            return
+        if len(self._buffer) >= self.max_buffer:
+            self._buffer.pop(0)
+            self.dropped += 1
+        self._buffer.append(record.to_row())
+        self._schedule_flush(immediate=len(self._buffer) >= self.batch_size)
+
+    def submit(self, builder: Coroutine[Any, Any, Optional[ExecutionRecord]]) -> None:
+        """
+        Build and record a record in the background.
+
+        Lets callers return their result immediately while the record waits on
+        slower inputs (late websocket fills).
+        """
+        if not self.enabled:
+            builder.close()
+            return
+
+        async def _run() -> None:
+            try:
+                record = await builder
+            except Exception as exc:
+                logger.debug(f"Execution telemetry record failed: {exc}")
+                return
+            if record is not None:
+                self.record(record)
+
+        task = asyncio.get_running_loop().create_task(_run())
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def drain(self) -> None:
+        """Wait for submitted records, then write everything buffered."""
+        if self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+        task = self._flush_task
+        if task is not None and not task.done() and self._flush_loop is asyncio.get_running_loop():
+            # Everything left is written below; don't leave the loop parked on its timer
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        self._flush_task = None
+        self._wake = None
+        await self.aflush()
+
+    def _schedule_flush(self, immediate: bool) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            if immediate:
+                self.flush()
+            return
+
+        task = self._flush_task
+        if task is None or task.done() or self._flush_loop is not loop:
+            self._wake = asyncio.Event()
+            self._flush_loop = loop
+            self._flush_task = loop.create_task(self._run_flush_loop(self._wake), name="execution-telemetry-flush")
+        if immediate and self._wake is not None:
+            self._wake.set()
+
+    async def _run_flush_loop(self, wake: asyncio.Event) -> None:
+        while self._buffer:
+            try:
+                await asyncio.wait_for(wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            wake.clear()
+            await self.aflush()
+
+    def _take_batch(self) -> List[Dict[str, Any]]:
+        rows, self._buffer = self._buffer, []
+        return rows
+
+    async def aflush(self) -> int:
+        """Write buffered records from a worker thread."""
+        rows = self._take_batch()
+        if rows:
+            await asyncio.to_thread(self._write_rows, rows)
+        return len(rows)
+
+    def flush(self) -> int:
+        """Write buffered records synchronously (shutdown path)."""
+        rows = self._take_batch()
+        if rows:
+            self._write_rows(rows)
+        return len(rows)
+
+    def _write_rows(self, rows: Sequence[Dict[str, Any]]) -> None:
+        by_file: Dict[Path, List[str]] = {}
+        for row in rows:
+            day = datetime.fromtimestamp(row["ts"], tz=timezone.utc).strftime("%Y%m%d")
+            by_file.setdefault(self.directory / f"{FILE_PREFIX}{day}.jsonl", []).append(
+                json.dumps(row, separators=(",", ":"))
+            )
+        try:
+            with self._write_lock:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                for path, lines in by_file.items():
+                    with path.open("a", encoding="utf-8") as handle:
+                        handle.write("\n".join(lines) + "\n")
+        except OSError as exc:
+            logger.warning(f"⚠️ Failed to write {len(rows)} execution telemetry records: {exc}")
+
+
+def load_records(
+    directory: Optional[Path] = None,
+    since: Optional[float] = None,
+) -> Iterator[ExecutionRecord]:
+    """Read stored records (oldest file first), optionally only those sent at/after ``since``."""
+    directory = Path(directory or os.getenv("EXECUTION_TELEMETRY_DIR") or DEFAULT_DIRECTORY)
+    if not directory.exists():
+        return
+    since_day = (
+        datetime.fromtimestamp(since, tz=timezone.utc).strftime("%Y%m%d") if since is not None else None
+    )
+    for path in sorted(directory.glob(f"{FILE_PREFIX}*.jsonl")):
+        if since_day and path.stem[len(FILE_PREFIX):] < since_day:
+            continue
+        with path.open(encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = ExecutionRecord.from_row(json.loads(line))
+                except (ValueError, TypeError):
+                    continue
+                if since is None or record.ts >= since:
+                    yield record
+
+
+def percentile(values: Sequence[float], pct: float) -> Optional[float]:
+    """Linear-interpolated percentile of ``values`` (pct in 0-100)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+SUMMARY_METRICS = ("time_to_first_fill_ms", "time_to_full_fill_ms", "slippage_bps", "arrival_slippage_bps")
+
+
+def summarize(
+    records: Iterable[ExecutionRecord],
+    group_by: Sequence[str] = ("venue",),
+    percentiles: Sequence[float] = (50, 90, 99),
+) -> List[Dict[str, Any]]:
+    """
+    Aggregate records into per-group fill rate, retries and metric percentiles.
+
+    Returns one dict per group (sorted by group key) with ``orders``,
+    ``fill_rate``, ``avg_retries`` and ``<metric>`` -> {"p50": ..., ...}.
+    """
+    groups: Dict[Tuple[Any, ...], List[ExecutionRecord]] = {}
+    for record in records:
+        key = tuple(getattr(record, name) for name in group_by)
+        groups.setdefault(key, []).append(record)
+
+    summary = []
+    for key in sorted(groups, key=lambda k: tuple(str(part) for part in k)):
+        members = groups[key]
+        row: Dict[str, Any] = dict(zip(group_by, key))
+        row["orders"] = len(members)
+        row["fill_rate"] = sum(1 for r in members if r.filled) / len(members)
+        row["avg_retries"] = sum(r.retries for r in members) / len(members)
+        for metric in SUMMARY_METRICS:
+            values = [getattr(r, metric) for r in members if getattr(r, metric) is not None]
+            row[metric] = {f"p{pct:g}": percentile(values, pct) for pct in percentiles}
+            row[metric]["count"] = len(values)
+        summary.append(row)
+    return summary
+
+
+# Process-wide telemetry store
+execution_telemetry = ExecutionTelemetry()
+atexit.register(execution_telemetry.flush)
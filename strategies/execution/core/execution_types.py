@@ -7,7 +7,7 @@ Contains shared data structures used across the execution layer to avoid circula
 from dataclasses import dataclass
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import Optional, Tuple
 
 
 class ExecutionMode(Enum):
@@ -51,4 +51,8 @@ class ExecutionResult:
     
     # Retry handling
     retryable: bool = False  # True if order failure is retryable (e.g., post-only violation)
+    retries: int = 0  # Re-placements before the final outcome (aggressive limit / market fallback)
+
+    # (bid, ask) the order was priced from, for execution telemetry
+    send_bbo: Optional[Tuple[Decimal, Decimal]] = None
 
@@ -0,0 +1,256 @@
+"""
+Fill Ledger - per-process record of every websocket fill.
+
+Websocket fill callbacks (routed by the atomic executor's WebsocketManager and
+by EventBasedReconciler) already see every execution. Recording them here lets
+the closing path compute entry/exit VWAP and realized PnL as soon as a close
+completes, instead of waiting for and paging through exchange trade-history
+APIs.
+
+Fills are keyed by (dex, order_id). Fill callbacks are incremental; status
+callbacks report the cumulative filled size, which is used to detect gaps (a
+fill the ledger never saw) so callers know when to fall back to the APIs.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Iterable, List, Optional, Tuple
+
+from exchange_clients.base_models import TradeData
+
+# Filled quantity may differ from the order size by exchange rounding
+COMPLETE_TOLERANCE = Decimal("0.99")
+
+
+@dataclass(slots=True)
+class LedgerFill:
+    """A single execution reported by a websocket callback."""
+
+    price: Decimal
+    quantity: Decimal
+    timestamp: float
+    sequence: Optional[int] = None
+    trade_id: Optional[str] = None
+    fee: Optional[Decimal] = None
+    inferred: bool = False  # Filled in from a cumulative status update
+
+
+@dataclass
+class OrderFills:
+    """All fills seen for one order."""
+
+    dex: str
+    order_id: str
+    symbol: Optional[str] = None
+    side: Optional[str] = None
+    fills: List[LedgerFill] = field(default_factory=list)
+    reported_filled: Optional[Decimal] = None  # Cumulative size from the last status update
+    status: Optional[str] = None
+
+    @property
+    def quantity(self) -> Decimal:
+        return sum((fill.quantity for fill in self.fills), Decimal("0"))
+
+    @property
+    def notional(self) -> Decimal:
+        return sum((fill.price * fill.quantity for fill in self.fills), Decimal("0"))
+
+    @property
+    def vwap(self) -> Optional[Decimal]:
+        quantity = self.quantity
+        return self.notional / quantity if quantity > 0 else None
+
+    @property
+    def first_timestamp(self) -> Optional[float]:
+        return min((fill.timestamp for fill in self.fills), default=None)
+
+    def is_complete(self, expected_quantity: Optional[Decimal] = None) -> bool:
+        """
+        True when the recorded fills account for the whole order.
+
+        Compares against ``expected_quantity`` when given, otherwise against the
+        cumulative size from the last status update. Fills well above the target
+        mean a fill was recorded twice, so the order is treated as incomplete and
+        callers fall back to the trade-history APIs.
+        """
+        if not self.fills:
+            return False
+        target = expected_quantity if expected_quantity is not None else self.reported_filled
+        if target is None:
+            return False
+        target = Decimal(str(target))
+        quantity = self.quantity
+        return target * COMPLETE_TOLERANCE <= quantity <= target * (2 - COMPLETE_TOLERANCE)
+
+    def to_trades(self, fee_rate: Optional[Decimal] = None, fee_currency: str = "USD") -> List[TradeData]:
+        """
+        Convert to ``TradeData`` so existing aggregation/PnL code can consume it.
+
+        Fills without an exchange-reported fee are charged ``fee_rate`` × notional.
+        """
+        rate = Decimal(str(fee_rate)) if fee_rate is not None else Decimal("0")
+        trades = []
+        for index, fill in enumerate(self.fills):
+            fee = fill.fee if fill.fee is not None else fill.price * fill.quantity * rate
+            trades.append(
+                TradeData(
+                    trade_id=f"ledger-{self.order_id}-{index}",
+                    timestamp=fill.timestamp,
+                    symbol=self.symbol or "",
+                    side=self.side or "",
+                    quantity=fill.quantity,
+                    price=fill.price,
+                    fee=fee,
+                    fee_currency=fee_currency,
+                    order_id=self.order_id,
+                )
+            )
+        return trades
+
+
+class FillLedger:
+    """In-memory fill store shared by every execution path in the process."""
+
+    def __init__(self, max_orders: int = 5000):
+        self._orders: "OrderedDict[Tuple[str, str], OrderFills]" = OrderedDict()
+        self._max_orders = max_orders
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    @staticmethod
+    def _key(dex: str, order_id: str) -> Tuple[str, str]:
+        return (str(dex).lower(), str(order_id))
+
+    def _entry(self, dex: str, order_id: str) -> OrderFills:
+        key = self._key(dex, order_id)
+        entry = self._orders.get(key)
+        if entry is None:
+            entry = OrderFills(dex=key[0], order_id=key[1])
+            self._orders[key] = entry
+            while len(self._orders) > self._max_orders:
+                self._orders.popitem(last=False)
+        return entry
+
+    def record_fill(
+        self,
+        dex: str,
+        order_id: str,
+        price: Decimal,
+        quantity: Decimal,
+        *,
+        sequence: Optional[int] = None,
+        trade_id: Optional[str] = None,
+        symbol: Optional[str] = None,
+        side: Optional[str] = None,
+        fee: Optional[Decimal] = None,
+        timestamp: Optional[float] = None,
+    ) -> bool:
+        """
+        Record an incremental fill.
+
+        Each websocket fill must be recorded by exactly one callback layer (see
+        ``EventBasedReconciler``). Repeats of a sequence number or trade id are
+        still ignored; fills carrying neither are always recorded, since two
+        genuine fills can share price and size.
+
+        A real fill first replaces any inferred quantity added by
+        ``record_status`` so the order is not counted twice.
+
+        Returns:
+            True if the fill was recorded, False if it was dropped as a duplicate
+            or invalid.
+        """
+        if not dex or not order_id or quantity is None or price is None:
+            return False
+        quantity = Decimal(str(quantity))
+        price = Decimal(str(price))
+        if quantity <= 0 or price <= 0:
+            return False
+
+        now = time.time() if timestamp is None else timestamp
+        entry = self._entry(dex, order_id)
+        trade_id = str(trade_id) if trade_id is not None else None
+        for existing in entry.fills:
+            if sequence is not None and existing.sequence == sequence:
+                return False
+            if trade_id is not None and existing.trade_id == trade_id:
+                return False
+
+        self._consume_inferred(entry, quantity)
+        entry.fills.append(
+            LedgerFill(price=price, quantity=quantity, timestamp=now, sequence=sequence, trade_id=trade_id, fee=fee)
+        )
+        if symbol and not entry.symbol:
+            entry.symbol = symbol
+        if side and not entry.side:
+            entry.side = side
+        self._orders.move_to_end(self._key(dex, order_id))
+        return True
+
+    @staticmethod
+    def _consume_inferred(entry: OrderFills, quantity: Decimal) -> None:
+        """Shrink or drop inferred fills by ``quantity`` of newly seen real fills."""
+        remaining = quantity
+        kept: List[LedgerFill] = []
+        for fill in entry.fills:
+            if fill.inferred and remaining > 0:
+                used = min(fill.quantity, remaining)
+                remaining -= used
+                if fill.quantity > used:
+                    fill.quantity -= used
+                    kept.append(fill)
+                continue
+            kept.append(fill)
+        entry.fills = kept
+
+    def record_status(
+        self,
+        dex: str,
+        order_id: str,
+        status: str,
+        filled_size: Optional[Decimal],
+        price: Optional[Decimal] = None,
+    ) -> None:
+        """
+        Record a terminal status update carrying the cumulative filled size.
+
+        For FILLED orders whose recorded fills fall short of the reported size
+        (some exchanges only report the final state) the remainder is added at
+        ``price`` and marked as inferred; fills that arrive later replace it.
+        """
+        if not dex or not order_id or filled_size is None:
+            return
+        filled = Decimal(str(filled_size))
+        entry = self._entry(dex, order_id)
+        entry.status = str(status).upper()
+        if entry.reported_filled is None or filled > entry.reported_filled:
+            entry.reported_filled = filled
+
+        missing = filled - entry.quantity
+        if entry.status == "FILLED" and missing > 0 and price is not None and Decimal(str(price)) > 0:
+            entry.fills.append(
+                LedgerFill(price=Decimal(str(price)), quantity=missing, timestamp=time.time(), inferred=True)
+            )
+
+    def get(self, dex: str, order_id: Optional[str]) -> Optional[OrderFills]:
+        if not dex or not order_id:
+            return None
+        return self._orders.get(self._key(dex, order_id))
+
+    def discard(self, dex: str, order_ids: Iterable[Optional[str]]) -> None:
+        """Drop orders that have been fully accounted for."""
+        for order_id in order_ids:
+            if order_id:
+                self._orders.pop(self._key(dex, order_id), None)
+
+    def clear(self) -> None:
+        self._orders.clear()
+
+
+# Process-wide ledger
+fill_ledger = FillLedger()
@@ -0,0 +1,195 @@
+"""
+Integer tick/lot arithmetic for the execution hot path.
+
+A MarketScale holds one market's price increment (tick size) and quantity
+increment (step size) from the venue's contract attributes. Prices become
+integer ticks and quantities integer lots once, at the venue boundary;
+pricing, sizing and alignment then work on ints and only build a Decimal
+when an order is submitted.
+
+Rounding onto the grid is exact rational arithmetic (no float error and no
+``Decimal(str(x))`` round-trips), and results are always whole multiples of
+the venue increment, unlike ``Decimal.quantize(tick)`` which only matches the
+tick's exponent (e.g. a 0.5 tick would accept 100.3).
+
+Example:
+    >>> scale = MarketScale.of(Decimal("0.01"), Decimal("0.001"))
+    >>> ask = scale.to_ticks(Decimal("100.05"))           # 10005
+    >>> scale.to_price(ask - 1)                           # Decimal("100.04")
+    >>> scale.to_lots(Decimal("0.0199"), ROUND_DOWN)      # 19
+"""
+
+from __future__ import annotations
+
+import math
+from decimal import ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_UP, ROUND_UP, Decimal
+from functools import lru_cache
+from typing import Any, Optional, Tuple, Union
+
+Number = Union[Decimal, int, float, str]
+Ratio = Tuple[int, int]
+
+# Floats within this many increments of a grid point are treated as on-grid
+_FLOAT_SNAP = 1e-9
+
+
+@lru_cache(maxsize=1024)
+def _decimal_ratio(value: Decimal) -> Ratio:
+    return value.as_integer_ratio()
+
+
+def as_ratio(value: Number) -> Ratio:
+    """Exact ``(numerator, denominator)`` of a Decimal/int/str (floats go through repr)."""
+    if value.__class__ is int:
+        return value, 1
+    if value.__class__ is not Decimal:
+        value = Decimal(repr(value) if value.__class__ is float else value)
+    return _decimal_ratio(value)
+
+
+def as_decimal(value: Any) -> Decimal:
+    """Decimal for a venue value without a string round-trip for Decimals and ints."""
+    if value.__class__ is Decimal:
+        return value
+    if value.__class__ is int:
+        return Decimal(value)
+    return Decimal(str(value))
+
+
+def div_round(num: int, den: int, rounding: str = ROUND_HALF_UP) -> int:
+    """``num / den`` rounded to an int with a ``decimal`` rounding mode (den > 0)."""
+    if rounding == ROUND_FLOOR:
+        return num // den
+    if rounding == ROUND_CEILING:
+        return -(-num // den)
+    magnitude = abs(num)
+    if rounding == ROUND_HALF_UP:
+        q = (2 * magnitude + den) // (2 * den)
+    elif rounding == ROUND_DOWN:
+        q = magnitude // den
+    elif rounding == ROUND_UP:
+        q = -(-magnitude // den)
+    else:
+        raise ValueError(f"Unsupported rounding mode: {rounding}")
+    return q if num >= 0 else -q
+
+
+def scale_ticks(ticks: int, factor: Ratio, rounding: str = ROUND_HALF_UP) -> int:
+    """``ticks * factor`` back onto the grid (e.g. ``factor=as_ratio(Decimal("0.9999"))``)."""
+    return div_round(ticks * factor[0], factor[1], rounding)
+
+
+def ratio_exceeds(num: int, den: int, threshold: Ratio) -> bool:
+    """``num / den > threshold`` in integers (den > 0)."""
+    return num * threshold[1] > threshold[0] * den
+
+
+class MarketScale:
+    """Tick/lot grid for one market. Instances are immutable; share them via ``of()``."""
+
+    __slots__ = ("tick_size", "step_size", "_tick", "_step", "_tick_float", "_step_float")
+
+    def __init__(self, tick_size: Optional[Decimal], step_size: Optional[Decimal] = None) -> None:
+        self.tick_size = tick_size
+        self.step_size = step_size
+        self._tick = _positive_ratio(tick_size, "tick_size")
+        self._step = _positive_ratio(step_size, "step_size")
+        self._tick_float = float(tick_size) if self._tick else None
+        self._step_float = float(step_size) if self._step else None
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def of(tick_size: Optional[Decimal], step_size: Optional[Decimal] = None) -> "MarketScale":
+        """Shared scale for a (tick_size, step_size) pair."""
+        return MarketScale(tick_size, step_size)
+
+    @classmethod
+    def for_client(cls, exchange_client: Any) -> Optional["MarketScale"]:
+        """
+        Scale from a client's contract attributes (``config.tick_size`` / ``config.step_size``).
+
+        Returns None when the client has no usable tick size.
+        """
+        config = getattr(exchange_client, "config", None)
+        tick = getattr(config, "tick_size", None)
+        if tick is None:
+            return None
+        step = getattr(config, "step_size", None)
+        try:
+            return cls.of(
+                as_decimal(tick),
+                as_decimal(step) if step is not None else None,
+            )
+        except (ValueError, TypeError, ArithmeticError):
+            return None
+
+    # ------------------------------------------------------------------
+    # Prices <-> ticks
+    # ------------------------------------------------------------------
+
+    def to_ticks(self, price: Number, rounding: str = ROUND_HALF_UP) -> int:
+        """Price to integer ticks, rounded onto the grid."""
+        return _to_grid(price, self._tick, self._tick_float, rounding, "tick_size")
+
+    def to_price(self, ticks: int) -> Decimal:
+        return ticks * self.tick_size
+
+    def round_price(self, price: Number, rounding: str = ROUND_HALF_UP) -> Decimal:
+        return self.to_price(self.to_ticks(price, rounding))
+
+    def scaled_ticks(self, price: Number, factor: Ratio, rounding: str = ROUND_HALF_UP) -> int:
+        """Ticks of ``price * factor`` rounded once (no intermediate rounding of ``price``)."""
+        num, den = as_ratio(price)
+        return div_round(num * factor[0] * self._tick[1], den * factor[1] * self._tick[0], rounding)
+
+    # ------------------------------------------------------------------
+    # Quantities <-> lots
+    # ------------------------------------------------------------------
+
+    def to_lots(self, quantity: Number, rounding: str = ROUND_DOWN) -> int:
+        """Quantity to integer lots (default rounds toward zero, never oversizing)."""
+        return _to_grid(quantity, self._step, self._step_float, rounding, "step_size")
+
+    def to_quantity(self, lots: int) -> Decimal:
+        return lots * self.step_size
+
+    def round_quantity(self, quantity: Number, rounding: str = ROUND_DOWN) -> Decimal:
+        return self.to_quantity(self.to_lots(quantity, rounding))
+
+    def __repr__(self) -> str:  # pragma: no cover - debugging helper
+        return f"MarketScale(tick_size={self.tick_size}, step_size={self.step_size})"
+
+
+def _positive_ratio(value: Optional[Decimal], name: str) -> Optional[Ratio]:
+    if value is None:
+        return None
+    num, den = as_ratio(value)
+    if num <= 0:
+        raise ValueError(f"{name} must be positive, got {value}")
+    return num, den
+
+
+def _to_grid(value: Number, increment: Optional[Ratio], increment_float: Optional[float], rounding: str, name: str) -> int:
+    if increment is None:
+        raise ValueError(f"MarketScale has no {name}")
+    if value.__class__ is float:
+        # Book prices arrive as floats: divide in float and snap near-grid values
+        quotient = value / increment_float
+        nearest = round(quotient)
+        if abs(quotient - nearest) <= _FLOAT_SNAP:
+            return nearest
+        if rounding == ROUND_HALF_UP:
+            magnitude = math.floor(abs(quotient) + 0.5)
+            return magnitude if quotient >= 0 else -magnitude
+        if rounding == ROUND_FLOOR:
+            return math.floor(quotient)
+        if rounding == ROUND_CEILING:
+            return math.ceil(quotient)
+        if rounding == ROUND_DOWN:
+            return math.trunc(quotient)
+        if rounding == ROUND_UP:
+            return math.ceil(quotient) if quotient > 0 else math.floor(quotient)
+        raise ValueError(f"Unsupported rounding mode: {rounding}")
+    num, den = as_ratio(value)
+    return div_round(num * increment[1], den * increment[0], rounding)
+
@@ -18,13 +18,18 @@ Example:
         logger.warning(f"Reduced position size from ${requested_size_usd} to ${max_size} due to leverage limits")
 """
 
-from typing import Any, List, Optional, Dict, Tuple
+import asyncio
+import time
+from typing import Any, Callable, Iterable, List, Optional, Dict, Tuple
 from decimal import Decimal
 from dataclasses import dataclass
 from helpers.unified_logger import get_core_logger
 
 logger = get_core_logger("leverage_validator")
 
+# Leverage limits change rarely; how long cached values are trusted (seconds)
+DEFAULT_REFRESH_INTERVAL_SECONDS = 900.0
+
 
 @dataclass
 class LeveragePreparationResult:
@@ -117,9 +122,48 @@ class LeverageValidator:
     leverage limits, we need to reduce the size for BOTH sides.
     """
     
-    def __init__(self):
+    def __init__(self, refresh_interval_seconds: float = DEFAULT_REFRESH_INTERVAL_SECONDS):
+        """
+        Args:
+            refresh_interval_seconds: How long cached leverage info is trusted. The
+                background refresh (see start_background_refresh) reloads it on this
+                interval; without it, stale entries are re-fetched on next use.
+        """
         self.logger = get_core_logger("leverage_validator")
+        self.refresh_interval_seconds = refresh_interval_seconds
         self._leverage_cache: Dict[Tuple[str, str], LeverageInfo] = {}
+        self._fetched_at: Dict[Tuple[str, str], float] = {}
+        # Leverage we last set per (exchange, symbol); skips redundant set_account_leverage calls
+        self._applied_leverage: Dict[Tuple[str, str], int] = {}
+        self._refresh_task: Optional[asyncio.Task] = None
+    
+    @staticmethod
+    def _cache_key(exchange_name: str, symbol: str) -> Tuple[str, str]:
+        return (exchange_name.lower(), symbol.upper())
+    
+    def _store(self, leverage_info: LeverageInfo) -> None:
+        key = self._cache_key(leverage_info.exchange_name, leverage_info.symbol)
+        self._leverage_cache[key] = leverage_info
+        self._fetched_at[key] = time.monotonic()
+    
+    def get_cached_leverage_info(self, exchange_name: str, symbol: str) -> Optional[LeverageInfo]:
+        """
+        Synchronous lookup of preloaded leverage info (never touches the network).
+        
+        Returns the cached entry even if it is older than the refresh interval;
+        the background refresh replaces it in place.
+        
+        Returns:
+            LeverageInfo, or None if this (exchange, symbol) has not been loaded
+        """
+        return self._leverage_cache.get(self._cache_key(exchange_name, symbol))
+    
+    def _is_fresh(self, key: Tuple[str, str]) -> bool:
+        # While the background refresh is running it owns freshness
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return True
+        fetched_at = self._fetched_at.get(key)
+        return fetched_at is not None and time.monotonic() - fetched_at < self.refresh_interval_seconds
     
     async def get_leverage_info(
         self,
@@ -129,6 +173,8 @@ class LeverageValidator:
         """
         Fetch leverage information for a symbol on an exchange.
         
+        Served from the cache when preloaded/fresh; otherwise queried and cached.
+        
         Args:
             exchange_client: Exchange client instance
             symbol: Trading symbol (e.g., "ZORA", "BTC")
@@ -137,20 +183,125 @@ class LeverageValidator:
             LeverageInfo with limits
         """
         exchange_name = exchange_client.get_exchange_name()
-        cache_key = (exchange_name, symbol)
+        cache_key = self._cache_key(exchange_name, symbol)
         
         # Check cache first
-        if cache_key in self._leverage_cache:
-            return self._leverage_cache[cache_key]
+        cached = self._leverage_cache.get(cache_key)
+        if cached is not None and self._is_fresh(cache_key):
+            return cached
         
         # Query exchange-specific leverage info
         leverage_info = await self._query_exchange_leverage(exchange_client, symbol)
         
         # Cache for future use
-        self._leverage_cache[cache_key] = leverage_info
+        self._store(leverage_info)
         
         return leverage_info
     
+    async def preload(self, exchange_client: Any, symbols: Optional[Iterable[str]] = None) -> int:
+        """
+        Load leverage info for all markets on an exchange.
+        
+        Uses the client's bulk get_all_leverage_info() when available. Exchanges
+        without a bulk endpoint fall back to concurrent per-symbol queries for
+        ``symbols`` plus any symbols already cached for that exchange.
+        
+        Returns:
+            Number of (exchange, symbol) entries loaded
+        """
+        exchange_name = exchange_client.get_exchange_name()
+        
+        bulk = None
+        get_all = getattr(exchange_client, "get_all_leverage_info", None)
+        if callable(get_all):
+            try:
+                bulk = await get_all()
+            except Exception as e:
+                self.logger.warning(f"⚠️  [{exchange_name.upper()}] Bulk leverage query failed: {e}")
+        
+        if bulk:
+            for symbol, leverage_data in bulk.items():
+                self._store(self._to_leverage_info(exchange_name, symbol, leverage_data))
+            self.logger.debug(f"✅ [{exchange_name.upper()}] Preloaded leverage info for {len(bulk)} markets")
+            return len(bulk)
+        
+        wanted = {symbol.upper() for symbol in (symbols or [])}
+        wanted.update(symbol for exchange, symbol in self._leverage_cache if exchange == exchange_name.lower())
+        if not wanted:
+            return 0
+        
+        infos = await asyncio.gather(
+            *(self._query_exchange_leverage(exchange_client, symbol) for symbol in sorted(wanted))
+        )
+        for leverage_info in infos:
+            self._store(leverage_info)
+        return len(infos)
+    
+    async def preload_all(self, exchange_clients: Iterable[Any], symbols: Optional[Iterable[str]] = None) -> None:
+        """Preload leverage info for several exchanges concurrently."""
+        symbols = list(symbols or [])
+        results = await asyncio.gather(
+            *(self.preload(client, symbols) for client in exchange_clients),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.warning(f"⚠️  Leverage preload failed: {result}")
+    
+    def start_background_refresh(
+        self,
+        exchange_clients: Callable[[], Iterable[Any]],
+        symbols: Optional[Callable[[], Iterable[str]]] = None,
+    ) -> None:
+        """
+        Preload now and keep reloading every ``refresh_interval_seconds``.
+        
+        Args:
+            exchange_clients: Returns the clients to refresh (re-read each cycle)
+            symbols: Optional; returns symbols to load on exchanges without a bulk endpoint
+        """
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.create_task(
+            self._refresh_loop(exchange_clients, symbols), name="leverage-refresh"
+        )
+    
+    async def stop_background_refresh(self) -> None:
+        """Cancel the background refresh task."""
+        task, self._refresh_task = self._refresh_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except (asyncio.CancelledError, Exception):
+            pass
+    
+    async def _refresh_loop(
+        self,
+        exchange_clients: Callable[[], Iterable[Any]],
+        symbols: Optional[Callable[[], Iterable[str]]],
+    ) -> None:
+        while True:
+            try:
+                await self.preload_all(list(exchange_clients()), symbols() if symbols else None)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"⚠️  Leverage refresh failed: {e}")
+            await asyncio.sleep(self.refresh_interval_seconds)
+    
+    @staticmethod
+    def _to_leverage_info(exchange_name: str, symbol: str, leverage_data: Dict[str, Any]) -> LeverageInfo:
+        return LeverageInfo(
+            exchange_name=exchange_name,
+            symbol=symbol,
+            max_leverage=leverage_data.get('max_leverage'),
+            max_notional=leverage_data.get('max_notional'),
+            margin_requirement=leverage_data.get('margin_requirement'),
+            error=leverage_data.get('error')  # Preserve error field for MARKET_NOT_FOUND detection
+        )
+    
     async def _query_exchange_leverage(
         self,
         exchange_client: Any,
@@ -170,14 +321,7 @@ class LeverageValidator:
             leverage_data = await exchange_client.get_leverage_info(symbol)
             
             # Convert to LeverageInfo object
-            leverage_info = LeverageInfo(
-                exchange_name=exchange_name,
-                symbol=symbol,
-                max_leverage=leverage_data.get('max_leverage'),
-                max_notional=leverage_data.get('max_notional'),
-                margin_requirement=leverage_data.get('margin_requirement'),
-                error=leverage_data.get('error')  # Preserve error field for MARKET_NOT_FOUND detection
-            )
+            leverage_info = self._to_leverage_info(exchange_name, symbol, leverage_data)
             
             self.logger.debug(
                 f"✅ [{exchange_name.upper()}] Leverage info for {symbol}: {leverage_info}"
@@ -202,7 +346,8 @@ class LeverageValidator:
         exchange_clients: List[Any],
         symbol: str,
         requested_size_usd: Decimal,
-        check_balance: bool = True
+        check_balance: bool = True,
+        available_balances: Optional[Dict[str, Optional[Decimal]]] = None,
     ) -> Tuple[Decimal, Optional[str]]:
         """
         Get maximum position size that ALL exchanges can support.
@@ -215,6 +360,8 @@ class LeverageValidator:
             symbol: Trading symbol
             requested_size_usd: Desired position size in USD
             check_balance: Whether to check available balance
+            available_balances: Balances already fetched by the caller, keyed by
+                exchange name; exchanges listed here are not queried again
             
         Returns:
             Tuple of (max_size_usd, limiting_exchange_name)
@@ -224,21 +371,31 @@ class LeverageValidator:
         max_size = requested_size_usd
         limiting_exchange = None
         
-        for client in exchange_clients:
+        async def _balance(client: Any) -> Optional[Decimal]:
+            exchange_name = client.get_exchange_name()
+            if available_balances is not None and exchange_name in available_balances:
+                return available_balances[exchange_name]
+            try:
+                return await client.get_account_balance()
+            except Exception as e:
+                self.logger.warning(
+                    f"⚠️  Could not get balance for {exchange_name}: {e}"
+                )
+                return None
+        
+        # Exchanges are independent: fetch leverage info and balances concurrently
+        leverage_lookups = asyncio.gather(*(self.get_leverage_info(client, symbol) for client in exchange_clients))
+        if check_balance:
+            leverage_infos, balances = await asyncio.gather(
+                leverage_lookups,
+                asyncio.gather(*(_balance(client) for client in exchange_clients)),
+            )
+        else:
+            leverage_infos = await leverage_lookups
+            balances = [None] * len(exchange_clients)
+        
+        for client, leverage_info, available_balance in zip(exchange_clients, leverage_infos, balances):
             exchange_name = client.get_exchange_name()
-            
-            # Get leverage info
-            leverage_info = await self.get_leverage_info(client, symbol)
-            
-            # Get available balance if requested
-            available_balance = None
-            if check_balance:
-                try:
-                    available_balance = await client.get_account_balance()
-                except Exception as e:
-                    self.logger.warning(
-                        f"⚠️  Could not get balance for {exchange_name}: {e}"
-                    )
             
             # Calculate max size for this exchange
             exchange_max = leverage_info.get_max_size_usd(available_balance)
@@ -310,13 +467,13 @@ class LeverageValidator:
         limiting_exchange = None
         leverage_per_exchange = {}
         
-        # Step 1: Query leverage limits from all exchanges
-        for client in exchange_clients:
+        # Step 1: Query leverage limits from all exchanges (concurrently)
+        leverage_infos = await asyncio.gather(
+            *(self.get_leverage_info(client, symbol) for client in exchange_clients)
+        )
+        for client, leverage_info in zip(exchange_clients, leverage_infos):
             exchange_name = client.get_exchange_name()
             
-            # Get leverage info
-            leverage_info = await self.get_leverage_info(client, symbol)
-            
             if leverage_info.max_leverage is not None:
                 max_lev = int(leverage_info.max_leverage)
                 leverage_per_exchange[exchange_name] = max_lev
@@ -347,7 +504,7 @@ class LeverageValidator:
             f"(limited by {limiting_exchange})"
         )
         
-        for client in exchange_clients:
+        async def _apply(client: Any) -> None:
             exchange_name = client.get_exchange_name()
             
             # Check if exchange supports setting leverage
@@ -355,11 +512,19 @@ class LeverageValidator:
                 self.logger.warning(
                     f"⚠️  [{exchange_name.upper()}] Does not support set_account_leverage(), skipping"
                 )
-                continue
+                return
+            
+            applied_key = self._cache_key(exchange_name, symbol)
+            if self._applied_leverage.get(applied_key) == min_leverage:
+                self.logger.debug(
+                    f"✅ [{exchange_name.upper()}] Leverage already {min_leverage}x for {symbol}"
+                )
+                return
             
             try:
                 success = await client.set_account_leverage(symbol, min_leverage)
                 if success:
+                    self._applied_leverage[applied_key] = min_leverage
                     self.logger.info(
                         f"✅ [{exchange_name.upper()}] Leverage set to {min_leverage}x for {symbol}"
                     )
@@ -372,6 +537,8 @@ class LeverageValidator:
                     f"❌ [{exchange_name.upper()}] Error setting leverage: {e}"
                 )
         
+        await asyncio.gather(*(_apply(client) for client in exchange_clients))
+        
         self.logger.info(
             f"✅ [LEVERAGE] All exchanges normalized to {min_leverage}x for {symbol}"
         )
@@ -439,3 +606,5 @@ class LeverageValidator:
     def clear_cache(self):
         """Clear leverage info cache."""
         self._leverage_cache.clear()
+        self._fetched_at.clear()
+        self._applied_leverage.clear()
@@ -7,13 +7,15 @@ with cancellation support and partial fill tracking.
 
 import asyncio
 import time
-from decimal import Decimal
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal
 from typing import Optional
 
 from exchange_clients import BaseExchangeClient
 from exchange_clients.base_models import CancelReason, is_retryable_cancellation, OrderInfo
 
+from ..execution_telemetry import timed_placement
 from ..execution_types import ExecutionResult
+from ..fixed_point import MarketScale, as_decimal, as_ratio
 from ..price_provider import PriceProvider
 from ..spread_utils import is_spread_acceptable
 from helpers.unified_logger import get_core_logger
@@ -94,6 +96,7 @@ class LimitOrderExecutor:
                     f"Rejecting limit order to prevent slippage."
                 )
                 return ExecutionResult(
+                    send_bbo=(best_bid, best_ask),
                     success=False,
                     filled=False,
                     error_message=f"Spread too wide: {reason}",
@@ -102,23 +105,33 @@ class LimitOrderExecutor:
                 )
             
             # Calculate limit price (maker order with small improvement)
-            if side == "buy":
-                # Buy at ask - offset (better than market taker)
-                limit_price = best_ask * (Decimal('1') - price_offset_pct)
+            scale = MarketScale.for_client(exchange_client)
+            if scale is not None:
+                # Single rounding onto the tick grid, away from the opposite touch
+                # (buys floor, sells ceil) so the maker price never crosses
+                if side == "buy":
+                    # Buy at ask - offset (better than market taker)
+                    factor = as_ratio(Decimal('1') - price_offset_pct)
+                    limit_price = scale.to_price(scale.scaled_ticks(best_ask, factor, ROUND_FLOOR))
+                else:
+                    # Sell at bid + offset (better than market taker)
+                    factor = as_ratio(Decimal('1') + price_offset_pct)
+                    limit_price = scale.to_price(scale.scaled_ticks(best_bid, factor, ROUND_CEILING))
             else:
-                # Sell at bid + offset (better than market taker)
-                limit_price = best_bid * (Decimal('1') + price_offset_pct)
-            
-            # Align price to the exchange's tick size before we derive order size or submit
-            limit_price = exchange_client.round_to_tick(limit_price)
+                if side == "buy":
+                    limit_price = best_ask * (Decimal('1') - price_offset_pct)
+                else:
+                    limit_price = best_bid * (Decimal('1') + price_offset_pct)
+                # Align price to the exchange's tick size before we derive order size or submit
+                limit_price = exchange_client.round_to_tick(limit_price)
             
             order_quantity: Decimal
             if quantity is not None:
-                order_quantity = Decimal(str(quantity)).copy_abs()
+                order_quantity = as_decimal(quantity).copy_abs()
             else:
                 if size_usd is None:
                     raise ValueError("Limit execution requires size_usd or quantity")
-                order_quantity = (Decimal(str(size_usd)) / limit_price).copy_abs()
+                order_quantity = (as_decimal(size_usd) / limit_price).copy_abs()
 
             order_quantity = exchange_client.round_to_step(order_quantity)
             if order_quantity <= Decimal("0"):
@@ -134,16 +147,21 @@ class LimitOrderExecutor:
             )
             
             # Place limit order using the normalized contract_id
-            order_result = await exchange_client.place_limit_order(
-                contract_id=contract_id,
-                quantity=float(order_quantity),
-                price=float(limit_price),
-                side=side,
-                reduce_only=reduce_only
+            order_result = await timed_placement(
+                exchange_name,
+                "limit",
+                exchange_client.place_limit_order(
+                    contract_id=contract_id,
+                    quantity=float(order_quantity),
+                    price=float(limit_price),
+                    side=side,
+                    reduce_only=reduce_only
+                ),
             )
             
             if not order_result.success:
                 return ExecutionResult(
+                    send_bbo=(best_bid, best_ask),
                     success=False,
                     filled=False,
                     error_message=f"Limit order placement failed: {order_result.error_message}",
@@ -199,6 +217,7 @@ class LimitOrderExecutor:
                     message = f"{message} (partial fill qty={filled_qty})"
 
                 return ExecutionResult(
+                    send_bbo=(best_bid, best_ask),
                     success=filled_qty is not None,
                     filled=False,
                     fill_price=fill_price,
@@ -271,6 +290,7 @@ class LimitOrderExecutor:
                     slippage_pct = abs(fill_price - limit_price) / limit_price if limit_price > 0 else Decimal('0')
                     
                     return ExecutionResult(
+                        send_bbo=(best_bid, best_ask),
                         success=True,
                         filled=True,
                         fill_price=fill_price,
@@ -13,6 +13,7 @@ from exchange_clients import BaseExchangeClient
 from .limit_order_executor import LimitOrderExecutor
 from ..utils import coerce_decimal
 from .order_confirmation import OrderConfirmationWaiter
+from ..execution_telemetry import timed_placement
 from ..execution_types import ExecutionResult
 from ..price_provider import PriceProvider
 from helpers.unified_logger import get_core_logger
@@ -98,15 +99,20 @@ class MarketOrderExecutor:
             )
             
             # Place market order using the normalized contract_id
-            result = await exchange_client.place_market_order(
-                contract_id=contract_id,
-                quantity=float(order_quantity),
-                side=side,
-                reduce_only=reduce_only
+            result = await timed_placement(
+                exchange_name,
+                "market",
+                exchange_client.place_market_order(
+                    contract_id=contract_id,
+                    quantity=float(order_quantity),
+                    side=side,
+                    reduce_only=reduce_only
+                ),
             )
             
             if not result.success:
                 return ExecutionResult(
+                    send_bbo=(best_bid, best_ask),
                     success=False,
                     filled=False,
                     error_message=f"Market order failed: {result.error_message}",
@@ -138,6 +144,7 @@ class MarketOrderExecutor:
             if order_info is None:
                 # No order info available - this is an error case
                 return ExecutionResult(
+                    send_bbo=(best_bid, best_ask),
                     success=False,
                     filled=False,
                     error_message="Market order placed but no order info available",
@@ -226,6 +233,7 @@ class MarketOrderExecutor:
                             )
                             
                             return ExecutionResult(
+                                send_bbo=(best_bid, best_ask),
                                 success=True,
                                 filled=True,
                                 fill_price=avg_price,
@@ -254,6 +262,7 @@ class MarketOrderExecutor:
                             )
                             
                             return ExecutionResult(
+                                send_bbo=(best_bid, best_ask),
                                 success=False,  # Overall failed because we didn't fill everything
                                 filled=True,    # But we did have a partial fill
                                 fill_price=partial_fill_price,
@@ -285,6 +294,7 @@ class MarketOrderExecutor:
                         )
                         
                         return ExecutionResult(
+                            send_bbo=(best_bid, best_ask),
                             success=False,  # Overall failed
                             filled=True,    # But we did have a partial fill
                             fill_price=partial_fill_price,
@@ -316,7 +326,7 @@ class MarketOrderExecutor:
                         f"Falling back to aggressive limit order for {symbol}"
                     )
                     # Fallback to limit order with aggressive pricing
-                    return await self._fallback_to_limit_on_slippage_error(
+                    fallback_result = await self._fallback_to_limit_on_slippage_error(
                         exchange_client=exchange_client,
                         symbol=symbol,
                         side=side,
@@ -325,12 +335,15 @@ class MarketOrderExecutor:
                         reduce_only=reduce_only,
                         original_cancel_reason=cancel_reason
                     )
+                    fallback_result.send_bbo = (best_bid, best_ask)
+                    return fallback_result
                 
                 self.logger.error(
                     f"[{exchange_name.upper()}] Market order canceled: {order_id} | "
                     f"Status: {status} | Reason: {cancel_reason}"
                 )
                 return ExecutionResult(
+                    send_bbo=(best_bid, best_ask),
                     success=False,
                     filled=False,
                     error_message=f"Market order canceled: {status} ({cancel_reason})",
@@ -348,6 +361,7 @@ class MarketOrderExecutor:
                     f"Status: {status}"
                 )
                 return ExecutionResult(
+                    send_bbo=(best_bid, best_ask),
                     success=False,
                     filled=False,
                     error_message=f"Market order not filled: status={status}",
@@ -370,6 +384,7 @@ class MarketOrderExecutor:
             )
             
             return ExecutionResult(
+                send_bbo=(best_bid, best_ask),
                 success=True,
                 filled=True,
                 fill_price=fill_price,
@@ -11,7 +11,7 @@ Key features:
 - Automatic fallback from limit to market
 - Timeout handling
 - Slippage tracking
-- Execution quality metrics
+- Execution quality metrics (persisted per order via execution_telemetry)
 """
 
 from typing import Dict, Optional
@@ -21,7 +21,9 @@ import asyncio
 from helpers.unified_logger import get_core_logger
 from exchange_clients import BaseExchangeClient
 
+from .execution_telemetry import ExecutionRecord, execution_telemetry
 from .execution_types import ExecutionMode, ExecutionResult
+from .fill_ledger import fill_ledger
 from .order_execution.limit_order_executor import LimitOrderExecutor
 from .order_execution.market_order_executor import MarketOrderExecutor
 from .order_execution.order_confirmation import OrderConfirmationWaiter
@@ -130,6 +132,8 @@ class OrderExecutor:
         max_deviation_pct: Optional[Decimal] = None,
         trigger_fill_price: Optional[Decimal] = None,
         trigger_side: Optional[str] = None,
+        target_fill_latency_seconds: Optional[float] = None,
+        telemetry_source: Optional[str] = "order_executor",
     ) -> ExecutionResult:
         """
         Execute order with intelligent mode selection.
@@ -153,6 +157,9 @@ class OrderExecutor:
             max_deviation_pct: Max market movement % to attempt break-even pricing (None = default: 0.5%)
             trigger_fill_price: Optional fill price from trigger order (for break-even pricing)
             trigger_side: Optional side of trigger order ("buy" or "sell")
+            target_fill_latency_seconds: Target completion latency; enables fill-model driven
+                pricing/waits (None = strategy default, static progression if unset)
+            telemetry_source: Caller label for the execution telemetry record (None = don't record)
         
         Returns:
             ExecutionResult with all execution details
@@ -168,7 +175,7 @@ class OrderExecutor:
             exchange_name = exchange_client.get_exchange_name()
         except Exception:
             exchange_name = "unknown"
-        
+
         # Choose emoji based on side
         emoji = "🟢" if side == "buy" else "🔴"
         
@@ -234,6 +241,7 @@ class OrderExecutor:
                     self.logger.info(
                         f"Limit order timeout for {symbol}, falling back to market"
                     )
+                    limit_bbo = result.send_bbo
                     result = await self.market_strategy.execute(
                         exchange_client=exchange_client,
                         symbol=symbol,
@@ -243,6 +251,7 @@ class OrderExecutor:
                         reduce_only=reduce_only,
                     )
                     result.execution_mode_used = "market_fallback"
+                    result.send_bbo = limit_bbo or result.send_bbo
             
             elif mode == ExecutionMode.AGGRESSIVE_LIMIT:
                 result = await self.aggressive_limit_strategy.execute(
@@ -260,6 +269,7 @@ class OrderExecutor:
                     trigger_fill_price=trigger_fill_price,
                     trigger_side=trigger_side,
                     logger=self.logger,
+                    target_fill_latency_seconds=target_fill_latency_seconds,
                 )
             
             elif mode == ExecutionMode.ADAPTIVE:
@@ -276,6 +286,7 @@ class OrderExecutor:
                     limit_price_offset_pct=offset_pct,
                     cancel_event=cancel_event,
                     reduce_only=reduce_only,
+                    telemetry_source=None,
                 )
             
             else:
@@ -283,14 +294,57 @@ class OrderExecutor:
             
             # Add execution time
             result.execution_time_ms = int((time.time() - start_time) * 1000)
-            
-            return result
         
         except Exception as e:
             self.logger.error(f"Order execution failed: {e}", exc_info=True)
-            return ExecutionResult(
+            result = ExecutionResult(
                 success=False,
                 filled=False,
                 error_message=str(e),
                 execution_time_ms=int((time.time() - start_time) * 1000)
             )
+
+        if telemetry_source and execution_telemetry.enabled:
+            execution_telemetry.submit(
+                self._build_execution_record(
+                    sent_at=start_time,
+                    exchange_name=exchange_name,
+                    symbol=symbol,
+                    side=side,
+                    mode=mode,
+                    source=telemetry_source,
+                    result=result,
+                    quantity=quantity,
+                    reduce_only=reduce_only,
+                )
+            )
+        return result
+
+    async def _build_execution_record(
+        self,
+        *,
+        sent_at: float,
+        exchange_name: str,
+        symbol: str,
+        side: str,
+        mode: ExecutionMode,
+        source: str,
+        result: ExecutionResult,
+        quantity: Optional[Decimal],
+        reduce_only: bool,
+    ) -> ExecutionRecord:
+        """Assemble the telemetry record from the BBO the order was priced with."""
+        order_fills = fill_ledger.get(exchange_name, result.order_id) if result.order_id else None
+        return ExecutionRecord.build(
+            sent_at=sent_at,
+            venue=exchange_name,
+            symbol=symbol,
+            side=side,
+            mode=mode.value,
+            source=source,
+            result=result,
+            reduce_only=reduce_only,
+            quantity=quantity if quantity is not None else result.filled_quantity,
+            bbo=result.send_bbo,
+            order_fills=order_fills,
+        )
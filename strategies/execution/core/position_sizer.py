@@ -20,6 +20,8 @@ from typing import Any, Optional
 from decimal import Decimal, ROUND_DOWN, ROUND_UP
 from helpers.unified_logger import get_core_logger
 
+from .fixed_point import MarketScale, as_decimal
+
 logger = get_core_logger("position_sizer")
 
 
@@ -169,32 +171,53 @@ class PositionSizer:
         Returns:
             Rounded quantity
         """
+        rounding_mode = ROUND_DOWN if round_down else ROUND_UP
         try:
-            # Try to get tick size from exchange config
-            if hasattr(exchange_client, 'get_quantity_precision'):
-                precision = exchange_client.get_quantity_precision(symbol)
-                
-                # Round to precision
-                rounding_mode = ROUND_DOWN if round_down else ROUND_UP
-                quantized = quantity.quantize(
-                    Decimal(f"1e-{precision}"),
-                    rounding=rounding_mode
-                )
-                
-                return quantized
-            
-            # Fallback: Round to 8 decimal places (standard for crypto)
-            rounding_mode = ROUND_DOWN if round_down else ROUND_UP
-            return quantity.quantize(Decimal("1e-8"), rounding=rounding_mode)
+            scale = self._quantity_scale(exchange_client, symbol)
+            return scale.round_quantity(quantity, rounding_mode)
         
         except Exception as e:
             self.logger.warning(
                 f"Precision rounding failed, using default: {e}"
             )
             # Safe fallback
-            rounding_mode = ROUND_DOWN if round_down else ROUND_UP
             return quantity.quantize(Decimal("1e-8"), rounding=rounding_mode)
     
+    @staticmethod
+    def _quantity_scale(exchange_client: Any, symbol: str) -> MarketScale:
+        """
+        Lot grid for a market: the venue's step size when the client's loaded
+        contract is ``symbol``, else its quantity precision for ``symbol``,
+        else 8 decimal places (standard for crypto).
+
+        ``config.step_size`` belongs to whichever contract was loaded last, so
+        it only applies when the config's ticker or contract id is ``symbol``.
+        """
+        config = getattr(exchange_client, 'config', None)
+        step = getattr(config, 'step_size', None)
+        if (
+            isinstance(step, (Decimal, int, str))
+            and as_decimal(step) > 0
+            and PositionSizer._config_matches(config, symbol)
+        ):
+            return MarketScale.of(None, as_decimal(step))
+        
+        if hasattr(exchange_client, 'get_quantity_precision'):
+            precision = int(exchange_client.get_quantity_precision(symbol))
+            return MarketScale.of(None, Decimal(1).scaleb(-precision))
+        
+        return MarketScale.of(None, Decimal("1e-8"))
+    
+    @staticmethod
+    def _config_matches(config: Any, symbol: str) -> bool:
+        """True when the client's loaded contract is ``symbol``."""
+        wanted = str(symbol).upper()
+        return any(
+            str(value).upper() == wanted
+            for value in (getattr(config, 'ticker', None), getattr(config, 'contract_id', None))
+            if value is not None
+        )
+    
     async def _fetch_mid_price(
         self,
         exchange_client: Any,
@@ -219,13 +242,13 @@ class PositionSizer:
             # Try dedicated BBO method if available
             if hasattr(exchange_client, 'fetch_bbo_prices'):
                 bid, ask = await exchange_client.fetch_bbo_prices(symbol)
-                return Decimal(str(bid)), Decimal(str(ask))
+                return as_decimal(bid), as_decimal(ask)
             
             # Fallback: Get from order book
             if hasattr(exchange_client, 'get_order_book_depth'):
                 book = await exchange_client.get_order_book_depth(symbol, levels=1)
-                best_bid = Decimal(str(book['bids'][0]['price']))
-                best_ask = Decimal(str(book['asks'][0]['price']))
+                best_bid = as_decimal(book['bids'][0]['price'])
+                best_ask = as_decimal(book['asks'][0]['price'])
                 return best_bid, best_ask
             
             raise NotImplementedError(
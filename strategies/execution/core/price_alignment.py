@@ -9,14 +9,19 @@ Key Features:
 - Feasibility-checked break-even for hedge operations
 - Post-only protection validation
 - Spread threshold checks
+
+Hedge pricing works in integer ticks (see ``fixed_point``); Decimal prices are
+converted once on the way in and out.
 """
 
 from dataclasses import dataclass
-from decimal import Decimal
+from decimal import ROUND_FLOOR, Decimal
 from typing import Optional, Tuple
 
 from helpers.unified_logger import get_core_logger
 
+from .fixed_point import MarketScale, Ratio, as_ratio
+
 logger = get_core_logger("price_alignment")
 
 
@@ -42,6 +47,8 @@ class BreakEvenPriceAligner:
     DEFAULT_MAX_SPREAD_PCT = Decimal("0.005")  # 0.5%
     DEFAULT_MAX_DEVIATION_PCT = Decimal("0.005")  # 0.5%
     DEFAULT_OFFSET_RATIO = Decimal("0.25")  # 25% of spread
+    # Break-even hedge target: 1bp through the trigger fill
+    BREAK_EVEN_FACTOR: Ratio = as_ratio(Decimal("0.9999"))
     
     @staticmethod
     def calculate_aligned_prices(
@@ -95,7 +102,7 @@ class BreakEvenPriceAligner:
             long_price = long_ask
             short_price = short_bid
             logger.debug(
-                f"Using BBO-based pricing (spread {spread_pct*100:.2f}% > threshold {max_spread_threshold_pct*100:.2f}%): "
+                lambda: f"Using BBO-based pricing (spread {spread_pct*100:.2f}% > threshold {max_spread_threshold_pct*100:.2f}%): "
                 f"long={long_price:.6f}, short={short_price:.6f}"
             )
             return AlignedPrices(
@@ -128,8 +135,8 @@ class BreakEvenPriceAligner:
         # Final check: ensure long < short
         if long_price >= short_price:
             # Still not break-even, use BBO-based
-            logger.warning(
-                f"Price validation failed (long {long_price:.6f} >= short {short_price:.6f}). "
+            logger.throttled(
+                lambda: f"Price validation failed (long {long_price:.6f} >= short {short_price:.6f}). "
                 f"Using BBO-based pricing."
             )
             long_price = long_ask
@@ -139,7 +146,7 @@ class BreakEvenPriceAligner:
             strategy_used = "aligned" if (long_price == long_price_candidate and short_price == short_price_candidate) else "post_only_adjusted"
         
         logger.debug(
-            f"Aligned prices (spread {spread_pct*100:.2f}%): "
+            lambda: f"Aligned prices (spread {spread_pct*100:.2f}%): "
             f"long={long_price:.6f} < short={short_price:.6f} (strategy: {strategy_used})"
         )
         
@@ -233,89 +240,95 @@ class BreakEvenPriceAligner:
             Tuple of (hedge_price, strategy_used)
             strategy_used: "break_even", "bbo_based", or "bbo_fallback"
         """
+        scale = MarketScale.of(tick_size)
+        hedge_ticks, strategy = BreakEvenPriceAligner.break_even_hedge_ticks(
+            scale=scale,
+            trigger_fill_price=trigger_fill_price,
+            trigger_side=trigger_side,
+            bid_ticks=scale.to_ticks(hedge_bid),
+            ask_ticks=scale.to_ticks(hedge_ask),
+            hedge_side=hedge_side,
+            max_deviation_pct=max_deviation_pct,
+        )
+        return scale.to_price(hedge_ticks), strategy
+
+    @staticmethod
+    def break_even_hedge_ticks(
+        scale: MarketScale,
+        trigger_fill_price: Decimal,
+        trigger_side: str,
+        bid_ticks: int,
+        ask_ticks: int,
+        hedge_side: str,
+        max_deviation_pct: Optional[Decimal] = None,
+    ) -> Tuple[int, str]:
+        """
+        Integer-tick core of ``calculate_break_even_hedge_price``.
+
+        The break-even target is ``trigger_fill_price * 0.9999`` rounded down
+        onto the hedge market's grid, so it stays strictly through the trigger
+        price. Deviation from mid is compared as an integer ratio.
+
+        Returns:
+            Tuple of (hedge_price_ticks, strategy_used)
+        """
         if max_deviation_pct is None:
             max_deviation_pct = BreakEvenPriceAligner.DEFAULT_MAX_DEVIATION_PCT
         
         # Calculate BBO-based price (fallback)
         if hedge_side == "buy":
-            bbo_price = hedge_ask - tick_size
+            bbo_ticks = ask_ticks - 1
         else:
-            bbo_price = hedge_bid + tick_size
+            bbo_ticks = bid_ticks + 1
         
-        # Calculate break-even target
-        if trigger_side == "buy" and hedge_side == "sell":
-            # Long filled, hedging short
-            # Need: short_entry < long_entry (break-even)
-            break_even_target = trigger_fill_price * (Decimal('1') - Decimal('0.0001'))
-            
-            # Check feasibility: Is break-even target fillable?
-            if break_even_target >= hedge_bid:
-                # Check market movement
-                current_mid = (hedge_bid + hedge_ask) / 2
-                deviation_pct = abs(break_even_target - current_mid) / current_mid if current_mid > 0 else Decimal("0")
-                
-                if deviation_pct <= max_deviation_pct:
-                    # Market stable, use break-even price
-                    logger.info(
-                        f"Using break-even hedge price: {break_even_target:.6f} < trigger {trigger_fill_price:.6f} "
-                        f"(deviation: {deviation_pct*100:.2f}%)"
-                    )
-                    return break_even_target, "break_even"
-                else:
-                    # Market moved too much
-                    logger.warning(
-                        f"Market moved {deviation_pct*100:.2f}% since fill. "
-                        f"Using BBO-based price {bbo_price:.6f} for fill probability. "
-                        f"(Break-even target {break_even_target:.6f} would be stale)"
-                    )
-                    return bbo_price, "bbo_fallback"
-            else:
-                # Break-even target below bid (unfillable)
-                logger.warning(
-                    f"Break-even target {break_even_target:.6f} < current bid {hedge_bid:.6f}. "
-                    f"Using BBO-based price {bbo_price:.6f} for fill probability."
-                )
-                return bbo_price, "bbo_fallback"
+        if not (
+            (trigger_side == "buy" and hedge_side == "sell")
+            or (trigger_side == "sell" and hedge_side == "buy")
+        ):
+            # Same side or invalid combination, use BBO-based
+            logger.debug(
+                lambda: f"Invalid trigger/hedge side combination ({trigger_side}/{hedge_side}). "
+                f"Using BBO-based price {scale.to_price(bbo_ticks):.6f}."
+            )
+            return bbo_ticks, "bbo_based"
         
-        elif trigger_side == "sell" and hedge_side == "buy":
-            # Short filled, hedging long
-            # Need: long_entry < short_entry (break-even)
-            break_even_target = trigger_fill_price * (Decimal('1') - Decimal('0.0001'))
-            
-            # Check feasibility: Is break-even target fillable?
-            if break_even_target <= hedge_ask:
-                # Check market movement
-                current_mid = (hedge_bid + hedge_ask) / 2
-                deviation_pct = abs(break_even_target - current_mid) / current_mid if current_mid > 0 else Decimal("0")
-                
-                if deviation_pct <= max_deviation_pct:
-                    # Market stable, use break-even price
-                    logger.info(
-                        f"Using break-even hedge price: {break_even_target:.6f} < trigger {trigger_fill_price:.6f} "
-                        f"(deviation: {deviation_pct*100:.2f}%)"
-                    )
-                    return break_even_target, "break_even"
-                else:
-                    # Market moved too much
-                    logger.warning(
-                        f"Market moved {deviation_pct*100:.2f}% since fill. "
-                        f"Using BBO-based price {bbo_price:.6f} for fill probability. "
-                        f"(Break-even target {break_even_target:.6f} would be stale)"
-                    )
-                    return bbo_price, "bbo_fallback"
-            else:
-                # Break-even target above ask (unfillable)
-                logger.warning(
-                    f"Break-even target {break_even_target:.6f} > current ask {hedge_ask:.6f}. "
-                    f"Using BBO-based price {bbo_price:.6f} for fill probability."
-                )
-                return bbo_price, "bbo_fallback"
+        # Long filled → hedging short, or short filled → hedging long; either way
+        # the hedge must land just through the trigger fill for break-even
+        target_ticks = scale.scaled_ticks(trigger_fill_price, BreakEvenPriceAligner.BREAK_EVEN_FACTOR, ROUND_FLOOR)
         
+        # Check feasibility: Is break-even target fillable?
+        if hedge_side == "sell":
+            fillable = target_ticks >= bid_ticks
+            side_label, touch_label, touch_ticks = "<", "bid", bid_ticks
         else:
-            # Same side or invalid combination, use BBO-based
+            fillable = target_ticks <= ask_ticks
+            side_label, touch_label, touch_ticks = ">", "ask", ask_ticks
+        
+        if not fillable:
+            logger.throttled(
+                lambda: f"Break-even target {scale.to_price(target_ticks):.6f} {side_label} current {touch_label} "
+                f"{scale.to_price(touch_ticks):.6f}. "
+                f"Using BBO-based price {scale.to_price(bbo_ticks):.6f} for fill probability."
+            )
+            return bbo_ticks, "bbo_fallback"
+        
+        # Check market movement: |target - mid| / mid with mid = (bid + ask) / 2
+        mid_x2 = bid_ticks + ask_ticks
+        deviation_x2 = abs(2 * target_ticks - mid_x2)
+        dev_num, dev_den = as_ratio(max_deviation_pct)
+        
+        if mid_x2 <= 0 or deviation_x2 * dev_den <= dev_num * mid_x2:
+            # Market stable, use break-even price (the pricer reports the chosen level)
             logger.debug(
-                f"Invalid trigger/hedge side combination ({trigger_side}/{hedge_side}). "
-                f"Using BBO-based price {bbo_price:.6f}."
+                lambda: f"Using break-even hedge price: {scale.to_price(target_ticks):.6f} < trigger {trigger_fill_price:.6f} "
+                f"(deviation: {(deviation_x2 / mid_x2 if mid_x2 > 0 else 0.0)*100:.2f}%)"
             )
-            return bbo_price, "bbo_based"
-
+            return target_ticks, "break_even"
+        
+        # Market moved too much
+        logger.throttled(
+            lambda: f"Market moved {deviation_x2 / mid_x2 * 100:.2f}% since fill. "
+            f"Using BBO-based price {scale.to_price(bbo_ticks):.6f} for fill probability. "
+            f"(Break-even target {scale.to_price(target_ticks):.6f} would be stale)"
+        )
+        return bbo_ticks, "bbo_fallback"
@@ -73,7 +73,10 @@ class PriceProvider:
 
         bid_dec = Decimal(str(bid))
         ask_dec = Decimal(str(ask))
-        self.logger.info(
-            f"✅ [{exchange_name.upper()}] BBO: bid={bid_dec}, ask={ask_dec}"
+        # Fetched on every pricing attempt: one line per market every few seconds
+        self.logger.throttled(
+            lambda: f"✅ [{exchange_name.upper()}] BBO: bid={bid_dec}, ask={ask_dec}",
+            "INFO",
+            key=(exchange_name, symbol),
         )
         return bid_dec, ask_dec
@@ -5,6 +5,8 @@ from __future__ import annotations
 from decimal import Decimal
 from typing import Optional
 
+from strategies.execution.core.fixed_point import as_decimal
+
 from ...contexts import OrderContext
 
 
@@ -45,10 +47,7 @@ class HedgeTargetCalculator:
         Returns:
             HedgeTarget if calculation successful, None if should skip
         """
-        trigger_qty = trigger_ctx.filled_quantity
-        if not isinstance(trigger_qty, Decimal):
-            trigger_qty = Decimal(str(trigger_qty))
-        trigger_qty = trigger_qty.copy_abs()
+        trigger_qty = as_decimal(trigger_ctx.filled_quantity).copy_abs()
         
         # Account for quantity multipliers when matching across exchanges
         # Example: Lighter kTOSHI (84 units = 84k tokens) vs Aster TOSHI (84k units = 84k tokens)
@@ -59,12 +58,16 @@ class HedgeTargetCalculator:
             target_ctx.spec.symbol
         )
         
-        # Convert trigger quantity to "actual tokens" then to target exchange's units
-        actual_tokens = trigger_qty * Decimal(str(trigger_multiplier))
-        target_qty = actual_tokens / Decimal(str(ctx_multiplier))
-        
         used_multiplier_adjustment = trigger_multiplier != ctx_multiplier
         
+        if used_multiplier_adjustment:
+            # Convert trigger quantity to "actual tokens" then to target exchange's units
+            actual_tokens = trigger_qty * as_decimal(trigger_multiplier)
+            target_qty = actual_tokens / as_decimal(ctx_multiplier)
+        else:
+            # Same units on both legs: hedge the filled quantity exactly
+            target_qty = trigger_qty
+        
         if used_multiplier_adjustment:
             exchange_name = target_ctx.spec.exchange_client.get_exchange_name().upper()
             logger.debug(
@@ -80,7 +83,7 @@ class HedgeTargetCalculator:
         # Only cap if target_qty exceeds spec.quantity significantly (safety check)
         spec_qty = getattr(target_ctx.spec, "quantity", None)
         if spec_qty is not None:
-            spec_qty_dec = Decimal(str(spec_qty))
+            spec_qty_dec = as_decimal(spec_qty)
             # Only cap if target is significantly larger (more than 10% over)
             # This allows for small rounding differences but prevents huge errors
             if target_qty > spec_qty_dec * Decimal("1.1"):
@@ -130,12 +133,12 @@ class HedgeTargetCalculator:
         if hedge_target is not None:
             target_qty = hedge_target
         elif ctx.hedge_target_quantity is not None:
-            target_qty = Decimal(str(ctx.hedge_target_quantity))
+            target_qty = as_decimal(ctx.hedge_target_quantity)
         else:
             # Fallback to spec.quantity
             spec_quantity = getattr(ctx.spec, "quantity", None)
             if spec_quantity is not None:
-                target_qty = Decimal(str(spec_quantity))
+                target_qty = as_decimal(spec_quantity)
             else:
                 return Decimal("0")
         
@@ -172,7 +175,7 @@ class HedgeTargetCalculator:
         # for quantity multipliers across exchanges.
         # Example: Aster fills 233960 TOSHI → Lighter should hedge 233.96 (233960/1000)
         if ctx.hedge_target_quantity is not None:
-            hedge_target = Decimal(str(ctx.hedge_target_quantity))
+            hedge_target = as_decimal(ctx.hedge_target_quantity)
             remaining_qty = hedge_target - ctx.filled_quantity
             if remaining_qty < Decimal("0"):
                 remaining_qty = Decimal("0")
@@ -188,6 +188,7 @@ class MarketHedgeStrategy(HedgeStrategy):
                 mode=ExecutionMode.MARKET_ONLY,
                 timeout_seconds=spec.timeout_seconds,
                 reduce_only=reduce_only,
+                telemetry_source="atomic_hedge",
             )
         except Exception as exc:
             logger.error(f"Hedge order failed on {exchange_name}: {exc}")
@@ -7,6 +7,7 @@ before executing orders.
 
 from __future__ import annotations
 
+import asyncio
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
@@ -66,6 +67,7 @@ class PreFlightChecker:
         Returns:
             Tuple of (success: bool, error_message: Optional[str])
         """
+        pending: List[asyncio.Future] = []
         try:
             compose_stage = lambda *parts: self._compose_stage_id(stage_prefix, *parts)
             symbols_to_check: Dict[str, List[OrderSpec]] = {}
@@ -75,6 +77,46 @@ class PreFlightChecker:
                     symbols_to_check[symbol] = []
                 symbols_to_check[symbol].append(order_spec)
 
+            orders_by_exchange: Dict[str, List[OrderSpec]] = {}
+            for order_spec in orders:
+                orders_by_exchange.setdefault(order_spec.exchange_client.get_exchange_name(), []).append(order_spec)
+
+            # Legs live on independent venues: start every venue read now so they
+            # overlap each other and leverage validation. Each balance is fetched
+            # once and shared by the leverage and margin checks.
+            def _start(coro) -> asyncio.Future:
+                task = asyncio.ensure_future(coro)
+                pending.append(task)
+                return task
+
+            async def _balance(exchange_client: Any) -> Optional[Decimal]:
+                return await exchange_client.get_account_balance()
+
+            async def _snapshot(order_spec: "OrderSpec") -> Any:
+                return await order_spec.exchange_client.get_position_snapshot(order_spec.symbol)
+
+            balance_tasks = {
+                exchange_name: _start(_balance(exchange_orders[0].exchange_client))
+                for exchange_name, exchange_orders in orders_by_exchange.items()
+            }
+            check_liquidation = enable_liquidation_prevention and min_liquidation_distance_pct is not None
+            snapshot_tasks = {
+                exchange_name: _start(_snapshot(exchange_orders[0]))
+                for exchange_name, exchange_orders in orders_by_exchange.items()
+            } if check_liquidation else {}
+            analyzer = LiquidityAnalyzer(price_provider=self.price_provider, max_spread_bps=100)
+            liquidity_tasks = [
+                _start(
+                    analyzer.check_execution_feasibility(
+                        exchange_client=order_spec.exchange_client,
+                        symbol=order_spec.symbol,
+                        side=order_spec.side,
+                        size_usd=order_spec.size_usd,
+                    )
+                )
+                for order_spec in orders
+            ]
+
             if not skip_leverage_check:
                 log_stage(self.logger, "Leverage Validation", icon="📐", stage_id=compose_stage("1"))
                 from strategies.execution.core.leverage_validator import LeverageValidator
@@ -82,16 +124,30 @@ class PreFlightChecker:
                 # Use shared leverage validator if available, otherwise create new instance
                 leverage_validator = self.leverage_validator or LeverageValidator()
 
-                for symbol, symbol_orders in symbols_to_check.items():
-                    exchange_clients = [order.exchange_client for order in symbol_orders]
-                    requested_size = symbol_orders[0].size_usd
-
-                    max_size, limiting_exchange = await leverage_validator.get_max_position_size(
-                        exchange_clients=exchange_clients,
-                        symbol=symbol,
-                        requested_size_usd=requested_size,
-                        check_balance=True,
+                available_balances: Dict[str, Optional[Decimal]] = {}
+                for exchange_name, balance in (await self._join(balance_tasks)).items():
+                    if isinstance(balance, Exception):
+                        self.logger.warning(f"⚠️  Could not get balance for {exchange_name}: {balance}")
+                        balance = None
+                    available_balances[exchange_name] = balance
+
+                size_results = await asyncio.gather(
+                    *(
+                        leverage_validator.get_max_position_size(
+                            exchange_clients=[order.exchange_client for order in symbol_orders],
+                            symbol=symbol,
+                            requested_size_usd=symbol_orders[0].size_usd,
+                            check_balance=True,
+                            available_balances=available_balances,
+                        )
+                        for symbol, symbol_orders in symbols_to_check.items()
                     )
+                )
+
+                for (symbol, symbol_orders), (max_size, limiting_exchange) in zip(
+                    symbols_to_check.items(), size_results
+                ):
+                    requested_size = symbol_orders[0].size_usd
 
                     if max_size < requested_size:
                         error_msg = (
@@ -103,17 +159,21 @@ class PreFlightChecker:
                         self.logger.warning(f"⚠️  {error_msg}")
                         return False, error_msg
 
-                for symbol, symbol_orders in symbols_to_check.items():
-                    exchange_clients = [order.exchange_client for order in symbol_orders]
-                    requested_size = symbol_orders[0].size_usd
-
-                    self.logger.info(f"Normalizing leverage for {symbol}...")
-                    min_leverage, limiting = await leverage_validator.normalize_and_set_leverage(
-                        exchange_clients=exchange_clients,
-                        symbol=symbol,
-                        requested_size_usd=requested_size,
+                self.logger.info(f"Normalizing leverage for {', '.join(symbols_to_check)}...")
+                leverage_results = await asyncio.gather(
+                    *(
+                        leverage_validator.normalize_and_set_leverage(
+                            exchange_clients=[order.exchange_client for order in symbol_orders],
+                            symbol=symbol,
+                            requested_size_usd=symbol_orders[0].size_usd,
+                        )
+                        for symbol, symbol_orders in symbols_to_check.items()
                     )
+                )
 
+                for (symbol, symbol_orders), (min_leverage, limiting) in zip(
+                    symbols_to_check.items(), leverage_results
+                ):
                     if min_leverage is not None:
                         self.logger.info(
                             f"✅ [LEVERAGE] {symbol} normalized to {min_leverage}x "
@@ -139,11 +199,15 @@ class PreFlightChecker:
             exchange_margin_required: Dict[str, Decimal] = {}
             exchange_leverage_info: Dict[str, Dict[str, Any]] = {}  # Store leverage info for notifications
 
-            for order_spec in orders:
-                exchange_name = order_spec.exchange_client.get_exchange_name()
-                estimated_margin = await self.estimate_required_margin(
-                    order_spec, normalized_leverage, leverage_info_cache
+            estimated_margins = await asyncio.gather(
+                *(
+                    self.estimate_required_margin(order_spec, normalized_leverage, leverage_info_cache)
+                    for order_spec in orders
                 )
+            )
+
+            for order_spec, estimated_margin in zip(orders, estimated_margins):
+                exchange_name = order_spec.exchange_client.get_exchange_name()
                 exchange_margin_required.setdefault(exchange_name, Decimal("0"))
                 exchange_margin_required[exchange_name] += estimated_margin
 
@@ -154,32 +218,18 @@ class PreFlightChecker:
                         exchange_leverage_info[exchange_name] = {}
                     exchange_leverage_info[exchange_name][order_spec.symbol] = leverage_info_cache[cache_key]
 
-            for exchange_name, required_margin in exchange_margin_required.items():
-                exchange_client = next(
-                    (
-                        order.exchange_client
-                        for order in orders
-                        if order.exchange_client.get_exchange_name() == exchange_name
-                    ),
-                    None,
-                )
-                if not exchange_client:
-                    continue
+            balances = await self._join(balance_tasks)
 
-                # Get orders for this specific exchange to determine symbol(s)
-                exchange_orders = [
-                    order for order in orders
-                    if order.exchange_client.get_exchange_name() == exchange_name
-                ]
+            for exchange_name, required_margin in exchange_margin_required.items():
+                exchange_orders = orders_by_exchange[exchange_name]
                 # Get symbol from exchange orders (use first order's symbol)
                 # For funding arb, all orders for same exchange should have same symbol
-                symbol = exchange_orders[0].symbol if exchange_orders else "UNKNOWN"
+                symbol = exchange_orders[0].symbol
 
-                try:
-                    available_balance = await exchange_client.get_account_balance()
-                except Exception as exc:  # pragma: no cover - defensive
+                available_balance = balances[exchange_name]
+                if isinstance(available_balance, Exception):  # pragma: no cover - defensive
                     self.logger.warning(
-                        f"⚠️ Balance check failed for {exchange_name}: {exc}"
+                        f"⚠️ Balance check failed for {exchange_name}: {available_balance}"
                     )
                     continue
 
@@ -240,35 +290,23 @@ class PreFlightChecker:
                 )
 
             # Liquidation Risk Check (after margin checks, before liquidity checks)
-            if enable_liquidation_prevention and min_liquidation_distance_pct is not None:
+            if check_liquidation:
                 log_stage(self.logger, "Liquidation Risk Check", icon="⚠️", stage_id=compose_stage("2.5"))
                 self.logger.info("Checking liquidation risk for existing positions...")
                 
                 if liquidation_risk_notified is None:
                     liquidation_risk_notified = {}
                 
-                for exchange_name, required_margin in exchange_margin_required.items():
-                    exchange_client = next(
-                        (
-                            order.exchange_client
-                            for order in orders
-                            if order.exchange_client.get_exchange_name() == exchange_name
-                        ),
-                        None,
-                    )
-                    if not exchange_client:
-                        continue
-                    
-                    # Get orders for this specific exchange to determine symbol
-                    exchange_orders = [
-                        order for order in orders
-                        if order.exchange_client.get_exchange_name() == exchange_name
-                    ]
-                    symbol = exchange_orders[0].symbol if exchange_orders else "UNKNOWN"
+                snapshots = await self._join(snapshot_tasks)
+                
+                for exchange_name in exchange_margin_required:
+                    symbol = orders_by_exchange[exchange_name][0].symbol
                     
                     try:
                         # Check if there's an existing position for this symbol
-                        snapshot = await exchange_client.get_position_snapshot(symbol)
+                        snapshot = snapshots[exchange_name]
+                        if isinstance(snapshot, Exception):
+                            raise snapshot
                         if snapshot and snapshot.liquidation_price is not None and snapshot.mark_price is not None:
                             # Determine side
                             side = snapshot.side
@@ -336,18 +374,11 @@ class PreFlightChecker:
             log_stage(self.logger, "Order Book Liquidity", icon="🌊", stage_id=compose_stage("3"))
             self.logger.info("Running liquidity checks...")
 
-            analyzer = LiquidityAnalyzer(price_provider=self.price_provider, max_spread_bps=100)
-
-            for i, order_spec in enumerate(orders):
+            for i, (order_spec, liquidity_task) in enumerate(zip(orders, liquidity_tasks)):
                 self.logger.debug(
                     f"Checking liquidity for order {i}: {order_spec.side} {order_spec.symbol} ${order_spec.size_usd}"
                 )
-                report = await analyzer.check_execution_feasibility(
-                    exchange_client=order_spec.exchange_client,
-                    symbol=order_spec.symbol,
-                    side=order_spec.side,
-                    size_usd=order_spec.size_usd,
-                )
+                report = await liquidity_task
 
                 if not analyzer.is_execution_acceptable(report):
                     error_msg = (
@@ -407,6 +438,19 @@ class PreFlightChecker:
             self.logger.error(f"Pre-flight check error: {exc}")
             self.logger.warning("⚠️ Continuing despite pre-flight check error")
             return True, None
+        finally:
+            # Early exits leave venue reads running; cancel them and swallow their results
+            for task in pending:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()
+
+    @staticmethod
+    async def _join(tasks: Dict[str, asyncio.Future]) -> Dict[str, Any]:
+        """Await per-exchange tasks together; failures are returned as exceptions."""
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        return dict(zip(tasks.keys(), results))
 
     async def estimate_required_margin(
         self,
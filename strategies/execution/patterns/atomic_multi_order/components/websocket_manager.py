@@ -13,6 +13,7 @@ from __future__ import annotations
 from decimal import Decimal
 from typing import Any, Dict, List, Optional
 
+from strategies.execution.core.fill_ledger import fill_ledger
 from strategies.execution.core.utils import coerce_decimal
 
 from ..contexts import OrderContext
@@ -71,6 +72,45 @@ class WebsocketManager:
                     f"Set websocket status callback router for {exchange_client.get_exchange_name()}"
                 )
     
+    def _record_fill(
+        self,
+        ctx: OrderContext,
+        order_id: str,
+        price: Optional[Decimal],
+        quantity: Decimal,
+        sequence: Optional[int] = None,
+    ) -> None:
+        """Mirror an incremental fill into the process-wide fill ledger."""
+        try:
+            spec = ctx.spec
+            fill_ledger.record_fill(
+                spec.exchange_client.get_exchange_name(),
+                order_id,
+                price,
+                quantity,
+                sequence=sequence,
+                symbol=spec.symbol,
+                side=spec.side,
+            )
+        except Exception as exc:
+            self.logger.debug(f"Error recording fill for {order_id} in fill ledger: {exc}")
+
+    def _record_status(
+        self,
+        ctx: OrderContext,
+        order_id: str,
+        status: str,
+        filled_size: Decimal,
+        price: Optional[Decimal],
+    ) -> None:
+        """Mirror a cumulative status update into the process-wide fill ledger."""
+        try:
+            fill_ledger.record_status(
+                ctx.spec.exchange_client.get_exchange_name(), order_id, status, filled_size, price
+            )
+        except Exception as exc:
+            self.logger.debug(f"Error recording status for {order_id} in fill ledger: {exc}")
+
     def get_callback_router(self) -> Any:
         """Get the websocket callback router function."""
         return self._create_websocket_callback_router()
@@ -137,12 +177,20 @@ class WebsocketManager:
                         callback_data["quantity"],
                         callback_data["price"]
                     )
+                    self._record_fill(
+                        ctx,
+                        order_id,
+                        callback_data["price"],
+                        callback_data["quantity"],
+                        callback_data.get("sequence"),
+                    )
                 elif callback_type == "cancel":
                     ctx.on_websocket_cancel(callback_data.get("filled_size", Decimal("0")))
                 elif callback_type == "status":
                     status = callback_data.get("status", "").upper()
                     filled_size = callback_data.get("filled_size", Decimal("0"))
                     price = callback_data.get("price")
+                    self._record_status(ctx, order_id, status, filled_size, price)
                     if status == "CANCELED" or status == "CANCELLED":
                         ctx.on_websocket_cancel(filled_size)
                     elif status == "FILLED":
@@ -188,6 +236,7 @@ class WebsocketManager:
                 
                 # Context registered - route fill directly
                 ctx.on_websocket_fill(filled_size, price)
+                self._record_fill(ctx, order_id, price, filled_size, sequence)
                 
                 # Also check if order was cancelled (websocket handlers update latest_orders)
                 # This handles case where cancellation happens after registration
@@ -211,6 +260,8 @@ class WebsocketManager:
                     f"Error in websocket callback router for {order_id}: {exc}"
                 )
         
+        # Lets an outer router that chains to this one skip its own ledger write
+        router.records_fills = True
         return router
     
     def _create_websocket_status_callback_router(self) -> Any:
@@ -263,6 +314,7 @@ class WebsocketManager:
                     return
                 
                 # Context registered - route status change
+                self._record_status(ctx, order_id, status_upper, filled_size, price)
                 if status_upper == "CANCELED" or status_upper == "CANCELLED":
                     # Route cancellation to OrderContext
                     ctx.on_websocket_cancel(filled_size)
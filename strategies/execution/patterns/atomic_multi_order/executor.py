@@ -677,6 +677,7 @@ class AtomicMultiOrderExecutor:
             limit_price_offset_pct=spec.limit_price_offset_pct,
             cancel_event=cancel_event,
             reduce_only=spec.reduce_only,
+            telemetry_source="atomic_multi_order",
         )
 
         return execution_result_to_dict(spec, result)
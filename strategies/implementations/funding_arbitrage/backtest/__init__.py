@@ -0,0 +1,44 @@
+"""
+Funding Arbitrage Backtester
+
+Vectorized replay of the strategy's entry (OpportunityFinder + FeeCalculator)
+and exit (risk_management + ExitEvaluator) rules over stored funding_rates
+history, with process-pool parameter sweeps.
+
+Usage:
+    >>> cube = await load_funding_rate_cube(db, start, end, bucket_seconds=3600)
+    >>> grid = expand_grid(BacktestParams(), {"min_profit": [0.0005, 0.001]})
+    >>> results = run_sweep(cube, grid)
+    >>> print(format_sweep_report(results, varied=["min_profit"]))
+"""
+
+from .data import FundingRateCube, forward_fill, load_funding_rate_cube
+from .engine import (
+    EXIT_REASONS,
+    BacktestParams,
+    BacktestResult,
+    PairSignals,
+    compute_pair_signals,
+    fee_rates_for,
+    run_backtest,
+    summarize,
+)
+from .sweep import expand_grid, format_sweep_report, rank_results, run_sweep
+
+__all__ = [
+    'FundingRateCube',
+    'forward_fill',
+    'load_funding_rate_cube',
+    'EXIT_REASONS',
+    'BacktestParams',
+    'BacktestResult',
+    'PairSignals',
+    'compute_pair_signals',
+    'fee_rates_for',
+    'run_backtest',
+    'summarize',
+    'expand_grid',
+    'format_sweep_report',
+    'rank_results',
+    'run_sweep',
+]
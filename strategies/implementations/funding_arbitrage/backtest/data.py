@@ -0,0 +1,174 @@
+"""
+Funding rate history as dense NumPy arrays.
+
+The backtester works on a ``FundingRateCube``: funding rates, open interest and
+24h volume laid out as ``(time, dex, symbol)`` float arrays with NaN where a
+DEX does not list a symbol (or has no sample in that bucket).
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from database.repositories.funding_rate_repository import FundingRateRepository
+
+
+@dataclass
+class FundingRateCube:
+    """Dense funding-rate history for a symbol universe."""
+
+    timestamps: np.ndarray  # (T,) epoch seconds, ascending
+    dexes: List[str]
+    symbols: List[str]
+    rates: np.ndarray  # (T, D, S) per-interval funding rate (same units as funding_rates.funding_rate)
+    open_interest_usd: np.ndarray  # (T, D, S)
+    volume_24h: np.ndarray  # (T, D, S)
+    bucket_seconds: int = 3600
+
+    @property
+    def shape(self) -> tuple:
+        return self.rates.shape
+
+    @property
+    def step_hours(self) -> float:
+        return self.bucket_seconds / 3600.0
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Any],
+        bucket_seconds: int = 3600,
+        max_fill_buckets: Optional[int] = None,
+    ) -> "FundingRateCube":
+        """
+        Build a cube from rows with ``bucket``, ``dex_name``, ``symbol``,
+        ``funding_rate`` and optional ``open_interest_usd`` / ``volume_24h``.
+
+        Args:
+            rows: Rows as returned by FundingRateRepository.get_bucketed_history()
+            bucket_seconds: Bucket width used when the rows were aggregated
+            max_fill_buckets: Forward-fill gaps up to this many buckets
+                (None = fill until the next sample, 0 = no fill)
+        """
+        records = [_row_to_dict(row) for row in rows]
+        if not records:
+            raise ValueError("No funding rate history to build a cube from")
+
+        buckets = sorted({int(record["bucket"]) for record in records})
+        dexes = sorted({str(record["dex_name"]).lower() for record in records})
+        symbols = sorted({str(record["symbol"]).upper() for record in records})
+
+        # Fill gaps between first and last bucket so every step is one bucket wide
+        timestamps = np.arange(buckets[0], buckets[-1] + bucket_seconds, bucket_seconds, dtype=np.int64)
+        t_index = {int(ts): i for i, ts in enumerate(timestamps)}
+        d_index = {name: i for i, name in enumerate(dexes)}
+        s_index = {name: i for i, name in enumerate(symbols)}
+
+        shape = (len(timestamps), len(dexes), len(symbols))
+        rates = np.full(shape, np.nan)
+        oi = np.full(shape, np.nan)
+        volume = np.full(shape, np.nan)
+
+        ti = np.fromiter((t_index[int(r["bucket"])] for r in records), dtype=np.int64, count=len(records))
+        di = np.fromiter((d_index[str(r["dex_name"]).lower()] for r in records), dtype=np.int64, count=len(records))
+        si = np.fromiter((s_index[str(r["symbol"]).upper()] for r in records), dtype=np.int64, count=len(records))
+        rates[ti, di, si] = [_to_float(r.get("funding_rate")) for r in records]
+        oi[ti, di, si] = [_to_float(r.get("open_interest_usd")) for r in records]
+        volume[ti, di, si] = [_to_float(r.get("volume_24h")) for r in records]
+
+        if max_fill_buckets != 0:
+            rates = forward_fill(rates, max_fill_buckets)
+            oi = forward_fill(oi, max_fill_buckets)
+            volume = forward_fill(volume, max_fill_buckets)
+
+        return cls(
+            timestamps=timestamps,
+            dexes=dexes,
+            symbols=symbols,
+            rates=rates,
+            open_interest_usd=oi,
+            volume_24h=volume,
+            bucket_seconds=bucket_seconds,
+        )
+
+    def subset(
+        self,
+        dexes: Optional[Sequence[str]] = None,
+        symbols: Optional[Sequence[str]] = None,
+    ) -> "FundingRateCube":
+        """Return a cube restricted to the given DEXs and/or symbols."""
+        d_idx = [self.dexes.index(d.lower()) for d in dexes] if dexes else list(range(len(self.dexes)))
+        s_idx = [self.symbols.index(s.upper()) for s in symbols] if symbols else list(range(len(self.symbols)))
+        grid = np.ix_(range(len(self.timestamps)), d_idx, s_idx)
+        return FundingRateCube(
+            timestamps=self.timestamps,
+            dexes=[self.dexes[i] for i in d_idx],
+            symbols=[self.symbols[i] for i in s_idx],
+            rates=self.rates[grid],
+            open_interest_usd=self.open_interest_usd[grid],
+            volume_24h=self.volume_24h[grid],
+            bucket_seconds=self.bucket_seconds,
+        )
+
+
+def forward_fill(values: np.ndarray, limit: Optional[int] = None) -> np.ndarray:
+    """Forward-fill NaNs along axis 0, optionally only across gaps of at most ``limit`` steps."""
+    mask = ~np.isnan(values)
+    index = np.where(mask, np.arange(values.shape[0]).reshape(-1, *([1] * (values.ndim - 1))), 0)
+    np.maximum.accumulate(index, axis=0, out=index)
+    filled = np.take_along_axis(values, index, axis=0)
+    if limit is not None:
+        age = np.arange(values.shape[0]).reshape(-1, *([1] * (values.ndim - 1))) - index
+        filled = np.where(age > limit, np.nan, filled)
+    # Leading gaps (before the first sample) stay NaN
+    seen = np.logical_or.accumulate(mask, axis=0)
+    return np.where(seen, filled, np.nan)
+
+
+async def load_funding_rate_cube(
+    database: Any,
+    start_time: datetime,
+    end_time: datetime,
+    bucket_seconds: int = 3600,
+    dex_names: Optional[List[str]] = None,
+    symbols: Optional[List[str]] = None,
+    max_fill_buckets: Optional[int] = 24,
+) -> FundingRateCube:
+    """
+    Load ``funding_rates`` history into a FundingRateCube.
+
+    Args:
+        database: Connected ``databases.Database`` instance
+        start_time: Start of the backtest window
+        end_time: End of the backtest window
+        bucket_seconds: Resampling interval (default: 1 hour)
+        dex_names: Optional DEX universe
+        symbols: Optional symbol universe
+        max_fill_buckets: Forward-fill limit for collection gaps
+    """
+    repository = FundingRateRepository(database)
+    rows = await repository.get_bucketed_history(
+        start_time=start_time,
+        end_time=end_time,
+        bucket_seconds=bucket_seconds,
+        dex_names=dex_names,
+        symbols=symbols,
+    )
+    return FundingRateCube.from_rows(rows, bucket_seconds=bucket_seconds, max_fill_buckets=max_fill_buckets)
+
+
+def _row_to_dict(row: Any) -> Dict[str, Any]:
+    if isinstance(row, dict):
+        return row
+    try:
+        return dict(row._mapping)
+    except AttributeError:
+        return dict(row)
+
+
+def _to_float(value: Any) -> float:
+    if value is None:
+        return np.nan
+    return float(value)
@@ -0,0 +1,137 @@
+"""
+Parameter sweeps for the funding arbitrage backtester.
+
+Parameter sets are fanned out over a process pool. The cube and fee table are
+handed to each worker once (via the pool initializer) and pair signals are
+cached per ``BacktestParams.signal_key()`` inside each worker, so a grid that
+only varies exit thresholds reuses the expensive best-pair computation.
+"""
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .data import FundingRateCube
+from .engine import BacktestParams, BacktestResult, PairSignals, compute_pair_signals, fee_rates_for, run_backtest
+
+# Per-process state populated by _init_worker()
+_WORKER_CUBE: Optional[FundingRateCube] = None
+_WORKER_FEES: Optional[Tuple[np.ndarray, np.ndarray]] = None
+_WORKER_SIGNALS: Dict[Tuple[Any, ...], PairSignals] = {}
+
+
+def expand_grid(base: BacktestParams, grid: Dict[str, Sequence[Any]]) -> List[BacktestParams]:
+    """
+    Cartesian product of ``grid`` values applied on top of ``base``.
+
+    Example:
+        >>> expand_grid(BacktestParams(), {"min_profit": [0.0005, 0.001], "min_erosion_ratio": [0.3, 0.5]})
+        # -> 4 parameter sets
+    """
+    if not grid:
+        return [base]
+    names = list(grid.keys())
+    unknown = [name for name in names if name not in BacktestParams.__dataclass_fields__]
+    if unknown:
+        raise ValueError(f"Unknown backtest parameter(s): {', '.join(unknown)}")
+    return [
+        replace(base, **dict(zip(names, values)))
+        for values in itertools.product(*(grid[name] for name in names))
+    ]
+
+
+def _init_worker(cube: FundingRateCube, fee_rates: Tuple[np.ndarray, np.ndarray]) -> None:
+    global _WORKER_CUBE, _WORKER_FEES
+    _WORKER_CUBE = cube
+    _WORKER_FEES = fee_rates
+    _WORKER_SIGNALS.clear()
+
+
+def _run_in_worker(params: BacktestParams) -> BacktestResult:
+    key = params.signal_key()
+    signals = _WORKER_SIGNALS.get(key)
+    if signals is None:
+        signals = compute_pair_signals(_WORKER_CUBE, params, _WORKER_FEES)
+        _WORKER_SIGNALS[key] = signals
+    return run_backtest(_WORKER_CUBE, params, signals=signals, fee_rates=_WORKER_FEES)
+
+
+def run_sweep(
+    cube: FundingRateCube,
+    param_sets: Iterable[BacktestParams],
+    max_workers: Optional[int] = None,
+    fee_rates: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+) -> List[BacktestResult]:
+    """
+    Run every parameter set and return results in input order.
+
+    Args:
+        cube: Funding rate history
+        param_sets: Parameter sets to evaluate
+        max_workers: Process count (default: CPU count; 1 runs inline)
+        fee_rates: (maker, taker) fee arrays aligned with ``cube.dexes``
+    """
+    params_list = list(param_sets)
+    fee_rates = fee_rates or fee_rates_for(cube.dexes)
+    workers = max_workers or os.cpu_count() or 1
+    workers = min(workers, len(params_list)) if params_list else 1
+
+    if workers <= 1:
+        _init_worker(cube, fee_rates)
+        return [_run_in_worker(params) for params in params_list]
+
+    # Group parameter sets sharing signals so each worker computes them once
+    params_list_sorted = sorted(range(len(params_list)), key=lambda i: repr(params_list[i].signal_key()))
+    ordered = [params_list[i] for i in params_list_sorted]
+    chunksize = max(1, len(ordered) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(cube, fee_rates)) as pool:
+        results_sorted = list(pool.map(_run_in_worker, ordered, chunksize=chunksize))
+
+    results: List[Optional[BacktestResult]] = [None] * len(params_list)
+    for position, original_index in enumerate(params_list_sorted):
+        results[original_index] = results_sorted[position]
+    return results  # type: ignore[return-value]
+
+
+def rank_results(
+    results: Sequence[BacktestResult],
+    sort_by: str = "net_pnl_usd",
+    descending: bool = True,
+) -> List[BacktestResult]:
+    """Sort results by a summary metric."""
+    return sorted(results, key=lambda r: r.summary.get(sort_by, 0.0), reverse=descending)
+
+
+def format_sweep_report(
+    results: Sequence[BacktestResult],
+    varied: Optional[Sequence[str]] = None,
+    top: int = 20,
+    sort_by: str = "net_pnl_usd",
+) -> str:
+    """Plain-text table of the best parameter sets."""
+    ranked = rank_results(results, sort_by=sort_by)[:top]
+    varied = list(varied or [])
+    metrics = [
+        ("trades", "{:>7d}"),
+        ("net_pnl_usd", "{:>12.2f}"),
+        ("fees_usd", "{:>10.2f}"),
+        ("turnover_usd", "{:>13.0f}"),
+        ("win_rate", "{:>8.2%}"),
+        ("holding_hours_p50", "{:>9.1f}"),
+        ("holding_hours_p90", "{:>9.1f}"),
+    ]
+    header = "  ".join([f"{name:>14}" for name in varied] + [
+        f"{'trades':>7}", f"{'net_pnl':>12}", f"{'fees':>10}", f"{'turnover':>13}",
+        f"{'win':>8}", f"{'hold_p50':>9}", f"{'hold_p90':>9}",
+    ])
+    lines = [header, "-" * len(header)]
+    for result in ranked:
+        cells = [f"{str(getattr(result.params, name)):>14}" for name in varied]
+        cells += [fmt.format(result.summary[key]) for key, fmt in metrics]
+        lines.append("  ".join(cells))
+    return "\n".join(lines)
@@ -125,6 +125,16 @@ class FundingArbConfig(BaseModel):
         description="Max new positions to open per cycle"
     )
     
+    prestage_top_k: int = Field(
+        default=3,
+        description="Top scan candidates to pre-stage (leverage, contracts, feeds) before opening; 0 disables"
+    )
+    
+    use_opportunity_feed: bool = Field(
+        default=True,
+        description="Read opportunities from the funding rate service's published feed (falls back to local scoring when stale)"
+    )
+    
     target_margin: Optional[Decimal] = Field(
         default=None,
         description="Target margin per position in USD. If set, exposure will be calculated dynamically based on leverage."
@@ -2,10 +2,13 @@
 
 from .opening.position_opener import PositionOpener
 from .opportunity_scanner import OpportunityScanner
+from .opportunity_snapshot import OpportunitySnapshot, OpportunitySnapshotProvider
 from .closing.position_closer import PositionCloser
 
 __all__ = [
     "PositionOpener",
     "OpportunityScanner",
+    "OpportunitySnapshot",
+    "OpportunitySnapshotProvider",
     "PositionCloser",
 ]
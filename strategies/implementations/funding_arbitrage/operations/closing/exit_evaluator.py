@@ -324,40 +324,14 @@ class ExitEvaluator:
             return False
 
         strategy = self._strategy
-        opportunity_finder = getattr(strategy, "opportunity_finder", None)
-        if opportunity_finder is None:
+        snapshots = getattr(strategy, "opportunity_snapshots", None)
+        if snapshots is None or getattr(strategy, "opportunity_finder", None) is None:
             return False
 
+        # One snapshot (and one tradeability pass) serves every eroding position this cycle
+        max_age = max(strategy.config.risk_config.check_interval_seconds, 1)
         try:
-            from funding_rate_service.models.filters import OpportunityFilter
-        except Exception:
-            return False
-
-        available_exchanges = list(strategy.exchange_clients.keys())
-        whitelist_dexes = [dex.lower() for dex in available_exchanges] if available_exchanges else None
-        required_dex = getattr(strategy.config, "mandatory_exchange", None)
-        if not required_dex:
-            required_dex = getattr(strategy.config, "primary_exchange", None)
-        if isinstance(required_dex, str) and required_dex.strip():
-            required_dex = required_dex.strip().lower()
-        else:
-            required_dex = None
-
-        max_oi_cap = strategy.config.max_oi_usd if required_dex else None
-
-        filters = OpportunityFilter(
-            min_profit_percent=strategy.config.min_profit,
-            max_oi_usd=max_oi_cap,
-            min_volume_24h=strategy.config.min_volume_24h,
-            min_oi_usd=strategy.config.min_oi_usd,
-            whitelist_dexes=whitelist_dexes,
-            required_dex=required_dex,
-            symbol=None,
-            limit=10,
-        )
-
-        try:
-            opportunities = await opportunity_finder.find_opportunities(filters)
+            snapshot = await snapshots.get(max_age_seconds=max_age)
         except Exception as exc:
             strategy.logger.error(
                 f"Failed to score opportunities while checking erosion guard for "
@@ -365,14 +339,10 @@ class ExitEvaluator:
             )
             return False
 
-        if not opportunities:
+        if not snapshot.opportunities:
             return False
 
-        best_tradeable = None
-        for opp in opportunities:
-            if await is_opportunity_tradeable(opp):
-                best_tradeable = opp
-                break
+        best_tradeable = await snapshot.best_tradeable(is_opportunity_tradeable)
         
         if best_tradeable is None:
             strategy.logger.debug(
@@ -1,12 +1,13 @@
 """PnL calculation for position closing."""
 
+import asyncio
 from decimal import Decimal
-from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from exchange_clients.base_models import TradeData
+from strategies.execution.core.fill_ledger import fill_ledger
 
-from ..core.trade_aggregator import aggregate_trades_by_order
+from ..core.trade_aggregator import aggregate_trades_by_order, to_utc_datetime
 from ..core.decimal_utils import to_decimal
 
 # Database imports (optional - handle gracefully if not available)
@@ -80,6 +81,157 @@ class PnLCalculator:
         
         return total_closing_fees
     
+    def _estimated_fee_rate(self, dex: str, is_maker: bool) -> Decimal:
+        """Fee rate charged on ledger fills that arrived without an exchange-reported fee."""
+        try:
+            fee_structure = self._strategy.fee_calculator.get_fee_structure(dex)
+            return to_decimal(fee_structure.maker_fee if is_maker else fee_structure.taker_fee)
+        except Exception:
+            return Decimal("0")
+    
+    def _ledger_trades(
+        self,
+        dex: str,
+        symbol: str,
+        side: str,
+        order_id: Optional[str],
+        expected_quantity: Any,
+        is_maker: bool,
+    ) -> Optional[List[TradeData]]:
+        """
+        Trades for one order from the fill ledger, or None if the ledger has gaps.
+        
+        The ledger only covers orders placed by this process since it started, so
+        anything it didn't fully see is left to the trade-history APIs.
+        """
+        if not order_id or not expected_quantity:
+            return None
+        order_fills = fill_ledger.get(dex, order_id)
+        if order_fills is None or not order_fills.is_complete(to_decimal(expected_quantity)):
+            return None
+        trades = order_fills.to_trades(fee_rate=self._estimated_fee_rate(dex, is_maker))
+        for trade in trades:
+            trade.symbol = trade.symbol or symbol
+            trade.side = trade.side or side
+        return trades
+    
+    def close_fills_recorded(self, close_result: Optional[Dict[str, Any]]) -> bool:
+        """True if the fill ledger saw every closing fill in ``close_result``."""
+        if not close_result:
+            return False
+        filled_orders = close_result.get("filled_orders", [])
+        if not filled_orders:
+            return False
+        for fill_info in filled_orders:
+            order_fills = fill_ledger.get(fill_info.get("dex"), fill_info.get("order_id"))
+            filled_qty = fill_info.get("filled_quantity")
+            if order_fills is None or not filled_qty or not order_fills.is_complete(to_decimal(filled_qty)):
+                return False
+        return True
+    
+    async def _fetch_trade_history(
+        self,
+        dex: str,
+        client: Any,
+        symbol: str,
+        entry_order_id: Optional[str],
+        exit_order_id: Optional[str],
+        closing_order_ids: set,
+        start_time: float,
+        end_time: float,
+        entry_window: Tuple[float, float],
+        exit_window: Tuple[float, float],
+    ) -> Tuple[List[TradeData], List[TradeData], bool]:
+        """
+        Fetch entry and exit trades for one DEX from its trade-history API.
+        
+        Returns:
+            Tuple of (entry_trades, exit_trades, order_ids_available)
+        """
+        strategy = self._strategy
+        entry_window_start, entry_window_end = entry_window
+        exit_window_start, exit_window_end = exit_window
+        order_ids_available = False
+        
+        entry_trades: List[TradeData] = []
+        if entry_order_id:
+            try:
+                trades = await client.get_user_trade_history(
+                    symbol=symbol,
+                    start_time=entry_window_start,
+                    end_time=entry_window_end,
+                    order_id=entry_order_id,
+                )
+                if trades:
+                    entry_trades.extend(trades)
+                    order_ids_available = True
+                    strategy.logger.debug(
+                        f"[{dex}] Found {len(trades)} entry trades for order_id {entry_order_id}"
+                    )
+            except Exception as e:
+                strategy.logger.debug(
+                    f"[{dex}] Failed to get entry trades with order_id {entry_order_id}: {e}"
+                )
+        
+        exit_trades: List[TradeData] = []
+        if exit_order_id:
+            try:
+                trades = await client.get_user_trade_history(
+                    symbol=symbol,
+                    start_time=exit_window_start,
+                    end_time=exit_window_end,
+                    order_id=exit_order_id,
+                )
+                if trades:
+                    exit_trades.extend(trades)
+                    order_ids_available = True
+                    strategy.logger.debug(
+                        f"[{dex}] Found {len(trades)} exit trades for order_id {exit_order_id}"
+                    )
+            except Exception as e:
+                strategy.logger.debug(
+                    f"[{dex}] Failed to get exit trades with order_id {exit_order_id}: {e}"
+                )
+        
+        if not entry_trades or not exit_trades:
+            try:
+                all_trades = await client.get_user_trade_history(
+                    symbol=symbol,
+                    start_time=start_time,
+                    end_time=end_time,
+                    order_id=None,
+                )
+                if all_trades:
+                    for trade in all_trades:
+                        if entry_order_id and trade.order_id == entry_order_id:
+                            if trade not in entry_trades:
+                                entry_trades.append(trade)
+                        elif exit_order_id and trade.order_id == exit_order_id:
+                            if trade not in exit_trades:
+                                exit_trades.append(trade)
+                        elif trade.order_id in closing_order_ids:
+                            if trade not in exit_trades:
+                                exit_trades.append(trade)
+                        else:
+                            trade_ts = trade.timestamp
+                            if entry_window_start <= trade_ts <= entry_window_end:
+                                if trade not in entry_trades:
+                                    entry_trades.append(trade)
+                            elif exit_window_start <= trade_ts <= exit_window_end:
+                                if trade not in exit_trades:
+                                    exit_trades.append(trade)
+                    
+                    strategy.logger.debug(
+                        f"[{dex}] Found {len(entry_trades)} entry and {len(exit_trades)} exit trades "
+                        f"(timestamp-filtered from {len(all_trades)} total)"
+                    )
+            except Exception as e:
+                strategy.logger.debug(
+                    f"[{dex}] Failed to get trade history: {e}"
+                )
+        
+        return entry_trades, exit_trades, order_ids_available
+    
     async def calculate_pnl_from_trade_history(
         self,
         position: "FundingArbPosition",
@@ -87,11 +239,14 @@ class PnLCalculator:
         start_time: float,
         end_time: float,
         store_trades_fn: Any,
+        close_order_type: Optional[str] = None,
     ) -> Optional[Tuple[Decimal, str]]:
         """
-        Calculate PnL from exchange trade history APIs.
+        Calculate PnL from recorded fills, falling back to exchange trade history APIs.
         
-        Fetches both entry and exit trades for accurate PnL calculation.
+        Entry and exit fills are taken from the process-wide fill ledger when it
+        saw the complete order; only legs with gaps are fetched from the
+        trade-history APIs (concurrently across DEXes).
         Supports both automated closes (with close_result) and manual closes (without close_result).
         
         Args:
@@ -101,6 +256,8 @@ class PnLCalculator:
             start_time: Start timestamp (Unix seconds) - position opened_at
             end_time: End timestamp (Unix seconds) - current time after close
             store_trades_fn: Function to store trades in database
+            close_order_type: "market" (taker) or "limit" (maker), used to estimate
+                              fees for ledger fills; defaults to taker
             
         Returns:
             Tuple of (pnl, method_name) if successful, None if trade history unavailable
@@ -115,6 +272,7 @@ class PnLCalculator:
                 entry_order_ids_by_dex[dex] = leg_meta.get("order_id")
         
         exit_order_ids_by_dex: Dict[str, Optional[str]] = {}
+        exit_quantities_by_dex: Dict[str, Any] = {}
         closing_order_ids: set = set()
         if close_result:
             filled_orders = close_result.get("filled_orders", [])
@@ -123,121 +281,86 @@ class PnLCalculator:
                 order_id = fill_info.get("order_id")
                 if dex and order_id:
                     exit_order_ids_by_dex[dex] = order_id
+                    exit_quantities_by_dex[dex] = fill_info.get("filled_quantity")
                     closing_order_ids.add(order_id)
         
         all_trades_by_dex: Dict[str, List[TradeData]] = {}
         entry_trades_by_dex: Dict[str, List[TradeData]] = {}
         exit_trades_by_dex: Dict[str, List[TradeData]] = {}
         
-        # Handle timezone-aware and naive datetimes
-        opened_at = position.opened_at
-        if opened_at.tzinfo is None:
-            opened_at_timestamp = opened_at.timestamp()
-        else:
-            opened_at_timestamp = opened_at.timestamp()
         # Widen time window to 30 minutes to account for API indexing delays
-        entry_window_start = opened_at_timestamp - 1800  # 30 minutes before
-        entry_window_end = opened_at_timestamp + 1800   # 30 minutes after
-        exit_window_start = end_time - 300
-        exit_window_end = end_time + 300
+        opened_at_timestamp = position.opened_at.timestamp()
+        entry_window = (opened_at_timestamp - 1800, opened_at_timestamp + 1800)
+        exit_window = (end_time - 300, end_time + 300)
         
         order_ids_available = False
+        exit_is_maker = close_order_type == "limit"
         
+        fetches = []
+        ledger_only = True
         for dex in [position.long_dex, position.short_dex]:
             if not dex:
                 continue
             
-            client = strategy.exchange_clients.get(dex)
-            if not client:
-                strategy.logger.debug(f"[{dex}] Exchange client not available for trade history")
-                continue
-            
+            leg_meta = legs_metadata.get(dex, {})
             entry_order_id = entry_order_ids_by_dex.get(dex)
             exit_order_id = exit_order_ids_by_dex.get(dex)
+            # "limit", "aggressive_limit" fill as maker; "market" and any fallback to market as taker
+            execution_mode = str(leg_meta.get("execution_mode") or "")
+            entry_is_maker = "limit" in execution_mode and "market" not in execution_mode
             
-            entry_trades: List[TradeData] = []
-            if entry_order_id:
-                try:
-                    trades = await client.get_user_trade_history(
-                        symbol=position.symbol,
-                        start_time=entry_window_start,
-                        end_time=entry_window_end,
-                        order_id=entry_order_id,
-                    )
-                    if trades:
-                        entry_trades.extend(trades)
-                        order_ids_available = True
-                        strategy.logger.debug(
-                            f"[{dex}] Found {len(trades)} entry trades for order_id {entry_order_id}"
-                        )
-                except Exception as e:
-                    strategy.logger.debug(
-                        f"[{dex}] Failed to get entry trades with order_id {entry_order_id}: {e}"
-                    )
+            entry_side = "sell" if leg_meta.get("side") == "short" else "buy"
+            exit_side = "buy" if entry_side == "sell" else "sell"
             
-            exit_trades: List[TradeData] = []
-            if exit_order_id:
-                try:
-                    trades = await client.get_user_trade_history(
-                        symbol=position.symbol,
-                        start_time=exit_window_start,
-                        end_time=exit_window_end,
-                        order_id=exit_order_id,
-                    )
-                    if trades:
-                        exit_trades.extend(trades)
-                        order_ids_available = True
-                        strategy.logger.debug(
-                            f"[{dex}] Found {len(trades)} exit trades for order_id {exit_order_id}"
-                        )
-                except Exception as e:
-                    strategy.logger.debug(
-                        f"[{dex}] Failed to get exit trades with order_id {exit_order_id}: {e}"
-                    )
+            ledger_entry = self._ledger_trades(
+                dex, position.symbol, entry_side, entry_order_id, leg_meta.get("quantity"), entry_is_maker
+            )
+            ledger_exit = self._ledger_trades(
+                dex, position.symbol, exit_side, exit_order_id, exit_quantities_by_dex.get(dex), exit_is_maker
+            )
+            if ledger_entry:
+                entry_trades_by_dex[dex] = ledger_entry
+            if ledger_exit:
+                exit_trades_by_dex[dex] = ledger_exit
+            if ledger_entry and ledger_exit:
+                strategy.logger.debug(f"[{dex}] Entry and exit fills taken from fill ledger")
+                continue
             
-            if not entry_trades or not exit_trades:
-                try:
-                    all_trades = await client.get_user_trade_history(
-                        symbol=position.symbol,
-                        start_time=start_time,
-                        end_time=end_time,
-                        order_id=None,
-                    )
-                    if all_trades:
-                        for trade in all_trades:
-                            if entry_order_id and trade.order_id == entry_order_id:
-                                if trade not in entry_trades:
-                                    entry_trades.append(trade)
-                            elif exit_order_id and trade.order_id == exit_order_id:
-                                if trade not in exit_trades:
-                                    exit_trades.append(trade)
-                            elif trade.order_id in closing_order_ids:
-                                if trade not in exit_trades:
-                                    exit_trades.append(trade)
-                            else:
-                                trade_ts = trade.timestamp
-                                if entry_window_start <= trade_ts <= entry_window_end:
-                                    if trade not in entry_trades:
-                                        entry_trades.append(trade)
-                                elif exit_window_start <= trade_ts <= exit_window_end:
-                                    if trade not in exit_trades:
-                                        exit_trades.append(trade)
-                        
-                        strategy.logger.debug(
-                            f"[{dex}] Found {len(entry_trades)} entry and {len(exit_trades)} exit trades "
-                            f"(timestamp-filtered from {len(all_trades)} total)"
-                        )
-                except Exception as e:
-                    strategy.logger.debug(
-                        f"[{dex}] Failed to get trade history: {e}"
-                    )
+            ledger_only = False
+            client = strategy.exchange_clients.get(dex)
+            if not client:
+                strategy.logger.debug(f"[{dex}] Exchange client not available for trade history")
+                continue
             
-            if entry_trades:
-                entry_trades_by_dex[dex] = entry_trades
-            if exit_trades:
-                exit_trades_by_dex[dex] = exit_trades
-            if entry_trades or exit_trades:
-                all_trades_by_dex[dex] = entry_trades + exit_trades
+            fetches.append((dex, self._fetch_trade_history(
+                dex,
+                client,
+                position.symbol,
+                entry_order_id,
+                exit_order_id,
+                closing_order_ids,
+                start_time,
+                end_time,
+                entry_window,
+                exit_window,
+            )))
+        
+        if fetches:
+            results = await asyncio.gather(*(fetch for _, fetch in fetches), return_exceptions=True)
+            for (dex, _), result in zip(fetches, results):
+                if isinstance(result, BaseException):
+                    strategy.logger.debug(f"[{dex}] Failed to get trade history: {result}")
+                    continue
+                entry_trades, exit_trades, dex_order_ids_available = result
+                order_ids_available = order_ids_available or dex_order_ids_available
+                # Ledger results are complete; API results only fill the gaps
+                if entry_trades and dex not in entry_trades_by_dex:
+                    entry_trades_by_dex[dex] = entry_trades
+                if exit_trades and dex not in exit_trades_by_dex:
+                    exit_trades_by_dex[dex] = exit_trades
+        
+        for dex in set(entry_trades_by_dex) | set(exit_trades_by_dex):
+            all_trades_by_dex[dex] = entry_trades_by_dex.get(dex, []) + exit_trades_by_dex.get(dex, [])
         
         total_trades = sum(len(trades) for trades in all_trades_by_dex.values())
         if total_trades == 0:
@@ -329,7 +452,10 @@ class PnLCalculator:
         total_fees_decimal = entry_fees + closing_fees
         pnl = total_price_pnl + funding_to_add - total_fees_decimal
         
-        method_name = f"trade_history_{'with_order_id' if order_ids_available else 'timestamp_filtered'}"
+        if ledger_only:
+            method_name = "fill_ledger"
+        else:
+            method_name = f"trade_history_{'with_order_id' if order_ids_available else 'timestamp_filtered'}"
         if close_result is None:
             method_name += "_manual_close"
         
@@ -340,6 +466,9 @@ class PnLCalculator:
             exit_trades_by_dex=exit_trades_by_dex,
         )
         
+        for dex, order_id in list(entry_order_ids_by_dex.items()) + list(exit_order_ids_by_dex.items()):
+            fill_ledger.discard(dex, [order_id])
+        
         strategy.logger.info(
             f"PnL calculation ({method_name}): "
             f"price_pnl=${total_price_pnl:.2f}, "
@@ -391,121 +520,45 @@ class PnLCalculator:
                 )
                 return
             
-            repository = TradeFillRepository(database)
-            
-            for dex_name, exit_trades in exit_trades_by_dex.items():
-                if not exit_trades:
-                    continue
-                
-                dex_id = dex_mapper.get_id(dex_name)
-                if dex_id is None:
-                    strategy.logger.warning(
-                        f"[{position.symbol}] Cannot store exit trades for {dex_name}: dex_id not found"
-                    )
-                    continue
-                
-                aggregated = aggregate_trades_by_order(exit_trades)
-                
-                for order_id, agg in aggregated.items():
-                    try:
-                        # Ensure timestamp is timezone-aware UTC
-                        timestamp_seconds = agg['timestamp']
-                        if isinstance(timestamp_seconds, datetime):
-                            if timestamp_seconds.tzinfo is None:
-                                timestamp_dt = timestamp_seconds.replace(tzinfo=timezone.utc)
-                            else:
-                                timestamp_dt = timestamp_seconds.astimezone(timezone.utc)
-                        else:
-                            timestamp_dt = datetime.fromtimestamp(timestamp_seconds, tz=timezone.utc)
-                        fill_id = await repository.insert_trade_fill(
-                            position_id=position.id,
-                            account_id=account_id,
-                            trade_type='exit',
-                            dex_id=dex_id,
-                            symbol_id=symbol_id,
-                            order_id=order_id,
-                            trade_id=agg['trade_id'],
-                            timestamp=timestamp_dt,
-                            side=agg['side'],
-                            total_quantity=agg['total_quantity'],
-                            weighted_avg_price=agg['weighted_avg_price'],
-                            total_fee=agg['total_fee'],
-                            fee_currency=agg['fee_currency'],
-                            realized_pnl=agg['realized_pnl'],
-                            realized_funding=agg['realized_funding'],
-                            fill_count=agg['fill_count'],
-                        )
-                        if fill_id:
-                            strategy.logger.debug(
-                                f"[{position.symbol}] Stored exit trade for {dex_name} "
-                                f"(order_id={order_id}, fills={agg['fill_count']})"
-                            )
-                    except Exception as e:
+            rows = []
+            for trade_type, trades_by_dex in (("exit", exit_trades_by_dex), ("entry", entry_trades_by_dex)):
+                for dex_name, trades in trades_by_dex.items():
+                    if not trades:
+                        continue
+                    
+                    dex_id = dex_mapper.get_id(dex_name)
+                    if dex_id is None:
                         strategy.logger.warning(
-                            f"[{position.symbol}] Failed to store exit trade for {dex_name} "
-                            f"(order_id={order_id}): {e}"
+                            f"[{position.symbol}] Cannot store {trade_type} trades for {dex_name}: dex_id not found"
                         )
+                        continue
+                    
+                    for order_id, agg in aggregate_trades_by_order(trades).items():
+                        rows.append({
+                            "position_id": position.id,
+                            "account_id": account_id,
+                            "trade_type": trade_type,
+                            "dex_id": dex_id,
+                            "symbol_id": symbol_id,
+                            "order_id": order_id,
+                            "trade_id": agg['trade_id'],
+                            "timestamp": to_utc_datetime(agg['timestamp']),
+                            "side": agg['side'],
+                            "total_quantity": agg['total_quantity'],
+                            "weighted_avg_price": agg['weighted_avg_price'],
+                            "total_fee": agg['total_fee'],
+                            "fee_currency": agg['fee_currency'],
+                            "realized_pnl": agg['realized_pnl'],
+                            "realized_funding": agg['realized_funding'],
+                            "fill_count": agg['fill_count'],
+                        })
             
-            for dex_name, entry_trades in entry_trades_by_dex.items():
-                if not entry_trades:
-                    continue
-                
-                dex_id = dex_mapper.get_id(dex_name)
-                if dex_id is None:
-                    strategy.logger.warning(
-                        f"[{position.symbol}] Cannot store entry trades for {dex_name}: dex_id not found"
-                    )
-                    continue
-                
-                aggregated = aggregate_trades_by_order(entry_trades)
-                
-                for order_id, agg in aggregated.items():
-                    try:
-                        existing = await repository.get_trades_by_order_id(order_id)
-                        if existing and existing.get('position_id') == str(position.id):
-                            strategy.logger.debug(
-                                f"[{position.symbol}] Entry trade already stored for {dex_name} "
-                                f"(order_id={order_id})"
-                            )
-                            continue
-                        
-                        # Ensure timestamp is timezone-aware UTC, then repository will convert to naive
-                        timestamp_seconds = agg['timestamp']
-                        if isinstance(timestamp_seconds, datetime):
-                            if timestamp_seconds.tzinfo is None:
-                                timestamp_dt = timestamp_seconds.replace(tzinfo=timezone.utc)
-                            else:
-                                timestamp_dt = timestamp_seconds.astimezone(timezone.utc)
-                        else:
-                            timestamp_dt = datetime.fromtimestamp(float(timestamp_seconds), tz=timezone.utc)
-                        fill_id = await repository.insert_trade_fill(
-                            position_id=position.id,
-                            account_id=account_id,
-                            trade_type='entry',
-                            dex_id=dex_id,
-                            symbol_id=symbol_id,
-                            order_id=order_id,
-                            trade_id=agg['trade_id'],
-                            timestamp=timestamp_dt,
-                            side=agg['side'],
-                            total_quantity=agg['total_quantity'],
-                            weighted_avg_price=agg['weighted_avg_price'],
-                            total_fee=agg['total_fee'],
-                            fee_currency=agg['fee_currency'],
-                            realized_pnl=agg['realized_pnl'],
-                            realized_funding=agg['realized_funding'],
-                            fill_count=agg['fill_count'],
-                        )
-                        if fill_id:
-                            strategy.logger.debug(
-                                f"[{position.symbol}] Stored entry trade for {dex_name} "
-                                f"(order_id={order_id}, fills={agg['fill_count']})"
-                            )
-                    except Exception as e:
-                        strategy.logger.warning(
-                            f"[{position.symbol}] Failed to store entry trade for {dex_name} "
-                            f"(order_id={order_id}): {e}"
-                        )
+            # Single round trip; ON CONFLICT skips orders already stored for this position
+            stored = await TradeFillRepository(database).insert_trade_fills(rows)
+            if stored:
+                strategy.logger.debug(
+                    f"[{position.symbol}] Stored {stored} aggregated trade fill(s)"
+                )
         except Exception as e:
             strategy.logger.warning(
                 f"[{position.symbol}] Failed to store trades in database: {e}"
@@ -370,10 +370,13 @@ class PositionCloser:
                 )
                 return  # Exit early without closing position
 
-            await asyncio.sleep(1.0)
+            close_result = position.metadata.get("close_execution_result")
+            # Give trade-history APIs time to index the close unless the
+            # fill ledger already recorded every closing fill
+            if not self._pnl_calculator.close_fills_recorded(close_result):
+                await asyncio.sleep(1.0)
             
             closing_fees = Decimal("0")
-            close_result = position.metadata.get("close_execution_result")
             if close_result and close_result.get("filled_orders"):
                 closing_fees = self._pnl_calculator.calculate_closing_fees(
                     close_result, 
@@ -396,6 +399,7 @@ class PositionCloser:
                     start_time,
                     end_time,
                     store_trades_fn=self._pnl_calculator.store_trades_in_database,
+                    close_order_type=self._current_close_order_type,
                 )
                 if trade_history_result:
                     pnl, pnl_method = trade_history_result
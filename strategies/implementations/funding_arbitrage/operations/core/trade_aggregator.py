@@ -1,5 +1,6 @@
 """Trade aggregation utilities."""
 
+from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Dict, List, Any
 from exchange_clients.base_models import TradeData
@@ -84,3 +85,11 @@ def aggregate_trades_by_order(trades: List[TradeData]) -> Dict[str, Dict[str, An
     
     return aggregated
 
+
+def to_utc_datetime(timestamp: Any) -> datetime:
+    """Normalize an aggregated trade timestamp (Unix seconds or datetime) to aware UTC."""
+    if isinstance(timestamp, datetime):
+        if timestamp.tzinfo is None:
+            return timestamp.replace(tzinfo=timezone.utc)
+        return timestamp.astimezone(timezone.utc)
+    return datetime.fromtimestamp(float(timestamp), tz=timezone.utc)
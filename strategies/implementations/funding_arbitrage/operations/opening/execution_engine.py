@@ -1,5 +1,6 @@
 """Execution engine for opening positions."""
 
+import asyncio
 from decimal import Decimal, InvalidOperation, ROUND_DOWN
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
@@ -64,11 +65,10 @@ class ExecutionEngine:
             f"Ensuring {symbol} is tradeable on both {long_dex} and {short_dex}"
         )
 
-        long_init_ok = await contract_preparer.ensure_contract_attributes(
-            long_client, symbol, strategy.logger
-        )
-        short_init_ok = await contract_preparer.ensure_contract_attributes(
-            short_client, symbol, strategy.logger
+        # Venues are independent; prepare both legs concurrently (no-ops when pre-staged)
+        long_init_ok, short_init_ok = await asyncio.gather(
+            contract_preparer.ensure_contract_attributes(long_client, symbol, strategy.logger),
+            contract_preparer.ensure_contract_attributes(short_client, symbol, strategy.logger),
         )
 
         if not long_init_ok or not short_init_ok:
@@ -231,8 +231,10 @@ class ExecutionEngine:
             )
             return None
 
-        await self._ws_manager.prepare_websocket_feeds(long_client, symbol, strategy.logger)
-        await self._ws_manager.prepare_websocket_feeds(short_client, symbol, strategy.logger)
+        await asyncio.gather(
+            self._ws_manager.prepare_websocket_feeds(long_client, symbol, strategy.logger),
+            self._ws_manager.prepare_websocket_feeds(short_client, symbol, strategy.logger),
+        )
 
         try:
             long_bid, long_ask = await price_provider.get_bbo_prices(long_client, symbol)
@@ -1,12 +1,13 @@
 """Persistence handling for position opening."""
 
-from datetime import datetime, timezone
+import asyncio
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from exchange_clients.base_models import TradeData
+from strategies.execution.core.fill_ledger import fill_ledger
 
-from ..core.trade_aggregator import aggregate_trades_by_order
+from ..core.trade_aggregator import aggregate_trades_by_order, to_utc_datetime
 from ..models.execution_models import PersistenceOutcome
 
 # Database imports (optional - handle gracefully if not available)
@@ -98,6 +99,33 @@ class PersistenceHandler:
 
         return PersistenceOutcome(type="created", position=position)
     
+    def _ledger_entry_trades(
+        self,
+        dex: str,
+        symbol: str,
+        side: str,
+        fill: Dict[str, Any],
+    ) -> Optional[List[TradeData]]:
+        """Entry trades from the fill ledger, or None if it didn't see the whole order."""
+        order_fills = fill_ledger.get(dex, fill.get("order_id"))
+        filled_quantity = fill.get("filled_quantity")
+        if order_fills is None or not filled_quantity or not order_fills.is_complete(Decimal(str(filled_quantity))):
+            return None
+        
+        execution_mode = str(fill.get("execution_mode_used") or "")
+        is_maker = "limit" in execution_mode and "market" not in execution_mode
+        try:
+            fee_structure = self._strategy.fee_calculator.get_fee_structure(dex)
+            fee_rate = fee_structure.maker_fee if is_maker else fee_structure.taker_fee
+        except Exception:
+            fee_rate = Decimal("0")
+        
+        trades = order_fills.to_trades(fee_rate=fee_rate)
+        for trade in trades:
+            trade.symbol = trade.symbol or symbol
+            trade.side = trade.side or side
+        return trades
+    
     async def store_entry_trades(
         self,
         position: "FundingArbPosition",
@@ -142,51 +170,49 @@ class PersistenceHandler:
                 )
                 return
             
-            repository = TradeFillRepository(database)
-            
-            long_order_id = long_fill.get("order_id")
-            short_order_id = short_fill.get("order_id")
-            
             entry_trades_by_dex: Dict[str, List[TradeData]] = {}
-            # Handle timezone-aware and naive datetimes
-            opened_at = position.opened_at
-            if opened_at.tzinfo is None:
-                # Naive datetime - assume UTC
-                opened_at_timestamp = opened_at.timestamp()
-            else:
-                # Timezone-aware datetime - convert to UTC timestamp
-                opened_at_timestamp = opened_at.timestamp()
             # Widen time window to 30 minutes (instead of 10) to account for API indexing delays
+            opened_at_timestamp = position.opened_at.timestamp()
             start_time = opened_at_timestamp - 1800  # 30 minutes before
             end_time = opened_at_timestamp + 1800   # 30 minutes after
             
-            for dex_name in [position.long_dex, position.short_dex]:
-                client = strategy.exchange_clients.get(dex_name)
-                if not client:
+            fetches = []
+            for dex_name, fill, side in (
+                (position.long_dex, long_fill, "buy"),
+                (position.short_dex, short_fill, "sell"),
+            ):
+                order_id = fill.get("order_id")
+                if not dex_name or not order_id:
                     continue
                 
-                order_id = long_order_id if dex_name == position.long_dex else short_order_id
-                if not order_id:
+                # Prefer fills the websocket callbacks already recorded
+                ledger_trades = self._ledger_entry_trades(dex_name, position.symbol, side, fill)
+                if ledger_trades:
+                    entry_trades_by_dex[dex_name] = ledger_trades
                     continue
                 
-                try:
-                    trades = await client.get_user_trade_history(
-                        symbol=position.symbol,
-                        start_time=start_time,
-                        end_time=end_time,
-                        order_id=order_id,
-                    )
-                    if trades:
+                client = strategy.exchange_clients.get(dex_name)
+                if not client:
+                    continue
+                fetches.append((dex_name, client.get_user_trade_history(
+                    symbol=position.symbol,
+                    start_time=start_time,
+                    end_time=end_time,
+                    order_id=order_id,
+                )))
+            
+            if fetches:
+                results = await asyncio.gather(*(fetch for _, fetch in fetches), return_exceptions=True)
+                for (dex_name, _), trades in zip(fetches, results):
+                    if isinstance(trades, BaseException):
+                        strategy.logger.debug(
+                            f"[{position.symbol}] Failed to fetch entry trades for {dex_name}: {trades}"
+                        )
+                    elif trades:
                         entry_trades_by_dex[dex_name] = trades
-                except Exception as e:
-                    strategy.logger.debug(
-                        f"[{position.symbol}] Failed to fetch entry trades for {dex_name}: {e}"
-                    )
             
+            rows = []
             for dex_name, entry_trades in entry_trades_by_dex.items():
-                if not entry_trades:
-                    continue
-                
                 dex_id = dex_mapper.get_id(dex_name)
                 if dex_id is None:
                     strategy.logger.warning(
@@ -194,50 +220,31 @@ class PersistenceHandler:
                     )
                     continue
                 
-                aggregated = aggregate_trades_by_order(entry_trades)
-                
-                for order_id, agg in aggregated.items():
-                    try:
-                        # Ensure timestamp is timezone-aware UTC
-                        timestamp_seconds = agg['timestamp']
-                        if isinstance(timestamp_seconds, datetime):
-                            # If it's already a datetime, convert to UTC-aware
-                            if timestamp_seconds.tzinfo is None:
-                                timestamp_dt = timestamp_seconds.replace(tzinfo=timezone.utc)
-                            else:
-                                timestamp_dt = timestamp_seconds.astimezone(timezone.utc)
-                        else:
-                            # Convert from Unix timestamp to UTC-aware datetime
-                            # Use time.time() as reference to ensure timezone-aware conversion
-                            timestamp_dt = datetime.fromtimestamp(float(timestamp_seconds), tz=timezone.utc)
-                        fill_id = await repository.insert_trade_fill(
-                            position_id=position.id,
-                            account_id=account_id,
-                            trade_type='entry',
-                            dex_id=dex_id,
-                            symbol_id=symbol_id,
-                            order_id=order_id,
-                            trade_id=agg['trade_id'],
-                            timestamp=timestamp_dt,
-                            side=agg['side'],
-                            total_quantity=agg['total_quantity'],
-                            weighted_avg_price=agg['weighted_avg_price'],
-                            total_fee=agg['total_fee'],
-                            fee_currency=agg['fee_currency'],
-                            realized_pnl=agg['realized_pnl'],
-                            realized_funding=agg['realized_funding'],
-                            fill_count=agg['fill_count'],
-                        )
-                        if fill_id:
-                            strategy.logger.debug(
-                                f"[{position.symbol}] Stored entry trade for {dex_name} "
-                                f"(order_id={order_id}, fills={agg['fill_count']})"
-                            )
-                    except Exception as e:
-                        strategy.logger.warning(
-                            f"[{position.symbol}] Failed to store entry trade for {dex_name} "
-                            f"(order_id={order_id}): {e}"
-                        )
+                for order_id, agg in aggregate_trades_by_order(entry_trades).items():
+                    rows.append({
+                        "position_id": position.id,
+                        "account_id": account_id,
+                        "trade_type": 'entry',
+                        "dex_id": dex_id,
+                        "symbol_id": symbol_id,
+                        "order_id": order_id,
+                        "trade_id": agg['trade_id'],
+                        "timestamp": to_utc_datetime(agg['timestamp']),
+                        "side": agg['side'],
+                        "total_quantity": agg['total_quantity'],
+                        "weighted_avg_price": agg['weighted_avg_price'],
+                        "total_fee": agg['total_fee'],
+                        "fee_currency": agg['fee_currency'],
+                        "realized_pnl": agg['realized_pnl'],
+                        "realized_funding": agg['realized_funding'],
+                        "fill_count": agg['fill_count'],
+                    })
+            
+            stored = await TradeFillRepository(database).insert_trade_fills(rows)
+            if stored:
+                strategy.logger.debug(
+                    f"[{position.symbol}] Stored {stored} entry trade fill(s)"
+                )
         except Exception as e:
             strategy.logger.warning(
                 f"[{position.symbol}] Failed to store entry trades in database: {e}"
@@ -11,6 +11,7 @@ from ..core.contract_preparer import ContractPreparer
 from .execution_engine import ExecutionEngine
 from .leverage_validator import LeverageValidator
 from .position_builder import PositionBuilder
+from .position_stager import PositionStager
 from .persistence_handler import PersistenceHandler
 
 if TYPE_CHECKING:
@@ -28,6 +29,7 @@ class PositionOpener:
         self._leverage_validator = LeverageValidator(strategy)
         self._position_builder = PositionBuilder()
         self._persistence_handler = PersistenceHandler(strategy)
+        self.stager = PositionStager(strategy, self._leverage_validator, self._contract_preparer)
 
     async def open(self, opportunity) -> Optional["FundingArbPosition"]:
         """
@@ -37,12 +39,18 @@ class PositionOpener:
             FundingArbPosition if the execution succeeds, otherwise None.
         """
         try:
-            # Validate leverage and get adjusted size
-            leverage_result = await self._leverage_validator.validate_leverage(
-                symbol=opportunity.symbol,
-                long_client=self._strategy.exchange_clients[opportunity.long_dex],
-                short_client=self._strategy.exchange_clients[opportunity.short_dex],
-            )
+            # Join background pre-staging (leverage, contracts, feeds) if this candidate was staged
+            staged = await self.stager.take(opportunity)
+
+            if staged is not None and staged.leverage_checked and not staged.sizing_stale:
+                leverage_result = staged.leverage_result
+            else:
+                # Validate leverage and get adjusted size
+                leverage_result = await self._leverage_validator.validate_leverage(
+                    symbol=opportunity.symbol,
+                    long_client=self._strategy.exchange_clients[opportunity.long_dex],
+                    short_client=self._strategy.exchange_clients[opportunity.short_dex],
+                )
 
             if leverage_result is None:
                 self._strategy.failed_symbols.add(opportunity.symbol)
@@ -72,6 +80,9 @@ class PositionOpener:
             if persistence is None:
                 return None
 
+            # Margin was consumed; other staged candidates must re-check their size
+            self.stager.invalidate_sizing()
+
             # Store entry trades in database (non-blocking)
             await self._persistence_handler.store_entry_trades(
                 position=execution.position,
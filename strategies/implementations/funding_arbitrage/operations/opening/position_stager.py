@@ -0,0 +1,188 @@
+"""Speculative pre-staging of the top opportunity candidates before opening."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from ..core.contract_preparer import ContractPreparer
+from ..core.websocket_manager import WebSocketManager
+from .leverage_validator import LeverageValidator
+
+if TYPE_CHECKING:
+    from ...strategy import FundingArbitrageStrategy
+
+StageKey = Tuple[str, str, str]
+
+
+@dataclass
+class StagedCandidate:
+    """Background preparation for one opportunity."""
+
+    key: StageKey
+    exclusive: bool  # Also switched contracts/feeds (mutates shared client state)
+    task: Optional["asyncio.Task[None]"] = None
+    started_at: float = field(default_factory=time.perf_counter)
+    elapsed: float = 0.0  # Seconds of staging work
+    leverage_result: Optional[Dict[str, Any]] = None
+    leverage_checked: bool = False
+    contracts_ready: bool = False
+    sizing_stale: bool = False
+
+
+@dataclass
+class StagingStats:
+    """Running totals for stage hit rate and latency saved."""
+
+    staged: int = 0
+    hits: int = 0
+    misses: int = 0
+    saved_seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        attempts = self.hits + self.misses
+        return self.hits / attempts if attempts else 0.0
+
+
+class PositionStager:
+    """
+    Prepares the top-K scan candidates in the background.
+
+    For every staged candidate the leverage/size validation (leverage info,
+    balances, set_account_leverage) runs concurrently on both venues. The first
+    candidate is also staged exclusively: contract attributes are resolved and
+    websocket feeds switched to its symbol. Exchange clients track a single
+    active contract and feed, so only one candidate at a time may do that.
+
+    PositionOpener.open() then joins the staged work for its candidate instead
+    of running those steps serially after the decision.
+    """
+
+    def __init__(
+        self,
+        strategy: "FundingArbitrageStrategy",
+        leverage_validator: LeverageValidator,
+        contract_preparer: ContractPreparer,
+    ) -> None:
+        self._strategy = strategy
+        self._leverage_validator = leverage_validator
+        self._contract_preparer = contract_preparer
+        self._ws_manager = WebSocketManager()
+        self._staged: Dict[StageKey, StagedCandidate] = {}
+        self.stats = StagingStats()
+
+    @staticmethod
+    def key_for(opportunity: Any) -> StageKey:
+        return (opportunity.symbol, opportunity.long_dex, opportunity.short_dex)
+
+    def stage(self, opportunities: List[Any], top_k: int) -> None:
+        """Start background staging for the first ``top_k`` candidates (replaces previous stages)."""
+        self.clear()
+        strategy = self._strategy
+        candidates = [
+            opportunity
+            for opportunity in opportunities
+            if opportunity.symbol not in strategy.failed_symbols
+            and opportunity.long_dex in strategy.exchange_clients
+            and opportunity.short_dex in strategy.exchange_clients
+        ][: max(top_k, 0)]
+
+        for rank, opportunity in enumerate(candidates):
+            key = self.key_for(opportunity)
+            if key in self._staged:
+                continue
+            staged = StagedCandidate(key=key, exclusive=rank == 0)
+            staged.task = asyncio.create_task(
+                self._stage_candidate(opportunity, staged), name=f"prestage-{opportunity.symbol}"
+            )
+            self._staged[key] = staged
+            self.stats.staged += 1
+
+    async def take(self, opportunity: Any) -> Optional[StagedCandidate]:
+        """
+        Claim the staged work for an opportunity about to be opened.
+
+        Waits for its staging to finish and cancels any other candidate's
+        exclusive staging, so nothing switches client contracts/feeds while
+        this one executes. Returns None (a miss) if it wasn't staged.
+        """
+        key = self.key_for(opportunity)
+        for other_key, other in list(self._staged.items()):
+            if other_key != key and other.exclusive and other.task and not other.task.done():
+                other.task.cancel()
+                await asyncio.gather(other.task, return_exceptions=True)
+                self._staged.pop(other_key, None)
+
+        staged = self._staged.pop(key, None)
+        if staged is None or staged.task is None:
+            self.stats.misses += 1
+            return None
+
+        wait_started = time.perf_counter()
+        await asyncio.gather(staged.task, return_exceptions=True)
+        waited = time.perf_counter() - wait_started
+
+        self.stats.hits += 1
+        self.stats.saved_seconds += max(staged.elapsed - waited, 0.0)
+        return staged
+
+    def invalidate_sizing(self) -> None:
+        """Balances changed (a position opened): staged sizes must be recomputed."""
+        for staged in self._staged.values():
+            staged.sizing_stale = True
+
+    def clear(self) -> None:
+        """Cancel and forget all outstanding stages."""
+        for staged in self._staged.values():
+            if staged.task and not staged.task.done():
+                staged.task.cancel()
+        self._staged.clear()
+
+    def summary(self) -> str:
+        stats = self.stats
+        return (
+            f"staged={stats.staged}, hits={stats.hits}, misses={stats.misses} "
+            f"(hit rate {stats.hit_rate * 100:.0f}%), saved≈{stats.saved_seconds * 1000:.0f}ms"
+        )
+
+    async def _stage_candidate(self, opportunity: Any, staged: StagedCandidate) -> None:
+        strategy = self._strategy
+        symbol = opportunity.symbol
+        long_client = strategy.exchange_clients[opportunity.long_dex]
+        short_client = strategy.exchange_clients[opportunity.short_dex]
+
+        async def _leverage() -> None:
+            staged.leverage_result = await self._leverage_validator.validate_leverage(
+                symbol=symbol,
+                long_client=long_client,
+                short_client=short_client,
+            )
+            staged.leverage_checked = True
+
+        async def _contracts_and_feeds() -> None:
+            long_ok, short_ok = await asyncio.gather(
+                self._contract_preparer.ensure_contract_attributes(long_client, symbol, strategy.logger),
+                self._contract_preparer.ensure_contract_attributes(short_client, symbol, strategy.logger),
+            )
+            if not (long_ok and short_ok):
+                return
+            await asyncio.gather(
+                self._ws_manager.prepare_websocket_feeds(long_client, symbol, strategy.logger),
+                self._ws_manager.prepare_websocket_feeds(short_client, symbol, strategy.logger),
+            )
+            staged.contracts_ready = True
+
+        steps = [_leverage()]
+        if staged.exclusive:
+            steps.append(_contracts_and_feeds())
+
+        try:
+            results = await asyncio.gather(*steps, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    strategy.logger.debug(f"Pre-staging step failed for {symbol}: {result}")
+        finally:
+            staged.elapsed = time.perf_counter() - staged.started_at
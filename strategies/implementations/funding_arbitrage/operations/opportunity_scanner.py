@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from decimal import Decimal
 from typing import TYPE_CHECKING, List, Optional
 
@@ -24,38 +25,18 @@ class OpportunityScanner:
             if not await self.has_capacity():
                 return candidates
 
-            from funding_rate_service.models.filters import OpportunityFilter
-
-            available_exchanges = [name.lower() for name in strategy.exchange_clients.keys()]
-            mandatory_dex = getattr(strategy.config, "mandatory_exchange", None)
-            if not mandatory_dex:
-                mandatory_dex = getattr(strategy.config, "primary_exchange", None)
-            if isinstance(mandatory_dex, str) and mandatory_dex.strip():
-                mandatory_dex = mandatory_dex.strip().lower()
-            else:
-                mandatory_dex = None
-
-            max_oi_cap = strategy.config.max_oi_usd if mandatory_dex else None
-
-            filters = OpportunityFilter(
-                min_profit_percent=strategy.config.min_profit,
-                max_oi_usd=max_oi_cap,
-                min_volume_24h=strategy.config.min_volume_24h,
-                min_oi_usd=strategy.config.min_oi_usd,
-                whitelist_dexes=available_exchanges if available_exchanges else None,
-                required_dex=mandatory_dex,
-                symbol=None,
-                limit=10,
-            )
-
+            snapshots = strategy.opportunity_snapshots
+            filters = snapshots.build_filter()
             strategy.logger.debug(
-                f"Filters - min_profit: {strategy.config.min_profit}, "
-                f"mandatory_dex: {mandatory_dex}, max_oi_cap: {max_oi_cap}, "
-                f"min_volume_24h: {strategy.config.min_volume_24h}, min_oi_usd: {strategy.config.min_oi_usd}, "
-                f"configured_dexes: {strategy.config.exchanges}, available_dexes: {available_exchanges}"
+                f"Filters - min_profit: {filters.min_profit_percent}, "
+                f"mandatory_dex: {filters.required_dex}, max_oi_cap: {filters.max_oi_usd}, "
+                f"min_volume_24h: {filters.min_volume_24h}, min_oi_usd: {filters.min_oi_usd}, "
+                f"configured_dexes: {strategy.config.exchanges}, available_dexes: {filters.whitelist_dexes}"
             )
 
-            opportunities = await strategy.opportunity_finder.find_opportunities(filters)
+            # Fresh snapshot per opening cycle; the exit evaluator reuses it within the monitor interval
+            snapshot = await snapshots.get(max_age_seconds=0)
+            opportunities = list(snapshot.opportunities)
 
             # Temporary: Skip CC opportunities and Z (which is incorrectly normalized from 2Z)
             # Original code (uncomment to revert):
@@ -204,9 +185,14 @@ class OpportunityScanner:
         short_dex_name = opportunity.short_dex
         
         try:
-            # Get leverage info through LeverageValidator (will cache)
-            long_leverage_info = await leverage_validator.get_leverage_info(long_client, symbol)
-            short_leverage_info = await leverage_validator.get_leverage_info(short_client, symbol)
+            # Preloaded leverage info is a synchronous lookup; only unseen symbols hit the venues
+            long_leverage_info = leverage_validator.get_cached_leverage_info(long_dex_name, symbol)
+            short_leverage_info = leverage_validator.get_cached_leverage_info(short_dex_name, symbol)
+            if long_leverage_info is None or short_leverage_info is None:
+                long_leverage_info, short_leverage_info = await asyncio.gather(
+                    leverage_validator.get_leverage_info(long_client, symbol),
+                    leverage_validator.get_leverage_info(short_client, symbol),
+                )
             
             # Check for MARKET_NOT_FOUND errors from LeverageInfo
             if long_leverage_info.error == "MARKET_NOT_FOUND":
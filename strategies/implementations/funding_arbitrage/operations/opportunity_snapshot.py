@@ -0,0 +1,161 @@
+"""Cycle-scoped snapshot of ranked funding arbitrage opportunities."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from ..strategy import FundingArbitrageStrategy
+    from ..models import OpportunityData
+
+PairKey = Tuple[str, str, str]
+
+_UNRESOLVED = object()
+
+
+class OpportunitySnapshot:
+    """
+    One ``find_opportunities`` result, indexed by symbol and DEX pair.
+
+    Opportunities keep the finder's ranking (best first). The best tradeable
+    opportunity is resolved once per snapshot, so every eroding position in a
+    monitor cycle is compared against the same answer without re-running
+    leverage/tradeability checks.
+    """
+
+    def __init__(self, opportunities: List["OpportunityData"], created_at: Optional[float] = None) -> None:
+        self.opportunities = list(opportunities)
+        self.created_at = time.monotonic() if created_at is None else created_at
+        self.by_symbol: Dict[str, List["OpportunityData"]] = {}
+        self.by_pair: Dict[PairKey, "OpportunityData"] = {}
+        for opportunity in self.opportunities:
+            symbol = (opportunity.symbol or "").upper()
+            self.by_symbol.setdefault(symbol, []).append(opportunity)
+            # Keep the best-ranked entry per pair
+            self.by_pair.setdefault(self.pair_key(symbol, opportunity.long_dex, opportunity.short_dex), opportunity)
+        self._best_tradeable: Any = _UNRESOLVED
+        self._best_lock = asyncio.Lock()
+
+    @staticmethod
+    def pair_key(symbol: str, long_dex: str, short_dex: str) -> PairKey:
+        return ((symbol or "").upper(), (long_dex or "").lower(), (short_dex or "").lower())
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.created_at
+
+    def __len__(self) -> int:
+        return len(self.opportunities)
+
+    def for_symbol(self, symbol: str) -> List["OpportunityData"]:
+        return self.by_symbol.get((symbol or "").upper(), [])
+
+    def for_pair(self, symbol: str, long_dex: str, short_dex: str) -> Optional["OpportunityData"]:
+        return self.by_pair.get(self.pair_key(symbol, long_dex, short_dex))
+
+    async def best_tradeable(
+        self,
+        is_tradeable: Callable[["OpportunityData"], Awaitable[bool]],
+    ) -> Optional["OpportunityData"]:
+        """Highest-ranked opportunity passing ``is_tradeable``; checked once per snapshot."""
+        if self._best_tradeable is not _UNRESOLVED:
+            return self._best_tradeable
+        async with self._best_lock:
+            if self._best_tradeable is _UNRESOLVED:
+                best = None
+                for opportunity in self.opportunities:
+                    if await is_tradeable(opportunity):
+                        best = opportunity
+                        break
+                self._best_tradeable = best
+        return self._best_tradeable
+
+
+class OpportunitySnapshotProvider:
+    """
+    Computes opportunity snapshots for the strategy and shares them within a cycle.
+
+    ``OpportunityScanner.scan`` takes a fresh snapshot at the start of each
+    opening cycle; the exit evaluator reuses any snapshot younger than the
+    position monitor interval, so a monitor cycle runs at most one
+    opportunity query however many positions are flagged by profit erosion.
+    Concurrent callers share one in-flight computation.
+
+    When the strategy has a fresh generation from the funding rate service's
+    opportunity feed, snapshots are filtered from it locally instead of
+    querying and scoring rates in this process.
+    """
+
+    def __init__(self, strategy: "FundingArbitrageStrategy") -> None:
+        self._strategy = strategy
+        self._snapshot: Optional[OpportunitySnapshot] = None
+        self._lock = asyncio.Lock()
+        self.computations = 0
+
+    @property
+    def snapshot(self) -> Optional[OpportunitySnapshot]:
+        return self._snapshot
+
+    def invalidate(self) -> None:
+        self._snapshot = None
+
+    def build_filter(self):
+        """Opportunity filter derived from the strategy config and connected exchanges."""
+        from funding_rate_service.models.filters import OpportunityFilter
+
+        strategy = self._strategy
+        available_exchanges = [name.lower() for name in strategy.exchange_clients.keys()]
+        mandatory_dex = getattr(strategy.config, "mandatory_exchange", None)
+        if not mandatory_dex:
+            mandatory_dex = getattr(strategy.config, "primary_exchange", None)
+        if isinstance(mandatory_dex, str) and mandatory_dex.strip():
+            mandatory_dex = mandatory_dex.strip().lower()
+        else:
+            mandatory_dex = None
+
+        max_oi_cap = strategy.config.max_oi_usd if mandatory_dex else None
+
+        return OpportunityFilter(
+            min_profit_percent=strategy.config.min_profit,
+            max_oi_usd=max_oi_cap,
+            min_volume_24h=strategy.config.min_volume_24h,
+            min_oi_usd=strategy.config.min_oi_usd,
+            whitelist_dexes=available_exchanges if available_exchanges else None,
+            required_dex=mandatory_dex,
+            symbol=None,
+            limit=10,
+        )
+
+    async def get(self, max_age_seconds: Optional[float] = None) -> OpportunitySnapshot:
+        """
+        Current snapshot, recomputed when missing or older than ``max_age_seconds``.
+
+        ``max_age_seconds=0`` always recomputes (unless another caller is
+        already computing one); None reuses any existing snapshot.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and (max_age_seconds is None or snapshot.age < max_age_seconds):
+            return snapshot
+
+        requested_at = time.monotonic()
+        async with self._lock:
+            snapshot = self._snapshot
+            # Another caller finished a computation while we waited for the lock
+            if snapshot is not None and snapshot.created_at >= requested_at:
+                return snapshot
+            if snapshot is not None and max_age_seconds is not None and snapshot.age < max_age_seconds:
+                return snapshot
+
+            filters = self.build_filter()
+            opportunities = None
+            feed = getattr(self._strategy, "opportunity_feed", None)
+            if feed is not None:
+                # Published generation filtered locally; None when the feed is stale
+                opportunities = feed.select(filters)
+            if opportunities is None:
+                opportunities = await self._strategy.opportunity_finder.find_opportunities(filters)
+            self.computations += 1
+            self._snapshot = OpportunitySnapshot(opportunities)
+            return self._snapshot
@@ -20,12 +20,14 @@ from .models import FundingArbPosition
 # Make imports conditional to avoid config loading issues during import
 try:
     from funding_rate_service.core.opportunity_finder import OpportunityFinder
+    from funding_rate_service.core.opportunity_feed import OpportunityFeedSubscriber
     from database.repositories import FundingRateRepository
     from database.connection import database
     FUNDING_SERVICE_AVAILABLE = True
 except ImportError as e:
     # For testing or when funding service config is not available
     OpportunityFinder = None
+    OpportunityFeedSubscriber = None
     FundingRateRepository = None
     database = None
     FUNDING_SERVICE_AVAILABLE = False
@@ -43,10 +45,11 @@ from strategies.execution.patterns.atomic_multi_order import (
     AtomicExecutionResult,
 )
 from strategies.execution.core.liquidity_analyzer import LiquidityAnalyzer
+from strategies.execution.core.execution_telemetry import execution_telemetry
 from exchange_clients.events import LiquidationEvent
 from .position_monitor import PositionMonitor
 # Funding_arb operation helpers
-from .operations import PositionOpener, OpportunityScanner, PositionCloser
+from .operations import PositionOpener, OpportunityScanner, OpportunitySnapshotProvider, PositionCloser
 from .operations.cooldown_manager import CooldownManager
 
 
@@ -135,6 +138,10 @@ class FundingArbitrageStrategy(BaseStrategy):
             symbol_mapper=symbol_mapper
         )
         self.funding_rate_repo = FundingRateRepository(database)
+        # Opportunity generations pushed by the funding rate service (shared across accounts)
+        self.opportunity_feed = (
+            OpportunityFeedSubscriber(database) if funding_config.use_opportunity_feed else None
+        )
         
         # ⭐ Price Provider (shared data source for all execution components)
         from strategies.execution.core.price_provider import PriceProvider
@@ -201,6 +208,7 @@ class FundingArbitrageStrategy(BaseStrategy):
         self.cooldown_manager = CooldownManager()
         
         self.position_opener = PositionOpener(self)
+        self.opportunity_snapshots = OpportunitySnapshotProvider(self)
         self.opportunity_scanner = OpportunityScanner(self)
         self.position_closer = PositionCloser(self)
 
@@ -238,6 +246,10 @@ class FundingArbitrageStrategy(BaseStrategy):
             opportunities = await self.opportunity_scanner.scan()
             self.logger.info(f"Found {len(opportunities)} opportunities to process")
             
+            # Warm contracts, feeds and leverage for the best candidates while we validate them
+            stager = self.position_opener.stager
+            stager.stage(opportunities, self.config.prestage_top_k)
+            
             processed_count = 0
             skipped_count = 0
             failed_count = 0
@@ -298,6 +310,10 @@ class FundingArbitrageStrategy(BaseStrategy):
                     f"📊 Opportunity processing summary: {processed_count} processed, "
                     f"{skipped_count} skipped, {failed_count} failed out of {len(opportunities)} total"
                 )
+            if stager.stats.staged:
+                self.logger.info(f"📊 Pre-staging: {stager.summary()}")
+            # Don't leave staging running into position monitoring/closing
+            stager.clear()
 
         except Exception as exc:
             self.logger.error(f"Strategy execution failed: {exc}")
@@ -313,6 +329,11 @@ class FundingArbitrageStrategy(BaseStrategy):
         """Strategy-specific initialization logic."""
         # Initialize position and state managers
         await self.position_manager.initialize()
+        # Preload leverage limits for every market and keep them fresh, so sizing
+        # and preflight read them from memory instead of awaiting the venues
+        self.leverage_validator.start_background_refresh(lambda: list(self.exchange_clients.values()))
+        if self.opportunity_feed is not None:
+            await self.opportunity_feed.start()
         self.logger.info("FundingArbitrageStrategy initialized successfully")
         if self._monitor_task is None:
             self._monitor_stop_event = asyncio.Event()
@@ -490,6 +511,8 @@ class FundingArbitrageStrategy(BaseStrategy):
             min_volume_24h=min_volume_24h,
             min_oi_usd=min_oi_usd,
             max_new_positions_per_cycle=strategy_params.get('max_new_positions_per_cycle', 2),
+            prestage_top_k=strategy_params.get('prestage_top_k', 3),
+            use_opportunity_feed=strategy_params.get('use_opportunity_feed', True),
             # Required database URL from funding_rate_service settings
             database_url=settings.database_url,
             # Risk management defaults
@@ -631,6 +654,17 @@ class FundingArbitrageStrategy(BaseStrategy):
             self._monitor_stop_event = None
         self._last_opportunity_scan_ts = 0.0
 
+        if hasattr(self, 'leverage_validator'):
+            await self.leverage_validator.stop_background_refresh()
+        if getattr(self, 'opportunity_feed', None) is not None:
+            await self.opportunity_feed.stop()
+        if hasattr(self, 'position_opener'):
+            self.position_opener.stager.clear()
+        try:
+            await asyncio.wait_for(execution_telemetry.drain(), timeout=5.0)
+        except Exception as exc:
+            self.logger.debug(f"Execution telemetry flush failed: {exc}")
+
         # Close position and state managers with timeout
         if hasattr(self, 'position_manager'):
             shutdown = getattr(self.position_manager, "shutdown", None)
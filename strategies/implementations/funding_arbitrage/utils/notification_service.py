@@ -7,7 +7,8 @@ Allows strategies to send notifications to Telegram users via database queue.
 import os
 import json
 import logging
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Dict, Any, Tuple
 from decimal import Decimal
 from datetime import datetime
 
@@ -24,6 +25,12 @@ EXCHANGE_EMOJIS = {
 # Funding payments per year (8-hour intervals)
 FUNDING_PAYMENTS_PER_YEAR = Decimal("1095")  # 365 days * 3 payments per day
 
+# Seconds before retrying a strategy run lookup that found nothing
+RUN_LOOKUP_RETRY_SECONDS = 30.0
+
+# Window for suppressing repeated insufficient-margin alerts
+MARGIN_ALERT_DEDUP_SECONDS = 300.0
+
 # Try to import database connection
 try:
     from database.connection import database
@@ -44,7 +51,10 @@ class StrategyNotificationService:
             account_name: Account name to identify the strategy run
         """
         self.account_name = account_name
-        self._run_id_cache: Optional[str] = None
+        self._run_cache: Optional[Tuple[str, str]] = None  # (run_id, user_id)
+        self._run_lookup_failed_at: Optional[float] = None
+        # (exchange, symbol) -> monotonic time of last insufficient-margin alert
+        self._recent_margin_alerts: Dict[Tuple[str, str], float] = {}
     
     @staticmethod
     def _get_exchange_emoji(dex_name: str) -> str:
@@ -83,12 +93,16 @@ class StrategyNotificationService:
         # Default fallback
         return None
     
-    async def _get_strategy_run_id(self) -> Optional[str]:
+    async def _get_strategy_run(self) -> Optional[Tuple[str, str]]:
         """
-        Get strategy run ID from database using account_name.
+        Get (strategy run ID, user ID) for this account.
+        
+        The run is fixed for the lifetime of the strategy process, so the lookup
+        is cached after the first hit; misses are retried at most every
+        RUN_LOOKUP_RETRY_SECONDS to keep notification bursts off the database.
         
         Returns:
-            Strategy run UUID as string, or None if not found
+            Tuple of (run_id, user_id) as strings, or None if not found
         """
         if not DATABASE_AVAILABLE or not database.is_connected:
             logger.warning("Database not available for notifications")
@@ -98,9 +112,13 @@ class StrategyNotificationService:
             logger.warning("Account name not provided, cannot identify strategy run")
             return None
         
-        # Use cached run_id if available
-        if self._run_id_cache:
-            return self._run_id_cache
+        # Use cached run if available
+        if self._run_cache:
+            return self._run_cache
+        
+        now = time.monotonic()
+        if self._run_lookup_failed_at is not None and now - self._run_lookup_failed_at < RUN_LOOKUP_RETRY_SECONDS:
+            return None
         
         try:
             # Find the most recent running strategy for this account
@@ -117,15 +135,31 @@ class StrategyNotificationService:
             row = await database.fetch_one(query, {"account_name": self.account_name})
             
             if row:
-                self._run_id_cache = str(row["id"])
-                return self._run_id_cache
+                self._run_cache = (str(row["id"]), str(row["user_id"]))
+                self._run_lookup_failed_at = None
+                return self._run_cache
             else:
+                self._run_lookup_failed_at = now
                 logger.warning(f"No running strategy found for account: {self.account_name}")
                 return None
         except Exception as e:
             logger.error(f"Error getting strategy run ID: {e}")
             return None
     
+    async def _get_strategy_run_id(self) -> Optional[str]:
+        """
+        Get strategy run ID from database using account_name.
+        
+        Returns:
+            Strategy run UUID as string, or None if not found
+        """
+        run = await self._get_strategy_run()
+        return run[0] if run else None
+    
+    def _invalidate_run_cache(self) -> None:
+        """Forget the cached run (e.g. after an insert failed against it)."""
+        self._run_cache = None
+    
     async def notify_position_opened(
         self,
         symbol: str,
@@ -167,24 +201,12 @@ class StrategyNotificationService:
         Returns:
             True if notification queued successfully, False otherwise
         """
-        run_id = await self._get_strategy_run_id()
-        if not run_id:
+        run = await self._get_strategy_run()
+        if not run:
             return False
+        run_id, user_id = run
         
         try:
-            # Get user_id from strategy_run
-            if not DATABASE_AVAILABLE or not database.is_connected:
-                return False
-            
-            run_row = await database.fetch_one(
-                "SELECT user_id FROM strategy_runs WHERE id = :run_id",
-                {"run_id": run_id}
-            )
-            if not run_row:
-                return False
-            
-            user_id = str(run_row["user_id"])
-            
             # Format message with improved clarity
             divergence_pct = entry_divergence * Decimal("100")
             
@@ -312,6 +334,7 @@ class StrategyNotificationService:
             
             return True
         except Exception as e:
+            self._invalidate_run_cache()
             logger.error(f"Error sending position opened notification: {e}")
             return False
     
@@ -342,24 +365,12 @@ class StrategyNotificationService:
         Returns:
             True if notification queued successfully, False otherwise
         """
-        run_id = await self._get_strategy_run_id()
-        if not run_id:
+        run = await self._get_strategy_run()
+        if not run:
             return False
+        run_id, user_id = run
         
         try:
-            # Get user_id from strategy_run
-            if not DATABASE_AVAILABLE or not database.is_connected:
-                return False
-            
-            run_row = await database.fetch_one(
-                "SELECT user_id FROM strategy_runs WHERE id = :run_id",
-                {"run_id": run_id}
-            )
-            if not run_row:
-                return False
-            
-            user_id = str(run_row["user_id"])
-            
             # Format reason for display
             if reason.startswith("LIQUIDATION_RISK_"):
                 # Extract exchange name and format nicely
@@ -440,6 +451,7 @@ class StrategyNotificationService:
             
             return True
         except Exception as e:
+            self._invalidate_run_cache()
             logger.error(f"Error sending position closed notification: {e}")
             return False
 
@@ -464,24 +476,12 @@ class StrategyNotificationService:
         Returns:
             True if notification queued successfully, False otherwise
         """
-        run_id = await self._get_strategy_run_id()
-        if not run_id:
+        run = await self._get_strategy_run()
+        if not run:
             return False
+        run_id, user_id = run
         
         try:
-            # Get user_id from strategy_run
-            if not DATABASE_AVAILABLE or not database.is_connected:
-                return False
-            
-            run_row = await database.fetch_one(
-                "SELECT user_id FROM strategy_runs WHERE id = :run_id",
-                {"run_id": run_id}
-            )
-            if not run_row:
-                return False
-            
-            user_id = str(run_row["user_id"])
-            
             # Format message - highlight the exchange that lacks margin
             exchange_emoji = self._get_exchange_emoji(exchange_name)
             message = (
@@ -508,7 +508,18 @@ class StrategyNotificationService:
                 details["leverage_info"] = leverage_info
             
             # Check if we've already sent a notification for this (exchange, symbol) pair recently (within last 5 minutes)
-            # This prevents duplicate notifications when multiple opportunities are checked simultaneously
+            # This prevents duplicate notifications when multiple opportunities are checked simultaneously.
+            # The in-process check avoids the query for repeats from this run; the database
+            # check still covers alerts queued before a restart.
+            alert_key = (exchange_name.lower(), symbol)
+            last_alert = self._recent_margin_alerts.get(alert_key)
+            if last_alert is not None and time.monotonic() - last_alert < MARGIN_ALERT_DEDUP_SECONDS:
+                logger.debug(
+                    f"Skipping duplicate insufficient margin notification for {exchange_name.upper()}/{symbol} "
+                    f"(already notified within last 5 minutes)"
+                )
+                return False
+            
             recent_notification = await database.fetch_one(
                 """
                 SELECT id FROM strategy_notifications
@@ -527,6 +538,7 @@ class StrategyNotificationService:
             )
             
             if recent_notification:
+                self._recent_margin_alerts[alert_key] = time.monotonic()
                 logger.debug(
                     f"Skipping duplicate insufficient margin notification for {exchange_name.upper()}/{symbol} "
                     f"(already notified within last 5 minutes)"
@@ -553,9 +565,11 @@ class StrategyNotificationService:
                     "details": json.dumps(details)
                 }
             )
+            self._recent_margin_alerts[alert_key] = time.monotonic()
             
             return True
         except Exception as e:
+            self._invalidate_run_cache()
             logger.error(f"Error sending insufficient margin notification: {e}")
             return False
 
@@ -582,24 +596,12 @@ class StrategyNotificationService:
         Returns:
             True if notification queued successfully, False otherwise
         """
-        run_id = await self._get_strategy_run_id()
-        if not run_id:
+        run = await self._get_strategy_run()
+        if not run:
             return False
+        run_id, user_id = run
         
         try:
-            # Get user_id from strategy_run
-            if not DATABASE_AVAILABLE or not database.is_connected:
-                return False
-            
-            run_row = await database.fetch_one(
-                "SELECT user_id FROM strategy_runs WHERE id = :run_id",
-                {"run_id": run_id}
-            )
-            if not run_row:
-                return False
-            
-            user_id = str(run_row["user_id"])
-            
             # Format message - highlight the exchange with liquidation risk
             exchange_emoji = self._get_exchange_emoji(exchange_name)
             message = (
@@ -647,6 +649,7 @@ class StrategyNotificationService:
             
             return True
         except Exception as e:
+            self._invalidate_run_cache()
             logger.error(f"Error sending liquidation risk notification: {e}")
             return False
 
@@ -0,0 +1,52 @@
+"""
+Grid Strategy Replay Backtester
+
+Drives the real GridStrategy state machine with recorded (or synthetic) best
+bid/ask streams on a virtual clock, against an in-memory venue that fills
+post-only orders with a queue-position model, and sweeps config presets over
+a process pool.
+
+Usage:
+    >>> series = synthetic_bbo(duration_seconds=86_400, seed=7)
+    >>> presets = load_grid_presets(Path("configs/grid").glob("*.yml"))
+    >>> results = run_preset_sweep(series, presets, GridReplayParams(exchange="lighter"))
+    >>> print(format_preset_report(results))
+"""
+
+from .data import BBOSeries, bbo_from_recording, load_bbo_csv, synthetic_bbo
+from .engine import (
+    GridReplayParams,
+    GridReplayResult,
+    VirtualClock,
+    build_replay_strategy,
+    fee_rates_for_exchange,
+    grid_virtual_time,
+    replay_grid,
+    run_grid_replay,
+    summarize_replay,
+)
+from .sweep import format_preset_report, load_grid_presets, run_preset_sweep
+from .venue import FillModel, ReplayFill, ReplayVenue, VenueStats
+
+__all__ = [
+    'BBOSeries',
+    'bbo_from_recording',
+    'load_bbo_csv',
+    'synthetic_bbo',
+    'GridReplayParams',
+    'GridReplayResult',
+    'VirtualClock',
+    'build_replay_strategy',
+    'fee_rates_for_exchange',
+    'grid_virtual_time',
+    'replay_grid',
+    'run_grid_replay',
+    'summarize_replay',
+    'format_preset_report',
+    'load_grid_presets',
+    'run_preset_sweep',
+    'FillModel',
+    'ReplayFill',
+    'ReplayVenue',
+    'VenueStats',
+]
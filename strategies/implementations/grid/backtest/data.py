@@ -0,0 +1,227 @@
+"""
+Top-of-book tick series for the grid replay backtester.
+
+A ``BBOSeries`` is a time-ordered sequence of best bid/ask quotes (optionally
+with the displayed size at each side) for a single symbol. Series can be
+generated synthetically, loaded from CSV, or extracted from a websocket feed
+recording (see ``exchange_clients.market_data.recorder``) by replaying it
+through the venue's websocket manager.
+"""
+
+import csv
+import inspect
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, List, Optional, Union
+
+import numpy as np
+
+
+@dataclass
+class BBOSeries:
+    """Best bid/ask quotes for one symbol."""
+
+    timestamps: np.ndarray  # (N,) epoch seconds, non-decreasing
+    bids: np.ndarray  # (N,)
+    asks: np.ndarray  # (N,)
+    bid_sizes: Optional[np.ndarray] = None  # (N,) displayed size at the best bid (base units)
+    ask_sizes: Optional[np.ndarray] = None
+    symbol: str = ""
+
+    def __post_init__(self) -> None:
+        n = len(self.timestamps)
+        if n == 0:
+            raise ValueError("BBO series is empty")
+        if len(self.bids) != n or len(self.asks) != n:
+            raise ValueError("BBO series arrays must have the same length")
+        if (self.bid_sizes is None) != (self.ask_sizes is None):
+            raise ValueError("bid_sizes and ask_sizes must be provided together")
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def has_sizes(self) -> bool:
+        return self.bid_sizes is not None
+
+    @property
+    def start(self) -> float:
+        return float(self.timestamps[0])
+
+    @property
+    def end(self) -> float:
+        return float(self.timestamps[-1])
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.end - self.start
+
+    def slice(self, start: Optional[float] = None, end: Optional[float] = None) -> "BBOSeries":
+        """Sub-series with ``start <= timestamp <= end``."""
+        lo = 0 if start is None else int(np.searchsorted(self.timestamps, start, side="left"))
+        hi = len(self) if end is None else int(np.searchsorted(self.timestamps, end, side="right"))
+        return BBOSeries(
+            timestamps=self.timestamps[lo:hi],
+            bids=self.bids[lo:hi],
+            asks=self.asks[lo:hi],
+            bid_sizes=None if self.bid_sizes is None else self.bid_sizes[lo:hi],
+            ask_sizes=None if self.ask_sizes is None else self.ask_sizes[lo:hi],
+            symbol=self.symbol,
+        )
+
+
+def synthetic_bbo(
+    duration_seconds: float = 86_400.0,
+    interval_seconds: float = 0.25,
+    start_price: float = 100_000.0,
+    tick_size: float = 0.1,
+    volatility: float = 0.5,
+    drift: float = 0.0,
+    spread_ticks: int = 1,
+    start_time: float = 0.0,
+    seed: Optional[int] = None,
+    symbol: str = "BTC",
+) -> BBOSeries:
+    """
+    Geometric Brownian motion mid price quoted on a tick grid.
+
+    Args:
+        duration_seconds: Length of the series
+        interval_seconds: Time between quotes
+        start_price: Initial mid price
+        tick_size: Price increment bids/asks are rounded to
+        volatility: Annualized volatility (0.5 = 50%)
+        drift: Annualized drift
+        spread_ticks: Quoted spread in ticks (spread widens by one tick at random ~10% of the time)
+        start_time: Epoch seconds of the first quote
+        seed: RNG seed for reproducible series
+    """
+    steps = max(2, int(duration_seconds / interval_seconds) + 1)
+    rng = np.random.default_rng(seed)
+    dt_years = interval_seconds / (365.0 * 86_400.0)
+    shocks = rng.standard_normal(steps - 1) * volatility * math.sqrt(dt_years)
+    log_returns = (drift - 0.5 * volatility ** 2) * dt_years + shocks
+    mid = start_price * np.exp(np.concatenate(([0.0], np.cumsum(log_returns))))
+
+    spread = spread_ticks + (rng.random(steps) < 0.1).astype(np.int64)
+    bid_ticks = np.floor(mid / tick_size - spread / 2.0)
+    bids = np.round(bid_ticks * tick_size, 10)
+    asks = np.round((bid_ticks + spread) * tick_size, 10)
+    timestamps = start_time + np.arange(steps, dtype=np.float64) * interval_seconds
+    return BBOSeries(timestamps=timestamps, bids=bids, asks=asks, symbol=symbol)
+
+
+def load_bbo_csv(path: Union[str, Path], symbol: str = "") -> BBOSeries:
+    """
+    Load quotes from a CSV with a header row.
+
+    Required columns: ``timestamp`` (epoch seconds, or milliseconds/nanoseconds
+    which are detected by magnitude), ``bid``, ``ask``. Optional: ``bid_size``,
+    ``ask_size``.
+    """
+    timestamps: List[float] = []
+    bids: List[float] = []
+    asks: List[float] = []
+    bid_sizes: List[float] = []
+    ask_sizes: List[float] = []
+
+    with open(path, newline="") as handle:
+        reader = csv.DictReader(handle)
+        fields = set(reader.fieldnames or [])
+        missing = {"timestamp", "bid", "ask"} - fields
+        if missing:
+            raise ValueError(f"{path}: missing column(s) {', '.join(sorted(missing))}")
+        with_sizes = {"bid_size", "ask_size"} <= fields
+        for row in reader:
+            timestamps.append(float(row["timestamp"]))
+            bids.append(float(row["bid"]))
+            asks.append(float(row["ask"]))
+            if with_sizes:
+                bid_sizes.append(float(row["bid_size"]))
+                ask_sizes.append(float(row["ask_size"]))
+
+    ts = _normalize_epoch(np.asarray(timestamps, dtype=np.float64))
+    order = np.argsort(ts, kind="stable")
+    return BBOSeries(
+        timestamps=ts[order],
+        bids=np.asarray(bids, dtype=np.float64)[order],
+        asks=np.asarray(asks, dtype=np.float64)[order],
+        bid_sizes=np.asarray(bid_sizes, dtype=np.float64)[order] if bid_sizes else None,
+        ask_sizes=np.asarray(ask_sizes, dtype=np.float64)[order] if ask_sizes else None,
+        symbol=symbol,
+    )
+
+
+async def bbo_from_recording(
+    path: Union[str, Path],
+    manager: Any,
+    start_ns: Optional[int] = None,
+    end_ns: Optional[int] = None,
+    symbol: str = "",
+) -> BBOSeries:
+    """
+    Extract a BBO series from a feed recording.
+
+    Frames are pushed through ``manager.get_replay_handlers()`` (the same code
+    path live messages take) and a quote is emitted, stamped with the frame's
+    recorded time, whenever the manager's best bid/ask changes.
+
+    Args:
+        path: ``.mdrec`` recording
+        manager: Venue websocket manager instance used to decode frames
+        start_ns / end_ns: Optional recorded-time window
+    """
+    from exchange_clients.market_data.recorder import FeedReader
+
+    handlers = manager.get_replay_handlers()
+    if not handlers:
+        raise ValueError(f"{type(manager).__name__} does not support replay")
+
+    timestamps: List[float] = []
+    bids: List[float] = []
+    asks: List[float] = []
+    last = None
+
+    with FeedReader(path) as reader:
+        for frame in reader.iter_frames(start_ns=start_ns, end_ns=end_ns):
+            handler = handlers.get(frame.stream)
+            if handler is None:
+                continue
+            try:
+                result = handler(frame.payload)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                continue
+
+            bbo = manager.get_latest_bbo()
+            if bbo is None or bbo.bid is None or bbo.ask is None:
+                continue
+            quote = (float(bbo.bid), float(bbo.ask))
+            if quote == last or quote[0] <= 0 or quote[1] <= quote[0]:
+                continue
+            last = quote
+            timestamps.append(frame.timestamp_ns / 1e9)
+            bids.append(quote[0])
+            asks.append(quote[1])
+
+    if not timestamps:
+        raise ValueError(f"No BBO updates could be decoded from {path}")
+    return BBOSeries(
+        timestamps=np.asarray(timestamps),
+        bids=np.asarray(bids),
+        asks=np.asarray(asks),
+        symbol=symbol,
+    )
+
+
+def _normalize_epoch(values: np.ndarray) -> np.ndarray:
+    if values.size == 0:
+        return values
+    magnitude = float(np.nanmax(np.abs(values)))
+    if magnitude > 1e17:  # nanoseconds
+        return values / 1e9
+    if magnitude > 1e11:  # milliseconds
+        return values / 1e3
+    return values
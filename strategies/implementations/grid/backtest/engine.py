@@ -0,0 +1,296 @@
+"""
+Grid strategy replay engine.
+
+Runs the real ``GridStrategy`` (built through ``StrategyFactory`` exactly as
+``TradingBot`` does) against a ``ReplayVenue``:
+
+- The module-level ``time`` of the grid modules is swapped for a
+  ``VirtualClock`` for the duration of the run, so cooldowns, entry timeouts,
+  stop-loss debouncing and position timeouts all follow replay time.
+- The bot loop (``should_execute`` → ``execute_strategy``, otherwise sleep
+  0.5s) is reproduced without sleeping: the clock jumps forward instead.
+- Fills are relayed to ``strategy.notify_order_filled`` the same way
+  ``TradingBot._handle_order_fill`` does for live fills.
+
+The venue only changes when a new quote arrives, so after each loop iteration
+the clock skips ahead to the next quote (bounded by ``max_skip_seconds`` so
+cooldowns and timeouts still resolve across gaps in the data); this is what
+lets a day of ticks replay in seconds.
+"""
+
+import asyncio
+import contextlib
+import time as _time
+from dataclasses import asdict, dataclass, field
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional
+
+from funding_rate_service.core.fee_calculator import FundingArbFeeCalculator, fee_calculator
+
+from .data import BBOSeries
+from .venue import FillModel, ReplayFill, ReplayVenue, VenueStats
+
+# Grid modules that read wall-clock time via ``time.time()``
+_CLOCKED_MODULES = (
+    "strategies.implementations.grid.strategy",
+    "strategies.implementations.grid.risk_controller",
+    "strategies.implementations.grid.operations.open_position",
+    "strategies.implementations.grid.operations.close_position",
+    "strategies.implementations.grid.operations.recovery",
+)
+
+
+class VirtualClock:
+    """Stand-in for the ``time`` module whose ``time()`` is driven by the replay."""
+
+    def __init__(self, start: float = 0.0) -> None:
+        self.now = float(start)
+
+    def time(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> float:
+        self.now += seconds
+        return self.now
+
+    def advance_to(self, timestamp: float) -> float:
+        if timestamp > self.now:
+            self.now = timestamp
+        return self.now
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(_time, name)
+
+
+@contextlib.contextmanager
+def grid_virtual_time(clock: VirtualClock) -> Iterator[VirtualClock]:
+    """Point the grid modules' ``time`` at ``clock`` until the block exits."""
+    import importlib
+
+    modules = [importlib.import_module(name) for name in _CLOCKED_MODULES]
+    originals = [module.time for module in modules]
+    for module in modules:
+        module.time = clock
+    try:
+        yield clock
+    finally:
+        for module, original in zip(modules, originals):
+            module.time = original
+
+
+class _QuietLogger:
+    """Drops strategy log output during replays (keeps formatting off the hot path)."""
+
+    def debug(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    info = warning = error = critical = exception = debug
+
+
+@dataclass(frozen=True)
+class GridReplayParams:
+    """Venue and loop settings for a replay run."""
+
+    exchange: str = "lighter"
+    ticker: str = "BTC"
+    tick_size: Decimal = Decimal("0.1")
+    step_size: Optional[Decimal] = Decimal("0.00001")
+    quantity: Optional[Decimal] = None  # Base size when the config has no order_notional_usd
+    max_leverage: Decimal = Decimal("20")
+    maker_fee: Optional[Decimal] = None  # None: FundingArbFeeCalculator fees for ``exchange``
+    taker_fee: Optional[Decimal] = None
+    fill_model: FillModel = field(default_factory=FillModel)
+    loop_interval: float = 0.5  # TradingBot sleep when should_execute() is False
+    action_latency: float = 0.05  # Simulated round trip for an execute_strategy() call
+    max_skip_seconds: float = 5.0  # Upper bound on a single fast-forward to the next quote
+    verbose: bool = False  # Keep the strategy's own logging
+
+
+@dataclass
+class GridReplayResult:
+    """Outcome of one replay."""
+
+    name: str
+    strategy_params: Dict[str, Any]
+    summary: Dict[str, Any]
+    fills: List[ReplayFill] = field(default_factory=list)
+    equity_curve: List[tuple] = field(default_factory=list)
+
+
+def fee_rates_for_exchange(
+    exchange: str,
+    calculator: Optional[FundingArbFeeCalculator] = None,
+) -> tuple:
+    """(maker, taker) fee rates for ``exchange`` from the fee calculator tables."""
+    structure = (calculator or fee_calculator).get_fee_structure(exchange)
+    return structure.maker_fee, structure.taker_fee
+
+
+def build_replay_strategy(strategy_params: Dict[str, Any], venue: ReplayVenue, params: GridReplayParams):
+    """Create the grid strategy the same way TradingBot does for a YAML config."""
+    from strategies import base_strategy
+    from strategies.factory import StrategyFactory
+
+    config = SimpleNamespace(
+        strategy="grid",
+        strategy_params=dict(strategy_params),
+        exchange=params.exchange,
+        ticker=params.ticker,
+        contract_id=venue.config.contract_id,
+        quantity=params.quantity,
+        tick_size=params.tick_size,
+    )
+    venue.config.quantity = params.quantity
+    if params.verbose:
+        strategy = StrategyFactory.create_strategy("grid", config, exchange_client=venue)
+    else:
+        # BaseStrategy resolves its logger at construction; the grid components share it
+        original_get_logger = base_strategy.get_strategy_logger
+        base_strategy.get_strategy_logger = lambda *args, **kwargs: _QuietLogger()
+        try:
+            strategy = StrategyFactory.create_strategy("grid", config, exchange_client=venue)
+        finally:
+            base_strategy.get_strategy_logger = original_get_logger
+
+    strategy.event_notifier = None
+    return strategy
+
+
+async def run_grid_replay(
+    strategy_params: Dict[str, Any],
+    series: BBOSeries,
+    params: Optional[GridReplayParams] = None,
+    name: str = "grid",
+    keep_fills: bool = False,
+) -> GridReplayResult:
+    """
+    Replay ``series`` through a grid strategy configured with ``strategy_params``.
+
+    Args:
+        strategy_params: Grid parameters (the ``config`` block of a grid YAML)
+        series: Quotes to replay
+        params: Venue / loop settings
+        name: Label carried into the result (e.g. the preset name)
+        keep_fills: Attach the fill list and equity curve to the result
+    """
+    params = params or GridReplayParams()
+    maker_fee, taker_fee = fee_rates_for_exchange(params.exchange)
+    if params.maker_fee is not None:
+        maker_fee = params.maker_fee
+    if params.taker_fee is not None:
+        taker_fee = params.taker_fee
+
+    clock = VirtualClock(series.start)
+    venue = ReplayVenue(
+        series,
+        clock,
+        symbol=params.ticker,
+        tick_size=params.tick_size,
+        step_size=params.step_size,
+        fill_model=params.fill_model,
+        maker_fee=maker_fee,
+        taker_fee=taker_fee,
+        max_leverage=params.max_leverage,
+        exchange_name=params.exchange,
+    )
+
+    started = _time.perf_counter()
+    cycles = executions = 0
+
+    with grid_virtual_time(clock):
+        strategy = build_replay_strategy(strategy_params, venue, params)
+
+        async def relay_fill(order_id: str, price: Decimal, quantity: Decimal, sequence: Optional[int]) -> None:
+            strategy.notify_order_filled(price, quantity, order_id=order_id)
+
+        venue.order_fill_callback = relay_fill
+        await strategy.initialize()
+
+        end = series.end
+        timestamps = venue._ts
+        last_index = len(timestamps) - 1
+        while clock.now < end:
+            for fill in venue.advance_to(clock.now):
+                await relay_fill(fill.order_id, fill.price, fill.quantity, None)
+
+            cycles += 1
+            if await strategy.should_execute():
+                await strategy.execute_strategy()
+                executions += 1
+                clock.advance(params.action_latency)
+            else:
+                clock.advance(params.loop_interval)
+
+            # The venue only changes at quote boundaries, so further cycles before
+            # the next quote would see the same book; jump straight to it
+            if venue._i < last_index:
+                next_quote = timestamps[venue._i + 1]
+                if next_quote > clock.now:
+                    clock.advance_to(min(next_quote, clock.now + params.max_skip_seconds))
+
+        for fill in venue.advance_to(end):
+            await relay_fill(fill.order_id, fill.price, fill.quantity, None)
+        equity = venue.mark_to_market()
+
+    elapsed = _time.perf_counter() - started
+    summary = summarize_replay(venue, strategy, equity, series, cycles, executions, elapsed)
+    return GridReplayResult(
+        name=name,
+        strategy_params=dict(strategy_params),
+        summary=summary,
+        fills=list(venue.fills) if keep_fills else [],
+        equity_curve=list(venue.equity_curve) if keep_fills else [],
+    )
+
+
+def replay_grid(
+    strategy_params: Dict[str, Any],
+    series: BBOSeries,
+    params: Optional[GridReplayParams] = None,
+    name: str = "grid",
+    keep_fills: bool = False,
+) -> GridReplayResult:
+    """Synchronous wrapper around :func:`run_grid_replay` (used by sweep workers)."""
+    return asyncio.run(run_grid_replay(strategy_params, series, params, name=name, keep_fills=keep_fills))
+
+
+def summarize_replay(
+    venue: ReplayVenue,
+    strategy: Any,
+    equity: float,
+    series: BBOSeries,
+    cycles: int,
+    executions: int,
+    elapsed: float,
+) -> Dict[str, Any]:
+    """Summary statistics for a finished replay."""
+    closing = [fill for fill in venue.fills if fill.realized_pnl != 0]
+    wins = sum(1 for fill in closing if fill.realized_pnl > 0)
+    realized = float(venue.realized_pnl)
+    fees = float(venue.fees_paid)
+    unrealized = equity - (realized - fees)
+    round_trips = len(closing)
+    stats: VenueStats = venue.stats
+    hours = series.duration_seconds / 3600.0
+
+    return {
+        "net_pnl_usd": equity,
+        "realized_pnl_usd": realized,
+        "unrealized_pnl_usd": unrealized,
+        "fees_usd": fees,
+        "round_trips": round_trips,
+        "ev_per_trade_usd": (realized - fees) / round_trips if round_trips else 0.0,
+        "win_rate": wins / round_trips if round_trips else 0.0,
+        "max_drawdown_usd": venue.max_drawdown,
+        "final_position": float(venue.position),
+        "max_abs_position": float(venue.max_abs_position),
+        "volume_usd": float(sum(fill.price * fill.quantity for fill in venue.fills)),
+        "open_positions": len(getattr(strategy.grid_state, "tracked_positions", []) or []),
+        "hours": hours,
+        "quotes": len(series),
+        "cycles": cycles,
+        "executions": executions,
+        "elapsed_seconds": elapsed,
+        **{f"venue_{key}": value for key, value in asdict(stats).items()},
+    }
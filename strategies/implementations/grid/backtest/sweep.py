@@ -0,0 +1,100 @@
+"""
+Preset sweeps for the grid replay backtester.
+
+Each (name, strategy params) pair is replayed in a worker process. The quote
+series is handed to each worker once via the pool initializer, so only the
+small parameter dicts and summaries cross process boundaries.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .data import BBOSeries
+from .engine import GridReplayParams, GridReplayResult, replay_grid
+
+# Per-process state populated by _init_worker()
+_WORKER_SERIES: Optional[BBOSeries] = None
+_WORKER_PARAMS: Optional[GridReplayParams] = None
+
+
+def load_grid_presets(paths: Iterable[Union[str, Path]]) -> List[Tuple[str, Dict[str, Any]]]:
+    """Read grid YAML configs into (preset name, strategy params) pairs."""
+    from trading_config.config_yaml import load_config_from_yaml
+
+    presets = []
+    for path in paths:
+        path = Path(path)
+        loaded = load_config_from_yaml(path)
+        if loaded.get("strategy") != "grid":
+            raise ValueError(f"{path}: not a grid config (strategy={loaded.get('strategy')!r})")
+        presets.append((path.stem, dict(loaded["config"])))
+    return presets
+
+
+def _init_worker(series: BBOSeries, params: GridReplayParams) -> None:
+    global _WORKER_SERIES, _WORKER_PARAMS
+    _WORKER_SERIES = series
+    _WORKER_PARAMS = params
+
+
+def _run_in_worker(preset: Tuple[str, Dict[str, Any]]) -> GridReplayResult:
+    name, strategy_params = preset
+    return replay_grid(strategy_params, _WORKER_SERIES, _WORKER_PARAMS, name=name)
+
+
+def run_preset_sweep(
+    series: BBOSeries,
+    presets: Sequence[Tuple[str, Dict[str, Any]]],
+    params: Optional[GridReplayParams] = None,
+    max_workers: Optional[int] = None,
+) -> List[GridReplayResult]:
+    """
+    Replay every preset over ``series`` and return results in input order.
+
+    Args:
+        series: Quotes to replay
+        presets: (name, strategy params) pairs, e.g. from ``load_grid_presets``
+        params: Venue / loop settings shared by all presets
+        max_workers: Process count (default: CPU count; 1 runs inline)
+    """
+    params = params or GridReplayParams()
+    presets = list(presets)
+    workers = max_workers or os.cpu_count() or 1
+    workers = min(workers, len(presets)) if presets else 1
+
+    if workers <= 1:
+        _init_worker(series, params)
+        return [_run_in_worker(preset) for preset in presets]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(series, params)) as pool:
+        return list(pool.map(_run_in_worker, presets))
+
+
+def format_preset_report(results: Sequence[GridReplayResult], sort_by: str = "net_pnl_usd") -> str:
+    """Plain-text EV / drawdown table, best preset first."""
+    ranked = sorted(results, key=lambda r: r.summary.get(sort_by, 0.0), reverse=True)
+    name_width = max([len("preset")] + [len(result.name) for result in ranked])
+    metrics = [
+        ("round_trips", "trades", "{:>7d}"),
+        ("net_pnl_usd", "net_pnl", "{:>10.2f}"),
+        ("ev_per_trade_usd", "ev/trade", "{:>9.4f}"),
+        ("win_rate", "win", "{:>7.1%}"),
+        ("max_drawdown_usd", "max_dd", "{:>9.2f}"),
+        ("fees_usd", "fees", "{:>8.2f}"),
+        ("volume_usd", "volume", "{:>12.0f}"),
+        ("venue_taker_fills", "taker", "{:>6d}"),
+        ("venue_post_only_rejects", "po_rej", "{:>6d}"),
+        ("elapsed_seconds", "secs", "{:>6.1f}"),
+    ]
+    widths = [len(fmt.format(0)) for _, _, fmt in metrics]
+    header = "  ".join([f"{'preset':<{name_width}}"] + [
+        f"{label:>{width}}" for (_, label, _), width in zip(metrics, widths)
+    ])
+    lines = [header, "-" * len(header)]
+    for result in ranked:
+        cells = [f"{result.name:<{name_width}}"]
+        cells += [fmt.format(result.summary[key]) for key, _, fmt in metrics]
+        lines.append("  ".join(cells))
+    return "\n".join(lines)
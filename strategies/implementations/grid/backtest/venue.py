@@ -0,0 +1,521 @@
+"""
+Replay venue: an in-memory exchange client driven by a BBO series.
+
+Implements the subset of ``BaseExchangeClient`` the grid strategy touches
+(order placement/cancel, active orders, positions, snapshots, leverage) and
+matches resting post-only orders against the recorded top of book with a queue
+position approximation:
+
+- An order that improves on the best price joins an empty queue; one placed at
+  the best price queues behind the displayed size (or ``default_queue_usd``
+  when the series has no sizes); one placed behind the touch gets the default
+  queue once its level becomes the best price.
+- While the order's level is the best price, the queue ahead is consumed by
+  ``trade_share`` of displayed-size decreases (series with sizes) or by
+  ``touch_volume_usd_per_second`` of traded notional (series without sizes);
+  once the queue is exhausted the remaining flow fills the order.
+- Any quote that trades through the order's price fills it outright.
+
+Orders fill in one piece once enough volume has traded, which mirrors how the
+grid strategy consumes fills (it only reacts to FILLED notifications).
+"""
+
+from dataclasses import dataclass
+from decimal import ROUND_DOWN, ROUND_HALF_UP, Decimal
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from exchange_clients.base_models import ExchangePositionSnapshot, OrderInfo, OrderResult
+
+from .data import BBOSeries
+
+ZERO = Decimal("0")
+
+
+@dataclass(frozen=True)
+class FillModel:
+    """Queue-position fill model parameters."""
+
+    touch_volume_usd_per_second: float = 2_000.0
+    default_queue_usd: float = 20_000.0
+    trade_share: float = 0.5
+    max_gap_seconds: float = 5.0  # Cap on the time credited across gaps in the series
+
+
+@dataclass
+class ReplayFill:
+    """One execution against the replay venue."""
+
+    timestamp: float
+    order_id: str
+    side: str
+    price: Decimal
+    quantity: Decimal
+    maker: bool
+    fee: Decimal
+    realized_pnl: Decimal
+    reduce_only: bool = False
+
+
+@dataclass
+class VenueStats:
+    """Order flow counters for a replay run."""
+
+    limit_orders: int = 0
+    market_orders: int = 0
+    post_only_rejects: int = 0
+    cancels: int = 0
+    reduce_only_cancels: int = 0
+    maker_fills: int = 0
+    taker_fills: int = 0
+
+
+class _RestingOrder:
+    __slots__ = (
+        "order_id", "side", "price", "price_ticks", "size", "size_f", "reduce_only",
+        "queue", "filled", "last_ts", "placed_at",
+    )
+
+    def __init__(self, order_id, side, price, price_ticks, size, reduce_only, queue, placed_at):
+        self.order_id = order_id
+        self.side = side
+        self.price = price
+        self.price_ticks = price_ticks
+        self.size = size
+        self.size_f = float(size)
+        self.reduce_only = reduce_only
+        self.queue = queue
+        self.filled = 0.0
+        self.last_ts = placed_at
+        self.placed_at = placed_at
+
+
+class ReplayVenue:
+    """Exchange client stand-in that replays a ``BBOSeries`` on a virtual clock."""
+
+    def __init__(
+        self,
+        series: BBOSeries,
+        clock: Any,
+        symbol: str,
+        tick_size: Decimal,
+        step_size: Optional[Decimal] = None,
+        fill_model: Optional[FillModel] = None,
+        maker_fee: Decimal = ZERO,
+        taker_fee: Decimal = ZERO,
+        max_leverage: Decimal = Decimal("20"),
+        exchange_name: str = "replay",
+        min_order_notional: Optional[Decimal] = None,
+    ) -> None:
+        self.clock = clock
+        self.fill_model = fill_model or FillModel()
+        self.maker_fee = Decimal(str(maker_fee))
+        self.taker_fee = Decimal(str(taker_fee))
+        self.max_leverage = Decimal(str(max_leverage))
+        self.leverage = self.max_leverage
+        self.step_size = Decimal(str(step_size)) if step_size else None
+        self._exchange_name = exchange_name
+        self._tick = Decimal(str(tick_size))
+        self._tick_f = float(self._tick)
+
+        self.config = SimpleNamespace(
+            ticker=symbol,
+            contract_id=symbol,
+            tick_size=self._tick,
+            quantity=None,
+            min_order_notional=min_order_notional,
+        )
+        # Set by the engine, mirroring how TradingBot wires live clients
+        self.order_fill_callback = None
+
+        self._ts: List[float] = series.timestamps.tolist()
+        self._bid: List[int] = np.rint(series.bids / self._tick_f).astype(np.int64).tolist()
+        self._ask: List[int] = np.rint(series.asks / self._tick_f).astype(np.int64).tolist()
+        self._bid_sz: Optional[List[float]] = series.bid_sizes.tolist() if series.has_sizes else None
+        self._ask_sz: Optional[List[float]] = series.ask_sizes.tolist() if series.has_sizes else None
+        self._i = 0
+
+        self._orders: Dict[str, _RestingOrder] = {}
+        self._order_history: Dict[str, OrderInfo] = {}
+        self._order_seq = 0
+
+        self.position = ZERO
+        self.avg_entry = ZERO
+        self.realized_pnl = ZERO
+        self.fees_paid = ZERO
+        self.fills: List[ReplayFill] = []
+        self.stats = VenueStats()
+
+        # Float mirror of the ledger for per-tick equity / drawdown tracking
+        self._pos_f = 0.0
+        self._avg_f = 0.0
+        self._net_f = 0.0  # realized - fees
+        self.peak_equity = 0.0
+        self.max_drawdown = 0.0
+        self.max_abs_position = ZERO
+        self.equity_curve: List[tuple] = []
+        self._next_equity_sample = self._ts[0]
+        self.equity_sample_seconds = 60.0
+
+    # ------------------------------------------------------------------ #
+    # Market state
+    # ------------------------------------------------------------------ #
+
+    @property
+    def best_bid(self) -> Decimal:
+        return self._tick * self._bid[self._i]
+
+    @property
+    def best_ask(self) -> Decimal:
+        return self._tick * self._ask[self._i]
+
+    @property
+    def mid(self) -> float:
+        return (self._bid[self._i] + self._ask[self._i]) * 0.5 * self._tick_f
+
+    def advance_to(self, now: float) -> List[ReplayFill]:
+        """Consume quotes up to ``now`` and return the resulting fills."""
+        ts, bids, asks = self._ts, self._bid, self._ask
+        bid_sz, ask_sz = self._bid_sz, self._ask_sz
+        last = len(ts) - 1
+        fills: List[ReplayFill] = []
+        i = self._i
+
+        while i < last and ts[i + 1] <= now:
+            prev = i
+            i += 1
+            self._i = i
+            if self._orders:
+                self._match_tick(prev, i, ts[i], bids, asks, bid_sz, ask_sz, fills)
+            self._track_equity(ts[i], bids[i], asks[i])
+
+        return fills
+
+    def _match_tick(self, prev, i, now, bids, asks, bid_sz, ask_sz, fills) -> None:
+        model = self.fill_model
+        bid, ask = bids[i], asks[i]
+        tick_f = self._tick_f
+
+        for order in list(self._orders.values()):
+            dt = min(now - max(order.last_ts, self._ts[prev]), model.max_gap_seconds)
+            order.last_ts = now
+            p = order.price_ticks
+            if order.side == "buy":
+                through = ask <= p
+                touch, alone = bid == p, bid < p
+                prev_touch = bids[prev] == p
+                sizes = (bid_sz[prev], bid_sz[i]) if bid_sz is not None else None
+            else:
+                through = bid >= p
+                touch, alone = ask == p, ask > p
+                prev_touch = asks[prev] == p
+                sizes = (ask_sz[prev], ask_sz[i]) if ask_sz is not None else None
+
+            if through:
+                self._fill_resting(order, now, fills)
+                continue
+
+            if alone:
+                order.queue = 0.0
+                flow = model.touch_volume_usd_per_second / (p * tick_f) * dt
+            elif touch:
+                if sizes is None:
+                    flow = model.touch_volume_usd_per_second / (p * tick_f) * dt
+                elif prev_touch:
+                    flow = max(sizes[0] - sizes[1], 0.0) * model.trade_share
+                else:
+                    # Level just became the best price: at most the displayed size is ahead
+                    order.queue = min(order.queue, sizes[1])
+                    flow = 0.0
+            else:
+                continue
+
+            if flow <= 0.0:
+                continue
+            if order.queue > 0.0:
+                consumed = min(order.queue, flow)
+                order.queue -= consumed
+                flow -= consumed
+            if flow > 0.0:
+                order.filled += flow
+                if order.filled >= order.size_f:
+                    self._fill_resting(order, now, fills)
+
+    def _fill_resting(self, order: _RestingOrder, now: float, fills: List[ReplayFill]) -> None:
+        del self._orders[order.order_id]
+        quantity = order.size
+        if order.reduce_only:
+            quantity = self._reduce_only_quantity(order.side, quantity)
+            if quantity <= 0:
+                self.stats.reduce_only_cancels += 1
+                self._record_order(order.order_id, order.side, order.size, order.price, "CANCELED")
+                return
+        self.stats.maker_fills += 1
+        fill = self._apply_fill(now, order.order_id, order.side, quantity, order.price, maker=True)
+        fill.reduce_only = order.reduce_only
+        self._record_order(order.order_id, order.side, quantity, order.price, "FILLED", filled=quantity)
+        fills.append(fill)
+
+    def _reduce_only_quantity(self, side: str, quantity: Decimal) -> Decimal:
+        if side == "sell" and self.position > 0:
+            return min(quantity, self.position)
+        if side == "buy" and self.position < 0:
+            return min(quantity, -self.position)
+        return ZERO
+
+    def _apply_fill(
+        self,
+        now: float,
+        order_id: str,
+        side: str,
+        quantity: Decimal,
+        price: Decimal,
+        maker: bool,
+    ) -> ReplayFill:
+        """Average-cost position ledger."""
+        signed = quantity if side == "buy" else -quantity
+        position = self.position
+        realized = ZERO
+
+        if position == 0 or (position > 0) == (signed > 0):
+            total = position.copy_abs() + quantity
+            self.avg_entry = (self.avg_entry * position.copy_abs() + price * quantity) / total
+        else:
+            closing = min(quantity, position.copy_abs())
+            direction = Decimal("1") if position > 0 else Decimal("-1")
+            realized = (price - self.avg_entry) * closing * direction
+            if quantity > closing:
+                self.avg_entry = price
+
+        self.position = position + signed
+        if self.position == 0:
+            self.avg_entry = ZERO
+        fee = price * quantity * (self.maker_fee if maker else self.taker_fee)
+        self.realized_pnl += realized
+        self.fees_paid += fee
+        if self.position.copy_abs() > self.max_abs_position:
+            self.max_abs_position = self.position.copy_abs()
+
+        self._pos_f = float(self.position)
+        self._avg_f = float(self.avg_entry)
+        self._net_f = float(self.realized_pnl - self.fees_paid)
+
+        fill = ReplayFill(
+            timestamp=now,
+            order_id=order_id,
+            side=side,
+            price=price,
+            quantity=quantity,
+            maker=maker,
+            fee=fee,
+            realized_pnl=realized,
+        )
+        self.fills.append(fill)
+        return fill
+
+    def _track_equity(self, now: float, bid: int, ask: int) -> None:
+        equity = self._net_f
+        if self._pos_f:
+            mark = (bid if self._pos_f > 0 else ask) * self._tick_f
+            equity += self._pos_f * (mark - self._avg_f)
+        if equity > self.peak_equity:
+            self.peak_equity = equity
+        elif self.peak_equity - equity > self.max_drawdown:
+            self.max_drawdown = self.peak_equity - equity
+        if now >= self._next_equity_sample:
+            self.equity_curve.append((now, equity))
+            self._next_equity_sample = now + self.equity_sample_seconds
+
+    def mark_to_market(self) -> float:
+        """Current equity (realized - fees + unrealized at the exit side of the book)."""
+        bid, ask = self._bid[self._i], self._ask[self._i]
+        self._track_equity(self._ts[self._i], bid, ask)
+        equity = self._net_f
+        if self._pos_f:
+            mark = (bid if self._pos_f > 0 else ask) * self._tick_f
+            equity += self._pos_f * (mark - self._avg_f)
+        return equity
+
+    # ------------------------------------------------------------------ #
+    # Exchange client surface used by GridStrategy
+    # ------------------------------------------------------------------ #
+
+    def get_exchange_name(self) -> str:
+        return self._exchange_name
+
+    async def ensure_market_feed(self, symbol: str) -> None:
+        return None
+
+    async def fetch_bbo_prices(self, symbol: str):
+        return self.best_bid, self.best_ask
+
+    async def get_leverage_info(self, symbol: str) -> Dict[str, Any]:
+        return {
+            "max_leverage": self.max_leverage,
+            "max_notional": None,
+            "margin_requirement": Decimal("1") / self.max_leverage,
+        }
+
+    async def set_account_leverage(self, symbol: str, leverage: int) -> bool:
+        self.leverage = Decimal(leverage)
+        return True
+
+    def round_to_tick(self, price) -> Decimal:
+        return Decimal(price).quantize(self._tick, rounding=ROUND_HALF_UP)
+
+    def round_to_step(self, quantity: Decimal) -> Decimal:
+        if not self.step_size:
+            return quantity
+        return (quantity / self.step_size).to_integral_value(rounding=ROUND_DOWN) * self.step_size
+
+    def resolve_client_order_id(self, client_order_id: str) -> Optional[str]:
+        return str(client_order_id)
+
+    async def get_account_positions(self) -> Decimal:
+        return self.position
+
+    async def get_position_snapshot(self, symbol: str) -> Optional[ExchangePositionSnapshot]:
+        if self.position == 0:
+            return None
+        mark = Decimal(repr(self.mid))
+        exposure = self.position.copy_abs() * mark
+        return ExchangePositionSnapshot(
+            symbol=self.config.ticker,
+            quantity=self.position,
+            side="long" if self.position > 0 else "short",
+            entry_price=self.avg_entry,
+            mark_price=mark,
+            exposure_usd=exposure,
+            unrealized_pnl=(mark - self.avg_entry) * self.position,
+            margin_reserved=exposure / self.leverage,
+            leverage=self.leverage,
+        )
+
+    async def place_limit_order(
+        self,
+        contract_id: str,
+        quantity: Decimal,
+        price: Decimal,
+        side: str,
+        reduce_only: bool = False,
+        client_order_id: Optional[int] = None,
+    ) -> OrderResult:
+        self.stats.limit_orders += 1
+        order_id = self._next_order_id(client_order_id)
+        price = self.round_to_tick(price)
+        price_ticks = int((price / self._tick).to_integral_value(rounding=ROUND_HALF_UP))
+        bid, ask = self._bid[self._i], self._ask[self._i]
+
+        crosses = price_ticks >= ask if side == "buy" else price_ticks <= bid
+        if crosses:
+            # Like Lighter, the submission is accepted and the post-only order is
+            # canceled by the matching engine; the strategy finds out through
+            # get_active_orders / get_order_info and reposts.
+            self.stats.post_only_rejects += 1
+            self._record_order(order_id, side, quantity, price, "CANCELED", cancel_reason="post-only")
+            return OrderResult(success=True, order_id=order_id, side=side, size=quantity, price=price, status="OPEN")
+
+        best = bid if side == "buy" else ask
+        improves = price_ticks > bid if side == "buy" else price_ticks < ask
+        if improves:
+            queue = 0.0
+        elif price_ticks == best and self._bid_sz is not None:
+            queue = (self._bid_sz if side == "buy" else self._ask_sz)[self._i]
+        else:
+            queue = self.fill_model.default_queue_usd / float(price)
+
+        self._orders[order_id] = _RestingOrder(
+            order_id, side, price, price_ticks, quantity, reduce_only, queue, self.clock.time()
+        )
+        self._record_order(order_id, side, quantity, price, "OPEN")
+        return OrderResult(success=True, order_id=order_id, side=side, size=quantity, price=price, status="OPEN")
+
+    async def place_market_order(
+        self,
+        contract_id: str,
+        quantity: Decimal,
+        side: str,
+        client_order_id: Optional[int] = None,
+        reduce_only: bool = False,
+    ) -> OrderResult:
+        self.stats.market_orders += 1
+        order_id = self._next_order_id(client_order_id)
+        if reduce_only:
+            quantity = self._reduce_only_quantity(side, quantity)
+            if quantity <= 0:
+                return OrderResult(success=False, order_id=order_id, side=side, status="CANCELED",
+                                   error_message="Reduce-only order would increase position")
+
+        price = self.best_ask if side == "buy" else self.best_bid
+        self.stats.taker_fills += 1
+        fill = self._apply_fill(self.clock.time(), order_id, side, quantity, price, maker=False)
+        fill.reduce_only = reduce_only
+        self._record_order(order_id, side, quantity, price, "FILLED", filled=quantity)
+        if self.order_fill_callback is not None:
+            await self.order_fill_callback(order_id, price, quantity, None)
+        return OrderResult(
+            success=True,
+            order_id=order_id,
+            side=side,
+            size=quantity,
+            price=price,
+            status="FILLED",
+            filled_size=quantity,
+        )
+
+    async def cancel_order(self, order_id: str) -> OrderResult:
+        order = self._orders.pop(str(order_id), None)
+        if order is None:
+            return OrderResult(success=False, order_id=str(order_id), error_message="Order not found")
+        self.stats.cancels += 1
+        self._record_order(order.order_id, order.side, order.size, order.price, "CANCELED")
+        return OrderResult(success=True, order_id=order.order_id, status="CANCELED")
+
+    async def get_active_orders(self, contract_id: str) -> List[OrderInfo]:
+        return [
+            OrderInfo(
+                order_id=order.order_id,
+                side=order.side,
+                size=order.size,
+                price=order.price,
+                status="OPEN",
+                filled_size=ZERO,
+                remaining_size=order.size,
+            )
+            for order in self._orders.values()
+        ]
+
+    async def get_order_info(self, order_id: str, force_refresh: bool = False) -> Optional[OrderInfo]:
+        return self._order_history.get(str(order_id))
+
+    # ------------------------------------------------------------------ #
+
+    def _next_order_id(self, client_order_id: Optional[int]) -> str:
+        self._order_seq += 1
+        # Client ids may be reused once the previous order with that id is done
+        if client_order_id is not None and str(client_order_id) not in self._orders:
+            return str(client_order_id)
+        return f"replay-{self._order_seq}"
+
+    def _record_order(
+        self,
+        order_id: str,
+        side: str,
+        size: Decimal,
+        price: Decimal,
+        status: str,
+        filled: Decimal = ZERO,
+        cancel_reason: str = "",
+    ) -> None:
+        self._order_history[order_id] = OrderInfo(
+            order_id=order_id,
+            side=side,
+            size=size,
+            price=price,
+            status=status,
+            filled_size=filled,
+            remaining_size=size - filled,
+            cancel_reason=cancel_reason,
+        )
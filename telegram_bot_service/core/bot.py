@@ -21,6 +21,7 @@ from telegram_bot_service.handlers.wizards import WizardRouter
 from telegram_bot_service.handlers.notifications import NotificationHandler
 from telegram_bot_service.handlers.opportunities import OpportunitiesHandler
 from telegram_bot_service.handlers.trades import TradesHandler
+from telegram_bot_service.utils.api_client import close_all_clients as close_control_api_clients
 from telegram_bot_service.utils.auth import TelegramAuth
 from telegram_bot_service.utils.formatters import TelegramFormatter
 from telegram_bot_service.managers.process_manager import StrategyProcessManager
@@ -221,6 +222,9 @@ class StrategyControlBot:
             except Exception as e:
                 self.logger.warning(f"Error shutting down application: {e}")
         
+        # Close pooled control API connections
+        await close_control_api_clients()
+        
         try:
             await self.database.disconnect()
         except Exception as e:
@@ -1,25 +1,57 @@
 """
 Notification Handler for Telegram Bot
 
-Polls database for strategy notifications and sends them to Telegram users.
+Delivers strategy notifications to Telegram users. New rows in
+strategy_notifications are pushed via Postgres LISTEN/NOTIFY (see migration
+019); a slow poll of unsent rows remains as a safety net for notifications
+missed while the listener was reconnecting or that failed to send.
 """
 
 import asyncio
 import logging
-from typing import Optional
+from collections import OrderedDict
+from typing import Any, Optional
 from databases import Database
 from telegram import Bot
 
 logger = logging.getLogger(__name__)
 
+# Channel published by the strategy_notifications insert trigger
+NOTIFY_CHANNEL = "strategy_notifications"
+
+# Safety-net poll interval while the listener is connected
+SAFETY_POLL_INTERVAL_SECONDS = 60.0
+
+# Poll interval when LISTEN is unavailable (non-Postgres backend, listener down)
+FALLBACK_POLL_INTERVAL_SECONDS = 5.0
+
+# Delay before re-establishing a dropped listener connection
+LISTEN_RECONNECT_SECONDS = 5.0
+
+# How often an idle listener checks that its connection is still open
+LISTEN_IDLE_CHECK_SECONDS = 5.0
+
+# Recently sent ids remembered to skip rows picked up by both push and poll
+SENT_ID_MEMORY = 1000
+
+_SELECT_NOTIFICATIONS = """
+    SELECT
+        sn.id, sn.user_id, sn.message, sn.notification_type, sn.symbol,
+        u.telegram_user_id
+    FROM strategy_notifications sn
+    JOIN users u ON sn.user_id = u.id
+    WHERE sn.sent = FALSE
+    AND u.telegram_user_id IS NOT NULL
+"""
+
 
 class NotificationHandler:
-    """Handles polling and sending strategy notifications to Telegram users."""
-    
+    """Handles delivering strategy notifications to Telegram users."""
+
     def __init__(self, database: Database, bot: Bot):
         """
         Initialize notification handler.
-        
+
         Args:
             database: Database connection
             bot: Telegram bot instance
@@ -27,87 +59,161 @@ class NotificationHandler:
         self.database = database
         self.bot = bot
         self._task: Optional[asyncio.Task] = None
+        self._listen_task: Optional[asyncio.Task] = None
         self._running = False
-    
+        self._listening = False
+        self._pending_ids: "asyncio.Queue[str]" = asyncio.Queue()
+        self._poll_wakeup = asyncio.Event()
+        # Serializes push and poll delivery so a row is never sent twice
+        self._send_lock = asyncio.Lock()
+        self._sent_ids: "OrderedDict[str, None]" = OrderedDict()
+
     async def start(self):
-        """Start the notification polling loop."""
+        """Start the notification listener and safety-net polling loop."""
         if self._running:
             logger.warning("Notification handler already running")
             return
-        
+
         self._running = True
+        self._listen_task = asyncio.create_task(self._listen_loop())
         self._task = asyncio.create_task(self._polling_loop())
         logger.info("Notification handler started")
-    
+
     async def stop(self):
-        """Stop the notification polling loop."""
+        """Stop the notification listener and polling loop."""
         self._running = False
-        if self._task:
-            self._task.cancel()
+        for task in (self._listen_task, self._task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._listen_task = None
+        self._task = None
+        logger.info("Notification handler stopped")
+
+    def _on_notify(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        """asyncpg listener callback: queue the notification id for delivery."""
+        if payload:
+            self._pending_ids.put_nowait(payload)
+
+    async def _listen_loop(self):
+        """
+        Hold a LISTEN connection and deliver pushed notifications as they arrive.
+
+        Falls back to fast polling while the listener is unavailable.
+        """
+        while self._running:
             try:
-                await self._task
+                async with self.database.connection() as conn:
+                    raw_conn = conn.raw_connection
+                    if not hasattr(raw_conn, "add_listener"):
+                        logger.info("Database backend has no LISTEN support; using polling for notifications")
+                        return
+
+                    await raw_conn.add_listener(NOTIFY_CHANNEL, self._on_notify)
+                    self._listening = True
+                    logger.info(f"Listening for notifications on channel '{NOTIFY_CHANNEL}'")
+                    # Catch up on anything inserted before LISTEN took effect
+                    self._poll_wakeup.set()
+                    try:
+                        while self._running and not raw_conn.is_closed():
+                            try:
+                                notification_id = await asyncio.wait_for(
+                                    self._pending_ids.get(), timeout=LISTEN_IDLE_CHECK_SECONDS
+                                )
+                            except asyncio.TimeoutError:
+                                continue
+                            await self._deliver_by_id(notification_id)
+                    finally:
+                        self._listening = False
+                        if not raw_conn.is_closed():
+                            await raw_conn.remove_listener(NOTIFY_CHANNEL, self._on_notify)
             except asyncio.CancelledError:
-                pass
-            self._task = None
-        logger.info("Notification handler stopped")
-    
+                break
+            except Exception as e:
+                self._listening = False
+                logger.error(f"Notification listener error: {e}")
+
+            if self._running:
+                await asyncio.sleep(LISTEN_RECONNECT_SECONDS)
+
     async def _polling_loop(self):
-        """Background task to poll for strategy notifications and send to Telegram users."""
+        """Background task to poll for unsent notifications (safety net for the listener)."""
         while self._running:
             try:
-                await asyncio.sleep(5)  # Poll every 5 seconds
-                
+                interval = SAFETY_POLL_INTERVAL_SECONDS if self._listening else FALLBACK_POLL_INTERVAL_SECONDS
+                try:
+                    await asyncio.wait_for(self._poll_wakeup.wait(), timeout=interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._poll_wakeup.clear()
+
                 # Get unsent notifications
                 notifications = await self.database.fetch_all(
-                    """
-                    SELECT 
-                        sn.id, sn.user_id, sn.message, sn.notification_type, sn.symbol,
-                        u.telegram_user_id
-                    FROM strategy_notifications sn
-                    JOIN users u ON sn.user_id = u.id
-                    WHERE sn.sent = FALSE
-                    AND u.telegram_user_id IS NOT NULL
+                    _SELECT_NOTIFICATIONS + """
                     ORDER BY sn.created_at ASC
                     LIMIT 10
                     """
                 )
-                
-                if not notifications:
-                    continue
-                
-                # Send each notification
+
                 for notif in notifications:
-                    notification_id = notif["id"]
-                    telegram_user_id = notif["telegram_user_id"]
-                    message = notif["message"]
-                    
-                    try:
-                        # Send message to Telegram user
-                        await self.bot.send_message(
-                            chat_id=telegram_user_id,
-                            text=message,
-                            parse_mode='HTML'
-                        )
-                        
-                        # Mark as sent
-                        await self.database.execute(
-                            """
-                            UPDATE strategy_notifications
-                            SET sent = TRUE, sent_at = NOW()
-                            WHERE id = :notification_id
-                            """,
-                            {"notification_id": notification_id}
-                        )
-                        
-                        logger.debug(f"Sent notification {notification_id} to user {telegram_user_id}")
-                        
-                    except Exception as e:
-                        # Log error but continue processing other notifications
-                        logger.error(f"Failed to send notification {notification_id} to user {telegram_user_id}: {e}")
-                        # Don't mark as sent if there was an error - will retry next poll
-                        
+                    await self._send(notif)
+
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Notification polling error: {e}")
 
+    async def _deliver_by_id(self, notification_id: str) -> None:
+        """Send a single pushed notification if it is still unsent."""
+        try:
+            notif = await self.database.fetch_one(
+                _SELECT_NOTIFICATIONS + " AND sn.id = CAST(:notification_id AS uuid)",
+                {"notification_id": notification_id},
+            )
+        except Exception as e:
+            logger.error(f"Failed to load notification {notification_id}: {e}")
+            return
+
+        if notif:
+            await self._send(notif)
+
+    async def _send(self, notif: Any) -> None:
+        """Send one notification row to Telegram and mark it as sent."""
+        notification_id = str(notif["id"])
+        telegram_user_id = notif["telegram_user_id"]
+        message = notif["message"]
+
+        async with self._send_lock:
+            if notification_id in self._sent_ids:
+                return
+
+            try:
+                # Send message to Telegram user
+                await self.bot.send_message(
+                    chat_id=telegram_user_id,
+                    text=message,
+                    parse_mode='HTML'
+                )
+                self._sent_ids[notification_id] = None
+                while len(self._sent_ids) > SENT_ID_MEMORY:
+                    self._sent_ids.popitem(last=False)
+
+                # Mark as sent
+                await self.database.execute(
+                    """
+                    UPDATE strategy_notifications
+                    SET sent = TRUE, sent_at = NOW()
+                    WHERE id = :notification_id
+                    """,
+                    {"notification_id": notif["id"]}
+                )
+
+                logger.debug(f"Sent notification {notification_id} to user {telegram_user_id}")
+
+            except Exception as e:
+                # Log error but continue processing other notifications
+                logger.error(f"Failed to send notification {notification_id} to user {telegram_user_id}: {e}")
+                # Don't mark as sent if there was an error - will retry next poll
@@ -1,19 +1,115 @@
 """
 API Client for communicating with strategy control API
+
+Every ControlAPIClient talking to the same control server (base URL / port)
+shares one long-lived ``httpx.AsyncClient`` with keep-alive, so button presses
+reuse warm connections and concurrent calls to a strategy process are bounded
+by the pool size. Read endpoints additionally coalesce identical in-flight
+requests and serve a short-TTL cache; writes invalidate that server's cache.
 """
 
+import asyncio
+import copy
+import time
 import httpx
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from decimal import Decimal
 
+# Connections kept per control server; extra concurrent calls queue in the pool
+MAX_CONNECTIONS_PER_SERVER = 4
+
+# Idle keep-alive connections are dropped after this many seconds
+KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+# Per-endpoint request timeouts (seconds)
+ENDPOINT_TIMEOUTS: Dict[str, float] = {
+    "health": 5.0,
+    "status": 30.0,
+    "accounts": 30.0,
+    "positions": 30.0,
+    "balances": 60.0,
+    "close_position": 60.0,
+    "reload_config": 30.0,
+}
+
+# How long read responses are reused (seconds)
+READ_CACHE_TTL: Dict[str, float] = {
+    "status": 2.0,
+    "accounts": 10.0,
+    "positions": 2.0,
+    "balances": 5.0,
+}
+
+_CacheKey = Tuple[str, str, str, Tuple[Tuple[str, str], ...]]
+
+# Shared across all ControlAPIClient instances in the process
+_http_clients: Dict[str, Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+_read_cache: Dict[_CacheKey, Tuple[float, Any]] = {}
+_inflight_reads: Dict[_CacheKey, "asyncio.Task[Any]"] = {}
+# Bumped by invalidate_cache; reads started under an older generation are not cached
+_cache_generations: Dict[str, int] = {}
+
+
+def _get_http_client(base_url: str) -> httpx.AsyncClient:
+    """Return the pooled client for a control server, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    entry = _http_clients.get(base_url)
+    # Pooled connections belong to the loop that opened them
+    if entry is not None and entry[0] is loop and not entry[1].is_closed:
+        return entry[1]
+
+    client = httpx.AsyncClient(
+        base_url=base_url,
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS_PER_SERVER,
+            max_keepalive_connections=MAX_CONNECTIONS_PER_SERVER,
+            keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
+    _http_clients[base_url] = (loop, client)
+    return client
+
+
+def invalidate_cache(base_url: Optional[str] = None) -> None:
+    """
+    Drop cached read responses for one control server (or all of them).
+
+    Reads already in flight keep answering their current callers but are not
+    cached, and later callers start a fresh read.
+    """
+    if base_url is None:
+        _read_cache.clear()
+        _inflight_reads.clear()
+        for url in _cache_generations:
+            _cache_generations[url] += 1
+        return
+    base_url = base_url.rstrip('/')
+    for key in [key for key in _read_cache if key[0] == base_url]:
+        del _read_cache[key]
+    for key in [key for key in _inflight_reads if key[0] == base_url]:
+        del _inflight_reads[key]
+    _cache_generations[base_url] = _cache_generations.get(base_url, 0) + 1
+
+
+async def close_all_clients() -> None:
+    """Close every pooled HTTP client (call on bot shutdown)."""
+    clients = [client for _, client in _http_clients.values()]
+    _http_clients.clear()
+    _read_cache.clear()
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception:
+            pass
+
 
 class ControlAPIClient:
     """HTTP client for strategy control API"""
-    
+
     def __init__(self, base_url: str, api_key: str):
         """
         Initialize API client.
-        
+
         Args:
             base_url: Base URL of control API (e.g., "http://localhost:8766")
             api_key: API key for authentication
@@ -24,67 +120,112 @@ class ControlAPIClient:
             "X-API-Key": api_key,
             "Content-Type": "application/json"
         }
-    
-    async def get_status(self) -> Dict[str, Any]:
-        """Get strategy status and account information."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/status",
-                headers=self.headers
+
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        return _get_http_client(self.base_url)
+
+    async def _get(self, endpoint: str, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        GET a read endpoint through the shared cache.
+
+        Identical concurrent requests (same server, API key, path and params)
+        share a single HTTP call; results are reused for READ_CACHE_TTL seconds.
+        The call runs in its own task, so a cancelled caller never cancels it
+        for the others. Callers always receive their own copy of the response.
+        """
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        key: _CacheKey = (
+            self.base_url,
+            self.api_key,
+            path,
+            tuple(sorted((k, str(v)) for k, v in params.items())),
+        )
+
+        cached = _read_cache.get(key)
+        if cached is not None and time.monotonic() < cached[0]:
+            return copy.deepcopy(cached[1])
+
+        task = _inflight_reads.get(key)
+        if task is None:
+            generation = _cache_generations.setdefault(self.base_url, 0)
+            task = asyncio.ensure_future(self._fetch(endpoint, path, params, key, generation))
+            # Retrieve the exception even if every waiter was cancelled
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            _inflight_reads[key] = task
+        return copy.deepcopy(await asyncio.shield(task))
+
+    async def _fetch(
+        self,
+        endpoint: str,
+        path: str,
+        params: Dict[str, Any],
+        key: _CacheKey,
+        generation: int,
+    ) -> Dict[str, Any]:
+        """
+        Perform one read and cache it; shared by every caller waiting on ``key``.
+
+        The response is not cached when a write invalidated the server's cache
+        while the read was in flight (``generation`` is then out of date).
+        """
+        try:
+            response = await self._client.get(
+                path,
+                headers=self.headers,
+                params=params or None,
+                timeout=ENDPOINT_TIMEOUTS[endpoint],
             )
             response.raise_for_status()
-            return response.json()
-    
-    async def get_accounts(self) -> Dict[str, Any]:
-        """Get list of accessible accounts."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/accounts",
-                headers=self.headers
+            data = response.json()
+            if _cache_generations.get(self.base_url, 0) == generation:
+                _read_cache[key] = (time.monotonic() + READ_CACHE_TTL.get(endpoint, 0.0), data)
+            return data
+        finally:
+            # A newer read may have taken the slot after an invalidation
+            if _inflight_reads.get(key) is asyncio.current_task():
+                del _inflight_reads[key]
+
+    async def _post(self, endpoint: str, path: str, json: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """POST to a write endpoint and invalidate this server's read cache."""
+        try:
+            response = await self._client.post(
+                path,
+                headers=self.headers,
+                json=json,
+                timeout=ENDPOINT_TIMEOUTS[endpoint],
             )
             response.raise_for_status()
             return response.json()
-    
+        finally:
+            invalidate_cache(self.base_url)
+
+    async def get_status(self) -> Dict[str, Any]:
+        """Get strategy status and account information."""
+        return await self._get("status", "/api/v1/status")
+
+    async def get_accounts(self) -> Dict[str, Any]:
+        """Get list of accessible accounts."""
+        return await self._get("accounts", "/api/v1/accounts")
+
     async def get_positions(self, account_name: Optional[str] = None) -> Dict[str, Any]:
         """
         Get active positions.
-        
+
         Args:
             account_name: Optional account name filter
         """
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            params = {}
-            if account_name:
-                params["account_name"] = account_name
-            
-            response = await client.get(
-                f"{self.base_url}/api/v1/positions",
-                headers=self.headers,
-                params=params
-            )
-            response.raise_for_status()
-            return response.json()
-    
+        return await self._get("positions", "/api/v1/positions", {"account_name": account_name})
+
     async def get_balances(self, account_name: Optional[str] = None) -> Dict[str, Any]:
         """
         Get available margin balances across all exchanges.
-        
+
         Args:
             account_name: Optional account name filter
         """
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            params = {}
-            if account_name:
-                params["account_name"] = account_name
-            
-            response = await client.get(
-                f"{self.base_url}/api/v1/balances",
-                headers=self.headers,
-                params=params
-            )
-            response.raise_for_status()
-            return response.json()
-    
+        return await self._get("balances", "/api/v1/balances", {"account_name": account_name})
+
     async def close_position(
         self,
         position_id: str,
@@ -94,53 +235,42 @@ class ControlAPIClient:
     ) -> Dict[str, Any]:
         """
         Close a position.
-        
+
         Args:
             position_id: Position ID (UUID)
             order_type: "market" or "limit"
             reason: Reason for closing
             confirm_wide_spread: If True, proceed with close despite wide spread warning
         """
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/positions/{position_id}/close",
-                headers=self.headers,
-                json={
-                    "order_type": order_type,
-                    "reason": reason,
-                    "confirm_wide_spread": confirm_wide_spread
-                }
-            )
-            response.raise_for_status()
-            return response.json()
-    
+        return await self._post(
+            "close_position",
+            f"/api/v1/positions/{position_id}/close",
+            json={
+                "order_type": order_type,
+                "reason": reason,
+                "confirm_wide_spread": confirm_wide_spread
+            },
+        )
+
     async def health_check(self) -> bool:
         """
         Check if the control API server is running and accessible.
-        
+
         Returns:
             True if server is accessible, False otherwise
         """
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                # Health endpoint doesn't require auth
-                response = await client.get(f"{self.base_url}/health")
-                response.raise_for_status()
-                return True
+            # Health endpoint doesn't require auth
+            response = await self._client.get("/health", timeout=ENDPOINT_TIMEOUTS["health"])
+            response.raise_for_status()
+            return True
         except Exception:
             return False
-    
+
     async def reload_config(self) -> Dict[str, Any]:
         """
         Reload strategy configuration from the config file.
-        
+
         Changes will take effect on the next execution cycle.
         """
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/config/reload",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
-
+        return await self._post("reload_config", "/api/v1/config/reload")
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Compare a pytest-benchmark JSON run against the committed baseline.
+
+Prints a per-benchmark table of baseline vs current medians and exits non-zero
+when any benchmark is slower than the baseline by more than the threshold, or
+when a baselined benchmark did not run (e.g. a venue SDK is missing).
+
+Usage:
+    python -m pytest tests/benchmarks --benchmark-only --benchmark-json=.benchmarks/latest.json
+    python tests/benchmarks/compare.py .benchmarks/latest.json
+    python tests/benchmarks/compare.py .benchmarks/latest.json --threshold 0.40
+    python tests/benchmarks/compare.py .benchmarks/latest.json --allow-missing
+    python tests/benchmarks/compare.py .benchmarks/latest.json --update   # Rewrite baseline.json
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+STAT_KEYS = ("min", "median", "mean", "stddev", "rounds")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare benchmark results against the stored baseline")
+    parser.add_argument("results", type=str, help="JSON file written by --benchmark-json")
+    parser.add_argument("--baseline", type=str, default=str(BASELINE_PATH), help="Baseline JSON file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed median slowdown as a fraction of the baseline (default: 0.25)",
+    )
+    parser.add_argument(
+        "--allow-missing",
+        action="store_true",
+        help="Do not fail when a baselined benchmark is absent from the results",
+    )
+    parser.add_argument("--update", action="store_true", help="Write the results as the new baseline")
+    return parser.parse_args()
+
+
+def load_results(path: Path) -> Dict[str, Dict[str, float]]:
+    """Reduce a pytest-benchmark report to {fullname: summary stats}."""
+    with open(path) as handle:
+        report = json.load(handle)
+    return {
+        bench["fullname"]: {key: bench["stats"][key] for key in STAT_KEYS}
+        for bench in report.get("benchmarks", [])
+    }
+
+
+def load_baseline(path: Path) -> Dict[str, Dict[str, float]]:
+    with open(path) as handle:
+        return json.load(handle)["benchmarks"]
+
+
+def write_baseline(path: Path, results: Dict[str, Dict[str, float]]) -> None:
+    payload = {
+        "updated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "benchmarks": dict(sorted(results.items())),
+    }
+    with open(path, "w") as handle:
+        json.dump(payload, handle, indent=2)
+        handle.write("\n")
+
+
+def compare(
+    baseline: Dict[str, Dict[str, float]],
+    current: Dict[str, Dict[str, float]],
+    threshold: float,
+) -> Tuple[List[Tuple[str, str, str, str, str]], List[str], List[str]]:
+    """
+    Build report rows, the regressed benchmarks and the baselined benchmarks that did not run.
+
+    NEW benchmarks (not in the baseline yet) are reported but never fail the run.
+    """
+    rows = []
+    regressions = []
+    missing = []
+    for name in sorted(set(baseline) | set(current)):
+        base = baseline.get(name)
+        cur = current.get(name)
+        if base is None:
+            rows.append((name, "-", _fmt_us(cur["median"]), "-", "NEW"))
+            continue
+        if cur is None:
+            rows.append((name, _fmt_us(base["median"]), "-", "-", "MISSING"))
+            missing.append(name)
+            continue
+
+        change = cur["median"] / base["median"] - 1.0 if base["median"] else 0.0
+        if change > threshold:
+            status = "SLOWER"
+            regressions.append(name)
+        elif change < -threshold:
+            status = "faster"
+        else:
+            status = "ok"
+        rows.append((name, _fmt_us(base["median"]), _fmt_us(cur["median"]), f"{change:+.1%}", status))
+    return rows, regressions, missing
+
+
+def _fmt_us(seconds: float) -> str:
+    return f"{seconds * 1e6:,.1f}"
+
+
+def main() -> int:
+    args = parse_args()
+    current = load_results(Path(args.results))
+    if not current:
+        print(f"No benchmarks found in {args.results} (was it run with timing enabled?)")
+        return 1
+
+    baseline_path = Path(args.baseline)
+    if args.update:
+        write_baseline(baseline_path, current)
+        print(f"Wrote {len(current)} benchmark(s) to {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        print(f"Baseline {baseline_path} not found; run with --update to create it")
+        return 1
+
+    rows, regressions, missing = compare(load_baseline(baseline_path), current, args.threshold)
+
+    headers = ("Benchmark", "Baseline µs", "Current µs", "Change", "Status")
+    names = [row[0].split("::", 1)[-1] for row in rows]
+    widths = [max(len(headers[0]), *(len(n) for n in names))] + [
+        max(len(headers[i]), *(len(row[i]) for row in rows)) for i in range(1, len(headers))
+    ]
+    print("  ".join(h.ljust(w) if i == 0 else h.rjust(w) for i, (h, w) in enumerate(zip(headers, widths))))
+    for name, row in zip(names, rows):
+        cells = (name,) + row[1:]
+        print("  ".join(c.ljust(w) if i == 0 else c.rjust(w) for i, (c, w) in enumerate(zip(cells, widths))))
+
+    failed = False
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) slower than baseline by more than {args.threshold:.0%}:")
+        for name in regressions:
+            print(f"  - {name}")
+        failed = True
+    if missing and not args.allow_missing:
+        print(f"\n{len(missing)} baselined benchmark(s) did not run (skipped or removed):")
+        for name in missing:
+            print(f"  - {name}")
+        failed = True
+    if failed:
+        return 1
+
+    print(f"\nAll benchmarks within {args.threshold:.0%} of baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
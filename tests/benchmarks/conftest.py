@@ -0,0 +1,213 @@
+"""
+Shared fixtures and fakes for the hot-path benchmark suite.
+
+Everything here runs offline: exchange clients, the price provider and the
+funding rate database are replaced by in-memory fakes that return
+deterministic synthetic data.
+
+Timing is only collected when explicitly requested (``--benchmark-enable``,
+``--benchmark-only``, ``--benchmark-json`` or ``--benchmark-save``).  A plain
+``pytest`` run executes every benchmarked call once as a smoke test so the
+suite stays fast in CI.
+"""
+
+import asyncio
+import random
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from exchange_clients.base_client import BaseExchangeClient
+from exchange_clients.base_models import TradeData
+
+_TIMING_OPTIONS = ("benchmark_enable", "benchmark_only", "benchmark_json", "benchmark_save", "benchmark_autosave")
+
+
+@pytest.fixture
+def benchmark(benchmark, request):
+    """pytest-benchmark fixture that only times when asked to."""
+    if not any(request.config.getoption(name, None) for name in _TIMING_OPTIONS):
+        benchmark.disabled = True
+    return benchmark
+
+
+@pytest.fixture
+def run_async():
+    """Run a coroutine factory to completion on a dedicated event loop."""
+    loop = asyncio.new_event_loop()
+
+    def _run(factory, *args, **kwargs):
+        return loop.run_until_complete(factory(*args, **kwargs))
+
+    yield _run
+    loop.close()
+
+
+class NullLogger:
+    """Logger that drops everything (keeps formatting cost out of the timings)."""
+
+    def debug(self, *args, **kwargs):
+        pass
+
+    info = warning = error = debug
+
+
+# ---------------------------------------------------------------------------
+# Order book / exchange client fakes
+# ---------------------------------------------------------------------------
+
+
+def synthetic_depth(mid: float = 100.0, levels: int = 50, tick: float = 0.01, seed: int = 7) -> Dict[str, List]:
+    """Deterministic order book with ``levels`` price levels per side."""
+    rng = random.Random(seed)
+    bids = [
+        {"price": Decimal(str(round(mid - tick * (i + 1), 2))), "size": Decimal(str(round(rng.uniform(0.5, 20), 3)))}
+        for i in range(levels)
+    ]
+    asks = [
+        {"price": Decimal(str(round(mid + tick * (i + 1), 2))), "size": Decimal(str(round(rng.uniform(0.5, 20), 3)))}
+        for i in range(levels)
+    ]
+    return {"bids": bids, "asks": asks}
+
+
+class FakeExchangeClient:
+    """Just enough of BaseExchangeClient for execution and PnL hot paths."""
+
+    def __init__(
+        self,
+        name: str = "fakedex",
+        depth: Optional[Dict[str, List]] = None,
+        trades: Optional[List[TradeData]] = None,
+        tick_size: Decimal = Decimal("0.01"),
+    ):
+        self._name = name
+        self._depth = depth or synthetic_depth()
+        self._trades = trades or []
+        self.config = SimpleNamespace(tick_size=tick_size, contract_id=f"{name.upper()}-BTC")
+
+    round_to_tick = BaseExchangeClient.round_to_tick
+
+    def get_exchange_name(self) -> str:
+        return self._name
+
+    async def get_order_book_depth(self, symbol: str, levels: int = 20) -> Dict[str, List]:
+        return {"bids": self._depth["bids"][:levels], "asks": self._depth["asks"][:levels]}
+
+    async def get_user_trade_history(
+        self,
+        symbol: str,
+        start_time: float,
+        end_time: float,
+        order_id: Optional[str] = None,
+    ) -> List[TradeData]:
+        if order_id is None:
+            return [t for t in self._trades if start_time <= t.timestamp <= end_time]
+        return [t for t in self._trades if t.order_id == order_id]
+
+
+class FakePriceProvider:
+    """PriceProvider stand-in that answers from the fake client's book."""
+
+    async def get_bbo_prices(self, exchange_client: FakeExchangeClient, symbol: str):
+        depth = exchange_client._depth
+        return depth["bids"][0]["price"], depth["asks"][0]["price"]
+
+
+@pytest.fixture
+def fake_client() -> FakeExchangeClient:
+    return FakeExchangeClient()
+
+
+@pytest.fixture
+def fake_price_provider() -> FakePriceProvider:
+    return FakePriceProvider()
+
+
+# ---------------------------------------------------------------------------
+# Funding rate database fake
+# ---------------------------------------------------------------------------
+
+
+BENCH_DEXES = ["lighter", "aster", "backpack", "paradex", "grvt", "edgex", "hyperliquid", "extended"]
+
+
+class FakeFundingRateDatabase:
+    """Returns a fixed set of latest_funding_rates rows for any query."""
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.rows = rows
+
+    async def fetch_all(self, query: str, values: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        return self.rows
+
+
+def synthetic_rate_rows(symbols: int = 500, dexes: Optional[List[str]] = None, seed: int = 11) -> List[Dict[str, Any]]:
+    """One latest funding rate row per (dex, symbol), shaped like the finder's SQL result."""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    rows = []
+    for s in range(symbols):
+        symbol = f"SYM{s:03d}"
+        for dex in dexes or BENCH_DEXES:
+            rows.append({
+                "dex_name": dex,
+                "symbol": symbol,
+                "funding_rate": Decimal(str(round(rng.gauss(0.0001, 0.0004), 6))),
+                "volume_24h": Decimal(str(round(rng.uniform(1e5, 5e7), 2))),
+                "open_interest_usd": Decimal(str(round(rng.uniform(1e5, 2e7), 2))),
+                "spread_bps": rng.randint(1, 40),
+                "updated_at": now - timedelta(seconds=rng.randint(0, 300)),
+            })
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# Trade history / strategy fakes
+# ---------------------------------------------------------------------------
+
+
+def synthetic_trades(
+    count: int,
+    order_ids: List[str],
+    start_ts: float,
+    side: str = "buy",
+    price: float = 100.0,
+    seed: int = 3,
+) -> List[TradeData]:
+    """Partial fills spread across ``order_ids`` starting at ``start_ts``."""
+    rng = random.Random(seed)
+    return [
+        TradeData(
+            trade_id=f"t{seed}-{i}",
+            timestamp=start_ts + i * 0.05,
+            symbol="BTC",
+            side=side,
+            quantity=Decimal(str(round(rng.uniform(0.001, 0.05), 4))),
+            price=Decimal(str(round(price + rng.uniform(-0.5, 0.5), 2))),
+            fee=Decimal(str(round(rng.uniform(0.001, 0.02), 5))),
+            fee_currency="USDC",
+            order_id=order_ids[i % len(order_ids)],
+        )
+        for i in range(count)
+    ]
+
+
+class _FakePositionManager:
+    async def get_cumulative_funding(self, position_id) -> Decimal:
+        return Decimal("1.25")
+
+
+def fake_strategy(exchange_clients: Dict[str, FakeExchangeClient]) -> SimpleNamespace:
+    """Strategy stand-in exposing what PnLCalculator touches."""
+    from funding_rate_service.core.fee_calculator import FundingArbFeeCalculator
+
+    return SimpleNamespace(
+        exchange_clients=exchange_clients,
+        fee_calculator=FundingArbFeeCalculator(),
+        logger=NullLogger(),
+        position_manager=_FakePositionManager(),
+    )
@@ -0,0 +1,116 @@
+"""
+Typed websocket decoding throughput per venue, over frames replayed from a feed recording.
+
+Synthetic frames in each venue's wire format are written through FeedRecorder
+and read back with FeedReader, so the benchmark decodes exactly what a
+recording of the live feed would hand to the handlers. Divide the frame count
+(``extra_info``) by the mean to get messages/second; for real recordings use
+``scripts/market_data/benchmark_decoders.py``.
+"""
+
+import json
+import random
+
+import pytest
+
+from exchange_clients.market_data.decoding import RawMessage, get_decoder
+from exchange_clients.market_data.recorder import FeedReader, FeedRecorder
+
+pytest.importorskip("pytest_benchmark")
+
+FRAMES = 2_000
+
+
+def _levels(rng, mid, sign, count):
+    return [
+        (f"{mid + sign * 0.01 * i:.2f}", "0" if rng.random() < 0.2 else f"{rng.uniform(0.1, 25):.3f}")
+        for i in range(1, count + 1)
+    ]
+
+
+def _lighter_frame(rng, seq):
+    bids = _levels(rng, 100.0, -1, rng.randint(1, 4))
+    asks = _levels(rng, 100.0, 1, rng.randint(1, 4))
+    return {
+        "type": "update/order_book",
+        "channel": "order_book:1",
+        "order_book": {
+            "code": 0,
+            "offset": seq,
+            "bids": [{"price": p, "size": s} for p, s in bids],
+            "asks": [{"price": p, "size": s} for p, s in asks],
+        },
+    }
+
+
+def _aster_frame(rng, seq):
+    if seq % 2:
+        return {"e": "bookTicker", "u": seq, "s": "BTCUSDT", "b": "99.99", "B": "1.5", "a": "100.01", "A": "2.25"}
+    return {
+        "e": "depthUpdate", "E": seq, "s": "BTCUSDT", "u": seq,
+        "b": [list(level) for level in _levels(rng, 100.0, -1, 20)],
+        "a": [list(level) for level in _levels(rng, 100.0, 1, 20)],
+    }
+
+
+def _backpack_frame(rng, seq):
+    return {
+        "stream": "depth.BTC_USDC_PERP",
+        "data": {
+            "e": "depth", "s": "BTC_USDC_PERP", "U": seq, "u": seq, "E": seq,
+            "b": [list(level) for level in _levels(rng, 100.0, -1, rng.randint(1, 4))],
+            "a": [list(level) for level in _levels(rng, 100.0, 1, rng.randint(1, 4))],
+        },
+    }
+
+
+def _paradex_frame(rng, seq):
+    side = "BUY" if seq % 2 else "SELL"
+    price, size = _levels(rng, 100.0, -1 if side == "BUY" else 1, 1)[0]
+    key = "deletes" if size == "0" else "updates"
+    return {
+        "jsonrpc": "2.0",
+        "method": "subscription",
+        "params": {
+            "channel": "order_book.BTC-USD-PERP.snapshot@15@100ms",
+            "data": {"market": "BTC-USD-PERP", "update_type": "d", "seq_no": seq,
+                     key: [{"side": side, "price": price, "size": size}]},
+        },
+    }
+
+
+FRAME_BUILDERS = {
+    "lighter": _lighter_frame,
+    "aster": _aster_frame,
+    "backpack": _backpack_frame,
+    "paradex": _paradex_frame,
+}
+
+
+@pytest.fixture
+def recorded_frames(tmp_path):
+    def load(venue):
+        rng = random.Random(17)
+        path = tmp_path / f"{venue}.mdrec"
+        with FeedRecorder(path) as recorder:
+            for seq in range(1, FRAMES + 1):
+                recorder.record("ws", json.dumps(FRAME_BUILDERS[venue](rng, seq)))
+        with FeedReader(path) as reader:
+            return [frame.payload for frame in reader]
+
+    return load
+
+
+@pytest.mark.parametrize("venue", sorted(FRAME_BUILDERS))
+def test_decode_recorded_frames(benchmark, recorded_frames, venue):
+    payloads = recorded_frames(venue)
+    decoder = get_decoder(venue)
+    benchmark.extra_info["frames"] = len(payloads)
+
+    def decode_all():
+        decode = decoder.decode
+        return [decode(payload) for payload in payloads]
+
+    messages = benchmark(decode_all)
+    assert len(messages) == FRAMES
+    assert not any(isinstance(message, RawMessage) for message in messages)
@@ -0,0 +1,78 @@
+"""
+Execution hot-path benchmarks: liquidity checks and limit price computation.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from strategies.execution.core.execution_components.pricer import AggressiveLimitPricer
+from strategies.execution.core.liquidity_analyzer import LiquidityAnalyzer
+from strategies.execution.core.price_alignment import BreakEvenPriceAligner
+
+from .conftest import NullLogger
+
+
+def test_liquidity_analyzer_check_execution_feasibility(benchmark, run_async, fake_client):
+    analyzer = LiquidityAnalyzer()
+    analyzer.logger = NullLogger()
+
+    async def check_both_sides():
+        buy = await analyzer.check_execution_feasibility(fake_client, "BTC", "buy", Decimal("2500"))
+        sell = await analyzer.check_execution_feasibility(fake_client, "BTC", "sell", Decimal("2500"))
+        return buy, sell
+
+    buy, sell = benchmark(run_async, check_both_sides)
+    assert buy.depth_sufficient and sell.depth_sufficient
+
+
+def test_break_even_price_alignment(benchmark):
+    quotes = [
+        (Decimal("100.00") + Decimal(i) / 100, Decimal("100.02") + Decimal(i) / 100,
+         Decimal("100.01") + Decimal(i) / 100, Decimal("100.03") + Decimal(i) / 100)
+        for i in range(200)
+    ]
+
+    def align_all():
+        aligned = [BreakEvenPriceAligner.calculate_aligned_prices(*quote) for quote in quotes]
+        hedges = [
+            BreakEvenPriceAligner.calculate_break_even_hedge_price(
+                trigger_fill_price=long_ask,
+                trigger_side="buy",
+                hedge_bid=short_bid,
+                hedge_ask=short_ask,
+                hedge_side="sell",
+                tick_size=Decimal("0.01"),
+                max_deviation_pct=Decimal("0.005"),
+            )
+            for _, long_ask, short_bid, short_ask in quotes
+        ]
+        return aligned, hedges
+
+    aligned, hedges = benchmark(align_all)
+    assert len(aligned) == len(hedges) == 200
+
+
+def test_aggressive_limit_pricer(benchmark, run_async, fake_client, fake_price_provider):
+    pricer = AggressiveLimitPricer(price_provider=fake_price_provider)
+
+    async def price_retry_ladder():
+        results = []
+        for retry in range(8):
+            for side, trigger_side in (("buy", "sell"), ("sell", "buy")):
+                results.append(await pricer.calculate_aggressive_limit_price(
+                    fake_client,
+                    "BTC",
+                    side,
+                    retry_count=retry,
+                    inside_tick_retries=3,
+                    max_deviation_pct=Decimal("0.005"),
+                    trigger_fill_price=Decimal("100.00"),
+                    trigger_side=trigger_side,
+                ))
+        return results
+
+    results = benchmark(run_async, price_retry_ladder)
+    assert all(r.limit_price > 0 for r in results)
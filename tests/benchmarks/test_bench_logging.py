@@ -0,0 +1,75 @@
+"""
+Logging cost on a replayed BBO feed.
+
+Each frame goes through PriceProvider (one BBO record per fetch) and the event
+reconciler's fill router, both logging through the real UnifiedLogger sinks.
+The eager variant replays the same feed with the per-frame f-string records
+the hot paths used to emit, for a before/after comparison.
+"""
+
+import random
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from helpers.unified_logger import get_core_logger
+from strategies.execution.core.execution_components.event_reconciler import EventBasedReconciler
+from strategies.execution.core.price_provider import PriceProvider
+
+FRAMES = 500
+
+
+def _replayed_feed(seed: int = 9):
+    rng = random.Random(seed)
+    mid = 100.0
+    frames = []
+    for _ in range(FRAMES):
+        mid += rng.choice((-0.01, 0.0, 0.01))
+        frames.append((Decimal(f"{mid - 0.01:.2f}"), Decimal(f"{mid + 0.01:.2f}")))
+    return frames
+
+
+class ReplayClient:
+    def __init__(self, frames):
+        self.frames = frames
+        self.position = 0
+
+    def get_exchange_name(self):
+        return "replay"
+
+    async def fetch_bbo_prices(self, symbol):
+        frame = self.frames[self.position % len(self.frames)]
+        self.position += 1
+        return frame
+
+
+def test_replayed_feed_hot_path_logging(benchmark, run_async):
+    frames = _replayed_feed()
+    client = ReplayClient(frames)
+    provider = PriceProvider()
+    router = EventBasedReconciler(get_core_logger("bench_logging")).get_callback_router()
+
+    async def replay():
+        for i in range(FRAMES):
+            bid, ask = await provider.get_bbo_prices(client, "BTC")
+            await router(f"order-{i % 8}", ask, Decimal("0.01"))
+        return client.position
+
+    assert benchmark(run_async, replay) >= FRAMES
+
+
+def test_replayed_feed_eager_logging(benchmark, run_async):
+    frames = _replayed_feed()
+    client = ReplayClient(frames)
+    logger = get_core_logger("bench_logging")
+
+    async def replay():
+        for i in range(FRAMES):
+            bid, ask = await client.fetch_bbo_prices("BTC")
+            logger.info(f"✅ [REPLAY] BBO: bid={Decimal(str(bid))}, ask={Decimal(str(ask))}")
+            logger.debug(f"Queued websocket fill callback for order-{i % 8} (tracker not registered yet)")
+        return client.position
+
+    assert benchmark(run_async, replay) >= FRAMES
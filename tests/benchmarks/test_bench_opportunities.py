@@ -0,0 +1,40 @@
+"""
+OpportunityFinder benchmark over a synthetic latest_funding_rates universe.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from funding_rate_service.core.fee_calculator import FundingArbFeeCalculator
+from funding_rate_service.core.opportunity_finder import OpportunityFinder
+from funding_rate_service.models.filters import OpportunityFilter
+
+from .conftest import FakeFundingRateDatabase, synthetic_rate_rows
+
+
+@pytest.fixture(scope="module")
+def finder():
+    return OpportunityFinder(
+        database=FakeFundingRateDatabase(synthetic_rate_rows(symbols=500)),
+        fee_calculator=FundingArbFeeCalculator(),
+        dex_mapper=None,
+        symbol_mapper=None,
+    )
+
+
+def test_find_opportunities_500_symbols_8_dexes(benchmark, run_async, finder):
+    filters = OpportunityFilter(min_profit_percent=Decimal("0"), limit=100)
+
+    opportunities = benchmark(run_async, finder.find_opportunities, filters)
+    assert 0 < len(opportunities) <= 100
+
+
+def test_find_opportunities_with_required_dex(benchmark, run_async, finder):
+    filters = OpportunityFilter(min_profit_percent=Decimal("0"), required_dex="lighter", limit=50)
+
+    opportunities = benchmark(run_async, finder.find_opportunities, filters)
+    assert opportunities
+    assert all("lighter" in (o.long_dex, o.short_dex) for o in opportunities)
@@ -0,0 +1,146 @@
+"""
+Order book delta application benchmarks for each venue's websocket order book.
+
+Venue packages import their SDKs on package import, so a venue whose SDK is not
+installed is skipped rather than failing the suite.
+"""
+
+import importlib
+import random
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+UPDATES = 1_000
+LEVELS = 100
+
+
+def _load_book_class(module_path: str, class_name: str):
+    try:
+        module = importlib.import_module(module_path)
+    except Exception as exc:  # Missing SDKs surface as ImportError, NameError, ...
+        pytest.skip(f"{module_path} unavailable: {exc}")
+    return getattr(module, class_name)
+
+
+def _deltas(seed: int = 5):
+    """(side, price, size) deltas around a 100.00 mid; ~20% are level removals."""
+    rng = random.Random(seed)
+    deltas = []
+    for _ in range(UPDATES):
+        side = "bids" if rng.random() < 0.5 else "asks"
+        offset = rng.randint(1, LEVELS) * 0.01
+        price = round(100.0 - offset if side == "bids" else 100.0 + offset, 2)
+        size = 0.0 if rng.random() < 0.2 else round(rng.uniform(0.1, 25.0), 3)
+        deltas.append((side, price, size))
+    return deltas
+
+
+def _snapshot_levels():
+    bids = [(round(100.0 - 0.01 * i, 2), 5.0) for i in range(1, LEVELS + 1)]
+    asks = [(round(100.0 + 0.01 * i, 2), 5.0) for i in range(1, LEVELS + 1)]
+    return bids, asks
+
+
+def test_lighter_order_book_deltas(benchmark):
+    LighterOrderBook = _load_book_class("exchange_clients.lighter.websocket.order_book", "LighterOrderBook")
+    bids, asks = _snapshot_levels()
+    messages = [
+        (side, [{"price": str(price), "size": str(size)}])
+        for side, price, size in _deltas()
+    ]
+
+    def apply():
+        book = LighterOrderBook()
+        book.update_order_book("bids", [{"price": str(p), "size": str(s)} for p, s in bids])
+        book.update_order_book("asks", [{"price": str(p), "size": str(s)} for p, s in asks])
+        # Mark the seeded book as a loaded snapshot, as the message handler does
+        book.snapshot_loaded = True
+        book.order_book_ready = True
+        for side, updates in messages:
+            book.update_order_book(side, updates)
+        return book.get_order_book(levels=10)
+
+    result = benchmark(apply)
+    assert result["bids"] and result["asks"]
+
+
+def test_paradex_order_book_deltas(benchmark):
+    ParadexOrderBook = _load_book_class("exchange_clients.paradex.websocket.order_book", "ParadexOrderBook")
+    bids, asks = _snapshot_levels()
+    snapshot = {
+        "update_type": "s",
+        "inserts": [{"side": "BUY", "price": str(p), "size": str(s)} for p, s in bids]
+        + [{"side": "SELL", "price": str(p), "size": str(s)} for p, s in asks],
+    }
+    messages = []
+    for side, price, size in _deltas():
+        level = {"side": "BUY" if side == "bids" else "SELL", "price": str(price), "size": str(size)}
+        key = "deletes" if size == 0 else "updates"
+        messages.append({"update_type": "d", key: [level]})
+
+    def apply():
+        book = ParadexOrderBook()
+        book.update_order_book("BTC-USD-PERP", snapshot)
+        for message in messages:
+            book.update_order_book("BTC-USD-PERP", message)
+        return book.get_order_book(levels=10)
+
+    result = benchmark(apply)
+    assert result["bids"] and result["asks"]
+
+
+def test_backpack_order_book_deltas(benchmark):
+    BackpackOrderBook = _load_book_class("exchange_clients.backpack.websocket.order_book", "BackpackOrderBook")
+    bids, asks = _snapshot_levels()
+    snapshot = {
+        "lastUpdateId": 1,
+        "bids": [[str(p), str(s)] for p, s in bids],
+        "asks": [[str(p), str(s)] for p, s in asks],
+    }
+    messages = [
+        {
+            "e": "depth",
+            "s": "BTC_USDC_PERP",
+            "U": seq,
+            "u": seq,
+            "b" if side == "bids" else "a": [[str(price), str(size)]],
+        }
+        for seq, (side, price, size) in enumerate(_deltas(), start=2)
+    ]
+
+    def apply():
+        book = BackpackOrderBook()
+        book.load_snapshot(snapshot)
+        for message in messages:
+            book.apply_depth_update(message, symbol="BTC_USDC_PERP")
+        return book.get_order_book(levels=10)
+
+    result = benchmark(apply)
+    assert result["bids"] and result["asks"]
+
+
+def test_aster_order_book_depth_snapshots(benchmark):
+    # Aster streams partial-depth snapshots, so each update replaces the book
+    AsterOrderBook = _load_book_class("exchange_clients.aster.websocket.order_book", "AsterOrderBook")
+    rng = random.Random(9)
+    frames = [
+        (
+            [{"price": Decimal(str(round(100.0 - 0.01 * i, 2))), "size": Decimal(str(round(rng.uniform(0.1, 25), 3)))}
+             for i in range(1, 21)],
+            [{"price": Decimal(str(round(100.0 + 0.01 * i, 2))), "size": Decimal(str(round(rng.uniform(0.1, 25), 3)))}
+             for i in range(1, 21)],
+        )
+        for _ in range(UPDATES)
+    ]
+
+    def apply():
+        book = AsterOrderBook()
+        for bids, asks in frames:
+            book.update_order_book_from_depth(bids, asks)
+        return book.get_order_book(levels=10)
+
+    result = benchmark(apply)
+    assert result["bids"] and result["asks"]
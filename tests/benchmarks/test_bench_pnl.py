@@ -0,0 +1,115 @@
+"""
+Closing-path benchmarks: trade aggregation, PnL from trade history and
+position metadata serialization.
+"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from strategies.implementations.funding_arbitrage.models import FundingArbPosition
+from strategies.implementations.funding_arbitrage.operations.closing.pnl_calculator import PnLCalculator
+from strategies.implementations.funding_arbitrage.operations.core.trade_aggregator import (
+    aggregate_trades_by_order,
+)
+from strategies.implementations.funding_arbitrage.position_manager import FundingArbPositionManager
+
+from .conftest import FakeExchangeClient, NullLogger, fake_strategy, synthetic_trades
+
+OPENED_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+CLOSED_AT = OPENED_AT + timedelta(hours=36)
+
+
+def _position() -> FundingArbPosition:
+    return FundingArbPosition(
+        id=uuid4(),
+        symbol="BTC",
+        long_dex="lighter",
+        short_dex="paradex",
+        size_usd=Decimal("5000"),
+        entry_long_rate=Decimal("0.0001"),
+        entry_short_rate=Decimal("0.0005"),
+        entry_divergence=Decimal("0.0004"),
+        opened_at=OPENED_AT,
+        metadata={
+            "legs": {
+                "lighter": {"order_id": "L-entry", "entry_price": Decimal("100.00"), "side": "long",
+                            "quantity": Decimal("50"), "fill_history": [{"ts": OPENED_AT, "qty": Decimal("1")}] * 20},
+                "paradex": {"order_id": "P-entry", "entry_price": Decimal("100.05"), "side": "short",
+                            "quantity": Decimal("50"), "fill_history": [{"ts": OPENED_AT, "qty": Decimal("1")}] * 20},
+            },
+            "funding_history": [
+                {"timestamp": OPENED_AT + timedelta(hours=h), "amount": Decimal("0.41"), "rate": Decimal("0.0004")}
+                for h in range(0, 36, 1)
+            ],
+            "tags": {"entry", "bench"},
+            "position_uuid": uuid4(),
+        },
+    )
+
+
+def _clients():
+    opened = OPENED_AT.timestamp()
+    closed = CLOSED_AT.timestamp()
+    return {
+        "lighter": FakeExchangeClient(
+            "lighter",
+            trades=synthetic_trades(100, ["L-entry"], opened, "buy", seed=1)
+            + synthetic_trades(100, ["L-exit"], closed, "sell", price=101.0, seed=2),
+        ),
+        "paradex": FakeExchangeClient(
+            "paradex",
+            trades=synthetic_trades(100, ["P-entry"], opened, "sell", seed=3)
+            + synthetic_trades(100, ["P-exit"], closed, "buy", price=101.0, seed=4),
+        ),
+    }
+
+
+def test_aggregate_trades_by_order(benchmark):
+    trades = synthetic_trades(2_000, [f"order-{i}" for i in range(50)], OPENED_AT.timestamp())
+
+    aggregated = benchmark(aggregate_trades_by_order, trades)
+    assert len(aggregated) == 50
+
+
+def test_pnl_from_trade_history(benchmark, run_async):
+    strategy = fake_strategy(_clients())
+    calculator = PnLCalculator(strategy)
+    position = _position()
+    close_result = {
+        "filled_orders": [
+            {"dex": "lighter", "order_id": "L-exit", "fill_price": Decimal("101.0"), "filled_quantity": Decimal("2.5")},
+            {"dex": "paradex", "order_id": "P-exit", "fill_price": Decimal("101.0"), "filled_quantity": Decimal("2.5")},
+        ]
+    }
+
+    async def store_trades(**kwargs):
+        return None
+
+    def calculate():
+        fees = calculator.calculate_closing_fees(close_result, order_type="limit")
+        pnl = run_async(
+            calculator.calculate_pnl_from_trade_history,
+            position,
+            close_result,
+            OPENED_AT.timestamp(),
+            CLOSED_AT.timestamp() + 60,
+            store_trades,
+        )
+        return fees, pnl
+
+    fees, (pnl, method) = benchmark(calculate)
+    assert fees > 0
+    assert method == "trade_history_with_order_id"
+
+
+def test_position_metadata_serialization(benchmark):
+    manager = FundingArbPositionManager(logger=NullLogger())
+    metadata = _position().metadata
+
+    serialized = benchmark(manager._prepare_metadata_for_storage, metadata)
+    assert '"legs"' in serialized
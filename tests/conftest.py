@@ -1,8 +1,13 @@
 """Pytest configuration for funding arb tests."""
 
+import os
 import sys
 from pathlib import Path
 
+# Keep test runs from appending execution records to the repo's logs/ directory
+# (the module-level store reads this at import time)
+os.environ.setdefault("EXECUTION_TELEMETRY_ENABLED", "0")
+
 PROJECT_ROOT = Path(__file__).parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
@@ -22,13 +22,14 @@ class TestExchangeClientFactory:
         supported = ExchangeFactory.get_supported_exchanges()
 
         assert isinstance(supported, list)
-        assert len(supported) == 6
+        assert len(supported) == 7
         assert "lighter" in supported
         assert "aster" in supported
         assert "backpack" in supported
         assert "paradex" in supported
         assert "edgex" in supported
         assert "grvt" in supported
+        assert "sim" in supported
 
     def test_factory_raises_error_for_unknown_exchange(self):
         """Test that factory raises error for unknown exchange."""
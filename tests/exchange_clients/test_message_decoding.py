@@ -0,0 +1,133 @@
+"""
+Tests for the typed per-venue websocket decoders and unit conversions.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from exchange_clients.market_data.decoding import (
+    AsterDecoder,
+    BackpackDecoder,
+    BookMessage,
+    JSONDecodeError,
+    LighterDecoder,
+    ParadexDecoder,
+    RawMessage,
+    TickerMessage,
+    to_units,
+    units_to_decimal,
+)
+from exchange_clients.paradex.websocket.order_book import ParadexOrderBook
+
+
+@pytest.mark.parametrize(
+    "text, units",
+    [
+        ("100.5", 1_005_000_000_000),
+        ("0.00000001", 100),
+        ("-0.5", -5_000_000_000),
+        ("12", 120_000_000_000),
+        ("1e-5", 100_000),
+        (7, 70_000_000_000),
+        # Digits beyond 10 decimals are truncated
+        ("1.123456789012", 11_234_567_890),
+    ],
+)
+def test_to_units(text, units):
+    assert to_units(text) == units
+
+
+def test_units_round_trip_to_exact_decimal():
+    for text in ("100.5", "0.0001", "65000", "-3.25"):
+        assert units_to_decimal(to_units(text)) == Decimal(text)
+    assert str(units_to_decimal(to_units("100.500"))) == "100.5"
+
+
+def test_lighter_snapshot_update_and_incomplete_update():
+    decoder = LighterDecoder()
+    snapshot = decoder.decode(
+        '{"type": "subscribed/order_book", "order_book": {"code": 0, "offset": 7,'
+        ' "bids": [{"price": "100.1", "size": "2"}], "asks": [{"price": "100.2", "size": "1.5"}]}}'
+    )
+    assert isinstance(snapshot, BookMessage) and snapshot.snapshot and snapshot.sequence == 7
+    assert snapshot.bids == [(to_units("100.1"), to_units("2"))]
+
+    update = decoder.decode(
+        b'{"type": "update/order_book", "order_book": {"code": 0, "offset": 8,'
+        b' "bids": [{"price": "100.1", "size": "0"}], "asks": []}}'
+    )
+    assert not update.snapshot and update.bids == [(to_units("100.1"), 0)]
+
+    incomplete = decoder.decode('{"type": "update/order_book", "order_book": {"offset": 9}}')
+    assert isinstance(incomplete, RawMessage) and incomplete.type == "update/order_book"
+    assert decoder.malformed == 1
+
+    other = decoder.decode('{"type": "update/user_stats", "stats": {}}')
+    assert isinstance(other, RawMessage) and other.data["stats"] == {}
+
+    with pytest.raises(JSONDecodeError):
+        decoder.decode("{not json")
+
+
+def test_aster_book_ticker_and_depth():
+    decoder = AsterDecoder()
+    ticker = decoder.decode(
+        '{"e": "bookTicker", "u": 11, "s": "BTCUSDT", "b": "25.3519", "B": "31.21", "a": "25.3652", "A": "40.66"}'
+    )
+    assert isinstance(ticker, TickerMessage)
+    assert (ticker.symbol, ticker.bid, ticker.ask_size, ticker.sequence) == (
+        "BTCUSDT", to_units("25.3519"), to_units("40.66"), 11,
+    )
+
+    depth = decoder.decode('{"e": "depthUpdate", "E": 1, "s": "BTCUSDT", "u": 12, "b": [["1.5", "2"]], "a": []}')
+    assert depth.snapshot and depth.bids == [(to_units("1.5"), to_units("2"))] and depth.asks == []
+
+
+def test_backpack_dispatches_on_stream_kind():
+    decoder = BackpackDecoder()
+    depth = decoder.decode(
+        '{"stream": "depth.SOL_USDC_PERP", "data": {"e": "depth", "s": "SOL_USDC_PERP",'
+        ' "U": 101, "u": 103, "b": [["150.1", "2.5"]], "a": [["150.2", "0"]]}}'
+    )
+    assert (depth.symbol, depth.first_sequence, depth.sequence) == ("SOL_USDC_PERP", 101, 103)
+    assert depth.asks == [(to_units("150.2"), 0)]
+
+    ticker = decoder.decode('{"stream": "bookTicker.SOL_USDC_PERP", "data": {"b": "150.1", "a": "150.2"}}')
+    assert isinstance(ticker, TickerMessage) and ticker.bid_size is None
+
+    assert isinstance(decoder.decode('{"stream": "trade.SOL_USDC_PERP", "data": {}}'), RawMessage)
+
+
+def test_paradex_delta_order_and_book_apply():
+    decoder = ParadexDecoder()
+    channel = "order_book.BTC-USD-PERP.snapshot@15@100ms"
+    snapshot = decoder.decode_data({"params": {"channel": channel, "data": {
+        "market": "BTC-USD-PERP", "update_type": "s",
+        "inserts": [
+            {"side": "BUY", "price": "100", "size": "1"},
+            {"side": "BUY", "price": "99.5", "size": "2"},
+            {"side": "SELL", "price": "100.5", "size": "3"},
+        ],
+    }}})
+    delta = decoder.decode_data({"params": {"channel": channel, "data": {
+        "market": "BTC-USD-PERP", "update_type": "d",
+        "deletes": [{"side": "BUY", "price": "100", "size": "0"}],
+        "updates": [{"side": "SELL", "price": "100.5", "size": "4"}],
+    }}})
+    assert snapshot.snapshot and not delta.snapshot
+    assert delta.bids == [(to_units("100"), 0)]
+
+    book = ParadexOrderBook()
+    book.apply_message(snapshot)
+    assert book.best_bid == Decimal("100")
+    book.apply_message(delta)
+    assert book.best_bid == Decimal("99.5") and book.best_ask == Decimal("100.5")
+    assert book.get_order_book(levels=1) == {
+        "bids": [{"price": Decimal("99.5"), "size": Decimal("2")}],
+        "asks": [{"price": Decimal("100.5"), "size": Decimal("4")}],
+    }
+    assert book.get_best_levels() == ((Decimal("99.5"), Decimal("2")), (Decimal("100.5"), Decimal("4")))
+
+    bbo = decoder.decode_data({"params": {"channel": "bbo.BTC-USD-PERP", "data": {"market": "BTC-USD-PERP", "bid": "99.5", "ask": "100.5"}}})
+    assert isinstance(bbo, TickerMessage) and bbo.ask == to_units("100.5")
@@ -0,0 +1,226 @@
+"""
+Tests for the websocket-fed order state cache and cache-driven reconciliation.
+"""
+
+import asyncio
+import logging
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from exchange_clients.base_client import BaseExchangeClient
+from exchange_clients.base_models import OrderInfo
+from exchange_clients.order_state_cache import OrderStateCache, fresh_order_state, store_order_update
+from exchange_clients.paradex.websocket.manager import ParadexWebSocketManager
+from strategies.execution.core.execution_components.reconciler import OrderReconciler
+
+
+def _info(status, filled="0"):
+    return OrderInfo(
+        order_id="1",
+        side="buy",
+        size=Decimal("1"),
+        price=Decimal("100"),
+        status=status,
+        filled_size=Decimal(filled),
+        remaining_size=Decimal("1") - Decimal(filled),
+    )
+
+
+class StreamFlag:
+    def __init__(self, live=True):
+        self.live = live
+
+    def __call__(self):
+        return self.live
+
+
+def test_fresh_requires_live_stream_and_recent_update():
+    stream = StreamFlag()
+    cache = OrderStateCache(max_open_age=30.0, stream_live=stream)
+    cache["1"] = _info("OPEN")
+    cache["2"] = _info("FILLED", "1")
+
+    assert cache.fresh("1").status == "OPEN"
+    assert cache.fresh("missing") is None
+
+    # Stream drop: open orders must be re-verified via REST, terminal ones are still served
+    stream.live = False
+    assert cache.fresh("1") is None
+    assert cache.fresh("2").status == "FILLED"
+
+    # Reconnect alone doesn't clear staleness; the next update does
+    stream.live = True
+    assert cache.fresh("1") is None
+    cache["1"] = _info("OPEN")
+    assert cache.fresh("1") is not None
+
+    cache.max_open_age = 0.0
+    assert cache.fresh("1") is None
+
+    # Plain dicts only trust terminal states
+    assert fresh_order_state({"1": _info("OPEN")}, "1") is None
+
+
+def test_out_of_order_updates_are_dropped():
+    cache = OrderStateCache(stream_live=StreamFlag())
+
+    assert store_order_update(cache, "1", _info("OPEN"), sequence=10)
+    assert store_order_update(cache, "1", _info("FILLED", "1"), sequence=12)
+    assert not store_order_update(cache, "1", _info("PARTIALLY_FILLED", "0.5"), sequence=11)
+    # Without a sequence, a terminal order never regresses to a live state
+    assert not cache.apply("1", _info("OPEN"))
+
+    assert cache["1"].status == "FILLED"
+    assert cache.dropped_updates == 2
+
+
+@pytest.mark.asyncio
+async def test_wait_for_update_wakes_on_websocket_write():
+    cache = OrderStateCache(stream_live=StreamFlag())
+    cache["1"] = _info("OPEN")
+
+    async def fill_later():
+        await asyncio.sleep(0.01)
+        cache.apply("1", _info("FILLED", "1"))
+
+    task = asyncio.create_task(fill_later())
+    info = await cache.wait_for_update("1", timeout=1.0)
+    await task
+
+    assert info.status == "FILLED"
+    assert await cache.wait_for_update("1", timeout=0) is info
+
+
+class CacheOnlyClient:
+    """Client whose get_order_info serves the cache and counts REST fallbacks."""
+
+    def __init__(self):
+        self.cache = OrderStateCache(stream_live=lambda: True)
+        self.rest_calls = 0
+
+    def get_order_state_cache(self):
+        return self.cache
+
+    async def get_order_info(self, order_id, *, force_refresh=False):
+        fresh = fresh_order_state(self.cache, order_id)
+        if fresh is not None and not force_refresh:
+            return fresh
+        self.rest_calls += 1
+        return self.cache.get(str(order_id))
+
+
+@pytest.mark.asyncio
+async def test_reconciler_confirms_fill_from_websocket_without_rest():
+    client = CacheOnlyClient()
+    client.cache["1"] = _info("OPEN")
+
+    async def stream_fill():
+        await asyncio.sleep(0.02)
+        client.cache.apply("1", _info("FILLED", "1"), sequence=2)
+
+    task = asyncio.create_task(stream_fill())
+    result = await OrderReconciler().poll_order_until_filled(
+        exchange_client=client,
+        order_id="1",
+        order_quantity=Decimal("1"),
+        limit_price=Decimal("100"),
+        target_quantity=Decimal("1"),
+        accumulated_filled_qty=Decimal("0"),
+        current_order_filled_qty=Decimal("0"),
+        attempt_timeout=2.0,
+        pricing_strategy="touch",
+        retry_count=0,
+        retry_backoff_ms=0,
+        logger=logging.getLogger(__name__),
+        exchange_name="test",
+        symbol="BTC",
+    )
+    await task
+
+    assert result.filled and result.filled_qty == Decimal("1")
+    assert client.rest_calls == 0
+    # One read before the fill, one after it: no 50ms polling in between
+    assert client.cache.hits == 2
+
+
+class FakeSocket:
+    def __init__(self):
+        self.closed = False
+
+
+class FakeParadexSDK:
+    def __init__(self):
+        self.ws = None
+
+    async def connect(self):
+        self.ws = FakeSocket()
+        return True
+
+    async def _close_connection(self):
+        self.ws.closed = True
+
+
+class StreamedClient:
+    """Client wired to its websocket manager the way exchange clients are."""
+
+    _order_stream_live = BaseExchangeClient._order_stream_live
+    _watch_order_stream = BaseExchangeClient._watch_order_stream
+    get_order_state_cache = BaseExchangeClient.get_order_state_cache
+
+    def __init__(self, ws_manager):
+        self.ws_manager = ws_manager
+        self._latest_orders = OrderStateCache(stream_live=self._order_stream_live)
+        self._watch_order_stream(ws_manager)
+        self.rest_calls = 0
+
+    async def get_order_info(self, order_id, *, force_refresh=False):
+        fresh = fresh_order_state(self._latest_orders, order_id)
+        if fresh is not None and not force_refresh:
+            return fresh
+        self.rest_calls += 1
+        return self._latest_orders.get(str(order_id))
+
+
+async def _private_update(manager):
+    await manager._handle_order_update(None, {"params": {"data": {}}})
+
+
+@pytest.mark.asyncio
+async def test_dropped_private_stream_forces_rest():
+    sdk = FakeParadexSDK()
+    manager = ParadexWebSocketManager(config=SimpleNamespace(contract_id=None), paradex_ws_client=sdk)
+    client = StreamedClient(manager)
+    await manager.connect()
+
+    # Connected but no private message yet: not trusted
+    client._latest_orders["1"] = _info("OPEN")
+    await client.get_order_info("1")
+    assert client.rest_calls == 1
+
+    await _private_update(manager)
+    client._latest_orders["1"] = _info("OPEN")
+    await client.get_order_info("1")
+    assert client.rest_calls == 1
+
+    # Socket dies underneath a manager that still reports running
+    sdk.ws.closed = True
+    assert manager.running
+    await client.get_order_info("1")
+    assert client.rest_calls == 2
+
+    # Disconnect/reconnect with no read in between still invalidates live orders
+    sdk.ws.closed = False
+    client._latest_orders["1"] = _info("OPEN")
+    await manager.disconnect()
+    await manager.connect()
+    await _private_update(manager)
+    await client.get_order_info("1")
+    assert client.rest_calls == 3
+
+    # A silent stream stops being trusted
+    client._latest_orders["1"] = _info("OPEN")
+    manager.private_stream_max_silence = 0.0
+    await client.get_order_info("1")
+    assert client.rest_calls == 4
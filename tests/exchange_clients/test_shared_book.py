@@ -0,0 +1,281 @@
+"""
+Tests for the shared-memory book rings, the strategy-side adapter and the market-data daemon.
+"""
+
+import asyncio
+import os
+import struct
+import time
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from exchange_clients.base_client import BaseExchangeClient
+from exchange_clients.base_websocket import BaseWebSocketManager, BBOData
+from exchange_clients.market_data.daemon import MarketDataDaemon
+from exchange_clients.market_data.shared_book import (
+    DEFAULT_MAX_AGE_SECONDS,
+    HEAD_OFFSET,
+    HEADER,
+    SharedBookError,
+    SharedBookReader,
+    SharedBookWebSocketManager,
+    SharedBookWriter,
+)
+
+VENUE = "testvenue"
+
+
+@pytest.fixture
+def symbol(request):
+    return f"T{os.getpid()}{abs(hash(request.node.name)) % 100000}"
+
+
+@pytest.fixture
+def writer(symbol):
+    writer = SharedBookWriter.create(VENUE, symbol, levels=3, slots=4)
+    yield writer
+    writer.close()
+
+
+def test_reader_sees_latest_frame_across_ring_wraps(writer, symbol):
+    reader = SharedBookReader.attach(VENUE, symbol)
+    assert reader.read() is None
+
+    for i in range(10):
+        writer.publish([(100.0 + i, 1.0), (99.0, 2.0)], [(101.0 + i, 1.5)], sequence=i)
+    frame = reader.read()
+
+    assert frame.best_bid == 109.0 and frame.best_ask == 110.0
+    assert frame.bids == [(109.0, 1.0), (99.0, 2.0)]
+    assert frame.sequence == 9 and frame.version == reader.head == 10
+    # Depth beyond the ring's levels is truncated
+    writer.publish([(1.0, 1.0)] * 5, [(2.0, 1.0)] * 5)
+    assert len(reader.read().bids) == 3
+    reader.close()
+
+
+def test_torn_slot_is_retried_and_never_returned(writer, symbol):
+    reader = SharedBookReader.attach(VENUE, symbol)
+    writer.publish([(100.0, 1.0)], [(101.0, 1.0)])
+    head = struct.unpack_from("<Q", writer._buf, HEAD_OFFSET)[0]
+    offset = HEADER.size + (head % writer.slots) * writer._slot_size
+    seq = struct.unpack_from("<Q", writer._buf, offset)[0]
+
+    # Writer "mid-publish": odd sequence on the head slot
+    struct.pack_into("<Q", writer._buf, offset, seq + 1)
+    assert reader.read() is None
+    assert reader.torn_reads > 0
+
+    struct.pack_into("<Q", writer._buf, offset, seq + 2)
+    assert reader.read().best_bid == 100.0
+    reader.close()
+
+
+def test_missing_segment_raises():
+    with pytest.raises(SharedBookError):
+        SharedBookReader.attach(VENUE, "NOSUCHBOOK")
+
+
+class RecordingManager(BaseWebSocketManager):
+    """Venue-manager stand-in: holds a book and records forwarded BBOs."""
+
+    def __init__(self):
+        super().__init__()
+        self.book = None
+        self.received = []
+        self.prepared = []
+        self.register_bbo_listener(self.received.append)
+
+    async def connect(self):
+        self.running = True
+
+    async def disconnect(self):
+        self.running = False
+
+    async def prepare_market_feed(self, symbol):
+        self.prepared.append((symbol, self.public_book_feed))
+
+    def get_order_book(self, levels=None):
+        return self.book
+
+
+@pytest.mark.asyncio
+async def test_adapter_serves_book_and_forwards_bbo(writer, symbol):
+    writer.set_feed_symbol(f"{symbol}-PERP")
+    writer.publish([(100.0, 1.0), (99.5, 3.0)], [(100.5, 2.0)])
+
+    adapter = SharedBookWebSocketManager(VENUE, poll_interval=0.001)
+    venue_manager = RecordingManager()
+    adapter.forward_to(venue_manager)
+    await adapter.prepare_market_feed(symbol.lower())
+    try:
+        assert adapter.is_live()
+        assert adapter.best_bid == 100.0 and adapter.best_ask == 100.5
+        assert adapter.get_order_book(1) == {
+            "bids": [{"price": Decimal("100.0"), "size": Decimal("1.0")}],
+            "asks": [{"price": Decimal("100.5"), "size": Decimal("2.0")}],
+        }
+
+        writer.publish([(100.25, 1.0)], [(100.5, 2.0)], sequence=7)
+        for _ in range(200):
+            if venue_manager.received and venue_manager.received[-1].bid == Decimal("100.25"):
+                break
+            await asyncio.sleep(0.005)
+        bbo = venue_manager.received[-1]
+        assert (bbo.symbol, bbo.bid, bbo.ask, bbo.sequence) == (f"{symbol}-PERP", Decimal("100.25"), Decimal("100.5"), 7)
+
+        # A daemon that stopped publishing is treated as unavailable
+        writer.publish([(100.0, 1.0)], [(100.5, 1.0)], timestamp=time.time() - 60)
+        assert adapter.best_bid is None and adapter.get_order_book() is None
+    finally:
+        await adapter.disconnect()
+
+
+class FakeClient:
+    def __init__(self):
+        self.ws_manager = RecordingManager()
+        self.connected = False
+
+    async def connect(self):
+        self.connected = True
+
+    async def disconnect(self):
+        self.connected = False
+
+    async def ensure_market_feed(self, symbol):
+        self.ws_manager.book = {
+            "bids": [{"price": Decimal("10"), "size": Decimal("1")}],
+            "asks": [{"price": Decimal("11"), "size": Decimal("1")}],
+        }
+
+
+@pytest.mark.asyncio
+async def test_daemon_publishes_on_bbo_updates_and_unlinks_on_stop(symbol):
+    clients = {}
+
+    def factory(venue, sym):
+        clients[sym] = FakeClient()
+        return clients[sym]
+
+    daemon = MarketDataDaemon({VENUE: [symbol]}, levels=5, heartbeat_interval=60, client_factory=factory)
+    await daemon.start()
+    reader = SharedBookReader.attach(VENUE, symbol)
+    try:
+        assert reader.read().best_bid == 10.0
+
+        manager = clients[symbol.upper()].ws_manager
+        manager.book["bids"][0]["price"] = Decimal("10.5")
+        await manager._notify_bbo_update(BBOData(symbol="VENUE-SYM", bid=Decimal("10.5"), ask=Decimal("11"), timestamp=time.time(), sequence=3))
+
+        frame = reader.read()
+        assert (frame.best_bid, frame.sequence) == (10.5, 3)
+        assert reader.feed_symbol == "VENUE-SYM"
+    finally:
+        reader.close()
+        await daemon.stop()
+
+    assert not clients[symbol.upper()].connected
+    with pytest.raises(SharedBookError):
+        SharedBookReader.attach(VENUE, symbol)
+
+
+@pytest.mark.asyncio
+async def test_daemon_heartbeat_lets_a_stalled_source_go_stale(symbol):
+    client = FakeClient()
+    stalled_at = time.time() - DEFAULT_MAX_AGE_SECONDS - 5
+    client.ws_manager.order_book = SimpleNamespace(last_update_timestamp=stalled_at)
+
+    daemon = MarketDataDaemon({VENUE: [symbol]}, levels=5, heartbeat_interval=0.005, client_factory=lambda *_: client)
+    await daemon.start()
+    adapter = SharedBookWebSocketManager(VENUE, poll_interval=0.001)
+    await adapter.prepare_market_feed(symbol.lower(), timeout=0.05)
+    reader = SharedBookReader.attach(VENUE, symbol)
+    try:
+        await asyncio.sleep(0.05)
+        # Heartbeats neither republish nor refresh the frozen book
+        assert reader.read().timestamp == stalled_at
+        assert daemon.stats()[f"{VENUE}:{symbol.upper()}"] == 1
+        assert not adapter.is_live() and adapter.best_bid is None
+
+        # The venue book updates again (depth only, no BBO): the heartbeat carries it
+        client.ws_manager.order_book.last_update_timestamp = time.time()
+        for _ in range(200):
+            if adapter.is_live():
+                break
+            await asyncio.sleep(0.005)
+        assert adapter.best_bid == 10.0
+        assert reader.read().timestamp == client.ws_manager.order_book.last_update_timestamp
+    finally:
+        reader.close()
+        await adapter.disconnect()
+        await daemon.stop()
+
+
+@pytest.mark.asyncio
+async def test_daemon_keeps_a_quiet_connected_feed_live(symbol):
+    client = FakeClient()
+    client.ws_manager.running = True
+    quiet_since = time.time() - DEFAULT_MAX_AGE_SECONDS - 5
+    client.ws_manager.order_book = SimpleNamespace(last_update_timestamp=quiet_since)
+
+    daemon = MarketDataDaemon({VENUE: [symbol]}, levels=5, heartbeat_interval=0.005, client_factory=lambda *_: client)
+    await daemon.start()
+    adapter = SharedBookWebSocketManager(VENUE, poll_interval=0.001)
+    await adapter.prepare_market_feed(symbol.lower(), timeout=0.05)
+    reader = SharedBookReader.attach(VENUE, symbol)
+    try:
+        # Connected socket, unchanged book: live, but the frame keeps the book's own time
+        assert adapter.is_live() and adapter.best_bid == 10.0
+        assert reader.read().timestamp == quiet_since
+        assert daemon.stats()[f"{VENUE}:{symbol.upper()}"] == 1
+
+        # Socket drops: the heartbeat stops confirming the ring
+        client.ws_manager.running = False
+        await asyncio.sleep(0.02)
+        alive_at = reader.alive_at
+        await asyncio.sleep(0.05)
+        assert reader.alive_at == alive_at
+    finally:
+        reader.close()
+        await adapter.disconnect()
+        await daemon.stop()
+
+
+class SharedBookClient(BaseExchangeClient):
+    """Exchange client stub that reads public books from the shared rings."""
+
+    def __init__(self):
+        super().__init__(SimpleNamespace(ticker="ALL"))
+        self.use_shared_market_data = True
+        self.ws_manager = RecordingManager()
+
+    def _validate_config(self):
+        pass
+
+    def get_exchange_name(self):
+        return VENUE
+
+
+SharedBookClient.__abstractmethods__ = frozenset()
+
+
+@pytest.mark.asyncio
+async def test_stale_ring_hands_the_public_feed_back_to_the_venue_manager(writer, symbol):
+    writer.publish([(100.0, 1.0)], [(100.5, 1.0)])
+    client = SharedBookClient()
+    manager = client.ws_manager
+    try:
+        await client.ensure_market_feed(symbol)
+        assert not manager.public_book_feed
+        assert client.shared_bbo() == (Decimal("100.0"), Decimal("100.5"))
+
+        # Daemon stops confirming the feed: the next read falls back and resumes the venue feed
+        writer.mark_alive(time.time() - 60)
+        assert client.shared_bbo() is None
+        await client._public_feed_resume
+        assert manager.public_book_feed
+        assert manager.prepared[-1] == (symbol.upper(), True)
+    finally:
+        await client.close_shared_book()
@@ -0,0 +1,147 @@
+"""
+Tests for the simulated exchange venue (matching engine, client, websocket callbacks).
+"""
+
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from exchange_clients.factory import ExchangeFactory
+from exchange_clients.sim import SimClient, SimMatchingEngine, SimVenueConfig
+from exchange_clients.sim.client import NONCE_ERROR_MESSAGE
+from strategies.execution.core.execution_types import ExecutionMode
+from strategies.execution.core.order_executor import OrderExecutor
+
+
+def _make_config(**overrides):
+    params = {
+        "ticker": "BTC",
+        "contract_id": "",
+        "tick_size": Decimal("0.01"),
+        "sim_seed": 7,
+        "sim_default_mid_price": "100",
+        "sim_volatility_ticks": 0.0,
+    }
+    params.update(overrides)
+    return SimpleNamespace(**params)
+
+
+@pytest.fixture
+def engine():
+    return SimMatchingEngine(SimVenueConfig(seed=7, book_levels=5, level_size=Decimal("1"), volatility_ticks=0.0))
+
+
+def test_price_time_priority_and_partial_fill(engine):
+    engine.ensure_symbol("ETH")
+    best_bid, best_ask = engine.get_bbo("ETH")
+    assert (best_bid, best_ask) == (9999, 10001)
+
+    # Two resting asks inside the ladder at the same price: first in, first filled
+    first = engine.submit_limit("alice", "ETH", "sell", 10000, 600)
+    second = engine.submit_limit("bob", "ETH", "sell", 10000, 600)
+    taker = engine.submit_limit("carol", "ETH", "buy", 10000, 800, post_only=False)
+
+    assert taker.status == "FILLED"
+    assert first.status == "FILLED"
+    assert second.status == "PARTIALLY_FILLED"
+    assert second.filled_lots == 200
+    assert engine.get_position("carol", "ETH")[0] == 800
+    assert engine.get_position("bob", "ETH")[0] == -200
+
+
+def test_post_only_cross_is_rejected(engine):
+    engine.ensure_symbol("ETH")
+    order = engine.submit_limit("alice", "ETH", "buy", 10001, 100, post_only=True)
+    assert order.status == "REJECTED"
+    assert order.cancel_reason == "post_only_violation"
+
+
+def test_advance_market_fills_resting_orders_as_maker(engine):
+    engine.ensure_symbol("ETH")
+    order = engine.submit_limit("alice", "ETH", "buy", 10000, 5000)
+    engine.advance_market("ETH")
+    assert order.filled_lots > 0
+    assert engine.get_fills("alice")[0].is_maker is True
+
+
+@pytest.mark.asyncio
+async def test_factory_creates_sim_client_and_streams_fills():
+    SimMatchingEngine.reset_shared("sim")
+    client = ExchangeFactory.create_exchange("sim", _make_config(), {"account_id": "acct-1"})
+    assert isinstance(client, SimClient)
+    await client.connect()
+
+    fills = []
+    statuses = []
+
+    async def on_fill(order_id, price, qty, sequence):
+        fills.append((order_id, price, qty))
+
+    async def on_status(order_id, status, filled, price):
+        statuses.append((order_id, status))
+
+    client.order_fill_callback = on_fill
+    client.order_status_callback = on_status
+
+    contract_id, tick = await client.get_contract_attributes()
+    assert contract_id == "BTC-SIM"
+    bid, ask = await client.fetch_bbo_prices(contract_id)
+    assert ask > bid
+
+    result = await client.place_limit_order(contract_id, Decimal("0.5"), bid + tick, "buy")
+    assert result.success and result.status == "OPEN"
+
+    # Taker flow fills the resting bid over a few steps (partial fills along the way)
+    for _ in range(50):
+        client.engine.advance_market("BTC")
+        info = await client.await_order_update(result.order_id, timeout=1.0)
+        if info is not None and info.status == "FILLED":
+            break
+    assert info is not None and info.status == "FILLED"
+    await asyncio.sleep(0)
+    assert sum(qty for _, _, qty in fills) == Decimal("0.5")
+    assert (result.order_id, "FILLED") in statuses
+    assert await client.get_account_positions() == Decimal("0.5")
+
+    trades = await client.get_user_trade_history("BTC", 0, float("inf"), order_id=result.order_id)
+    assert sum(t.quantity for t in trades) == Decimal("0.5")
+    await client.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_nonce_errors_and_post_only_rejections_surface_as_failures():
+    SimMatchingEngine.reset_shared("sim")
+    client = SimClient(_make_config(sim_nonce_error_rate=1.0))
+    result = await client.place_limit_order("BTC-SIM", Decimal("1"), Decimal("100"), "buy")
+    assert not result.success
+    assert result.error_message == NONCE_ERROR_MESSAGE
+
+    client.venue_config.nonce_error_rate = 0.0
+    _, ask = await client.fetch_bbo_prices("BTC-SIM")
+    result = await client.place_limit_order("BTC-SIM", Decimal("1"), ask, "buy")
+    assert not result.success
+    assert "post_only_violation" in result.error_message
+
+
+@pytest.mark.asyncio
+async def test_aggressive_limit_executor_fills_against_sim_venue():
+    SimMatchingEngine.reset_shared("sim")
+    client = SimClient(_make_config(sim_market_step_interval=0.01, sim_taker_size="2"))
+    await client.connect()
+    await client.get_contract_attributes()
+
+    executor = OrderExecutor()
+    result = await executor.execute_order(
+        exchange_client=client,
+        symbol="BTC",
+        side="buy",
+        quantity=Decimal("1"),
+        mode=ExecutionMode.AGGRESSIVE_LIMIT,
+        total_timeout_seconds=5.0,
+    )
+    await client.disconnect()
+
+    assert result.success
+    assert result.filled_quantity == Decimal("1")
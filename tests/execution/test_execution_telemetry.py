@@ -0,0 +1,141 @@
+"""
+Tests for per-order execution telemetry records and their aggregation.
+"""
+
+import time
+from decimal import Decimal
+
+import pytest
+
+from strategies.execution.core import order_executor as order_executor_module
+from strategies.execution.core.execution_telemetry import (
+    ExecutionRecord,
+    ExecutionTelemetry,
+    load_records,
+    percentile,
+    summarize,
+)
+from strategies.execution.core.execution_types import ExecutionMode, ExecutionResult
+from strategies.execution.core.fill_ledger import fill_ledger
+from strategies.execution.core.order_executor import OrderExecutor
+
+
+class BboClient:
+    def __init__(self):
+        self.bbo_calls = 0
+
+    def get_exchange_name(self):
+        return "lighter"
+
+    async def fetch_bbo_prices(self, symbol):
+        self.bbo_calls += 1
+        return Decimal("99.9"), Decimal("100.1")
+
+
+class FillingMarketStrategy:
+    """Market strategy stub that reports two websocket fills into the ledger."""
+
+    async def execute(self, **kwargs):
+        now = time.time()
+        fill_ledger.record_fill("lighter", "order-1", Decimal("100.1"), Decimal("0.5"), timestamp=now + 0.02)
+        fill_ledger.record_fill("lighter", "order-1", Decimal("100.3"), Decimal("0.5"), timestamp=now + 0.05)
+        return ExecutionResult(
+            success=True,
+            filled=True,
+            fill_price=Decimal("100.2"),
+            filled_quantity=Decimal("1"),
+            execution_mode_used="market",
+            order_id="order-1",
+            send_bbo=(Decimal("99.9"), Decimal("100.1")),
+        )
+
+
+@pytest.fixture
+def telemetry(tmp_path, monkeypatch):
+    store = ExecutionTelemetry(directory=tmp_path, enabled=True)
+    monkeypatch.setattr(order_executor_module, "execution_telemetry", store)
+    yield store
+    fill_ledger.discard("lighter", ["order-1"])
+
+
+@pytest.mark.asyncio
+async def test_order_executor_emits_record_with_bbo_fill_times_and_slippage(telemetry, tmp_path):
+    executor = OrderExecutor()
+    executor.market_strategy = FillingMarketStrategy()
+    client = BboClient()
+
+    result = await executor.execute_order(
+        exchange_client=client,
+        symbol="btc",
+        side="buy",
+        quantity=Decimal("1"),
+        mode=ExecutionMode.MARKET_ONLY,
+        telemetry_source="atomic_multi_order",
+    )
+    await telemetry.drain()
+
+    assert result.success
+    (record,) = list(load_records(tmp_path))
+    assert (record.venue, record.symbol, record.mode, record.source) == ("lighter", "BTC", "market_only", "atomic_multi_order")
+    # The BBO comes from the executor's pricing, not a second fetch
+    assert (record.bid, record.ask, record.intended_price) == (99.9, 100.1, 100.1)
+    assert client.bbo_calls == 0
+    assert record.fill_price == 100.2
+    assert 0 < record.time_to_first_fill_ms <= record.time_to_full_fill_ms
+    assert record.slippage_bps == pytest.approx(9.99, abs=0.01)
+    assert record.arrival_slippage_bps == pytest.approx(20.0, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_telemetry_source_none_records_nothing(telemetry):
+    executor = OrderExecutor()
+    executor.market_strategy = FillingMarketStrategy()
+
+    await executor.execute_order(
+        exchange_client=BboClient(),
+        symbol="BTC",
+        side="buy",
+        quantity=Decimal("1"),
+        mode=ExecutionMode.MARKET_ONLY,
+        telemetry_source=None,
+    )
+    await telemetry.drain()
+
+    assert len(telemetry) == 0 and not list(telemetry.directory.glob("*.jsonl"))
+
+
+@pytest.mark.asyncio
+async def test_drain_writes_the_buffer_and_stops_the_flush_loop(tmp_path):
+    store = ExecutionTelemetry(directory=tmp_path, enabled=True, flush_interval_seconds=60)
+    store.record(ExecutionRecord(
+        ts=time.time(), venue="aster", symbol="BTC", side="sell", mode="limit_only", mode_used="limit",
+        source="order_executor", success=True, filled=True,
+    ))
+    flush_task = store._flush_task
+    assert flush_task is not None and not flush_task.done()
+
+    await store.drain()
+
+    assert flush_task.done() and store._flush_task is None
+    assert len(store) == 0 and len(list(load_records(tmp_path))) == 1
+
+
+def test_summarize_reports_per_venue_percentiles():
+    def record(venue, full_ms, slippage, filled=True):
+        return ExecutionRecord(
+            ts=0.0, venue=venue, symbol="BTC", side="buy", mode="market_only", mode_used="market",
+            source="order_executor", success=filled, filled=filled,
+            time_to_full_fill_ms=full_ms, slippage_bps=slippage,
+        )
+
+    rows = summarize(
+        [record("aster", 100, 1.0), record("aster", 300, 3.0), record("aster", None, None, filled=False),
+         record("lighter", 50, -0.5)]
+    )
+
+    assert [row["venue"] for row in rows] == ["aster", "lighter"]
+    aster = rows[0]
+    assert aster["orders"] == 3 and aster["fill_rate"] == pytest.approx(2 / 3)
+    assert aster["time_to_full_fill_ms"]["p50"] == 200
+    assert aster["slippage_bps"]["count"] == 2
+    assert percentile([1, 2, 3, 4], 90) == pytest.approx(3.7)
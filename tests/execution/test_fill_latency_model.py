@@ -0,0 +1,76 @@
+"""
+Tests for the online fill-latency model and adaptive aggressive limit execution.
+"""
+
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from exchange_clients.sim import SimClient, SimMatchingEngine
+from strategies.execution.core.execution_components.fill_model import FillLatencyModel
+from strategies.execution.core.execution_strategies.aggressive_limit import AggressiveLimitExecutionStrategy
+
+
+def test_plan_uses_most_passive_level_that_fits_the_budget():
+    model = FillLatencyModel()
+
+    # Priors: -2 fills at 0.1/s, -1 at 0.3/s, 0 at 1/s, +1 at 3/s; P=0.8 needs rate*w >= 1.61
+    assert model.plan("lighter", "BTC", remaining_budget_seconds=30).level == -2
+    assert model.plan("lighter", "BTC", remaining_budget_seconds=3).level == 0
+    tight = model.plan("lighter", "BTC", remaining_budget_seconds=0.2)
+    assert tight.level == 1 and tight.wait_seconds == pytest.approx(0.25)
+
+    relaxed = model.plan("lighter", "BTC", remaining_budget_seconds=30, min_level=0)
+    assert relaxed.level == 0 and relaxed.fill_probability >= 0.8
+
+
+def test_observations_move_rates_and_rejections_skip_levels():
+    model = FillLatencyModel()
+    for _ in range(10):
+        model.observe("aster", "ETH", -1, waited_seconds=0.2, filled=True)
+        model.observe("aster", "ETH", 0, waited_seconds=0.0, filled=False)
+        model.observe_rejection("aster", "ETH", 0)
+
+    assert model.stats("aster", "ETH", -1).rate > 2  # prior 0.3
+    # Other markets keep their priors
+    assert model.stats("aster", "BTC", -1).rate == pytest.approx(0.3)
+    plan = model.plan("aster", "ETH", remaining_budget_seconds=1, min_level=0)
+    assert plan.level == 1
+
+
+def test_level_for_price_is_relative_to_opposite_touch():
+    level = FillLatencyModel.level_for_price
+    tick = Decimal("0.01")
+    assert level("buy", Decimal("100.00"), Decimal("99.98"), Decimal("100.00"), tick) == 0
+    assert level("buy", Decimal("99.99"), Decimal("99.98"), Decimal("100.00"), tick) == -1
+    assert level("sell", Decimal("99.97"), Decimal("99.98"), Decimal("100.00"), tick) == 1
+
+
+@pytest.mark.asyncio
+async def test_adaptive_execution_fills_against_sim_venue_and_learns():
+    SimMatchingEngine.reset_shared("sim")
+    client = SimClient(SimpleNamespace(
+        ticker="BTC", contract_id="", tick_size=Decimal("0.01"), sim_seed=7,
+        sim_default_mid_price="100", sim_volatility_ticks=0.0,
+        sim_market_step_interval=0.01, sim_taker_size="2",
+    ))
+    await client.connect()
+    await client.get_contract_attributes()
+    model = FillLatencyModel()
+    strategy = AggressiveLimitExecutionStrategy(fill_model=model)
+
+    result = await strategy.execute(
+        exchange_client=client,
+        symbol="BTC",
+        side="buy",
+        quantity=Decimal("1"),
+        total_timeout_seconds=5.0,
+        target_fill_latency_seconds=2.0,
+    )
+    await client.disconnect()
+
+    assert result.success and result.filled_quantity == Decimal("1")
+    assert "fallback" not in result.execution_mode_used
+    observed = [key for key in model._stats if key[:2] == ("sim", "BTC")]
+    assert observed
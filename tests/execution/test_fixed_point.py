@@ -0,0 +1,144 @@
+"""
+Tests for integer tick/lot arithmetic and the tick-based pricing built on it.
+"""
+
+from decimal import ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_UP, ROUND_UP, Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from strategies.execution.core.execution_components.pricer import AggressiveLimitPricer
+from strategies.execution.core.fixed_point import MarketScale, div_round
+from strategies.execution.core.position_sizer import PositionSizer
+from strategies.execution.core.price_alignment import BreakEvenPriceAligner
+
+
+@pytest.mark.parametrize(
+    "rounding, expected",
+    [(ROUND_FLOOR, -3), (ROUND_CEILING, -2), (ROUND_HALF_UP, -3), (ROUND_DOWN, -2), (ROUND_UP, -3)],
+)
+def test_div_round_modes(rounding, expected):
+    assert div_round(-5, 2, rounding) == expected
+
+
+def test_prices_round_to_true_multiples_of_tick():
+    scale = MarketScale.of(Decimal("0.5"), Decimal("0.001"))
+    assert scale is MarketScale.of(Decimal("0.5"), Decimal("0.001"))
+
+    # quantize() would keep 100.3 (same exponent as the tick); the grid does not
+    assert scale.round_price(Decimal("100.3")) == Decimal("100.5")
+    assert scale.round_price(Decimal("100.2")) == Decimal("100.0")
+    assert scale.to_ticks(Decimal("100.3"), ROUND_FLOOR) == 200
+
+    # Float book prices snap onto the grid instead of drifting a tick
+    cents = MarketScale.of(Decimal("0.01"))
+    assert cents.to_ticks(0.1 + 0.2) == 30
+    assert cents.to_ticks(100.05, ROUND_FLOOR) == 10005
+
+    assert scale.to_lots(Decimal("0.0199")) == 19
+    assert scale.round_quantity(Decimal("0.0191"), ROUND_UP) == Decimal("0.020")
+
+
+def test_break_even_hedge_ticks_and_fallbacks():
+    scale = MarketScale.of(Decimal("0.01"))
+
+    ticks, strategy = BreakEvenPriceAligner.break_even_hedge_ticks(
+        scale=scale,
+        trigger_fill_price=Decimal("100.00"),
+        trigger_side="buy",
+        bid_ticks=9998,
+        ask_ticks=10000,
+        hedge_side="sell",
+    )
+    # floor(100.00 * 0.9999) on the cent grid
+    assert (ticks, strategy) == (9999, "break_even")
+
+    # Break-even below the hedge bid is not fillable as a maker sell
+    ticks, strategy = BreakEvenPriceAligner.break_even_hedge_ticks(
+        scale=scale,
+        trigger_fill_price=Decimal("100.00"),
+        trigger_side="buy",
+        bid_ticks=10005,
+        ask_ticks=10006,
+        hedge_side="sell",
+    )
+    assert (ticks, strategy) == (10006, "bbo_fallback")
+
+    price, strategy = BreakEvenPriceAligner.calculate_break_even_hedge_price(
+        trigger_fill_price=Decimal("100.00"),
+        trigger_side="buy",
+        hedge_bid=Decimal("99.98"),
+        hedge_ask=Decimal("100.00"),
+        hedge_side="sell",
+        tick_size=Decimal("0.01"),
+    )
+    assert (price, strategy) == (Decimal("99.99"), "break_even")
+
+
+class GridClient:
+    def __init__(self, tick_size, step_size=None):
+        self.config = SimpleNamespace(tick_size=tick_size, step_size=step_size, contract_id="BTC")
+
+    def get_exchange_name(self):
+        return "test"
+
+    def round_to_tick(self, price):  # pragma: no cover - only used without a tick grid
+        raise AssertionError("venue grid prices should not be re-rounded")
+
+
+class FixedPriceProvider:
+    def __init__(self, bid, ask):
+        self.bbo = (bid, ask)
+
+    async def get_bbo_prices(self, exchange_client, symbol):
+        return self.bbo
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "side, retry_count, expected",
+    [("buy", 0, "101.0"), ("buy", 1, "100.5"), ("buy", 9, "101.5"), ("sell", 9, "99.5")],
+)
+async def test_aggressive_limit_pricer_stays_on_tick_grid(side, retry_count, expected):
+    pricer = AggressiveLimitPricer(price_provider=FixedPriceProvider(Decimal("100.0"), Decimal("101.0")))
+    result = await pricer.calculate_aggressive_limit_price(
+        GridClient(Decimal("0.5")), "BTC", side, retry_count=retry_count, inside_tick_retries=3
+    )
+    assert result.limit_price == Decimal(expected)
+
+
+def test_position_sizer_rounds_to_step_size():
+    sizer = PositionSizer()
+    client = GridClient(Decimal("0.01"), Decimal("0.5"))
+    assert sizer._round_to_precision(Decimal("3.7"), client, "BTC", round_down=True) == Decimal("3.5")
+    assert sizer._round_to_precision(Decimal("3.7"), client, "BTC", round_down=False) == Decimal("4.0")
+
+
+class MultiContractClient(GridClient):
+    """Funding-arb client whose config holds the last contract it loaded."""
+
+    def get_quantity_precision(self, symbol):
+        return {"BTC": 3, "ETH": 2}[symbol]
+
+
+def test_position_sizer_uses_step_size_only_for_the_loaded_contract():
+    sizer = PositionSizer()
+    client = MultiContractClient(Decimal("0.01"), Decimal("0.5"))
+    assert sizer._round_to_precision(Decimal("3.789"), client, "btc", round_down=True) == Decimal("3.5")
+    # ETH is not the loaded contract: its own precision applies, not BTC's step
+    assert sizer._round_to_precision(Decimal("3.789"), client, "ETH", round_down=True) == Decimal("3.78")
+
+
+class NoTickClient(GridClient):
+    def round_to_tick(self, price):
+        return price
+
+
+@pytest.mark.asyncio
+async def test_price_derived_fallback_scale_is_not_cached():
+    pricer = AggressiveLimitPricer(price_provider=FixedPriceProvider(Decimal("100.0"), Decimal("101.37")))
+    before = MarketScale.of.cache_info().currsize
+    await pricer.calculate_aggressive_limit_price(
+        NoTickClient(None), "BTC", "buy", retry_count=0, inside_tick_retries=3
+    )
+    assert MarketScale.of.cache_info().currsize == before
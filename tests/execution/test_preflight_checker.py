@@ -0,0 +1,113 @@
+"""
+Tests for concurrent pre-flight checks in PreFlightChecker.
+"""
+
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from strategies.execution.core.leverage_validator import LeverageValidator
+from strategies.execution.patterns.atomic_multi_order.components import preflight_checker as preflight_module
+from strategies.execution.patterns.atomic_multi_order.components.preflight_checker import PreFlightChecker
+
+VENUE_DELAY = 0.05
+
+
+class VenueClient:
+    """Exchange client stub where every venue call takes VENUE_DELAY."""
+
+    def __init__(self, name, balance):
+        self.name = name
+        self.balance = balance
+        self.balance_calls = 0
+
+    def get_exchange_name(self):
+        return self.name
+
+    async def get_account_balance(self):
+        self.balance_calls += 1
+        await asyncio.sleep(VENUE_DELAY)
+        return self.balance
+
+    async def get_leverage_info(self, symbol):
+        await asyncio.sleep(VENUE_DELAY)
+        return {"max_leverage": Decimal("10"), "margin_requirement": Decimal("0.1")}
+
+    async def set_account_leverage(self, symbol, leverage):
+        await asyncio.sleep(VENUE_DELAY)
+        return True
+
+    async def get_position_snapshot(self, symbol):
+        await asyncio.sleep(VENUE_DELAY)
+        return None
+
+    def get_min_order_notional(self, symbol):
+        return None
+
+
+class InstantLiquidityAnalyzer:
+    def __init__(self, **kwargs):
+        pass
+
+    async def check_execution_feasibility(self, **kwargs):
+        await asyncio.sleep(VENUE_DELAY)
+        return SimpleNamespace(recommendation="ok")
+
+    def is_execution_acceptable(self, report):
+        return True
+
+
+@pytest.fixture(autouse=True)
+def stub_liquidity(monkeypatch):
+    monkeypatch.setattr(preflight_module, "LiquidityAnalyzer", InstantLiquidityAnalyzer)
+
+
+def _orders(*clients):
+    return [
+        SimpleNamespace(exchange_client=client, symbol="BTC", side=side, size_usd=Decimal("100"))
+        for client, side in zip(clients, ("buy", "sell"))
+    ]
+
+
+async def _check(checker, orders, margin_error_notified=None):
+    return await checker.check(
+        orders,
+        skip_leverage_check=False,
+        stage_prefix=None,
+        normalized_leverage={},
+        margin_error_notified={} if margin_error_notified is None else margin_error_notified,
+        min_liquidation_distance_pct=Decimal("0.1"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_two_leg_preflight_runs_venues_concurrently_and_fetches_balance_once():
+    long_client, short_client = VenueClient("lighter", Decimal("1000")), VenueClient("aster", Decimal("1000"))
+    checker = PreFlightChecker(leverage_validator=LeverageValidator())
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    ok, error = await _check(checker, _orders(long_client, short_client))
+    elapsed = loop.time() - started
+
+    assert (ok, error) == (True, None)
+    assert long_client.balance_calls == 1 and short_client.balance_calls == 1
+    # Sequentially this is 10+ venue round trips; concurrently leverage info
+    # then set-leverage are the only dependent steps
+    assert elapsed < VENUE_DELAY * 4
+
+
+@pytest.mark.asyncio
+async def test_insufficient_balance_still_fails_and_records_notification():
+    long_client, short_client = VenueClient("lighter", Decimal("1000")), VenueClient("aster", Decimal("10.2"))
+    checker = PreFlightChecker(leverage_validator=LeverageValidator())
+    notified = {}
+
+    ok, error = await _check(checker, _orders(long_client, short_client), notified)
+
+    assert not ok
+    # 10.2 passes the leverage cap (10x) but not the 5% margin buffer
+    assert error.startswith("Insufficient balance on aster")
+    assert notified == {("aster", "BTC"): True}
@@ -0,0 +1,147 @@
+from types import SimpleNamespace
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from networking.models import ProxyAssignment, ProxyEndpoint
+from networking.selector import ProxySelector
+from networking.session_proxy import SessionProxyManager
+from networking.transport import ProxyTransport
+
+
+def build_selector(*endpoints: str) -> ProxySelector:
+    assignments = []
+    for index, endpoint in enumerate(endpoints):
+        proxy = ProxyEndpoint(
+            id=f"proxy-{index}",
+            label=f"proxy-{index}",
+            endpoint=endpoint,
+            auth_type="basic",
+            username="alice",
+            password="secret",
+        )
+        assignments.append(ProxyAssignment(id=f"assign-{index}", account_id="acc", proxy=proxy, priority=index, status="active"))
+    return ProxySelector(assignments)
+
+
+def test_rotation_moves_only_the_failing_transport():
+    selector = build_selector("http://10.0.0.1:8080", "http://10.0.0.2:8080")
+    failing = ProxyTransport(selector, name="acc/aster", failure_threshold=3, rotate_cooldown=0)
+    healthy = ProxyTransport(selector, name="acc/lighter", failure_threshold=3, rotate_cooldown=0)
+    sdk_client = SimpleNamespace(configuration=SimpleNamespace(), rest_client=SimpleNamespace())
+    failing.bind_openapi_client(sdk_client)
+
+    assert failing.request_kwargs()["proxy"] == "http://10.0.0.1:8080"
+    assert failing.request_kwargs()["proxy_auth"] == aiohttp.BasicAuth("alice", "secret")
+
+    for _ in range(2):
+        failing.record_failure(ConnectionResetError("reset by peer"))
+    assert failing.proxy.id == "proxy-0" and failing.health.consecutive_failures == 2
+
+    failing.record_failure(ConnectionResetError("reset by peer"))
+    assert failing.proxy.id == "proxy-1"
+    assert failing.rotations == 1 and failing.health.failures == 0
+    assert sdk_client.rest_client.proxy == "http://10.0.0.2:8080"
+    assert sdk_client.configuration.proxy_headers["Proxy-Authorization"].startswith("Basic ")
+
+    # The other client of the account and the account's selector stay put
+    assert healthy.proxy.id == "proxy-0" and healthy.rotations == 0
+    assert selector.current_proxy().id == "proxy-0"
+
+
+def test_score_and_cooldown_gate_rotation():
+    selector = build_selector("http://10.0.0.1:8080", "http://10.0.0.2:8080")
+    transport = ProxyTransport(selector, failure_threshold=100, min_score=0.5, rotate_cooldown=3600)
+
+    # Intermittent failures: never consecutive enough, but the score sinks
+    for _ in range(6):
+        transport.record_success(0.05)
+        transport.record_failure(TimeoutError("read timed out"))
+        transport.record_failure(TimeoutError("read timed out"))
+    assert transport.rotations == 1 and transport.proxy.id == "proxy-1"
+
+    for _ in range(20):
+        transport.record_failure(TimeoutError("read timed out"))
+    assert transport.rotations == 1  # still cooling down
+
+
+def test_session_proxy_takes_precedence():
+    transport = ProxyTransport(build_selector("socks5://10.0.0.1:1080"))
+    assert transport.owns_proxy and transport.request_kwargs() == {}
+
+    session_proxy = ProxyEndpoint(id="session", label="session", endpoint="http://10.9.9.9:3128", auth_type="none")
+    SessionProxyManager.enable(session_proxy)
+    try:
+        assert not transport.owns_proxy
+        assert transport.request_kwargs() == {"proxy": "http://10.9.9.9:3128"}
+        assert transport.rotate() is None
+    finally:
+        SessionProxyManager.disable()
+
+
+async def test_requests_reuse_the_pool_and_feed_health():
+    async def handle(_request):
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_get("/ping", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    transport = ProxyTransport(name="direct")
+    try:
+        for _ in range(2):
+            async with transport.request("GET", f"http://127.0.0.1:{port}/ping") as response:
+                assert (await response.json()) == {"ok": True}
+        session = await transport.session()
+        assert session.connector.limit == transport.pool_limit
+        assert transport.health.successes == 2 and transport.health.latency is not None
+    finally:
+        await runner.cleanup()
+
+    with pytest.raises(aiohttp.ClientConnectionError):
+        async with transport.request("GET", f"http://127.0.0.1:{port}/ping"):
+            pass
+    assert transport.health.failures == 1
+    assert transport.rotate() is None  # direct transports never rotate
+
+    await transport.close()
+    assert session.closed
+
+
+async def test_only_the_connect_and_header_phase_feeds_health():
+    async def handle(request):
+        return web.Response(status=int(request.match_info["status"]))
+
+    app = web.Application()
+    app.router.add_get("/status/{status}", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    transport = ProxyTransport(name="direct")
+    try:
+        # An error in the caller's body is not the route's fault
+        with pytest.raises(ValueError):
+            async with transport.request("GET", f"http://127.0.0.1:{port}/status/200"):
+                raise ValueError("bad payload")
+        assert (transport.health.successes, transport.health.failures) == (1, 0)
+
+        async with transport.request("GET", f"http://127.0.0.1:{port}/status/404") as response:
+            assert response.status == 404
+        assert (transport.health.successes, transport.health.failures) == (2, 0)
+
+        for status in (407, 502):
+            async with transport.request("GET", f"http://127.0.0.1:{port}/status/{status}") as response:
+                assert response.status == status
+        assert (transport.health.successes, transport.health.failures) == (2, 2)
+        assert transport.health.last_error.startswith("ClientResponseError: 502")
+    finally:
+        await transport.close()
+        await runner.cleanup()
@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+
+from strategies.implementations.funding_arbitrage.backtest import (
+    BacktestParams,
+    FundingRateCube,
+    compute_pair_signals,
+    expand_grid,
+    forward_fill,
+    run_backtest,
+    run_sweep,
+)
+
+ZERO_FEES = (np.zeros(3), np.zeros(3))
+
+
+def _cube(rates):
+    """Hourly cube over dexes (aster, lighter, paradex) and a single BTC symbol."""
+    rates = np.asarray(rates, dtype=float)[:, :, None]
+    return FundingRateCube(
+        timestamps=np.arange(rates.shape[0], dtype=np.int64) * 3600,
+        dexes=["aster", "lighter", "paradex"],
+        symbols=["BTC"],
+        rates=rates,
+        open_interest_usd=np.full(rates.shape, 1e7),
+        volume_24h=np.full(rates.shape, 1e7),
+        bucket_seconds=3600,
+    )
+
+
+def test_from_rows_builds_dense_cube_and_fills_gaps():
+    rows = [
+        {"bucket": 0, "dex_name": "Lighter", "symbol": "btc", "funding_rate": 0.001},
+        {"bucket": 0, "dex_name": "aster", "symbol": "BTC", "funding_rate": 0.002},
+        {"bucket": 7200, "dex_name": "aster", "symbol": "BTC", "funding_rate": 0.003},
+    ]
+    cube = FundingRateCube.from_rows(rows, bucket_seconds=3600)
+
+    assert cube.dexes == ["aster", "lighter"]
+    assert cube.shape == (3, 2, 1)
+    assert cube.rates[:, 0, 0].tolist() == [0.002, 0.002, 0.003]
+    assert cube.rates[:, 1, 0].tolist() == [0.001, 0.001, 0.001]
+
+
+def test_forward_fill_respects_limit():
+    values = np.array([1.0, np.nan, np.nan, np.nan, 5.0])
+    filled = forward_fill(values, limit=1)
+    assert filled[:2].tolist() == [1.0, 1.0]
+    assert np.isnan(filled[2]) and np.isnan(filled[3])
+    assert filled[4] == 5.0
+
+
+def test_signals_pick_best_pair_net_of_fees():
+    cube = _cube([[0.0001, 0.0010, 0.0030]])
+    fees = (np.array([0.0, 0.0, 0.0005]), np.zeros(3))
+
+    signals = compute_pair_signals(cube, BacktestParams(), fees)
+
+    # aster/paradex: 0.0029 - 2 * 0.0005; aster/lighter: 0.0009 with no fees
+    assert cube.dexes[signals.best_long[0, 0]] == "aster"
+    assert cube.dexes[signals.best_short[0, 0]] == "paradex"
+    assert signals.best_net[0, 0] == pytest.approx(0.0019)
+
+
+def test_required_dex_restricts_pairs():
+    cube = _cube([[0.0001, 0.0010, 0.0030]])
+    signals = compute_pair_signals(cube, BacktestParams(required_dex="lighter"), ZERO_FEES)
+    assert "lighter" in (cube.dexes[signals.best_long[0, 0]], cube.dexes[signals.best_short[0, 0]])
+
+
+def test_divergence_flip_closes_position_and_accrues_funding():
+    # Enter at 0.002 divergence, hold two hours, then the spread flips
+    cube = _cube([
+        [0.0, 0.0020, np.nan],
+        [0.0, 0.0020, np.nan],
+        [0.0, 0.0020, np.nan],
+        [0.0, -0.0010, np.nan],
+    ])
+    params = BacktestParams(min_profit=0.001, position_size_usd=1000.0)
+
+    result = run_backtest(cube, params, fee_rates=ZERO_FEES)
+
+    assert result.summary["trades"] == 1
+    assert result.summary["exit_reasons"] == {"DIVERGENCE_FLIPPED": 1}
+    assert result.holding_hours[0] == 3.0
+    # 3 hours at 0.002 per 8h interval on $1000
+    assert result.funding_pnl_usd[0] == pytest.approx(1000 * 0.002 * 3 / 8)
+
+
+def test_time_limit_exit_and_min_hold_gate():
+    cube = _cube([[0.0, 0.0020, np.nan]] * 6)
+    params = BacktestParams(min_profit=0.001, max_position_age_hours=2.0, max_new_positions_per_cycle=1)
+
+    result = run_backtest(cube, params, fee_rates=ZERO_FEES)
+    assert result.summary["exit_reasons"].get("TIME_LIMIT", 0) >= 1
+    assert result.holding_hours[0] == 2.0
+
+    gated = run_backtest(cube, BacktestParams(min_profit=0.001, max_position_age_hours=2.0, min_hold_hours=4.0),
+                         fee_rates=ZERO_FEES)
+    assert gated.holding_hours[0] == 4.0
+
+
+def test_erosion_exit_skipped_while_still_top_opportunity():
+    # Divergence halves but the pair is still the best (and profitable) opportunity
+    cube = _cube([
+        [0.0, 0.0040, np.nan],
+        [0.0, 0.0015, np.nan],
+        [0.0, 0.0015, np.nan],
+    ])
+    params = BacktestParams(min_profit=0.001, min_erosion_ratio=0.5, severe_erosion_ratio=0.1)
+
+    held = run_backtest(cube, params, fee_rates=ZERO_FEES)
+    assert held.summary["exit_reasons"] == {"END_OF_DATA": 1}
+
+    exited = run_backtest(cube, BacktestParams(min_profit=0.001, min_erosion_ratio=0.5, severe_erosion_ratio=0.1,
+                                               hold_top_opportunity=False), fee_rates=ZERO_FEES)
+    assert exited.summary["exit_reasons"].get("PROFIT_EROSION") == 1
+    assert exited.holding_hours[0] == 1.0
+
+
+def test_sweep_matches_individual_runs_in_input_order():
+    cube = _cube([[0.0, 0.0020 + 0.0001 * (t % 5), 0.0005] for t in range(48)])
+    grid = expand_grid(BacktestParams(), {"min_profit": [0.001, 0.0025], "max_position_age_hours": [4.0, 24.0]})
+
+    results = run_sweep(cube, grid, max_workers=1, fee_rates=ZERO_FEES)
+
+    assert [r.params for r in results] == grid
+    for params, result in zip(grid, results):
+        assert result.summary["net_pnl_usd"] == pytest.approx(
+            run_backtest(cube, params, fee_rates=ZERO_FEES).summary["net_pnl_usd"]
+        )
+
+
+def test_expand_grid_rejects_unknown_parameter():
+    with pytest.raises(ValueError):
+        expand_grid(BacktestParams(), {"not_a_param": [1]})
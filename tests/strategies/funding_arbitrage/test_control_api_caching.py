@@ -0,0 +1,122 @@
+"""
+Tests for the control API controller's concurrent, cached balance and snapshot reads.
+"""
+
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from strategies.control.funding_arb_controller import FundingArbStrategyController, _TTLCache
+
+
+class SlowBalanceClient:
+    """Live exchange client stub whose balance call takes a fixed delay."""
+
+    def __init__(self, balance, delay=0.05):
+        self.balance = balance
+        self.delay = delay
+        self.calls = 0
+
+    async def get_account_balance(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.balance
+
+
+class StubCredentialLoader:
+    def __init__(self, credentials):
+        self.credentials = credentials
+
+    async def load_account_credentials(self, account_name):
+        return self.credentials
+
+
+def _controller(clients, balance_ttl=10.0):
+    strategy = SimpleNamespace(exchange_clients=clients, config=SimpleNamespace(_account_name="acct1"))
+    return FundingArbStrategyController(strategy=strategy, balance_ttl=balance_ttl)
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_coalesces_and_skips_failures():
+    cache = _TTLCache(ttl=10.0)
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    results = await asyncio.gather(*(cache.get_or_load("k", load) for _ in range(5)))
+    assert results == ["value"] * 5
+    assert await cache.get_or_load("k", load) == "value"
+    assert len(calls) == 1
+
+    async def empty():
+        calls.append(1)
+        return None
+
+    await cache.get_or_load("missing", empty)
+    await cache.get_or_load("missing", empty)
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_survives_first_caller_cancellation():
+    cache = _TTLCache(ttl=10.0)
+    release = asyncio.Event()
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await release.wait()
+        return "value"
+
+    first = asyncio.create_task(cache.get_or_load("k", load))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(cache.get_or_load("k", load))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    release.set()
+    assert await second == "value"
+    assert await cache.get_or_load("k", load) == "value"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_balances_fan_out_across_exchanges_and_are_cached():
+    clients = {name: SlowBalanceClient(Decimal(str(i + 1))) for i, name in enumerate(["lighter", "aster", "paradex", "backpack"])}
+    controller = _controller(clients)
+    loader = StubCredentialLoader({name: {} for name in clients})
+    row = {"account_name": "acct1", "account_id": "id-1"}
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    result = await controller._get_account_balances(loader, row)
+    elapsed = loop.time() - started
+
+    # Four 50ms calls run concurrently, not back to back
+    assert elapsed < 0.15
+    assert [b["balance"] for b in result["balances"]] == ["1", "2", "3", "4"]
+
+    await controller._get_account_balances(loader, row)
+    assert all(client.calls == 1 for client in clients.values())
+
+
+@pytest.mark.asyncio
+async def test_balance_errors_are_reported_per_exchange():
+    controller = _controller({"lighter": SlowBalanceClient(None, delay=0)})
+    # "aster" isn't a live client for this account and has no credentials
+    loader = StubCredentialLoader({"lighter": {}, "aster": None})
+
+    result = await controller._get_account_balances(loader, {"account_name": "acct1", "account_id": "id-1"})
+
+    assert result["balances"] == [
+        {"exchange": "lighter", "balance": None, "error": "Balance not available"},
+        {"exchange": "aster", "balance": None, "error": "No credentials found"},
+    ]
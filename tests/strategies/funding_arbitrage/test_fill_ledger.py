@@ -0,0 +1,249 @@
+"""
+Tests for the websocket fill ledger and the ledger-first closing PnL path.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from unittest.mock import AsyncMock
+
+from exchange_clients.base_models import TradeData
+from strategies.execution.core.execution_components.event_reconciler import EventBasedReconciler
+from strategies.execution.core.execution_components.order_tracker import OrderTracker
+from strategies.execution.core.fill_ledger import FillLedger, fill_ledger
+from strategies.execution.patterns.atomic_multi_order.components.websocket_manager import WebsocketManager
+from strategies.implementations.funding_arbitrage.models import FundingArbPosition
+from strategies.implementations.funding_arbitrage.operations.closing.pnl_calculator import PnLCalculator
+
+OPENED_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class StubLogger:
+    def debug(self, *args, **kwargs):
+        pass
+
+    info = warning = error = debug
+
+
+class HistoryClient:
+    """Exchange client stub that records trade-history calls."""
+
+    def __init__(self, name, trades=None):
+        self.name = name
+        self.trades = trades or []
+        self.calls = []
+
+    def get_exchange_name(self):
+        return self.name
+
+    async def get_user_trade_history(self, symbol, start_time, end_time, order_id=None):
+        self.calls.append(order_id)
+        return [t for t in self.trades if order_id is None or t.order_id == order_id]
+
+
+@pytest.fixture(autouse=True)
+def clean_ledger():
+    fill_ledger.clear()
+    yield
+    fill_ledger.clear()
+
+
+def _position():
+    return FundingArbPosition(
+        id=uuid4(),
+        symbol="BTC",
+        long_dex="lighter",
+        short_dex="paradex",
+        size_usd=Decimal("1000"),
+        entry_long_rate=Decimal("0.0001"),
+        entry_short_rate=Decimal("0.0005"),
+        entry_divergence=Decimal("0.0004"),
+        opened_at=OPENED_AT,
+        metadata={
+            "legs": {
+                "lighter": {"order_id": "L-entry", "entry_price": Decimal("100"), "side": "long",
+                            "quantity": Decimal("2"), "execution_mode": "limit"},
+                "paradex": {"order_id": "P-entry", "entry_price": Decimal("101"), "side": "short",
+                            "quantity": Decimal("2"), "execution_mode": "market"},
+            },
+        },
+    )
+
+
+def _strategy(clients):
+    fee_structure = SimpleNamespace(maker_fee=Decimal("0.0001"), taker_fee=Decimal("0.0005"))
+    return SimpleNamespace(
+        exchange_clients=clients,
+        fee_calculator=SimpleNamespace(get_fee_structure=lambda dex: fee_structure),
+        logger=StubLogger(),
+        position_manager=SimpleNamespace(get_cumulative_funding=AsyncMock(return_value=Decimal("1.5"))),
+    )
+
+
+CLOSE_RESULT = {
+    "filled_orders": [
+        {"dex": "lighter", "order_id": "L-exit", "fill_price": Decimal("102"), "filled_quantity": Decimal("2")},
+        {"dex": "paradex", "order_id": "P-exit", "fill_price": Decimal("100"), "filled_quantity": Decimal("2")},
+    ]
+}
+
+
+def test_ledger_dedupes_repeated_fills_and_infers_status_remainder():
+    ledger = FillLedger()
+    assert ledger.record_fill("Lighter", "1", Decimal("100"), Decimal("1"), sequence=5)
+    assert not ledger.record_fill("lighter", "1", Decimal("100"), Decimal("1"), sequence=5)
+    assert ledger.record_fill("lighter", "1", Decimal("102"), Decimal("1"), sequence=6)
+
+    ledger.record_status("lighter", "1", "FILLED", Decimal("3"), Decimal("104"))
+
+    order = ledger.get("lighter", "1")
+    assert order.quantity == Decimal("3")
+    assert order.vwap == Decimal("102")
+    assert order.is_complete()
+    assert order.fills[-1].inferred
+
+    ledger.discard("lighter", ["1"])
+    assert ledger.get("lighter", "1") is None
+
+
+def test_real_fills_replace_inferred_remainder():
+    ledger = FillLedger()
+    ledger.record_status("lighter", "1", "FILLED", Decimal("2"), Decimal("100"))
+    assert ledger.get("lighter", "1").quantity == Decimal("2")
+
+    assert ledger.record_fill("lighter", "1", Decimal("99.9"), Decimal("1"))
+    order = ledger.get("lighter", "1")
+    assert order.quantity == Decimal("2")
+    assert [fill.inferred for fill in order.fills] == [True, False]
+
+    assert ledger.record_fill("lighter", "1", Decimal("100.1"), Decimal("1"))
+    assert order.quantity == Decimal("2")
+    assert order.vwap == Decimal("100")
+    assert not any(fill.inferred for fill in order.fills)
+
+
+def test_ledger_dedupes_only_on_sequence_or_trade_id():
+    ledger = FillLedger()
+    # Two genuine fills at the same price and size, no identifiers
+    assert ledger.record_fill("aster", "7", Decimal("50"), Decimal("1"), timestamp=1000.0)
+    assert ledger.record_fill("aster", "7", Decimal("50"), Decimal("1"), timestamp=1000.5)
+
+    assert ledger.record_fill("aster", "7", Decimal("50"), Decimal("1"), trade_id="t-1")
+    assert not ledger.record_fill("aster", "7", Decimal("50"), Decimal("1"), trade_id="t-1")
+
+    assert ledger.get("aster", "7").quantity == Decimal("3")
+
+
+def test_ledger_evicts_oldest_orders():
+    ledger = FillLedger(max_orders=2)
+    for order_id in ("a", "b", "c"):
+        ledger.record_fill("aster", order_id, Decimal("1"), Decimal("1"))
+    assert ledger.get("aster", "a") is None
+    assert len(ledger) == 2
+
+
+@pytest.mark.asyncio
+async def test_websocket_manager_router_records_fills():
+    manager = WebsocketManager(logger=StubLogger())
+    client = SimpleNamespace(get_exchange_name=lambda: "aster")
+    ctx = SimpleNamespace(
+        spec=SimpleNamespace(exchange_client=client, symbol="ETH", side="buy"),
+        on_websocket_fill=lambda qty, price: None,
+    )
+    manager._order_context_registry["42"] = ctx
+
+    router = manager._create_websocket_callback_router()
+    await router("42", Decimal("2000"), Decimal("0.5"), 1)
+    await router("42", Decimal("2000"), Decimal("0.5"), 1)
+
+    order = fill_ledger.get("aster", "42")
+    assert order.quantity == Decimal("0.5")
+    assert (order.symbol, order.side) == ("ETH", "buy")
+
+
+@pytest.mark.asyncio
+async def test_fill_through_both_callback_layers_is_recorded_once():
+    manager = WebsocketManager(logger=StubLogger())
+    client = SimpleNamespace(get_exchange_name=lambda: "paradex")
+    ctx = SimpleNamespace(
+        spec=SimpleNamespace(exchange_client=client, symbol="BTC", side="sell"),
+        on_websocket_fill=lambda qty, price: None,
+    )
+    manager._order_context_registry["P-1"] = ctx
+
+    reconciler = EventBasedReconciler(logger=StubLogger())
+    reconciler.set_original_callbacks(fill_callback=manager.get_callback_router())
+    reconciler._order_registry["P-1"] = OrderTracker(
+        order_id="P-1", quantity=Decimal("2"), limit_price=Decimal("100")
+    )
+    reconciler._order_venues["P-1"] = ("paradex", "BTC")
+
+    # Paradex fill updates carry neither a sequence nor a trade id
+    await reconciler.get_callback_router()("P-1", Decimal("100"), Decimal("2"), None)
+    await asyncio.sleep(0)
+
+    order = fill_ledger.get("paradex", "P-1")
+    assert order.quantity == Decimal("2")
+    assert order.is_complete(Decimal("2"))
+
+
+def test_doubled_fills_are_not_complete():
+    ledger = FillLedger()
+    ledger.record_fill("paradex", "1", Decimal("100"), Decimal("2"))
+    ledger.record_fill("paradex", "1", Decimal("100"), Decimal("2"))
+    assert not ledger.get("paradex", "1").is_complete(Decimal("2"))
+
+
+@pytest.mark.asyncio
+async def test_pnl_uses_ledger_without_trade_history_calls():
+    clients = {"lighter": HistoryClient("lighter"), "paradex": HistoryClient("paradex")}
+    for dex, order_id, price in (
+        ("lighter", "L-entry", "100"),
+        ("lighter", "L-exit", "102"),
+        ("paradex", "P-entry", "101"),
+        ("paradex", "P-exit", "100"),
+    ):
+        fill_ledger.record_fill(dex, order_id, Decimal(price), Decimal("2"))
+    store = AsyncMock()
+
+    calculator = PnLCalculator(_strategy(clients))
+    pnl, method = await calculator.calculate_pnl_from_trade_history(
+        _position(), CLOSE_RESULT, OPENED_AT.timestamp(), OPENED_AT.timestamp() + 3600, store,
+        close_order_type="market",
+    )
+
+    assert method == "fill_ledger"
+    assert all(not client.calls for client in clients.values())
+    # Price PnL 4 + 2, funding 1.5; limit entry charged maker, market legs taker
+    assert pnl == Decimal("6") + Decimal("1.5") - (Decimal("0.02") + Decimal("0.101") + Decimal("0.102") + Decimal("0.1"))
+    assert set(store.call_args.kwargs["exit_trades_by_dex"]) == {"lighter", "paradex"}
+    assert fill_ledger.get("lighter", "L-exit") is None
+
+
+@pytest.mark.asyncio
+async def test_pnl_falls_back_to_trade_history_only_for_gaps():
+    exit_trade = TradeData(
+        trade_id="t1", timestamp=OPENED_AT.timestamp() + 3600, symbol="BTC", side="buy",
+        quantity=Decimal("2"), price=Decimal("100"), fee=Decimal("0.05"), fee_currency="USDC", order_id="P-exit",
+    )
+    clients = {"lighter": HistoryClient("lighter"), "paradex": HistoryClient("paradex", trades=[exit_trade])}
+    fill_ledger.record_fill("lighter", "L-entry", Decimal("100"), Decimal("2"))
+    fill_ledger.record_fill("lighter", "L-exit", Decimal("102"), Decimal("2"))
+    fill_ledger.record_fill("paradex", "P-entry", Decimal("101"), Decimal("2"))
+    # Only half of the paradex close was seen on the websocket
+    fill_ledger.record_fill("paradex", "P-exit", Decimal("100"), Decimal("1"))
+
+    calculator = PnLCalculator(_strategy(clients))
+    pnl, method = await calculator.calculate_pnl_from_trade_history(
+        _position(), CLOSE_RESULT, OPENED_AT.timestamp(), OPENED_AT.timestamp() + 3600, AsyncMock(),
+    )
+
+    assert method == "trade_history_with_order_id"
+    assert clients["lighter"].calls == []
+    assert "P-exit" in clients["paradex"].calls
+    assert calculator.close_fills_recorded(CLOSE_RESULT) is False
+    assert pnl == Decimal("6") + Decimal("1.5") - (Decimal("0.02") + Decimal("0.102") + Decimal("0.101") + Decimal("0.05"))
@@ -0,0 +1,90 @@
+"""
+Tests for LeverageValidator bulk preloading, TTL refresh and synchronous lookup.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from strategies.execution.core.leverage_validator import LeverageValidator
+
+
+class LeverageClient:
+    """Exchange client stub counting per-symbol and bulk leverage queries."""
+
+    def __init__(self, name, bulk=True):
+        self.name = name
+        self.bulk = bulk
+        self.single_calls = []
+        self.bulk_calls = 0
+        self.set_calls = []
+
+    def get_exchange_name(self):
+        return self.name
+
+    async def get_leverage_info(self, symbol):
+        self.single_calls.append(symbol)
+        return {"max_leverage": Decimal("5"), "margin_requirement": Decimal("0.2")}
+
+    async def get_all_leverage_info(self):
+        if not self.bulk:
+            return None
+        self.bulk_calls += 1
+        return {
+            "BTC": {"max_leverage": Decimal("50"), "margin_requirement": Decimal("0.02")},
+            "ETH": {"max_leverage": Decimal("20"), "margin_requirement": Decimal("0.05")},
+        }
+
+    async def set_account_leverage(self, symbol, leverage):
+        self.set_calls.append((symbol, leverage))
+        return True
+
+
+@pytest.mark.asyncio
+async def test_bulk_preload_serves_lookups_without_network():
+    validator = LeverageValidator()
+    client = LeverageClient("lighter")
+
+    assert await validator.preload(client) == 2
+
+    cached = validator.get_cached_leverage_info("Lighter", "eth")
+    assert cached.max_leverage == Decimal("20")
+    info = await validator.get_leverage_info(client, "BTC")
+    assert info.max_leverage == Decimal("50")
+    assert client.single_calls == [] and client.bulk_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_preload_without_bulk_refreshes_known_symbols_concurrently():
+    validator = LeverageValidator()
+    client = LeverageClient("paradex", bulk=False)
+    await validator.get_leverage_info(client, "SOL")
+
+    loaded = await validator.preload(client, symbols=["BTC"])
+
+    assert loaded == 2
+    assert sorted(client.single_calls) == ["BTC", "SOL", "SOL"]
+
+
+@pytest.mark.asyncio
+async def test_stale_entries_are_refetched_without_background_refresh():
+    validator = LeverageValidator(refresh_interval_seconds=0)
+    client = LeverageClient("paradex", bulk=False)
+
+    await validator.get_leverage_info(client, "BTC")
+    await validator.get_leverage_info(client, "BTC")
+
+    assert client.single_calls == ["BTC", "BTC"]
+
+
+@pytest.mark.asyncio
+async def test_normalize_skips_leverage_already_applied():
+    validator = LeverageValidator()
+    clients = [LeverageClient("lighter"), LeverageClient("aster")]
+    await validator.preload_all(clients)
+
+    for _ in range(2):
+        leverage, limiting = await validator.normalize_and_set_leverage(clients, "ETH", Decimal("100"))
+
+    assert (leverage, limiting) == (20, "lighter")
+    assert all(client.set_calls == [("ETH", 20)] for client in clients)
@@ -0,0 +1,141 @@
+"""
+Tests for the published opportunity feed and its local filtering in strategy processes.
+"""
+
+import random
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from funding_rate_service.core.fee_calculator import FundingArbFeeCalculator
+from funding_rate_service.core.opportunity_feed import (
+    OpportunityFeedPublisher,
+    OpportunityFeedSubscriber,
+    decode_generation,
+    encode_generation,
+    publish_filter,
+    select_opportunities,
+)
+from funding_rate_service.core.opportunity_finder import OpportunityFinder
+from funding_rate_service.models.filters import OpportunityFilter
+from strategies.implementations.funding_arbitrage.operations.opportunity_snapshot import OpportunitySnapshotProvider
+
+DEXES = ["lighter", "aster", "backpack", "paradex"]
+
+
+class RatesDatabase:
+    """latest_funding_rates rows for the finder, opportunity_generations rows for the feed."""
+
+    def __init__(self, symbols=60, seed=5):
+        rng = random.Random(seed)
+        now = datetime.now(timezone.utc)
+        self.rates = [
+            {
+                "dex_name": dex,
+                "symbol": f"SYM{s:02d}",
+                "funding_rate": Decimal(str(round(rng.gauss(0.0001, 0.0004), 6))),
+                "volume_24h": Decimal(str(round(rng.uniform(1e5, 5e7), 2))),
+                "open_interest_usd": Decimal(str(round(rng.uniform(1e5, 2e7), 2))),
+                "spread_bps": rng.randint(1, 40),
+                "updated_at": now,
+            }
+            for s in range(symbols)
+            for dex in DEXES
+        ]
+        self.generations = []
+        self.rate_queries = 0
+
+    async def fetch_all(self, query, values=None):
+        self.rate_queries += 1
+        return self.rates
+
+    async def fetch_one(self, query, values=None):
+        if query.lstrip().startswith("INSERT"):
+            row = {"id": len(self.generations) + 1, **values}
+            self.generations.append(row)
+            return {"id": row["id"]}
+        rows = self.generations
+        if values and "generation_id" in values:
+            rows = [row for row in rows if row["id"] == values["generation_id"]]
+        return rows[-1] if rows else None
+
+    async def execute(self, query, values=None):
+        self.generations = [row for row in self.generations if row["id"] > values["cutoff"]]
+
+
+@pytest.fixture
+def finder_and_db():
+    database = RatesDatabase()
+    finder = OpportunityFinder(
+        database=database, fee_calculator=FundingArbFeeCalculator(), dex_mapper=None, symbol_mapper=None
+    )
+    return finder, database
+
+
+def _keys(opportunities):
+    return [(o.symbol, o.long_dex, o.short_dex, o.net_profit_percent) for o in opportunities]
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        OpportunityFilter(min_profit_percent=Decimal("0.0002"), whitelist_dexes=["lighter", "aster", "paradex"], limit=10),
+        OpportunityFilter(required_dex="lighter", max_oi_usd=Decimal("8000000"), limit=10),
+        OpportunityFilter(min_volume_24h=Decimal("2e7"), min_oi_usd=Decimal("5e6"), exclude_dexes=["backpack"], limit=25),
+    ],
+)
+@pytest.mark.asyncio
+async def test_local_selection_matches_finder(finder_and_db, filters):
+    finder, _ = finder_and_db
+    generation = decode_generation(1, encode_generation(await finder.find_opportunities(publish_filter())))
+
+    expected = await finder.find_opportunities(filters)
+    assert expected
+    assert _keys(select_opportunities(generation.opportunities, filters)) == _keys(expected)
+
+
+@pytest.mark.asyncio
+async def test_subscriber_serves_latest_generation_and_rejects_stale(finder_and_db):
+    finder, database = finder_and_db
+    publisher = OpportunityFeedPublisher(database)
+    await publisher.publish(await finder.find_opportunities(publish_filter()))
+    second = await publisher.publish((await finder.find_opportunities(publish_filter()))[:5])
+
+    subscriber = OpportunityFeedSubscriber(database, max_age_seconds=60)
+    assert subscriber.select(OpportunityFilter()) is None
+
+    await subscriber.load_latest()
+    assert subscriber.latest.generation_id == second
+    assert len(subscriber.select(OpportunityFilter(limit=100))) == 5
+    # Older announcements never replace a newer generation
+    assert (await subscriber.load_generation(1)).generation_id == second
+
+    subscriber.latest.published_at = time.time() - 120
+    assert subscriber.select(OpportunityFilter()) is None
+
+
+@pytest.mark.asyncio
+async def test_snapshot_provider_prefers_feed_over_local_scoring(finder_and_db):
+    finder, database = finder_and_db
+    await OpportunityFeedPublisher(database).publish(await finder.find_opportunities(publish_filter()))
+    subscriber = OpportunityFeedSubscriber(database)
+    await subscriber.load_latest()
+    queries_before = database.rate_queries
+
+    strategy = SimpleNamespace(
+        config=SimpleNamespace(
+            min_profit=Decimal("0.0001"), max_oi_usd=None, min_volume_24h=None, min_oi_usd=None,
+            mandatory_exchange=None, primary_exchange=None,
+        ),
+        exchange_clients={"lighter": object(), "aster": object()},
+        opportunity_finder=finder,
+        opportunity_feed=subscriber,
+    )
+    snapshot = await OpportunitySnapshotProvider(strategy).get(max_age_seconds=0)
+
+    assert snapshot.opportunities
+    assert all({o.long_dex, o.short_dex} == {"lighter", "aster"} for o in snapshot.opportunities)
+    assert database.rate_queries == queries_before
@@ -0,0 +1,108 @@
+"""
+Tests for the cycle-scoped opportunity snapshot shared by scanning and exit evaluation.
+"""
+
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from strategies.implementations.funding_arbitrage.operations.closing.exit_evaluator import ExitEvaluator
+from strategies.implementations.funding_arbitrage.operations.opportunity_snapshot import (
+    OpportunitySnapshot,
+    OpportunitySnapshotProvider,
+)
+
+
+class StubLogger:
+    def info(self, message, **kwargs):
+        pass
+
+    debug = warning = error = info
+
+
+class CountingFinder:
+    def __init__(self, opportunities):
+        self.opportunities = opportunities
+        self.calls = 0
+
+    async def find_opportunities(self, filters):
+        self.calls += 1
+        return list(self.opportunities)
+
+
+def _opportunity(symbol, long_dex, short_dex, net_profit="0.01"):
+    return SimpleNamespace(
+        symbol=symbol, long_dex=long_dex, short_dex=short_dex, net_profit_percent=Decimal(net_profit)
+    )
+
+
+def _strategy(opportunities):
+    strategy = SimpleNamespace(
+        config=SimpleNamespace(
+            min_profit=Decimal("0.001"),
+            max_oi_usd=None,
+            min_volume_24h=None,
+            min_oi_usd=None,
+            mandatory_exchange=None,
+            primary_exchange="lighter",
+            risk_config=SimpleNamespace(check_interval_seconds=60),
+        ),
+        exchange_clients={"lighter": object(), "aster": object()},
+        opportunity_finder=CountingFinder(opportunities),
+        logger=StubLogger(),
+    )
+    strategy.opportunity_snapshots = OpportunitySnapshotProvider(strategy)
+    return strategy
+
+
+def test_snapshot_indexes_by_symbol_and_pair():
+    snapshot = OpportunitySnapshot([
+        _opportunity("BTC", "lighter", "aster", "0.02"),
+        _opportunity("btc", "aster", "lighter"),
+        _opportunity("BTC", "lighter", "aster", "0.001"),
+    ])
+
+    assert len(snapshot.for_symbol("btc")) == 3
+    # Best-ranked entry wins per pair
+    assert snapshot.for_pair("BTC", "Lighter", "ASTER").net_profit_percent == Decimal("0.02")
+    assert snapshot.for_pair("ETH", "lighter", "aster") is None
+
+
+@pytest.mark.asyncio
+async def test_eroding_positions_share_one_scan_and_tradeability_pass():
+    strategy = _strategy([
+        _opportunity("DOGE", "lighter", "aster"),
+        _opportunity("BTC", "lighter", "aster"),
+    ])
+    evaluator = ExitEvaluator(strategy, risk_manager=None)
+    checked = []
+
+    async def is_tradeable(opportunity):
+        checked.append(opportunity.symbol)
+        return opportunity.symbol != "DOGE"
+
+    positions = [SimpleNamespace(symbol=symbol, long_dex="lighter", short_dex="aster") for symbol in ("BTC", "ETH", "SOL")]
+    decisions = [
+        await evaluator.should_skip_erosion_exit(position, "PROFIT_EROSION", is_opportunity_tradeable=is_tradeable)
+        for position in positions
+    ]
+
+    assert decisions == [True, False, False]
+    assert strategy.opportunity_finder.calls == 1
+    assert checked == ["DOGE", "BTC"]
+
+
+@pytest.mark.asyncio
+async def test_scan_refreshes_snapshot_and_exit_evaluation_reuses_it():
+    strategy = _strategy([_opportunity("BTC", "lighter", "aster")])
+    provider = strategy.opportunity_snapshots
+
+    first = await provider.get(max_age_seconds=0)
+    assert await provider.get(max_age_seconds=60) is first
+    assert await provider.get(max_age_seconds=0) is not first
+    assert strategy.opportunity_finder.calls == 2
+
+    filters = provider.build_filter()
+    assert filters.required_dex == "lighter"
+    assert sorted(filters.whitelist_dexes) == ["aster", "lighter"]
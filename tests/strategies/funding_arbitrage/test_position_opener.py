@@ -264,3 +264,30 @@ async def test_position_opener_missing_exchange_clients():
 
     assert position is None
     assert opportunity.symbol in strategy.failed_symbols
+
+
+@pytest.mark.asyncio
+async def test_position_opener_uses_prestaged_candidate(monkeypatch):
+    strategy = _strategy(
+        exchange_clients={"aster": _exchange_client(), "lighter": _exchange_client()},
+        atomic_result=_atomic_success(),
+    )
+    opener = PositionOpener(strategy)
+    validate = AsyncMock(return_value={"adjusted_size": Decimal("90"), "normalized_leverage": Decimal("10")})
+    monkeypatch.setattr(opener._leverage_validator, "validate_leverage", validate)
+
+    best, runner_up = _opportunity("BTC"), _opportunity("ETH")
+    opener.stager.stage([best, runner_up], top_k=2)
+    position = await opener.open(best)
+
+    assert position is not None
+    # Both candidates were validated in the background; opening reused the staged result
+    assert validate.await_count == 2
+    assert opener.stager.stats.hits == 1
+
+    # The runner-up's staged size predates the open and is recomputed
+    await opener.open(runner_up)
+    assert validate.await_count == 3
+
+    await opener.open(_opportunity("SOL"))
+    assert opener.stager.stats.misses == 1
@@ -0,0 +1,166 @@
+"""
+Tests for the grid replay backtester (venue fill model, virtual clock, engine).
+"""
+
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from strategies.implementations.grid import strategy as grid_strategy_module
+from strategies.implementations.grid.backtest import (
+    BBOSeries,
+    FillModel,
+    GridReplayParams,
+    ReplayVenue,
+    VirtualClock,
+    format_preset_report,
+    grid_virtual_time,
+    load_bbo_csv,
+    run_grid_replay,
+    run_preset_sweep,
+    synthetic_bbo,
+)
+
+GRID_PARAMS = {
+    "direction": "buy",
+    "order_notional_usd": 200,
+    "target_leverage": 10,
+    "take_profit": 0.02,
+    "grid_step": 0.01,
+    "max_orders": 3,
+    "max_margin_usd": 200,
+    "post_only_tick_multiplier": 1,
+    "wait_time": 5,
+    "stop_loss_enabled": True,
+    "stop_loss_percentage": 2,
+    "position_timeout_minutes": 30,
+    "recovery_mode": "aggressive",
+}
+
+
+def _series(bids, asks, bid_sizes=None, ask_sizes=None, step=1.0):
+    n = len(bids)
+    return BBOSeries(
+        timestamps=np.arange(n, dtype=float) * step,
+        bids=np.asarray(bids, dtype=float),
+        asks=np.asarray(asks, dtype=float),
+        bid_sizes=None if bid_sizes is None else np.asarray(bid_sizes, dtype=float),
+        ask_sizes=None if ask_sizes is None else np.asarray(ask_sizes, dtype=float),
+    )
+
+
+def _venue(series, **kwargs):
+    clock = VirtualClock(series.start)
+    venue = ReplayVenue(series, clock, symbol="BTC", tick_size=Decimal("0.1"), **kwargs)
+    return clock, venue
+
+
+@pytest.mark.asyncio
+async def test_order_at_touch_waits_for_queue_ahead_then_fills():
+    series = _series(
+        bids=[100.0] * 5,
+        asks=[100.1] * 5,
+        bid_sizes=[3.0, 2.0, 4.0, 1.5, 1.5],
+        ask_sizes=[1.0] * 5,
+    )
+    clock, venue = _venue(series, fill_model=FillModel(trade_share=1.0))
+
+    result = await venue.place_limit_order("BTC", Decimal("0.5"), Decimal("100.0"), "buy", client_order_id=7)
+    assert result.success and result.order_id == "7"
+
+    # 1.0 traded ahead of us; size added behind us does not help
+    assert venue.advance_to(2.0) == []
+    assert venue._orders["7"].queue == 2.0
+    # 2.5 traded: 2.0 clears the queue and 0.5 fills the order
+    fills = venue.advance_to(3.0)
+    assert [(f.order_id, f.quantity, f.maker) for f in fills] == [("7", Decimal("0.5"), True)]
+    assert venue.position == Decimal("0.5")
+    assert (await venue.get_order_info("7")).status == "FILLED"
+
+
+@pytest.mark.asyncio
+async def test_trade_through_fills_and_post_only_cross_is_canceled():
+    series = _series(bids=[100.0, 100.0, 99.5], asks=[100.1, 100.1, 99.6])
+    clock, venue = _venue(series)
+
+    crossing = await venue.place_limit_order("BTC", Decimal("1"), Decimal("100.0"), "sell", client_order_id=1)
+    assert crossing.success
+    assert await venue.get_active_orders("BTC") == []
+    info = await venue.get_order_info("1")
+    assert info.status == "CANCELED" and info.cancel_reason == "post-only"
+    assert venue.stats.post_only_rejects == 1
+
+    await venue.place_limit_order("BTC", Decimal("1"), Decimal("99.7"), "buy", client_order_id=2)
+    assert venue.advance_to(1.0) == []
+    fills = venue.advance_to(2.0)
+    assert [f.order_id for f in fills] == ["2"]
+    assert fills[0].price == Decimal("99.7")
+
+
+@pytest.mark.asyncio
+async def test_reduce_only_and_average_cost_ledger():
+    series = _series(bids=[100.0, 101.0], asks=[100.1, 101.1])
+    clock, venue = _venue(series, taker_fee=Decimal("0.001"))
+
+    await venue.place_market_order("BTC", Decimal("2"), "buy")
+    assert venue.position == Decimal("2") and venue.avg_entry == Decimal("100.1")
+
+    await venue.place_limit_order("BTC", Decimal("5"), Decimal("101.0"), "sell", reduce_only=True, client_order_id=9)
+    venue.advance_to(1.0)
+
+    assert venue.position == 0
+    assert venue.realized_pnl == Decimal("1.8")
+    assert venue.fees_paid == Decimal("0.2002")
+
+
+def test_virtual_time_is_scoped_to_the_block():
+    clock = VirtualClock(1_000.0)
+    with grid_virtual_time(clock):
+        assert grid_strategy_module.time.time() == 1_000.0
+        clock.advance(5)
+        assert grid_strategy_module.time.time() == 1_005.0
+    assert grid_strategy_module.time.time() > 1_000_000
+
+
+def test_load_bbo_csv_normalizes_millisecond_timestamps(tmp_path):
+    path = tmp_path / "bbo.csv"
+    path.write_text("timestamp,bid,ask\n1700000001000,10.0,10.1\n1700000000000,9.9,10.0\n")
+
+    series = load_bbo_csv(path, symbol="ETH")
+
+    assert series.timestamps.tolist() == [1_700_000_000.0, 1_700_000_001.0]
+    assert series.bids.tolist() == [9.9, 10.0]
+    assert not series.has_sizes
+
+
+@pytest.mark.asyncio
+async def test_replay_runs_grid_strategy_round_trips_deterministically():
+    series = synthetic_bbo(duration_seconds=1_800, interval_seconds=0.5, volatility=0.8, seed=5)
+    params = GridReplayParams(maker_fee=Decimal("0.0001"), taker_fee=Decimal("0.0005"))
+
+    first = await run_grid_replay(GRID_PARAMS, series, params, keep_fills=True)
+    second = await run_grid_replay(GRID_PARAMS, series, params)
+
+    summary = first.summary
+    assert summary["round_trips"] > 0
+    assert summary["venue_maker_fills"] > 0
+    assert summary["fees_usd"] > 0
+    assert summary["net_pnl_usd"] == pytest.approx(
+        summary["realized_pnl_usd"] - summary["fees_usd"] + summary["unrealized_pnl_usd"]
+    )
+    assert summary == {**second.summary, "elapsed_seconds": summary["elapsed_seconds"]}
+    assert first.fills and all(fill.timestamp <= series.end for fill in first.fills)
+    # Virtual time must not leak out of the run
+    assert grid_strategy_module.time.time() > series.end
+
+
+def test_preset_sweep_keeps_input_order_and_formats_table():
+    series = synthetic_bbo(duration_seconds=600, interval_seconds=0.5, seed=2)
+    presets = [("wide", {**GRID_PARAMS, "grid_step": 0.05}), ("tight", GRID_PARAMS)]
+
+    results = run_preset_sweep(series, presets, max_workers=1)
+
+    assert [r.name for r in results] == ["wide", "tight"]
+    report = format_preset_report(results)
+    assert "ev/trade" in report and "wide" in report and "tight" in report
@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from telegram_bot_service.utils import api_client
+from telegram_bot_service.utils.api_client import ControlAPIClient
+
+
+@pytest.fixture
+async def control_server():
+    """Local control API whose /status handler counts calls and can be held open."""
+    state = {"calls": 0, "release": asyncio.Event()}
+    state["release"].set()
+
+    async def status(_request):
+        state["calls"] += 1
+        await state["release"].wait()
+        return web.json_response({"running": True, "call": state["calls"]})
+
+    async def close(_request):
+        return web.json_response({"success": True})
+
+    app = web.Application()
+    app.router.add_get("/api/v1/status", status)
+    app.router.add_post("/api/v1/positions/{position_id}/close", close)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    state["client"] = ControlAPIClient(f"http://127.0.0.1:{runner.addresses[0][1]}", "key")
+    try:
+        yield state
+    finally:
+        await api_client.close_all_clients()
+        api_client._inflight_reads.clear()
+        await runner.cleanup()
+
+
+async def test_concurrent_identical_reads_share_one_request(control_server):
+    control_server["release"].clear()
+    client = control_server["client"]
+
+    tasks = [asyncio.create_task(client.get_status()) for _ in range(3)]
+    await asyncio.sleep(0.05)
+    control_server["release"].set()
+    results = await asyncio.gather(*tasks)
+
+    assert control_server["calls"] == 1
+    assert results[0] == results[1] == results[2] == {"running": True, "call": 1}
+    results[0]["running"] = False
+    assert results[1]["running"] is True
+
+
+async def test_cached_read_expires_after_ttl(control_server, monkeypatch):
+    monkeypatch.setitem(api_client.READ_CACHE_TTL, "status", 0.1)
+    client = control_server["client"]
+
+    assert (await client.get_status())["call"] == 1
+    assert (await client.get_status())["call"] == 1
+    await asyncio.sleep(0.15)
+    assert (await client.get_status())["call"] == 2
+    assert control_server["calls"] == 2
+
+
+async def test_cancelling_the_first_caller_does_not_cancel_the_others(control_server):
+    control_server["release"].clear()
+    client = control_server["client"]
+
+    first = asyncio.create_task(client.get_status())
+    await asyncio.sleep(0.05)
+    second = asyncio.create_task(client.get_status())
+    await asyncio.sleep(0)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    control_server["release"].set()
+    assert (await second) == {"running": True, "call": 1}
+    assert control_server["calls"] == 1
+
+
+async def test_read_in_flight_during_a_write_is_not_cached(control_server):
+    control_server["release"].clear()
+    client = control_server["client"]
+
+    stale = asyncio.create_task(client.get_status())
+    await asyncio.sleep(0.05)
+    await client.close_position("pos-1")
+    control_server["release"].set()
+    assert (await stale)["call"] == 1
+
+    # The pre-write response was not cached, so the next read goes to the server
+    assert (await client.get_status())["call"] == 2
+    assert control_server["calls"] == 2
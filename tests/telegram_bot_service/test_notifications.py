@@ -0,0 +1,128 @@
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import pytest
+
+from telegram_bot_service.handlers import notifications
+from telegram_bot_service.handlers.notifications import NOTIFY_CHANNEL, NotificationHandler
+
+MIGRATION = Path(__file__).resolve().parents[2] / "database" / "migrations" / "019_add_strategy_notifications_notify_trigger.sql"
+
+
+class FakeRawConnection:
+    """asyncpg-style connection exposing add_listener/remove_listener."""
+
+    def __init__(self, fail_subscribe=False):
+        self.fail_subscribe = fail_subscribe
+        self.listeners = {}
+        self.closed = False
+
+    async def add_listener(self, channel, callback):
+        if self.fail_subscribe:
+            raise ConnectionError("connection reset")
+        self.listeners[channel] = callback
+
+    async def remove_listener(self, channel, callback):
+        self.listeners.pop(channel, None)
+
+    def is_closed(self):
+        return self.closed
+
+    def notify(self, payload):
+        self.listeners[NOTIFY_CHANNEL](self, 1234, NOTIFY_CHANNEL, payload)
+
+
+class FakeDatabase:
+    def __init__(self, raw_connections):
+        self.raw_connections = list(raw_connections)
+        self.subscribed = []
+        self.rows = {}
+
+    @asynccontextmanager
+    async def connection(self):
+        raw = self.raw_connections.pop(0)
+        self.subscribed.append(raw)
+        yield type("Connection", (), {"raw_connection": raw})()
+
+    def insert(self, notification_id, message):
+        self.rows[notification_id] = {
+            "id": notification_id,
+            "user_id": "u1",
+            "message": message,
+            "notification_type": "info",
+            "symbol": None,
+            "telegram_user_id": 42,
+            "sent": False,
+        }
+
+    async def fetch_all(self, query, values=None):
+        return [row for row in self.rows.values() if not row["sent"]]
+
+    async def fetch_one(self, query, values):
+        row = self.rows.get(values["notification_id"])
+        return row if row is not None and not row["sent"] else None
+
+    async def execute(self, query, values):
+        self.rows[values["notification_id"]]["sent"] = True
+
+
+class FakeBot:
+    def __init__(self):
+        self.sent = []
+
+    async def send_message(self, chat_id, text, parse_mode=None):
+        self.sent.append((chat_id, text))
+
+
+async def _wait_for(condition, timeout=1.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.005)
+
+
+@pytest.fixture(autouse=True)
+def fast_intervals(monkeypatch):
+    monkeypatch.setattr(notifications, "LISTEN_RECONNECT_SECONDS", 0.01)
+    monkeypatch.setattr(notifications, "LISTEN_IDLE_CHECK_SECONDS", 0.01)
+    monkeypatch.setattr(notifications, "FALLBACK_POLL_INTERVAL_SECONDS", 0.01)
+    monkeypatch.setattr(notifications, "SAFETY_POLL_INTERVAL_SECONDS", 0.01)
+
+
+async def test_notified_id_is_delivered_once_and_listener_resubscribes():
+    failing, first, second = FakeRawConnection(fail_subscribe=True), FakeRawConnection(), FakeRawConnection()
+    database = FakeDatabase([failing, first, second])
+    bot = FakeBot()
+    handler = NotificationHandler(database, bot)
+    await handler.start()
+    try:
+        # A failed subscription is retried on a fresh connection
+        await _wait_for(lambda: NOTIFY_CHANNEL in first.listeners)
+
+        # Pushed twice and also visible to the safety-net poll: still one message
+        database.insert("n-1", "filled")
+        first.notify("n-1")
+        first.notify("n-1")
+        await _wait_for(lambda: database.rows["n-1"]["sent"])
+        await asyncio.sleep(0.05)
+        assert bot.sent == [(42, "filled")]
+
+        # The listening connection drops: the loop subscribes again
+        first.closed = True
+        await _wait_for(lambda: NOTIFY_CHANNEL in second.listeners)
+        database.insert("n-2", "closed")
+        second.notify("n-2")
+        await _wait_for(lambda: len(bot.sent) == 2)
+        assert bot.sent[-1] == (42, "closed")
+    finally:
+        await handler.stop()
+
+    assert not second.listeners
+
+
+def test_migration_publishes_new_ids_on_the_listened_channel():
+    sql = MIGRATION.read_text()
+    assert f"pg_notify('{NOTIFY_CHANNEL}', NEW.id::text)" in sql
+    assert "AFTER INSERT ON strategy_notifications" in sql
+    assert "FOR EACH ROW" in sql
@@ -0,0 +1,64 @@
+"""
+Tests for the event loop monitor: stall stacks and per-task CPU accounting.
+"""
+
+import asyncio
+import time
+
+from helpers.loop_monitor import EventLoopMonitor
+
+
+def _block_the_loop(seconds):
+    time.sleep(seconds)
+
+
+async def test_stall_captures_stack_of_blocking_task():
+    monitor = EventLoopMonitor(interval=0.01, lag_threshold=0.05, summary_interval=0)
+    monitor.start()
+    try:
+        await asyncio.sleep(0.03)
+
+        async def rest_call():
+            _block_the_loop(0.25)
+
+        await asyncio.create_task(rest_call(), name="sync-rest-call")
+        await asyncio.sleep(0.05)
+        snapshot = monitor.snapshot()
+    finally:
+        await monitor.stop()
+
+    assert snapshot["stalls"]["count"] >= 1
+    stall = snapshot["stalls"]["recent"][-1]
+    assert stall["task"] == "sync-rest-call"
+    assert "_block_the_loop" in stall["stack"][-1]
+    assert stall["lag_seconds"] >= 0.2
+    assert snapshot["lag"]["max_ms"] >= 200
+
+
+async def test_named_tasks_accrue_cpu_time():
+    loop = asyncio.get_running_loop()
+    previous_factory = loop.get_task_factory()
+    monitor = EventLoopMonitor(interval=0.01, summary_interval=0)
+    monitor.start()
+    try:
+        async def busy():
+            deadline = time.thread_time() + 0.05
+            while time.thread_time() < deadline:
+                pass
+            await asyncio.sleep(0)
+
+        await asyncio.gather(
+            asyncio.create_task(busy(), name="liquidation-consumer"),
+            asyncio.create_task(asyncio.sleep(0.01)),
+        )
+        stats = {s.name: s for s in monitor.task_stats(limit=None)}
+    finally:
+        await monitor.stop()
+
+    consumer = stats["liquidation-consumer"]
+    assert consumer.cpu_seconds >= 0.04
+    assert consumer.finished == 1 and consumer.steps == 2
+    assert "<unnamed>" in stats
+    assert stats["loop-monitor"].live == 1
+    assert loop.get_task_factory() is previous_factory
+    assert "liquidation-consumer" in monitor.format_summary()
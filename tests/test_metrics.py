@@ -0,0 +1,93 @@
+"""
+Tests for the metrics registry, its text exposition and the placement timer.
+"""
+
+import gc
+import time
+
+import pytest
+
+from exchange_clients.base_models import OrderResult
+from exchange_clients.market_data.decoding.base import WS_MESSAGES
+from exchange_clients.market_data.decoding.lighter import LighterDecoder
+from exchange_clients.lighter.websocket.order_book import BOOK_STALENESS, LighterOrderBook
+from helpers.metrics import MetricsRegistry
+from strategies.execution.core.execution_telemetry import ORDERS_PLACED, ORDER_PLACEMENT_SECONDS, timed_placement
+
+
+def test_render_counters_gauges_and_cumulative_histogram_buckets():
+    registry = MetricsRegistry()
+    requests = registry.counter("rest_requests_total", "REST requests", ("venue",))
+    requests.labels(venue="lighter").inc()
+    requests.labels("lighter").inc(2)
+    assert registry.counter("rest_requests_total", "REST requests", ("venue",)) is requests
+    with pytest.raises(ValueError):
+        registry.gauge("rest_requests_total", "clash", ("venue",))
+
+    latency = registry.histogram("query_seconds", "Query time", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.observe(value)
+
+    class Book:
+        def staleness(self):
+            return 2.5
+
+    book = Book()
+    staleness = registry.gauge("staleness_seconds", 'Book "staleness"', ("venue",))
+    staleness.labels(venue='a"b').set_function(book.staleness)
+
+    text = registry.render()
+    assert 'rest_requests_total{venue="lighter"} 3' in text
+    assert "# TYPE query_seconds histogram" in text
+    assert 'query_seconds_bucket{le="0.1"} 2' in text
+    assert 'query_seconds_bucket{le="1"} 3' in text
+    assert 'query_seconds_bucket{le="+Inf"} 4' in text
+    assert "query_seconds_sum 3.65" in text
+    assert "query_seconds_count 4" in text
+    assert 'staleness_seconds{venue="a\\"b"} 2.5' in text
+
+    # The gauge does not keep the book alive
+    del book
+    gc.collect()
+    assert "staleness_seconds{" not in registry.render()
+
+
+async def test_timed_placement_records_latency_and_outcome():
+    accepted = ORDERS_PLACED.labels(venue="unit", order_type="limit", outcome="accepted")
+    errors = ORDERS_PLACED.labels(venue="unit", order_type="limit", outcome="error")
+    timings = ORDER_PLACEMENT_SECONDS.labels(venue="unit", order_type="limit")
+    before = (accepted.value, errors.value, timings.count)
+
+    async def place():
+        return OrderResult(success=True, order_id="1")
+
+    async def fail():
+        raise ConnectionError("venue down")
+
+    assert (await timed_placement("unit", "limit", place())).order_id == "1"
+    with pytest.raises(ConnectionError):
+        await timed_placement("unit", "limit", fail())
+
+    assert (accepted.value, errors.value, timings.count) == (before[0] + 1, before[1] + 1, before[2] + 2)
+
+
+def test_decoder_counts_frames_per_venue():
+    frames = WS_MESSAGES.labels(venue="lighter")
+    before = frames.value
+    decoder = LighterDecoder()
+    decoder.decode('{"type": "ping"}')
+    decoder.decode_data({"type": "update/order_book", "order_book": {"bids": "bad"}})
+    assert frames.value == before + 2
+
+
+def test_book_staleness_reports_the_stalest_live_book():
+    gauge = BOOK_STALENESS.labels(venue="lighter")
+    fresh, stale = LighterOrderBook(), LighterOrderBook()
+    fresh.last_update_timestamp = time.time()
+    stale.last_update_timestamp = time.time() - 3600
+    assert gauge.read() >= 3600
+
+    # Dropping a book leaves the series to the books still alive
+    del stale
+    gc.collect()
+    assert gauge.read() < 3600
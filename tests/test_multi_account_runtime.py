@@ -0,0 +1,137 @@
+"""
+Tests for hosting several funding arbitrage accounts in one process: control
+routing by account, shared venue metadata and the shared opportunity feed.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from exchange_clients.base_client import BaseExchangeClient
+from funding_rate_service.core.opportunity_feed import OpportunityFeedSubscriber
+from multi_account_runtime import shared_proxy
+from strategies.control.funding_arb_controller import FundingArbStrategyController
+
+
+class StubPositionManager:
+    def __init__(self, positions):
+        self.positions = positions
+
+    async def get(self, position_id):
+        return self.positions.get(position_id)
+
+
+class StubCloser:
+    def __init__(self):
+        self.closed = []
+
+    async def close(self, position, reason, live_snapshots=None, order_type="market"):
+        self.closed.append((position, reason, order_type))
+
+
+def _strategy(account_name, positions=(), reload_ok=True):
+    strategy = SimpleNamespace(
+        config=SimpleNamespace(account_name=account_name),
+        position_manager=StubPositionManager({position.id: position for position in positions}),
+        position_closer=StubCloser(),
+        exchange_clients={},
+        reloads=0,
+    )
+
+    async def reload_config():
+        strategy.reloads += 1
+        return reload_ok
+
+    strategy.reload_config = reload_config
+    return strategy
+
+
+async def test_close_and_reload_are_routed_to_the_positions_account():
+    position = SimpleNamespace(id=uuid4(), long_dex="aster", short_dex="lighter", symbol="BTC")
+    acc1 = _strategy("acc1")
+    acc2 = _strategy("acc2", positions=[position], reload_ok=False)
+    controller = FundingArbStrategyController(strategies={"acc1": acc1, "acc2": acc2})
+    account_id = str(uuid4())
+
+    with patch("database.connection.database") as db:
+        db.fetch_one = AsyncMock(return_value={
+            "id": str(position.id), "account_id": account_id, "account_name": "acc2",
+        })
+        result = await controller.close_position(
+            str(position.id), [account_id], order_type="limit", confirm_wide_spread=True
+        )
+        assert result["success"] and result["account_name"] == "acc2"
+        assert acc2.position_closer.closed == [(position, "manual_close", "limit")]
+        assert acc1.position_closer.closed == []
+
+        db.fetch_one = AsyncMock(return_value={
+            "id": str(position.id), "account_id": account_id, "account_name": "acc3",
+        })
+        with pytest.raises(ValueError, match="acc3"):
+            await controller.close_position(str(position.id), [account_id])
+
+    assert (await controller.reload_config("acc1"))["accounts"] == ["acc1"]
+    assert (acc1.reloads, acc2.reloads) == (1, 0)
+    result = await controller.reload_config()
+    assert not result["success"] and result["error"] == "Failed to reload config for acc2"
+    assert (acc1.reloads, acc2.reloads) == (2, 1)
+    with pytest.raises(ValueError):
+        await controller.reload_config("acc3")
+
+    assert controller.hosts("acc1") and not controller.hosts("acc3")
+
+
+class StubVenueClient(BaseExchangeClient):
+    SHARED_METADATA_ATTRS = ("_contract_id_cache", "_tick_size_cache")
+
+    def __init__(self):
+        super().__init__(SimpleNamespace(ticker="ALL"))
+        self._tick_size_cache = {}
+        self.api_key = object()
+
+    def _validate_config(self):
+        pass
+
+
+StubVenueClient.__abstractmethods__ = frozenset()
+
+
+def test_clients_share_public_metadata_but_not_credentials():
+    donor, client = StubVenueClient(), StubVenueClient()
+    donor._contract_id_cache["BTC"] = "BTC-USD-PERP"
+    client.adopt_shared_metadata(donor)
+
+    assert client._contract_id_cache is donor._contract_id_cache
+    assert client._tick_size_cache is donor._tick_size_cache
+    assert client.api_key is not donor.api_key
+
+    other_venue = type("OtherVenueClient", (StubVenueClient,), {})()
+    with pytest.raises(TypeError):
+        other_venue.adopt_shared_metadata(donor)
+
+
+def test_accounts_must_agree_on_the_session_proxy():
+    def selector(proxy_id):
+        return SimpleNamespace(current_proxy=lambda: SimpleNamespace(id=proxy_id, label=proxy_id))
+
+    assert shared_proxy({"acc1": None, "acc2": None}) is None
+    assert shared_proxy({"acc1": selector("p1"), "acc2": selector("p1")}).id == "p1"
+    with pytest.raises(ValueError, match="acc2=none"):
+        shared_proxy({"acc1": selector("p1"), "acc2": None})
+
+
+async def test_shared_feed_runs_until_its_last_user_stops():
+    def no_listener():
+        raise RuntimeError("no listener connection")
+
+    database = SimpleNamespace(connection=no_listener, fetch_one=AsyncMock(return_value=None))
+    feed = OpportunityFeedSubscriber(database)
+    await feed.start()
+    await feed.start()
+
+    await feed.stop()
+    assert feed.running and feed._poll_task is not None
+    await feed.stop()
+    assert not feed.running and feed._poll_task is None
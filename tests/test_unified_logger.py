@@ -0,0 +1,52 @@
+"""
+Tests for the hot-path logging helpers: throttling, sampling and lazy messages.
+"""
+
+from helpers.unified_logger import LogThrottle, UnifiedLogger, log_throttled
+
+
+def test_throttle_admits_once_per_interval_and_counts_suppressed():
+    throttle = LogThrottle()
+    assert throttle.admit("site", 5.0, now=100.0) == 0
+    assert throttle.admit("site", 5.0, now=101.0) is None
+    assert throttle.admit("site", 5.0, now=104.9) is None
+    assert throttle.admit("other", 5.0, now=104.9) == 0
+    assert throttle.admit("site", 5.0, now=105.0) == 2
+    assert throttle.admit("site", 5.0, now=106.0) is None
+
+    seen = [throttle.sample("sampled", 3) for _ in range(7)]
+    assert seen == [1, None, None, 3, None, None, 3]
+
+
+class RecordingLogger:
+    def __init__(self):
+        self.records = []
+
+    def error(self, message):
+        self.records.append(message)
+
+
+def test_log_throttled_suppresses_repeats_from_one_call_site():
+    logger = RecordingLogger()
+    built = []
+
+    def message():
+        built.append(1)
+        return "bad frame"
+
+    for _ in range(5):
+        log_throttled(logger, message, "ERROR", interval=3600)
+    log_throttled(logger, "other site", "ERROR", interval=3600)
+
+    assert logger.records == ["bad frame", "other site"]
+    # Suppressed records never build their message
+    assert len(built) == 1
+
+
+def test_lazy_message_is_skipped_below_the_sink_level():
+    logger = UnifiedLogger("core", "lazy_test")
+    calls = []
+    logger.debug(lambda: calls.append("debug") or "debug")
+    assert bool(calls) == UnifiedLogger.is_enabled("DEBUG")
+    logger.info(lambda: calls.append("info") or "info")
+    assert calls[-1] == "info"
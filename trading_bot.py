@@ -16,6 +16,7 @@ from helpers.unified_logger import get_logger
 from strategies import StrategyFactory
 from networking import ProxySelector, SessionProxyManager
 from helpers.networking import ProxyHealthMonitor, detect_egress_ip
+from helpers.loop_monitor import EventLoopMonitor
 
 
 @dataclass
@@ -47,6 +48,7 @@ class TradingBot:
         config: TradingConfig,
         account_credentials: Optional[Dict[str, Dict[str, Any]]] = None,
         proxy_selector: Optional[ProxySelector] = None,
+        hosted: bool = False,
     ):
         """
         Initialize Trading Bot.
@@ -56,16 +58,27 @@ class TradingBot:
             account_credentials: Optional credentials dict mapping exchange names to credentials.
                                If provided, credentials will be used instead of environment variables.
             proxy_selector: Optional proxy selector derived from account assignments.
+            hosted: Run as one account of a MultiAccountRuntime, which owns the
+                    loop monitor, proxy health checks and control API server.
         """
         self.config = config
         self.account_credentials = account_credentials
         self.proxy_selector = proxy_selector
-        self.logger = get_logger("bot", config.strategy, context={"exchange": config.exchange, "ticker": config.ticker}, log_to_console=True)
+        self.hosted = hosted
+        # Each exchange client gets its own proxy transport instead of the session proxy
+        self.client_proxies = bool(config.strategy_params.get("_client_proxies"))
+        context = {"exchange": config.exchange, "ticker": config.ticker}
+        if hosted:
+            context["account"] = config.strategy_params.get("_account_name")
+        self.logger = get_logger("bot", config.strategy, context=context, log_to_console=True)
         self._proxy_health_monitor: Optional[ProxyHealthMonitor] = None
+        self._loop_monitor: Optional[EventLoopMonitor] = (
+            None if hosted else EventLoopMonitor.from_env(logger=self.logger)
+        )
         self._proxy_rotation_attempts = 0
         self._control_server_task: Optional[asyncio.Task] = None
         self._control_server: Optional[Any] = None  # Store uvicorn.Server instance for manual shutdown
-        self._control_server_enabled = os.getenv("CONTROL_API_ENABLED", "false").lower() in ("true", "1", "yes")
+        self._control_server_enabled = not hosted and os.getenv("CONTROL_API_ENABLED", "false").lower() in ("true", "1", "yes")
 
         # Log account info if credentials provided
         if account_credentials:
@@ -74,7 +87,11 @@ class TradingBot:
             self.logger.info(f"Available exchanges: {list(account_credentials.keys())}")
 
         if proxy_selector:
-            if SessionProxyManager.is_active():
+            if self.client_proxies:
+                current = proxy_selector.current_proxy()
+                if current:
+                    self.logger.info(f"Per-client proxies active, starting at {current.masked_label()}")
+            elif SessionProxyManager.is_active():
                 active_display = SessionProxyManager.describe(mask_password=True)
                 assignment = proxy_selector.current_assignment()
                 if not active_display and assignment:
@@ -135,6 +152,8 @@ class TradingBot:
                 if proxy_selector:
                     for client in self.exchange_clients.values():
                         setattr(client, "proxy_selector", proxy_selector)
+                    if self.client_proxies:
+                        self._use_client_proxies(self.exchange_clients.values())
 
                 # Set a representative exchange client for backward compatibility
                 self.exchange_client = next(iter(self.exchange_clients.values()))
@@ -158,6 +177,8 @@ class TradingBot:
 
                 if proxy_selector and self.exchange_client:
                     setattr(self.exchange_client, "proxy_selector", proxy_selector)
+                    if self.client_proxies:
+                        self._use_client_proxies([self.exchange_client])
 
                 if hasattr(self.exchange_client, "order_fill_callback"):
                     self.exchange_client.order_fill_callback = self._handle_order_fill
@@ -316,6 +337,13 @@ class TradingBot:
                 pass  # Non-critical, continue shutdown
             self._proxy_health_monitor = None
 
+        if self._loop_monitor and self._loop_monitor.running:
+            self.logger.info(self._loop_monitor.format_summary())
+            try:
+                await asyncio.wait_for(self._loop_monitor.stop(), timeout=5.0)
+            except (asyncio.TimeoutError, Exception):
+                pass  # Non-critical, continue shutdown
+
         try:
             # Cleanup strategy with timeout
             if hasattr(self, 'strategy') and self.strategy:
@@ -386,7 +414,7 @@ class TradingBot:
             # Debug logging
             self.logger.info(f"🔧 _start_control_server called: strategy={self.config.strategy}, CONTROL_API_ENABLED={os.getenv('CONTROL_API_ENABLED', 'not set')}")
             
-            from strategies.control.server import app, set_strategy_controller
+            from strategies.control.server import app, set_strategy_controller, set_loop_monitor
             from strategies.control.funding_arb_controller import FundingArbStrategyController
             import uvicorn
             
@@ -398,6 +426,7 @@ class TradingBot:
             # Create controller
             controller = FundingArbStrategyController(self.strategy)
             set_strategy_controller(controller)
+            set_loop_monitor(self._loop_monitor)
             
             # Get server config
             host = os.getenv("CONTROL_API_HOST", "127.0.0.1")
@@ -548,6 +577,22 @@ class TradingBot:
             if hasattr(self, '_control_server'):
                 self._control_server = None
 
+    def _use_client_proxies(self, clients) -> None:
+        """Give every client its own transport over the account's proxies."""
+        clients = list(clients)
+        unsupported = sorted(client.get_exchange_name() for client in clients if not client.SUPPORTS_CLIENT_PROXY)
+        if unsupported:
+            raise ValueError(
+                f"Per-client proxies are not supported for {', '.join(unsupported)}; use --proxy-mode session"
+            )
+        account_name = self.config.strategy_params.get("_account_name")
+        for client in clients:
+            exchange = client.get_exchange_name()
+            client.use_client_proxy(
+                self.proxy_selector,
+                name=f"{account_name}/{exchange}" if account_name else exchange,
+            )
+
     async def _on_proxy_unhealthy(self, failure_count: int) -> None:
         """Rotate to the next proxy when health checks continue to fail."""
         if not self.proxy_selector:
@@ -607,7 +652,11 @@ class TradingBot:
             # Capture the running event loop for thread-safe callbacks
             self.loop = asyncio.get_running_loop()
 
-            if SessionProxyManager.is_active():
+            # Start before connecting so websocket listeners get CPU accounting
+            if self._loop_monitor:
+                self._loop_monitor.start()
+
+            if SessionProxyManager.is_active() and not self.hosted:
                 if not self._proxy_health_monitor:
                     self._proxy_health_monitor = ProxyHealthMonitor(
                         logger=self.logger,
@@ -622,11 +671,13 @@ class TradingBot:
             await self.strategy.initialize()
             
             # Start control API server if enabled
-            self.logger.info(f"🔧 Control API enabled check: {self._control_server_enabled} (CONTROL_API_ENABLED={os.getenv('CONTROL_API_ENABLED', 'not set')})")
-            if self._control_server_enabled:
-                await self._start_control_server()
-            else:
-                self.logger.info("Control API disabled (CONTROL_API_ENABLED not set to 'true')")
+            # (hosted bots are served by the runtime's control server)
+            if not self.hosted:
+                self.logger.info(f"🔧 Control API enabled check: {self._control_server_enabled} (CONTROL_API_ENABLED={os.getenv('CONTROL_API_ENABLED', 'not set')})")
+                if self._control_server_enabled:
+                    await self._start_control_server()
+                else:
+                    self.logger.info("Control API disabled (CONTROL_API_ENABLED not set to 'true')")
             
             # Execution phase
             await self._run_trading_loop()